@@ -1,6 +1,5 @@
 """Pylons environment configuration"""
 import os
-import re
 
 from mako.lookup import TemplateLookup
 from pylons import config
@@ -12,6 +11,12 @@ import onlinelinguisticdatabase.lib.app_globals as app_globals
 import onlinelinguisticdatabase.lib.helpers
 from onlinelinguisticdatabase.config.routing import make_map
 from onlinelinguisticdatabase.model import init_model
+from onlinelinguisticdatabase.lib.regexCache import regexCache, regexp
+from onlinelinguisticdatabase.lib.translationCache import translationCache
+from onlinelinguisticdatabase.lib.secondaryObjects import secondaryObjectCache
+from onlinelinguisticdatabase.lib.validationScanner import validationScanner
+from onlinelinguisticdatabase.lib.jobQueue import jobQueue
+from onlinelinguisticdatabase.lib.queryCounter import QueryCounter
 
 from onlinelinguisticdatabase.lib.functions import applicationSettingsToAppGlobals, updateSecondaryObjectsInAppGlobals
 
@@ -52,12 +57,26 @@ def load_environment(global_conf, app_conf):
     SQLAlchemyURL = config['sqlalchemy.url']
     rdbms = SQLAlchemyURL.split(':')[0]
     if rdbms == 'sqlite':
+        regexCache.size = int(app_conf.get('regexp_cache_size',
+                                           regexCache.size))
         engine = engine_from_config(
-            config, 'sqlalchemy.', listeners=[SQLiteSetup()])
+            config, 'sqlalchemy.', listeners=[SQLiteSetup()],
+            proxy=QueryCounter())
     else:
-        engine = engine_from_config(config, 'sqlalchemy.')
+        engine = engine_from_config(config, 'sqlalchemy.',
+                                    proxy=QueryCounter())
     init_model(engine)
 
+    translationCache.size = int(app_conf.get('translation_cache_size',
+                                             translationCache.size))
+    secondaryObjectCache.pollInterval = float(app_conf.get(
+        'secondary_objects_poll_interval', secondaryObjectCache.pollInterval))
+    validationScanner.processes = int(app_conf.get('validation_processes',
+                                                   validationScanner.processes))
+    jobQueue.threads = int(app_conf.get('job_threads', jobQueue.threads))
+    jobQueue.pollInterval = float(app_conf.get('job_poll_interval',
+                                               jobQueue.pollInterval))
+
     # Put the application settings into the app_globals object
     #  This has the effect that when the app is restarted the globals like
     #  objectLanguageName, metalanguageName, etc. have the correct values
@@ -82,10 +101,10 @@ def load_environment(global_conf, app_conf):
 
 class SQLiteSetup(PoolListener):
     """A PoolListener used to provide the SQLite dbapi with a regexp function.
+    The compiled patterns are cached in lib/regexCache.regexCache.
     """
     def connect(self, conn, conn_record):
         conn.create_function('regexp', 2, self.regexp)
 
     def regexp(self, expr, item):
-        patt = re.compile(expr)
-        return item and patt.match(item) is not None
+        return regexp(expr, item)
@@ -20,6 +20,7 @@ import logging
 import os
 import subprocess
 import codecs
+import cgi
 import unicodedata as ud
 
 from paste.fileapp import FileApp
@@ -36,6 +37,12 @@ import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
 import onlinelinguisticdatabase.lib.createSQLiteDBCopy as createSQLiteDBCopy
+from onlinelinguisticdatabase.lib.morphemeReferences import \
+    recomputeAllMorphemeReferences, getThroughput
+from onlinelinguisticdatabase.lib.searchIndex import rebuildSearchIndex
+from onlinelinguisticdatabase.lib.schemaMigration import migrate
+from onlinelinguisticdatabase.lib.dictionaryIndex import setDictionaryKeys, \
+    rebuildDictionaryIndex
 
 from formencode.schema import Schema
 from formencode.validators import OneOf
@@ -209,6 +216,7 @@ class AdministerController(BaseController):
                 pass
             for gloss in form.glosses:
                 gloss.gloss = h.NFD(gloss.gloss)
+            setDictionaryKeys(form)
 
             if i != 0 and i % 100 == 0:
                 saveState('normalizeNFDEverythingStatus', {
@@ -261,32 +269,195 @@ class AdministerController(BaseController):
         })
 
 
+    @h.authenticate
+    def recomputeMorphemeReferencesCheck(self):
+        """recomputeMorphemeReferencesCheck is called repeatedly by
+        pollRecomputeMorphemeReferences in administer/index.html to see how
+        much of recomputeMorphemeReferences's work is complete.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        recomputeStatus = getState('recomputeMorphemeReferencesStatus')
+        return json.dumps(recomputeStatus)
+
+
     @h.authenticate
     @h.authorize(['administrator'])
     def recomputeMorphemeReferences(self):
         """Compute the values of Form.morphemeBreakIDs, Form.morphemeGlossIDs
         and Form.syntacticCategoryString for each Form in the database.
 
-        WARNING, this is a computationally intensive and long-running script.
-        With a database of 20,000 Forms, this took about 20 minutes to run on
-        a MBP 2.26GHz 2GB ram.
+        The Forms are processed in batches (see
+        lib/morphemeReferences.recomputeAllMorphemeReferences) and the number
+        of Forms processed and the throughput are reported via
+        recomputeMorphemeReferencesCheck.
 
         """
 
-        highestID = meta.Session.query(func.max(model.Form.id)).first()[0]
-        for i in range(1, int(highestID) + 1):
-            form = meta.Session.query(model.Form).get(i)
-            if form:
-                syntacticCategoryString = form.syntacticCategoryString
-                form.getMorphemeIDLists(meta, model)
-                meta.Session.commit()
-            i += 1
-        meta.Session.commit()
+        response.headers['Content-Type'] = 'application/json'
 
-        session['flash'] = 'Morpheme references have been recomputed.'
-        session.save()
+        saveState('recomputeMorphemeReferencesStatus', {
+            'statusMsg': 'Recomputation has begun.',
+            'complete': False
+        })
 
-        return render('/derived/administer/index.html')
+        def reportProgress(count, elapsed):
+            saveState('recomputeMorphemeReferencesStatus', {
+                'statusMsg': '%d forms recomputed (%.1f forms/s).' % (
+                    count, getThroughput(count, elapsed)),
+                'complete': False
+            })
+
+        count, elapsed = recomputeAllMorphemeReferences(
+            callback=reportProgress)
+
+        saveState('recomputeMorphemeReferencesStatus', {
+            'statusMsg': 'Morpheme references of all %d forms recomputed in '
+                '%.1f seconds (%.1f forms/s).' % (
+                count, elapsed, getThroughput(count, elapsed)),
+            'complete': True
+        })
+
+
+    @h.authenticate
+    def rebuildSearchIndexCheck(self):
+        """rebuildSearchIndexCheck is called repeatedly by
+        pollRebuildSearchIndex in administer/index.html to see how much of
+        rebuildSearchIndex's work is complete.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        rebuildStatus = getState('rebuildSearchIndexStatus')
+        return json.dumps(rebuildStatus)
+
+
+    @h.authenticate
+    @h.authorize(['administrator'])
+    def rebuildSearchIndex(self):
+        """Create the full-text search index (see lib/searchIndex) and index
+        every Form in the database.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+
+        saveState('rebuildSearchIndexStatus', {
+            'statusMsg': 'Indexing has begun.',
+            'complete': False
+        })
+
+        def reportProgress(count, elapsed):
+            saveState('rebuildSearchIndexStatus', {
+                'statusMsg': '%d forms indexed (%.1f forms/s).' % (
+                    count, getThroughput(count, elapsed)),
+                'complete': False
+            })
+
+        backend, count, elapsed = rebuildSearchIndex(callback=reportProgress)
+
+        saveState('rebuildSearchIndexStatus', {
+            'statusMsg': 'All %d forms indexed in %.1f seconds (search index '
+                'type: %s).' % (count, elapsed, backend),
+            'complete': True
+        })
+
+
+    @h.authenticate
+    def rebuildDictionaryIndexCheck(self):
+        """rebuildDictionaryIndexCheck is called repeatedly by
+        pollRebuildDictionaryIndex in administer/index.html to see how much of
+        rebuildDictionaryIndex's work is complete.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        rebuildStatus = getState('rebuildDictionaryIndexStatus')
+        return json.dumps(rebuildStatus)
+
+
+    @h.authenticate
+    @h.authorize(['administrator'])
+    def rebuildDictionaryIndex(self):
+        """Recompute the dictionary browsing and sorting keys of every Form
+        and Gloss (see lib/dictionaryIndex), e.g., after the storage or
+        metalanguage orthography has changed.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+
+        saveState('rebuildDictionaryIndexStatus', {
+            'statusMsg': 'Rebuilding has begun.',
+            'complete': False
+        })
+
+        def reportProgress(count, elapsed):
+            saveState('rebuildDictionaryIndexStatus', {
+                'statusMsg': '%d forms and glosses indexed (%.1f/s).' % (
+                    count, getThroughput(count, elapsed)),
+                'complete': False
+            })
+
+        count, elapsed = rebuildDictionaryIndex(callback=reportProgress)
+
+        saveState('rebuildDictionaryIndexStatus', {
+            'statusMsg': 'All %d forms and glosses indexed in %.1f seconds.' % (
+                count, elapsed),
+            'complete': True
+        })
+
+
+    @h.authenticate
+    def migrateIndexesCheck(self):
+        """migrateIndexesCheck is called repeatedly by pollMigrateIndexes in
+        administer/index.html to see whether migrateIndexes is done.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        migrateStatus = getState('migrateIndexesStatus')
+        return json.dumps(migrateStatus)
+
+
+    @h.authenticate
+    @h.authorize(['administrator'])
+    def migrateIndexes(self):
+        """Add the columns and create the indexes declared in the model (and
+        lib/schemaMigration) that the database lacks and report the slow
+        queries whose query plans the new indexes change.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+
+        saveState('migrateIndexesStatus', {
+            'statusMsg': 'Creating the missing indexes.',
+            'complete': False
+        })
+
+        added, created, changed = migrate()
+
+        if added or created:
+            statusMsg = u'Added %d columns (%s) and created %d indexes ' \
+                u'(%s).' % (len(added), u', '.join(added), len(created),
+                            u', '.join(created))
+        else:
+            statusMsg = u'The database has all of the columns and indexes.'
+        if added:
+            statusMsg += u'  Rebuild the dictionary index to fill in the ' \
+                u'new columns.'
+        if changed:
+            statusMsg += u'</p><p>Queries sped up:</p><ul>%s</ul><p>' % \
+                u''.join([u'<li>%s<br />before: %s<br />after: %s</li>' % (
+                    cgi.escape(description), cgi.escape(before),
+                    cgi.escape(after))
+                    for description, before, after in changed])
+        saveState('migrateIndexesStatus', {
+            'statusMsg': statusMsg,
+            'complete': True
+        })
 
 
     @h.authenticate
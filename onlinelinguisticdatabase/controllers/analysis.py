@@ -39,12 +39,16 @@ except ImportError:
 from pylons import config, request, response, session, app_globals, tmpl_context as c
 from pylons.controllers.util import abort, redirect_to
 from pylons.decorators.rest import restrict
+from formencode.validators import Invalid
 
 from form import SearchFormForm
 from onlinelinguisticdatabase.lib.base import BaseController, render
 from onlinelinguisticdatabase.lib.analysisObjects import Phonology
 import onlinelinguisticdatabase.lib.helpers as h
-from onlinelinguisticdatabase.lib.myworker import worker_q
+from onlinelinguisticdatabase.lib.flookup import flookup, flookupMany, \
+    reloadFlookupPools, getBinarySignature
+from onlinelinguisticdatabase.lib.jobQueue import registerTask, submitJob, \
+    getJob, cancelJob
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 
@@ -124,17 +128,74 @@ def getParsesFromFoma(word):
     word = u'#%s#' % word
     morphophonologyBinaryFilePath = os.path.join(
         analysisDataDir, morphophonologyBinaryFileName)
-
-    process = subprocess.Popen(
-        ['flookup', '-x', morphophonologyBinaryFilePath],
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(word.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(morphophonologyBinaryFilePath, word)
     return [x[1:-1] for x in result if x]
 
 
+def getParsesFromFomaBatch(words):
+    """Like getParsesFromFoma but for a list of words: the distinct words are
+    sent through the morphophonology FST in a single streamed pass.  Returns a
+    dict from each word to its list of possible parses.
+
+    """
+
+    words = list(set(words))
+    morphophonologyBinaryFilePath = os.path.join(
+        analysisDataDir, morphophonologyBinaryFileName)
+    results = flookupMany(morphophonologyBinaryFilePath,
+                          [u'#%s#' % w for w in words])
+    return dict([(w, [x[1:-1] for x in r if x])
+                 for w, r in zip(words, results)])
+
+
+def getTokensFromTranscriptions(transcriptions):
+    """Return the distinct word tokens of the transcriptions, in order of first
+    occurrence, with extraneous punctuation removed.
+
+    """
+
+    tokens = []
+    seen = {}
+    for transcription in transcriptions:
+        for word in transcription.split():
+            word = removeExtraneousPunctuation(word)
+            if word and word not in seen:
+                seen[word] = None
+                tokens.append(word)
+    return tokens
+
+
+def rankParses(parses, probCalc=None):
+    """Return parses (as returned by getParsesFromFoma) as a list of
+    (morphemeBreak, morphemeGloss) tuples, most probable first if a probability
+    calculator is available.
+
+    """
+
+    if parses == [u'']:
+        return [('NO PARSE', 'NO PARSE')]
+    if probCalc:
+        probs = [probCalc.getProbability(p) for p in parses]
+        result = zip(parses, probs)
+        result.sort(key=lambda x: x[1])
+        result.reverse()
+        result = [x[0] for x in result]
+    else:
+        result = parses
+    return [splitBreakFromGloss(a) for a in result]
+
+
+def getRankedParsesBatch(words):
+    """Return a dict from each of the distinct words to its ranked list of
+    (morphemeBreak, morphemeGloss) parses.
+
+    """
+
+    probCalc = getProbCalc()
+    parses = getParsesFromFomaBatch(words)
+    return dict([(w, rankParses(p, probCalc)) for w, p in parses.items()])
+
+
 def getOrthographicVariants(word, limit=20):
     """Use flookup and the orthographicvariation FST to get possible alternate
     spellings/transcriptions of the word.  Return these ranked by their minimum
@@ -142,7 +203,7 @@ def getOrthographicVariants(word, limit=20):
 
     """
 
-    print '\n\n\nTRYING TO GET VARIANTS FOR: %s\n\n\n' % word
+    log.debug('Getting orthographic variants for %s.' % word)
 
     # Check to see if we have the orthographic variation FST file
     if orthographicVariationBinaryFileName not in os.listdir(analysisDataDir):
@@ -158,13 +219,7 @@ def getOrthographicVariants(word, limit=20):
     word = u'#%s#' % word
     orthographicVariationBinaryFilePath = os.path.join(
         analysisDataDir, orthographicVariationBinaryFileName)
-    process = subprocess.Popen(
-        ['flookup', '-x', '-i', orthographicVariationBinaryFilePath],
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(word.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(orthographicVariationBinaryFilePath, word, inverse=True)
     #print 'Number of results from flookup: %d' % len(result)
 
     # Remove results that are too long or too short
@@ -193,17 +248,7 @@ def applyFomaPhonology(i, dir):
     i = u'#%s#' % i
     phonologyBinaryFilePath = os.path.join(
         analysisDataDir, phonologyBinaryFileName)
-
-    cmdList = ['flookup', '-x', phonologyBinaryFilePath]
-    if dir == 'inverse':
-        cmdList = ['flookup', '-x', '-i', phonologyBinaryFilePath]
-    process = subprocess.Popen(
-        cmdList,
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(i.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(phonologyBinaryFilePath, i, inverse=(dir == 'inverse'))
     return [x[1:-1] for x in result if x]
 
 
@@ -324,7 +369,7 @@ def getLexicalItemsFromFile(delim):
 
     lexiconFilePath = os.path.join(analysisDataDir, lexiconFileName)
     try:
-        print 'Getting lexical items from file.'
+        log.debug('Getting lexical items from file.')
         lexiconFile = codecs.open(lexiconFilePath, 'r', 'utf-8')
         lexicalItems = {}
         for line in lexiconFile:
@@ -336,7 +381,7 @@ def getLexicalItemsFromFile(delim):
                 lexicalItems[key].append(value)
         return lexicalItems
     except IOError:
-        print 'Getting lexical items from database.'
+        log.debug('Getting lexical items from database.')
         return getLexicalItems(delim)
 
 
@@ -535,9 +580,7 @@ class ProbabilityCalculator(object):
                 probability = numerator / float(denominator)
             except KeyError:
                 
-                print 'ERROR: could not find count for %s' % bigram[0]
-                if analysis:
-                    print 'the analysis variable is not None'
+                log.debug('Could not find count for %s.' % bigram[0])
                 probability = 0.00000000001
             self.bigram2probability[bigram] = probability
             result = probability
@@ -551,22 +594,28 @@ class ProbabilityCalculator(object):
 
 
 def getProbCalc():
-    """Try to get a probability calculator object.
+    """Try to get a probability calculator object.  The pickle written by the
+    generateprobabilitycalculator job (possibly in another process) is loaded
+    again whenever it changes.
 
     """
 
-    try:
-        probCalc = app_globals.wordProbabilityCalculator
-    except AttributeError:
+    probabilityCalculatorPath = os.path.join(analysisDataDir,
+                                             probabilityCalculatorFileName)
+    signature = getBinarySignature(probabilityCalculatorPath)
+    if signature is None:
+        return None
+    if getattr(app_globals, 'wordProbabilityCalculatorSignature',
+               None) != signature:
         try:
-            probabilityCalculatorPath = os.path.join(analysisDataDir,
-                                            probabilityCalculatorFileName)
             probCalcPickleFile = open(probabilityCalculatorPath, 'rb')
             probCalc = pickle.load(probCalcPickleFile)
-            app_globals.wordProbabilityCalculator = probCalc
+            probCalcPickleFile.close()
         except IOError:
-            probCalc = None
-    return probCalc
+            return None
+        app_globals.wordProbabilityCalculator = probCalc
+        app_globals.wordProbabilityCalculatorSignature = signature
+    return app_globals.wordProbabilityCalculator
 
 
 def splitBreakFromGloss(analysis):
@@ -588,8 +637,8 @@ def splitBreakFromGloss(analysis):
                 mb += analysis[i]
                 mg += analysis[i]
         except IndexError:
-            print 'Warning: unable to split %s, the %d element of %s' % (
-                analysis[i], i, str(analysis))
+            log.warning('Unable to split %s, the %d element of %s.' % (
+                analysis[i], i, str(analysis)))
     return (mb, mg)
 
 
@@ -737,6 +786,414 @@ def saveAnalyzedWordsFile(analyzedWords, fname=None):
 
 
 
+################################################################################
+# Jobs: the long-running tasks, which the actions of AnalysisController queue
+#  and the job queue runs in the background (see lib/jobQueue.py)
+################################################################################
+
+def generateMorphotactics(job, arguments):
+    """Writes the morphotactics.foma file representing the morphotactics
+    of the language (and the lexicon.txt file).
+
+    """
+
+    job.progress(u'Getting syncatWordStrings.')
+    syncatWordStrings = getAllSyncatWordStrings(delim)
+
+    job.progress(u'Getting lexicalItems.')
+    lexicalItems = getLexicalItems(delim)
+
+    job.progress(u'Writing lexicon.txt file.')
+    lexiconFilePath = os.path.join(analysisDataDir, lexiconFileName)
+    lexiconFile = codecs.open(lexiconFilePath, 'w', 'utf-8')
+    lexiconString = u''
+    for li in sorted(lexicalItems.keys()):
+        lexiconString += u'#%s' % li
+        for x in sorted(lexicalItems[li]):
+            lexiconString += u'\n%s %s' % (x[0], x[1])
+        lexiconString += u'\n\n'
+    lexiconFile.write(lexiconString)
+    lexiconFile.close()
+
+    job.progress(u'Getting fomaMorphotacticsFile.')
+    fomaFile = getFomaMorphotacticsFile(
+        syncatWordStrings, lexicalItems, delim)
+    morphotacticsFilePath = os.path.join(analysisDataDir,
+                                         morphotacticsFileName)
+    morphotacticsFile = codecs.open(morphotacticsFilePath, 'w', 'utf-8')
+    morphotacticsFile.write(fomaFile)
+    morphotacticsFile.close()
+
+    now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
+    msg = u"morphotactics file saved (%s)." % now
+    return u"<span style='color:green;font-weight:bold;'>%s</span>" % msg
+
+
+def generateMorphophonology(job, arguments):
+    """Writes the foma binary file morphophonology.foma.bin representing the
+    morphophonology FST.  In order to do so, it also writes two other files:
+    morphophonology.foma and compilemorphophonology.sh.  foma is then run
+    (with the commands of compilemorphophonology.sh) to create the
+    morphohonology.foma.bin file.
+
+    """
+
+    morphophonologyBinaryFilePath = os.path.join(
+        analysisDataDir, morphophonologyBinaryFileName)
+
+    # 1. Write morphophonology.foma
+    job.progress(u'Writing morphophonology.foma.')
+    phonologyFilePath = os.path.join(analysisDataDir, phonologyFileName)
+    phonologyFile = codecs.open(phonologyFilePath, 'r', 'utf-8')
+    phonology = phonologyFile.read()
+    phonologyFile.close()
+
+    morphotacticsFilePath = os.path.join(analysisDataDir,
+                                         morphotacticsFileName)
+    morphotacticsFile = codecs.open(morphotacticsFilePath, 'r', 'utf-8')
+    morphotactics = morphotacticsFile.read()
+    morphotacticsFile.close()
+
+    morphophonologyFilePath = os.path.join(analysisDataDir,
+                                           morphophonologyFileName)
+    morphophonologyFile = codecs.open(morphophonologyFilePath, 'w', 'utf-8')
+    morphophonology = u'%s\n\n\n%s\n\n\n%s\n\n\n%s' % (
+        morphotactics,
+        phonology,
+        'define morphophonology morphotactics .o. phonology;',
+        'regex morphophonology;'
+    )
+    morphophonologyFile.write(morphophonology)
+    morphophonologyFile.close()
+
+    # 2. Write compilemorphophonology.sh
+    job.progress(u'Writing compilemorphophonology.sh.')
+    compilePath = os.path.join(analysisDataDir,
+                               compileMorphophonologyFileName)
+    compileFile = open(compilePath, 'w')
+    cmd = 'foma -e "source %s" -e "save stack %s" -e "quit"' % (
+        morphophonologyFilePath, morphophonologyBinaryFilePath)
+    compileFile.write(cmd)
+    compileFile.close()
+    os.chmod(compilePath, 0755)
+
+    # 3. Run its foma commands (without a shell, so that cancelling the job
+    #  kills foma itself)
+    job.progress(u'Generating morphophonology.foma.bin.')
+    process = subprocess.Popen(['foma', '-e', 'source %s' % morphophonologyFilePath,
+        '-e', 'save stack %s' % morphophonologyBinaryFilePath, '-e', 'quit'],
+        stdout=subprocess.PIPE)
+    output = unicode(job.communicate(process), 'utf-8')
+
+    now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
+    success = 'Writing to file %s' % morphophonologyBinaryFilePath
+    if success in output:
+        reloadFlookupPools(morphophonologyBinaryFilePath)
+        msg = u"morphophonology binary file generated (%s)." % now
+        return u"<span style='color:green;font-weight:bold;'>%s</span>" % msg
+    else:
+        msg = u"unable to generate morphophonology binary file."
+        return u"<span class='warning-message'>%s</span>" % msg
+
+
+def generateProbabilityCalculator(job, arguments):
+    """Pickles a ProbabilityCalculator built from the analyzed words of the
+    database (see getProbCalc).
+
+    """
+
+    job.progress(u'Getting lexical items.')
+    lexItms = getLexicalItemsFromFile(delim)
+    lexCats = lexItms.keys()
+
+    job.progress(u'Getting Forms with analyzed words.')
+    forms = getFormsWithAnalyzedWords()
+
+    job.progress(u'Getting analyzed word tokens.')
+    analyzedWords = getAnalyzedWords(forms, lexCats, delim)
+
+    job.progress(u'Writing analyzed_words.txt file (%d analyzed words).' %
+                 len(analyzedWords))
+    saveAnalyzedWordsFile(analyzedWords)
+
+    job.progress(u'Getting ngrams.')
+    unigrams, bigrams = getNGramCounts(analyzedWords, lexItms)
+
+    job.progress(u'Getting probabilityCalculator.')
+    probabilityCalculator = ProbabilityCalculator(unigrams, bigrams, delim)
+
+    job.progress(u'Pickling probabilityCalculator.')
+    probabilityCalculatorPicklePath = os.path.join(
+        analysisDataDir, probabilityCalculatorFileName)
+    probabilityCalculatorPickle = open(
+        probabilityCalculatorPicklePath, 'wb')
+    pickle.dump(probabilityCalculator, probabilityCalculatorPickle)
+    probabilityCalculatorPickle.close()
+
+    now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
+    msg = u'generated probability calculator (%s)' % now
+    return u"<span style='color:green;font-weight:bold;'>%s</span>" % msg
+
+
+def evaluateParser(job, arguments):
+    """Parses the analyzed words of a test set with the morphophonology FST
+    and a ProbabilityCalculator built from a training set, logging a report
+    on each word (at the debug level), and returns the F-scores of the best guesses.
+
+    """
+
+    #analyzeAccentation()
+
+    formsFilter = None
+    formsFilter = 'frantz'
+
+    job.progress(u'Getting lexical items from file.')
+    lexItms = getLexicalItemsFromFile(delim)
+    lexCats = lexItms.keys()
+
+    if formsFilter:
+        job.progress(u'Getting Forms with analyzed words.')
+        forms = getFormsWithAnalyzedWords()
+        if formsFilter == 'frantz':
+
+            badCats = ['vcpx', 'nan', 'nin', 'nar', 'nir', 'vai', 'vii',
+                       'vta', 'vti', 'vrt', 'adt', 'dem', 'prev', 'med',
+                       'fin', 'oth', 'und', 'pro', 'asp', 'ten', 'mod',
+                       'agra', 'agrb', 'thm', 'whq', 'num', 'drt', 'dim',
+                       'o', 'stp', 'PN', 'INT']
+            forms = [f for f in forms if f.source and
+                     f.source.authorLastName == u'Frantz'
+                     and (not f.syntacticCategory or
+                     f.syntacticCategory.name not in badCats)]
+            log.debug('Analyzing data from %d forms.' % len(forms))
+
+        job.progress(u'Getting analyzed word tokens.')
+        analyzedWords = getAnalyzedWords(forms, lexCats, delim)
+        log.debug('There are %d analyzed words in the database.' % len(
+            analyzedWords))
+
+        job.progress(u'Writing analyzed_words_frantz.txt file.')
+        saveAnalyzedWordsFile(analyzedWords, 'analyzed_words_frantz.txt')
+
+    else:
+        job.progress(u'Getting analyzed word tokens from file.')
+        analyzedWordsFilePath = os.path.join(analysisDataDir,
+                                             analyzedWordsFileName)
+        analyzedWordsFile = codecs.open(analyzedWordsFilePath, 'r', 'utf-8')
+        analyzedWords = [tuple(x[:-1].split()) for x in analyzedWordsFile]
+        analyzedWordsFile.close()
+
+    job.progress(u'Getting training and test sets.')
+    trainingSet, testSet = getTrainingAndTestSets(analyzedWords)
+
+    job.progress(u'Getting ngrams from training set.')
+    unigrams, bigrams = getNGramCounts(trainingSet, lexItms)
+
+    job.progress(u'Getting probabilityCalculator based on training set.')
+    probCalc = ProbabilityCalculator(unigrams, bigrams, delim)
+
+    def getFScore(results):
+        try:
+            numCorrectParses = len([x for x in results if x[1] == x[2]])
+            numGuesses = len([x for x in results if x[2]])
+            numActualParses = len(results)
+            P = numCorrectParses / float(numGuesses)
+            R = numCorrectParses / float(numActualParses)
+            F = (2 * P * R) / (P + R)
+        except ZeroDivisionError:
+            F = 0.0
+        return F
+
+    def logResult(result, F, i, data):
+        rightAnswerInParses = result[1] in result[3]
+        correct = result[2] == result[1]
+        try:
+            bestGuess = ' '.join(result[2])
+        except TypeError:
+            bestGuess = 'NO GUESS'
+        log.debug('%s:\n%d. %s %s\n\tbest guess: %s\n\tright answer: %s'
+                  '\n\tright answer in parses: %s\n\tF-score: %f' % (
+                      data, i, result[0],
+                      {True: 'Correct', False: 'Incorrect'}[correct],
+                      bestGuess, ' '.join(result[1]), rightAnswerInParses, F))
+
+    results = []
+    resultsConformingToPhonology = []
+    lookup = {}
+    i = 1
+
+    for word in testSet:
+        if i % 10 == 1:
+            job.progress(u'Parsing word %d of %d (F-score so far: %f).' % (
+                i, len(testSet), getFScore(results)))
+
+        tr = word[0]
+        tr = removeWordFinalPunctuation(tr) # Remove word-final punctuation
+        mb = word[1]
+        mg = word[2]
+        variants = []
+        rightAnswer = (mb, mg)
+
+        conformsToPhonology = False
+        phonologizeds = applyFomaPhonology(mb, 'inverse')
+        if tr in phonologizeds:
+            conformsToPhonology = True
+            log.debug('%s phonologizes to %s' % (mb, tr))
+        else:
+            log.debug('%s does not phonologize to %s, but to %s' % (
+                mb, tr, ', '.join(phonologizeds)))
+
+        try:    # If we've already parsed this, no need to do it again
+            bestGuess, parses = lookup[tr]
+        except KeyError:
+            parses = getParsesFromFoma(tr)  # Try to get parses
+
+            if parses == [u'']: # If none, get variants
+                variants = getOrthographicVariants(tr)
+                if tr[0].isupper():
+                    deCapped = tr[0].lower() + tr[1:]
+                    variants = [deCapped] + \
+                        getOrthographicVariants(deCapped) + variants
+                log.debug('Variants:\n\t%s' % '\n\t'.join(variants))
+
+            for v in variants:
+                log.debug('%s is a variant for %s' % (v, tr))
+                parses = getParsesFromFoma(v)
+                if parses != [u'']:
+                    log.debug('Got %d parses for %s.' % (len(parses), v))
+                    break
+                else:
+                    log.debug('No parses for %s.' % v)
+
+            if parses == [u'']:
+                parses = []
+                bestGuess = None
+
+            if parses:
+                probs = [probCalc.getProbability(p) for p in parses]
+                parses = zip(parses, probs)
+                parses.sort(key=lambda x: x[1])
+                parses.reverse()
+                parses = [splitBreakFromGloss(x[0]) for x in parses]
+                bestGuess = parses[0]
+
+        # Remember results so we don't needlessly reparse 
+        lookup[tr] = (bestGuess, parses)
+
+        result = (tr, rightAnswer, bestGuess, parses)
+        results.append(result)
+        if conformsToPhonology:
+            resultsConformingToPhonology.append(result)
+
+        logResult(result, getFScore(results), i, 'All data')
+        logResult(result, getFScore(resultsConformingToPhonology), i,
+                  'Data where phonology works')
+
+        i += 1
+
+    return u'<p>F-score: %f (%d words); where the phonology works: %f ' \
+        u'(%d words).</p>' % (getFScore(results), len(results),
+                               getFScore(resultsConformingToPhonology),
+                               len(resultsConformingToPhonology))
+
+
+def applyPhonologyToDB(job, arguments):
+    """Applies the phonology to the morpheme breaks of the words of the Forms
+    that match the search values (arguments['values'], whose search terms the
+    request has already translated into the storage orthography) and returns
+    an HTML report on which of them the phonology maps to their
+    transcriptions.
+
+    """
+
+    def getVariants(word):
+        deCapped = word[0].lower() + word[1:]
+        return list(set([removeExtraneousPunctuation(word),
+                removeExtraneousPunctuation(deCapped)]))
+
+    def getReport(mb, tr, phonologizations):
+        report = u''
+        if tr in phonologizations or \
+        set(getVariants(tr)) & set(phonologizations):
+            span = '<span style="color: green;">'
+            report += u'<p>%s%s \u2192 %s</span></p>' % (span, mb, tr)
+        else:
+            span = '<span style="color: red;">'
+            report += u'<p>%s%s \u219B %s</span></p>\n<ul>' % (span, mb, tr)
+            for ph in phonologizations:
+                report += u'<li>%s</li>' % ph
+            report += u'</ul>'
+        return report
+
+    output = u''
+
+    # Get forms based on the search/filter provided by the user (validated
+    #  when the job was queued)
+    job.progress(u'Getting the Forms that match your criteria.')
+    result = SearchFormForm().to_python(arguments['values'])
+    form_q = meta.Session.query(model.Form)
+    form_q = h.filterSearchQuery(result, form_q, 'Form', translate=False)
+    if 'limit' in result and result['limit']:
+        form_q = form_q.limit(int(result['limit']))
+    forms = form_q.all()
+    log.debug('%d Forms match the search values.' % len(forms))
+
+    correct = incorrect = wordsFound = 0
+    mb2phonologized = {}
+    output += u'<p>%d Forms match your criteria</p>' % len(forms)
+    for i, form in enumerate(forms):
+        if i % 100 == 0:
+            job.progress(u'Applying the phonology to Form %d of %d.' % (
+                i + 1, len(forms)))
+        tr = form.transcription
+        mb = form.morphemeBreak
+        if form.morphemeBreak:
+            if len(tr.split()) == len(mb.split()):
+                words = zip(tr.split(), mb.split())
+                for w in words:
+                    tr = w[0]
+                    mb = w[1]
+                    try:
+                        phonologizations = mb2phonologized[mb]
+                    except KeyError:
+                        phonologizations = list(set(applyFomaPhonology(
+                            mb, 'inverse')))
+                        mb2phonologized[mb] = phonologizations
+                    wordsFound += 1
+                    if tr in phonologizations or \
+                    set(getVariants(tr)) & set(phonologizations):
+                        correct += 1
+                    else:
+                        log.debug('%s is not in %s' % (
+                            getVariants(tr), str(phonologizations)))
+                    output += getReport(w[1], w[0], phonologizations)
+    try:
+        percentCorrect = 100 * correct / float(wordsFound)
+    except ZeroDivisionError:
+        percentCorrect = 0.0
+    output += u'<p>%0.2f%% accuracy.</p>' % percentCorrect
+    output += u'<p>(%d words found in %d Forms).</p>' % (wordsFound, len(forms))
+    return output
+
+
+registerTask(u'generatemorphotactics', generateMorphotactics)
+registerTask(u'generatemorphophonology', generateMorphophonology)
+registerTask(u'generateprobabilitycalculator', generateProbabilityCalculator)
+registerTask(u'evaluateparser', evaluateParser)
+registerTask(u'applyphonologytodb', applyPhonologyToDB)
+
+
+def queueJob(name, arguments=None):
+    """Queues a job that runs the task called name for the user of the request
+    and returns its record as JSON.
+
+    """
+
+    id = submitJob(name, arguments, int(session['user_id']))
+    return json.dumps(getJob(id))
+
+
+
 class AnalysisController(BaseController):
 
     @h.authenticate
@@ -974,19 +1431,35 @@ class AnalysisController(BaseController):
 
         word = unicode(request.body, 'utf-8')
         parses = getParsesFromFoma(word)
-        if parses == [u'']:
-            return json.dumps([('NO PARSE', 'NO PARSE')])
-        probCalc = getProbCalc()
-        if probCalc:
-            probs = [probCalc.getProbability(p) for p in parses]
-            result = zip(parses, probs)
-            result.sort(key=lambda x: x[1])
-            result.reverse()
-            result = [x[0] for x in result]
-        else:
-            result = parses
-        result = json.dumps([splitBreakFromGloss(a) for a in result])
-        return result
+        return json.dumps(rankParses(parses, getProbCalc()))
+
+    @h.authenticate
+    @h.authorize(['administrator', 'contributor'])
+    @restrict('POST')
+    def getparses(self):
+        """Batch version of getparse.  The POST body is a JSON object with any
+        of the following attributes:
+
+        - words: a list of words
+        - transcriptions: a list of (multi-word) transcriptions
+        - formIDs: a list of Form ids whose transcriptions are to be parsed
+
+        The distinct word tokens are parsed in a single pass through the
+        morphophonology FST.  Returns a JSON object with the tokens (in order of
+        first occurrence) and a mapping from each token to its ranked list of
+        (morphemeBreak, morphemeGloss) parses, or with an error if the body
+        cannot be read (see h.getTranscriptionsToParse).
+
+        """
+
+        try:
+            transcriptions = h.getTranscriptionsToParse(request.body)
+        except ValueError:
+            return json.dumps({'error': 'Unable to read the words to parse'})
+
+        tokens = getTokensFromTranscriptions(transcriptions)
+        parses = getRankedParsesBatch(tokens)
+        return json.dumps({'tokens': tokens, 'parses': parses})
 
 
     @h.authenticate
@@ -1038,312 +1511,71 @@ class AnalysisController(BaseController):
 
         success = 'Writing to file %s' % phonologyBinaryFilePath
         if success in output:
+            reloadFlookupPools(phonologyBinaryFilePath)
             msg = "phonology script saved and compiled (%s)." % now
             return "<span style='color:green;font-weight:bold;'>%s</span>" % msg
         else:
             msg = "phonology script saved but unable to compile."
             return "<span class='warning-message'>%s</span>" % msg
 
+    # The following actions queue jobs (see the tasks above) and return their
+    #  records as JSON; the browser polls the job action until they finish.
+
     @h.authenticate
     @h.authorize(['administrator', 'contributor'])
     def generatemorphotactics(self):
-        """Writes the morphotactics.foma file representing the morphotactics
-        of the language.
+        """Queues a job that writes the morphotactics.foma file representing
+        the morphotactics of the language.
 
         """
 
-        print 'Getting syncatWordStrings.'
-        syncatWordStrings = getAllSyncatWordStrings(delim)
-
-        print 'Getting lexicalItems.'
-        lexicalItems = getLexicalItems(delim)
-
-        print 'Writing lexicon.txt file.'
-        lexiconFilePath = os.path.join(analysisDataDir, lexiconFileName)
-        lexiconFile = codecs.open(lexiconFilePath, 'w', 'utf-8')
-        lexiconString = u''
-        for li in sorted(lexicalItems.keys()):
-            lexiconString += u'#%s' % li
-            for x in sorted(lexicalItems[li]):
-                lexiconString += u'\n%s %s' % (x[0], x[1])
-            lexiconString += u'\n\n'
-        lexiconFile.write(lexiconString)
-        lexiconFile.close()
-
-        print 'Getting fomaMorphotacticsFile.'
-        fomaFile = getFomaMorphotacticsFile(
-            syncatWordStrings, lexicalItems, delim)
-        morphotacticsFilePath = os.path.join(analysisDataDir,
-                                             morphotacticsFileName)
-        morphotacticsFile = codecs.open(morphotacticsFilePath, 'w', 'utf-8')
-        morphotacticsFile.write(fomaFile)
-        morphotacticsFile.close()
-        
-        print 'Done.'
-        now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
-        return "morphotactics file saved (%s)." % now
+        return queueJob(u'generatemorphotactics')
 
     @h.authenticate
     @h.authorize(['administrator', 'contributor'])
     def generatemorphophonology(self):
-        """This method writes the foma binary file morphophonology.foma.bin
-        representing the morphophonology FST.  In order to do so, it also writes
-        two other files: morphophonology.foma and compilemorphophonology.sh.
-        The Python subprocess module is then used to run the shell script
-        compilemorphophonology.sh which runs a series of foma commands that
-        result in the creation of the morphohonology.foma.bin file.
+        """Queues a job that generates the morphophonology.foma.bin file (see
+        generateMorphophonology).
 
         """
 
-        morphophonologyBinaryFilePath = os.path.join(
-            analysisDataDir, morphophonologyBinaryFileName)
-
-        # 1. Write morphophonology.foma
-        print 'Writing morphophonology.foma.'
-        phonologyFilePath = os.path.join(analysisDataDir, phonologyFileName)
-        phonologyFile = codecs.open(phonologyFilePath, 'r', 'utf-8')
-        phonology = phonologyFile.read()
-
-        morphotacticsFilePath = os.path.join(analysisDataDir,
-                                             morphotacticsFileName)
-        morphotacticsFile = codecs.open(morphotacticsFilePath, 'r', 'utf-8')
-        morphotactics = morphotacticsFile.read()
-
-        morphophonologyFilePath = os.path.join(analysisDataDir,
-                                               morphophonologyFileName)
-        morphophonologyFile = codecs.open(morphophonologyFilePath, 'w', 'utf-8')
-        morphophonology = u'%s\n\n\n%s\n\n\n%s\n\n\n%s' % (
-            morphotactics,
-            phonology,
-            'define morphophonology morphotactics .o. phonology;',
-            'regex morphophonology;'
-        )
-        morphophonologyFile.write(morphophonology)
-
-        # 2. Write compilemorphophonology.sh
-        print 'Writing compilemorphophonology.sh.'
-        compilePath = os.path.join(analysisDataDir,
-                                   compileMorphophonologyFileName)
-        compileFile = open(compilePath, 'w')
-        cmd = 'foma -e "source %s" -e "save stack %s" -e "quit"' % (
-            morphophonologyFilePath, morphophonologyBinaryFilePath)
-        compileFile.write(cmd)
-        compileFile.close()
-        os.chmod(compilePath, 0755)
-
-        # 3. Execute compilemorphophonology.sh
-        print 'Generating morphophonology.foma.bin.'
-        process = subprocess.Popen([compilePath], shell=True,
-            stdout=subprocess.PIPE)
-
-        now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
-        output = unicode(process.communicate()[0], 'utf-8')
-        print 'Done.'
-
-        success = 'Writing to file %s' % morphophonologyBinaryFilePath
-        if success in output:
-            msg = "morphophonology binary file generated (%s)." % now
-            return "<span style='color:green;font-weight:bold;'>%s</span>" % msg
-        else:
-            msg = "unable to generate morphophonology binary file."
-            return "<span class='warning-message'>%s</span>" % msg
+        return queueJob(u'generatemorphophonology')
 
     @h.authenticate
     @h.authorize(['administrator', 'contributor'])
     def generateprobabilitycalculator(self):
-
-        print 'Getting lexical items.'
-        lexItms = getLexicalItemsFromFile(delim)
-        lexCats = lexItms.keys()
-
-        print 'Getting Forms with analyzed words.'
-        forms = getFormsWithAnalyzedWords()
-
-        print 'Getting analyzed word tokens.'
-        analyzedWords = getAnalyzedWords(forms, lexCats, delim)
-        print 'There are %d analyzed words in the database.' % len(
-            analyzedWords)
-
-        print 'Writing analyzed_words.txt file.'
-        saveAnalyzedWordsFile(analyzedWords)
-
-        print 'Getting ngrams.'
-        unigrams, bigrams = getNGramCounts(analyzedWords, lexItms)
-
-        print 'Getting probabilityCalculator.'
-        probabilityCalculator = ProbabilityCalculator(unigrams, bigrams, delim)
-
-        print 'Updating application globals with probabilityCalculator.'
-        app_globals.wordProbabilityCalculator = probabilityCalculator
-
-        print 'Pickling probabilityCalculator.'
-        probabilityCalculatorPicklePath = os.path.join(
-            analysisDataDir, probabilityCalculatorFileName)
-        probabilityCalculatorPickle = open(
-            probabilityCalculatorPicklePath, 'wb')
-        pickle.dump(probabilityCalculator, probabilityCalculatorPickle)
-        probabilityCalculatorPickle.close()
-
-        print 'Done.'
-        now = datetime.utcnow().strftime('at %H:%M on %b %d, %Y')
-        msg = 'generated probability calculator (%s)' % now
-        return "<span style='color:green;font-weight:bold;'>%s</span>" % msg
+        return queueJob(u'generateprobabilitycalculator')
 
     @h.authenticate
     @h.authorize(['administrator', 'contributor'])
     def evaluateparser(self):
-        #analyzeAccentation()
-
-        formsFilter = None
-        formsFilter = 'frantz'
-
-        print 'Getting lexical items from file.'
-        lexItms = getLexicalItemsFromFile(delim)
-        lexCats = lexItms.keys()
-
-        if formsFilter:
-            print 'Getting Forms with analyzed words.'
-            forms = getFormsWithAnalyzedWords()
-            if formsFilter == 'frantz':
-
-                badCats = ['vcpx', 'nan', 'nin', 'nar', 'nir', 'vai', 'vii',
-                           'vta', 'vti', 'vrt', 'adt', 'dem', 'prev', 'med',
-                           'fin', 'oth', 'und', 'pro', 'asp', 'ten', 'mod',
-                           'agra', 'agrb', 'thm', 'whq', 'num', 'drt', 'dim',
-                           'o', 'stp', 'PN', 'INT']
-                forms = [f for f in forms if f.source and
-                         f.source.authorLastName == u'Frantz'
-                         and (not f.syntacticCategory or
-                         f.syntacticCategory.name not in badCats)]
-                print 'We are analyzing data from %d forms' % len(forms)
-
-            print 'Getting analyzed word tokens.'
-            analyzedWords = getAnalyzedWords(forms, lexCats, delim)
-            print 'There are %d analyzed words in the database.' % len(
-                analyzedWords)
-
-            print 'Writing analyzed_words_frantz.txt file.'
-            saveAnalyzedWordsFile(analyzedWords, 'analyzed_words_frantz.txt')
-
-        else:
-            print 'Getting analyzed word tokens from file.'
-            analyzedWordsFilePath = os.path.join(analysisDataDir,
-                                                 analyzedWordsFileName)
-            analyzedWordsFile = codecs.open(analyzedWordsFilePath, 'r', 'utf-8')
-            analyzedWords = [tuple(x[:-1].split()) for x in analyzedWordsFile]
-            analyzedWordsFile.close()
-
-        print 'Getting training and test sets.'
-        trainingSet, testSet = getTrainingAndTestSets(analyzedWords)
-
-        print 'Getting ngrams from training set.'
-        unigrams, bigrams = getNGramCounts(trainingSet, lexItms)
-
-        print 'Getting probabilityCalculator based on training set.'
-        probCalc = ProbabilityCalculator(unigrams, bigrams, delim)
-
-        def getFScore(results):
-            try:
-                numCorrectParses = len([x for x in results if x[1] == x[2]])
-                numGuesses = len([x for x in results if x[2]])
-                numActualParses = len(results)
-                P = numCorrectParses / float(numGuesses)
-                R = numCorrectParses / float(numActualParses)
-                F = (2 * P * R) / (P + R)
-            except ZeroDivisionError:
-                F = 0.0
-            return F
-
-        def printResult(result, F, i):
-            rightAnswerInParses = result[1] in result[3]
-            correct = result[2] == result[1]
-            print '%d. %s %s' % (i, result[0],
-                                 {True: 'Correct', False: 'Incorrect'}[correct])
-            try:
-                print '\tbest guess: %s' % ' '.join(result[2])
-            except TypeError:
-                print '\tbest guess: NO GUESS'
-            print '\tright answer: %s' % ' '.join(result[1])
-            print '\tright answer in parses: %s' % rightAnswerInParses
-            print '\tF-score: %f' % F
-
-        results = []
-        resultsConformingToPhonology = []
-        lookup = {}
-        i = 1
-
-        for word in testSet:
-            tr = word[0]
-            tr = removeWordFinalPunctuation(tr) # Remove word-final punctuation
-            mb = word[1]
-            mg = word[2]
-            variants = []
-            rightAnswer = (mb, mg)
-
-            conformsToPhonology = False
-            phonologizeds = applyFomaPhonology(mb, 'inverse')
-            if tr in phonologizeds:
-                conformsToPhonology = True
-                print '%s phonologizes to %s' % (mb, tr)
-            else:
-                print '%s does not phonologize to %s, but to %s' % (
-                    mb, tr, ', '.join(phonologizeds))
-
-            try:    # If we've already parsed this, no need to do it again
-                bestGuess, parses = lookup[tr]
-            except KeyError:
-                parses = getParsesFromFoma(tr)  # Try to get parses
-
-                if parses == [u'']: # If none, get variants
-                    variants = getOrthographicVariants(tr)
-                    if tr[0].isupper():
-                        deCapped = tr[0].lower() + tr[1:]
-                        variants = [deCapped] + \
-                            getOrthographicVariants(deCapped) + variants
-                    print '\nVariants:\n\t%s\n' % '\n\t'.join(variants)
-
-                for v in variants:
-                    print '\t%s is a variant for %s' % (v, tr)
-                    parses = getParsesFromFoma(v)
-                    if parses != [u'']:
-                        print '\tWe got some parses for %s!:\n%d' % (
-                            v, len(parses))
-                        break
-                    else:
-                        print '\tNo parses for %s :(' % v
-
-                if parses == [u'']:
-                    parses = []
-                    bestGuess = None
-
-                if parses:
-                    probs = [probCalc.getProbability(p) for p in parses]
-                    parses = zip(parses, probs)
-                    parses.sort(key=lambda x: x[1])
-                    parses.reverse()
-                    parses = [splitBreakFromGloss(x[0]) for x in parses]
-                    bestGuess = parses[0]
+        return queueJob(u'evaluateparser')
 
-            # Remember results so we don't needlessly reparse 
-            lookup[tr] = (bestGuess, parses)
-
-            result = (tr, rightAnswer, bestGuess, parses)
-            results.append(result)
-            if conformsToPhonology:
-                resultsConformingToPhonology.append(result)
-
-            F = getFScore(results)
-            print 'All Data:'
-            printResult(result, F, i)
-
-            print 'Data where phonology works'
-            F = getFScore(resultsConformingToPhonology)
-            printResult(result, F, i)
+    @h.authenticate
+    @h.authorize(['administrator', 'contributor'])
+    def job(self, id):
+        """Returns the record of the job with id as JSON (see getJob in
+        lib/jobQueue.py).
 
-            i += 1
+        """
 
-            print '\n\n'
+        try:
+            job = getJob(int(id))
+        except (TypeError, ValueError):
+            job = None
+        if job is None:
+            abort(404)
+        return json.dumps(job)
 
+    @h.authenticate
+    @h.authorize(['administrator', 'contributor'])
+    @restrict('POST')
+    def canceljob(self, id):
+        try:
+            cancelJob(int(id))
+        except (TypeError, ValueError):
+            abort(404)
+        return self.job(id)
 
     @h.authenticate
     @h.authorize(['administrator', 'contributor'])
@@ -1354,75 +1586,21 @@ class AnalysisController(BaseController):
     @h.authorize(['administrator', 'contributor'])
     @restrict('POST')
     def applyphonologytodb(self):
+        """Queues a job that applies the phonology to the Forms that match the
+        search values in the request body (see applyPhonologyToDB).  The
+        search terms are translated into the storage orthography here, since
+        the job cannot get at the user's translators.
 
-        def getVariants(word):
-            deCapped = word[0].lower() + word[1:]
-            return list(set([removeExtraneousPunctuation(word),
-                    removeExtraneousPunctuation(deCapped)]))
-
-        def getReport(mb, tr, phonologizations):
-            report = u''
-            if tr in phonologizations or \
-            set(getVariants(tr)) & set(phonologizations):
-                span = '<span style="color: green;">'
-                report += u'<p>%s%s \u2192 %s</span></p>' % (span, mb, tr)
-            else:
-                span = '<span style="color: red;">'
-                report += u'<p>%s%s \u219B %s</span></p>\n<ul>' % (span, mb, tr)
-                for ph in phonologizations:
-                    report += u'<li>%s</li>' % ph
-                report += u'</ul>'
-            return report
-
-        output = u''
+        """
 
-        # Get forms based on the search/filter provided by the user
         values = urllib.unquote_plus(unicode(request.body, 'utf-8'))
         values = json.loads(values)
 
         schema = SearchFormForm()
         try:
-            result = schema.to_python(values)
+            schema.to_python(values)
         except Invalid:
-            return 'Unable to validate form data'
-
-        form_q = meta.Session.query(model.Form)
-        form_q = h.filterSearchQuery(result, form_q, 'Form')
-        if 'limit' in result and result['limit']:
-            form_q = form_q.limit(int(result['limit']))
-        forms = form_q.all()
-        log.debug(len(forms))
-
-        correct = incorrect = wordsFound = 0
-        mb2phonologized = {}
-        output += u'<p>%d Forms match your criteria</p>' % len(forms)
-        for form in forms:
-            tr = form.transcription
-            mb = form.morphemeBreak
-            if form.morphemeBreak:
-                if len(tr.split()) == len(mb.split()):
-                    words = zip(tr.split(), mb.split())
-                    for w in words:
-                        tr = w[0]
-                        mb = w[1]
-                        try:
-                            phonologizations = mb2phonologized[mb]
-                        except KeyError:
-                            phonologizations = list(set(applyFomaPhonology(
-                                mb, 'inverse')))
-                            mb2phonologized[mb] = phonologizations
-                        wordsFound += 1
-                        if tr in phonologizations or \
-                        set(getVariants(tr)) & set(phonologizations):
-                            correct += 1
-                        else:
-                            print '%s is not in %s' % (getVariants(tr), str(phonologizations))
-                        output += getReport(w[1], w[0], phonologizations)
-        try:
-            percentCorrect = 100 * correct / float(wordsFound)
-        except ZeroDivisionError:
-            percentCorrect = 0.0
-        output += u'<p>%0.2f%% accuracy.</p>' % percentCorrect
-        output += u'<p>(%d words found in %d Forms).</p>' % (wordsFound, len(forms))
-        return output
-    
\ No newline at end of file
+            return json.dumps({'error': 'Unable to validate form data'})
+
+        values = h.translateSearchTerms(values)
+        return queueJob(u'applyphonologytodb', {'values': values})
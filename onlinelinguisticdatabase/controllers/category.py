@@ -103,9 +103,8 @@ class CategoryController(BaseController):
         # Enter the data
         meta.Session.add(category)
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['syncats'])
-        app_globals.syncats = tags['syncats']
+        # Update the syncats in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('syncats')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='category', action='view', id=category.id)
@@ -157,9 +156,8 @@ class CategoryController(BaseController):
         category.description = h.NFD(self.form_result['description'])
         # Update the data
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['syncats'])
-        app_globals.syncats = tags['syncats']
+        # Update the syncats in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('syncats')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='category', action='view', id=category.id)
@@ -177,9 +175,8 @@ class CategoryController(BaseController):
             abort(404)
         meta.Session.delete(category)
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['syncats'])
-        app_globals.syncats = tags['syncats']
+        # Update the syncats in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('syncats')
         session['flash'] = "Syntactic Category %s has been deleted" % id
         session.save()
         redirect(url(controller='tag', action='index'))
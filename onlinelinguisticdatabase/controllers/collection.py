@@ -44,6 +44,10 @@ import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
 from onlinelinguisticdatabase.lib.oldMarkup import embedContentsOfCollections, linkToOLDEntitites, embedFiles
+from onlinelinguisticdatabase.lib.oldMarkup import getEmbeddedCollections, \
+    getEmbeddedIDs, getEntitiesByID, formEmbedPatt, fileEmbedPatt
+from onlinelinguisticdatabase.lib.renderCache import getCachedHTML, \
+    getDependencyFingerprint, getFingerprint, getViewerKey
 
 from sqlalchemy import desc
 
@@ -252,9 +256,12 @@ def getFormAsHTMLTable(match, formsDict):
     except AttributeError:
         return form
 
-def getCollectionContentsAsHTML(collection):
+def getCollectionContentsAsHTML(collection, collectionsDict=None):
     """This function formats the contents of a Collection as HTML.  It assumes
     the contents text is written in reStructuredText.
+
+    collectionsDict maps ids to the Collections embedded in the contents (see
+    oldMarkup.getEmbeddedCollections); by default, they are fetched.
     
     """
     
@@ -267,14 +274,19 @@ def getCollectionContentsAsHTML(collection):
     # enumerator gives example numbers to embedded forms
     enumerator = 1
     
-    # c.formsDict will be used by template to get the correct Form
-    c.formsDict = dict([(form.id, form) for form in collection.forms])
-    
     # Replace each embedding reference to a Collection with its contents
     #  (verbatim). Do this first so that the subsequent rst2html conversion will
     #  convert the composite collection in one go.  This seems easier than doing
     #  rst2html(collection.contents) for each embedded Collection...
-    contents = embedContentsOfCollections(contents)
+    contents = embedContentsOfCollections(contents, collectionsDict)
+
+    # Fetch the Forms and Files embedded anywhere in the (composite) contents
+    #  with one query each.  c.formsDict will be used by template to get the
+    #  correct Form
+    c.formsDict = getEntitiesByID(model.Form,
+        getEmbeddedIDs(contents, formEmbedPatt), 'IGT')
+    filesDict = getEntitiesByID(model.File,
+        getEmbeddedIDs(contents, fileEmbedPatt))
 
     # Convert collection's contents to HTML using rst2html
     contents = h.rst2html(contents)
@@ -327,7 +339,7 @@ def getCollectionContentsAsHTML(collection):
     )
 
     # Embed OLD Files
-    contents = embedFiles(contents)
+    contents = embedFiles(contents, filesDict)
 
     # Replace each linking reference to an OLD entity with an HTML link
     contents = linkToOLDEntitites(contents)
@@ -335,6 +347,29 @@ def getCollectionContentsAsHTML(collection):
     return contents
 
 
+def getCachedCollectionContentsAsHTML(collection):
+    """Return getCollectionContentsAsHTML(collection), from the render cache
+    (see lib/renderCache) if nothing it depends on has changed: the contents,
+    the embedded Collections (at any depth) and the Forms (and their Files)
+    and Files embedded in them.
+    
+    """
+
+    collectionsDict = getEmbeddedCollections(collection.contents)
+    contents = embedContentsOfCollections(collection.contents or u'',
+                                          collectionsDict)
+    formIDs = getEmbeddedIDs(contents, formEmbedPatt)
+    fingerprint = getFingerprint(
+        collection.contents, collection.datetimeModified,
+        sorted([(id, embedded.datetimeModified)
+                for id, embedded in collectionsDict.items()]),
+        getDependencyFingerprint(formIDs,
+                                 getEmbeddedIDs(contents, fileEmbedPatt)))
+    key = 'collection%d_%s' % (collection.id, getViewerKey(formIDs))
+    return getCachedHTML(key, fingerprint,
+        lambda: getCollectionContentsAsHTML(collection, collectionsDict))
+
+
 class CollectionController(BaseController):
     """Collection Controller contains actions about OLD Collections.
     Authorization and authentication are implemented by the
@@ -377,7 +412,7 @@ class CollectionController(BaseController):
 
         # Convert the Collection contents (assumed to be in reStructuredText
         #  with OLDMarkup) to HTML
-        c.contents = getCollectionContentsAsHTML(c.collection)
+        c.contents = getCachedCollectionContentsAsHTML(c.collection)
 
         return render('/derived/collection/view.html')
 
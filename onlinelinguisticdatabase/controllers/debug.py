@@ -24,6 +24,11 @@ import os
 import re
 from docutils import core
 
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
 from pylons import request, response, session, app_globals, tmpl_context as c
 from pylons import url
 from pylons.controllers.util import abort, redirect
@@ -48,6 +53,8 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.regexCache import regexCache
+from onlinelinguisticdatabase.lib.translationCache import translationCache
 
 from sqlalchemy import desc
 
@@ -72,4 +79,26 @@ class DebugController(BaseController):
     @h.authorize(['administrator'])
     def root(self):
         c.root = app_globals.pylons_config.paths
-        return render('/derived/debug/root.html')
\ No newline at end of file
+        return render('/derived/debug/root.html')
+
+    @h.authenticate
+    @h.authorize(['administrator'])
+    def regexcache(self):
+        """Return the hit/miss counts of the compiled regex cache used by the
+        SQLite REGEXP function as JSON.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        return json.dumps(regexCache.getStats())
+
+    @h.authenticate
+    @h.authorize(['administrator'])
+    def translationcache(self):
+        """Return the hit/miss counts of the orthographic translation cache
+        as JSON.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        return json.dumps(translationCache.getStats())
@@ -53,10 +53,30 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.loadingProfiles import withLoadingProfile
 
 log = logging.getLogger(__name__)
 
 
+def getWordQuery():
+    """Return a Form query that loads the glosses and keywords that the
+    dictionary views display along with the Forms.
+
+    """
+
+    return withLoadingProfile(meta.Session.query(model.Form), 'summary')
+
+
+def getGlossQuery():
+    """Return a query of (Form, Gloss) pairs, one for each Gloss, ordered by
+    the Glosses' dictionary keys (see lib/dictionaryIndex.py).
+
+    """
+
+    return getWordQuery().join(model.Form.glosses).add_entity(
+        model.Gloss).order_by(model.Gloss.dictionaryKey, model.Gloss.id)
+
+
 class SearchDictionaryForm(Schema):
     """SearchDictionaryForm is a Schema for validating the search term entered
     at the Dictionary page.
@@ -71,8 +91,8 @@ class SearchDictionaryForm(Schema):
 
 class ThinForm():
     """Defines a Form-like object with only id, transcription and gloss
-    attributes.  The transcription attribute allows a ThinForm to be sorted
-    by h.CustomSorter.sort() just like a regular Form.
+    attributes.  The dictionary's metalanguage-to-object-language views list
+    one ThinForm per Gloss, with the gloss as the transcription.
     
     """
     
@@ -83,24 +103,6 @@ class ThinForm():
         self.keywords = keywords
 
 
-def getSuperGraphs(graph, orthographyAsList):
-    """Given a graph x, return a list of those graphs in 
-    orthographyAsList of which x is a substring.
-    
-    e.g., 
-        graph = ['a']
-        orthographyAsList = [['a', 'ae'], ['o']]
-        getSuperGraphs(graph, orthographyAsList) returns ['ae']
-    """ 
-    result = []
-    for x in orthographyAsList:
-        for y in graph:
-            for z in x:
-                if y in z and graph != x:
-                    result.append(z)
-    return result
-
-
 class DictionaryController(BaseController):
     """Dictionary Controller object provides a dictionary-like interface to
     the OLD database.
@@ -174,82 +176,48 @@ class DictionaryController(BaseController):
         pattern = h.inputToStorageTranslate(result['dictionarySearchTerm'])
         direction = c.languageToSortBy = result['dictionarySearchType']
         
-        def getOLQuery(pattern, orthography):
+        def getOLQuery(pattern):
             # Exact query
-            general_q = meta.Session.query(model.Form)
+            general_q = getWordQuery()
             general_q = general_q.filter(not_(
-                model.Form.transcription.like(unicode(u'% %'))))
+                model.Form.transcription.like(unicode(u'% %')))).order_by(
+                model.Form.dictionaryKey, model.Form.id)
             exactMatch_q = general_q.filter(model.Form.transcription==pattern)
             c.exactMatchList = exactMatch_q.all()
 
             # Fuzzy query
-            general_q = meta.Session.query(model.Form)
-            general_q = general_q.filter(not_(
-                model.Form.transcription.like(unicode(u'% %'))))
             pattern = unicode('%' + pattern + '%')
             fuzzyMatch_q = general_q.filter(
                 model.Form.transcription.like(pattern))  
             c.fuzzyMatchList = fuzzyMatch_q.all()
 
-            if c.exactMatchList or c.fuzzyMatchList:
-                cs = h.CustomSorter(orthography)
-                c.exactMatchList = cs.sort(c.exactMatchList)
-                c.fuzzyMatchList = cs.sort(c.fuzzyMatchList)
+        def getMLQuery(pattern):
+            # (Form, Gloss) pairs in the order of the glosses
+            general_q = getGlossQuery().filter(not_(
+                model.Form.transcription.like(unicode(u'% %'))))
 
-        def getMLQuery(pattern, orthography):
             # Exact query
-            general_q = meta.Session.query(model.Form)
-            general_q = general_q.filter(not_(
-                model.Form.transcription.like(unicode(u'% %'))))
-            general_q = general_q.outerjoin(model.Form.glosses)
             exactMatch_q = general_q.filter(model.Gloss.gloss==pattern)
-            c.exactMatchList = exactMatch_q.all()
+            c.exactMatchList = [ThinForm(form.id, gloss.gloss,
+                                         form.transcription, form.keywords)
+                                for form, gloss in exactMatch_q.all()]
+            exactIds = [x.id for x in c.exactMatchList]
 
             # Fuzzy query
-            general_q = meta.Session.query(model.Form)
-            general_q = general_q.filter(not_(
-                model.Form.transcription.like(unicode(u'% %'))))
-            general_q = general_q.outerjoin(model.Form.glosses)
             likePattern = unicode('%' + pattern + '%')
             fuzzyMatch_q = general_q.filter(model.Gloss.gloss.like(likePattern))
-            c.fuzzyMatchList = fuzzyMatch_q.all()
-
-            if c.exactMatchList or c.fuzzyMatchList:
-                newWordList = []
-                for form in c.exactMatchList:
-                    goodGlosses = [gloss.gloss for gloss in form.glosses
-                                   if pattern == gloss.gloss]
-                    for gg in goodGlosses:  
-                        newForm = ThinForm(form.id, gg, form.transcription, form.keywords)
-                        newWordList.append(newForm)
-                c.exactMatchList = newWordList
-                exactIds = [x.id for x in c.exactMatchList]
-
-                newWordList = []
-                for form in c.fuzzyMatchList:
-                    goodGlosses = [gloss.gloss for gloss in form.glosses
-                                   if pattern in gloss.gloss]
-                    for gg in goodGlosses:  
-                        newForm = ThinForm(form.id, gg, form.transcription, form.keywords)
-                        newWordList.append(newForm)
-                c.fuzzyMatchList = [x for x in newWordList
-                                    if x.id not in exactIds]
-
-                cs = h.CustomSorter(orthography)
-                c.exactMatchList = cs.sort(c.exactMatchList)
-                c.fuzzyMatchList = cs.sort(c.fuzzyMatchList)
+            c.fuzzyMatchList = [ThinForm(form.id, gloss.gloss,
+                                         form.transcription, form.keywords)
+                                for form, gloss in fuzzyMatch_q.all()
+                                if pattern in gloss.gloss and
+                                form.id not in exactIds]
                 
-        directionToOrthography = {
-            'ol': app_globals.storageOrthography[1],
-            'ml': app_globals.metaLanguageOrthography
-        }
         directionToResultListsGetter = {
             'ol': getOLQuery,
             'ml': getMLQuery
         }
                     
-        orthography = directionToOrthography[direction]
-        directionToResultListsGetter[direction](pattern, orthography)
+        directionToResultListsGetter[direction](pattern)
         return render('/derived/dictionary/search.html')
 
 
@@ -306,92 +274,50 @@ class DictionaryController(BaseController):
         if id and patt.search(id):
             headCharIndex = id.split('_')[0]
             c.languageToSortBy = id.split('_')[1]
-            langToOrth = {
-                'ol': [app_globals.storageOrthography[1], OLOrthographyAsList,
-                       'transcription'],
-                'ml': [MLOrthography, MLOrthographyAsList, 'gloss']
+            langToOrthographyAsList = {
+                'ol': OLOrthographyAsList,
+                'ml': MLOrthographyAsList
             }
-            orthography = langToOrth[c.languageToSortBy][0]
-            orthographyAsList = langToOrth[c.languageToSortBy][1]
+            orthographyAsList = langToOrthographyAsList[c.languageToSortBy]
             try:
                 c.headChar = orthographyAsList[int(headCharIndex)]
             except IndexError:
                 c.headChar = None
-            wordList_q = meta.Session.query(model.Form)
+            if c.languageToSortBy == 'ol':
+                wordList_q = getWordQuery().order_by(
+                    model.Form.dictionaryKey, model.Form.id)
+            else:
+                wordList_q = getGlossQuery()
             wordList_q = wordList_q.filter(
                 not_(model.Form.transcription.like(u'% %'))
             )
             
         # The default case
-        #  Non-empty headChar means a letter was clicked on
+        #  Non-empty headChar means a letter was clicked on.  Forms and Glosses
+        #  store the rank of the graph they begin with (see
+        #  lib/dictionaryIndex.py); the output orthography's graphs have the
+        #  same ranks as the storage orthography's.
         if id and c.headChar:
         
-            # filter and sort wordList for object-language-to-metalanguage view
+            # object-language-to-metalanguage view
             if c.languageToSortBy == 'ol':
-                wordList_q = wordList_q.filter(
-                    model.Form.transcription.op('regexp')(
-                        '^(%s)' % '|'.join(c.headChar))
-                )
-                    
-                # existence of supergraphs means we have to filter the query
-                #  of Forms whose transcription/gloss begins with a supergraph
-                superGraphs = getSuperGraphs(c.headChar, OLOrthographyAsList)
-                if superGraphs:
-                    wordList_q = wordList_q.filter(
-                        not_(model.Form.transcription.op('regexp')(
-                            '^(%s)' % '|'.join(superGraphs)))
-                    )
-                
-                # sort wordList using functions.CustomSorter class
-                c.wordList = wordList_q.all()   
-                if c.wordList:
-                    cs = h.CustomSorter(orthography)
-                    c.wordList = cs.sort(c.wordList)
-            # filter and sort wordList for metalanguage-to-object-metalanguage view
+                c.wordList = wordList_q.filter(
+                    model.Form.dictionaryHead == int(headCharIndex)).all()
+            # metalanguage-to-object-metalanguage view
             elif c.languageToSortBy == 'ml':
-                wordList_q = wordList_q.outerjoin(
-                    model.Form.glosses
-                )
                 wordList_q = wordList_q.filter(
-                    model.Gloss.gloss.op('regexp')('^(%s)' % '|'.join(c.headChar))
-                )
-                
-                # existence of supergraphs means we have to filter the query
-                #  of Forms whose transcription/gloss begins with a supergraph
-                superGraphs = getSuperGraphs(c.headChar, MLOrthographyAsList)
-                if superGraphs:
-                    wordList_q = wordList_q.filter(
-                        not_(model.Gloss.gloss.op('regexp')(
-                            '^(%s)' % '|'.join(superGraphs)))
-                    )
-                wordList = wordList_q.all()
-                
-                if wordList:
-                    patt = re.compile('^%s' % c.headChar)
-                    newWordList = []
-                    for form in wordList:
-                        goodGlosses = [gloss.gloss for gloss in form.glosses
-                                       if patt.match(gloss.gloss)]
-                        for gg in goodGlosses:  
-                            newForm = ThinForm(form.id, gg, form.transcription, form.keywords)
-                            newWordList.append(newForm)
-                    cs = h.CustomSorter(orthography)
-                    c.wordList = cs.sort(newWordList)
+                    model.Gloss.dictionaryHead == int(headCharIndex))
+                c.wordList = [ThinForm(form.id, gloss.gloss,
+                                       form.transcription, form.keywords)
+                              for form, gloss in wordList_q]
         # The special case
         #  id of a million means we are browsing everything!
         elif id and int(headCharIndex) == 1000000:
-            wordList = wordList_q.all()
             if c.languageToSortBy == 'ml':
-                newWordList = []
-                for form in wordList:
-                    goodGlosses = [gloss.gloss for gloss in form.glosses]
-                    for gg in goodGlosses:  
-                        newForm = ThinForm(form.id, gg, form.transcription, form.keywords)
-                        newWordList.append(newForm)
-                cs = h.CustomSorter(orthography)
-                c.wordList = cs.sort(newWordList)
+                c.wordList = [ThinForm(form.id, gloss.gloss,
+                                       form.transcription, form.keywords)
+                              for form, gloss in wordList_q]
             else:
-                cs = h.CustomSorter(orthography)
-                c.wordList = cs.sort(wordList)
+                c.wordList = wordList_q.all()
 
         return render('/derived/dictionary/browse.html') 
\ No newline at end of file
@@ -87,11 +87,10 @@ class ExportController(BaseController):
         exporterIndex = int(option[6:])
         exporter = exporters[exporterIndex]
         
-        # Create the export string
-        exportString = exporter.export(input)
-        
         # Create the export file (simultaneously overwriting this user's
-        #  previous export file)
+        #  previous export file).  The export is written piece by piece as it
+        #  is generated to a temporary file, which then replaces the previous
+        #  export file.
         c.filename = '%s.%s' % (session['user_username'], exporter.extension)
         filePath = os.path.join(
             config['app_conf']['permanent_store'],
@@ -99,8 +98,20 @@ class ExportController(BaseController):
             session['user_username'],
             c.filename
         )
-        file = codecs.open(filePath, encoding='utf-8', mode='w')
-        file.write(exportString)
+        tempPath = '%s.tmp' % filePath
+        file = codecs.open(tempPath, encoding='utf-8', mode='w')
+        try:
+            try:
+                for chunk in exporter.iter_export(input):
+                    file.write(chunk)
+            finally:
+                file.close()
+        except:
+            os.remove(tempPath)
+            raise
+        if os.path.exists(filePath):
+            os.remove(filePath)
+        os.rename(tempPath, filePath)
 
         c.fileRetrieveName = os.path.join(
             'researchers', session['user_username'], c.filename)
@@ -52,6 +52,7 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.pagination import getKeysetPage
 
 
 log = logging.getLogger(__name__)
@@ -216,11 +217,17 @@ class FileController(BaseController):
     @h.authenticate
     def browse(self):
         """Browse through all Files in the system."""
-        file_q = meta.Session.query(model.File).order_by(model.File.name)
-        c.paginator = paginate.Page(
+        file_q = meta.Session.query(model.File)
+        # Keyset pagination by name (see lib/pagination)
+        c.paginator = getKeysetPage(
             file_q,
-            page=int(request.params.get('page', 1)),
-            items_per_page = app_globals.file_items_per_page
+            'fileBrowsePagination',
+            app_globals.file_items_per_page,
+            model.File.name,
+            'asc',
+            model.File.id,
+            int(request.params.get('page', 1)),
+            app_globals.file_items_per_page
         )
         c.browsing = True
         return render('/derived/file/results.html')
@@ -55,6 +55,12 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.morphemeReferences import getMorphemeKey, \
+    scheduleMorphemeReferenceUpdate
+from onlinelinguisticdatabase.lib.pagination import getKeysetPage
+from onlinelinguisticdatabase.lib.loadingProfiles import withLoadingProfile, \
+    getFormViewProfile
+from onlinelinguisticdatabase.lib.dictionaryIndex import setDictionaryKeys
 
 from sqlalchemy import desc
 
@@ -509,6 +515,9 @@ def getFormAttributes(form, result, createOrSave):
     meta.Session.add(form)
     form.getMorphemeIDLists(meta, model)
 
+    # The place of the Form and its Glosses in the dictionary
+    setDictionaryKeys(form)
+
     # Save the form just entered to the session as the lastFormEntered so that
     #  we can implement the defaultMetadataFromPreviousForm setting.
     session['lastFormEntered'] = form
@@ -659,8 +668,8 @@ class FormController(BaseController):
         
         """
 
-        form_q = meta.Session.query(model.Form).order_by(desc(
-            model.Form.id)).limit(1000)
+        form_q = withLoadingProfile(meta.Session.query(model.Form),
+            getFormViewProfile(session.get('defaultFormView')))
 
         form_items_per_page = app_globals.form_items_per_page
         try:
@@ -669,10 +678,19 @@ class FormController(BaseController):
         except KeyError:
             pass
 
-        c.paginator = paginate.Page(
+        # Keyset pagination (see lib/pagination) by descending id; the form
+        #  count kept in app_globals is used as the item count.
+        formCount = h.getFormCount()
+        c.paginator = getKeysetPage(
             form_q,
-            page=int(request.params.get('page', 1)),
-            items_per_page = form_items_per_page
+            'formBrowsePagination',
+            (formCount, form_items_per_page),
+            model.Form.id,
+            'desc',
+            model.Form.id,
+            int(request.params.get('page', 1)),
+            form_items_per_page,
+            itemCount=formCount
         )
         c.browsing = True
         
@@ -901,12 +919,13 @@ class FormController(BaseController):
 
         return {
             'grammaticalities': app_globals.grammaticalities,
-            'elicitationMethods': [[u'', u'']] + app_globals.elicitationMethods,
-            'keywords': app_globals.keywords,
-            'categories': [[u'', u'']] + app_globals.syncats,
-            'speakers': [[u'', u'']] + app_globals.speakers,
-            'users': [[u'', u'']] + app_globals.users,
-            'sources': [[u'', u'']] + app_globals.sources
+            'elicitationMethods': [[u'', u'']] +
+                list(app_globals.elicitationMethods),
+            'keywords': list(app_globals.keywords),
+            'categories': [[u'', u'']] + list(app_globals.syncats),
+            'speakers': [[u'', u'']] + list(app_globals.speakers),
+            'users': [[u'', u'']] + list(app_globals.users),
+            'sources': [[u'', u'']] + list(app_globals.sources)
         }
 
     #@h.authenticate_ajax
@@ -926,8 +945,12 @@ class FormController(BaseController):
             # Enter it in the database
             meta.Session.add(form)
             meta.Session.commit()
+            h.updateSearchIndex(form)
+            meta.Session.commit()
             formCount = h.getFormCount()
             app_globals.formCount += 1
+            scheduleMorphemeReferenceUpdate(form.id, None,
+                                            getMorphemeKey(form))
             result = {'valid': True, 'form': form}
 
         response.headers['Content-Type'] = 'application/json'
@@ -969,10 +992,16 @@ class FormController(BaseController):
             # Enter the data
             meta.Session.add(form)
             meta.Session.commit()
+            h.updateSearchIndex(form)
+            meta.Session.commit()
 
             formCount = h.getFormCount()
             app_globals.formCount += 1
 
+            # Other Forms may contain this Form's morpheme
+            scheduleMorphemeReferenceUpdate(form.id, None,
+                                            getMorphemeKey(form))
+
             # Foreign word forms will change the inventory-based validation
             h.updateInventoryObjsIfFormIsForeignWord(form)
 
@@ -1040,6 +1069,11 @@ class FormController(BaseController):
 
         """
 
+        # Sort column and direction for keyset pagination
+        orderByColumn = 'id'
+        orderByDirection = 'asc'
+        searchSignature = None
+
         if id:
             patt = re.compile('^[0-9 ]+$')
             IDs = [int(ID.strip().replace(' ', '')) for ID in id.split(',')
@@ -1048,11 +1082,15 @@ class FormController(BaseController):
                 IDs = [0]
             form_q = meta.Session.query(model.Form).filter(
                 model.Form.id.in_(IDs))
+            searchSignature = tuple(IDs)
         else:
             if 'formSearchValues' in session:
                 result = session['formSearchValues']
                 form_q = meta.Session.query(model.Form)
                 form_q = h.filterSearchQuery(result, form_q, 'Form')
+                orderByColumn = result['orderByColumn']
+                orderByDirection = result['orderByDirection']
+                searchSignature = result.get('timeSearched')
             else:
                 form_q = meta.Session.query(model.Form)
 
@@ -1062,12 +1100,10 @@ class FormController(BaseController):
             limit = None
 
         if limit:
-            form_q = form_q.limit(int(limit))
+            limit = int(limit)
         else:
             # Default is to limit query to 1000 results max
-            form_q = form_q.limit(1000)
-
-        forms = form_q.all()
+            limit = 1000
 
         form_items_per_page = app_globals.form_items_per_page
         try:
@@ -1076,11 +1112,32 @@ class FormController(BaseController):
         except KeyError:
             pass
 
-        c.paginator = paginate.Page(
-            form_q,
-            page=int(request.params.get('page', 1)),
-            items_per_page = form_items_per_page
-        )
+        page = int(request.params.get('page', 1))
+
+        form_q = withLoadingProfile(form_q,
+            getFormViewProfile(session.get('defaultFormView')))
+
+        if orderByColumn == 'gloss':
+            # Ordering by a column of the joined gloss table can list a Form
+            #  more than once, so use offset pagination.
+            c.paginator = paginate.Page(
+                form_q.limit(limit),
+                page=page,
+                items_per_page = form_items_per_page
+            )
+        else:
+            c.paginator = getKeysetPage(
+                form_q,
+                'formResultsPagination',
+                (searchSignature, orderByColumn, orderByDirection, limit,
+                 form_items_per_page),
+                getattr(model.Form, orderByColumn),
+                orderByDirection == 'desc' and 'desc' or 'asc',
+                model.Form.id,
+                page,
+                form_items_per_page,
+                maxItems=limit
+            )
 
         return render('/derived/form/results.html')
 
@@ -1203,14 +1260,20 @@ class FormController(BaseController):
 
             # Backup the form to the formbackup table
             backupForm(form)
+            oldMorphemeKey = getMorphemeKey(form)
 
             # Populate the Form's attributes with the data from the user-entered
             #  result dict
             form = getFormAttributes(form, result, 'save')
+            h.updateSearchIndex(form)
 
             # Commit the update
             meta.Session.commit()
 
+            # Other Forms may contain this Form's (old or new) morpheme
+            scheduleMorphemeReferenceUpdate(form.id, oldMorphemeKey,
+                                            getMorphemeKey(form))
+
             # Foreign word forms will change the inventory-based validation
             h.updateInventoryObjsIfFormIsForeignWord(form)
 
@@ -1242,16 +1305,21 @@ class FormController(BaseController):
 
         # Back up Form to formbackup table
         backupForm(form)
+        oldMorphemeKey = getMorphemeKey(form)
 
         # Delete Form
+        h.removeFromSearchIndex(form.id)
         meta.Session.delete(form)
         meta.Session.commit()
 
+        # Other Forms may contain this Form's morpheme
+        scheduleMorphemeReferenceUpdate(int(id), oldMorphemeKey, None)
+
         formCount = h.getFormCount()
         app_globals.formCount -= 1
 
         # Foreign word forms will change the inventory-based validation
-        h.updateInventoryObjsIfFormIsForeignWord(form)
+        h.updateInventoryObjsIfFormIsForeignWord(form, deleted=True)
 
         # Create the flash message
         session['flash'] = "Form %s has been deleted" % id
@@ -1337,7 +1405,8 @@ class FormController(BaseController):
 
         if id is None:
             abort(404)
-        form = c.form = meta.Session.query(model.Form).get(int(id))  
+        form = c.form = withLoadingProfile(meta.Session.query(model.Form),
+                                           'IGT').get(int(id))
 
         if c.form is None:
             abort(404)
@@ -1485,11 +1554,13 @@ class FormController(BaseController):
         if id is None:
             if 'formSearchValues' in session:
                 result = session['formSearchValues']
-                form_q = meta.Session.query(model.Form)
+                form_q = withLoadingProfile(meta.Session.query(model.Form),
+                                            'access')
                 c.forms = h.filterSearchQuery(result, form_q, 'Form').limit(
                     max).all()
             else:
-                c.forms = meta.Session.query(model.Form).limit(max).all()
+                c.forms = withLoadingProfile(meta.Session.query(model.Form),
+                                             'access').limit(max).all()
         else:
             form_q = meta.Session.query(model.Form)
             c.forms = [form_q.get(int(id))]
@@ -1703,38 +1774,44 @@ class FormController(BaseController):
             replacement = '<span class="warning-message">%s</span>' % pattern
             return string.replace(pattern, replacement)
 
+        def getFormQuery(*entities):
+            # The matches are displayed with their glosses and checked for
+            #  the 'restricted' keyword
+            return withLoadingProfile(meta.Session.query(*entities),
+                                      'summary')
+
         def getOLSearchResults(term):
             # First, try exact search
-            result = meta.Session.query(model.Form).filter(
+            result = getFormQuery(model.Form).filter(
                 model.Form.transcription==term).limit(20).all()
             # Then, try regular expression "as a word" search
             if not result:
                 termRE = '(^| )%s($| )' % term
-                result = meta.Session.query(model.Form).filter(
+                result = getFormQuery(model.Form).filter(
                     model.Form.transcription.op('regexp')(termRE)).limit(20).all()
             # Finally, try substring (like) search
             if not result:
                 likeTerm = '%s%s%s' % ('%', term, '%')
-                result = meta.Session.query(model.Form).filter(
+                result = getFormQuery(model.Form).filter(
                     model.Form.transcription.like(likeTerm)).limit(20).all()
             return [f for f in result
                     if h.userIsAuthorizedToAccessForm(session['user'], f)]
 
         def getMLSearchResults(term):
             # First, try exact search
-            result = meta.Session.query(model.Form, model.Gloss).filter(
+            result = getFormQuery(model.Form, model.Gloss).filter(
                 model.Gloss.form_id==model.Form.id).filter(
                 model.Gloss.gloss==term).limit(20).all()
             # Then, try regular expression "as a word" search
             if not result:
                 termRE = '(^| )%s($| )' % term
-                result = meta.Session.query(model.Form, model.Gloss).filter(
+                result = getFormQuery(model.Form, model.Gloss).filter(
                     model.Gloss.form_id==model.Form.id).filter(
                     model.Gloss.gloss.op('regexp')(termRE)).limit(20).all()
             # Finally, try substring (like) search
             if not result:
                 likeTerm = '%s%s%s' % ('%', term, '%')
-                result = meta.Session.query(model.Form, model.Gloss).filter(
+                result = getFormQuery(model.Form, model.Gloss).filter(
                     model.Gloss.form_id==model.Form.id).filter(
                     model.Gloss.gloss.like(likeTerm)).limit(20).all()
             return [t[0] for t in result
@@ -30,6 +30,7 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.renderCache import getCachedPageHTML
 
 from formencode.schema import Schema
 from formencode import htmlfill
@@ -121,9 +122,9 @@ class HelpController(BaseController):
 
         c.heading = helppage.heading
 
-        # Get the help page content and translate it to HTML
-        content = helppage.content
-        content = h.literal(h.rst2html(content))
+        # Get the help page content and translate it to HTML (cached until the
+        #  page changes)
+        content = h.literal(getCachedPageHTML(helppage, h.rst2html))
 
         c.content = content
         
@@ -38,7 +38,8 @@ from formencode.schema import Schema
 from formencode import htmlfill
 from formencode.validators import Int, OneOf, UnicodeString
 
-from onlinelinguisticdatabase.lib.oldMarkup import linkToOLDEntitites, embedFiles, embedForms
+from onlinelinguisticdatabase.lib.oldMarkup import getPageContentAsHTML
+from onlinelinguisticdatabase.lib.renderCache import getCachedPageHTML
 
 log = logging.getLogger(__name__)
 
@@ -69,20 +70,15 @@ class HomeController(BaseController):
             model.Page.name==u'home')
         homepage = homepage_q.first()
 
-        try:
+        # Convert the content (reStructuredText with OLD Markup) to HTML; the
+        #  result is cached until the page or an entity it embeds changes.
+        if homepage:
             c.heading = homepage.heading
-            c.content = homepage.content
-        except AttributeError:
+            c.content = getCachedPageHTML(homepage)
+        else:
             c.heading = u'There is no heading'
-            c.content = u'There is no content for this page'
-
-        # Convert reStructuredText to HTML
-        c.content = h.rst2html(c.content)
-        
-        # Convert OLD Markup references to links/representations
-        c.content = linkToOLDEntitites(c.content)
-        c.content = embedFiles(c.content)
-        c.content = embedForms(c.content)
+            c.content = getPageContentAsHTML(
+                u'There is no content for this page')
         
         return render('/derived/home/index.html')
 
@@ -104,21 +100,16 @@ class HomeController(BaseController):
             model.Page.name==u'home')
         homepage = homepage_q.first()
 
-        try:
-            result['headerText'] = homepage.heading
-            result['bodyContent'] = homepage.content
-        except AttributeError:
-            result['heading'] = u'There is no heading'
-            result['content'] = u'There is no content for this page'
-
         # Perform a series of transformations on the page body content:
         #  1. convert reStructuredText to HTML, 2. link to OLD entities,
         #  3. embed Files and 4. Forms (LAST 3 SHOULD BE DONE CLIENT-SIDE)
-        # Convert OLD Markup references to links/representations
-        result['bodyContent'] = embedForms(
-                                embedFiles(
-                                linkToOLDEntitites(
-                                h.rst2html(result['bodyContent']))))
+        if homepage:
+            result['headerText'] = homepage.heading
+            result['bodyContent'] = getCachedPageHTML(homepage)
+        else:
+            result['headerText'] = u'There is no heading'
+            result['bodyContent'] = getPageContentAsHTML(
+                u'There is no content for this page')
 
         return json.dumps(result)
 
@@ -98,9 +98,8 @@ class KeyController(BaseController):
         # Enter the data
         meta.Session.add(keyword)
         meta.Session.commit()
-        # Update the keywords variable in app_globals
-        tags = h.getSecondaryObjects(['keywords'])
-        app_globals.keywords = tags['keywords']
+        # Update the keywords in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('keywords')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='key', action='view', id=keyword.id)
@@ -151,9 +150,8 @@ class KeyController(BaseController):
         keyword.description = h.NFD(self.form_result['description'])
         # Update the data
         meta.Session.commit()
-        # Update the keywords variable in app_globals
-        tags = h.getSecondaryObjects(['keywords'])
-        app_globals.keywords = tags['keywords']
+        # Update the keywords in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('keywords')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='key', action='view', id=keyword.id)
@@ -171,9 +169,8 @@ class KeyController(BaseController):
             abort(404)
         meta.Session.delete(keyword)
         meta.Session.commit()
-        # Update the keywords variable in app_globals
-        tags = h.getSecondaryObjects(['keywords'])
-        app_globals.keywords = tags['keywords']
+        # Update the keywords in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('keywords')
         session['flash'] = "Keyword %s has been deleted" % id
         session.save()
         redirect(url(controller='tag', action='index'))
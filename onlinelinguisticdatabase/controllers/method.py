@@ -100,9 +100,8 @@ class MethodController(BaseController):
         # Enter the data
         meta.Session.add(elicitationMethod)
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['elicitationMethods'])
-        app_globals.elicitationMethods = tags['elicitationMethods']
+        # Update the elicitationMethods in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('elicitationMethods')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='method', action='view', id=elicitationMethod.id)
@@ -153,9 +152,8 @@ class MethodController(BaseController):
         elicitationMethod.description = h.NFD(self.form_result['description'])
         # Update the data
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['elicitationMethods'])
-        app_globals.elicitationMethods = tags['elicitationMethods']
+        # Update the elicitationMethods in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('elicitationMethods')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='method', action='view', id=elicitationMethod.id)
@@ -173,9 +171,8 @@ class MethodController(BaseController):
             abort(404)
         meta.Session.delete(elicitationMethod)
         meta.Session.commit()
-        # Update the syncats variable in app_globals
-        tags = h.getSecondaryObjects(['elicitationMethods'])
-        app_globals.elicitationMethods = tags['elicitationMethods']
+        # Update the elicitationMethods in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('elicitationMethods')
         session['flash'] = "Elicitation Method %s has been deleted" % id
         session.save()
         redirect(url(controller='tag', action='index'))
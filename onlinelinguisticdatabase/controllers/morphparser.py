@@ -42,7 +42,8 @@ from pylons.decorators.rest import restrict
 
 from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.lib.helpers as h
-from onlinelinguisticdatabase.lib.myworker import worker_q
+from onlinelinguisticdatabase.lib.flookup import flookup, flookupMany, \
+    reloadFlookupPools
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 
@@ -120,17 +121,74 @@ def getParsesFromFoma(word):
     word = u'#%s#' % word
     morphophonologyBinaryFilePath = os.path.join(
         parserDataDir, morphophonologyBinaryFileName)
-
-    process = subprocess.Popen(
-        ['flookup', '-x', morphophonologyBinaryFilePath],
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(word.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(morphophonologyBinaryFilePath, word)
     return [x[1:-1] for x in result if x]
 
 
+def getParsesFromFomaBatch(words):
+    """Like getParsesFromFoma but for a list of words: the distinct words are
+    sent through the morphophonology FST in a single streamed pass.  Returns a
+    dict from each word to its list of possible parses.
+
+    """
+
+    words = list(set(words))
+    morphophonologyBinaryFilePath = os.path.join(
+        parserDataDir, morphophonologyBinaryFileName)
+    results = flookupMany(morphophonologyBinaryFilePath,
+                          [u'#%s#' % w for w in words])
+    return dict([(w, [x[1:-1] for x in r if x])
+                 for w, r in zip(words, results)])
+
+
+def getTokensFromTranscriptions(transcriptions):
+    """Return the distinct word tokens of the transcriptions, in order of first
+    occurrence, with extraneous punctuation removed.
+
+    """
+
+    tokens = []
+    seen = {}
+    for transcription in transcriptions:
+        for word in transcription.split():
+            word = removeExtraneousPunctuation(word)
+            if word and word not in seen:
+                seen[word] = None
+                tokens.append(word)
+    return tokens
+
+
+def rankParses(parses, probCalc=None):
+    """Return parses (as returned by getParsesFromFoma) as a list of
+    (morphemeBreak, morphemeGloss) tuples, most probable first if a probability
+    calculator is available.
+
+    """
+
+    if parses == [u'']:
+        return [('NO PARSE', 'NO PARSE')]
+    if probCalc:
+        probs = [probCalc.getProbability(p) for p in parses]
+        result = zip(parses, probs)
+        result.sort(key=lambda x: x[1])
+        result.reverse()
+        result = [x[0] for x in result]
+    else:
+        result = parses
+    return [splitBreakFromGloss(a) for a in result]
+
+
+def getRankedParsesBatch(words):
+    """Return a dict from each of the distinct words to its ranked list of
+    (morphemeBreak, morphemeGloss) parses.
+
+    """
+
+    probCalc = getProbCalc()
+    parses = getParsesFromFomaBatch(words)
+    return dict([(w, rankParses(p, probCalc)) for w, p in parses.items()])
+
+
 def getOrthographicVariants(word, limit=20):
     """Use flookup and the orthographicvariation FST to get possible alternate
     spellings/transcriptions of the word.  Return these ranked by their minimum
@@ -154,13 +212,7 @@ def getOrthographicVariants(word, limit=20):
     word = u'#%s#' % word
     orthographicVariationBinaryFilePath = os.path.join(
         parserDataDir, orthographicVariationBinaryFileName)
-    process = subprocess.Popen(
-        ['flookup', '-x', '-i', orthographicVariationBinaryFilePath],
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(word.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(orthographicVariationBinaryFilePath, word, inverse=True)
     #print 'Number of results from flookup: %d' % len(result)
 
     # Remove results that are too long or too short
@@ -189,17 +241,7 @@ def applyFomaPhonology(i, dir):
     i = u'#%s#' % i
     phonologyBinaryFilePath = os.path.join(
         parserDataDir, phonologyBinaryFileName)
-
-    cmdList = ['flookup', '-x', phonologyBinaryFilePath]
-    if dir == 'inverse':
-        cmdList = ['flookup', '-x', '-i', phonologyBinaryFilePath]
-    process = subprocess.Popen(
-        cmdList,
-        shell=False,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE)
-    process.stdin.write(i.encode('utf-8'))
-    result = unicode(process.communicate()[0], 'utf-8').split('\n')
+    result = flookup(phonologyBinaryFilePath, i, inverse=(dir == 'inverse'))
     return [x[1:-1] for x in result if x]
 
 
@@ -753,19 +795,35 @@ class MorphparserController(BaseController):
     def getparse(self):
         word = unicode(request.body, 'utf-8')
         parses = getParsesFromFoma(word)
-        if parses == [u'']:
-            return json.dumps([('NO PARSE', 'NO PARSE')])
-        probCalc = getProbCalc()
-        if probCalc:
-            probs = [probCalc.getProbability(p) for p in parses]
-            result = zip(parses, probs)
-            result.sort(key=lambda x: x[1])
-            result.reverse()
-            result = [x[0] for x in result]
-        else:
-            result = parses
-        result = json.dumps([splitBreakFromGloss(a) for a in result])
-        return result
+        return json.dumps(rankParses(parses, getProbCalc()))
+
+    @h.authenticate
+    @h.authorize(['administrator', 'contributor'])
+    @restrict('POST')
+    def getparses(self):
+        """Batch version of getparse.  The POST body is a JSON object with any
+        of the following attributes:
+
+        - words: a list of words
+        - transcriptions: a list of (multi-word) transcriptions
+        - formIDs: a list of Form ids whose transcriptions are to be parsed
+
+        The distinct word tokens are parsed in a single pass through the
+        morphophonology FST.  Returns a JSON object with the tokens (in order of
+        first occurrence) and a mapping from each token to its ranked list of
+        (morphemeBreak, morphemeGloss) parses, or with an error if the body
+        cannot be read (see h.getTranscriptionsToParse).
+
+        """
+
+        try:
+            transcriptions = h.getTranscriptionsToParse(request.body)
+        except ValueError:
+            return json.dumps({'error': 'Unable to read the words to parse'})
+
+        tokens = getTokensFromTranscriptions(transcriptions)
+        parses = getRankedParsesBatch(tokens)
+        return json.dumps({'tokens': tokens, 'parses': parses})
 
 
     @h.authenticate
@@ -817,6 +875,7 @@ class MorphparserController(BaseController):
 
         success = 'Writing to file %s' % phonologyBinaryFilePath
         if success in output:
+            reloadFlookupPools(phonologyBinaryFilePath)
             msg = "phonology script saved and compiled (%s)." % now
             return "<span style='color:green;font-weight:bold;'>%s</span>" % msg
         else:
@@ -921,6 +980,7 @@ class MorphparserController(BaseController):
 
         success = 'Writing to file %s' % morphophonologyBinaryFilePath
         if success in output:
+            reloadFlookupPools(morphophonologyBinaryFilePath)
             msg = "morphophonology binary file generated (%s)." % now
             return "<span style='color:green;font-weight:bold;'>%s</span>" % msg
         else:
@@ -175,9 +175,8 @@ class ResearcherController(BaseController):
         # Enter the data
         meta.Session.add(researcher)
         meta.Session.commit()
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['users'])
-        app_globals.users = tags['users']
+        # Update the users in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('users')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(
@@ -225,9 +224,8 @@ class ResearcherController(BaseController):
         getResearcherAttributes(researcher, self.form_result, 'save')
         # Update the data
         meta.Session.commit()
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['users'])
-        app_globals.users = tags['users']
+        # Update the users in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('users')
         # update the session if we have just updated the current user
         if researcher.id == session['user_id']:
             h.getAuthorizedUserIntoSession(researcher)
@@ -256,9 +254,8 @@ class ResearcherController(BaseController):
         # Destroy the researcher's directory in the files directory
         h.destroyResearcherDirectory(researcher)
 
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['users'])
-        app_globals.users = tags['users']
+        # Update the users in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('users')
         session['flash'] = "Researcher %s has been deleted" % id
         session.save()
         redirect(url(controller='people'))
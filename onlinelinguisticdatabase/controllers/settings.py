@@ -19,8 +19,8 @@
 # <http://www.gnu.org/licenses/>.
 
 import logging
-import re
 import string
+import cgi
 import os
 
 try:
@@ -52,11 +52,24 @@ from onlinelinguisticdatabase.lib.base import BaseController, render
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.validationScanner import validationScanner
+from onlinelinguisticdatabase.lib.languageIndex import languageIndex
 
-from sqlalchemy import desc, or_, not_
+from sqlalchemy import desc, or_
 
 log = logging.getLogger(__name__)
 
+# The validation ids of the testValidation buttons of settings/index.html:
+#  the inventory in app_globals and the Form field each one checks
+VALIDATION_FIELDS = {
+    u'testOrthographicValidation': ('orthTranscrInvObj', 'transcription'),
+    u'testNarrPhonValidation': ('narrPhonInvObj',
+                                'narrowPhoneticTranscription'),
+    u'testBroadPhonValidation': ('broadPhonInvObj', 'phoneticTranscription'),
+    u'testMorphophonValidation': ('morphBreakInvObj', 'morphemeBreak'),
+    u'testOrthographicMBValidation': ('morphBreakInvObj', 'morphemeBreak')
+}
+
 
 
 class UnrestrictedUser(Schema):
@@ -134,6 +147,18 @@ class AlterSettingsForm(Schema):
     grammaticalities = UnicodeString()
 
 
+def getDictionaryOrthographies():
+    """Return the storage and metalanguage orthographies as strings.
+
+    """
+
+    try:
+        return (app_globals.storageOrthography[1].orthographyAsString,
+                app_globals.metaLanguageOrthography.orthographyAsString)
+    except AttributeError:
+        return None
+
+
 def renderEditSettings(values=None, errors=None):
     """Function is called by the edit action to create the Edit Application
     Settings HTML form.
@@ -569,8 +594,18 @@ class SettingsController(BaseController):
             meta.Session.add(appSet)
             meta.Session.commit()
 
-            # Update App_Globals with the newly saved application settings info
-            h.applicationSettingsToAppGlobals(app_globals, appSet)
+            # Update App_Globals (in this and the other processes) with the
+            #  newly saved application settings info
+            dictionaryOrthographies = getDictionaryOrthographies()
+            h.secondaryObjectsChanged('applicationSettings')
+
+            # The dictionary keys of Forms depend on the storage and
+            #  metalanguage orthographies
+            if getDictionaryOrthographies() != dictionaryOrthographies:
+                session['flash'] = u'The storage or metalanguage orthography ' \
+                    u'has changed: rebuild the dictionary index (see ' \
+                    u'Administer).'
+                session.save()
 
             # Issue an HTTP redirect
             response.status_int = 302
@@ -645,15 +680,11 @@ class SettingsController(BaseController):
         sourceID = values['sourceID']
         mode = values['mode']
         
-        languages_q = meta.Session.query(model.Language)
-        languages_q = languages_q.filter(
-            getattr(model.Language, mode).op("regexp")('^' + uInput)
-        )
-        languages_q = languages_q.order_by(getattr(model.Language, mode))
-        languages = languages_q.all()[:10]
-        
+        # Look the prefix up in the ISO 639-3 index (see lib/languageIndex)
+        languages = languageIndex.getMatches(mode, uInput, 10)
+
         languages = ['<language>\n\t<id>%s</id>\n\t<name>%s</name>\n</language>' \
-            % (x.Id, x.Ref_Name) for x in languages]
+            % (cgi.escape(Id), cgi.escape(name)) for Id, name in languages]
         languages = '<languages>\n%s\n</languages>' % '\n'.join(languages)
         response.headers['content-type'] = 'text/xml; charset=utf-8'
         return languages
@@ -666,59 +697,55 @@ class SettingsController(BaseController):
             (h.getUnicodeCodePoints(input), h.getUnicodeNames(input)))
 
     def testvalidation(self):
+        """Start a scan of every Form for values of the field that the
+        relevant inventory does not generate (see lib/validationScanner) and
+        return its status.  The page polls testvalidationCheck for progress
+        and then reads the report a page at a time from testvalidationPage.
+
+        """
+
         response.headers['Content-Type'] = 'application/json'
         validationId = dict(request.params)['validationId']
 
-        appSettings = meta.Session.query(model.ApplicationSettings).order_by(
-            desc(model.ApplicationSettings.id)).first()
+        if validationId not in VALIDATION_FIELDS:
+            abort(404)
 
         # Get the appropriate Inventory object for validation from app_globals
         #  These objects are saved by functions/applicationSettingsToAppGlobals
         #  when the application settings are saved
-        if validationId == u'testOrthographicValidation':
-            inventory = app_globals.orthTranscrInvObj
-            fieldName = u'transcription'
-        elif validationId == u'testNarrPhonValidation':
-            inventory = app_globals.narrPhonInvObj
-            fieldName = u'narrowPhoneticTranscription'
-        elif validationId == u'testBroadPhonValidation':
-            inventory = app_globals.broadPhonInvObj
-            fieldName = u'phoneticTranscription'
-        elif validationId in [u'testMorphophonValidation',
-                              u'testOrthographicMBValidation']:
-            inventory = app_globals.morphBreakInvObj
-            fieldName = u'morphemeBreak'
-
-        # regex is the regular expression that valid fields will match
-        regex = inventory.getRegexValidator()
-
-        # NFDFixes returns True if unicode canonical decompositional
-        #  normalization makes the data valid
-        def NFDFixes(string, regex):
-            string = h.NFD(string)
-            patt = re.compile(regex)
-            if patt.match(string):
-                return True
-            return False
-
-        # Count the forms in the db
-        formCount = meta.Session.query(model.Form).count()
-
-        # Get the invalid forms using regex and SQLAlchemy
-        invalidForms = meta.Session.query(model.Form).filter(not_(
-            getattr(model.Form, fieldName).op('regexp')(regex))).all()
-
-        # Build the result to return to the user
-        result = {'formCount': formCount, 'invalidCount': len(invalidForms),
-                  'NFDFixes': 0, 'invalid': [],
-                  'validationInventory': inventory.inputList}
-
-        for f in invalidForms :
-            if NFDFixes(getattr(f, fieldName), regex):
-                result['NFDFixes'] += 1
-            else:
-                result['invalid'].append([f.id,
-                        h.NFD(getattr(f, fieldName)),
-                        h.getUnicodeCodePoints(h.NFD(getattr(f, fieldName)))])
-
-        return json.dumps(result)
+        inventoryName, fieldName = VALIDATION_FIELDS[validationId]
+        inventory = getattr(app_globals, inventoryName)
+
+        return json.dumps(validationScanner.start(validationId, fieldName,
+                                                  inventory))
+
+    def testvalidationCheck(self):
+        """Return the status of the latest validation scan (see
+        testvalidation), i.e., its counts and progress.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        validationId = dict(request.params)['validationId']
+        if validationId not in VALIDATION_FIELDS:
+            abort(404)
+        return json.dumps(validationScanner.getStatus(validationId))
+
+    def testvalidationPage(self):
+        """Return a page of the report of the latest validation scan: a list
+        of [id, NFD-normalized value, code points] triples of invalid Forms.
+
+        """
+
+        response.headers['Content-Type'] = 'application/json'
+        params = dict(request.params)
+        if params.get('validationId') not in VALIDATION_FIELDS:
+            abort(404)
+        try:
+            page = int(params.get('page', 0))
+        except ValueError:
+            page = 0
+        invalid = validationScanner.getPage(params['validationId'], page)
+        if invalid is None:
+            abort(404)
+        return json.dumps(invalid)
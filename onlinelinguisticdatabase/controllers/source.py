@@ -108,9 +108,8 @@ class SourceController(BaseController):
         # Enter the data
         meta.Session.add(source)
         meta.Session.commit()
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['sources'])
-        app_globals.sources = tags['sources']
+        # Update the sources in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('sources')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='source', action='view', id=source.id)
@@ -166,9 +165,8 @@ class SourceController(BaseController):
             source.file = None
         # Update the data
         meta.Session.commit()
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['sources'])
-        app_globals.sources = tags['sources']
+        # Update the sources in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('sources')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='source', action='view', id=source.id)
@@ -186,9 +184,8 @@ class SourceController(BaseController):
             abort(404)
         meta.Session.delete(source)
         meta.Session.commit()
-        # Update the users variable in app_globals
-        tags = h.getSecondaryObjects(['sources'])
-        app_globals.sources = tags['sources']
+        # Update the sources in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('sources')
         session['flash'] = "Source %s has been deleted" % id
         session.save()
         redirect(url(controller='source'))
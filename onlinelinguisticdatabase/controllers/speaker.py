@@ -93,9 +93,8 @@ class SpeakerController(BaseController):
         # Enter the data
         meta.Session.add(speaker)
         meta.Session.commit()
-        # Update the speaker variable in app_globals
-        tags = h.getSecondaryObjects(['speakers'])
-        app_globals.speakers = tags['speakers']
+        # Update the speakers in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('speakers')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='speaker', action='view', id=speaker.id)
@@ -135,9 +134,8 @@ class SpeakerController(BaseController):
         speaker.speakerPageContent = h.NFD(self.form_result['speakerPageContent'])
         # Update the data
         meta.Session.commit()
-        # Update the speaker variable in app_globals
-        tags = h.getSecondaryObjects(['speakers'])
-        app_globals.speakers = tags['speakers']
+        # Update the speakers in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('speakers')
         # Issue an HTTP redirect
         response.status_int = 302
         response.headers['location'] = url(controller='speaker', action='view', id=speaker.id)
@@ -155,9 +153,8 @@ class SpeakerController(BaseController):
             abort(404)
         meta.Session.delete(speaker)
         meta.Session.commit()
-        # Update the speaker variable in app_globals
-        tags = h.getSecondaryObjects(['speakers'])
-        app_globals.speakers = tags['speakers']
+        # Update the speakers in app_globals (and in the other processes)
+        h.secondaryObjectsChanged('speakers')
         session['flash'] = "Speaker %s has been deleted" % id
         session.save()
         redirect(url(controller='people'))
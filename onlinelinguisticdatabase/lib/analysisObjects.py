@@ -36,6 +36,8 @@ except ImportError:
 
 from pylons import config, session, app_globals
 
+from flookup import flookup, reloadFlookupPools, removeFlookupPools
+
 log = logging.getLogger(__name__)
 
 
@@ -72,6 +74,7 @@ class Phonology(object):
         """
 
         self.getFilePaths()
+        removeFlookupPools(self.phonologyBinaryFilePath)
         success = True
         try:
             os.remove(self.phonologyFilePath)
@@ -120,6 +123,7 @@ class Phonology(object):
         if expectedOutput in output:
             log.debug('Compilation succeeded.')
             self.compiledSuccessfully = True
+            reloadFlookupPools(self.phonologyBinaryFilePath)
         else:
             log.debug('Compilation failed.')
             log.debug(output)
@@ -160,14 +164,7 @@ class Phonology(object):
     def phonologize(self, token):
         #log.debug('Phonologizing %s' % token)
         token = u'#%s#' % token
-        cmdList = ['flookup', '-x', '-i', self.phonologyBinaryFilePath]
-        process = subprocess.Popen(
-            cmdList,
-            shell=False,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE)
-        process.stdin.write(token.encode('utf-8'))
-        result = unicode(process.communicate()[0], 'utf-8').split('\n')
+        result = flookup(self.phonologyBinaryFilePath, token, inverse=True)
         return list(set([x[1:-1] for x in result if x]))
 
     def getTestsFromScript(self):
@@ -350,6 +350,11 @@ class Globals(object):
         self.inputToStorageTranslator = None
         self.storageToInputTranslator = None
         self.storageToOutputTranslator = None
+
+        # settingsVersion is the id of the application settings that the
+        #  globals above were taken from (0 for these defaults); see
+        #  lib/translatorRegistry.py
+        self.settingsVersion = 0
         
         # formCount is the number of Forms in the OLD application.
         #  This variable is updated on the deletion and addition of Forms.
@@ -358,8 +363,8 @@ class Globals(object):
         self.formCount = None
 
         # Secondary Object Lists
-        #  These variables are set by the function
-        #  updateSecondaryObjectsInAppGlobals() in lib/functions.py
+        #  These variables are set (to tuples of read-only records) by the
+        #  secondary object cache in lib/secondaryObjects.py
         self.speakers = []
         self.users = []
         self.nonAdministrators = []
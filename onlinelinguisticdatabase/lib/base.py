@@ -22,10 +22,20 @@ Provides the BaseController class for subclassing.
 
 """
 
+import logging
+
+from paste.deploy.converters import asbool
+from pylons import config
 from pylons.controllers import WSGIController
 from pylons.templating import render_mako as render
 
 from onlinelinguisticdatabase.model import meta
+from onlinelinguisticdatabase.lib.secondaryObjects import secondaryObjectCache
+from onlinelinguisticdatabase.lib.jobQueue import jobQueue
+from onlinelinguisticdatabase.lib.queryCounter import resetQueryCount, \
+    getQueryCount
+
+log = logging.getLogger(__name__)
 
 class BaseController(WSGIController):
 
@@ -34,7 +44,31 @@ class BaseController(WSGIController):
         # WSGIController.__call__ dispatches to the Controller method
         # the request is routed to. This routing information is
         # available in environ['pylons.routes_dict']
+
+        # Count the SQL queries of this request (see lib/queryCounter)
+        resetQueryCount()
+        def startResponse(status, headers, exc_info=None):
+            queryCount = getQueryCount()
+            if asbool(config.get('debug')):
+                headers.append(('X-Query-Count', str(queryCount)))
+            logQueryCount(environ.get('PATH_INFO'), queryCount)
+            return start_response(status, headers, exc_info)
+
         try:
-            return WSGIController.__call__(self, environ, start_response)
+            # Reload the secondary object lists and application settings that
+            #  have changed (see lib/secondaryObjects)
+            secondaryObjectCache.refresh()
+            # Start the background job workers of this process, once (see
+            #  lib/jobQueue)
+            jobQueue.start()
+            return WSGIController.__call__(self, environ, startResponse)
         finally:
             meta.Session.remove()
+
+
+def logQueryCount(path, queryCount):
+    limit = int(config['app_conf'].get('query_count_warning', 0))
+    if limit and queryCount > limit:
+        log.warning('%s executed %d SQL queries.' % (path, queryCount))
+    else:
+        log.debug('%s executed %d SQL queries.' % (path, queryCount))
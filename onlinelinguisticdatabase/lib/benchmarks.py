@@ -0,0 +1,422 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Stand-alone benchmarks for performance-sensitive parts of the OLD.
+
+These do not need a configured application.  Run them from this directory,
+e.g.,
+
+    $ python benchmarks.py regexp 200000
+
+The OrthographyTranslator and CustomSorter benchmarks are run by the
+orthography module (see orthography.py) with its Kwak'wala orthographies.
+
+"""
+
+import sys
+import time
+import random
+
+
+def getRandomWords(count, alphabet=u'aehiklmnoprstuwy', minLength=3,
+                   maxLength=12, seed=0):
+    rand = random.Random(seed)
+    return [u''.join([rand.choice(alphabet) for i in
+                      range(rand.randint(minLength, maxLength))])
+            for j in range(count)]
+
+
+def timeIt(function, *args):
+    start = time.time()
+    result = function(*args)
+    return time.time() - start, result
+
+
+def benchmarkRegexp(formCount=200000):
+    """Time REGEXP searches on an in-memory SQLite form table with formCount
+    rows, with the pattern compiled for each row (as SQLiteSetup.regexp used
+    to do) and with the cached regexp function from regexCache.
+
+    """
+
+    import re
+    import sqlite3
+    from regexCache import regexp, regexCache
+
+    def uncachedRegexp(expr, item):
+        patt = re.compile(expr)
+        return item and patt.match(item) is not None
+
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE form (id INTEGER PRIMARY KEY, '
+                 'transcription VARCHAR(255))')
+    conn.executemany('INSERT INTO form (transcription) VALUES (?)',
+                     [(w,) for w in getRandomWords(formCount)])
+    # 150 distinct patterns: more than the 100 that the re module caches
+    patterns = [u'^%s.*%s$' % (w[:2], w[-1]) for w in getRandomWords(150,
+                seed=1)]
+    query = 'SELECT COUNT(*) FROM form WHERE transcription REGEXP ?'
+
+    def runQueries():
+        return [conn.execute(query, (p,)).fetchone()[0] for p in patterns]
+
+    def callRegexp(function):
+        words = getRandomWords(1000)
+        for p in patterns[:10]:
+            for i in range(100):
+                for w in words:
+                    function(p, w)
+
+    print 'REGEXP function: 1,000,000 calls'
+    uncachedTime = timeIt(callRegexp, uncachedRegexp)[0]
+    print '  re.compile per row: %.2f s' % uncachedTime
+    cachedTime = timeIt(callRegexp, regexp)[0]
+    print '  regexCache:         %.2f s (%.1fx)' % (
+        cachedTime, uncachedTime / cachedTime)
+
+    print 'REGEXP queries: %d forms, %d queries' % (formCount, len(patterns))
+    conn.create_function('regexp', 2, uncachedRegexp)
+    uncachedTime, uncachedCounts = timeIt(runQueries)
+    print '  re.compile per row: %.2f s' % uncachedTime
+    regexCache.clear()
+    conn.create_function('regexp', 2, regexp)
+    cachedTime, cachedCounts = timeIt(runQueries)
+    print '  regexCache:         %.2f s (%.1fx)' % (
+        cachedTime, uncachedTime / cachedTime)
+    print '  cache stats: %s' % regexCache.getStats()
+    assert cachedCounts == uncachedCounts
+
+
+def getCallbackTranslate(translator):
+    """Return a function that translates text as OrthographyTranslator.translate
+    did before it used a trie regex: lowercasing with a Python callback per
+    character and replacing with a callback per graph.
+
+    """
+
+    import re
+    regex = re.compile(
+        "<ml>.*?</ml>|(" + "|".join(translator.replacementKeys) + ")")
+    lowercasePatt = re.compile("<ml>.*?</ml>|.")
+
+    def lowercase(string):
+        if string[:4] == '<ml>' and string[-5:] == '</ml>':
+            return string
+        return string.lower()
+
+    def translate(text):
+        if translator.inputOrthography.lowercase:
+            text = lowercasePatt.sub(lambda x: lowercase(x.group()), text)
+        if translator.removeInitialGlottalStops:
+            text = translator.initialGlottalStopRemover.sub("\\1", text)
+        return regex.sub(lambda x: translator.getReplacement(x.group()), text)
+
+    return translate
+
+
+def getOrthographicTexts(orthography, wordCount, seed=0):
+    """Return lines of ten random words made of the graphs of orthography.
+    Some words are capitalized, some begin with a glottal stop ('7') and some
+    lines end with a metalanguage string.
+
+    """
+
+    rand = random.Random(seed)
+    graphs = [g for graphType in orthography.orthographyAsList
+              for g in graphType if g]
+    words = []
+    for i in range(wordCount):
+        word = u''.join([rand.choice(graphs)
+                         for j in range(rand.randint(2, 8))])
+        if rand.random() < 0.1:
+            word = word.capitalize()
+        if rand.random() < 0.1:
+            word = u'7' + word
+        words.append(word)
+    lines = []
+    for i in range(0, wordCount, 10):
+        line = u' '.join(words[i:i + 10])
+        if rand.random() < 0.2:
+            line += u' <ml>Lit. "the %s"</ml>' % rand.choice(words)
+        lines.append(line)
+    return lines
+
+
+def benchmarkOrthographyTranslator(orthographies, wordCount=20000):
+    """Time OrthographyTranslator.translate against the callback-based
+    translation it replaced, and translating the same texts again (as each page
+    view does) with the translation cache.  orthographies is a list of (name,
+    input orthography, output orthography) triples; the orthography module's
+    __main__ block supplies the Kwak'wala orthographies.
+
+    """
+
+    from orthography import OrthographyTranslator
+    from translationCache import translationCache
+
+    def translateAll(translate, texts):
+        return [translate(t) for t in texts]
+
+    print 'OrthographyTranslator: %d words per orthography pair' % wordCount
+    for name, inputOrthography, outputOrthography in orthographies:
+        texts = getOrthographicTexts(inputOrthography, wordCount)
+        translator = OrthographyTranslator(inputOrthography, outputOrthography)
+        callbackTime, callbackResult = timeIt(
+            translateAll, getCallbackTranslate(translator), texts)
+        trieTime, trieResult = timeIt(translateAll,
+                                      translator.translateUncached, texts)
+        print '  %s: callbacks %.2f s, trie regex %.2f s (%.1fx)' % (
+            name, callbackTime, trieTime, callbackTime / trieTime)
+        assert trieResult == callbackResult
+        translationCache.clear()
+        translateAll(translator.translate, texts)
+        cachedTime, cachedResult = timeIt(translateAll, translator.translate,
+                                          texts)
+        print '  %s: cached translations %.3f s (%.1fx)' % (
+            name, cachedTime, trieTime / cachedTime)
+        assert cachedResult == callbackResult
+
+
+def getReplaceIntegerTuple(orthography):
+    """Return a function that computes a word's integer tuple as
+    CustomSorter.getIntegerTuple did before it used the orthography's graph
+    regex: one replace pass per graph, longest first, and parsing the ranks
+    back out of a comma-separated string.
+
+    """
+
+    def getIntegerTuple(word):
+        graphs = orthography.orthographyAsDict.keys()
+        graphs.sort(key=len)
+        graphs.reverse()
+        for graph in graphs:
+            word = unicode(word.replace(graph,
+                            '%s,' % orthography.orthographyAsDict[graph]))
+        word = filter(lambda x: x in '01234546789,', word)
+        return tuple([int(x) for x in word[:-1].split(',') if x])
+
+    return getIntegerTuple
+
+
+def benchmarkCustomSorter(orthographies, formCount=100000):
+    """Time CustomSorter.sort on formCount Forms against the replace-based
+    integer tuples it replaced.  Its graph ranks (Orthography.getGraphRanks)
+    are also what the dictionary keys of the Forms are computed from (see
+    Orthography.getDictionaryKeys).  orthographies is a list of (name,
+    orthography) pairs; the orthography module's __main__ block supplies
+    Kwak'wala orthographies.
+
+    """
+
+    from orthography import CustomSorter
+
+    class Form(object):
+        def __init__(self, transcription):
+            self.transcription = transcription
+
+    def replaceSort(forms, getIntegerTuple):
+        temp = [(getIntegerTuple(form.transcription.replace(' ', '').lower()),
+                 form) for form in forms]
+        temp.sort()
+        return [x[1] for x in temp]
+
+    print 'CustomSorter: %d forms per orthography' % formCount
+    for name, orthography in orthographies:
+        forms = [Form(t) for line in getOrthographicTexts(
+                 orthography, formCount) for t in line.split()[:10]]
+        getIntegerTuple = getReplaceIntegerTuple(orthography)
+        replaceTime, replaceResult = timeIt(replaceSort, forms,
+                                            getIntegerTuple)
+        sorter = CustomSorter(orthography)
+        sortTime, sortResult = timeIt(sorter.sort, forms)
+        print '  %s: replace %.2f s, graph regex %.2f s (%.1fx)' % (
+            name, replaceTime, sortTime, replaceTime / sortTime)
+        # The replace passes mistook digits (e.g., the glottal stop u'7') for
+        #  the ranks they inserted, so the orders are compared on the words
+        #  without digits, in orthographies without digits.
+        if not [g for g in orthography.orthographyAsDict if g.isdigit()]:
+            key = lambda form: getIntegerTuple(
+                form.transcription.replace(' ', '').lower())
+            noDigits = lambda forms: [f for f in forms if not
+                                      [c for c in f.transcription if c.isdigit()]]
+            assert map(key, noDigits(replaceResult)) == \
+                map(key, noDigits(sortResult))
+
+
+def benchmarkKeywordJoin(formCount=100000):
+    """Time fetching the forms tagged with a keyword ('foreign word') from an
+    SQLite database with formCount forms: as getForeignWords used to (the
+    formkeyword rows, then the forms with an IN list) and with one join,
+    before and after the association table indexes are created.
+
+    """
+
+    import sqlite3
+
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE form (id INTEGER PRIMARY KEY, '
+                 'transcription VARCHAR(255))')
+    conn.execute('CREATE TABLE keyword (id INTEGER PRIMARY KEY, '
+                 'name VARCHAR(255))')
+    conn.execute('CREATE TABLE formkeyword (id INTEGER PRIMARY KEY, '
+                 'form_id INTEGER, keyword_id INTEGER)')
+    conn.executemany('INSERT INTO form (transcription) VALUES (?)',
+                     [(w,) for w in getRandomWords(formCount)])
+    keywords = [u'foreign word', u'restricted'] + [u'keyword %d' % i
+                                                   for i in range(20)]
+    conn.executemany('INSERT INTO keyword (name) VALUES (?)',
+                     [(k,) for k in keywords])
+    # Every form has two keywords; about 1% are foreign words
+    rand = random.Random(0)
+    conn.executemany(
+        'INSERT INTO formkeyword (form_id, keyword_id) VALUES (?, ?)',
+        [(id, keywordID) for id in range(1, formCount + 1)
+         for keywordID in (rand.random() < 0.01 and 1 or 3,
+                           rand.randint(3, len(keywords)))])
+
+    def getByINList():
+        keywordIDs = [row[0] for row in conn.execute(
+            "SELECT id FROM keyword WHERE name = 'foreign word'")]
+        formIDs = [row[0] for row in conn.execute(
+            'SELECT form_id FROM formkeyword WHERE keyword_id IN (%s)' %
+            ', '.join(map(str, keywordIDs)))]
+        return sorted(conn.execute(
+            'SELECT id, transcription FROM form WHERE id IN (%s)' %
+            ', '.join(map(str, formIDs))).fetchall())
+
+    def getByJoin():
+        return sorted(conn.execute(
+            'SELECT form.id, form.transcription FROM form '
+            'JOIN formkeyword ON formkeyword.form_id = form.id '
+            'JOIN keyword ON keyword.id = formkeyword.keyword_id '
+            "WHERE keyword.name = 'foreign word'").fetchall())
+
+    def repeat(function, times=20):
+        for i in range(times):
+            result = function()
+        return result
+
+    print 'Foreign word lookup: %d forms, 20 lookups' % formCount
+    inListTime, inListResult = timeIt(repeat, getByINList)
+    print '  IN list, no indexes: %.2f s' % inListTime
+    joinTime, joinResult = timeIt(repeat, getByJoin)
+    print '  join, no indexes:    %.2f s' % joinTime
+    conn.execute('CREATE INDEX ix_formkeyword_keyword_id_form_id ON '
+                 'formkeyword (keyword_id, form_id)')
+    conn.execute('CREATE INDEX ix_formkeyword_form_id_keyword_id ON '
+                 'formkeyword (form_id, keyword_id)')
+    conn.execute('CREATE INDEX ix_keyword_name ON keyword (name)')
+    indexedTime, indexedResult = timeIt(repeat, getByJoin)
+    print '  join, indexes:       %.2f s (%.1fx)' % (
+        indexedTime, inListTime / indexedTime)
+    assert inListResult == joinResult == indexedResult
+
+
+LANGUAGE_DATA_SCRIPT = """
+import sys, time, resource
+sys.path[:0] = [%r, %r]
+start = time.time()
+%s
+print '%%.3f %%d' %% (time.time() - start,
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+WRITE_LITERAL = """
+from languageIndex import readLanguages
+literal = open('iso_639_3.py', 'w')
+literal.write('# -*- coding: utf-8 -*-\\nlanguages = (\\n\\t%s\\n)\\n' %
+              ',\\n\\t'.join([repr(l) for l in readLanguages()]))
+literal.close()
+import py_compile
+py_compile.compile('iso_639_3.py')
+"""
+
+def benchmarkLanguageData(lookupCount=10000):
+    """Time and measure the peak memory (maximum resident set size, as
+    getrusage reports it) of a new process that: imports the ISO 639-3 table
+    as the Python tuple literal that lib/languages/iso_639_3.py used to hold
+    (generated from iso_639_3.tab into a temporary directory), with and
+    without its .pyc file; imports languageIndex (all that startup now does); and
+    imports languageIndex and answers a first lookup, which loads the index.
+    Then time lookupCount lookups.
+
+    Everything but the lookups runs in a child process, since on Linux a child
+    inherits its parent's maximum resident set size.
+
+    """
+
+    import os
+    import shutil
+    import tempfile
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    directory = tempfile.mkdtemp()
+
+    def run(code):
+        output = subprocess.Popen(
+            [sys.executable, '-c', LANGUAGE_DATA_SCRIPT % (directory, here,
+                                                           code)],
+            stdout=subprocess.PIPE, cwd=directory).communicate()[0]
+        return output.split()
+
+    try:
+        run(WRITE_LITERAL)
+        print 'ISO 639-3 language data'
+        for description, code in [
+                ('tuple literal, .pyc', 'import iso_639_3'),
+                ('tuple literal, no .pyc', 'sys.dont_write_bytecode = True\n'
+                 'import os; os.remove("iso_639_3.pyc")\nimport iso_639_3'),
+                ('baseline (no import)', 'pass'),
+                ('languageIndex import',
+                 'from languageIndex import languageIndex'),
+                ('languageIndex first lookup',
+                 'from languageIndex import languageIndex\n'
+                 'languageIndex.getMatches("Ref_Name", u"a")')]:
+            seconds, memory = run(code)
+            print '  %-27s %s s, max RSS %s' % (description + ':', seconds,
+                                                 memory)
+    finally:
+        shutil.rmtree(directory)
+
+    from languageIndex import languageIndex, readLanguages
+    prefixes = [l[6][:2] for l in readLanguages()]
+    prefixes = (prefixes * (lookupCount / len(prefixes) + 1))[:lookupCount]
+    languageIndex.getMatches('Ref_Name', u'a')
+    lookupTime, result = timeIt(lambda: [languageIndex.getMatches(
+        'Ref_Name', p, 10) for p in prefixes])
+    print '  %d lookups: %.3f s (%.1f us each)' % (
+        lookupCount, lookupTime, lookupTime / lookupCount * 1e6)
+
+
+benchmarks = {
+    'regexp': benchmarkRegexp,
+    'keywordjoin': benchmarkKeywordJoin,
+    'languages': benchmarkLanguageData
+}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in benchmarks:
+        print 'Usage: python benchmarks.py (%s) [size]' % '|'.join(
+            sorted(benchmarks))
+        sys.exit(1)
+    args = [int(a) for a in sys.argv[2:]]
+    benchmarks[sys.argv[1]](*args)
@@ -0,0 +1,128 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""This module keeps the dictionaryHead and dictionaryKey values of Forms and
+Glosses, by which the dictionary controller browses and sorts them.
+
+A Form's dictionaryHead is the rank of the graph of the storage orthography
+that its transcription begins with, i.e., the index of the letter under which
+the Form is browsed; its dictionaryKey encodes the ranks of all of the graphs
+of its transcription so that ordering Forms by dictionaryKey orders them as
+CustomSorter does (see Orthography.getDictionaryKeys).  A Gloss's values are
+the same, computed from the gloss in the metalanguage orthography.  So each
+browse letter is one query on an index of (dictionaryHead, dictionaryKey).
+
+setDictionaryKeys is called when a Form is saved.  The values depend on the
+storage and metalanguage orthographies, so rebuildDictionaryIndex (see the
+administer controller) has to be run when either of those changes (and after
+the dictionaryHead and dictionaryKey columns are added to an existing
+database).
+
+"""
+
+import time
+import logging
+
+from pylons import app_globals
+from sqlalchemy.sql import select, bindparam
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def getOrthographies():
+    """Return the orthographies of the dictionary keys of Forms and Glosses.
+
+    """
+
+    return app_globals.storageOrthography[1], \
+        app_globals.metaLanguageOrthography
+
+
+def setDictionaryKeys(form):
+    """Set the dictionaryHead and dictionaryKey attributes of the Form and of
+    its Glosses.
+
+    """
+
+    storageOrthography, metaLanguageOrthography = getOrthographies()
+    form.dictionaryHead, form.dictionaryKey = \
+        storageOrthography.getDictionaryKeys(form.transcription)
+    for gloss in form.glosses:
+        gloss.dictionaryHead, gloss.dictionaryKey = \
+            metaLanguageOrthography.getDictionaryKeys(gloss.gloss)
+
+
+def rebuildTable(table, column, orthography, batchSize, callback, count,
+                 start):
+    """Recompute the dictionary keys of the values of column in each row of
+    table, in batches of batchSize rows ordered by id.  count is the number of
+    rows processed before and start the time processing began.  Return the
+    number of rows processed, including count.
+
+    """
+
+    update = table.update(table.c.id == bindparam('rowID'), values={
+        table.c.dictionaryHead: bindparam('head'),
+        table.c.dictionaryKey: bindparam('key')
+    })
+    lastID = 0
+    while True:
+        rows = meta.Session.execute(select([table.c.id, column],
+            table.c.id > lastID).order_by(table.c.id).limit(batchSize)).fetchall()
+        if not rows:
+            break
+        parameters = []
+        for id, value in rows:
+            head, key = orthography.getDictionaryKeys(value or u'')
+            parameters.append({'rowID': id, 'head': head, 'key': key})
+        meta.Session.execute(update, parameters)
+        meta.Session.commit()
+        lastID = rows[-1][0]
+        count += len(rows)
+        if callback:
+            callback(count, time.time() - start)
+    return count
+
+
+def rebuildDictionaryIndex(batchSize=BATCH_SIZE, callback=None):
+    """Recompute the dictionary keys of every Form and Gloss in the database.
+
+    callback (if given) is called after each batch with the number of Forms and
+    Glosses processed so far and the elapsed time in seconds.  Return a
+    (count, elapsedSeconds) tuple.
+
+    """
+
+    start = time.time()
+    storageOrthography, metaLanguageOrthography = getOrthographies()
+    count = rebuildTable(model.form_table, model.form_table.c.transcription,
+                         storageOrthography, batchSize, callback, 0, start)
+    count = rebuildTable(model.gloss_table, model.gloss_table.c.gloss,
+                         metaLanguageOrthography, batchSize, callback, count,
+                         start)
+    elapsed = time.time() - start
+    log.info('Recomputed the dictionary keys of %d forms and glosses in '
+             '%.1f s.' % (count, elapsed))
+    return count, elapsed
@@ -23,6 +23,8 @@ from pylons import session
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
 import onlinelinguisticdatabase.lib.helpers as h
+from onlinelinguisticdatabase.lib.pagination import iterByKey, iterBySlice
+from onlinelinguisticdatabase.lib.loadingProfiles import withLoadingProfile
 
 """The exporter module defines exporter objects used to create OLD export strings
 which can then be saved as files.
@@ -48,8 +50,9 @@ A working exporter object *must* valuate the following five attributes/methods:
 4. ``input_types``: a method that takes an as input a string representing the
     type of object to be exported and returns a boolean indicating whether the
     exporter exports that type of object.
-5. ``exporter``: method that takes as input a string representing the
-    object to be exported and returns the export as a unicode string.
+5. ``exporter_function``: method that takes as input a string representing the
+    object to be exported and returns the export as a unicode string or as an
+    iterator over unicode strings.
 
 The input to ``exporter.export`` must be one of the following strings or types
 of string:
@@ -60,8 +63,16 @@ of string:
 4. 'memory'
 5. 'lastsearch'
 
+Form lists from memory or from the last search are fetched ``BATCH_SIZE`` Forms
+at a time (using the 'export' loading profile) and the Form list exporters
+format one Form at a time, so ``exporter.iter_export`` can write an export of
+the whole database to a file without holding it in memory.
+
 """
 
+# Number of Forms fetched from the database at a time
+BATCH_SIZE = 200
+
 
 class Exporter(object):
     """Base class for exporter instances.
@@ -73,15 +84,28 @@ class Exporter(object):
             setattr(self, k, v)
 
     def export(self, input_):
-        return self.exporter_function(input_)
+        """Return the export of ``input_`` as a unicode string.
+
+        """
+        return u''.join(self.iter_export(input_))
+
+    def iter_export(self, input_):
+        """Return an iterator over the unicode strings that make up the export of
+        ``input_``.
+
+        """
+        result = self.exporter_function(input_)
+        if isinstance(result, basestring):
+            return iter([result])
+        return result
 
     ################################################################################
     # Methods for getting exportables from the ``input`` string.
     ################################################################################
 
     def get_form_list(self, input_):
-        """Returns a list of Forms.  The value of ``input_`` must be one of the
-        following four strings/ types of string:
+        """Returns a list of (or an iterator over) Forms.  The value of ``input_``
+        must be one of the following four strings/ types of string:
 
         1. 'form<x>', where '<x>' is the ``id`` value of a form
         2. 'collectionforms<x>', where '<x>' is the ``id`` value of a collection
@@ -102,32 +126,54 @@ class Exporter(object):
             return None
 
     def get_form_list_from_form_id(self, form_id):
-        return [meta.Session.query(model.Form).get(form_id)]
+        return [withLoadingProfile(meta.Session.query(model.Form),
+                                   'export').get(form_id)]
 
     def get_form_list_from_collection_id(self, collection_id):
         return meta.Session.query(model.Collection).get(collection_id).forms
 
     def get_form_list_from_memory(self):
-        """Return the list of all Forms memorized by the currently logged in user.
+        """Return an iterator over all Forms memorized by the currently logged in
+        user.
 
         """
-        return meta.Session.query(model.Form).\
-            order_by(model.Form.id).\
-            filter(model.Form.memorizers.contains(session['user'])).all()
+        query = meta.Session.query(model.Form).\
+            filter(model.Form.memorizers.contains(session['user']))
+        return self.iter_forms(query)
 
     def get_form_list_from_last_search(self):
         """Whenever a OLD Form search is effected, the values of the HTML Form Search
         form are stored in the session under the key 'formSearchValues'.  Use these
-        values to recreate the last search and return the resultant Forms.
+        values to recreate the last search and return an iterator over the
+        resultant Forms.
 
         """
         form_search = session.get('formSearchValues', None)
         if form_search:
-            return h.filterSearchQuery(
-                form_search, meta.Session.query(model.Form), 'Form').\
-                order_by(model.Form.id).all()
+            query = h.filterSearchQuery(
+                form_search, meta.Session.query(model.Form), 'Form')
+            return self.iter_forms(query, form_search['orderByColumn'],
+                                   form_search['orderByDirection'])
         return []
 
+    def iter_forms(self, query, order_by_column='id', order_by_direction='asc'):
+        """Return an iterator over the Forms of ``query`` ordered by
+        ``order_by_column`` and then by id.  The Forms are fetched ``BATCH_SIZE``
+        at a time with the relations used by the formatters (the 'export' loading
+        profile) eagerly loaded.  Forms no longer referenced are dropped from the
+        session's (weak-referencing) identity map, so memory use does not grow
+        with the number of Forms.
+
+        """
+        query = withLoadingProfile(query, 'export')
+        if order_by_column == 'gloss':
+            # Ordering by gloss lists a Form once per gloss, so there is no
+            #  unique key to fetch the batches by.
+            return iterBySlice(query.order_by(model.Form.id), BATCH_SIZE)
+        direction = order_by_direction == 'desc' and 'desc' or 'asc'
+        return iterByKey(query, getattr(model.Form, order_by_column),
+                         direction, model.Form.id, BATCH_SIZE)
+
     def get_collection_content(self, input_):
         """Return the content of the Collection with ID=collection_id.
 
@@ -458,12 +504,13 @@ class FormListExporter(Exporter):
         form_delimiter = kwargs.get('form_delimiter', u'\n')
         header = kwargs.get('header', None)
         def exporter_function(input_):
-            form_list = self.get_form_list(input_)
-            forms = []
+            delimiter = u''
             if header:
-                forms.append(header)
-            forms.extend([form_formatter(form) for form in form_list])
-            return form_delimiter.join(forms)
+                yield header
+                delimiter = form_delimiter
+            for form in self.get_form_list(input_):
+                yield delimiter + form_formatter(form)
+                delimiter = form_delimiter
         return exporter_function
 
 
@@ -499,18 +546,16 @@ class XeLaTeXFormListExporter(Exporter):
 
         def exporter_function(input_):
 
-            form_list = self.get_form_list(input_)
-            result = [
-                u'\\documentclass{article}\n\n%s\n%s' % (h.xelatex_preamble, igt_package),
-                u'\n\n\\begin{document}\n\n\\title{OLD Export}',
-                u'\n\\author{%s %s}\n\\maketitle\n\n' % (session['user_firstName'],
-                    session['user_lastName']),
-                u'\n\n'.join([
-                    form_formatter(f, secondary_data=secondary_data, reference=reference)
-                    for f in form_list]),
-                u'\n\n\\end{document}'
-            ]
-            return u''.join(result)
+            yield u'\\documentclass{article}\n\n%s\n%s' % (h.xelatex_preamble, igt_package)
+            yield u'\n\n\\begin{document}\n\n\\title{OLD Export}'
+            yield u'\n\\author{%s %s}\n\\maketitle\n\n' % (session['user_firstName'],
+                session['user_lastName'])
+            delimiter = u''
+            for f in self.get_form_list(input_):
+                yield delimiter + form_formatter(f, secondary_data=secondary_data,
+                                                 reference=reference)
+                delimiter = u'\n\n'
+            yield u'\n\n\\end{document}'
 
         return exporter_function
 
@@ -0,0 +1,463 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""This module provides pools of long-lived flookup processes.
+
+Starting flookup and loading a compiled foma FST takes far longer than looking
+up a single word, so instead of spawning a new flookup for every word we keep a
+small pool of flookup processes per (binary file, direction) pair and feed them
+words over stdin/stdout.  flookup is run with -b (unbuffered output) so that
+each lookup can be read back as soon as it is written; the results for a word
+are terminated by an empty line.
+
+Workers that die are restarted transparently and a pool reloads its FST
+(i.e., restarts its workers) whenever the binary file is recompiled.
+
+Usage:
+
+    pool = getFlookupPool(binaryFilePath, inverse=True)
+    pool.apply(u'#word#')    # e.g., [u'#wurd#', u'#word#']
+
+"""
+
+import os
+import atexit
+import logging
+import threading
+import subprocess
+import Queue
+
+from pylons import config
+
+log = logging.getLogger(__name__)
+
+
+def getDefaultPoolSize():
+    """Return the maximum number of flookup processes per FST, as set by the
+    flookup_pool_size option in the config file (default 2).
+
+    """
+
+    try:
+        return max(1, int(config['app_conf'].get('flookup_pool_size', 2)))
+    except (KeyError, TypeError, ValueError):
+        return 2
+
+
+def getBinarySignature(binaryFilePath):
+    """Return a (modification time, size) tuple for the binary file or None if
+    it does not exist.  A change in signature means the FST was recompiled.
+
+    """
+
+    try:
+        stat = os.stat(binaryFilePath)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+class FlookupError(Exception):
+    pass
+
+
+class FlookupWorker(object):
+    """A single flookup process with the FST in binaryFilePath loaded.
+
+    """
+
+    def __init__(self, binaryFilePath, inverse=False, generation=0):
+        self.binaryFilePath = binaryFilePath
+        self.inverse = inverse
+        self.generation = generation
+        self.process = None
+
+    def getCommand(self):
+        cmdList = ['flookup', '-b', '-x']
+        if self.inverse:
+            cmdList.append('-i')
+        cmdList.append(self.binaryFilePath)
+        return cmdList
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.getCommand(),
+            shell=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            close_fds=True)
+
+    def isAlive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except IOError:
+            pass
+        try:
+            if self.process.poll() is None:
+                os.kill(self.process.pid, 15)
+            self.process.wait()
+        except OSError:
+            pass
+        self.process = None
+
+    def write(self, word):
+        """Write a single word (unicode) to flookup's stdin.  Newlines would
+        desynchronize the line-based protocol so they are replaced by spaces.
+
+        """
+
+        word = word.replace(u'\n', u' ').replace(u'\r', u' ')
+        self.process.stdin.write(word.encode('utf-8') + '\n')
+
+    def read(self):
+        """Read the results for a single word from flookup's stdout, i.e., the
+        lines up to the next empty line.
+
+        """
+
+        result = []
+        while True:
+            line = self.process.stdout.readline()
+            if not line:
+                raise FlookupError('flookup exited unexpectedly (%s).' %
+                                   self.binaryFilePath)
+            line = line.rstrip('\n')
+            if not line:
+                return result
+            result.append(unicode(line, 'utf-8'))
+
+    def apply(self, word):
+        """Return the list of output lines flookup produces for word.  These
+        are identical to the non-empty lines of a one-off ``flookup -x`` call,
+        e.g., ``[u'+?']`` for words the FST does not accept.
+
+        """
+
+        self.write(word)
+        self.process.stdin.flush()
+        return self.read()
+
+    def applyMany(self, words, results):
+        """Stream words through flookup in a single pass, appending the output
+        lines for each word to results.  A separate thread writes the words so
+        that neither side of the pipe can fill up and deadlock; results is
+        passed in so that, if flookup dies, the caller knows how far it got.
+
+        """
+
+        def writeWords():
+            try:
+                for word in words:
+                    self.write(word)
+                self.process.stdin.flush()
+            except (IOError, OSError):
+                pass    # The reader will notice that flookup has exited
+
+        writer = threading.Thread(target=writeWords)
+        writer.setDaemon(True)
+        writer.start()
+        try:
+            for word in words:
+                results.append(self.read())
+        finally:
+            writer.join()
+
+
+class FlookupPool(object):
+    """A bounded pool of FlookupWorker instances sharing one FST binary.
+
+    Workers are started lazily (up to size of them) and are returned to the
+    idle queue after each lookup.  A worker whose process has crashed is
+    replaced and the lookup is retried once.  When the binary's signature
+    changes the pool's generation is incremented and workers of an older
+    generation are stopped instead of being reused.  Once the pool is shut
+    down, workers that are still busy are stopped when they are released.
+
+    """
+
+    def __init__(self, binaryFilePath, inverse=False, size=None):
+        self.binaryFilePath = binaryFilePath
+        self.inverse = inverse
+        self.size = size or getDefaultPoolSize()
+        self.idle = Queue.Queue()
+        self.lock = threading.Lock()
+        self.workerCount = 0
+        self.generation = 0
+        self.signature = getBinarySignature(binaryFilePath)
+        self.closed = False
+
+    def checkForRecompilation(self):
+        signature = getBinarySignature(self.binaryFilePath)
+        if signature != self.signature:
+            self.lock.acquire()
+            try:
+                if signature != self.signature:
+                    log.debug('%s has changed; reloading flookup pool.' %
+                              self.binaryFilePath)
+                    self.signature = signature
+                    self.generation += 1
+            finally:
+                self.lock.release()
+
+    def reload(self):
+        """Force the workers to reload the FST, e.g., after a recompilation
+        that happened within the resolution of the file system's mtime.
+
+        """
+
+        self.lock.acquire()
+        try:
+            self.signature = getBinarySignature(self.binaryFilePath)
+            self.generation += 1
+        finally:
+            self.lock.release()
+
+    def getWorker(self):
+        """Return an idle worker of the current generation, starting a new
+        one if the pool is not yet full; otherwise wait for one to be
+        released or discarded.  Raise FlookupError at once if a worker cannot
+        be started.
+
+        """
+
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except Queue.Empty:
+                worker = None
+                self.lock.acquire()
+                try:
+                    if self.workerCount < self.size:
+                        self.workerCount += 1
+                        worker = FlookupWorker(self.binaryFilePath,
+                                               self.inverse, self.generation)
+                finally:
+                    self.lock.release()
+                if worker is None:
+                    worker = self.idle.get()
+                else:
+                    self.startWorker(worker)
+                    return worker
+            if worker is None:
+                # A worker was discarded (see discardWorker): start another
+                continue
+            if worker.generation == self.generation and worker.isAlive():
+                return worker
+            self.discardWorker(worker)
+
+    def startWorker(self, worker):
+        if not os.path.isfile(self.binaryFilePath):
+            self.discardWorker(worker)
+            raise FlookupError('%s does not exist.' % self.binaryFilePath)
+        try:
+            worker.start()
+        except OSError, e:
+            self.discardWorker(worker)
+            raise FlookupError('Unable to start flookup (%s).' % e)
+
+    def releaseWorker(self, worker):
+        self.lock.acquire()
+        try:
+            if not self.closed:
+                self.idle.put(worker)
+                return
+        finally:
+            self.lock.release()
+        self.discardWorker(worker)
+
+    def discardWorker(self, worker):
+        """Stop the worker and wake a thread waiting for one in getWorker (if
+        any) by putting None in the idle queue, so that it starts a new
+        worker in its place.
+
+        """
+
+        worker.stop()
+        self.lock.acquire()
+        try:
+            self.workerCount -= 1
+        finally:
+            self.lock.release()
+        self.idle.put(None)
+
+    def apply(self, word):
+        """Look up word with one of the pool's workers.
+
+        """
+
+        self.checkForRecompilation()
+        for attempt in range(2):
+            worker = self.getWorker()
+            try:
+                result = worker.apply(word)
+            except (IOError, OSError, FlookupError), e:
+                log.warning('flookup worker failed on %s (%s); restarting.' %
+                            (word, e))
+                self.discardWorker(worker)
+                continue
+            self.releaseWorker(worker)
+            return result
+        raise FlookupError('Unable to look up %s using %s.' % (
+            word, self.binaryFilePath))
+
+    def applyMany(self, words):
+        """Look up all of the words in one streamed pass and return a list of
+        output line lists, one per word.  If a worker dies mid-stream, the
+        remaining words are streamed through a fresh worker; a word that
+        kills two workers in a row gets an empty list as its result.
+
+        """
+
+        self.checkForRecompilation()
+        words = list(words)
+        results = []
+        failedAt = None
+        while len(results) < len(words):
+            worker = self.getWorker()
+            start = len(results)
+            try:
+                worker.applyMany(words[start:], results)
+            except (IOError, OSError, FlookupError), e:
+                index = len(results)
+                log.warning('flookup worker failed on %s (%s); restarting.' %
+                            (words[index], e))
+                self.discardWorker(worker)
+                if failedAt == index:
+                    results.append([])
+                failedAt = index
+                continue
+            self.releaseWorker(worker)
+        return results
+
+    def shutdown(self):
+        """Stop the idle workers and mark the pool as closed, so that the busy
+        ones are stopped when they are released.
+
+        """
+
+        self.lock.acquire()
+        try:
+            self.closed = True
+        finally:
+            self.lock.release()
+        workers = []
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except Queue.Empty:
+                break
+            if worker is not None:
+                workers.append(worker)
+        for worker in workers:
+            self.discardWorker(worker)
+
+
+# Process-wide registry of pools, keyed by (binary file path, inverse).
+_pools = {}
+_poolsLock = threading.Lock()
+
+
+def getFlookupPool(binaryFilePath, inverse=False):
+    """Return the (shared) pool of flookup processes for binaryFilePath.
+
+    """
+
+    key = (os.path.abspath(binaryFilePath), bool(inverse))
+    try:
+        return _pools[key]
+    except KeyError:
+        _poolsLock.acquire()
+        try:
+            if key not in _pools:
+                _pools[key] = FlookupPool(key[0], key[1])
+            return _pools[key]
+        finally:
+            _poolsLock.release()
+
+
+def reloadFlookupPools(binaryFilePath):
+    """Make any pools using binaryFilePath reload it.  Call this after
+    compiling a foma script.
+
+    """
+
+    path = os.path.abspath(binaryFilePath)
+    for key, pool in _pools.items():
+        if key[0] == path:
+            pool.reload()
+
+
+def removeFlookupPools(binaryFilePath):
+    """Shut down and forget any pools using binaryFilePath, e.g., when the FST
+    is deleted.
+
+    """
+
+    path = os.path.abspath(binaryFilePath)
+    _poolsLock.acquire()
+    try:
+        for key in _pools.keys():
+            if key[0] == path:
+                _pools.pop(key).shutdown()
+    finally:
+        _poolsLock.release()
+
+
+def shutdownFlookupPools():
+    for pool in _pools.values():
+        pool.shutdown()
+
+atexit.register(shutdownFlookupPools)
+
+
+def flookupMany(binaryFilePath, words, inverse=False):
+    """Apply the FST in binaryFilePath to each of the words in a single
+    streamed pass and return a list of output line lists, one per word.  If
+    flookup cannot be run (e.g., because the binary file is missing), log the
+    error and return an empty list for each word, as flookup does.
+
+    """
+
+    words = list(words)
+    try:
+        return getFlookupPool(binaryFilePath, inverse).applyMany(words)
+    except FlookupError, e:
+        log.warning(str(e))
+        return [[] for word in words]
+
+
+def flookup(binaryFilePath, word, inverse=False):
+    """Apply the FST in binaryFilePath to word (down, or up if inverse is
+    True) and return the list of non-empty output lines.  If flookup cannot
+    process the word (e.g., because the binary file is missing), log the
+    error and return an empty list, as a one-off flookup call would.
+
+    """
+
+    try:
+        return getFlookupPool(binaryFilePath, inverse).apply(word)
+    except FlookupError, e:
+        log.warning(str(e))
+        return []
@@ -25,11 +25,13 @@
 import os
 import shutil
 import re
+import threading
 import helpers as h
 import codecs
 import htmlentitydefs
 import string
 import pickle
+import urllib
 import unicodedata as ud
 
 from datetime import datetime, date, time
@@ -48,6 +50,10 @@ from sqlalchemy import desc
 
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
+from translatorRegistry import translatorRegistry, getTranslatorKey, \
+    getUserTranslator, STORAGE
+from secondaryObjects import secondaryObjectCache, secondaryObjectsChanged
+from languageIndex import readLanguages
 
 
 def removeWhiteSpace(string):
@@ -115,7 +121,11 @@ def putOrthographyTranslatorsIntoSession():
     3. storageToInputTranslator
     
     Whether these variables point to OrthographyTranslator instances or to None,
-    depends on the user's user-specific settings.
+    depends on the user's user-specific settings.  Only the keys of the
+    translators are stored in the session (e.g., as
+    session['user_storageToOutputTranslatorKey']); the translators themselves
+    are shared by all users (see lib/translatorRegistry.py and
+    getUserTranslator).
     
     If (1) the user has chosen an input orthography and (2) that orthography
     differs from the system's storage orthography and (3) that orthography
@@ -133,18 +143,14 @@ def putOrthographyTranslatorsIntoSession():
         app_globals.defaultInputOrthography) and (
         session['user_inputOrthography'] in app_globals.OLOrthographies):
         # Update the inputToStorageTranslator
-        session['user_inputToStorageTranslator'] = h.OrthographyTranslator(
-            app_globals.OLOrthographies[session['user_inputOrthography']][1],
-            app_globals.storageOrthography[1]
-        )
+        session['user_inputToStorageTranslatorKey'] = getTranslatorKey(
+            session['user_inputOrthography'], STORAGE)
         # Update the storageToInputTranslator
-        session['user_storageToInputTranslator'] = h.OrthographyTranslator(
-            app_globals.storageOrthography[1],
-            app_globals.OLOrthographies[session['user_inputOrthography']][1]
-        )
+        session['user_storageToInputTranslatorKey'] = getTranslatorKey(
+            STORAGE, session['user_inputOrthography'])
     else:
-        session['user_inputToStorageTranslator'] = None
-        session['user_storageToInputTranslator'] = None
+        session['user_inputToStorageTranslatorKey'] = None
+        session['user_storageToInputTranslatorKey'] = None
 
     if session['user_outputOrthography'] and \
         (app_globals.storageOrthography != \
@@ -152,12 +158,19 @@ def putOrthographyTranslatorsIntoSession():
         session['user_outputOrthography'] != \
         app_globals.defaultOutputOrthography) and (
         session['user_outputOrthography'] in app_globals.OLOrthographies):
-        session['user_storageToOutputTranslator'] = h.OrthographyTranslator(
-            app_globals.storageOrthography[1],
-            app_globals.OLOrthographies[session['user_outputOrthography']][1]
-        )
+        session['user_storageToOutputTranslatorKey'] = getTranslatorKey(
+            STORAGE, session['user_outputOrthography'])
     else:
-        session['user_storageToOutputTranslator'] = None
+        session['user_storageToOutputTranslatorKey'] = None
+
+    session['user_translatorsVersion'] = app_globals.settingsVersion
+
+    # Remove any translators pickled into the session by earlier versions
+    for name in ['user_inputToStorageTranslator',
+                 'user_storageToInputTranslator',
+                 'user_storageToOutputTranslator']:
+        if name in session:
+            del session[name]
 
     session.save()
 
@@ -196,98 +209,32 @@ def updateSessionAndGlobals(user):
 
 def updateSecondaryObjectsInAppGlobals(app_globals):
     """Updates the app_globals secondary object list attributes, e.g., speakers,
-    users, etc.
+    users, etc., from the secondary object cache (see lib/secondaryObjects.py),
+    reloading only those lists that have changed.
 
     """
 
-    # Update the tags options (i.e., possible speakers, elicitors, sources, etc.)
-    secondaryObjects = getSecondaryObjects()
-    app_globals.speakers = secondaryObjects['speakers']
-    app_globals.users = secondaryObjects['users']
-    app_globals.nonAdministrators = secondaryObjects['nonAdministrators']
-    app_globals.unrestrictedUsers= secondaryObjects['unrestrictedUsers']
-    app_globals.sources = secondaryObjects['sources']
-    app_globals.syncats = secondaryObjects['syncats']
-    app_globals.keywords = secondaryObjects['keywords']
-    app_globals.elicitationMethods = secondaryObjects['elicitationMethods']
+    secondaryObjectCache.refresh(force=True)
 
 
 def getSecondaryObjects(objectsList=None):
-    """Returns a dict whose values are lists for each of speakers, users,
-    sources, syntactic categories, elicitation methods, keywords.
+    """Returns a dict whose values are tuples of read-only records for each of
+    speakers, users, sources, syntactic categories, elicitation methods,
+    keywords.  The records come from the secondary object cache (see
+    lib/secondaryObjects.py), which is only reloaded when the tables change.
 
     The optional objectsList parameter is a list specifying which objects should
     be retrieved.  If objectsList is None, all are retrieved.
 
     """
 
-    # Speakers
-    speakers = []
-    if not objectsList or 'speakers' in objectsList:
-        speakers = meta.Session.query(model.Speaker).order_by(
-            model.Speaker.lastName).all()
-
-    # Users
-    users = []
-    nonAdministrators = []
-    if not objectsList or 'users' in objectsList:
-        users = meta.Session.query(model.User).order_by(
-            model.User.lastName).all()
-        nonAdministrators = [user for user in users if
-                             user.role == u'contributor']
-
-    # Unrestricted Users
-    unrestrictedUsers = []
-    if not objectsList or 'unrestrictedUsers' in objectsList:
-        appSet = meta.Session.query(
-            model.ApplicationSettings).order_by(  
-            desc(model.ApplicationSettings.id)).first()
-
-        try:
-            unrestrictedUserIDs = tuple([int(uu) for uu in json.loads(
-                appSet.unrestrictedUsers)])
-        except TypeError: # Error caused by json choking on None
-            unrestrictedUserIDs = []
-        unrestrictedUsers = meta.Session.query(model.User).filter(
-            model.User.id.in_(unrestrictedUserIDs)).all()
-
-    # Sources
-    sources = []
-    if not objectsList or 'sources' in objectsList:
-        sources = meta.Session.query(model.Source).order_by(
-            model.Source.authorLastName).order_by(
-            model.Source.authorFirstName).order_by(
-            desc(model.Source.year)).all()
-
-    # Syntactic Categories
-    syncats = []
-    if not objectsList or 'syncats' in objectsList:
-        syncats = meta.Session.query(model.SyntacticCategory).order_by(
-            model.SyntacticCategory.name).all()
-
-    # Keywords
-    keywords = []
-    if not objectsList or 'keywords' in objectsList:
-        keywords = meta.Session.query(model.Keyword).order_by(
-            model.Keyword.name).all()
-
-    # Elicitation Methods
-    elicitationMethods = []
-    if not objectsList or 'elicitationMethods' in objectsList:
-        elicitationMethods = meta.Session.query(
-            model.ElicitationMethod).order_by(
-            model.ElicitationMethod.name).all()
-
-    return {
-        'speakers': speakers,
-        'users': users,
-        'nonAdministrators': nonAdministrators,
-        'unrestrictedUsers': unrestrictedUsers,
-        'sources': sources,
-        'syncats': syncats,
-        'keywords': keywords,
-        'elicitationMethods': elicitationMethods
-    }
+    secondaryObjectCache.refresh()
+    secondaryObjects = secondaryObjectCache.getSecondaryObjects()
+    if objectsList:
+        for key in secondaryObjects:
+            if key not in objectsList:
+                secondaryObjects[key] = ()
+    return secondaryObjects
 
 
 def applicationSettingsToAppGlobals(app_globals, applicationSettings=None):
@@ -420,10 +367,7 @@ def applicationSettingsToAppGlobals(app_globals, applicationSettings=None):
         else:
             app_globals.storageToOutputTranslator = None
 
-        unrestrictedUserIDs = json.loads(applicationSettings.unrestrictedUsers)
-        unrestrictedUsers = meta.Session.query(model.User).filter(
-            model.User.id.in_(unrestrictedUserIDs)).all()
-        app_globals.unrestrictedUsers = unrestrictedUsers
+        # app_globals.unrestrictedUsers is set by the secondary object cache
 
         # Update Inventory objects (useful for validation)
         updateInventoryObjectsInAppGlobals(app_globals, applicationSettings)
@@ -466,6 +410,12 @@ def applicationSettingsToAppGlobals(app_globals, applicationSettings=None):
         app_globals.punctuation = list(u""".,;:!?'"\u2018\u2019\u201C\u201D[]{}()-""")
         app_globals.grammaticalities = [u'', u'*', u'#', u'?']
 
+    # Users' translators are now built from the new orthographies (see
+    #  lib/translatorRegistry.py)
+    app_globals.settingsVersion = applicationSettings and \
+        applicationSettings.id or 0
+    translatorRegistry.clear()
+
 
 def getApplicationSettings():
     """Return an ApplicationSettings instance.
@@ -486,8 +436,12 @@ def updateInventoryObjectsInAppGlobals(app_globals, applicationSettings=None):
     if not applicationSettings:
         applicationSettings = getApplicationSettings()
 
+    # The transcriptions of each foreign word are remembered so that
+    #  updateInventoryObjsIfFormIsForeignWord can update the inventories
+    #  incrementally when a foreign word Form changes.
+    foreignWordTranscriptions = getForeignWordTranscriptionsByForm()
     fWNarrPhonTranscrs, fWBroadPhonTranscrs, fWOrthTranscrs, \
-        fWMorphTranscrs = getForeignWordTranscriptions()
+        fWMorphTranscrs = getForeignWordTranscriptions(foreignWordTranscriptions)
     storOrthAsList = getStorageOrthographyAsList(applicationSettings)
     app_globals.punctInvObj = Inventory(app_globals.punctuation)
     app_globals.morphDelimInvObj = Inventory(app_globals.morphDelimiters)
@@ -504,6 +458,7 @@ def updateInventoryObjectsInAppGlobals(app_globals, applicationSettings=None):
         app_globals.morphBreakInvObj = Inventory(fWMorphTranscrs + 
             app_globals.morphDelimiters + [u' '] +
             h.removeAllWhiteSpace(app_globals.morphPhonInventory).split(','))
+    app_globals.foreignWordTranscriptions = foreignWordTranscriptions
 
 
 ################################################################################
@@ -516,9 +471,9 @@ def getInputToStorageTranslator():
     in the globals.  If no translator is found, return the identity function.
     
     """
-    if session['user_inputToStorageTranslator']:
-        return lambda x: h.literal(session[
-            'user_inputToStorageTranslator'].translate(x))
+    translator = getUserTranslator('inputToStorage')
+    if translator:
+        return lambda x: h.literal(translator.translate(x))
     elif app_globals.inputToStorageTranslator:
         return lambda x: h.literal(
             app_globals.inputToStorageTranslator.translate(x))
@@ -566,9 +521,9 @@ def getStorageToInputTranslator():
     in the globals.  If no translator is found, return the identity function.
     
     """
-    if session['user_storageToInputTranslator']:
-        return lambda x: h.literal(session[
-            'user_storageToInputTranslator'].translate(x))
+    translator = getUserTranslator('storageToInput')
+    if translator:
+        return lambda x: h.literal(translator.translate(x))
     elif app_globals.storageToInputTranslator:
         return lambda x: h.literal(
             app_globals.storageToInputTranslator.translate(x))
@@ -618,10 +573,9 @@ def getStorageToOutputTranslator():
     in the globals.  If no translator is found, return the identity function.
     
     """
-    if 'user_storageToOutputTranslator' in session and \
-    session['user_storageToOutputTranslator']:
-        return lambda x: h.literal(session[
-            'user_storageToOutputTranslator'].translate(x))
+    translator = getUserTranslator('storageToOutput')
+    if translator:
+        return lambda x: h.literal(translator.translate(x))
     elif app_globals.storageToOutputTranslator:
         return lambda x: h.literal(
             app_globals.storageToOutputTranslator.translate(x))
@@ -982,17 +936,11 @@ def getListOfLanguages():
     """ Function returns the ISO 639-3 Code Set
     (http://www.sil.org/iso639-3/download.asp) as a list.
     
-    Expects a UTF-8 file named 'iso-639-3.tab' in lib/languages. 
+    Reads the UTF-8 file 'iso_639_3.tab' in lib/languages (see
+    lib/languageIndex).
     
     """
-    file = codecs.open(
-        os.path.join(
-            config['pylons.paths']['root'], 'lib', 'languages', 'iso-639-3.tab'
-        ),
-        'r', 'utf-8'
-    )
-    temp = [x.split('\t') for x in file]
-    return temp
+    return [list(language) for language in readLanguages()]
 
 def commatizeNumberString(numberString):
     if len(numberString) > 3:
@@ -1127,6 +1075,35 @@ def userIsAuthorizedToAccessForm(user, form):
         user.role != u'administrator')
 
 
+def getTranscriptionsToParse(body):
+    """Return the strings to parse given the body of a getparses request (see
+    the analysis and morphparser controllers): a JSON object with any of the
+    attributes words (a list of words), transcriptions (a list of
+    transcriptions) and formIDs (a list of ids of Forms whose transcriptions
+    are to be parsed), or a list of words.  Forms the user may not access are
+    skipped.  Raise ValueError if the body is not such an object.
+
+    """
+
+    values = json.loads(urllib.unquote_plus(unicode(body, 'utf-8')))
+    if isinstance(values, list):
+        values = {'words': values}
+    if not isinstance(values, dict):
+        raise ValueError('Expected a JSON object or list.')
+    try:
+        words = [w.strip() for w in values.get('words', [])]
+        transcriptions = [unicode(t) for t in values.get('transcriptions', [])]
+        formIDs = [int(id) for id in values.get('formIDs', [])]
+    except (AttributeError, TypeError), e:
+        raise ValueError(str(e))
+    if formIDs:
+        forms = meta.Session.query(model.Form).filter(
+            model.Form.id.in_(formIDs)).all()
+        transcriptions += [f.transcription for f in forms if
+            userIsAuthorizedToAccessForm(session['user'], f)]
+    return words + transcriptions
+
+
 def appendMsgToFlash(msg):
     if 'flash' in session:
         session['flash'] += msg
@@ -1174,7 +1151,7 @@ def NFDDict(dict_):
             pass
     return dict_
 
-class Inventory:
+class Inventory(object):
     """An inventory is a set of graphemes/polygraphs/characters.  Initialization
     requires a list.
 
@@ -1182,20 +1159,101 @@ class Inventory:
     inventory which provides unicode metadata such as character name, character
     code, etc.
 
+    Validation.  The graphs are kept in a trie (nested dicts from characters to
+    nodes; the None key marks the end of a graph).  stringIsValid and
+    getNonMatchingSubstrings walk the trie from each position of the string, so
+    they take time linear in the length of the string (times the length of the
+    longest graph) and never compile anything.  (The regex alternation used
+    before could backtrack exponentially when graphs overlapped, e.g., u'a' and
+    u'aa'.)  Graphs can be added and removed one at a time (see add and remove)
+    as foreign word Forms are saved and deleted.
+
     This class should be the base class from which the Orthography class
     inherits but I don't have time to implement that right now.
     
     """
 
     def __init__(self, inputList):
-        self.inputList = inputList
-        self._getUnicodeMetadata(inputList)
-        self._setRegexValidator(inputList)
-        self._compileRegexValidator(self.regexValidator)
+        self.inputList = []
+        self.counts = {}    # graph -> number of occurrences in inputList
+        self.trie = {}
+        self.lock = threading.Lock()
+        self._unicodeMetadata = None
+        for graph in reversed(inputList):
+            self.add(graph)
+
+    def add(self, graph):
+        """Add graph to the start of the inventory (where the transcriptions of
+        foreign words go; cf. getInventoryListForKeyboard).
+
+        """
+
+        self.lock.acquire()
+        try:
+            self.inputList.insert(0, graph)
+            self._unicodeMetadata = None
+            self.counts[graph] = self.counts.get(graph, 0) + 1
+            if self.counts[graph] == 1 and graph:
+                node = self.trie
+                for char in graph:
+                    node = node.setdefault(char, {})
+                node[None] = True
+        finally:
+            self.lock.release()
+
+    def remove(self, graph):
+        """Remove (the first occurrence of) graph from the inventory.  The graph
+        remains valid if it occurs more than once.
+
+        """
+
+        self.lock.acquire()
+        try:
+            if graph not in self.counts:
+                return
+            self.inputList.remove(graph)
+            self._unicodeMetadata = None
+            self.counts[graph] -= 1
+            if self.counts[graph] == 0:
+                del self.counts[graph]
+                if graph:
+                    self._removeFromTrie(graph)
+        finally:
+            self.lock.release()
+
+    def _removeFromTrie(self, graph):
+        path = [self.trie]
+        for char in graph:
+            path.append(path[-1][char])
+        del path[-1][None]
+        # Prune the nodes that no longer lead to a graph
+        for index in range(len(graph) - 1, -1, -1):
+            if path[index + 1]:
+                break
+            del path[index][graph[index]]
+
+    def _getMatchEnds(self, string, start):
+        """Return the end indices of the graphs that occur in string at
+        start, shortest first.
+
+        """
 
-    def _getUnicodeMetadata(self, inputList):
-        self.inventoryWithUnicodeMetadata = [self._getNameCodeDistNorm(g)
-                                             for g in inputList]
+        ends = []
+        node = self.trie
+        for index in xrange(start, len(string)):
+            node = node.get(string[index])
+            if node is None:
+                break
+            if None in node:
+                ends.append(index + 1)
+        return ends
+
+    @property
+    def inventoryWithUnicodeMetadata(self):
+        if self._unicodeMetadata is None:
+            self._unicodeMetadata = [self._getNameCodeDistNorm(g)
+                                     for g in self.inputList]
+        return self._unicodeMetadata
 
     def _getNameCodeDistNorm(self, graph):
         return (graph, getUnicodeNames(graph), getUnicodeCodePoints(graph))
@@ -1207,36 +1265,39 @@ class Inventory:
         else:
             return u''
 
-    def _setRegexValidator(self, inputList):
-        disjPatt = u'|'.join([escREMetaChars(g) for g in inputList])
-        self.regexValidator = u'^(%s)*$' % disjPatt
-
-    def _compileRegexValidator(self, regexValidator):
-        self.compiledRegexValidator = re.compile(regexValidator)
-
     def getInputList(self):
         return self.inputList
 
     def getRegexValidator(self, substr=False):
         """Returns a regex that matches only strings composed of zero or more
-        of the graphemes in the inventory (plus the space character).
+        of the graphemes in the inventory (plus the space character).  (The
+        regex is for client-side validation; stringIsValid does not use it.)
 
         """
 
-        return self.regexValidator
+        disjPatt = u'|'.join([escREMetaChars(g) for g in self.inputList])
+        return u'^(%s)*$' % disjPatt
 
     def getNonMatchingSubstrings(self, string):
         """Return a list of substrings of string that are not constructable
-        using the inventory.
+        using the inventory.  The graphs are matched greedily (longest first)
+        from left to right.
 
         """
 
-        regex = u'|'.join([escREMetaChars(g) for g in self.inputList])
-        regex = u'(%s)+' % regex
-        patt = re.compile(regex)
-        list_ = patt.split(string)
-        nonMatchingSubstrings = [escREMetaChars(x) for x in list_[::2] if x]
-        return nonMatchingSubstrings
+        nonMatchingSubstrings = []
+        start = index = 0
+        while index < len(string):
+            ends = self._getMatchEnds(string, index)
+            if ends:
+                if start < index:
+                    nonMatchingSubstrings.append(string[start:index])
+                index = start = ends[-1]
+            else:
+                index += 1
+        if start < len(string):
+            nonMatchingSubstrings.append(string[start:])
+        return [escREMetaChars(x) for x in nonMatchingSubstrings]
 
     def getHTMLTable(self, className='', tabLen=5):
         return tablify(self.inventoryWithUnicodeMetadata, tabLen, className)
@@ -1247,9 +1308,13 @@ class Inventory:
 
         """
 
-        if self.compiledRegexValidator.match(string):
-            return True
-        return False
+        # reachable[i] is True if string[:i] can be generated
+        reachable = [True] + [False] * len(string)
+        for start in xrange(len(string)):
+            if reachable[start]:
+                for end in self._getMatchEnds(string, start):
+                    reachable[end] = True
+        return reachable[-1]
 
 
 def getCommaDelimitedStringAsInventory(string):
@@ -1286,41 +1351,56 @@ def getForeignWords():
     useful for input validation as foreign words may contain otherwise illicit
     characters/graphemes.
 
-    ***Note*** This should obviously be done with a SQL join!  However, SQLite
-    on my system is taking *forever* to perform a join query, hence this
-    roundabout.
+    This is one join, which starts from the keyword table using the indexes on
+    keyword.name and formkeyword (keyword_id, form_id); without those indexes
+    SQLite scanned the whole formkeyword table (see
+    benchmarks.benchmarkKeywordJoin).
+
+    """
+
+    return meta.Session.query(model.Form).join('keywords').filter(
+        model.Keyword.name == u'foreign word').all()
+
+# The app_globals inventories that the (narrow phonetic, broad phonetic,
+#  orthographic, morphemic) transcriptions of foreign words are added to
+FOREIGN_WORD_INVENTORIES = ('narrPhonInvObj', 'broadPhonInvObj',
+                            'orthTranscrInvObj', 'morphBreakInvObj')
+
+def getFormForeignWordTranscriptions(form):
+    """Return the 4-tuple of the (narrow phonetic, broad phonetic,
+    orthographic, morphemic) transcriptions of form, with None for empty
+    (non-orthographic) transcriptions.
+
+    """
+
+    return (form.narrowPhoneticTranscription or None,
+            form.phoneticTranscription or None, form.transcription,
+            form.morphemeBreak or None)
+
+def getForeignWordTranscriptionsByForm():
+    """Return a dict from the ids of the foreign word Forms to the 4-tuples of
+    their transcriptions (see getFormForeignWordTranscriptions).
 
     """
 
-    foreignWordKeywordIds = getForeignWordKeywordIds()
-    formKeywords = meta.Session.query(model.FormKeyword).filter(
-        model.FormKeyword.keyword_id.in_(foreignWordKeywordIds)).all()
-    formIds = [fkw.form_id for fkw in formKeywords]
-    return meta.Session.query(model.Form).filter(
-        model.Form.id.in_(formIds)).all()
+    return dict([(fw.id, getFormForeignWordTranscriptions(fw))
+                 for fw in getForeignWords()])
 
-def getForeignWordTranscriptions():
+def getForeignWordTranscriptions(foreignWordTranscriptions=None):
     """Returns a 4-tuple (fWNarrPhonTranscrs, fWBroadPhonTranscrs,
     fWOrthTranscrs, fWMorphTranscrs) where each element is a list of
     transcriptions (narrow phonetic, broad phonetic, orthographic, morphemic)
-    of foreign words.
+    of foreign words.  foreignWordTranscriptions is the result of
+    getForeignWordTranscriptionsByForm (by default, it is called).
 
     """
 
-    foreignWords = getForeignWords()
-    fWNarrPhonTranscrs = []
-    fWBroadPhonTranscrs = []
-    fWOrthTranscrs = []
-    fWMorphTranscrs = []
-    for fw in foreignWords:
-        if fw.narrowPhoneticTranscription:
-            fWNarrPhonTranscrs.append(fw.narrowPhoneticTranscription)
-        if fw.phoneticTranscription:
-            fWBroadPhonTranscrs.append(fw.phoneticTranscription)
-        if fw.morphemeBreak:
-            fWMorphTranscrs.append(fw.morphemeBreak)
-        fWOrthTranscrs.append(fw.transcription)
-    return (fWNarrPhonTranscrs, fWBroadPhonTranscrs, fWOrthTranscrs, fWMorphTranscrs)
+    if foreignWordTranscriptions is None:
+        foreignWordTranscriptions = getForeignWordTranscriptionsByForm()
+    transcriptions = [foreignWordTranscriptions[id] for id in
+                      sorted(foreignWordTranscriptions)]
+    return tuple([[t[index] for t in transcriptions if t[index] is not None]
+                  for index in range(len(FOREIGN_WORD_INVENTORIES))])
 
 
 def formIsForeignWord(form):
@@ -1330,9 +1410,39 @@ def formIsForeignWord(form):
         return True
     return False
 
-def updateInventoryObjsIfFormIsForeignWord(form):
-    if formIsForeignWord(form):
-        updateInventoryObjectsInAppGlobals(app_globals)
+def updateInventoryObjsIfFormIsForeignWord(form, deleted=False):
+    """Update the inventories after form has been saved (or deleted, if
+    deleted is True): remove the transcriptions it contributed as a foreign
+    word (if it was one) and add its current ones if it is a foreign word now.
+    Only the graphs that changed are touched; nothing is reloaded or
+    recompiled.
+
+    """
+
+    foreignWordTranscriptions = getattr(app_globals,
+                                        'foreignWordTranscriptions', None)
+    if foreignWordTranscriptions is None:
+        # The inventories have not been built yet
+        if not deleted and formIsForeignWord(form):
+            updateInventoryObjectsInAppGlobals(app_globals)
+        return
+
+    old = foreignWordTranscriptions.get(form.id)
+    new = None
+    if not deleted and formIsForeignWord(form):
+        new = getFormForeignWordTranscriptions(form)
+    if old == new:
+        return
+    for index, name in enumerate(FOREIGN_WORD_INVENTORIES):
+        inventory = getattr(app_globals, name)
+        if old and old[index] is not None:
+            inventory.remove(old[index])
+        if new and new[index] is not None:
+            inventory.add(new[index])
+    if new:
+        foreignWordTranscriptions[form.id] = new
+    else:
+        del foreignWordTranscriptions[form.id]
 
 
 def getInputOrthographyAsString():
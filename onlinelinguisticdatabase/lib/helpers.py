@@ -33,7 +33,8 @@ from webhelpers.markdown import markdown
 #from formbuild.helpers import field
 #from formbuild import start_with_layout as form_start, end_with_layout as form_end
 
-from queryBuilder import filterSearchQuery
+from queryBuilder import filterSearchQuery, translateSearchTerms
+from searchIndex import updateSearchIndex, removeFromSearchIndex
 from functions import *
 from auth import *
 from orthography import *
@@ -0,0 +1,383 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A queue of long-running background jobs (e.g., compiling the
+morphophonology FST; see the analysis controller) whose records are kept in
+the job table.
+
+A task is a function registered under a name with registerTask by one of the
+TASK_MODULES, which the queue imports when it starts.  It is called with a
+JobContext and the (JSON-decoded) arguments of the job and returns the result
+of the job (a unicode string).  It reports its progress (and lets the job be
+cancelled) by calling job.progress, which raises JobCancelled once a
+cancellation has been requested.
+
+submitJob records a queued job and returns its id right away; getJob returns
+the record (for polling) and cancelJob cancels the job.  Each process runs
+jobQueue.threads worker threads (see the job_threads config option), which
+claim the oldest queued job whose task the process has registered.  A job is
+claimed by an UPDATE that only succeeds while the job is still queued, so
+exactly one worker in one process runs it.
+
+The queue survives restarts: queued jobs stay in the table until a worker
+claims them and, when the queue starts, the running jobs of workers on this
+host whose processes have stopped are queued again.
+
+"""
+
+import os
+import time
+import errno
+import socket
+import logging
+import threading
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+import pylons
+from pylons import config
+import sqlalchemy as sa
+from sqlalchemy.sql import select
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+
+log = logging.getLogger(__name__)
+
+QUEUED = u'queued'
+RUNNING = u'running'
+COMPLETE = u'complete'
+FAILED = u'failed'
+CANCELLED = u'cancelled'
+
+# Default number of worker threads per process (see the job_threads config
+#  option) and of seconds an idle worker waits before checking for jobs
+#  queued by other processes
+DEFAULT_THREADS = 1
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Number of seconds between two checks for the cancellation of a job that is
+#  waiting for a subprocess (see JobContext.communicate)
+CANCEL_POLL_INTERVAL = 1.0
+
+# Modules that register tasks when they are imported.  Pylons only imports a
+#  controller when it first handles a request for it, so the queue imports
+#  them itself; this happens in a request thread (see JobQueue.start) since
+#  they read app_globals when they are imported.
+TASK_MODULES = ['onlinelinguisticdatabase.controllers.analysis']
+
+# task name -> function(job, arguments)
+tasks = {}
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def registerTask(name, function):
+    """Make the jobs called name run function (see the module docstring).
+
+    """
+
+    tasks[name] = function
+
+
+def getWorkerName():
+    return u'%s:%d' % (socket.gethostname(), os.getpid())
+
+
+def processIsRunning(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError, e:
+        return e.errno == errno.EPERM
+    return True
+
+
+def updateJob(id, where=None, **values):
+    """Set the values of the job with id (if where, a condition on the job
+    table, holds) and return the number of rows updated.
+
+    """
+
+    table = model.job_table
+    condition = table.c.id == id
+    if where is not None:
+        condition = sa.and_(condition, where)
+    values['datetimeModified'] = model.now()
+    return meta.engine.execute(table.update(condition, values=values)).rowcount
+
+
+def submitJob(name, arguments=None, entererID=None):
+    """Queue a job that runs the task called name with the arguments (a dict
+    that can be encoded as JSON) and return its id.
+
+    """
+
+    table = model.job_table
+    now = model.now()
+    result = meta.engine.execute(table.insert(), name=name,
+        arguments=unicode(json.dumps(arguments or {})), status=QUEUED,
+        message=u'Queued.', cancelRequested=False, enterer_id=entererID,
+        datetimeEntered=now, datetimeModified=now)
+    id = result.last_inserted_ids()[0]
+    jobQueue.wake()
+    return id
+
+
+def getJob(id):
+    """Return the record of the job with id as a dict that can be encoded as
+    JSON, or None if there is no such job.
+
+    """
+
+    table = model.job_table
+    columns = [c for c in table.c if c.name != 'arguments']
+    row = meta.engine.execute(select(columns, table.c.id == id)).fetchone()
+    if row is None:
+        return None
+    job = {}
+    for column in columns:
+        value = row[column]
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        job[column.name] = value
+    return job
+
+
+def cancelJob(id):
+    """Cancel the job with id: a queued job is cancelled at once, a running one
+    when its task next reports its progress.  Return True unless the job has
+    already finished.
+
+    """
+
+    table = model.job_table
+    now = model.now()
+    if updateJob(id, table.c.status == QUEUED, status=CANCELLED,
+                 message=u'Cancelled before it started.',
+                 datetimeFinished=now):
+        return True
+    return bool(updateJob(id, table.c.status == RUNNING,
+                          cancelRequested=True))
+
+
+class JobContext(object):
+    """What a task knows of its job: its id and how to report progress.
+
+    """
+
+    def __init__(self, id):
+        self.id = id
+
+    def isCancelRequested(self):
+        table = model.job_table
+        return bool(meta.engine.execute(select([table.c.cancelRequested],
+            table.c.id == self.id)).scalar())
+
+    def progress(self, message):
+        """Record message as the progress of the job and raise JobCancelled if
+        the job has been cancelled.
+
+        """
+
+        log.debug('Job %d: %s' % (self.id, message))
+        updateJob(self.id, message=message)
+        if self.isCancelRequested():
+            raise JobCancelled()
+
+    def communicate(self, process):
+        """Return the output of the subprocess once it exits, like
+        process.communicate()[0], but kill it and raise JobCancelled if the job
+        is cancelled while it runs.
+
+        """
+
+        output = []
+        reader = threading.Thread(
+            target=lambda: output.append(process.stdout.read()))
+        reader.setDaemon(True)
+        reader.start()
+        while process.poll() is None:
+            reader.join(CANCEL_POLL_INTERVAL)
+            if self.isCancelRequested():
+                process.kill()
+                process.wait()
+                raise JobCancelled()
+        reader.join()
+        return output and output[0] or ''
+
+
+def claimJob(names, worker):
+    """Mark the oldest queued job whose task is one of names as running in
+    worker and return its (id, name, arguments) row, or None if there is no
+    such job.
+
+    """
+
+    table = model.job_table
+    if not names:
+        return None
+    while True:
+        row = meta.engine.execute(
+            select([table.c.id, table.c.name, table.c.arguments],
+                   sa.and_(table.c.status == QUEUED,
+                           table.c.name.in_(names))).order_by(
+                table.c.id).limit(1)).fetchone()
+        if row is None:
+            return None
+        # Another worker may claim it first
+        if updateJob(row['id'], table.c.status == QUEUED, status=RUNNING,
+                     worker=worker, message=u'Started.',
+                     datetimeStarted=model.now()):
+            return row
+
+
+def runJob(row):
+    """Run the task of the claimed job and record how it finished.
+
+    """
+
+    id = row['id']
+    job = JobContext(id)
+    start = time.time()
+    try:
+        try:
+            arguments = json.loads(row['arguments'] or u'{}')
+            result = tasks[row['name']](job, arguments)
+        except JobCancelled:
+            log.info('Job %d (%s) cancelled.' % (id, row['name']))
+            updateJob(id, status=CANCELLED, message=u'Cancelled.',
+                      datetimeFinished=model.now())
+        except Exception, e:
+            log.exception('Job %d (%s) failed.' % (id, row['name']))
+            updateJob(id, status=FAILED, message=u'Failed: %s' % e,
+                      datetimeFinished=model.now())
+        else:
+            log.info('Job %d (%s) completed in %.1f s.' % (
+                id, row['name'], time.time() - start))
+            updateJob(id, status=COMPLETE, message=u'Complete.',
+                      result=result, datetimeFinished=model.now())
+    finally:
+        meta.Session.remove()
+
+
+def requeueOrphanedJobs():
+    """Queue again the running jobs of the workers on this host whose processes
+    have stopped (or of an earlier process with this pid) and return their
+    ids.
+
+    """
+
+    table = model.job_table
+    host = socket.gethostname()
+    requeued = []
+    for id, worker in meta.engine.execute(
+            select([table.c.id, table.c.worker], table.c.status == RUNNING)):
+        try:
+            workerHost, pid = worker.rsplit(u':', 1)
+            pid = int(pid)
+        except (AttributeError, ValueError):
+            continue
+        if workerHost != host or \
+                (pid != os.getpid() and processIsRunning(pid)):
+            continue
+        if updateJob(id, sa.and_(table.c.status == RUNNING,
+                                 table.c.worker == worker),
+                     status=QUEUED, worker=None, cancelRequested=False,
+                     message=u'Queued again: worker %s stopped.' % worker):
+            requeued.append(id)
+    if requeued:
+        log.info('Queued jobs %s again.' % ', '.join(map(str, requeued)))
+    return requeued
+
+
+class JobQueue(object):
+    """Runs the worker threads of this process.  start is called before each
+    request (see BaseController) but only loads the tasks and starts the
+    workers once.
+
+    """
+
+    def __init__(self, threads=DEFAULT_THREADS,
+                 pollInterval=DEFAULT_POLL_INTERVAL):
+        self.threads = threads
+        self.pollInterval = pollInterval
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.workers = []
+
+    def start(self):
+        if self.workers or self.threads < 1:
+            return
+        self.lock.acquire()
+        try:
+            if self.workers:
+                return
+            for name in TASK_MODULES:
+                try:
+                    __import__(name)
+                except Exception:
+                    log.exception('Unable to load the tasks of %s.' % name)
+            try:
+                requeueOrphanedJobs()
+            except sa.exc.DBAPIError, e:
+                log.warning('Background jobs are not available (%s); run '
+                            'setup-app to create the job table.' % e)
+            for i in range(self.threads):
+                worker = threading.Thread(target=self.run,
+                                          name='jobWorker%d' % i)
+                worker.setDaemon(True)
+                worker.start()
+                self.workers.append(worker)
+        finally:
+            self.lock.release()
+
+    def wake(self):
+        """Make the idle workers of this process check for jobs now.
+
+        """
+
+        self.wakeup.set()
+
+    def run(self):
+        # Tasks may use app_globals, which is only set up in request threads
+        pylons.app_globals._push_object(config['pylons.app_globals'])
+        worker = getWorkerName()
+        while True:
+            self.wakeup.clear()
+            try:
+                row = claimJob(tasks.keys(), worker)
+            except Exception:
+                log.exception('Unable to claim a job.')
+                row = None
+            if row is None:
+                self.wakeup.wait(self.pollInterval)
+                continue
+            try:
+                runJob(row)
+            except Exception:
+                log.exception('Unable to record the end of job %d.' % row['id'])
+
+
+jobQueue = JobQueue()
@@ -0,0 +1,131 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A prefix index of the ISO 639-3 languages for the language auto-suggest of
+the settings/edit page (see the getmatchinglanguages action of the settings
+controller).
+
+languageIndex reads lib/languages/iso_639_3.tab (the tab-delimited code table
+published by SIL) and keeps, for each of the Id and Ref_Name fields, a sorted
+list of the lowercased values of the field and a parallel list of the (Id,
+Ref_Name) pairs of the languages.  getMatches finds the first value that
+begins with a prefix by bisection and reads off at most limit matches from
+there, so a lookup takes time logarithmic in the number of languages plus the
+limit and never touches the database.
+
+The code table is only read (and the index built) when the first lookup is
+made, so starting a process that never suggests languages costs nothing.  See
+the languages benchmark in benchmarks.py.
+
+"""
+
+import os
+import bisect
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+ISO_639_3_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'languages', 'iso_639_3.tab')
+
+# The fields of a line of iso_639_3.tab
+FIELDS = ('Id', 'Part2B', 'Part2T', 'Part1', 'Scope', 'Language_Type',
+          'Ref_Name', 'Comment')
+
+# The fields that can be searched by prefix (the mode of getmatchinglanguages)
+MODES = ('Id', 'Ref_Name')
+
+
+def readLanguages(path=ISO_639_3_PATH):
+    """Return a list of the languages in the ISO 639-3 code table at path as
+    tuples of unicode values of the FIELDS.
+
+    """
+
+    f = open(path, 'rb')
+    try:
+        data = f.read().decode('utf-8-sig')
+    finally:
+        f.close()
+    languages = []
+    for line in data.split(u'\n'):
+        values = tuple(line.rstrip(u'\r').split(u'\t'))
+        if len(values) != len(FIELDS) or values[0] == u'Id':  # Header
+            continue
+        languages.append(values)
+    return languages
+
+
+class LanguageIndex(object):
+    """Finds the ISO 639-3 languages whose Id or Ref_Name begins with a string
+    (ignoring case).  load reads the code table; getMatches calls it the first
+    time it is called.
+
+    """
+
+    def __init__(self, path=ISO_639_3_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        # mode -> (sorted list of lowercased values, parallel list of (Id,
+        #  Ref_Name) pairs); None until loaded
+        self.index = None
+
+    def load(self):
+        languages = readLanguages(self.path)
+        index = {}
+        for mode in MODES:
+            column = FIELDS.index(mode)
+            entries = sorted([(language[column].lower(), language[0],
+                               language[6]) for language in languages])
+            index[mode] = ([entry[0] for entry in entries],
+                           [entry[1:] for entry in entries])
+        self.index = index
+        log.debug('Indexed %d ISO 639-3 languages.' % len(languages))
+
+    def getMatches(self, mode, prefix, limit=10):
+        """Return the (Id, Ref_Name) pairs of at most limit languages whose mode
+        field (Id or Ref_Name) begins with prefix, ignoring case, in order of
+        that field.
+
+        """
+
+        if self.index is None:
+            self.lock.acquire()
+            try:
+                if self.index is None:
+                    self.load()
+            finally:
+                self.lock.release()
+        try:
+            keys, languages = self.index[mode]
+        except KeyError:
+            return []
+        prefix = prefix.lower()
+        matches = []
+        index = bisect.bisect_left(keys, prefix)
+        while index < len(keys) and len(matches) < limit and \
+                keys[index].startswith(prefix):
+            matches.append(languages[index])
+            index += 1
+        return matches
+
+
+languageIndex = LanguageIndex()
@@ -1,7706 +0,0 @@
-languages = (
-	(u'aaa', u'', u'', u'', u'I', u'L', u'Ghotuo', u'\r\n'),
-	(u'aab', u'', u'', u'', u'I', u'L', u'Alumu-Tesu', u'\r\n'),
-	(u'aac', u'', u'', u'', u'I', u'L', u'Ari', u'\r\n'),
-	(u'aad', u'', u'', u'', u'I', u'L', u'Amal', u'\r\n'),
-	(u'aae', u'', u'', u'', u'I', u'L', u'Arb\xebresh\xeb Albanian', u'\r\n'),
-	(u'aaf', u'', u'', u'', u'I', u'L', u'Aranadan', u'\r\n'),
-	(u'aag', u'', u'', u'', u'I', u'L', u'Ambrak', u'\r\n'),
-	(u'aah', u'', u'', u'', u'I', u'L', u"Abu' Arapesh", u'\r\n'),
-	(u'aai', u'', u'', u'', u'I', u'L', u'Arifama-Miniafia', u'\r\n'),
-	(u'aak', u'', u'', u'', u'I', u'L', u'Ankave', u'\r\n'),
-	(u'aal', u'', u'', u'', u'I', u'L', u'Afade', u'\r\n'),
-	(u'aam', u'', u'', u'', u'I', u'L', u'Aramanik', u'\r\n'),
-	(u'aan', u'', u'', u'', u'I', u'L', u'Anamb\xe9', u'\r\n'),
-	(u'aao', u'', u'', u'', u'I', u'L', u'Algerian Saharan Arabic', u'\r\n'),
-	(u'aap', u'', u'', u'', u'I', u'L', u'Par\xe1 Ar\xe1ra', u'\r\n'),
-	(u'aaq', u'', u'', u'', u'I', u'E', u'Eastern Abnaki', u'\r\n'),
-	(u'aar', u'aar', u'aar', u'aa', u'I', u'L', u'Afar', u'\r\n'),
-	(u'aas', u'', u'', u'', u'I', u'L', u'Aas\xe1x', u'\r\n'),
-	(u'aat', u'', u'', u'', u'I', u'L', u'Arvanitika Albanian', u'\r\n'),
-	(u'aau', u'', u'', u'', u'I', u'L', u'Abau', u'\r\n'),
-	(u'aaw', u'', u'', u'', u'I', u'L', u'Solong', u'\r\n'),
-	(u'aax', u'', u'', u'', u'I', u'L', u'Mandobo Atas', u'\r\n'),
-	(u'aaz', u'', u'', u'', u'I', u'L', u'Amarasi', u'\r\n'),
-	(u'aba', u'', u'', u'', u'I', u'L', u'Ab\xe9', u'\r\n'),
-	(u'abb', u'', u'', u'', u'I', u'L', u'Bankon', u'\r\n'),
-	(u'abc', u'', u'', u'', u'I', u'L', u'Ambala Ayta', u'\r\n'),
-	(u'abd', u'', u'', u'', u'I', u'L', u'Manide', u'\r\n'),
-	(u'abe', u'', u'', u'', u'I', u'E', u'Western Abnaki', u'\r\n'),
-	(u'abf', u'', u'', u'', u'I', u'L', u'Abai Sungai', u'\r\n'),
-	(u'abg', u'', u'', u'', u'I', u'L', u'Abaga', u'\r\n'),
-	(u'abh', u'', u'', u'', u'I', u'L', u'Tajiki Arabic', u'\r\n'),
-	(u'abi', u'', u'', u'', u'I', u'L', u'Abidji', u'\r\n'),
-	(u'abj', u'', u'', u'', u'I', u'E', u'Aka-Bea', u'\r\n'),
-	(u'abk', u'abk', u'abk', u'ab', u'I', u'L', u'Abkhazian', u'\r\n'),
-	(u'abl', u'', u'', u'', u'I', u'L', u'Lampung Nyo', u'\r\n'),
-	(u'abm', u'', u'', u'', u'I', u'L', u'Abanyom', u'\r\n'),
-	(u'abn', u'', u'', u'', u'I', u'L', u'Abua', u'\r\n'),
-	(u'abo', u'', u'', u'', u'I', u'L', u'Abon', u'\r\n'),
-	(u'abp', u'', u'', u'', u'I', u'L', u'Abellen Ayta', u'\r\n'),
-	(u'abq', u'', u'', u'', u'I', u'L', u'Abaza', u'\r\n'),
-	(u'abr', u'', u'', u'', u'I', u'L', u'Abron', u'\r\n'),
-	(u'abs', u'', u'', u'', u'I', u'L', u'Ambonese Malay', u'\r\n'),
-	(u'abt', u'', u'', u'', u'I', u'L', u'Ambulas', u'\r\n'),
-	(u'abu', u'', u'', u'', u'I', u'L', u'Abure', u'\r\n'),
-	(u'abv', u'', u'', u'', u'I', u'L', u'Baharna Arabic', u'\r\n'),
-	(u'abw', u'', u'', u'', u'I', u'L', u'Pal', u'\r\n'),
-	(u'abx', u'', u'', u'', u'I', u'L', u'Inabaknon', u'\r\n'),
-	(u'aby', u'', u'', u'', u'I', u'L', u'Aneme Wake', u'\r\n'),
-	(u'abz', u'', u'', u'', u'I', u'L', u'Abui', u'\r\n'),
-	(u'aca', u'', u'', u'', u'I', u'L', u'Achagua', u'\r\n'),
-	(u'acb', u'', u'', u'', u'I', u'L', u'\xc1nc\xe1', u'\r\n'),
-	(u'acd', u'', u'', u'', u'I', u'L', u'Gikyode', u'\r\n'),
-	(u'ace', u'ace', u'ace', u'', u'I', u'L', u'Achinese', u'\r\n'),
-	(u'acf', u'', u'', u'', u'I', u'L', u'Saint Lucian Creole French', u'\r\n'),
-	(u'ach', u'ach', u'ach', u'', u'I', u'L', u'Acoli', u'\r\n'),
-	(u'aci', u'', u'', u'', u'I', u'E', u'Aka-Cari', u'\r\n'),
-	(u'ack', u'', u'', u'', u'I', u'E', u'Aka-Kora', u'\r\n'),
-	(u'acl', u'', u'', u'', u'I', u'E', u'Akar-Bale', u'\r\n'),
-	(u'acm', u'', u'', u'', u'I', u'L', u'Mesopotamian Arabic', u'\r\n'),
-	(u'acn', u'', u'', u'', u'I', u'L', u'Achang', u'\r\n'),
-	(u'acp', u'', u'', u'', u'I', u'L', u'Eastern Acipa', u'\r\n'),
-	(u'acq', u'', u'', u'', u'I', u'L', u"Ta'izzi-Adeni Arabic", u'\r\n'),
-	(u'acr', u'', u'', u'', u'I', u'L', u'Achi', u'\r\n'),
-	(u'acs', u'', u'', u'', u'I', u'E', u'Acro\xe1', u'\r\n'),
-	(u'act', u'', u'', u'', u'I', u'L', u'Achterhoeks', u'\r\n'),
-	(u'acu', u'', u'', u'', u'I', u'L', u'Achuar-Shiwiar', u'\r\n'),
-	(u'acv', u'', u'', u'', u'I', u'L', u'Achumawi', u'\r\n'),
-	(u'acw', u'', u'', u'', u'I', u'L', u'Hijazi Arabic', u'\r\n'),
-	(u'acx', u'', u'', u'', u'I', u'L', u'Omani Arabic', u'\r\n'),
-	(u'acy', u'', u'', u'', u'I', u'L', u'Cypriot Arabic', u'\r\n'),
-	(u'acz', u'', u'', u'', u'I', u'L', u'Acheron', u'\r\n'),
-	(u'ada', u'ada', u'ada', u'', u'I', u'L', u'Adangme', u'\r\n'),
-	(u'adb', u'', u'', u'', u'I', u'L', u'Adabe', u'\r\n'),
-	(u'add', u'', u'', u'', u'I', u'L', u'Dzodinka', u'\r\n'),
-	(u'ade', u'', u'', u'', u'I', u'L', u'Adele', u'\r\n'),
-	(u'adf', u'', u'', u'', u'I', u'L', u'Dhofari Arabic', u'\r\n'),
-	(u'adg', u'', u'', u'', u'I', u'L', u'Andegerebinha', u'\r\n'),
-	(u'adh', u'', u'', u'', u'I', u'L', u'Adhola', u'\r\n'),
-	(u'adi', u'', u'', u'', u'I', u'L', u'Adi', u'\r\n'),
-	(u'adj', u'', u'', u'', u'I', u'L', u'Adioukrou', u'\r\n'),
-	(u'adl', u'', u'', u'', u'I', u'L', u'Galo', u'\r\n'),
-	(u'adn', u'', u'', u'', u'I', u'L', u'Adang', u'\r\n'),
-	(u'ado', u'', u'', u'', u'I', u'L', u'Abu', u'\r\n'),
-	(u'adp', u'', u'', u'', u'I', u'L', u'Adap', u'\r\n'),
-	(u'adq', u'', u'', u'', u'I', u'L', u'Adangbe', u'\r\n'),
-	(u'adr', u'', u'', u'', u'I', u'L', u'Adonara', u'\r\n'),
-	(u'ads', u'', u'', u'', u'I', u'L', u'Adamorobe Sign Language', u'\r\n'),
-	(u'adt', u'', u'', u'', u'I', u'L', u'Adnyamathanha', u'\r\n'),
-	(u'adu', u'', u'', u'', u'I', u'L', u'Aduge', u'\r\n'),
-	(u'adw', u'', u'', u'', u'I', u'L', u'Amundava', u'\r\n'),
-	(u'adx', u'', u'', u'', u'I', u'L', u'Amdo Tibetan', u'\r\n'),
-	(u'ady', u'ady', u'ady', u'', u'I', u'L', u'Adyghe', u'\r\n'),
-	(u'adz', u'', u'', u'', u'I', u'L', u'Adzera', u'\r\n'),
-	(u'aea', u'', u'', u'', u'I', u'E', u'Areba', u'\r\n'),
-	(u'aeb', u'', u'', u'', u'I', u'L', u'Tunisian Arabic', u'\r\n'),
-	(u'aec', u'', u'', u'', u'I', u'L', u'Saidi Arabic', u'\r\n'),
-	(u'aed', u'', u'', u'', u'I', u'L', u'Argentine Sign Language', u'\r\n'),
-	(u'aee', u'', u'', u'', u'I', u'L', u'Northeast Pashayi', u'\r\n'),
-	(u'aek', u'', u'', u'', u'I', u'L', u'Haeke', u'\r\n'),
-	(u'ael', u'', u'', u'', u'I', u'L', u'Ambele', u'\r\n'),
-	(u'aem', u'', u'', u'', u'I', u'L', u'Arem', u'\r\n'),
-	(u'aen', u'', u'', u'', u'I', u'L', u'Armenian Sign Language', u'\r\n'),
-	(u'aeq', u'', u'', u'', u'I', u'L', u'Aer', u'\r\n'),
-	(u'aer', u'', u'', u'', u'I', u'L', u'Eastern Arrernte', u'\r\n'),
-	(u'aes', u'', u'', u'', u'I', u'E', u'Alsea', u'\r\n'),
-	(u'aeu', u'', u'', u'', u'I', u'L', u'Akeu', u'\r\n'),
-	(u'aew', u'', u'', u'', u'I', u'L', u'Ambakich', u'\r\n'),
-	(u'aey', u'', u'', u'', u'I', u'L', u'Amele', u'\r\n'),
-	(u'aez', u'', u'', u'', u'I', u'L', u'Aeka', u'\r\n'),
-	(u'afb', u'', u'', u'', u'I', u'L', u'Gulf Arabic', u'\r\n'),
-	(u'afd', u'', u'', u'', u'I', u'L', u'Andai', u'\r\n'),
-	(u'afe', u'', u'', u'', u'I', u'L', u'Putukwam', u'\r\n'),
-	(u'afg', u'', u'', u'', u'I', u'L', u'Afghan Sign Language', u'\r\n'),
-	(u'afh', u'afh', u'afh', u'', u'I', u'C', u'Afrihili', u'\r\n'),
-	(u'afi', u'', u'', u'', u'I', u'L', u'Akrukay', u'\r\n'),
-	(u'afk', u'', u'', u'', u'I', u'L', u'Nanubae', u'\r\n'),
-	(u'afn', u'', u'', u'', u'I', u'L', u'Defaka', u'\r\n'),
-	(u'afo', u'', u'', u'', u'I', u'L', u'Eloyi', u'\r\n'),
-	(u'afp', u'', u'', u'', u'I', u'L', u'Tapei', u'\r\n'),
-	(u'afr', u'afr', u'afr', u'af', u'I', u'L', u'Afrikaans', u'\r\n'),
-	(u'afs', u'', u'', u'', u'I', u'L', u'Afro-Seminole Creole', u'\r\n'),
-	(u'aft', u'', u'', u'', u'I', u'L', u'Afitti', u'\r\n'),
-	(u'afu', u'', u'', u'', u'I', u'L', u'Awutu', u'\r\n'),
-	(u'afz', u'', u'', u'', u'I', u'L', u'Obokuitai', u'\r\n'),
-	(u'aga', u'', u'', u'', u'I', u'E', u'Aguano', u'\r\n'),
-	(u'agb', u'', u'', u'', u'I', u'L', u'Legbo', u'\r\n'),
-	(u'agc', u'', u'', u'', u'I', u'L', u'Agatu', u'\r\n'),
-	(u'agd', u'', u'', u'', u'I', u'L', u'Agarabi', u'\r\n'),
-	(u'age', u'', u'', u'', u'I', u'L', u'Angal', u'\r\n'),
-	(u'agf', u'', u'', u'', u'I', u'L', u'Arguni', u'\r\n'),
-	(u'agg', u'', u'', u'', u'I', u'L', u'Angor', u'\r\n'),
-	(u'agh', u'', u'', u'', u'I', u'L', u'Ngelima', u'\r\n'),
-	(u'agi', u'', u'', u'', u'I', u'L', u'Agariya', u'\r\n'),
-	(u'agj', u'', u'', u'', u'I', u'L', u'Argobba', u'\r\n'),
-	(u'agk', u'', u'', u'', u'I', u'L', u'Isarog Agta', u'\r\n'),
-	(u'agl', u'', u'', u'', u'I', u'L', u'Fembe', u'\r\n'),
-	(u'agm', u'', u'', u'', u'I', u'L', u'Angaataha', u'\r\n'),
-	(u'agn', u'', u'', u'', u'I', u'L', u'Agutaynen', u'\r\n'),
-	(u'ago', u'', u'', u'', u'I', u'L', u'Tainae', u'\r\n'),
-	(u'agq', u'', u'', u'', u'I', u'L', u'Aghem', u'\r\n'),
-	(u'agr', u'', u'', u'', u'I', u'L', u'Aguaruna', u'\r\n'),
-	(u'ags', u'', u'', u'', u'I', u'L', u'Esimbi', u'\r\n'),
-	(u'agt', u'', u'', u'', u'I', u'L', u'Central Cagayan Agta', u'\r\n'),
-	(u'agu', u'', u'', u'', u'I', u'L', u'Aguacateco', u'\r\n'),
-	(u'agv', u'', u'', u'', u'I', u'L', u'Remontado Dumagat', u'\r\n'),
-	(u'agw', u'', u'', u'', u'I', u'L', u'Kahua', u'\r\n'),
-	(u'agx', u'', u'', u'', u'I', u'L', u'Aghul', u'\r\n'),
-	(u'agy', u'', u'', u'', u'I', u'L', u'Southern Alta', u'\r\n'),
-	(u'agz', u'', u'', u'', u'I', u'L', u'Mt. Iriga Agta', u'\r\n'),
-	(u'aha', u'', u'', u'', u'I', u'L', u'Ahanta', u'\r\n'),
-	(u'ahb', u'', u'', u'', u'I', u'L', u'Axamb', u'\r\n'),
-	(u'ahg', u'', u'', u'', u'I', u'L', u'Qimant', u'\r\n'),
-	(u'ahh', u'', u'', u'', u'I', u'L', u'Aghu', u'\r\n'),
-	(u'ahi', u'', u'', u'', u'I', u'L', u'Tiagbamrin Aizi', u'\r\n'),
-	(u'ahk', u'', u'', u'', u'I', u'L', u'Akha', u'\r\n'),
-	(u'ahl', u'', u'', u'', u'I', u'L', u'Igo', u'\r\n'),
-	(u'ahm', u'', u'', u'', u'I', u'L', u'Mobumrin Aizi', u'\r\n'),
-	(u'ahn', u'', u'', u'', u'I', u'L', u'\xc0h\xe0n', u'\r\n'),
-	(u'aho', u'', u'', u'', u'I', u'E', u'Ahom', u'\r\n'),
-	(u'ahp', u'', u'', u'', u'I', u'L', u'Aproumu Aizi', u'\r\n'),
-	(u'ahr', u'', u'', u'', u'I', u'L', u'Ahirani', u'\r\n'),
-	(u'ahs', u'', u'', u'', u'I', u'L', u'Ashe', u'\r\n'),
-	(u'aht', u'', u'', u'', u'I', u'L', u'Ahtena', u'\r\n'),
-	(u'aia', u'', u'', u'', u'I', u'L', u'Arosi', u'\r\n'),
-	(u'aib', u'', u'', u'', u'I', u'L', u'Ainu (China)', u'\r\n'),
-	(u'aic', u'', u'', u'', u'I', u'L', u'Ainbai', u'\r\n'),
-	(u'aid', u'', u'', u'', u'I', u'E', u'Alngith', u'\r\n'),
-	(u'aie', u'', u'', u'', u'I', u'L', u'Amara', u'\r\n'),
-	(u'aif', u'', u'', u'', u'I', u'L', u'Agi', u'\r\n'),
-	(u'aig', u'', u'', u'', u'I', u'L', u'Antigua and Barbuda Creole English', u'\r\n'),
-	(u'aih', u'', u'', u'', u'I', u'L', u'Ai-Cham', u'\r\n'),
-	(u'aii', u'', u'', u'', u'I', u'L', u'Assyrian Neo-Aramaic', u'\r\n'),
-	(u'aij', u'', u'', u'', u'I', u'L', u'Lishanid Noshan', u'\r\n'),
-	(u'aik', u'', u'', u'', u'I', u'L', u'Ake', u'\r\n'),
-	(u'ail', u'', u'', u'', u'I', u'L', u'Aimele', u'\r\n'),
-	(u'aim', u'', u'', u'', u'I', u'L', u'Aimol', u'\r\n'),
-	(u'ain', u'ain', u'ain', u'', u'I', u'L', u'Ainu (Japan)', u'\r\n'),
-	(u'aio', u'', u'', u'', u'I', u'L', u'Aiton', u'\r\n'),
-	(u'aip', u'', u'', u'', u'I', u'L', u'Burumakok', u'\r\n'),
-	(u'aiq', u'', u'', u'', u'I', u'L', u'Aimaq', u'\r\n'),
-	(u'air', u'', u'', u'', u'I', u'L', u'Airoran', u'\r\n'),
-	(u'ais', u'', u'', u'', u'I', u'L', u'Nataoran Amis', u'\r\n'),
-	(u'ait', u'', u'', u'', u'I', u'E', u'Arikem', u'\r\n'),
-	(u'aiw', u'', u'', u'', u'I', u'L', u'Aari', u'\r\n'),
-	(u'aix', u'', u'', u'', u'I', u'L', u'Aighon', u'\r\n'),
-	(u'aiy', u'', u'', u'', u'I', u'L', u'Ali', u'\r\n'),
-	(u'aja', u'', u'', u'', u'I', u'L', u'Aja (Sudan)', u'\r\n'),
-	(u'ajg', u'', u'', u'', u'I', u'L', u'Aja (Benin)', u'\r\n'),
-	(u'aji', u'', u'', u'', u'I', u'L', u'Aji\xeb', u'\r\n'),
-	(u'ajp', u'', u'', u'', u'I', u'L', u'South Levantine Arabic', u'\r\n'),
-	(u'ajt', u'', u'', u'', u'I', u'L', u'Judeo-Tunisian Arabic', u'\r\n'),
-	(u'aju', u'', u'', u'', u'I', u'L', u'Judeo-Moroccan Arabic', u'\r\n'),
-	(u'ajw', u'', u'', u'', u'I', u'E', u'Ajawa', u'\r\n'),
-	(u'ajz', u'', u'', u'', u'I', u'L', u'Amri Karbi', u'\r\n'),
-	(u'aka', u'aka', u'aka', u'ak', u'M', u'L', u'Akan', u'\r\n'),
-	(u'akb', u'', u'', u'', u'I', u'L', u'Batak Angkola', u'\r\n'),
-	(u'akc', u'', u'', u'', u'I', u'L', u'Mpur', u'\r\n'),
-	(u'akd', u'', u'', u'', u'I', u'L', u'Ukpet-Ehom', u'\r\n'),
-	(u'ake', u'', u'', u'', u'I', u'L', u'Akawaio', u'\r\n'),
-	(u'akf', u'', u'', u'', u'I', u'L', u'Akpa', u'\r\n'),
-	(u'akg', u'', u'', u'', u'I', u'L', u'Anakalangu', u'\r\n'),
-	(u'akh', u'', u'', u'', u'I', u'L', u'Angal Heneng', u'\r\n'),
-	(u'aki', u'', u'', u'', u'I', u'L', u'Aiome', u'\r\n'),
-	(u'akj', u'', u'', u'', u'I', u'E', u'Aka-Jeru', u'\r\n'),
-	(u'akk', u'akk', u'akk', u'', u'I', u'A', u'Akkadian', u'\r\n'),
-	(u'akl', u'', u'', u'', u'I', u'L', u'Aklanon', u'\r\n'),
-	(u'akm', u'', u'', u'', u'I', u'E', u'Aka-Bo', u'\r\n'),
-	(u'ako', u'', u'', u'', u'I', u'L', u'Akurio', u'\r\n'),
-	(u'akp', u'', u'', u'', u'I', u'L', u'Siwu', u'\r\n'),
-	(u'akq', u'', u'', u'', u'I', u'L', u'Ak', u'\r\n'),
-	(u'akr', u'', u'', u'', u'I', u'L', u'Araki', u'\r\n'),
-	(u'aks', u'', u'', u'', u'I', u'L', u'Akaselem', u'\r\n'),
-	(u'akt', u'', u'', u'', u'I', u'L', u'Akolet', u'\r\n'),
-	(u'aku', u'', u'', u'', u'I', u'L', u'Akum', u'\r\n'),
-	(u'akv', u'', u'', u'', u'I', u'L', u'Akhvakh', u'\r\n'),
-	(u'akw', u'', u'', u'', u'I', u'L', u'Akwa', u'\r\n'),
-	(u'akx', u'', u'', u'', u'I', u'E', u'Aka-Kede', u'\r\n'),
-	(u'aky', u'', u'', u'', u'I', u'E', u'Aka-Kol', u'\r\n'),
-	(u'akz', u'', u'', u'', u'I', u'L', u'Alabama', u'\r\n'),
-	(u'ala', u'', u'', u'', u'I', u'L', u'Alago', u'\r\n'),
-	(u'alc', u'', u'', u'', u'I', u'L', u'Qawasqar', u'\r\n'),
-	(u'ald', u'', u'', u'', u'I', u'L', u'Alladian', u'\r\n'),
-	(u'ale', u'ale', u'ale', u'', u'I', u'L', u'Aleut', u'\r\n'),
-	(u'alf', u'', u'', u'', u'I', u'L', u'Alege', u'\r\n'),
-	(u'alh', u'', u'', u'', u'I', u'L', u'Alawa', u'\r\n'),
-	(u'ali', u'', u'', u'', u'I', u'L', u'Amaimon', u'\r\n'),
-	(u'alj', u'', u'', u'', u'I', u'L', u'Alangan', u'\r\n'),
-	(u'alk', u'', u'', u'', u'I', u'L', u'Alak', u'\r\n'),
-	(u'all', u'', u'', u'', u'I', u'L', u'Allar', u'\r\n'),
-	(u'alm', u'', u'', u'', u'I', u'L', u'Amblong', u'\r\n'),
-	(u'aln', u'', u'', u'', u'I', u'L', u'Gheg Albanian', u'\r\n'),
-	(u'alo', u'', u'', u'', u'I', u'L', u'Larike-Wakasihu', u'\r\n'),
-	(u'alp', u'', u'', u'', u'I', u'L', u'Alune', u'\r\n'),
-	(u'alq', u'', u'', u'', u'I', u'L', u'Algonquin', u'\r\n'),
-	(u'alr', u'', u'', u'', u'I', u'L', u'Alutor', u'\r\n'),
-	(u'als', u'', u'', u'', u'I', u'L', u'Tosk Albanian', u'\r\n'),
-	(u'alt', u'alt', u'alt', u'', u'I', u'L', u'Southern Altai', u'\r\n'),
-	(u'alu', u'', u'', u'', u'I', u'L', u"'Are'are", u'\r\n'),
-	(u'alw', u'', u'', u'', u'I', u'L', u'Alaba-K\u2019abeena', u'\r\n'),
-	(u'alx', u'', u'', u'', u'I', u'L', u'Amol', u'\r\n'),
-	(u'aly', u'', u'', u'', u'I', u'L', u'Alyawarr', u'\r\n'),
-	(u'alz', u'', u'', u'', u'I', u'L', u'Alur', u'\r\n'),
-	(u'ama', u'', u'', u'', u'I', u'E', u'Amanay\xe9', u'\r\n'),
-	(u'amb', u'', u'', u'', u'I', u'L', u'Ambo', u'\r\n'),
-	(u'amc', u'', u'', u'', u'I', u'L', u'Amahuaca', u'\r\n'),
-	(u'ame', u'', u'', u'', u'I', u'L', u"Yanesha'", u'\r\n'),
-	(u'amf', u'', u'', u'', u'I', u'L', u'Hamer-Banna', u'\r\n'),
-	(u'amg', u'', u'', u'', u'I', u'L', u'Amarag', u'\r\n'),
-	(u'amh', u'amh', u'amh', u'am', u'I', u'L', u'Amharic', u'\r\n'),
-	(u'ami', u'', u'', u'', u'I', u'L', u'Amis', u'\r\n'),
-	(u'amj', u'', u'', u'', u'I', u'L', u'Amdang', u'\r\n'),
-	(u'amk', u'', u'', u'', u'I', u'L', u'Ambai', u'\r\n'),
-	(u'aml', u'', u'', u'', u'I', u'L', u'War-Jaintia', u'\r\n'),
-	(u'amm', u'', u'', u'', u'I', u'L', u'Ama (Papua New Guinea)', u'\r\n'),
-	(u'amn', u'', u'', u'', u'I', u'L', u'Amanab', u'\r\n'),
-	(u'amo', u'', u'', u'', u'I', u'L', u'Amo', u'\r\n'),
-	(u'amp', u'', u'', u'', u'I', u'L', u'Alamblak', u'\r\n'),
-	(u'amq', u'', u'', u'', u'I', u'L', u'Amahai', u'\r\n'),
-	(u'amr', u'', u'', u'', u'I', u'L', u'Amarakaeri', u'\r\n'),
-	(u'ams', u'', u'', u'', u'I', u'L', u'Southern Amami-Oshima', u'\r\n'),
-	(u'amt', u'', u'', u'', u'I', u'L', u'Amto', u'\r\n'),
-	(u'amu', u'', u'', u'', u'I', u'L', u'Guerrero Amuzgo', u'\r\n'),
-	(u'amv', u'', u'', u'', u'I', u'L', u'Ambelau', u'\r\n'),
-	(u'amw', u'', u'', u'', u'I', u'L', u'Western Neo-Aramaic', u'\r\n'),
-	(u'amx', u'', u'', u'', u'I', u'L', u'Anmatyerre', u'\r\n'),
-	(u'amy', u'', u'', u'', u'I', u'L', u'Ami', u'\r\n'),
-	(u'amz', u'', u'', u'', u'I', u'E', u'Atampaya', u'\r\n'),
-	(u'ana', u'', u'', u'', u'I', u'E', u'Andaqui', u'\r\n'),
-	(u'anb', u'', u'', u'', u'I', u'E', u'Andoa', u'\r\n'),
-	(u'anc', u'', u'', u'', u'I', u'L', u'Ngas', u'\r\n'),
-	(u'and', u'', u'', u'', u'I', u'L', u'Ansus', u'\r\n'),
-	(u'ane', u'', u'', u'', u'I', u'L', u'X\xe2r\xe2c\xf9\xf9', u'\r\n'),
-	(u'anf', u'', u'', u'', u'I', u'L', u'Animere', u'\r\n'),
-	(u'ang', u'ang', u'ang', u'', u'I', u'H', u'Old English (ca. 450-1100)', u'\r\n'),
-	(u'anh', u'', u'', u'', u'I', u'L', u'Nend', u'\r\n'),
-	(u'ani', u'', u'', u'', u'I', u'L', u'Andi', u'\r\n'),
-	(u'anj', u'', u'', u'', u'I', u'L', u'Anor', u'\r\n'),
-	(u'ank', u'', u'', u'', u'I', u'L', u'Goemai', u'\r\n'),
-	(u'anl', u'', u'', u'', u'I', u'L', u'Anu', u'\r\n'),
-	(u'anm', u'', u'', u'', u'I', u'L', u'Anal', u'\r\n'),
-	(u'ann', u'', u'', u'', u'I', u'L', u'Obolo', u'\r\n'),
-	(u'ano', u'', u'', u'', u'I', u'L', u'Andoque', u'\r\n'),
-	(u'anp', u'anp', u'anp', u'', u'I', u'L', u'Angika', u'\r\n'),
-	(u'anq', u'', u'', u'', u'I', u'L', u'Jarawa (India)', u'\r\n'),
-	(u'anr', u'', u'', u'', u'I', u'L', u'Andh', u'\r\n'),
-	(u'ans', u'', u'', u'', u'I', u'E', u'Anserma', u'\r\n'),
-	(u'ant', u'', u'', u'', u'I', u'L', u'Antakarinya', u'\r\n'),
-	(u'anu', u'', u'', u'', u'I', u'L', u'Anuak', u'\r\n'),
-	(u'anv', u'', u'', u'', u'I', u'L', u'Denya', u'\r\n'),
-	(u'anw', u'', u'', u'', u'I', u'L', u'Anaang', u'\r\n'),
-	(u'anx', u'', u'', u'', u'I', u'L', u'Andra-Hus', u'\r\n'),
-	(u'any', u'', u'', u'', u'I', u'L', u'Anyin', u'\r\n'),
-	(u'anz', u'', u'', u'', u'I', u'L', u'Anem', u'\r\n'),
-	(u'aoa', u'', u'', u'', u'I', u'L', u'Angolar', u'\r\n'),
-	(u'aob', u'', u'', u'', u'I', u'L', u'Abom', u'\r\n'),
-	(u'aoc', u'', u'', u'', u'I', u'L', u'Pemon', u'\r\n'),
-	(u'aod', u'', u'', u'', u'I', u'L', u'Andarum', u'\r\n'),
-	(u'aoe', u'', u'', u'', u'I', u'L', u'Angal Enen', u'\r\n'),
-	(u'aof', u'', u'', u'', u'I', u'L', u'Bragat', u'\r\n'),
-	(u'aog', u'', u'', u'', u'I', u'L', u'Angoram', u'\r\n'),
-	(u'aoh', u'', u'', u'', u'I', u'E', u'Arma', u'\r\n'),
-	(u'aoi', u'', u'', u'', u'I', u'L', u'Anindilyakwa', u'\r\n'),
-	(u'aoj', u'', u'', u'', u'I', u'L', u'Mufian', u'\r\n'),
-	(u'aok', u'', u'', u'', u'I', u'L', u'Arh\xf6', u'\r\n'),
-	(u'aol', u'', u'', u'', u'I', u'L', u'Alor', u'\r\n'),
-	(u'aom', u'', u'', u'', u'I', u'L', u'\xd6mie', u'\r\n'),
-	(u'aon', u'', u'', u'', u'I', u'L', u'Bumbita Arapesh', u'\r\n'),
-	(u'aor', u'', u'', u'', u'I', u'E', u'Aore', u'\r\n'),
-	(u'aos', u'', u'', u'', u'I', u'L', u'Taikat', u'\r\n'),
-	(u'aot', u'', u'', u'', u'I', u'L', u"A'tong", u'\r\n'),
-	(u'aox', u'', u'', u'', u'I', u'L', u'Atorada', u'\r\n'),
-	(u'aoz', u'', u'', u'', u'I', u'L', u'Uab Meto', u'\r\n'),
-	(u'apb', u'', u'', u'', u'I', u'L', u"Sa'a", u'\r\n'),
-	(u'apc', u'', u'', u'', u'I', u'L', u'North Levantine Arabic', u'\r\n'),
-	(u'apd', u'', u'', u'', u'I', u'L', u'Sudanese Arabic', u'\r\n'),
-	(u'ape', u'', u'', u'', u'I', u'L', u'Bukiyip', u'\r\n'),
-	(u'apf', u'', u'', u'', u'I', u'L', u'Pahanan Agta', u'\r\n'),
-	(u'apg', u'', u'', u'', u'I', u'L', u'Ampanang', u'\r\n'),
-	(u'aph', u'', u'', u'', u'I', u'L', u'Athpariya', u'\r\n'),
-	(u'api', u'', u'', u'', u'I', u'L', u'Apiak\xe1', u'\r\n'),
-	(u'apj', u'', u'', u'', u'I', u'L', u'Jicarilla Apache', u'\r\n'),
-	(u'apk', u'', u'', u'', u'I', u'L', u'Kiowa Apache', u'\r\n'),
-	(u'apl', u'', u'', u'', u'I', u'L', u'Lipan Apache', u'\r\n'),
-	(u'apm', u'', u'', u'', u'I', u'L', u'Mescalero-Chiricahua Apache', u'\r\n'),
-	(u'apn', u'', u'', u'', u'I', u'L', u'Apinay\xe9', u'\r\n'),
-	(u'apo', u'', u'', u'', u'I', u'L', u'Apalik', u'\r\n'),
-	(u'app', u'', u'', u'', u'I', u'L', u'Apma', u'\r\n'),
-	(u'apq', u'', u'', u'', u'I', u'L', u'A-Pucikwar', u'\r\n'),
-	(u'apr', u'', u'', u'', u'I', u'L', u'Arop-Lokep', u'\r\n'),
-	(u'aps', u'', u'', u'', u'I', u'L', u'Arop-Sissano', u'\r\n'),
-	(u'apt', u'', u'', u'', u'I', u'L', u'Apatani', u'\r\n'),
-	(u'apu', u'', u'', u'', u'I', u'L', u'Apurin\xe3', u'\r\n'),
-	(u'apv', u'', u'', u'', u'I', u'E', u'Alapmunte', u'\r\n'),
-	(u'apw', u'', u'', u'', u'I', u'L', u'Western Apache', u'\r\n'),
-	(u'apx', u'', u'', u'', u'I', u'L', u'Aputai', u'\r\n'),
-	(u'apy', u'', u'', u'', u'I', u'L', u'Apala\xed', u'\r\n'),
-	(u'apz', u'', u'', u'', u'I', u'L', u'Safeyoka', u'\r\n'),
-	(u'aqc', u'', u'', u'', u'I', u'L', u'Archi', u'\r\n'),
-	(u'aqg', u'', u'', u'', u'I', u'L', u'Arigidi', u'\r\n'),
-	(u'aqm', u'', u'', u'', u'I', u'L', u'Atohwaim', u'\r\n'),
-	(u'aqn', u'', u'', u'', u'I', u'L', u'Northern Alta', u'\r\n'),
-	(u'aqp', u'', u'', u'', u'I', u'E', u'Atakapa', u'\r\n'),
-	(u'aqr', u'', u'', u'', u'I', u'L', u'Arh\xe2', u'\r\n'),
-	(u'aqz', u'', u'', u'', u'I', u'L', u'Akuntsu', u'\r\n'),
-	(u'ara', u'ara', u'ara', u'ar', u'M', u'L', u'Arabic', u'\r\n'),
-	(u'arb', u'', u'', u'', u'I', u'L', u'Standard Arabic', u'\r\n'),
-	(u'arc', u'arc', u'arc', u'', u'I', u'A', u'Official Aramaic (700-300 BCE)', u'\r\n'),
-	(u'ard', u'', u'', u'', u'I', u'E', u'Arabana', u'\r\n'),
-	(u'are', u'', u'', u'', u'I', u'L', u'Western Arrarnta', u'\r\n'),
-	(u'arg', u'arg', u'arg', u'an', u'I', u'L', u'Aragonese', u'\r\n'),
-	(u'arh', u'', u'', u'', u'I', u'L', u'Arhuaco', u'\r\n'),
-	(u'ari', u'', u'', u'', u'I', u'L', u'Arikara', u'\r\n'),
-	(u'arj', u'', u'', u'', u'I', u'E', u'Arapaso', u'\r\n'),
-	(u'ark', u'', u'', u'', u'I', u'L', u'Arikap\xfa', u'\r\n'),
-	(u'arl', u'', u'', u'', u'I', u'L', u'Arabela', u'\r\n'),
-	(u'arn', u'arn', u'arn', u'', u'I', u'L', u'Mapudungun', u'\r\n'),
-	(u'aro', u'', u'', u'', u'I', u'L', u'Araona', u'\r\n'),
-	(u'arp', u'arp', u'arp', u'', u'I', u'L', u'Arapaho', u'\r\n'),
-	(u'arq', u'', u'', u'', u'I', u'L', u'Algerian Arabic', u'\r\n'),
-	(u'arr', u'', u'', u'', u'I', u'L', u'Karo (Brazil)', u'\r\n'),
-	(u'ars', u'', u'', u'', u'I', u'L', u'Najdi Arabic', u'\r\n'),
-	(u'aru', u'', u'', u'', u'I', u'E', u'Aru\xe1 (Amazonas State)', u'\r\n'),
-	(u'arv', u'', u'', u'', u'I', u'L', u'Arbore', u'\r\n'),
-	(u'arw', u'arw', u'arw', u'', u'I', u'L', u'Arawak', u'\r\n'),
-	(u'arx', u'', u'', u'', u'I', u'L', u'Aru\xe1 (Rodonia State)', u'\r\n'),
-	(u'ary', u'', u'', u'', u'I', u'L', u'Moroccan Arabic', u'\r\n'),
-	(u'arz', u'', u'', u'', u'I', u'L', u'Egyptian Arabic', u'\r\n'),
-	(u'asa', u'', u'', u'', u'I', u'L', u'Asu (Tanzania)', u'\r\n'),
-	(u'asb', u'', u'', u'', u'I', u'L', u'Assiniboine', u'\r\n'),
-	(u'asc', u'', u'', u'', u'I', u'L', u'Casuarina Coast Asmat', u'\r\n'),
-	(u'asd', u'', u'', u'', u'I', u'L', u'Asas', u'\r\n'),
-	(u'ase', u'', u'', u'', u'I', u'L', u'American Sign Language', u'\r\n'),
-	(u'asf', u'', u'', u'', u'I', u'L', u'Australian Sign Language', u'\r\n'),
-	(u'asg', u'', u'', u'', u'I', u'L', u'Cishingini', u'\r\n'),
-	(u'ash', u'', u'', u'', u'I', u'E', u'Abishira', u'\r\n'),
-	(u'asi', u'', u'', u'', u'I', u'L', u'Buruwai', u'\r\n'),
-	(u'asj', u'', u'', u'', u'I', u'L', u'Nsari', u'\r\n'),
-	(u'ask', u'', u'', u'', u'I', u'L', u'Ashkun', u'\r\n'),
-	(u'asl', u'', u'', u'', u'I', u'L', u'Asilulu', u'\r\n'),
-	(u'asm', u'asm', u'asm', u'as', u'I', u'L', u'Assamese', u'\r\n'),
-	(u'asn', u'', u'', u'', u'I', u'L', u'Xing\xfa Asurin\xed', u'\r\n'),
-	(u'aso', u'', u'', u'', u'I', u'L', u'Dano', u'\r\n'),
-	(u'asp', u'', u'', u'', u'I', u'L', u'Algerian Sign Language', u'\r\n'),
-	(u'asq', u'', u'', u'', u'I', u'L', u'Austrian Sign Language', u'\r\n'),
-	(u'asr', u'', u'', u'', u'I', u'L', u'Asuri', u'\r\n'),
-	(u'ass', u'', u'', u'', u'I', u'L', u'Ipulo', u'\r\n'),
-	(u'ast', u'ast', u'ast', u'', u'I', u'L', u'Asturian', u'\r\n'),
-	(u'asu', u'', u'', u'', u'I', u'L', u'Tocantins Asurini', u'\r\n'),
-	(u'asv', u'', u'', u'', u'I', u'L', u'Asoa', u'\r\n'),
-	(u'asw', u'', u'', u'', u'I', u'L', u'Australian Aborigines Sign Language', u'\r\n'),
-	(u'asx', u'', u'', u'', u'I', u'L', u'Muratayak', u'\r\n'),
-	(u'asy', u'', u'', u'', u'I', u'L', u'Yaosakor Asmat', u'\r\n'),
-	(u'asz', u'', u'', u'', u'I', u'L', u'As', u'\r\n'),
-	(u'ata', u'', u'', u'', u'I', u'L', u'Pele-Ata', u'\r\n'),
-	(u'atb', u'', u'', u'', u'I', u'L', u'Zaiwa', u'\r\n'),
-	(u'atc', u'', u'', u'', u'I', u'E', u'Atsahuaca', u'\r\n'),
-	(u'atd', u'', u'', u'', u'I', u'L', u'Ata Manobo', u'\r\n'),
-	(u'ate', u'', u'', u'', u'I', u'L', u'Atemble', u'\r\n'),
-	(u'atg', u'', u'', u'', u'I', u'L', u'Ivbie North-Okpela-Arhe', u'\r\n'),
-	(u'ati', u'', u'', u'', u'I', u'L', u'Atti\xe9', u'\r\n'),
-	(u'atj', u'', u'', u'', u'I', u'L', u'Atikamekw', u'\r\n'),
-	(u'atk', u'', u'', u'', u'I', u'L', u'Ati', u'\r\n'),
-	(u'atl', u'', u'', u'', u'I', u'L', u'Mt. Iraya Agta', u'\r\n'),
-	(u'atm', u'', u'', u'', u'I', u'L', u'Ata', u'\r\n'),
-	(u'atn', u'', u'', u'', u'I', u'L', u'Ashtiani', u'\r\n'),
-	(u'ato', u'', u'', u'', u'I', u'L', u'Atong', u'\r\n'),
-	(u'atp', u'', u'', u'', u'I', u'L', u'Pudtol Atta', u'\r\n'),
-	(u'atq', u'', u'', u'', u'I', u'L', u'Aralle-Tabulahan', u'\r\n'),
-	(u'atr', u'', u'', u'', u'I', u'L', u'Waimiri-Atroari', u'\r\n'),
-	(u'ats', u'', u'', u'', u'I', u'L', u'Gros Ventre', u'\r\n'),
-	(u'att', u'', u'', u'', u'I', u'L', u'Pamplona Atta', u'\r\n'),
-	(u'atu', u'', u'', u'', u'I', u'L', u'Reel', u'\r\n'),
-	(u'atv', u'', u'', u'', u'I', u'L', u'Northern Altai', u'\r\n'),
-	(u'atw', u'', u'', u'', u'I', u'L', u'Atsugewi', u'\r\n'),
-	(u'atx', u'', u'', u'', u'I', u'L', u'Arutani', u'\r\n'),
-	(u'aty', u'', u'', u'', u'I', u'L', u'Aneityum', u'\r\n'),
-	(u'atz', u'', u'', u'', u'I', u'L', u'Arta', u'\r\n'),
-	(u'aua', u'', u'', u'', u'I', u'L', u'Asumboa', u'\r\n'),
-	(u'aub', u'', u'', u'', u'I', u'L', u'Alugu', u'\r\n'),
-	(u'auc', u'', u'', u'', u'I', u'L', u'Waorani', u'\r\n'),
-	(u'aud', u'', u'', u'', u'I', u'L', u'Anuta', u'\r\n'),
-	(u'aue', u'', u'', u'', u'I', u'L', u"=/Kx'au//'ein", u'\r\n'),
-	(u'aug', u'', u'', u'', u'I', u'L', u'Aguna', u'\r\n'),
-	(u'auh', u'', u'', u'', u'I', u'L', u'Aushi', u'\r\n'),
-	(u'aui', u'', u'', u'', u'I', u'L', u'Anuki', u'\r\n'),
-	(u'auj', u'', u'', u'', u'I', u'L', u'Awjilah', u'\r\n'),
-	(u'auk', u'', u'', u'', u'I', u'L', u'Heyo', u'\r\n'),
-	(u'aul', u'', u'', u'', u'I', u'L', u'Aulua', u'\r\n'),
-	(u'aum', u'', u'', u'', u'I', u'L', u'Asu (Nigeria)', u'\r\n'),
-	(u'aun', u'', u'', u'', u'I', u'L', u'Molmo One', u'\r\n'),
-	(u'auo', u'', u'', u'', u'I', u'E', u'Auyokawa', u'\r\n'),
-	(u'aup', u'', u'', u'', u'I', u'L', u'Makayam', u'\r\n'),
-	(u'auq', u'', u'', u'', u'I', u'L', u'Anus', u'\r\n'),
-	(u'aur', u'', u'', u'', u'I', u'L', u'Aruek', u'\r\n'),
-	(u'aut', u'', u'', u'', u'I', u'L', u'Austral', u'\r\n'),
-	(u'auu', u'', u'', u'', u'I', u'L', u'Auye', u'\r\n'),
-	(u'auw', u'', u'', u'', u'I', u'L', u'Awyi', u'\r\n'),
-	(u'aux', u'', u'', u'', u'I', u'E', u'Aur\xe1', u'\r\n'),
-	(u'auy', u'', u'', u'', u'I', u'L', u'Awiyaana', u'\r\n'),
-	(u'auz', u'', u'', u'', u'I', u'L', u'Uzbeki Arabic', u'\r\n'),
-	(u'ava', u'ava', u'ava', u'av', u'I', u'L', u'Avaric', u'\r\n'),
-	(u'avb', u'', u'', u'', u'I', u'L', u'Avau', u'\r\n'),
-	(u'avd', u'', u'', u'', u'I', u'L', u'Alviri-Vidari', u'\r\n'),
-	(u'ave', u'ave', u'ave', u'ae', u'I', u'A', u'Avestan', u'\r\n'),
-	(u'avi', u'', u'', u'', u'I', u'L', u'Avikam', u'\r\n'),
-	(u'avk', u'', u'', u'', u'I', u'C', u'Kotava', u'\r\n'),
-	(u'avl', u'', u'', u'', u'I', u'L', u'Eastern Egyptian Bedawi Arabic', u'\r\n'),
-	(u'avn', u'', u'', u'', u'I', u'L', u'Avatime', u'\r\n'),
-	(u'avo', u'', u'', u'', u'I', u'E', u'Agavotaguerra', u'\r\n'),
-	(u'avs', u'', u'', u'', u'I', u'E', u'Aushiri', u'\r\n'),
-	(u'avt', u'', u'', u'', u'I', u'L', u'Au', u'\r\n'),
-	(u'avu', u'', u'', u'', u'I', u'L', u'Avokaya', u'\r\n'),
-	(u'avv', u'', u'', u'', u'I', u'L', u'Av\xe1-Canoeiro', u'\r\n'),
-	(u'awa', u'awa', u'awa', u'', u'I', u'L', u'Awadhi', u'\r\n'),
-	(u'awb', u'', u'', u'', u'I', u'L', u'Awa (Papua New Guinea)', u'\r\n'),
-	(u'awc', u'', u'', u'', u'I', u'L', u'Cicipu', u'\r\n'),
-	(u'awe', u'', u'', u'', u'I', u'L', u'Awet\xed', u'\r\n'),
-	(u'awh', u'', u'', u'', u'I', u'L', u'Awbono', u'\r\n'),
-	(u'awi', u'', u'', u'', u'I', u'L', u'Aekyom', u'\r\n'),
-	(u'awk', u'', u'', u'', u'I', u'E', u'Awabakal', u'\r\n'),
-	(u'awm', u'', u'', u'', u'I', u'L', u'Arawum', u'\r\n'),
-	(u'awn', u'', u'', u'', u'I', u'L', u'Awngi', u'\r\n'),
-	(u'awo', u'', u'', u'', u'I', u'L', u'Awak', u'\r\n'),
-	(u'awr', u'', u'', u'', u'I', u'L', u'Awera', u'\r\n'),
-	(u'aws', u'', u'', u'', u'I', u'L', u'South Awyu', u'\r\n'),
-	(u'awt', u'', u'', u'', u'I', u'L', u'Arawet\xe9', u'\r\n'),
-	(u'awu', u'', u'', u'', u'I', u'L', u'Central Awyu', u'\r\n'),
-	(u'awv', u'', u'', u'', u'I', u'L', u'Jair Awyu', u'\r\n'),
-	(u'aww', u'', u'', u'', u'I', u'L', u'Awun', u'\r\n'),
-	(u'awx', u'', u'', u'', u'I', u'L', u'Awara', u'\r\n'),
-	(u'awy', u'', u'', u'', u'I', u'L', u'Edera Awyu', u'\r\n'),
-	(u'axb', u'', u'', u'', u'I', u'E', u'Abipon', u'\r\n'),
-	(u'axg', u'', u'', u'', u'I', u'E', u'Mato Grosso Ar\xe1ra', u'\r\n'),
-	(u'axk', u'', u'', u'', u'I', u'L', u'Yaka (Central African Republic)', u'\r\n'),
-	(u'axm', u'', u'', u'', u'I', u'H', u'Middle Armenian', u'\r\n'),
-	(u'axx', u'', u'', u'', u'I', u'L', u'Xaragure', u'\r\n'),
-	(u'aya', u'', u'', u'', u'I', u'L', u'Awar', u'\r\n'),
-	(u'ayb', u'', u'', u'', u'I', u'L', u'Ayizo Gbe', u'\r\n'),
-	(u'ayc', u'', u'', u'', u'I', u'L', u'Southern Aymara', u'\r\n'),
-	(u'ayd', u'', u'', u'', u'I', u'E', u'Ayabadhu', u'\r\n'),
-	(u'aye', u'', u'', u'', u'I', u'L', u'Ayere', u'\r\n'),
-	(u'ayg', u'', u'', u'', u'I', u'L', u'Ginyanga', u'\r\n'),
-	(u'ayh', u'', u'', u'', u'I', u'L', u'Hadrami Arabic', u'\r\n'),
-	(u'ayi', u'', u'', u'', u'I', u'L', u'Leyigha', u'\r\n'),
-	(u'ayk', u'', u'', u'', u'I', u'L', u'Akuku', u'\r\n'),
-	(u'ayl', u'', u'', u'', u'I', u'L', u'Libyan Arabic', u'\r\n'),
-	(u'aym', u'aym', u'aym', u'ay', u'M', u'L', u'Aymara', u'\r\n'),
-	(u'ayn', u'', u'', u'', u'I', u'L', u'Sanaani Arabic', u'\r\n'),
-	(u'ayo', u'', u'', u'', u'I', u'L', u'Ayoreo', u'\r\n'),
-	(u'ayp', u'', u'', u'', u'I', u'L', u'North Mesopotamian Arabic', u'\r\n'),
-	(u'ayq', u'', u'', u'', u'I', u'L', u'Ayi (Papua New Guinea)', u'\r\n'),
-	(u'ayr', u'', u'', u'', u'I', u'L', u'Central Aymara', u'\r\n'),
-	(u'ays', u'', u'', u'', u'I', u'L', u'Sorsogon Ayta', u'\r\n'),
-	(u'ayt', u'', u'', u'', u'I', u'L', u'Magbukun Ayta', u'\r\n'),
-	(u'ayu', u'', u'', u'', u'I', u'L', u'Ayu', u'\r\n'),
-	(u'ayx', u'', u'', u'', u'I', u'L', u'Ayi (China)', u'\r\n'),
-	(u'ayy', u'', u'', u'', u'I', u'E', u'Tayabas Ayta', u'\r\n'),
-	(u'ayz', u'', u'', u'', u'I', u'L', u'Mai Brat', u'\r\n'),
-	(u'aza', u'', u'', u'', u'I', u'L', u'Azha', u'\r\n'),
-	(u'azb', u'', u'', u'', u'I', u'L', u'South Azerbaijani', u'\r\n'),
-	(u'aze', u'aze', u'aze', u'az', u'M', u'L', u'Azerbaijani', u'\r\n'),
-	(u'azg', u'', u'', u'', u'I', u'L', u'San Pedro Amuzgos Amuzgo', u'\r\n'),
-	(u'azj', u'', u'', u'', u'I', u'L', u'North Azerbaijani', u'\r\n'),
-	(u'azm', u'', u'', u'', u'I', u'L', u'Ipalapa Amuzgo', u'\r\n'),
-	(u'azo', u'', u'', u'', u'I', u'L', u'Awing', u'\r\n'),
-	(u'azt', u'', u'', u'', u'I', u'L', u'Faire Atta', u'\r\n'),
-	(u'azz', u'', u'', u'', u'I', u'L', u'Highland Puebla Nahuatl', u'\r\n'),
-	(u'baa', u'', u'', u'', u'I', u'L', u'Babatana', u'\r\n'),
-	(u'bab', u'', u'', u'', u'I', u'L', u'Bainouk-Gunyu\xf1o', u'\r\n'),
-	(u'bac', u'', u'', u'', u'I', u'L', u'Badui', u'\r\n'),
-	(u'bae', u'', u'', u'', u'I', u'E', u'Bar\xe9', u'\r\n'),
-	(u'baf', u'', u'', u'', u'I', u'L', u'Nubaca', u'\r\n'),
-	(u'bag', u'', u'', u'', u'I', u'L', u'Tuki', u'\r\n'),
-	(u'bah', u'', u'', u'', u'I', u'L', u'Bahamas Creole English', u'\r\n'),
-	(u'baj', u'', u'', u'', u'I', u'L', u'Barakai', u'\r\n'),
-	(u'bak', u'bak', u'bak', u'ba', u'I', u'L', u'Bashkir', u'\r\n'),
-	(u'bal', u'bal', u'bal', u'', u'M', u'L', u'Baluchi', u'\r\n'),
-	(u'bam', u'bam', u'bam', u'bm', u'I', u'L', u'Bambara', u'\r\n'),
-	(u'ban', u'ban', u'ban', u'', u'I', u'L', u'Balinese', u'\r\n'),
-	(u'bao', u'', u'', u'', u'I', u'L', u'Waimaha', u'\r\n'),
-	(u'bap', u'', u'', u'', u'I', u'L', u'Bantawa', u'\r\n'),
-	(u'bar', u'', u'', u'', u'I', u'L', u'Bavarian', u'\r\n'),
-	(u'bas', u'bas', u'bas', u'', u'I', u'L', u'Basa (Cameroon)', u'\r\n'),
-	(u'bau', u'', u'', u'', u'I', u'L', u'Bada (Nigeria)', u'\r\n'),
-	(u'bav', u'', u'', u'', u'I', u'L', u'Vengo', u'\r\n'),
-	(u'baw', u'', u'', u'', u'I', u'L', u'Bambili-Bambui', u'\r\n'),
-	(u'bax', u'', u'', u'', u'I', u'L', u'Bamun', u'\r\n'),
-	(u'bay', u'', u'', u'', u'I', u'L', u'Batuley', u'\r\n'),
-	(u'baz', u'', u'', u'', u'I', u'L', u'Tunen', u'\r\n'),
-	(u'bba', u'', u'', u'', u'I', u'L', u'Baatonum', u'\r\n'),
-	(u'bbb', u'', u'', u'', u'I', u'L', u'Barai', u'\r\n'),
-	(u'bbc', u'', u'', u'', u'I', u'L', u'Batak Toba', u'\r\n'),
-	(u'bbd', u'', u'', u'', u'I', u'L', u'Bau', u'\r\n'),
-	(u'bbe', u'', u'', u'', u'I', u'L', u'Bangba', u'\r\n'),
-	(u'bbf', u'', u'', u'', u'I', u'L', u'Baibai', u'\r\n'),
-	(u'bbg', u'', u'', u'', u'I', u'L', u'Barama', u'\r\n'),
-	(u'bbh', u'', u'', u'', u'I', u'L', u'Bugan', u'\r\n'),
-	(u'bbi', u'', u'', u'', u'I', u'L', u'Barombi', u'\r\n'),
-	(u'bbj', u'', u'', u'', u'I', u'L', u"Ghom\xe1l\xe1'", u'\r\n'),
-	(u'bbk', u'', u'', u'', u'I', u'L', u'Babanki', u'\r\n'),
-	(u'bbl', u'', u'', u'', u'I', u'L', u'Bats', u'\r\n'),
-	(u'bbm', u'', u'', u'', u'I', u'L', u'Babango', u'\r\n'),
-	(u'bbn', u'', u'', u'', u'I', u'L', u'Uneapa', u'\r\n'),
-	(u'bbo', u'', u'', u'', u'I', u'L', u'Northern Bobo Madar\xe9', u'\r\n'),
-	(u'bbp', u'', u'', u'', u'I', u'L', u'West Central Banda', u'\r\n'),
-	(u'bbq', u'', u'', u'', u'I', u'L', u'Bamali', u'\r\n'),
-	(u'bbr', u'', u'', u'', u'I', u'L', u'Girawa', u'\r\n'),
-	(u'bbs', u'', u'', u'', u'I', u'L', u'Bakpinka', u'\r\n'),
-	(u'bbt', u'', u'', u'', u'I', u'L', u'Mburku', u'\r\n'),
-	(u'bbu', u'', u'', u'', u'I', u'L', u'Kulung (Nigeria)', u'\r\n'),
-	(u'bbv', u'', u'', u'', u'I', u'L', u'Karnai', u'\r\n'),
-	(u'bbw', u'', u'', u'', u'I', u'L', u'Baba', u'\r\n'),
-	(u'bbx', u'', u'', u'', u'I', u'L', u'Bubia', u'\r\n'),
-	(u'bby', u'', u'', u'', u'I', u'L', u'Befang', u'\r\n'),
-	(u'bbz', u'', u'', u'', u'I', u'L', u'Babalia Creole Arabic', u'\r\n'),
-	(u'bca', u'', u'', u'', u'I', u'L', u'Central Bai', u'\r\n'),
-	(u'bcb', u'', u'', u'', u'I', u'L', u'Bainouk-Samik', u'\r\n'),
-	(u'bcc', u'', u'', u'', u'I', u'L', u'Southern Balochi', u'\r\n'),
-	(u'bcd', u'', u'', u'', u'I', u'L', u'North Babar', u'\r\n'),
-	(u'bce', u'', u'', u'', u'I', u'L', u'Bamenyam', u'\r\n'),
-	(u'bcf', u'', u'', u'', u'I', u'L', u'Bamu', u'\r\n'),
-	(u'bcg', u'', u'', u'', u'I', u'L', u'Baga Binari', u'\r\n'),
-	(u'bch', u'', u'', u'', u'I', u'L', u'Bariai', u'\r\n'),
-	(u'bci', u'', u'', u'', u'I', u'L', u'Baoul\xe9', u'\r\n'),
-	(u'bcj', u'', u'', u'', u'I', u'L', u'Bardi', u'\r\n'),
-	(u'bck', u'', u'', u'', u'I', u'L', u'Bunaba', u'\r\n'),
-	(u'bcl', u'', u'', u'', u'I', u'L', u'Central Bicolano', u'\r\n'),
-	(u'bcm', u'', u'', u'', u'I', u'L', u'Bannoni', u'\r\n'),
-	(u'bcn', u'', u'', u'', u'I', u'L', u'Bali (Nigeria)', u'\r\n'),
-	(u'bco', u'', u'', u'', u'I', u'L', u'Kaluli', u'\r\n'),
-	(u'bcp', u'', u'', u'', u'I', u'L', u'Bali (Democratic Republic of Congo)', u'\r\n'),
-	(u'bcq', u'', u'', u'', u'I', u'L', u'Bench', u'\r\n'),
-	(u'bcr', u'', u'', u'', u'I', u'L', u'Babine', u'\r\n'),
-	(u'bcs', u'', u'', u'', u'I', u'L', u'Kohumono', u'\r\n'),
-	(u'bct', u'', u'', u'', u'I', u'L', u'Bendi', u'\r\n'),
-	(u'bcu', u'', u'', u'', u'I', u'L', u'Awad Bing', u'\r\n'),
-	(u'bcv', u'', u'', u'', u'I', u'L', u'Shoo-Minda-Nye', u'\r\n'),
-	(u'bcw', u'', u'', u'', u'I', u'L', u'Bana', u'\r\n'),
-	(u'bcy', u'', u'', u'', u'I', u'L', u'Bacama', u'\r\n'),
-	(u'bcz', u'', u'', u'', u'I', u'L', u'Bainouk-Gunyaamolo', u'\r\n'),
-	(u'bda', u'', u'', u'', u'I', u'L', u'Bayot', u'\r\n'),
-	(u'bdb', u'', u'', u'', u'I', u'L', u'Basap', u'\r\n'),
-	(u'bdc', u'', u'', u'', u'I', u'L', u'Ember\xe1-Baud\xf3', u'\r\n'),
-	(u'bdd', u'', u'', u'', u'I', u'L', u'Bunama', u'\r\n'),
-	(u'bde', u'', u'', u'', u'I', u'L', u'Bade', u'\r\n'),
-	(u'bdf', u'', u'', u'', u'I', u'L', u'Biage', u'\r\n'),
-	(u'bdg', u'', u'', u'', u'I', u'L', u'Bonggi', u'\r\n'),
-	(u'bdh', u'', u'', u'', u'I', u'L', u'Baka (Sudan)', u'\r\n'),
-	(u'bdi', u'', u'', u'', u'I', u'L', u'Burun', u'\r\n'),
-	(u'bdj', u'', u'', u'', u'I', u'L', u'Bai', u'\r\n'),
-	(u'bdk', u'', u'', u'', u'I', u'L', u'Budukh', u'\r\n'),
-	(u'bdl', u'', u'', u'', u'I', u'L', u'Indonesian Bajau', u'\r\n'),
-	(u'bdm', u'', u'', u'', u'I', u'L', u'Buduma', u'\r\n'),
-	(u'bdn', u'', u'', u'', u'I', u'L', u'Baldemu', u'\r\n'),
-	(u'bdo', u'', u'', u'', u'I', u'L', u'Morom', u'\r\n'),
-	(u'bdp', u'', u'', u'', u'I', u'L', u'Bende', u'\r\n'),
-	(u'bdq', u'', u'', u'', u'I', u'L', u'Bahnar', u'\r\n'),
-	(u'bdr', u'', u'', u'', u'I', u'L', u'West Coast Bajau', u'\r\n'),
-	(u'bds', u'', u'', u'', u'I', u'L', u'Burunge', u'\r\n'),
-	(u'bdt', u'', u'', u'', u'I', u'L', u'Bokoto', u'\r\n'),
-	(u'bdu', u'', u'', u'', u'I', u'L', u'Oroko', u'\r\n'),
-	(u'bdv', u'', u'', u'', u'I', u'L', u'Bodo Parja', u'\r\n'),
-	(u'bdw', u'', u'', u'', u'I', u'L', u'Baham', u'\r\n'),
-	(u'bdx', u'', u'', u'', u'I', u'L', u'Budong-Budong', u'\r\n'),
-	(u'bdy', u'', u'', u'', u'I', u'L', u'Bandjalang', u'\r\n'),
-	(u'bdz', u'', u'', u'', u'I', u'L', u'Badeshi', u'\r\n'),
-	(u'bea', u'', u'', u'', u'I', u'L', u'Beaver', u'\r\n'),
-	(u'beb', u'', u'', u'', u'I', u'L', u'Bebele', u'\r\n'),
-	(u'bec', u'', u'', u'', u'I', u'L', u'Iceve-Maci', u'\r\n'),
-	(u'bed', u'', u'', u'', u'I', u'L', u'Bedoanas', u'\r\n'),
-	(u'bee', u'', u'', u'', u'I', u'L', u'Byangsi', u'\r\n'),
-	(u'bef', u'', u'', u'', u'I', u'L', u'Benabena', u'\r\n'),
-	(u'beg', u'', u'', u'', u'I', u'L', u'Belait', u'\r\n'),
-	(u'beh', u'', u'', u'', u'I', u'L', u'Biali', u'\r\n'),
-	(u'bei', u'', u'', u'', u'I', u'L', u"Bekati'", u'\r\n'),
-	(u'bej', u'bej', u'bej', u'', u'I', u'L', u'Beja', u'\r\n'),
-	(u'bek', u'', u'', u'', u'I', u'L', u'Bebeli', u'\r\n'),
-	(u'bel', u'bel', u'bel', u'be', u'I', u'L', u'Belarusian', u'\r\n'),
-	(u'bem', u'bem', u'bem', u'', u'I', u'L', u'Bemba (Zambia)', u'\r\n'),
-	(u'ben', u'ben', u'ben', u'bn', u'I', u'L', u'Bengali', u'\r\n'),
-	(u'beo', u'', u'', u'', u'I', u'L', u'Beami', u'\r\n'),
-	(u'bep', u'', u'', u'', u'I', u'L', u'Besoa', u'\r\n'),
-	(u'beq', u'', u'', u'', u'I', u'L', u'Beembe', u'\r\n'),
-	(u'bes', u'', u'', u'', u'I', u'L', u'Besme', u'\r\n'),
-	(u'bet', u'', u'', u'', u'I', u'L', u'Guiberoua B\xe9te', u'\r\n'),
-	(u'beu', u'', u'', u'', u'I', u'L', u'Blagar', u'\r\n'),
-	(u'bev', u'', u'', u'', u'I', u'L', u'Daloa B\xe9t\xe9', u'\r\n'),
-	(u'bew', u'', u'', u'', u'I', u'L', u'Betawi', u'\r\n'),
-	(u'bex', u'', u'', u'', u'I', u'L', u'Jur Modo', u'\r\n'),
-	(u'bey', u'', u'', u'', u'I', u'L', u'Beli (Papua New Guinea)', u'\r\n'),
-	(u'bez', u'', u'', u'', u'I', u'L', u'Bena (Tanzania)', u'\r\n'),
-	(u'bfa', u'', u'', u'', u'I', u'L', u'Bari', u'\r\n'),
-	(u'bfb', u'', u'', u'', u'I', u'L', u'Pauri Bareli', u'\r\n'),
-	(u'bfc', u'', u'', u'', u'I', u'L', u'Northern Bai', u'\r\n'),
-	(u'bfd', u'', u'', u'', u'I', u'L', u'Bafut', u'\r\n'),
-	(u'bfe', u'', u'', u'', u'I', u'L', u'Betaf', u'\r\n'),
-	(u'bff', u'', u'', u'', u'I', u'L', u'Bofi', u'\r\n'),
-	(u'bfg', u'', u'', u'', u'I', u'L', u'Busang Kayan', u'\r\n'),
-	(u'bfh', u'', u'', u'', u'I', u'L', u'Blafe', u'\r\n'),
-	(u'bfi', u'', u'', u'', u'I', u'L', u'British Sign Language', u'\r\n'),
-	(u'bfj', u'', u'', u'', u'I', u'L', u'Bafanji', u'\r\n'),
-	(u'bfk', u'', u'', u'', u'I', u'L', u'Ban Khor Sign Language', u'\r\n'),
-	(u'bfl', u'', u'', u'', u'I', u'L', u'Banda-Nd\xe9l\xe9', u'\r\n'),
-	(u'bfm', u'', u'', u'', u'I', u'L', u'Mmen', u'\r\n'),
-	(u'bfn', u'', u'', u'', u'I', u'L', u'Bunak', u'\r\n'),
-	(u'bfo', u'', u'', u'', u'I', u'L', u'Malba Birifor', u'\r\n'),
-	(u'bfp', u'', u'', u'', u'I', u'L', u'Beba', u'\r\n'),
-	(u'bfq', u'', u'', u'', u'I', u'L', u'Badaga', u'\r\n'),
-	(u'bfr', u'', u'', u'', u'I', u'L', u'Bazigar', u'\r\n'),
-	(u'bfs', u'', u'', u'', u'I', u'L', u'Southern Bai', u'\r\n'),
-	(u'bft', u'', u'', u'', u'I', u'L', u'Balti', u'\r\n'),
-	(u'bfu', u'', u'', u'', u'I', u'L', u'Gahri', u'\r\n'),
-	(u'bfw', u'', u'', u'', u'I', u'L', u'Bondo', u'\r\n'),
-	(u'bfx', u'', u'', u'', u'I', u'L', u'Bantayanon', u'\r\n'),
-	(u'bfy', u'', u'', u'', u'I', u'L', u'Bagheli', u'\r\n'),
-	(u'bfz', u'', u'', u'', u'I', u'L', u'Mahasu Pahari', u'\r\n'),
-	(u'bga', u'', u'', u'', u'I', u'L', u'Gwamhi-Wuri', u'\r\n'),
-	(u'bgb', u'', u'', u'', u'I', u'L', u'Bobongko', u'\r\n'),
-	(u'bgc', u'', u'', u'', u'I', u'L', u'Haryanvi', u'\r\n'),
-	(u'bgd', u'', u'', u'', u'I', u'L', u'Rathwi Bareli', u'\r\n'),
-	(u'bge', u'', u'', u'', u'I', u'L', u'Bauria', u'\r\n'),
-	(u'bgf', u'', u'', u'', u'I', u'L', u'Bangandu', u'\r\n'),
-	(u'bgg', u'', u'', u'', u'I', u'L', u'Bugun', u'\r\n'),
-	(u'bgi', u'', u'', u'', u'I', u'L', u'Giangan', u'\r\n'),
-	(u'bgj', u'', u'', u'', u'I', u'L', u'Bangolan', u'\r\n'),
-	(u'bgk', u'', u'', u'', u'I', u'L', u'Bit', u'\r\n'),
-	(u'bgl', u'', u'', u'', u'I', u'L', u'Bo (Laos)', u'\r\n'),
-	(u'bgm', u'', u'', u'', u'I', u'L', u'Baga Mboteni', u'\r\n'),
-	(u'bgn', u'', u'', u'', u'I', u'L', u'Western Balochi', u'\r\n'),
-	(u'bgo', u'', u'', u'', u'I', u'L', u'Baga Koga', u'\r\n'),
-	(u'bgp', u'', u'', u'', u'I', u'L', u'Eastern Balochi', u'\r\n'),
-	(u'bgq', u'', u'', u'', u'I', u'L', u'Bagri', u'\r\n'),
-	(u'bgr', u'', u'', u'', u'I', u'L', u'Bawm Chin', u'\r\n'),
-	(u'bgs', u'', u'', u'', u'I', u'L', u'Tagabawa', u'\r\n'),
-	(u'bgt', u'', u'', u'', u'I', u'L', u'Bughotu', u'\r\n'),
-	(u'bgu', u'', u'', u'', u'I', u'L', u'Mbongno', u'\r\n'),
-	(u'bgv', u'', u'', u'', u'I', u'L', u'Warkay-Bipim', u'\r\n'),
-	(u'bgw', u'', u'', u'', u'I', u'L', u'Bhatri', u'\r\n'),
-	(u'bgx', u'', u'', u'', u'I', u'L', u'Balkan Gagauz Turkish', u'\r\n'),
-	(u'bgy', u'', u'', u'', u'I', u'L', u'Benggoi', u'\r\n'),
-	(u'bgz', u'', u'', u'', u'I', u'L', u'Banggai', u'\r\n'),
-	(u'bha', u'', u'', u'', u'I', u'L', u'Bharia', u'\r\n'),
-	(u'bhb', u'', u'', u'', u'I', u'L', u'Bhili', u'\r\n'),
-	(u'bhc', u'', u'', u'', u'I', u'L', u'Biga', u'\r\n'),
-	(u'bhd', u'', u'', u'', u'I', u'L', u'Bhadrawahi', u'\r\n'),
-	(u'bhe', u'', u'', u'', u'I', u'L', u'Bhaya', u'\r\n'),
-	(u'bhf', u'', u'', u'', u'I', u'L', u'Odiai', u'\r\n'),
-	(u'bhg', u'', u'', u'', u'I', u'L', u'Binandere', u'\r\n'),
-	(u'bhh', u'', u'', u'', u'I', u'L', u'Bukharic', u'\r\n'),
-	(u'bhi', u'', u'', u'', u'I', u'L', u'Bhilali', u'\r\n'),
-	(u'bhj', u'', u'', u'', u'I', u'L', u'Bahing', u'\r\n'),
-	(u'bhl', u'', u'', u'', u'I', u'L', u'Bimin', u'\r\n'),
-	(u'bhm', u'', u'', u'', u'I', u'L', u'Bathari', u'\r\n'),
-	(u'bhn', u'', u'', u'', u'I', u'L', u'Bohtan Neo-Aramaic', u'\r\n'),
-	(u'bho', u'bho', u'bho', u'', u'I', u'L', u'Bhojpuri', u'\r\n'),
-	(u'bhp', u'', u'', u'', u'I', u'L', u'Bima', u'\r\n'),
-	(u'bhq', u'', u'', u'', u'I', u'L', u'Tukang Besi South', u'\r\n'),
-	(u'bhr', u'', u'', u'', u'I', u'L', u'Bara Malagasy', u'\r\n'),
-	(u'bhs', u'', u'', u'', u'I', u'L', u'Buwal', u'\r\n'),
-	(u'bht', u'', u'', u'', u'I', u'L', u'Bhattiyali', u'\r\n'),
-	(u'bhu', u'', u'', u'', u'I', u'L', u'Bhunjia', u'\r\n'),
-	(u'bhv', u'', u'', u'', u'I', u'L', u'Bahau', u'\r\n'),
-	(u'bhw', u'', u'', u'', u'I', u'L', u'Biak', u'\r\n'),
-	(u'bhx', u'', u'', u'', u'I', u'L', u'Bhalay', u'\r\n'),
-	(u'bhy', u'', u'', u'', u'I', u'L', u'Bhele', u'\r\n'),
-	(u'bhz', u'', u'', u'', u'I', u'L', u'Bada (Indonesia)', u'\r\n'),
-	(u'bia', u'', u'', u'', u'I', u'L', u'Badimaya', u'\r\n'),
-	(u'bib', u'', u'', u'', u'I', u'L', u'Bissa', u'\r\n'),
-	(u'bic', u'', u'', u'', u'I', u'L', u'Bikaru', u'\r\n'),
-	(u'bid', u'', u'', u'', u'I', u'L', u'Bidiyo', u'\r\n'),
-	(u'bie', u'', u'', u'', u'I', u'L', u'Bepour', u'\r\n'),
-	(u'bif', u'', u'', u'', u'I', u'L', u'Biafada', u'\r\n'),
-	(u'big', u'', u'', u'', u'I', u'L', u'Biangai', u'\r\n'),
-	(u'bij', u'', u'', u'', u'I', u'L', u'Vaghat-Ya-Bijim-Legeri', u'\r\n'),
-	(u'bik', u'bik', u'bik', u'', u'M', u'L', u'Bikol', u'\r\n'),
-	(u'bil', u'', u'', u'', u'I', u'L', u'Bile', u'\r\n'),
-	(u'bim', u'', u'', u'', u'I', u'L', u'Bimoba', u'\r\n'),
-	(u'bin', u'bin', u'bin', u'', u'I', u'L', u'Bini', u'\r\n'),
-	(u'bio', u'', u'', u'', u'I', u'L', u'Nai', u'\r\n'),
-	(u'bip', u'', u'', u'', u'I', u'L', u'Bila', u'\r\n'),
-	(u'biq', u'', u'', u'', u'I', u'L', u'Bipi', u'\r\n'),
-	(u'bir', u'', u'', u'', u'I', u'L', u'Bisorio', u'\r\n'),
-	(u'bis', u'bis', u'bis', u'bi', u'I', u'L', u'Bislama', u'\r\n'),
-	(u'bit', u'', u'', u'', u'I', u'L', u'Berinomo', u'\r\n'),
-	(u'biu', u'', u'', u'', u'I', u'L', u'Biete', u'\r\n'),
-	(u'biv', u'', u'', u'', u'I', u'L', u'Southern Birifor', u'\r\n'),
-	(u'biw', u'', u'', u'', u'I', u'L', u'Kol (Cameroon)', u'\r\n'),
-	(u'bix', u'', u'', u'', u'I', u'L', u'Bijori', u'\r\n'),
-	(u'biy', u'', u'', u'', u'I', u'L', u'Birhor', u'\r\n'),
-	(u'biz', u'', u'', u'', u'I', u'L', u'Baloi', u'\r\n'),
-	(u'bja', u'', u'', u'', u'I', u'L', u'Budza', u'\r\n'),
-	(u'bjb', u'', u'', u'', u'I', u'E', u'Banggarla', u'\r\n'),
-	(u'bjc', u'', u'', u'', u'I', u'L', u'Bariji', u'\r\n'),
-	(u'bjd', u'', u'', u'', u'I', u'L', u'Bandjigali', u'\r\n'),
-	(u'bje', u'', u'', u'', u'I', u'L', u'Biao-Jiao Mien', u'\r\n'),
-	(u'bjf', u'', u'', u'', u'I', u'L', u'Barzani Jewish Neo-Aramaic', u'\r\n'),
-	(u'bjg', u'', u'', u'', u'I', u'L', u'Bidyogo', u'\r\n'),
-	(u'bjh', u'', u'', u'', u'I', u'L', u'Bahinemo', u'\r\n'),
-	(u'bji', u'', u'', u'', u'I', u'L', u'Burji', u'\r\n'),
-	(u'bjj', u'', u'', u'', u'I', u'L', u'Kanauji', u'\r\n'),
-	(u'bjk', u'', u'', u'', u'I', u'L', u'Barok', u'\r\n'),
-	(u'bjl', u'', u'', u'', u'I', u'L', u'Bulu (Papua New Guinea)', u'\r\n'),
-	(u'bjm', u'', u'', u'', u'I', u'L', u'Bajelani', u'\r\n'),
-	(u'bjn', u'', u'', u'', u'I', u'L', u'Banjar', u'\r\n'),
-	(u'bjo', u'', u'', u'', u'I', u'L', u'Mid-Southern Banda', u'\r\n'),
-	(u'bjq', u'', u'', u'', u'I', u'L', u'Southern Betsimisaraka Malagasy', u'\r\n'),
-	(u'bjr', u'', u'', u'', u'I', u'L', u'Binumarien', u'\r\n'),
-	(u'bjs', u'', u'', u'', u'I', u'L', u'Bajan', u'\r\n'),
-	(u'bjt', u'', u'', u'', u'I', u'L', u'Balanta-Ganja', u'\r\n'),
-	(u'bju', u'', u'', u'', u'I', u'L', u'Busuu', u'\r\n'),
-	(u'bjv', u'', u'', u'', u'I', u'L', u'Bedjond', u'\r\n'),
-	(u'bjw', u'', u'', u'', u'I', u'L', u'Bakw\xe9', u'\r\n'),
-	(u'bjx', u'', u'', u'', u'I', u'L', u'Banao Itneg', u'\r\n'),
-	(u'bjy', u'', u'', u'', u'I', u'E', u'Bayali', u'\r\n'),
-	(u'bjz', u'', u'', u'', u'I', u'L', u'Baruga', u'\r\n'),
-	(u'bka', u'', u'', u'', u'I', u'L', u'Kyak', u'\r\n'),
-	(u'bkc', u'', u'', u'', u'I', u'L', u'Baka (Cameroon)', u'\r\n'),
-	(u'bkd', u'', u'', u'', u'I', u'L', u'Binukid', u'\r\n'),
-	(u'bkf', u'', u'', u'', u'I', u'L', u'Beeke', u'\r\n'),
-	(u'bkg', u'', u'', u'', u'I', u'L', u'Buraka', u'\r\n'),
-	(u'bkh', u'', u'', u'', u'I', u'L', u'Bakoko', u'\r\n'),
-	(u'bki', u'', u'', u'', u'I', u'L', u'Baki', u'\r\n'),
-	(u'bkj', u'', u'', u'', u'I', u'L', u'Pande', u'\r\n'),
-	(u'bkk', u'', u'', u'', u'I', u'L', u'Brokskat', u'\r\n'),
-	(u'bkl', u'', u'', u'', u'I', u'L', u'Berik', u'\r\n'),
-	(u'bkm', u'', u'', u'', u'I', u'L', u'Kom (Cameroon)', u'\r\n'),
-	(u'bkn', u'', u'', u'', u'I', u'L', u'Bukitan', u'\r\n'),
-	(u'bko', u'', u'', u'', u'I', u'L', u"Kwa'", u'\r\n'),
-	(u'bkp', u'', u'', u'', u'I', u'L', u'Boko (Democratic Republic of Congo)', u'\r\n'),
-	(u'bkq', u'', u'', u'', u'I', u'L', u'Bakair\xed', u'\r\n'),
-	(u'bkr', u'', u'', u'', u'I', u'L', u'Bakumpai', u'\r\n'),
-	(u'bks', u'', u'', u'', u'I', u'L', u'Northern Sorsoganon', u'\r\n'),
-	(u'bkt', u'', u'', u'', u'I', u'L', u'Boloki', u'\r\n'),
-	(u'bku', u'', u'', u'', u'I', u'L', u'Buhid', u'\r\n'),
-	(u'bkv', u'', u'', u'', u'I', u'L', u'Bekwarra', u'\r\n'),
-	(u'bkw', u'', u'', u'', u'I', u'L', u'Bekwil', u'\r\n'),
-	(u'bkx', u'', u'', u'', u'I', u'L', u'Baikeno', u'\r\n'),
-	(u'bky', u'', u'', u'', u'I', u'L', u'Bokyi', u'\r\n'),
-	(u'bkz', u'', u'', u'', u'I', u'L', u'Bungku', u'\r\n'),
-	(u'bla', u'bla', u'bla', u'', u'I', u'L', u'Siksika', u'\r\n'),
-	(u'blb', u'', u'', u'', u'I', u'L', u'Bilua', u'\r\n'),
-	(u'blc', u'', u'', u'', u'I', u'L', u'Bella Coola', u'\r\n'),
-	(u'bld', u'', u'', u'', u'I', u'L', u'Bolango', u'\r\n'),
-	(u'ble', u'', u'', u'', u'I', u'L', u'Balanta-Kentohe', u'\r\n'),
-	(u'blf', u'', u'', u'', u'I', u'L', u'Buol', u'\r\n'),
-	(u'blg', u'', u'', u'', u'I', u'L', u'Balau', u'\r\n'),
-	(u'blh', u'', u'', u'', u'I', u'L', u'Kuwaa', u'\r\n'),
-	(u'bli', u'', u'', u'', u'I', u'L', u'Bolia', u'\r\n'),
-	(u'blj', u'', u'', u'', u'I', u'L', u'Bolongan', u'\r\n'),
-	(u'blk', u'', u'', u'', u'I', u'L', u"Pa'o Karen", u'\r\n'),
-	(u'bll', u'', u'', u'', u'I', u'E', u'Biloxi', u'\r\n'),
-	(u'blm', u'', u'', u'', u'I', u'L', u'Beli (Sudan)', u'\r\n'),
-	(u'bln', u'', u'', u'', u'I', u'L', u'Southern Catanduanes Bicolano', u'\r\n'),
-	(u'blo', u'', u'', u'', u'I', u'L', u'Anii', u'\r\n'),
-	(u'blp', u'', u'', u'', u'I', u'L', u'Blablanga', u'\r\n'),
-	(u'blq', u'', u'', u'', u'I', u'L', u'Baluan-Pam', u'\r\n'),
-	(u'blr', u'', u'', u'', u'I', u'L', u'Blang', u'\r\n'),
-	(u'bls', u'', u'', u'', u'I', u'L', u'Balaesang', u'\r\n'),
-	(u'blt', u'', u'', u'', u'I', u'L', u'Tai Dam', u'\r\n'),
-	(u'blv', u'', u'', u'', u'I', u'L', u'Bolo', u'\r\n'),
-	(u'blw', u'', u'', u'', u'I', u'L', u'Balangao', u'\r\n'),
-	(u'blx', u'', u'', u'', u'I', u'L', u'Mag-Indi Ayta', u'\r\n'),
-	(u'bly', u'', u'', u'', u'I', u'L', u'Notre', u'\r\n'),
-	(u'blz', u'', u'', u'', u'I', u'L', u'Balantak', u'\r\n'),
-	(u'bma', u'', u'', u'', u'I', u'L', u'Lame', u'\r\n'),
-	(u'bmb', u'', u'', u'', u'I', u'L', u'Bembe', u'\r\n'),
-	(u'bmc', u'', u'', u'', u'I', u'L', u'Biem', u'\r\n'),
-	(u'bmd', u'', u'', u'', u'I', u'L', u'Baga Manduri', u'\r\n'),
-	(u'bme', u'', u'', u'', u'I', u'L', u'Limassa', u'\r\n'),
-	(u'bmf', u'', u'', u'', u'I', u'L', u'Bom', u'\r\n'),
-	(u'bmg', u'', u'', u'', u'I', u'L', u'Bamwe', u'\r\n'),
-	(u'bmh', u'', u'', u'', u'I', u'L', u'Kein', u'\r\n'),
-	(u'bmi', u'', u'', u'', u'I', u'L', u'Bagirmi', u'\r\n'),
-	(u'bmj', u'', u'', u'', u'I', u'L', u'Bote-Majhi', u'\r\n'),
-	(u'bmk', u'', u'', u'', u'I', u'L', u'Ghayavi', u'\r\n'),
-	(u'bml', u'', u'', u'', u'I', u'L', u'Bomboli', u'\r\n'),
-	(u'bmm', u'', u'', u'', u'I', u'L', u'Northern Betsimisaraka Malagasy', u'\r\n'),
-	(u'bmn', u'', u'', u'', u'I', u'E', u'Bina (Papua New Guinea)', u'\r\n'),
-	(u'bmo', u'', u'', u'', u'I', u'L', u'Bambalang', u'\r\n'),
-	(u'bmp', u'', u'', u'', u'I', u'L', u'Bulgebi', u'\r\n'),
-	(u'bmq', u'', u'', u'', u'I', u'L', u'Bomu', u'\r\n'),
-	(u'bmr', u'', u'', u'', u'I', u'L', u'Muinane', u'\r\n'),
-	(u'bms', u'', u'', u'', u'I', u'L', u'Bilma Kanuri', u'\r\n'),
-	(u'bmt', u'', u'', u'', u'I', u'L', u'Biao Mon', u'\r\n'),
-	(u'bmu', u'', u'', u'', u'I', u'L', u'Burum-Mindik', u'\r\n'),
-	(u'bmv', u'', u'', u'', u'I', u'L', u'Bum', u'\r\n'),
-	(u'bmw', u'', u'', u'', u'I', u'L', u'Bomwali', u'\r\n'),
-	(u'bmx', u'', u'', u'', u'I', u'L', u'Baimak', u'\r\n'),
-	(u'bmy', u'', u'', u'', u'I', u'L', u'Bemba (Democratic Republic of Congo)', u'\r\n'),
-	(u'bmz', u'', u'', u'', u'I', u'L', u'Baramu', u'\r\n'),
-	(u'bna', u'', u'', u'', u'I', u'L', u'Bonerate', u'\r\n'),
-	(u'bnb', u'', u'', u'', u'I', u'L', u'Bookan', u'\r\n'),
-	(u'bnc', u'', u'', u'', u'M', u'L', u'Bontok', u'\r\n'),
-	(u'bnd', u'', u'', u'', u'I', u'L', u'Banda (Indonesia)', u'\r\n'),
-	(u'bne', u'', u'', u'', u'I', u'L', u'Bintauna', u'\r\n'),
-	(u'bnf', u'', u'', u'', u'I', u'L', u'Masiwang', u'\r\n'),
-	(u'bng', u'', u'', u'', u'I', u'L', u'Benga', u'\r\n'),
-	(u'bni', u'', u'', u'', u'I', u'L', u'Bangi', u'\r\n'),
-	(u'bnj', u'', u'', u'', u'I', u'L', u'Eastern Tawbuid', u'\r\n'),
-	(u'bnk', u'', u'', u'', u'I', u'L', u'Bierebo', u'\r\n'),
-	(u'bnl', u'', u'', u'', u'I', u'L', u'Boon', u'\r\n'),
-	(u'bnm', u'', u'', u'', u'I', u'L', u'Batanga', u'\r\n'),
-	(u'bnn', u'', u'', u'', u'I', u'L', u'Bunun', u'\r\n'),
-	(u'bno', u'', u'', u'', u'I', u'L', u'Bantoanon', u'\r\n'),
-	(u'bnp', u'', u'', u'', u'I', u'L', u'Bola', u'\r\n'),
-	(u'bnq', u'', u'', u'', u'I', u'L', u'Bantik', u'\r\n'),
-	(u'bnr', u'', u'', u'', u'I', u'L', u'Butmas-Tur', u'\r\n'),
-	(u'bns', u'', u'', u'', u'I', u'L', u'Bundeli', u'\r\n'),
-	(u'bnu', u'', u'', u'', u'I', u'L', u'Bentong', u'\r\n'),
-	(u'bnv', u'', u'', u'', u'I', u'L', u'Bonerif', u'\r\n'),
-	(u'bnw', u'', u'', u'', u'I', u'L', u'Bisis', u'\r\n'),
-	(u'bnx', u'', u'', u'', u'I', u'L', u'Bangubangu', u'\r\n'),
-	(u'bny', u'', u'', u'', u'I', u'L', u'Bintulu', u'\r\n'),
-	(u'bnz', u'', u'', u'', u'I', u'L', u'Beezen', u'\r\n'),
-	(u'boa', u'', u'', u'', u'I', u'L', u'Bora', u'\r\n'),
-	(u'bob', u'', u'', u'', u'I', u'L', u'Aweer', u'\r\n'),
-	(u'bod', u'tib', u'bod', u'bo', u'I', u'L', u'Tibetan', u'\r\n'),
-	(u'boe', u'', u'', u'', u'I', u'L', u'Mundabli', u'\r\n'),
-	(u'bof', u'', u'', u'', u'I', u'L', u'Bolon', u'\r\n'),
-	(u'bog', u'', u'', u'', u'I', u'L', u'Bamako Sign Language', u'\r\n'),
-	(u'boh', u'', u'', u'', u'I', u'L', u'Boma', u'\r\n'),
-	(u'boi', u'', u'', u'', u'I', u'E', u'Barbare\xf1o', u'\r\n'),
-	(u'boj', u'', u'', u'', u'I', u'L', u'Anjam', u'\r\n'),
-	(u'bok', u'', u'', u'', u'I', u'L', u'Bonjo', u'\r\n'),
-	(u'bol', u'', u'', u'', u'I', u'L', u'Bole', u'\r\n'),
-	(u'bom', u'', u'', u'', u'I', u'L', u'Berom', u'\r\n'),
-	(u'bon', u'', u'', u'', u'I', u'L', u'Bine', u'\r\n'),
-	(u'boo', u'', u'', u'', u'I', u'L', u'Tiemac\xe8w\xe8 Bozo', u'\r\n'),
-	(u'bop', u'', u'', u'', u'I', u'L', u'Bonkiman', u'\r\n'),
-	(u'boq', u'', u'', u'', u'I', u'L', u'Bogaya', u'\r\n'),
-	(u'bor', u'', u'', u'', u'I', u'L', u'Bor\xf4ro', u'\r\n'),
-	(u'bos', u'bos', u'bos', u'bs', u'I', u'L', u'Bosnian', u'\r\n'),
-	(u'bot', u'', u'', u'', u'I', u'L', u'Bongo', u'\r\n'),
-	(u'bou', u'', u'', u'', u'I', u'L', u'Bondei', u'\r\n'),
-	(u'bov', u'', u'', u'', u'I', u'L', u'Tuwuli', u'\r\n'),
-	(u'bow', u'', u'', u'', u'I', u'E', u'Rema', u'\r\n'),
-	(u'box', u'', u'', u'', u'I', u'L', u'Buamu', u'\r\n'),
-	(u'boy', u'', u'', u'', u'I', u'L', u'Bodo (Central African Republic)', u'\r\n'),
-	(u'boz', u'', u'', u'', u'I', u'L', u'Ti\xe9yaxo Bozo', u'\r\n'),
-	(u'bpa', u'', u'', u'', u'I', u'L', u'Dakaka', u'\r\n'),
-	(u'bpb', u'', u'', u'', u'I', u'E', u'Barbacoas', u'\r\n'),
-	(u'bpd', u'', u'', u'', u'I', u'L', u'Banda-Banda', u'\r\n'),
-	(u'bpg', u'', u'', u'', u'I', u'L', u'Bonggo', u'\r\n'),
-	(u'bph', u'', u'', u'', u'I', u'L', u'Botlikh', u'\r\n'),
-	(u'bpi', u'', u'', u'', u'I', u'L', u'Bagupi', u'\r\n'),
-	(u'bpj', u'', u'', u'', u'I', u'L', u'Binji', u'\r\n'),
-	(u'bpk', u'', u'', u'', u'I', u'L', u'Orowe', u'\r\n'),
-	(u'bpl', u'', u'', u'', u'I', u'L', u'Broome Pearling Lugger Pidgin', u'\r\n'),
-	(u'bpm', u'', u'', u'', u'I', u'L', u'Biyom', u'\r\n'),
-	(u'bpn', u'', u'', u'', u'I', u'L', u'Dzao Min', u'\r\n'),
-	(u'bpo', u'', u'', u'', u'I', u'L', u'Anasi', u'\r\n'),
-	(u'bpp', u'', u'', u'', u'I', u'L', u'Kaure', u'\r\n'),
-	(u'bpq', u'', u'', u'', u'I', u'L', u'Banda Malay', u'\r\n'),
-	(u'bpr', u'', u'', u'', u'I', u'L', u'Koronadal Blaan', u'\r\n'),
-	(u'bps', u'', u'', u'', u'I', u'L', u'Sarangani Blaan', u'\r\n'),
-	(u'bpt', u'', u'', u'', u'I', u'E', u'Barrow Point', u'\r\n'),
-	(u'bpu', u'', u'', u'', u'I', u'L', u'Bongu', u'\r\n'),
-	(u'bpv', u'', u'', u'', u'I', u'L', u'Bian Marind', u'\r\n'),
-	(u'bpw', u'', u'', u'', u'I', u'L', u'Bo (Papua New Guinea)', u'\r\n'),
-	(u'bpx', u'', u'', u'', u'I', u'L', u'Palya Bareli', u'\r\n'),
-	(u'bpy', u'', u'', u'', u'I', u'L', u'Bishnupriya', u'\r\n'),
-	(u'bpz', u'', u'', u'', u'I', u'L', u'Bilba', u'\r\n'),
-	(u'bqa', u'', u'', u'', u'I', u'L', u'Tchumbuli', u'\r\n'),
-	(u'bqb', u'', u'', u'', u'I', u'L', u'Bagusa', u'\r\n'),
-	(u'bqc', u'', u'', u'', u'I', u'L', u'Boko (Benin)', u'\r\n'),
-	(u'bqd', u'', u'', u'', u'I', u'L', u'Bung', u'\r\n'),
-	(u'bqf', u'', u'', u'', u'I', u'E', u'Baga Kaloum', u'\r\n'),
-	(u'bqg', u'', u'', u'', u'I', u'L', u'Bago-Kusuntu', u'\r\n'),
-	(u'bqh', u'', u'', u'', u'I', u'L', u'Baima', u'\r\n'),
-	(u'bqi', u'', u'', u'', u'I', u'L', u'Bakhtiari', u'\r\n'),
-	(u'bqj', u'', u'', u'', u'I', u'L', u'Bandial', u'\r\n'),
-	(u'bqk', u'', u'', u'', u'I', u'L', u'Banda-Mbr\xe8s', u'\r\n'),
-	(u'bql', u'', u'', u'', u'I', u'L', u'Bilakura', u'\r\n'),
-	(u'bqm', u'', u'', u'', u'I', u'L', u'Wumboko', u'\r\n'),
-	(u'bqn', u'', u'', u'', u'I', u'L', u'Bulgarian Sign Language', u'\r\n'),
-	(u'bqo', u'', u'', u'', u'I', u'L', u'Balo', u'\r\n'),
-	(u'bqp', u'', u'', u'', u'I', u'L', u'Busa', u'\r\n'),
-	(u'bqq', u'', u'', u'', u'I', u'L', u'Biritai', u'\r\n'),
-	(u'bqr', u'', u'', u'', u'I', u'L', u'Burusu', u'\r\n'),
-	(u'bqs', u'', u'', u'', u'I', u'L', u'Bosngun', u'\r\n'),
-	(u'bqt', u'', u'', u'', u'I', u'L', u'Bamukumbit', u'\r\n'),
-	(u'bqu', u'', u'', u'', u'I', u'L', u'Boguru', u'\r\n'),
-	(u'bqv', u'', u'', u'', u'I', u'L', u'Begbere-Ejar', u'\r\n'),
-	(u'bqw', u'', u'', u'', u'I', u'L', u'Buru (Nigeria)', u'\r\n'),
-	(u'bqx', u'', u'', u'', u'I', u'L', u'Baangi', u'\r\n'),
-	(u'bqy', u'', u'', u'', u'I', u'L', u'Bengkala Sign Language', u'\r\n'),
-	(u'bqz', u'', u'', u'', u'I', u'L', u'Bakaka', u'\r\n'),
-	(u'bra', u'bra', u'bra', u'', u'I', u'L', u'Braj', u'\r\n'),
-	(u'brb', u'', u'', u'', u'I', u'L', u'Lave', u'\r\n'),
-	(u'brc', u'', u'', u'', u'I', u'E', u'Berbice Creole Dutch', u'\r\n'),
-	(u'brd', u'', u'', u'', u'I', u'L', u'Baraamu', u'\r\n'),
-	(u'bre', u'bre', u'bre', u'br', u'I', u'L', u'Breton', u'\r\n'),
-	(u'brf', u'', u'', u'', u'I', u'L', u'Bera', u'\r\n'),
-	(u'brg', u'', u'', u'', u'I', u'L', u'Baure', u'\r\n'),
-	(u'brh', u'', u'', u'', u'I', u'L', u'Brahui', u'\r\n'),
-	(u'bri', u'', u'', u'', u'I', u'L', u'Mokpwe', u'\r\n'),
-	(u'brj', u'', u'', u'', u'I', u'L', u'Bieria', u'\r\n'),
-	(u'brk', u'', u'', u'', u'I', u'E', u'Birked', u'\r\n'),
-	(u'brl', u'', u'', u'', u'I', u'L', u'Birwa', u'\r\n'),
-	(u'brm', u'', u'', u'', u'I', u'L', u'Barambu', u'\r\n'),
-	(u'brn', u'', u'', u'', u'I', u'L', u'Boruca', u'\r\n'),
-	(u'bro', u'', u'', u'', u'I', u'L', u'Brokkat', u'\r\n'),
-	(u'brp', u'', u'', u'', u'I', u'L', u'Barapasi', u'\r\n'),
-	(u'brq', u'', u'', u'', u'I', u'L', u'Breri', u'\r\n'),
-	(u'brr', u'', u'', u'', u'I', u'L', u'Birao', u'\r\n'),
-	(u'brs', u'', u'', u'', u'I', u'L', u'Baras', u'\r\n'),
-	(u'brt', u'', u'', u'', u'I', u'L', u'Bitare', u'\r\n'),
-	(u'bru', u'', u'', u'', u'I', u'L', u'Eastern Bru', u'\r\n'),
-	(u'brv', u'', u'', u'', u'I', u'L', u'Western Bru', u'\r\n'),
-	(u'brw', u'', u'', u'', u'I', u'L', u'Bellari', u'\r\n'),
-	(u'brx', u'', u'', u'', u'I', u'L', u'Bodo (India)', u'\r\n'),
-	(u'bry', u'', u'', u'', u'I', u'L', u'Burui', u'\r\n'),
-	(u'brz', u'', u'', u'', u'I', u'L', u'Bilbil', u'\r\n'),
-	(u'bsa', u'', u'', u'', u'I', u'L', u'Abinomn', u'\r\n'),
-	(u'bsb', u'', u'', u'', u'I', u'L', u'Brunei Bisaya', u'\r\n'),
-	(u'bsc', u'', u'', u'', u'I', u'L', u'Bassari', u'\r\n'),
-	(u'bse', u'', u'', u'', u'I', u'L', u'Wushi', u'\r\n'),
-	(u'bsf', u'', u'', u'', u'I', u'L', u'Bauchi', u'\r\n'),
-	(u'bsg', u'', u'', u'', u'I', u'L', u'Bashkardi', u'\r\n'),
-	(u'bsh', u'', u'', u'', u'I', u'L', u'Kati', u'\r\n'),
-	(u'bsi', u'', u'', u'', u'I', u'L', u'Bassossi', u'\r\n'),
-	(u'bsj', u'', u'', u'', u'I', u'L', u'Bangwinji', u'\r\n'),
-	(u'bsk', u'', u'', u'', u'I', u'L', u'Burushaski', u'\r\n'),
-	(u'bsl', u'', u'', u'', u'I', u'E', u'Basa-Gumna', u'\r\n'),
-	(u'bsm', u'', u'', u'', u'I', u'L', u'Busami', u'\r\n'),
-	(u'bsn', u'', u'', u'', u'I', u'L', u'Barasana-Eduria', u'\r\n'),
-	(u'bso', u'', u'', u'', u'I', u'L', u'Buso', u'\r\n'),
-	(u'bsp', u'', u'', u'', u'I', u'L', u'Baga Sitemu', u'\r\n'),
-	(u'bsq', u'', u'', u'', u'I', u'L', u'Bassa', u'\r\n'),
-	(u'bsr', u'', u'', u'', u'I', u'L', u'Bassa-Kontagora', u'\r\n'),
-	(u'bss', u'', u'', u'', u'I', u'L', u'Akoose', u'\r\n'),
-	(u'bst', u'', u'', u'', u'I', u'L', u'Basketo', u'\r\n'),
-	(u'bsu', u'', u'', u'', u'I', u'L', u'Bahonsuai', u'\r\n'),
-	(u'bsv', u'', u'', u'', u'I', u'E', u'Baga Soban\xe9', u'\r\n'),
-	(u'bsw', u'', u'', u'', u'I', u'L', u'Baiso', u'\r\n'),
-	(u'bsx', u'', u'', u'', u'I', u'L', u'Yangkam', u'\r\n'),
-	(u'bsy', u'', u'', u'', u'I', u'L', u'Sabah Bisaya', u'\r\n'),
-	(u'bta', u'', u'', u'', u'I', u'L', u'Bata', u'\r\n'),
-	(u'btc', u'', u'', u'', u'I', u'L', u'Bati (Cameroon)', u'\r\n'),
-	(u'btd', u'', u'', u'', u'I', u'L', u'Batak Dairi', u'\r\n'),
-	(u'bte', u'', u'', u'', u'I', u'E', u'Gamo-Ningi', u'\r\n'),
-	(u'btf', u'', u'', u'', u'I', u'L', u'Birgit', u'\r\n'),
-	(u'btg', u'', u'', u'', u'I', u'L', u'Gagnoa B\xe9t\xe9', u'\r\n'),
-	(u'bth', u'', u'', u'', u'I', u'L', u'Biatah Bidayuh', u'\r\n'),
-	(u'bti', u'', u'', u'', u'I', u'L', u'Burate', u'\r\n'),
-	(u'btj', u'', u'', u'', u'I', u'L', u'Bacanese Malay', u'\r\n'),
-	(u'btl', u'', u'', u'', u'I', u'L', u'Bhatola', u'\r\n'),
-	(u'btm', u'', u'', u'', u'I', u'L', u'Batak Mandailing', u'\r\n'),
-	(u'btn', u'', u'', u'', u'I', u'L', u'Ratagnon', u'\r\n'),
-	(u'bto', u'', u'', u'', u'I', u'L', u'Rinconada Bikol', u'\r\n'),
-	(u'btp', u'', u'', u'', u'I', u'L', u'Budibud', u'\r\n'),
-	(u'btq', u'', u'', u'', u'I', u'L', u'Batek', u'\r\n'),
-	(u'btr', u'', u'', u'', u'I', u'L', u'Baetora', u'\r\n'),
-	(u'bts', u'', u'', u'', u'I', u'L', u'Batak Simalungun', u'\r\n'),
-	(u'btt', u'', u'', u'', u'I', u'L', u'Bete-Bendi', u'\r\n'),
-	(u'btu', u'', u'', u'', u'I', u'L', u'Batu', u'\r\n'),
-	(u'btv', u'', u'', u'', u'I', u'L', u'Bateri', u'\r\n'),
-	(u'btw', u'', u'', u'', u'I', u'L', u'Butuanon', u'\r\n'),
-	(u'btx', u'', u'', u'', u'I', u'L', u'Batak Karo', u'\r\n'),
-	(u'bty', u'', u'', u'', u'I', u'L', u'Bobot', u'\r\n'),
-	(u'btz', u'', u'', u'', u'I', u'L', u'Batak Alas-Kluet', u'\r\n'),
-	(u'bua', u'bua', u'bua', u'', u'M', u'L', u'Buriat', u'\r\n'),
-	(u'bub', u'', u'', u'', u'I', u'L', u'Bua', u'\r\n'),
-	(u'buc', u'', u'', u'', u'I', u'L', u'Bushi', u'\r\n'),
-	(u'bud', u'', u'', u'', u'I', u'L', u'Ntcham', u'\r\n'),
-	(u'bue', u'', u'', u'', u'I', u'E', u'Beothuk', u'\r\n'),
-	(u'buf', u'', u'', u'', u'I', u'L', u'Bushoong', u'\r\n'),
-	(u'bug', u'bug', u'bug', u'', u'I', u'L', u'Buginese', u'\r\n'),
-	(u'buh', u'', u'', u'', u'I', u'L', u'Younuo Bunu', u'\r\n'),
-	(u'bui', u'', u'', u'', u'I', u'L', u'Bongili', u'\r\n'),
-	(u'buj', u'', u'', u'', u'I', u'L', u'Basa-Gurmana', u'\r\n'),
-	(u'buk', u'', u'', u'', u'I', u'L', u'Bugawac', u'\r\n'),
-	(u'bul', u'bul', u'bul', u'bg', u'I', u'L', u'Bulgarian', u'\r\n'),
-	(u'bum', u'', u'', u'', u'I', u'L', u'Bulu (Cameroon)', u'\r\n'),
-	(u'bun', u'', u'', u'', u'I', u'L', u'Sherbro', u'\r\n'),
-	(u'buo', u'', u'', u'', u'I', u'L', u'Terei', u'\r\n'),
-	(u'bup', u'', u'', u'', u'I', u'L', u'Busoa', u'\r\n'),
-	(u'buq', u'', u'', u'', u'I', u'L', u'Brem', u'\r\n'),
-	(u'bus', u'', u'', u'', u'I', u'L', u'Bokobaru', u'\r\n'),
-	(u'but', u'', u'', u'', u'I', u'L', u'Bungain', u'\r\n'),
-	(u'buu', u'', u'', u'', u'I', u'L', u'Budu', u'\r\n'),
-	(u'buv', u'', u'', u'', u'I', u'L', u'Bun', u'\r\n'),
-	(u'buw', u'', u'', u'', u'I', u'L', u'Bubi', u'\r\n'),
-	(u'bux', u'', u'', u'', u'I', u'L', u'Boghom', u'\r\n'),
-	(u'buy', u'', u'', u'', u'I', u'L', u'Bullom So', u'\r\n'),
-	(u'buz', u'', u'', u'', u'I', u'L', u'Bukwen', u'\r\n'),
-	(u'bva', u'', u'', u'', u'I', u'L', u'Barein', u'\r\n'),
-	(u'bvb', u'', u'', u'', u'I', u'L', u'Bube', u'\r\n'),
-	(u'bvc', u'', u'', u'', u'I', u'L', u'Baelelea', u'\r\n'),
-	(u'bvd', u'', u'', u'', u'I', u'L', u'Baeggu', u'\r\n'),
-	(u'bve', u'', u'', u'', u'I', u'L', u'Berau Malay', u'\r\n'),
-	(u'bvf', u'', u'', u'', u'I', u'L', u'Boor', u'\r\n'),
-	(u'bvg', u'', u'', u'', u'I', u'L', u'Bonkeng', u'\r\n'),
-	(u'bvh', u'', u'', u'', u'I', u'L', u'Bure', u'\r\n'),
-	(u'bvi', u'', u'', u'', u'I', u'L', u'Belanda Viri', u'\r\n'),
-	(u'bvj', u'', u'', u'', u'I', u'L', u'Baan', u'\r\n'),
-	(u'bvk', u'', u'', u'', u'I', u'L', u'Bukat', u'\r\n'),
-	(u'bvl', u'', u'', u'', u'I', u'L', u'Bolivian Sign Language', u'\r\n'),
-	(u'bvm', u'', u'', u'', u'I', u'L', u'Bamunka', u'\r\n'),
-	(u'bvn', u'', u'', u'', u'I', u'L', u'Buna', u'\r\n'),
-	(u'bvo', u'', u'', u'', u'I', u'L', u'Bolgo', u'\r\n'),
-	(u'bvq', u'', u'', u'', u'I', u'L', u'Birri', u'\r\n'),
-	(u'bvr', u'', u'', u'', u'I', u'L', u'Burarra', u'\r\n'),
-	(u'bvt', u'', u'', u'', u'I', u'L', u'Bati (Indonesia)', u'\r\n'),
-	(u'bvu', u'', u'', u'', u'I', u'L', u'Bukit Malay', u'\r\n'),
-	(u'bvv', u'', u'', u'', u'I', u'E', u'Baniva', u'\r\n'),
-	(u'bvw', u'', u'', u'', u'I', u'L', u'Boga', u'\r\n'),
-	(u'bvx', u'', u'', u'', u'I', u'L', u'Dibole', u'\r\n'),
-	(u'bvy', u'', u'', u'', u'I', u'L', u'Baybayanon', u'\r\n'),
-	(u'bvz', u'', u'', u'', u'I', u'L', u'Bauzi', u'\r\n'),
-	(u'bwa', u'', u'', u'', u'I', u'L', u'Bwatoo', u'\r\n'),
-	(u'bwb', u'', u'', u'', u'I', u'L', u'Namosi-Naitasiri-Serua', u'\r\n'),
-	(u'bwc', u'', u'', u'', u'I', u'L', u'Bwile', u'\r\n'),
-	(u'bwd', u'', u'', u'', u'I', u'L', u'Bwaidoka', u'\r\n'),
-	(u'bwe', u'', u'', u'', u'I', u'L', u'Bwe Karen', u'\r\n'),
-	(u'bwf', u'', u'', u'', u'I', u'L', u'Boselewa', u'\r\n'),
-	(u'bwg', u'', u'', u'', u'I', u'L', u'Barwe', u'\r\n'),
-	(u'bwh', u'', u'', u'', u'I', u'L', u'Bishuo', u'\r\n'),
-	(u'bwi', u'', u'', u'', u'I', u'L', u'Baniwa', u'\r\n'),
-	(u'bwj', u'', u'', u'', u'I', u'L', u'L\xe1\xe1 L\xe1\xe1 Bwamu', u'\r\n'),
-	(u'bwk', u'', u'', u'', u'I', u'L', u'Bauwaki', u'\r\n'),
-	(u'bwl', u'', u'', u'', u'I', u'L', u'Bwela', u'\r\n'),
-	(u'bwm', u'', u'', u'', u'I', u'L', u'Biwat', u'\r\n'),
-	(u'bwn', u'', u'', u'', u'I', u'L', u'Wunai Bunu', u'\r\n'),
-	(u'bwo', u'', u'', u'', u'I', u'L', u'Boro (Ethiopia)', u'\r\n'),
-	(u'bwp', u'', u'', u'', u'I', u'L', u'Mandobo Bawah', u'\r\n'),
-	(u'bwq', u'', u'', u'', u'I', u'L', u'Southern Bobo Madar\xe9', u'\r\n'),
-	(u'bwr', u'', u'', u'', u'I', u'L', u'Bura-Pabir', u'\r\n'),
-	(u'bws', u'', u'', u'', u'I', u'L', u'Bomboma', u'\r\n'),
-	(u'bwt', u'', u'', u'', u'I', u'L', u'Bafaw-Balong', u'\r\n'),
-	(u'bwu', u'', u'', u'', u'I', u'L', u'Buli (Ghana)', u'\r\n'),
-	(u'bww', u'', u'', u'', u'I', u'L', u'Bwa', u'\r\n'),
-	(u'bwx', u'', u'', u'', u'I', u'L', u'Bu-Nao Bunu', u'\r\n'),
-	(u'bwy', u'', u'', u'', u'I', u'L', u'Cwi Bwamu', u'\r\n'),
-	(u'bwz', u'', u'', u'', u'I', u'L', u'Bwisi', u'\r\n'),
-	(u'bxa', u'', u'', u'', u'I', u'L', u'Bauro', u'\r\n'),
-	(u'bxb', u'', u'', u'', u'I', u'L', u'Belanda Bor', u'\r\n'),
-	(u'bxc', u'', u'', u'', u'I', u'L', u'Molengue', u'\r\n'),
-	(u'bxd', u'', u'', u'', u'I', u'L', u'Pela', u'\r\n'),
-	(u'bxe', u'', u'', u'', u'I', u'L', u'Birale', u'\r\n'),
-	(u'bxf', u'', u'', u'', u'I', u'L', u'Bilur', u'\r\n'),
-	(u'bxg', u'', u'', u'', u'I', u'L', u'Bangala', u'\r\n'),
-	(u'bxh', u'', u'', u'', u'I', u'L', u'Buhutu', u'\r\n'),
-	(u'bxi', u'', u'', u'', u'I', u'E', u'Pirlatapa', u'\r\n'),
-	(u'bxj', u'', u'', u'', u'I', u'L', u'Bayungu', u'\r\n'),
-	(u'bxk', u'', u'', u'', u'I', u'L', u'Bukusu', u'\r\n'),
-	(u'bxl', u'', u'', u'', u'I', u'L', u'Jalkunan', u'\r\n'),
-	(u'bxm', u'', u'', u'', u'I', u'L', u'Mongolia Buriat', u'\r\n'),
-	(u'bxn', u'', u'', u'', u'I', u'L', u'Burduna', u'\r\n'),
-	(u'bxo', u'', u'', u'', u'I', u'L', u'Barikanchi', u'\r\n'),
-	(u'bxp', u'', u'', u'', u'I', u'L', u'Bebil', u'\r\n'),
-	(u'bxq', u'', u'', u'', u'I', u'L', u'Beele', u'\r\n'),
-	(u'bxr', u'', u'', u'', u'I', u'L', u'Russia Buriat', u'\r\n'),
-	(u'bxs', u'', u'', u'', u'I', u'L', u'Busam', u'\r\n'),
-	(u'bxu', u'', u'', u'', u'I', u'L', u'China Buriat', u'\r\n'),
-	(u'bxv', u'', u'', u'', u'I', u'L', u'Berakou', u'\r\n'),
-	(u'bxw', u'', u'', u'', u'I', u'L', u'Bankagooma', u'\r\n'),
-	(u'bxx', u'', u'', u'', u'I', u'L', u'Borna (Democratic Republic of Congo)', u'\r\n'),
-	(u'bxz', u'', u'', u'', u'I', u'L', u'Binahari', u'\r\n'),
-	(u'bya', u'', u'', u'', u'I', u'L', u'Batak', u'\r\n'),
-	(u'byb', u'', u'', u'', u'I', u'L', u'Bikya', u'\r\n'),
-	(u'byc', u'', u'', u'', u'I', u'L', u'Ubaghara', u'\r\n'),
-	(u'byd', u'', u'', u'', u'I', u'L', u"Benyadu'", u'\r\n'),
-	(u'bye', u'', u'', u'', u'I', u'L', u'Pouye', u'\r\n'),
-	(u'byf', u'', u'', u'', u'I', u'L', u'Bete', u'\r\n'),
-	(u'byg', u'', u'', u'', u'I', u'E', u'Baygo', u'\r\n'),
-	(u'byh', u'', u'', u'', u'I', u'L', u'Bhujel', u'\r\n'),
-	(u'byi', u'', u'', u'', u'I', u'L', u'Buyu', u'\r\n'),
-	(u'byj', u'', u'', u'', u'I', u'L', u'Bina (Nigeria)', u'\r\n'),
-	(u'byk', u'', u'', u'', u'I', u'L', u'Biao', u'\r\n'),
-	(u'byl', u'', u'', u'', u'I', u'L', u'Bayono', u'\r\n'),
-	(u'bym', u'', u'', u'', u'I', u'L', u'Bidyara', u'\r\n'),
-	(u'byn', u'byn', u'byn', u'', u'I', u'L', u'Bilin', u'\r\n'),
-	(u'byo', u'', u'', u'', u'I', u'L', u'Biyo', u'\r\n'),
-	(u'byp', u'', u'', u'', u'I', u'L', u'Bumaji', u'\r\n'),
-	(u'byq', u'', u'', u'', u'I', u'E', u'Basay', u'\r\n'),
-	(u'byr', u'', u'', u'', u'I', u'L', u'Baruya', u'\r\n'),
-	(u'bys', u'', u'', u'', u'I', u'L', u'Burak', u'\r\n'),
-	(u'byt', u'', u'', u'', u'I', u'E', u'Berti', u'\r\n'),
-	(u'byv', u'', u'', u'', u'I', u'L', u'Medumba', u'\r\n'),
-	(u'byw', u'', u'', u'', u'I', u'L', u'Belhariya', u'\r\n'),
-	(u'byx', u'', u'', u'', u'I', u'L', u'Qaqet', u'\r\n'),
-	(u'byy', u'', u'', u'', u'I', u'L', u'Buya', u'\r\n'),
-	(u'byz', u'', u'', u'', u'I', u'L', u'Banaro', u'\r\n'),
-	(u'bza', u'', u'', u'', u'I', u'L', u'Bandi', u'\r\n'),
-	(u'bzb', u'', u'', u'', u'I', u'L', u'Andio', u'\r\n'),
-	(u'bzd', u'', u'', u'', u'I', u'L', u'Bribri', u'\r\n'),
-	(u'bze', u'', u'', u'', u'I', u'L', u'Jenaama Bozo', u'\r\n'),
-	(u'bzf', u'', u'', u'', u'I', u'L', u'Boikin', u'\r\n'),
-	(u'bzg', u'', u'', u'', u'I', u'L', u'Babuza', u'\r\n'),
-	(u'bzh', u'', u'', u'', u'I', u'L', u'Mapos Buang', u'\r\n'),
-	(u'bzi', u'', u'', u'', u'I', u'L', u'Bisu', u'\r\n'),
-	(u'bzj', u'', u'', u'', u'I', u'L', u'Belize Kriol English', u'\r\n'),
-	(u'bzk', u'', u'', u'', u'I', u'L', u'Nicaragua Creole English', u'\r\n'),
-	(u'bzl', u'', u'', u'', u'I', u'L', u'Boano (Sulawesi)', u'\r\n'),
-	(u'bzm', u'', u'', u'', u'I', u'L', u'Bolondo', u'\r\n'),
-	(u'bzn', u'', u'', u'', u'I', u'L', u'Boano (Maluku)', u'\r\n'),
-	(u'bzo', u'', u'', u'', u'I', u'L', u'Bozaba', u'\r\n'),
-	(u'bzp', u'', u'', u'', u'I', u'L', u'Kemberano', u'\r\n'),
-	(u'bzq', u'', u'', u'', u'I', u'L', u'Buli (Indonesia)', u'\r\n'),
-	(u'bzr', u'', u'', u'', u'I', u'E', u'Biri', u'\r\n'),
-	(u'bzs', u'', u'', u'', u'I', u'L', u'Brazilian Sign Language', u'\r\n'),
-	(u'bzt', u'', u'', u'', u'I', u'C', u'Brithenig', u'\r\n'),
-	(u'bzu', u'', u'', u'', u'I', u'L', u'Burmeso', u'\r\n'),
-	(u'bzv', u'', u'', u'', u'I', u'L', u'Bebe', u'\r\n'),
-	(u'bzw', u'', u'', u'', u'I', u'L', u'Basa (Nigeria)', u'\r\n'),
-	(u'bzx', u'', u'', u'', u'I', u'L', u'Hainyaxo Bozo', u'\r\n'),
-	(u'bzy', u'', u'', u'', u'I', u'L', u'Obanliku', u'\r\n'),
-	(u'bzz', u'', u'', u'', u'I', u'L', u'Evant', u'\r\n'),
-	(u'caa', u'', u'', u'', u'I', u'L', u'Chort\xed', u'\r\n'),
-	(u'cab', u'', u'', u'', u'I', u'L', u'Garifuna', u'\r\n'),
-	(u'cac', u'', u'', u'', u'I', u'L', u'Chuj', u'\r\n'),
-	(u'cad', u'cad', u'cad', u'', u'I', u'L', u'Caddo', u'\r\n'),
-	(u'cae', u'', u'', u'', u'I', u'L', u'Lehar', u'\r\n'),
-	(u'caf', u'', u'', u'', u'I', u'L', u'Southern Carrier', u'\r\n'),
-	(u'cag', u'', u'', u'', u'I', u'L', u'Nivacl\xe9', u'\r\n'),
-	(u'cah', u'', u'', u'', u'I', u'L', u'Cahuarano', u'\r\n'),
-	(u'caj', u'', u'', u'', u'I', u'E', u'Chan\xe9', u'\r\n'),
-	(u'cak', u'', u'', u'', u'I', u'L', u'Kaqchikel', u'\r\n'),
-	(u'cal', u'', u'', u'', u'I', u'L', u'Carolinian', u'\r\n'),
-	(u'cam', u'', u'', u'', u'I', u'L', u'Cemuh\xee', u'\r\n'),
-	(u'can', u'', u'', u'', u'I', u'L', u'Chambri', u'\r\n'),
-	(u'cao', u'', u'', u'', u'I', u'L', u'Ch\xe1cobo', u'\r\n'),
-	(u'cap', u'', u'', u'', u'I', u'L', u'Chipaya', u'\r\n'),
-	(u'caq', u'', u'', u'', u'I', u'L', u'Car Nicobarese', u'\r\n'),
-	(u'car', u'car', u'car', u'', u'I', u'L', u'Galibi Carib', u'\r\n'),
-	(u'cas', u'', u'', u'', u'I', u'L', u'Tsiman\xe9', u'\r\n'),
-	(u'cat', u'cat', u'cat', u'ca', u'I', u'L', u'Catalan', u'\r\n'),
-	(u'cav', u'', u'', u'', u'I', u'L', u'Cavine\xf1a', u'\r\n'),
-	(u'caw', u'', u'', u'', u'I', u'L', u'Callawalla', u'\r\n'),
-	(u'cax', u'', u'', u'', u'I', u'L', u'Chiquitano', u'\r\n'),
-	(u'cay', u'', u'', u'', u'I', u'L', u'Cayuga', u'\r\n'),
-	(u'caz', u'', u'', u'', u'I', u'E', u'Canichana', u'\r\n'),
-	(u'cbb', u'', u'', u'', u'I', u'L', u'Cabiyar\xed', u'\r\n'),
-	(u'cbc', u'', u'', u'', u'I', u'L', u'Carapana', u'\r\n'),
-	(u'cbd', u'', u'', u'', u'I', u'L', u'Carijona', u'\r\n'),
-	(u'cbe', u'', u'', u'', u'I', u'E', u'Chipiajes', u'\r\n'),
-	(u'cbg', u'', u'', u'', u'I', u'L', u'Chimila', u'\r\n'),
-	(u'cbh', u'', u'', u'', u'I', u'E', u'Cagua', u'\r\n'),
-	(u'cbi', u'', u'', u'', u'I', u'L', u'Chachi', u'\r\n'),
-	(u'cbj', u'', u'', u'', u'I', u'L', u'Ede Cabe', u'\r\n'),
-	(u'cbk', u'', u'', u'', u'I', u'L', u'Chavacano', u'\r\n'),
-	(u'cbl', u'', u'', u'', u'I', u'L', u'Bualkhaw Chin', u'\r\n'),
-	(u'cbn', u'', u'', u'', u'I', u'L', u'Nyahkur', u'\r\n'),
-	(u'cbo', u'', u'', u'', u'I', u'L', u'Izora', u'\r\n'),
-	(u'cbr', u'', u'', u'', u'I', u'L', u'Cashibo-Cacataibo', u'\r\n'),
-	(u'cbs', u'', u'', u'', u'I', u'L', u'Cashinahua', u'\r\n'),
-	(u'cbt', u'', u'', u'', u'I', u'L', u'Chayahuita', u'\r\n'),
-	(u'cbu', u'', u'', u'', u'I', u'L', u'Candoshi-Shapra', u'\r\n'),
-	(u'cbv', u'', u'', u'', u'I', u'L', u'Cacua', u'\r\n'),
-	(u'cbw', u'', u'', u'', u'I', u'L', u'Kinabalian', u'\r\n'),
-	(u'cby', u'', u'', u'', u'I', u'L', u'Carabayo', u'\r\n'),
-	(u'cca', u'', u'', u'', u'I', u'E', u'Cauca', u'\r\n'),
-	(u'ccc', u'', u'', u'', u'I', u'L', u'Chamicuro', u'\r\n'),
-	(u'ccd', u'', u'', u'', u'I', u'L', u'Cafundo Creole', u'\r\n'),
-	(u'cce', u'', u'', u'', u'I', u'L', u'Chopi', u'\r\n'),
-	(u'ccg', u'', u'', u'', u'I', u'L', u'Samba Daka', u'\r\n'),
-	(u'cch', u'', u'', u'', u'I', u'L', u'Atsam', u'\r\n'),
-	(u'ccj', u'', u'', u'', u'I', u'L', u'Kasanga', u'\r\n'),
-	(u'ccl', u'', u'', u'', u'I', u'L', u'Cutchi-Swahili', u'\r\n'),
-	(u'ccm', u'', u'', u'', u'I', u'L', u'Malaccan Creole Malay', u'\r\n'),
-	(u'cco', u'', u'', u'', u'I', u'L', u'Comaltepec Chinantec', u'\r\n'),
-	(u'ccp', u'', u'', u'', u'I', u'L', u'Chakma', u'\r\n'),
-	(u'ccq', u'', u'', u'', u'I', u'L', u'Chaungtha', u'\r\n'),
-	(u'ccr', u'', u'', u'', u'I', u'E', u'Cacaopera', u'\r\n'),
-	(u'cda', u'', u'', u'', u'I', u'L', u'Choni', u'\r\n'),
-	(u'cde', u'', u'', u'', u'I', u'L', u'Chenchu', u'\r\n'),
-	(u'cdf', u'', u'', u'', u'I', u'L', u'Chiru', u'\r\n'),
-	(u'cdg', u'', u'', u'', u'I', u'L', u'Chamari', u'\r\n'),
-	(u'cdh', u'', u'', u'', u'I', u'L', u'Chambeali', u'\r\n'),
-	(u'cdi', u'', u'', u'', u'I', u'L', u'Chodri', u'\r\n'),
-	(u'cdj', u'', u'', u'', u'I', u'L', u'Churahi', u'\r\n'),
-	(u'cdm', u'', u'', u'', u'I', u'L', u'Chepang', u'\r\n'),
-	(u'cdn', u'', u'', u'', u'I', u'L', u'Chaudangsi', u'\r\n'),
-	(u'cdo', u'', u'', u'', u'I', u'L', u'Min Dong Chinese', u'\r\n'),
-	(u'cdr', u'', u'', u'', u'I', u'L', u'Cinda-Regi-Tiyal', u'\r\n'),
-	(u'cds', u'', u'', u'', u'I', u'L', u'Chadian Sign Language', u'\r\n'),
-	(u'cdy', u'', u'', u'', u'I', u'L', u'Chadong', u'\r\n'),
-	(u'cdz', u'', u'', u'', u'I', u'L', u'Koda', u'\r\n'),
-	(u'cea', u'', u'', u'', u'I', u'E', u'Lower Chehalis', u'\r\n'),
-	(u'ceb', u'ceb', u'ceb', u'', u'I', u'L', u'Cebuano', u'\r\n'),
-	(u'ceg', u'', u'', u'', u'I', u'L', u'Chamacoco', u'\r\n'),
-	(u'cen', u'', u'', u'', u'I', u'L', u'Cen', u'\r\n'),
-	(u'ces', u'cze', u'ces', u'cs', u'I', u'L', u'Czech', u'\r\n'),
-	(u'cet', u'', u'', u'', u'I', u'L', u'Cent\xfa\xfam', u'\r\n'),
-	(u'cfa', u'', u'', u'', u'I', u'L', u'Dijim-Bwilim', u'\r\n'),
-	(u'cfd', u'', u'', u'', u'I', u'L', u'Cara', u'\r\n'),
-	(u'cfg', u'', u'', u'', u'I', u'L', u'Como Karim', u'\r\n'),
-	(u'cfm', u'', u'', u'', u'I', u'L', u'Falam Chin', u'\r\n'),
-	(u'cga', u'', u'', u'', u'I', u'L', u'Changriwa', u'\r\n'),
-	(u'cgc', u'', u'', u'', u'I', u'L', u'Kagayanen', u'\r\n'),
-	(u'cgg', u'', u'', u'', u'I', u'L', u'Chiga', u'\r\n'),
-	(u'cgk', u'', u'', u'', u'I', u'L', u'Chocangacakha', u'\r\n'),
-	(u'cha', u'cha', u'cha', u'ch', u'I', u'L', u'Chamorro', u'\r\n'),
-	(u'chb', u'chb', u'chb', u'', u'I', u'E', u'Chibcha', u'\r\n'),
-	(u'chc', u'', u'', u'', u'I', u'E', u'Catawba', u'\r\n'),
-	(u'chd', u'', u'', u'', u'I', u'L', u'Highland Oaxaca Chontal', u'\r\n'),
-	(u'che', u'che', u'che', u'ce', u'I', u'L', u'Chechen', u'\r\n'),
-	(u'chf', u'', u'', u'', u'I', u'L', u'Tabasco Chontal', u'\r\n'),
-	(u'chg', u'chg', u'chg', u'', u'I', u'E', u'Chagatai', u'\r\n'),
-	(u'chh', u'', u'', u'', u'I', u'L', u'Chinook', u'\r\n'),
-	(u'chj', u'', u'', u'', u'I', u'L', u'Ojitl\xe1n Chinantec', u'\r\n'),
-	(u'chk', u'chk', u'chk', u'', u'I', u'L', u'Chuukese', u'\r\n'),
-	(u'chl', u'', u'', u'', u'I', u'L', u'Cahuilla', u'\r\n'),
-	(u'chm', u'chm', u'chm', u'', u'M', u'L', u'Mari (Russia)', u'\r\n'),
-	(u'chn', u'chn', u'chn', u'', u'I', u'L', u'Chinook jargon', u'\r\n'),
-	(u'cho', u'cho', u'cho', u'', u'I', u'L', u'Choctaw', u'\r\n'),
-	(u'chp', u'chp', u'chp', u'', u'I', u'L', u'Chipewyan', u'\r\n'),
-	(u'chq', u'', u'', u'', u'I', u'L', u'Quiotepec Chinantec', u'\r\n'),
-	(u'chr', u'chr', u'chr', u'', u'I', u'L', u'Cherokee', u'\r\n'),
-	(u'cht', u'', u'', u'', u'I', u'E', u'Chol\xf3n', u'\r\n'),
-	(u'chu', u'chu', u'chu', u'cu', u'I', u'A', u'Church Slavic', u'\r\n'),
-	(u'chv', u'chv', u'chv', u'cv', u'I', u'L', u'Chuvash', u'\r\n'),
-	(u'chw', u'', u'', u'', u'I', u'L', u'Chuwabu', u'\r\n'),
-	(u'chx', u'', u'', u'', u'I', u'L', u'Chantyal', u'\r\n'),
-	(u'chy', u'chy', u'chy', u'', u'I', u'L', u'Cheyenne', u'\r\n'),
-	(u'chz', u'', u'', u'', u'I', u'L', u'Ozumac\xedn Chinantec', u'\r\n'),
-	(u'cia', u'', u'', u'', u'I', u'L', u'Cia-Cia', u'\r\n'),
-	(u'cib', u'', u'', u'', u'I', u'L', u'Ci Gbe', u'\r\n'),
-	(u'cic', u'', u'', u'', u'I', u'L', u'Chickasaw', u'\r\n'),
-	(u'cid', u'', u'', u'', u'I', u'E', u'Chimariko', u'\r\n'),
-	(u'cie', u'', u'', u'', u'I', u'L', u'Cineni', u'\r\n'),
-	(u'cih', u'', u'', u'', u'I', u'L', u'Chinali', u'\r\n'),
-	(u'cik', u'', u'', u'', u'I', u'L', u'Chitkuli Kinnauri', u'\r\n'),
-	(u'cim', u'', u'', u'', u'I', u'L', u'Cimbrian', u'\r\n'),
-	(u'cin', u'', u'', u'', u'I', u'L', u'Cinta Larga', u'\r\n'),
-	(u'cip', u'', u'', u'', u'I', u'L', u'Chiapanec', u'\r\n'),
-	(u'cir', u'', u'', u'', u'I', u'L', u'Tiri', u'\r\n'),
-	(u'ciw', u'', u'', u'', u'I', u'L', u'Chippewa', u'\r\n'),
-	(u'ciy', u'', u'', u'', u'I', u'L', u'Chaima', u'\r\n'),
-	(u'cja', u'', u'', u'', u'I', u'L', u'Western Cham', u'\r\n'),
-	(u'cje', u'', u'', u'', u'I', u'L', u'Chru', u'\r\n'),
-	(u'cjh', u'', u'', u'', u'I', u'E', u'Upper Chehalis', u'\r\n'),
-	(u'cji', u'', u'', u'', u'I', u'L', u'Chamalal', u'\r\n'),
-	(u'cjk', u'', u'', u'', u'I', u'L', u'Chokwe', u'\r\n'),
-	(u'cjm', u'', u'', u'', u'I', u'L', u'Eastern Cham', u'\r\n'),
-	(u'cjn', u'', u'', u'', u'I', u'L', u'Chenapian', u'\r\n'),
-	(u'cjo', u'', u'', u'', u'I', u'L', u'Ash\xe9ninka Pajonal', u'\r\n'),
-	(u'cjp', u'', u'', u'', u'I', u'L', u'Cab\xe9car', u'\r\n'),
-	(u'cjs', u'', u'', u'', u'I', u'L', u'Shor', u'\r\n'),
-	(u'cjv', u'', u'', u'', u'I', u'L', u'Chuave', u'\r\n'),
-	(u'cjy', u'', u'', u'', u'I', u'L', u'Jinyu Chinese', u'\r\n'),
-	(u'cka', u'', u'', u'', u'I', u'L', u'Khumi Awa Chin', u'\r\n'),
-	(u'ckb', u'', u'', u'', u'I', u'L', u'Central Kurdish', u'\r\n'),
-	(u'ckh', u'', u'', u'', u'I', u'L', u'Chak', u'\r\n'),
-	(u'ckl', u'', u'', u'', u'I', u'L', u'Cibak', u'\r\n'),
-	(u'cko', u'', u'', u'', u'I', u'L', u'Anufo', u'\r\n'),
-	(u'ckq', u'', u'', u'', u'I', u'L', u'Kajakse', u'\r\n'),
-	(u'ckr', u'', u'', u'', u'I', u'L', u'Kairak', u'\r\n'),
-	(u'cks', u'', u'', u'', u'I', u'L', u'Tayo', u'\r\n'),
-	(u'ckt', u'', u'', u'', u'I', u'L', u'Chukot', u'\r\n'),
-	(u'cku', u'', u'', u'', u'I', u'L', u'Koasati', u'\r\n'),
-	(u'ckv', u'', u'', u'', u'I', u'L', u'Kavalan', u'\r\n'),
-	(u'ckx', u'', u'', u'', u'I', u'L', u'Caka', u'\r\n'),
-	(u'cky', u'', u'', u'', u'I', u'L', u'Cakfem-Mushere', u'\r\n'),
-	(u'ckz', u'', u'', u'', u'I', u'L', u'Cakchiquel-Quich\xe9 Mixed Language', u'\r\n'),
-	(u'cla', u'', u'', u'', u'I', u'L', u'Ron', u'\r\n'),
-	(u'clc', u'', u'', u'', u'I', u'L', u'Chilcotin', u'\r\n'),
-	(u'cld', u'', u'', u'', u'I', u'L', u'Chaldean Neo-Aramaic', u'\r\n'),
-	(u'cle', u'', u'', u'', u'I', u'L', u'Lealao Chinantec', u'\r\n'),
-	(u'clh', u'', u'', u'', u'I', u'L', u'Chilisso', u'\r\n'),
-	(u'cli', u'', u'', u'', u'I', u'L', u'Chakali', u'\r\n'),
-	(u'clk', u'', u'', u'', u'I', u'L', u'Idu-Mishmi', u'\r\n'),
-	(u'cll', u'', u'', u'', u'I', u'L', u'Chala', u'\r\n'),
-	(u'clm', u'', u'', u'', u'I', u'L', u'Clallam', u'\r\n'),
-	(u'clo', u'', u'', u'', u'I', u'L', u'Lowland Oaxaca Chontal', u'\r\n'),
-	(u'clu', u'', u'', u'', u'I', u'L', u'Caluyanun', u'\r\n'),
-	(u'clw', u'', u'', u'', u'I', u'L', u'Chulym', u'\r\n'),
-	(u'cly', u'', u'', u'', u'I', u'L', u'Eastern Highland Chatino', u'\r\n'),
-	(u'cma', u'', u'', u'', u'I', u'L', u'Maa', u'\r\n'),
-	(u'cme', u'', u'', u'', u'I', u'L', u'Cerma', u'\r\n'),
-	(u'cmg', u'', u'', u'', u'I', u'H', u'Classical Mongolian', u'\r\n'),
-	(u'cmi', u'', u'', u'', u'I', u'L', u'Ember\xe1-Cham\xed', u'\r\n'),
-	(u'cml', u'', u'', u'', u'I', u'L', u'Campalagian', u'\r\n'),
-	(u'cmm', u'', u'', u'', u'I', u'E', u'Michigamea', u'\r\n'),
-	(u'cmn', u'', u'', u'', u'I', u'L', u'Mandarin Chinese', u'\r\n'),
-	(u'cmo', u'', u'', u'', u'I', u'L', u'Central Mnong', u'\r\n'),
-	(u'cmr', u'', u'', u'', u'I', u'L', u'Mro Chin', u'\r\n'),
-	(u'cms', u'', u'', u'', u'I', u'A', u'Messapic', u'\r\n'),
-	(u'cmt', u'', u'', u'', u'I', u'L', u'Camtho', u'\r\n'),
-	(u'cna', u'', u'', u'', u'I', u'L', u'Changthang', u'\r\n'),
-	(u'cnb', u'', u'', u'', u'I', u'L', u'Chinbon Chin', u'\r\n'),
-	(u'cnc', u'', u'', u'', u'I', u'L', u'C\xf4\xf4ng', u'\r\n'),
-	(u'cng', u'', u'', u'', u'I', u'L', u'Northern Qiang', u'\r\n'),
-	(u'cnh', u'', u'', u'', u'I', u'L', u'Haka Chin', u'\r\n'),
-	(u'cni', u'', u'', u'', u'I', u'L', u'Ash\xe1ninka', u'\r\n'),
-	(u'cnk', u'', u'', u'', u'I', u'L', u'Khumi Chin', u'\r\n'),
-	(u'cnl', u'', u'', u'', u'I', u'L', u'Lalana Chinantec', u'\r\n'),
-	(u'cno', u'', u'', u'', u'I', u'L', u'Con', u'\r\n'),
-	(u'cns', u'', u'', u'', u'I', u'L', u'Central Asmat', u'\r\n'),
-	(u'cnt', u'', u'', u'', u'I', u'L', u'Tepetotutla Chinantec', u'\r\n'),
-	(u'cnu', u'', u'', u'', u'I', u'L', u'Chenoua', u'\r\n'),
-	(u'cnw', u'', u'', u'', u'I', u'L', u'Ngawn Chin', u'\r\n'),
-	(u'cnx', u'', u'', u'', u'I', u'H', u'Middle Cornish', u'\r\n'),
-	(u'coa', u'', u'', u'', u'I', u'L', u'Cocos Islands Malay', u'\r\n'),
-	(u'cob', u'', u'', u'', u'I', u'E', u'Chicomuceltec', u'\r\n'),
-	(u'coc', u'', u'', u'', u'I', u'L', u'Cocopa', u'\r\n'),
-	(u'cod', u'', u'', u'', u'I', u'L', u'Cocama-Cocamilla', u'\r\n'),
-	(u'coe', u'', u'', u'', u'I', u'L', u'Koreguaje', u'\r\n'),
-	(u'cof', u'', u'', u'', u'I', u'L', u'Colorado', u'\r\n'),
-	(u'cog', u'', u'', u'', u'I', u'L', u'Chong', u'\r\n'),
-	(u'coh', u'', u'', u'', u'I', u'L', u'Chonyi-Dzihana-Kauma', u'\r\n'),
-	(u'coj', u'', u'', u'', u'I', u'E', u'Cochimi', u'\r\n'),
-	(u'cok', u'', u'', u'', u'I', u'L', u'Santa Teresa Cora', u'\r\n'),
-	(u'col', u'', u'', u'', u'I', u'L', u'Columbia-Wenatchi', u'\r\n'),
-	(u'com', u'', u'', u'', u'I', u'L', u'Comanche', u'\r\n'),
-	(u'con', u'', u'', u'', u'I', u'L', u'Cof\xe1n', u'\r\n'),
-	(u'coo', u'', u'', u'', u'I', u'L', u'Comox', u'\r\n'),
-	(u'cop', u'cop', u'cop', u'', u'I', u'E', u'Coptic', u'\r\n'),
-	(u'coq', u'', u'', u'', u'I', u'E', u'Coquille', u'\r\n'),
-	(u'cor', u'cor', u'cor', u'kw', u'I', u'L', u'Cornish', u'\r\n'),
-	(u'cos', u'cos', u'cos', u'co', u'I', u'L', u'Corsican', u'\r\n'),
-	(u'cot', u'', u'', u'', u'I', u'L', u'Caquinte', u'\r\n'),
-	(u'cou', u'', u'', u'', u'I', u'L', u'Wamey', u'\r\n'),
-	(u'cov', u'', u'', u'', u'I', u'L', u'Cao Miao', u'\r\n'),
-	(u'cow', u'', u'', u'', u'I', u'E', u'Cowlitz', u'\r\n'),
-	(u'cox', u'', u'', u'', u'I', u'L', u'Nanti', u'\r\n'),
-	(u'coy', u'', u'', u'', u'I', u'E', u'Coyaima', u'\r\n'),
-	(u'coz', u'', u'', u'', u'I', u'L', u'Chochotec', u'\r\n'),
-	(u'cpa', u'', u'', u'', u'I', u'L', u'Palantla Chinantec', u'\r\n'),
-	(u'cpb', u'', u'', u'', u'I', u'L', u'Ucayali-Yur\xfaa Ash\xe9ninka', u'\r\n'),
-	(u'cpc', u'', u'', u'', u'I', u'L', u'Ajy\xedninka Apurucayali', u'\r\n'),
-	(u'cpg', u'', u'', u'', u'I', u'E', u'Cappadocian Greek', u'\r\n'),
-	(u'cpi', u'', u'', u'', u'I', u'L', u'Chinese Pidgin English', u'\r\n'),
-	(u'cpn', u'', u'', u'', u'I', u'L', u'Cherepon', u'\r\n'),
-	(u'cps', u'', u'', u'', u'I', u'L', u'Capiznon', u'\r\n'),
-	(u'cpu', u'', u'', u'', u'I', u'L', u'Pichis Ash\xe9ninka', u'\r\n'),
-	(u'cpx', u'', u'', u'', u'I', u'L', u'Pu-Xian Chinese', u'\r\n'),
-	(u'cpy', u'', u'', u'', u'I', u'L', u'South Ucayali Ash\xe9ninka', u'\r\n'),
-	(u'cqd', u'', u'', u'', u'I', u'L', u'Chuanqiandian Cluster Miao', u'\r\n'),
-	(u'cqu', u'', u'', u'', u'I', u'L', u'Chilean Quechua', u'\r\n'),
-	(u'cra', u'', u'', u'', u'I', u'L', u'Chara', u'\r\n'),
-	(u'crb', u'', u'', u'', u'I', u'E', u'Island Carib', u'\r\n'),
-	(u'crc', u'', u'', u'', u'I', u'L', u'Lonwolwol', u'\r\n'),
-	(u'crd', u'', u'', u'', u'I', u'L', u"Coeur d'Alene", u'\r\n'),
-	(u'cre', u'cre', u'cre', u'cr', u'M', u'L', u'Cree', u'\r\n'),
-	(u'crf', u'', u'', u'', u'I', u'E', u'Caramanta', u'\r\n'),
-	(u'crg', u'', u'', u'', u'I', u'L', u'Michif', u'\r\n'),
-	(u'crh', u'crh', u'crh', u'', u'I', u'L', u'Crimean Tatar', u'\r\n'),
-	(u'cri', u'', u'', u'', u'I', u'L', u'S\xe3otomense', u'\r\n'),
-	(u'crj', u'', u'', u'', u'I', u'L', u'Southern East Cree', u'\r\n'),
-	(u'crk', u'', u'', u'', u'I', u'L', u'Plains Cree', u'\r\n'),
-	(u'crl', u'', u'', u'', u'I', u'L', u'Northern East Cree', u'\r\n'),
-	(u'crm', u'', u'', u'', u'I', u'L', u'Moose Cree', u'\r\n'),
-	(u'crn', u'', u'', u'', u'I', u'L', u'El Nayar Cora', u'\r\n'),
-	(u'cro', u'', u'', u'', u'I', u'L', u'Crow', u'\r\n'),
-	(u'crq', u'', u'', u'', u'I', u'L', u"Iyo'wujwa Chorote", u'\r\n'),
-	(u'crr', u'', u'', u'', u'I', u'E', u'Carolina Algonquian', u'\r\n'),
-	(u'crs', u'', u'', u'', u'I', u'L', u'Seselwa Creole French', u'\r\n'),
-	(u'crt', u'', u'', u'', u'I', u'L', u"Iyojwa'ja Chorote", u'\r\n'),
-	(u'crv', u'', u'', u'', u'I', u'L', u'Chaura', u'\r\n'),
-	(u'crw', u'', u'', u'', u'I', u'L', u'Chrau', u'\r\n'),
-	(u'crx', u'', u'', u'', u'I', u'L', u'Carrier', u'\r\n'),
-	(u'cry', u'', u'', u'', u'I', u'L', u'Cori', u'\r\n'),
-	(u'crz', u'', u'', u'', u'I', u'E', u'Cruze\xf1o', u'\r\n'),
-	(u'csa', u'', u'', u'', u'I', u'L', u'Chiltepec Chinantec', u'\r\n'),
-	(u'csb', u'csb', u'csb', u'', u'I', u'L', u'Kashubian', u'\r\n'),
-	(u'csc', u'', u'', u'', u'I', u'L', u'Catalan Sign Language', u'\r\n'),
-	(u'csd', u'', u'', u'', u'I', u'L', u'Chiangmai Sign Language', u'\r\n'),
-	(u'cse', u'', u'', u'', u'I', u'L', u'Czech Sign Language', u'\r\n'),
-	(u'csf', u'', u'', u'', u'I', u'L', u'Cuba Sign Language', u'\r\n'),
-	(u'csg', u'', u'', u'', u'I', u'L', u'Chilean Sign Language', u'\r\n'),
-	(u'csh', u'', u'', u'', u'I', u'L', u'Asho Chin', u'\r\n'),
-	(u'csi', u'', u'', u'', u'I', u'E', u'Coast Miwok', u'\r\n'),
-	(u'csk', u'', u'', u'', u'I', u'L', u'Jola-Kasa', u'\r\n'),
-	(u'csl', u'', u'', u'', u'I', u'L', u'Chinese Sign Language', u'\r\n'),
-	(u'csm', u'', u'', u'', u'I', u'L', u'Central Sierra Miwok', u'\r\n'),
-	(u'csn', u'', u'', u'', u'I', u'L', u'Colombian Sign Language', u'\r\n'),
-	(u'cso', u'', u'', u'', u'I', u'L', u'Sochiapam Chinantec', u'\r\n'),
-	(u'csq', u'', u'', u'', u'I', u'L', u'Croatia Sign Language', u'\r\n'),
-	(u'csr', u'', u'', u'', u'I', u'L', u'Costa Rican Sign Language', u'\r\n'),
-	(u'css', u'', u'', u'', u'I', u'E', u'Southern Ohlone', u'\r\n'),
-	(u'cst', u'', u'', u'', u'I', u'L', u'Northern Ohlone', u'\r\n'),
-	(u'csw', u'', u'', u'', u'I', u'L', u'Swampy Cree', u'\r\n'),
-	(u'csy', u'', u'', u'', u'I', u'L', u'Siyin Chin', u'\r\n'),
-	(u'csz', u'', u'', u'', u'I', u'L', u'Coos', u'\r\n'),
-	(u'cta', u'', u'', u'', u'I', u'L', u'Tataltepec Chatino', u'\r\n'),
-	(u'ctc', u'', u'', u'', u'I', u'L', u'Chetco', u'\r\n'),
-	(u'ctd', u'', u'', u'', u'I', u'L', u'Tedim Chin', u'\r\n'),
-	(u'cte', u'', u'', u'', u'I', u'L', u'Tepinapa Chinantec', u'\r\n'),
-	(u'ctg', u'', u'', u'', u'I', u'L', u'Chittagonian', u'\r\n'),
-	(u'ctl', u'', u'', u'', u'I', u'L', u'Tlacoatzintepec Chinantec', u'\r\n'),
-	(u'ctm', u'', u'', u'', u'I', u'E', u'Chitimacha', u'\r\n'),
-	(u'ctn', u'', u'', u'', u'I', u'L', u'Chhintange', u'\r\n'),
-	(u'cto', u'', u'', u'', u'I', u'L', u'Ember\xe1-Cat\xedo', u'\r\n'),
-	(u'ctp', u'', u'', u'', u'I', u'L', u'Western Highland Chatino', u'\r\n'),
-	(u'cts', u'', u'', u'', u'I', u'L', u'Northern Catanduanes Bicolano', u'\r\n'),
-	(u'ctt', u'', u'', u'', u'I', u'L', u'Wayanad Chetti', u'\r\n'),
-	(u'ctu', u'', u'', u'', u'I', u'L', u'Chol', u'\r\n'),
-	(u'ctz', u'', u'', u'', u'I', u'L', u'Zacatepec Chatino', u'\r\n'),
-	(u'cua', u'', u'', u'', u'I', u'L', u'Cua', u'\r\n'),
-	(u'cub', u'', u'', u'', u'I', u'L', u'Cubeo', u'\r\n'),
-	(u'cuc', u'', u'', u'', u'I', u'L', u'Usila Chinantec', u'\r\n'),
-	(u'cug', u'', u'', u'', u'I', u'L', u'Cung', u'\r\n'),
-	(u'cuh', u'', u'', u'', u'I', u'L', u'Chuka', u'\r\n'),
-	(u'cui', u'', u'', u'', u'I', u'L', u'Cuiba', u'\r\n'),
-	(u'cuj', u'', u'', u'', u'I', u'L', u'Mashco Piro', u'\r\n'),
-	(u'cuk', u'', u'', u'', u'I', u'L', u'San Blas Kuna', u'\r\n'),
-	(u'cul', u'', u'', u'', u'I', u'L', u'Culina', u'\r\n'),
-	(u'cum', u'', u'', u'', u'I', u'E', u'Cumeral', u'\r\n'),
-	(u'cuo', u'', u'', u'', u'I', u'E', u'Cumanagoto', u'\r\n'),
-	(u'cup', u'', u'', u'', u'I', u'E', u'Cupe\xf1o', u'\r\n'),
-	(u'cuq', u'', u'', u'', u'I', u'L', u'Cun', u'\r\n'),
-	(u'cur', u'', u'', u'', u'I', u'L', u'Chhulung', u'\r\n'),
-	(u'cut', u'', u'', u'', u'I', u'L', u'Teutila Cuicatec', u'\r\n'),
-	(u'cuu', u'', u'', u'', u'I', u'L', u'Tai Ya', u'\r\n'),
-	(u'cuv', u'', u'', u'', u'I', u'L', u'Cuvok', u'\r\n'),
-	(u'cuw', u'', u'', u'', u'I', u'L', u'Chukwa', u'\r\n'),
-	(u'cux', u'', u'', u'', u'I', u'L', u'Tepeuxila Cuicatec', u'\r\n'),
-	(u'cvg', u'', u'', u'', u'I', u'L', u'Chug', u'\r\n'),
-	(u'cvn', u'', u'', u'', u'I', u'L', u'Valle Nacional Chinantec', u'\r\n'),
-	(u'cwa', u'', u'', u'', u'I', u'L', u'Kabwa', u'\r\n'),
-	(u'cwb', u'', u'', u'', u'I', u'L', u'Maindo', u'\r\n'),
-	(u'cwd', u'', u'', u'', u'I', u'L', u'Woods Cree', u'\r\n'),
-	(u'cwe', u'', u'', u'', u'I', u'L', u'Kwere', u'\r\n'),
-	(u'cwg', u'', u'', u'', u'I', u'L', u'Chewong', u'\r\n'),
-	(u'cwt', u'', u'', u'', u'I', u'L', u'Kuwaataay', u'\r\n'),
-	(u'cya', u'', u'', u'', u'I', u'L', u'Nopala Chatino', u'\r\n'),
-	(u'cyb', u'', u'', u'', u'I', u'E', u'Cayubaba', u'\r\n'),
-	(u'cym', u'wel', u'cym', u'cy', u'I', u'L', u'Welsh', u'\r\n'),
-	(u'cyo', u'', u'', u'', u'I', u'L', u'Cuyonon', u'\r\n'),
-	(u'czh', u'', u'', u'', u'I', u'L', u'Huizhou Chinese', u'\r\n'),
-	(u'czk', u'', u'', u'', u'I', u'E', u'Knaanic', u'\r\n'),
-	(u'czn', u'', u'', u'', u'I', u'L', u'Zenzontepec Chatino', u'\r\n'),
-	(u'czo', u'', u'', u'', u'I', u'L', u'Min Zhong Chinese', u'\r\n'),
-	(u'czt', u'', u'', u'', u'I', u'L', u'Zotung Chin', u'\r\n'),
-	(u'daa', u'', u'', u'', u'I', u'L', u'Dangal\xe9at', u'\r\n'),
-	(u'dac', u'', u'', u'', u'I', u'L', u'Dambi', u'\r\n'),
-	(u'dad', u'', u'', u'', u'I', u'L', u'Marik', u'\r\n'),
-	(u'dae', u'', u'', u'', u'I', u'L', u'Duupa', u'\r\n'),
-	(u'daf', u'', u'', u'', u'I', u'L', u'Dan', u'\r\n'),
-	(u'dag', u'', u'', u'', u'I', u'L', u'Dagbani', u'\r\n'),
-	(u'dah', u'', u'', u'', u'I', u'L', u'Gwahatike', u'\r\n'),
-	(u'dai', u'', u'', u'', u'I', u'L', u'Day', u'\r\n'),
-	(u'daj', u'', u'', u'', u'I', u'L', u'Dar Fur Daju', u'\r\n'),
-	(u'dak', u'dak', u'dak', u'', u'I', u'L', u'Dakota', u'\r\n'),
-	(u'dal', u'', u'', u'', u'I', u'L', u'Dahalo', u'\r\n'),
-	(u'dam', u'', u'', u'', u'I', u'L', u'Damakawa', u'\r\n'),
-	(u'dan', u'dan', u'dan', u'da', u'I', u'L', u'Danish', u'\r\n'),
-	(u'dao', u'', u'', u'', u'I', u'L', u'Daai Chin', u'\r\n'),
-	(u'dap', u'', u'', u'', u'I', u'L', u'Nisi (India)', u'\r\n'),
-	(u'daq', u'', u'', u'', u'I', u'L', u'Dandami Maria', u'\r\n'),
-	(u'dar', u'dar', u'dar', u'', u'I', u'L', u'Dargwa', u'\r\n'),
-	(u'das', u'', u'', u'', u'I', u'L', u'Daho-Doo', u'\r\n'),
-	(u'dau', u'', u'', u'', u'I', u'L', u'Dar Sila Daju', u'\r\n'),
-	(u'dav', u'', u'', u'', u'I', u'L', u'Taita', u'\r\n'),
-	(u'daw', u'', u'', u'', u'I', u'L', u'Davawenyo', u'\r\n'),
-	(u'dax', u'', u'', u'', u'I', u'L', u'Dayi', u'\r\n'),
-	(u'daz', u'', u'', u'', u'I', u'L', u'Dao', u'\r\n'),
-	(u'dba', u'', u'', u'', u'I', u'L', u'Bangi Me', u'\r\n'),
-	(u'dbb', u'', u'', u'', u'I', u'L', u'Deno', u'\r\n'),
-	(u'dbd', u'', u'', u'', u'I', u'L', u'Dadiya', u'\r\n'),
-	(u'dbe', u'', u'', u'', u'I', u'L', u'Dabe', u'\r\n'),
-	(u'dbf', u'', u'', u'', u'I', u'L', u'Edopi', u'\r\n'),
-	(u'dbg', u'', u'', u'', u'I', u'L', u'Dogul Dom Dogon', u'\r\n'),
-	(u'dbi', u'', u'', u'', u'I', u'L', u'Doka', u'\r\n'),
-	(u'dbj', u'', u'', u'', u'I', u'L', u"Ida'an", u'\r\n'),
-	(u'dbl', u'', u'', u'', u'I', u'L', u'Dyirbal', u'\r\n'),
-	(u'dbm', u'', u'', u'', u'I', u'L', u'Duguri', u'\r\n'),
-	(u'dbn', u'', u'', u'', u'I', u'L', u'Duriankere', u'\r\n'),
-	(u'dbo', u'', u'', u'', u'I', u'L', u'Dulbu', u'\r\n'),
-	(u'dbp', u'', u'', u'', u'I', u'L', u'Duwai', u'\r\n'),
-	(u'dbq', u'', u'', u'', u'I', u'L', u'Daba', u'\r\n'),
-	(u'dbr', u'', u'', u'', u'I', u'L', u'Dabarre', u'\r\n'),
-	(u'dbu', u'', u'', u'', u'I', u'L', u'Bondum Dom Dogon', u'\r\n'),
-	(u'dbv', u'', u'', u'', u'I', u'L', u'Dungu', u'\r\n'),
-	(u'dby', u'', u'', u'', u'I', u'L', u'Dibiyaso', u'\r\n'),
-	(u'dcc', u'', u'', u'', u'I', u'L', u'Deccan', u'\r\n'),
-	(u'dcr', u'', u'', u'', u'I', u'E', u'Negerhollands', u'\r\n'),
-	(u'ddd', u'', u'', u'', u'I', u'L', u'Dongotono', u'\r\n'),
-	(u'dde', u'', u'', u'', u'I', u'L', u'Doondo', u'\r\n'),
-	(u'ddg', u'', u'', u'', u'I', u'L', u'Fataluku', u'\r\n'),
-	(u'ddi', u'', u'', u'', u'I', u'L', u'West Goodenough', u'\r\n'),
-	(u'ddj', u'', u'', u'', u'I', u'L', u'Jaru', u'\r\n'),
-	(u'ddn', u'', u'', u'', u'I', u'L', u'Dendi (Benin)', u'\r\n'),
-	(u'ddo', u'', u'', u'', u'I', u'L', u'Dido', u'\r\n'),
-	(u'dds', u'', u'', u'', u'I', u'L', u'Donno So Dogon', u'\r\n'),
-	(u'ddw', u'', u'', u'', u'I', u'L', u'Dawera-Daweloor', u'\r\n'),
-	(u'dec', u'', u'', u'', u'I', u'L', u'Dagik', u'\r\n'),
-	(u'ded', u'', u'', u'', u'I', u'L', u'Dedua', u'\r\n'),
-	(u'dee', u'', u'', u'', u'I', u'L', u'Dewoin', u'\r\n'),
-	(u'def', u'', u'', u'', u'I', u'L', u'Dezfuli', u'\r\n'),
-	(u'deg', u'', u'', u'', u'I', u'L', u'Degema', u'\r\n'),
-	(u'deh', u'', u'', u'', u'I', u'L', u'Dehwari', u'\r\n'),
-	(u'dei', u'', u'', u'', u'I', u'L', u'Demisa', u'\r\n'),
-	(u'dek', u'', u'', u'', u'I', u'L', u'Dek', u'\r\n'),
-	(u'del', u'del', u'del', u'', u'M', u'L', u'Delaware', u'\r\n'),
-	(u'dem', u'', u'', u'', u'I', u'L', u'Dem', u'\r\n'),
-	(u'den', u'den', u'den', u'', u'M', u'L', u'Slave (Athapascan)', u'\r\n'),
-	(u'dep', u'', u'', u'', u'I', u'E', u'Pidgin Delaware', u'\r\n'),
-	(u'deq', u'', u'', u'', u'I', u'L', u'Dendi (Central African Republic)', u'\r\n'),
-	(u'der', u'', u'', u'', u'I', u'L', u'Deori', u'\r\n'),
-	(u'des', u'', u'', u'', u'I', u'L', u'Desano', u'\r\n'),
-	(u'deu', u'ger', u'deu', u'de', u'I', u'L', u'German', u'\r\n'),
-	(u'dev', u'', u'', u'', u'I', u'L', u'Domung', u'\r\n'),
-	(u'dez', u'', u'', u'', u'I', u'L', u'Dengese', u'\r\n'),
-	(u'dga', u'', u'', u'', u'I', u'L', u'Southern Dagaare', u'\r\n'),
-	(u'dgb', u'', u'', u'', u'I', u'L', u'Bunoge Dogon', u'\r\n'),
-	(u'dgc', u'', u'', u'', u'I', u'L', u'Casiguran Dumagat Agta', u'\r\n'),
-	(u'dgd', u'', u'', u'', u'I', u'L', u'Dagaari Dioula', u'\r\n'),
-	(u'dge', u'', u'', u'', u'I', u'L', u'Degenan', u'\r\n'),
-	(u'dgg', u'', u'', u'', u'I', u'L', u'Doga', u'\r\n'),
-	(u'dgh', u'', u'', u'', u'I', u'L', u'Dghwede', u'\r\n'),
-	(u'dgi', u'', u'', u'', u'I', u'L', u'Northern Dagara', u'\r\n'),
-	(u'dgk', u'', u'', u'', u'I', u'L', u'Dagba', u'\r\n'),
-	(u'dgn', u'', u'', u'', u'I', u'E', u'Dagoman', u'\r\n'),
-	(u'dgo', u'', u'', u'', u'I', u'L', u'Dogri (individual language)', u'\r\n'),
-	(u'dgr', u'dgr', u'dgr', u'', u'I', u'L', u'Dogrib', u'\r\n'),
-	(u'dgs', u'', u'', u'', u'I', u'L', u'Dogoso', u'\r\n'),
-	(u'dgu', u'', u'', u'', u'I', u'L', u'Degaru', u'\r\n'),
-	(u'dgx', u'', u'', u'', u'I', u'L', u'Doghoro', u'\r\n'),
-	(u'dgz', u'', u'', u'', u'I', u'L', u'Daga', u'\r\n'),
-	(u'dha', u'', u'', u'', u'I', u'L', u'Dhanwar (India)', u'\r\n'),
-	(u'dhd', u'', u'', u'', u'I', u'L', u'Dhundari', u'\r\n'),
-	(u'dhg', u'', u'', u'', u'I', u'L', u'Dhangu', u'\r\n'),
-	(u'dhi', u'', u'', u'', u'I', u'L', u'Dhimal', u'\r\n'),
-	(u'dhl', u'', u'', u'', u'I', u'L', u'Dhalandji', u'\r\n'),
-	(u'dhm', u'', u'', u'', u'I', u'L', u'Zemba', u'\r\n'),
-	(u'dhn', u'', u'', u'', u'I', u'L', u'Dhanki', u'\r\n'),
-	(u'dho', u'', u'', u'', u'I', u'L', u'Dhodia', u'\r\n'),
-	(u'dhr', u'', u'', u'', u'I', u'L', u'Dhargari', u'\r\n'),
-	(u'dhs', u'', u'', u'', u'I', u'L', u'Dhaiso', u'\r\n'),
-	(u'dhu', u'', u'', u'', u'I', u'E', u'Dhurga', u'\r\n'),
-	(u'dhv', u'', u'', u'', u'I', u'L', u'Dehu', u'\r\n'),
-	(u'dhw', u'', u'', u'', u'I', u'L', u'Dhanwar (Nepal)', u'\r\n'),
-	(u'dia', u'', u'', u'', u'I', u'L', u'Dia', u'\r\n'),
-	(u'dib', u'', u'', u'', u'I', u'L', u'South Central Dinka', u'\r\n'),
-	(u'dic', u'', u'', u'', u'I', u'L', u'Lakota Dida', u'\r\n'),
-	(u'did', u'', u'', u'', u'I', u'L', u'Didinga', u'\r\n'),
-	(u'dif', u'', u'', u'', u'I', u'E', u'Dieri', u'\r\n'),
-	(u'dig', u'', u'', u'', u'I', u'L', u'Digo', u'\r\n'),
-	(u'dih', u'', u'', u'', u'I', u'L', u'Kumiai', u'\r\n'),
-	(u'dii', u'', u'', u'', u'I', u'L', u'Dimbong', u'\r\n'),
-	(u'dij', u'', u'', u'', u'I', u'L', u'Dai', u'\r\n'),
-	(u'dik', u'', u'', u'', u'I', u'L', u'Southwestern Dinka', u'\r\n'),
-	(u'dil', u'', u'', u'', u'I', u'L', u'Dilling', u'\r\n'),
-	(u'dim', u'', u'', u'', u'I', u'L', u'Dime', u'\r\n'),
-	(u'din', u'din', u'din', u'', u'M', u'L', u'Dinka', u'\r\n'),
-	(u'dio', u'', u'', u'', u'I', u'L', u'Dibo', u'\r\n'),
-	(u'dip', u'', u'', u'', u'I', u'L', u'Northeastern Dinka', u'\r\n'),
-	(u'diq', u'', u'', u'', u'I', u'L', u'Dimli (individual language)', u'\r\n'),
-	(u'dir', u'', u'', u'', u'I', u'L', u'Dirim', u'\r\n'),
-	(u'dis', u'', u'', u'', u'I', u'L', u'Dimasa', u'\r\n'),
-	(u'dit', u'', u'', u'', u'I', u'E', u'Dirari', u'\r\n'),
-	(u'diu', u'', u'', u'', u'I', u'L', u'Diriku', u'\r\n'),
-	(u'div', u'div', u'div', u'dv', u'I', u'L', u'Dhivehi', u'\r\n'),
-	(u'diw', u'', u'', u'', u'I', u'L', u'Northwestern Dinka', u'\r\n'),
-	(u'dix', u'', u'', u'', u'I', u'L', u'Dixon Reef', u'\r\n'),
-	(u'diy', u'', u'', u'', u'I', u'L', u'Diuwe', u'\r\n'),
-	(u'diz', u'', u'', u'', u'I', u'L', u'Ding', u'\r\n'),
-	(u'djb', u'', u'', u'', u'I', u'L', u'Djinba', u'\r\n'),
-	(u'djc', u'', u'', u'', u'I', u'L', u'Dar Daju Daju', u'\r\n'),
-	(u'djd', u'', u'', u'', u'I', u'L', u'Djamindjung', u'\r\n'),
-	(u'dje', u'', u'', u'', u'I', u'L', u'Zarma', u'\r\n'),
-	(u'djf', u'', u'', u'', u'I', u'E', u'Djangun', u'\r\n'),
-	(u'dji', u'', u'', u'', u'I', u'L', u'Djinang', u'\r\n'),
-	(u'djj', u'', u'', u'', u'I', u'L', u'Djeebbana', u'\r\n'),
-	(u'djk', u'', u'', u'', u'I', u'L', u'Eastern Maroon Creole', u'\r\n'),
-	(u'djl', u'', u'', u'', u'I', u'E', u'Djiwarli', u'\r\n'),
-	(u'djm', u'', u'', u'', u'I', u'L', u'Jamsay Dogon', u'\r\n'),
-	(u'djn', u'', u'', u'', u'I', u'L', u'Djauan', u'\r\n'),
-	(u'djo', u'', u'', u'', u'I', u'L', u'Jangkang', u'\r\n'),
-	(u'djr', u'', u'', u'', u'I', u'L', u'Djambarrpuyngu', u'\r\n'),
-	(u'dju', u'', u'', u'', u'I', u'L', u'Kapriman', u'\r\n'),
-	(u'djw', u'', u'', u'', u'I', u'E', u'Djawi', u'\r\n'),
-	(u'dka', u'', u'', u'', u'I', u'L', u'Dakpakha', u'\r\n'),
-	(u'dkk', u'', u'', u'', u'I', u'L', u'Dakka', u'\r\n'),
-	(u'dkl', u'', u'', u'', u'I', u'L', u'Kolum So Dogon', u'\r\n'),
-	(u'dkr', u'', u'', u'', u'I', u'L', u'Kuijau', u'\r\n'),
-	(u'dks', u'', u'', u'', u'I', u'L', u'Southeastern Dinka', u'\r\n'),
-	(u'dkx', u'', u'', u'', u'I', u'L', u'Mazagway', u'\r\n'),
-	(u'dlg', u'', u'', u'', u'I', u'L', u'Dolgan', u'\r\n'),
-	(u'dlm', u'', u'', u'', u'I', u'E', u'Dalmatian', u'\r\n'),
-	(u'dln', u'', u'', u'', u'I', u'L', u'Darlong', u'\r\n'),
-	(u'dma', u'', u'', u'', u'I', u'L', u'Duma', u'\r\n'),
-	(u'dmc', u'', u'', u'', u'I', u'L', u'Dimir', u'\r\n'),
-	(u'dme', u'', u'', u'', u'I', u'L', u'Dugwor', u'\r\n'),
-	(u'dmg', u'', u'', u'', u'I', u'L', u'Upper Kinabatangan', u'\r\n'),
-	(u'dmk', u'', u'', u'', u'I', u'L', u'Domaaki', u'\r\n'),
-	(u'dml', u'', u'', u'', u'I', u'L', u'Dameli', u'\r\n'),
-	(u'dmm', u'', u'', u'', u'I', u'L', u'Dama', u'\r\n'),
-	(u'dmo', u'', u'', u'', u'I', u'L', u'Kemezung', u'\r\n'),
-	(u'dmr', u'', u'', u'', u'I', u'L', u'East Damar', u'\r\n'),
-	(u'dms', u'', u'', u'', u'I', u'L', u'Dampelas', u'\r\n'),
-	(u'dmu', u'', u'', u'', u'I', u'L', u'Dubu', u'\r\n'),
-	(u'dmv', u'', u'', u'', u'I', u'L', u'Dumpas', u'\r\n'),
-	(u'dmx', u'', u'', u'', u'I', u'L', u'Dema', u'\r\n'),
-	(u'dmy', u'', u'', u'', u'I', u'L', u'Demta', u'\r\n'),
-	(u'dna', u'', u'', u'', u'I', u'L', u'Upper Grand Valley Dani', u'\r\n'),
-	(u'dnd', u'', u'', u'', u'I', u'L', u'Daonda', u'\r\n'),
-	(u'dne', u'', u'', u'', u'I', u'L', u'Ndendeule', u'\r\n'),
-	(u'dng', u'', u'', u'', u'I', u'L', u'Dungan', u'\r\n'),
-	(u'dni', u'', u'', u'', u'I', u'L', u'Lower Grand Valley Dani', u'\r\n'),
-	(u'dnk', u'', u'', u'', u'I', u'L', u'Dengka', u'\r\n'),
-	(u'dnn', u'', u'', u'', u'I', u'L', u'Dz\xf9\xf9ngoo', u'\r\n'),
-	(u'dnr', u'', u'', u'', u'I', u'L', u'Danaru', u'\r\n'),
-	(u'dnt', u'', u'', u'', u'I', u'L', u'Mid Grand Valley Dani', u'\r\n'),
-	(u'dnu', u'', u'', u'', u'I', u'L', u'Danau', u'\r\n'),
-	(u'dnw', u'', u'', u'', u'I', u'L', u'Western Dani', u'\r\n'),
-	(u'dny', u'', u'', u'', u'I', u'L', u'Den\xed', u'\r\n'),
-	(u'doa', u'', u'', u'', u'I', u'L', u'Dom', u'\r\n'),
-	(u'dob', u'', u'', u'', u'I', u'L', u'Dobu', u'\r\n'),
-	(u'doc', u'', u'', u'', u'I', u'L', u'Northern Dong', u'\r\n'),
-	(u'doe', u'', u'', u'', u'I', u'L', u'Doe', u'\r\n'),
-	(u'dof', u'', u'', u'', u'I', u'L', u'Domu', u'\r\n'),
-	(u'doh', u'', u'', u'', u'I', u'L', u'Dong', u'\r\n'),
-	(u'doi', u'doi', u'doi', u'', u'M', u'L', u'Dogri (macrolanguage)', u'\r\n'),
-	(u'dok', u'', u'', u'', u'I', u'L', u'Dondo', u'\r\n'),
-	(u'dol', u'', u'', u'', u'I', u'L', u'Doso', u'\r\n'),
-	(u'don', u'', u'', u'', u'I', u'L', u'Toura (Papua New Guinea)', u'\r\n'),
-	(u'doo', u'', u'', u'', u'I', u'L', u'Dongo', u'\r\n'),
-	(u'dop', u'', u'', u'', u'I', u'L', u'Lukpa', u'\r\n'),
-	(u'doq', u'', u'', u'', u'I', u'L', u'Dominican Sign Language', u'\r\n'),
-	(u'dor', u'', u'', u'', u'I', u'L', u"Dori'o", u'\r\n'),
-	(u'dos', u'', u'', u'', u'I', u'L', u'Dogos\xe9', u'\r\n'),
-	(u'dot', u'', u'', u'', u'I', u'L', u'Dass', u'\r\n'),
-	(u'dov', u'', u'', u'', u'I', u'L', u'Dombe', u'\r\n'),
-	(u'dow', u'', u'', u'', u'I', u'L', u'Doyayo', u'\r\n'),
-	(u'dox', u'', u'', u'', u'I', u'L', u'Bussa', u'\r\n'),
-	(u'doy', u'', u'', u'', u'I', u'L', u'Dompo', u'\r\n'),
-	(u'doz', u'', u'', u'', u'I', u'L', u'Dorze', u'\r\n'),
-	(u'dpp', u'', u'', u'', u'I', u'L', u'Papar', u'\r\n'),
-	(u'drb', u'', u'', u'', u'I', u'L', u'Dair', u'\r\n'),
-	(u'drd', u'', u'', u'', u'I', u'L', u'Darmiya', u'\r\n'),
-	(u'dre', u'', u'', u'', u'I', u'L', u'Dolpo', u'\r\n'),
-	(u'drg', u'', u'', u'', u'I', u'L', u'Rungus', u'\r\n'),
-	(u'dri', u'', u'', u'', u'I', u'L', u"C'lela", u'\r\n'),
-	(u'drl', u'', u'', u'', u'I', u'L', u'Darling', u'\r\n'),
-	(u'drn', u'', u'', u'', u'I', u'L', u'West Damar', u'\r\n'),
-	(u'dro', u'', u'', u'', u'I', u'L', u'Daro-Matu Melanau', u'\r\n'),
-	(u'drq', u'', u'', u'', u'I', u'E', u'Dura', u'\r\n'),
-	(u'drr', u'', u'', u'', u'I', u'E', u'Dororo', u'\r\n'),
-	(u'drs', u'', u'', u'', u'I', u'L', u'Gedeo', u'\r\n'),
-	(u'drt', u'', u'', u'', u'I', u'L', u'Drents', u'\r\n'),
-	(u'dru', u'', u'', u'', u'I', u'L', u'Rukai', u'\r\n'),
-	(u'dry', u'', u'', u'', u'I', u'L', u'Darai', u'\r\n'),
-	(u'dsb', u'dsb', u'dsb', u'', u'I', u'L', u'Lower Sorbian', u'\r\n'),
-	(u'dse', u'', u'', u'', u'I', u'L', u'Dutch Sign Language', u'\r\n'),
-	(u'dsh', u'', u'', u'', u'I', u'L', u'Daasanach', u'\r\n'),
-	(u'dsi', u'', u'', u'', u'I', u'L', u'Disa', u'\r\n'),
-	(u'dsl', u'', u'', u'', u'I', u'L', u'Danish Sign Language', u'\r\n'),
-	(u'dsn', u'', u'', u'', u'I', u'L', u'Dusner', u'\r\n'),
-	(u'dso', u'', u'', u'', u'I', u'L', u'Desiya', u'\r\n'),
-	(u'dsq', u'', u'', u'', u'I', u'L', u'Tadaksahak', u'\r\n'),
-	(u'dta', u'', u'', u'', u'I', u'L', u'Daur', u'\r\n'),
-	(u'dtb', u'', u'', u'', u'I', u'L', u'Labuk-Kinabatangan Kadazan', u'\r\n'),
-	(u'dti', u'', u'', u'', u'I', u'L', u'Ana Tinga Dogon', u'\r\n'),
-	(u'dtk', u'', u'', u'', u'I', u'L', u'Tene Kan Dogon', u'\r\n'),
-	(u'dtm', u'', u'', u'', u'I', u'L', u'Tomo Kan Dogon', u'\r\n'),
-	(u'dtp', u'', u'', u'', u'I', u'L', u'Central Dusun', u'\r\n'),
-	(u'dtr', u'', u'', u'', u'I', u'L', u'Lotud', u'\r\n'),
-	(u'dts', u'', u'', u'', u'I', u'L', u'Toro So Dogon', u'\r\n'),
-	(u'dtt', u'', u'', u'', u'I', u'L', u'Toro Tegu Dogon', u'\r\n'),
-	(u'dtu', u'', u'', u'', u'I', u'L', u'Tebul Ure Dogon', u'\r\n'),
-	(u'dua', u'dua', u'dua', u'', u'I', u'L', u'Duala', u'\r\n'),
-	(u'dub', u'', u'', u'', u'I', u'L', u'Dubli', u'\r\n'),
-	(u'duc', u'', u'', u'', u'I', u'L', u'Duna', u'\r\n'),
-	(u'dud', u'', u'', u'', u'I', u'L', u'Hun-Saare', u'\r\n'),
-	(u'due', u'', u'', u'', u'I', u'L', u'Umiray Dumaget Agta', u'\r\n'),
-	(u'duf', u'', u'', u'', u'I', u'L', u'Dumbea', u'\r\n'),
-	(u'dug', u'', u'', u'', u'I', u'L', u'Duruma', u'\r\n'),
-	(u'duh', u'', u'', u'', u'I', u'L', u'Dungra Bhil', u'\r\n'),
-	(u'dui', u'', u'', u'', u'I', u'L', u'Dumun', u'\r\n'),
-	(u'duj', u'', u'', u'', u'I', u'L', u'Dhuwal', u'\r\n'),
-	(u'duk', u'', u'', u'', u'I', u'L', u'Duduela', u'\r\n'),
-	(u'dul', u'', u'', u'', u'I', u'L', u'Alabat Island Agta', u'\r\n'),
-	(u'dum', u'dum', u'dum', u'', u'I', u'H', u'Middle Dutch (ca. 1050-1350)', u'\r\n'),
-	(u'dun', u'', u'', u'', u'I', u'L', u'Dusun Deyah', u'\r\n'),
-	(u'duo', u'', u'', u'', u'I', u'L', u'Dupaninan Agta', u'\r\n'),
-	(u'dup', u'', u'', u'', u'I', u'L', u'Duano', u'\r\n'),
-	(u'duq', u'', u'', u'', u'I', u'L', u'Dusun Malang', u'\r\n'),
-	(u'dur', u'', u'', u'', u'I', u'L', u'Dii', u'\r\n'),
-	(u'dus', u'', u'', u'', u'I', u'L', u'Dumi', u'\r\n'),
-	(u'duu', u'', u'', u'', u'I', u'L', u'Drung', u'\r\n'),
-	(u'duv', u'', u'', u'', u'I', u'L', u'Duvle', u'\r\n'),
-	(u'duw', u'', u'', u'', u'I', u'L', u'Dusun Witu', u'\r\n'),
-	(u'dux', u'', u'', u'', u'I', u'L', u'Duungooma', u'\r\n'),
-	(u'duy', u'', u'', u'', u'I', u'E', u'Dicamay Agta', u'\r\n'),
-	(u'duz', u'', u'', u'', u'I', u'E', u'Duli', u'\r\n'),
-	(u'dva', u'', u'', u'', u'I', u'L', u'Duau', u'\r\n'),
-	(u'dwa', u'', u'', u'', u'I', u'L', u'Diri', u'\r\n'),
-	(u'dwl', u'', u'', u'', u'I', u'L', u'Walo Kumbe Dogon', u'\r\n'),
-	(u'dwr', u'', u'', u'', u'I', u'L', u'Dawro', u'\r\n'),
-	(u'dws', u'', u'', u'', u'I', u'C', u'Dutton World Speedwords', u'\r\n'),
-	(u'dww', u'', u'', u'', u'I', u'L', u'Dawawa', u'\r\n'),
-	(u'dya', u'', u'', u'', u'I', u'L', u'Dyan', u'\r\n'),
-	(u'dyb', u'', u'', u'', u'I', u'E', u'Dyaberdyaber', u'\r\n'),
-	(u'dyd', u'', u'', u'', u'I', u'E', u'Dyugun', u'\r\n'),
-	(u'dyg', u'', u'', u'', u'I', u'E', u'Villa Viciosa Agta', u'\r\n'),
-	(u'dyi', u'', u'', u'', u'I', u'L', u'Djimini Senoufo', u'\r\n'),
-	(u'dym', u'', u'', u'', u'I', u'L', u'Yanda Dom Dogon', u'\r\n'),
-	(u'dyn', u'', u'', u'', u'I', u'L', u'Dyangadi', u'\r\n'),
-	(u'dyo', u'', u'', u'', u'I', u'L', u'Jola-Fonyi', u'\r\n'),
-	(u'dyu', u'dyu', u'dyu', u'', u'I', u'L', u'Dyula', u'\r\n'),
-	(u'dyy', u'', u'', u'', u'I', u'L', u'Dyaabugay', u'\r\n'),
-	(u'dza', u'', u'', u'', u'I', u'L', u'Tunzu', u'\r\n'),
-	(u'dzd', u'', u'', u'', u'I', u'L', u'Daza', u'\r\n'),
-	(u'dzg', u'', u'', u'', u'I', u'L', u'Dazaga', u'\r\n'),
-	(u'dzl', u'', u'', u'', u'I', u'L', u'Dzalakha', u'\r\n'),
-	(u'dzn', u'', u'', u'', u'I', u'L', u'Dzando', u'\r\n'),
-	(u'dzo', u'dzo', u'dzo', u'dz', u'I', u'L', u'Dzongkha', u'\r\n'),
-	(u'ebg', u'', u'', u'', u'I', u'L', u'Ebughu', u'\r\n'),
-	(u'ebk', u'', u'', u'', u'I', u'L', u'Eastern Bontok', u'\r\n'),
-	(u'ebo', u'', u'', u'', u'I', u'L', u'Teke-Ebo', u'\r\n'),
-	(u'ebr', u'', u'', u'', u'I', u'L', u'Ebri\xe9', u'\r\n'),
-	(u'ebu', u'', u'', u'', u'I', u'L', u'Embu', u'\r\n'),
-	(u'ecr', u'', u'', u'', u'I', u'A', u'Eteocretan', u'\r\n'),
-	(u'ecs', u'', u'', u'', u'I', u'L', u'Ecuadorian Sign Language', u'\r\n'),
-	(u'ecy', u'', u'', u'', u'I', u'A', u'Eteocypriot', u'\r\n'),
-	(u'eee', u'', u'', u'', u'I', u'L', u'E', u'\r\n'),
-	(u'efa', u'', u'', u'', u'I', u'L', u'Efai', u'\r\n'),
-	(u'efe', u'', u'', u'', u'I', u'L', u'Efe', u'\r\n'),
-	(u'efi', u'efi', u'efi', u'', u'I', u'L', u'Efik', u'\r\n'),
-	(u'ega', u'', u'', u'', u'I', u'L', u'Ega', u'\r\n'),
-	(u'egl', u'', u'', u'', u'I', u'L', u'Emilian', u'\r\n'),
-	(u'ego', u'', u'', u'', u'I', u'L', u'Eggon', u'\r\n'),
-	(u'egy', u'egy', u'egy', u'', u'I', u'A', u'Egyptian (Ancient)', u'\r\n'),
-	(u'ehu', u'', u'', u'', u'I', u'L', u'Ehueun', u'\r\n'),
-	(u'eip', u'', u'', u'', u'I', u'L', u'Eipomek', u'\r\n'),
-	(u'eit', u'', u'', u'', u'I', u'L', u'Eitiep', u'\r\n'),
-	(u'eiv', u'', u'', u'', u'I', u'L', u'Askopan', u'\r\n'),
-	(u'eja', u'', u'', u'', u'I', u'L', u'Ejamat', u'\r\n'),
-	(u'eka', u'eka', u'eka', u'', u'I', u'L', u'Ekajuk', u'\r\n'),
-	(u'eke', u'', u'', u'', u'I', u'L', u'Ekit', u'\r\n'),
-	(u'ekg', u'', u'', u'', u'I', u'L', u'Ekari', u'\r\n'),
-	(u'eki', u'', u'', u'', u'I', u'L', u'Eki', u'\r\n'),
-	(u'ekk', u'', u'', u'', u'I', u'L', u'Standard Estonian', u'\r\n'),
-	(u'ekl', u'', u'', u'', u'I', u'L', u'Kol', u'\r\n'),
-	(u'ekm', u'', u'', u'', u'I', u'L', u'Elip', u'\r\n'),
-	(u'eko', u'', u'', u'', u'I', u'L', u'Koti', u'\r\n'),
-	(u'ekp', u'', u'', u'', u'I', u'L', u'Ekpeye', u'\r\n'),
-	(u'ekr', u'', u'', u'', u'I', u'L', u'Yace', u'\r\n'),
-	(u'eky', u'', u'', u'', u'I', u'L', u'Eastern Kayah', u'\r\n'),
-	(u'ele', u'', u'', u'', u'I', u'L', u'Elepi', u'\r\n'),
-	(u'elh', u'', u'', u'', u'I', u'L', u'El Hugeirat', u'\r\n'),
-	(u'eli', u'', u'', u'', u'I', u'E', u'Nding', u'\r\n'),
-	(u'elk', u'', u'', u'', u'I', u'L', u'Elkei', u'\r\n'),
-	(u'ell', u'gre', u'ell', u'el', u'I', u'L', u'Modern Greek (1453-)', u'\r\n'),
-	(u'elm', u'', u'', u'', u'I', u'L', u'Eleme', u'\r\n'),
-	(u'elo', u'', u'', u'', u'I', u'L', u'El Molo', u'\r\n'),
-	(u'elp', u'', u'', u'', u'I', u'L', u'Elpaputih', u'\r\n'),
-	(u'elu', u'', u'', u'', u'I', u'L', u'Elu', u'\r\n'),
-	(u'elx', u'elx', u'elx', u'', u'I', u'A', u'Elamite', u'\r\n'),
-	(u'ema', u'', u'', u'', u'I', u'L', u'Emai-Iuleha-Ora', u'\r\n'),
-	(u'emb', u'', u'', u'', u'I', u'L', u'Embaloh', u'\r\n'),
-	(u'eme', u'', u'', u'', u'I', u'L', u'Emerillon', u'\r\n'),
-	(u'emg', u'', u'', u'', u'I', u'L', u'Eastern Meohang', u'\r\n'),
-	(u'emi', u'', u'', u'', u'I', u'L', u'Mussau-Emira', u'\r\n'),
-	(u'emk', u'', u'', u'', u'I', u'L', u'Eastern Maninkakan', u'\r\n'),
-	(u'emm', u'', u'', u'', u'I', u'E', u'Mamulique', u'\r\n'),
-	(u'emn', u'', u'', u'', u'I', u'L', u'Eman', u'\r\n'),
-	(u'emo', u'', u'', u'', u'I', u'E', u'Emok', u'\r\n'),
-	(u'emp', u'', u'', u'', u'I', u'L', u'Northern Ember\xe1', u'\r\n'),
-	(u'ems', u'', u'', u'', u'I', u'L', u'Pacific Gulf Yupik', u'\r\n'),
-	(u'emu', u'', u'', u'', u'I', u'L', u'Eastern Muria', u'\r\n'),
-	(u'emw', u'', u'', u'', u'I', u'L', u'Emplawas', u'\r\n'),
-	(u'emx', u'', u'', u'', u'I', u'L', u'Erromintxela', u'\r\n'),
-	(u'emy', u'', u'', u'', u'I', u'E', u'Epigraphic Mayan', u'\r\n'),
-	(u'ena', u'', u'', u'', u'I', u'L', u'Apali', u'\r\n'),
-	(u'enb', u'', u'', u'', u'I', u'L', u'Markweeta', u'\r\n'),
-	(u'enc', u'', u'', u'', u'I', u'L', u'En', u'\r\n'),
-	(u'end', u'', u'', u'', u'I', u'L', u'Ende', u'\r\n'),
-	(u'enf', u'', u'', u'', u'I', u'L', u'Forest Enets', u'\r\n'),
-	(u'eng', u'eng', u'eng', u'en', u'I', u'L', u'English', u'\r\n'),
-	(u'enh', u'', u'', u'', u'I', u'L', u'Tundra Enets', u'\r\n'),
-	(u'enm', u'enm', u'enm', u'', u'I', u'H', u'Middle English (1100-1500)', u'\r\n'),
-	(u'enn', u'', u'', u'', u'I', u'L', u'Engenni', u'\r\n'),
-	(u'eno', u'', u'', u'', u'I', u'L', u'Enggano', u'\r\n'),
-	(u'enq', u'', u'', u'', u'I', u'L', u'Enga', u'\r\n'),
-	(u'enr', u'', u'', u'', u'I', u'L', u'Emumu', u'\r\n'),
-	(u'enu', u'', u'', u'', u'I', u'L', u'Enu', u'\r\n'),
-	(u'env', u'', u'', u'', u'I', u'L', u'Enwan (Edu State)', u'\r\n'),
-	(u'enw', u'', u'', u'', u'I', u'L', u'Enwan (Akwa Ibom State)', u'\r\n'),
-	(u'eot', u'', u'', u'', u'I', u'L', u"Beti (C\xf4te d'Ivoire)", u'\r\n'),
-	(u'epi', u'', u'', u'', u'I', u'L', u'Epie', u'\r\n'),
-	(u'epo', u'epo', u'epo', u'eo', u'I', u'C', u'Esperanto', u'\r\n'),
-	(u'era', u'', u'', u'', u'I', u'L', u'Eravallan', u'\r\n'),
-	(u'erg', u'', u'', u'', u'I', u'L', u'Sie', u'\r\n'),
-	(u'erh', u'', u'', u'', u'I', u'L', u'Eruwa', u'\r\n'),
-	(u'eri', u'', u'', u'', u'I', u'L', u'Ogea', u'\r\n'),
-	(u'erk', u'', u'', u'', u'I', u'L', u'South Efate', u'\r\n'),
-	(u'ero', u'', u'', u'', u'I', u'L', u'Horpa', u'\r\n'),
-	(u'err', u'', u'', u'', u'I', u'E', u'Erre', u'\r\n'),
-	(u'ers', u'', u'', u'', u'I', u'L', u'Ersu', u'\r\n'),
-	(u'ert', u'', u'', u'', u'I', u'L', u'Eritai', u'\r\n'),
-	(u'erw', u'', u'', u'', u'I', u'L', u'Erokwanas', u'\r\n'),
-	(u'ese', u'', u'', u'', u'I', u'L', u'Ese Ejja', u'\r\n'),
-	(u'esh', u'', u'', u'', u'I', u'L', u'Eshtehardi', u'\r\n'),
-	(u'esi', u'', u'', u'', u'I', u'L', u'North Alaskan Inupiatun', u'\r\n'),
-	(u'esk', u'', u'', u'', u'I', u'L', u'Northwest Alaska Inupiatun', u'\r\n'),
-	(u'esl', u'', u'', u'', u'I', u'L', u'Egypt Sign Language', u'\r\n'),
-	(u'esm', u'', u'', u'', u'I', u'E', u'Esuma', u'\r\n'),
-	(u'esn', u'', u'', u'', u'I', u'L', u'Salvadoran Sign Language', u'\r\n'),
-	(u'eso', u'', u'', u'', u'I', u'L', u'Estonian Sign Language', u'\r\n'),
-	(u'esq', u'', u'', u'', u'I', u'E', u'Esselen', u'\r\n'),
-	(u'ess', u'', u'', u'', u'I', u'L', u'Central Siberian Yupik', u'\r\n'),
-	(u'est', u'est', u'est', u'et', u'M', u'L', u'Estonian', u'\r\n'),
-	(u'esu', u'', u'', u'', u'I', u'L', u'Central Yupik', u'\r\n'),
-	(u'etb', u'', u'', u'', u'I', u'L', u'Etebi', u'\r\n'),
-	(u'etc', u'', u'', u'', u'I', u'E', u'Etchemin', u'\r\n'),
-	(u'eth', u'', u'', u'', u'I', u'L', u'Ethiopian Sign Language', u'\r\n'),
-	(u'etn', u'', u'', u'', u'I', u'L', u'Eton (Vanuatu)', u'\r\n'),
-	(u'eto', u'', u'', u'', u'I', u'L', u'Eton (Cameroon)', u'\r\n'),
-	(u'etr', u'', u'', u'', u'I', u'L', u'Edolo', u'\r\n'),
-	(u'ets', u'', u'', u'', u'I', u'L', u'Yekhee', u'\r\n'),
-	(u'ett', u'', u'', u'', u'I', u'A', u'Etruscan', u'\r\n'),
-	(u'etu', u'', u'', u'', u'I', u'L', u'Ejagham', u'\r\n'),
-	(u'etx', u'', u'', u'', u'I', u'L', u'Eten', u'\r\n'),
-	(u'etz', u'', u'', u'', u'I', u'L', u'Semimi', u'\r\n'),
-	(u'eus', u'baq', u'eus', u'eu', u'I', u'L', u'Basque', u'\r\n'),
-	(u'eve', u'', u'', u'', u'I', u'L', u'Even', u'\r\n'),
-	(u'evh', u'', u'', u'', u'I', u'L', u'Uvbie', u'\r\n'),
-	(u'evn', u'', u'', u'', u'I', u'L', u'Evenki', u'\r\n'),
-	(u'ewe', u'ewe', u'ewe', u'ee', u'I', u'L', u'Ewe', u'\r\n'),
-	(u'ewo', u'ewo', u'ewo', u'', u'I', u'L', u'Ewondo', u'\r\n'),
-	(u'ext', u'', u'', u'', u'I', u'L', u'Extremaduran', u'\r\n'),
-	(u'eya', u'', u'', u'', u'I', u'E', u'Eyak', u'\r\n'),
-	(u'eyo', u'', u'', u'', u'I', u'L', u'Keiyo', u'\r\n'),
-	(u'eze', u'', u'', u'', u'I', u'L', u'Uzekwe', u'\r\n'),
-	(u'faa', u'', u'', u'', u'I', u'L', u'Fasu', u'\r\n'),
-	(u'fab', u'', u'', u'', u'I', u'L', u"Fa D'ambu", u'\r\n'),
-	(u'fad', u'', u'', u'', u'I', u'L', u'Wagi', u'\r\n'),
-	(u'faf', u'', u'', u'', u'I', u'L', u'Fagani', u'\r\n'),
-	(u'fag', u'', u'', u'', u'I', u'L', u'Finongan', u'\r\n'),
-	(u'fah', u'', u'', u'', u'I', u'L', u'Baissa Fali', u'\r\n'),
-	(u'fai', u'', u'', u'', u'I', u'L', u'Faiwol', u'\r\n'),
-	(u'faj', u'', u'', u'', u'I', u'L', u'Faita', u'\r\n'),
-	(u'fak', u'', u'', u'', u'I', u'L', u'Fang (Cameroon)', u'\r\n'),
-	(u'fal', u'', u'', u'', u'I', u'L', u'South Fali', u'\r\n'),
-	(u'fam', u'', u'', u'', u'I', u'L', u'Fam', u'\r\n'),
-	(u'fan', u'fan', u'fan', u'', u'I', u'L', u'Fang (Equatorial Guinea)', u'\r\n'),
-	(u'fao', u'fao', u'fao', u'fo', u'I', u'L', u'Faroese', u'\r\n'),
-	(u'fap', u'', u'', u'', u'I', u'L', u'Palor', u'\r\n'),
-	(u'far', u'', u'', u'', u'I', u'L', u'Fataleka', u'\r\n'),
-	(u'fas', u'per', u'fas', u'fa', u'M', u'L', u'Persian', u'\r\n'),
-	(u'fat', u'fat', u'fat', u'', u'I', u'L', u'Fanti', u'\r\n'),
-	(u'fau', u'', u'', u'', u'I', u'L', u'Fayu', u'\r\n'),
-	(u'fax', u'', u'', u'', u'I', u'L', u'Fala', u'\r\n'),
-	(u'fay', u'', u'', u'', u'I', u'L', u'Southwestern Fars', u'\r\n'),
-	(u'faz', u'', u'', u'', u'I', u'L', u'Northwestern Fars', u'\r\n'),
-	(u'fbl', u'', u'', u'', u'I', u'L', u'West Albay Bikol', u'\r\n'),
-	(u'fcs', u'', u'', u'', u'I', u'L', u'Quebec Sign Language', u'\r\n'),
-	(u'fer', u'', u'', u'', u'I', u'L', u'Feroge', u'\r\n'),
-	(u'ffi', u'', u'', u'', u'I', u'L', u'Foia Foia', u'\r\n'),
-	(u'ffm', u'', u'', u'', u'I', u'L', u'Maasina Fulfulde', u'\r\n'),
-	(u'fgr', u'', u'', u'', u'I', u'L', u'Fongoro', u'\r\n'),
-	(u'fia', u'', u'', u'', u'I', u'L', u'Nobiin', u'\r\n'),
-	(u'fie', u'', u'', u'', u'I', u'L', u'Fyer', u'\r\n'),
-	(u'fij', u'fij', u'fij', u'fj', u'I', u'L', u'Fijian', u'\r\n'),
-	(u'fil', u'fil', u'fil', u'', u'I', u'L', u'Filipino', u'\r\n'),
-	(u'fin', u'fin', u'fin', u'fi', u'I', u'L', u'Finnish', u'\r\n'),
-	(u'fip', u'', u'', u'', u'I', u'L', u'Fipa', u'\r\n'),
-	(u'fir', u'', u'', u'', u'I', u'L', u'Firan', u'\r\n'),
-	(u'fit', u'', u'', u'', u'I', u'L', u'Tornedalen Finnish', u'\r\n'),
-	(u'fiw', u'', u'', u'', u'I', u'L', u'Fiwaga', u'\r\n'),
-	(u'fkv', u'', u'', u'', u'I', u'L', u'Kven Finnish', u'\r\n'),
-	(u'fla', u'', u'', u'', u'I', u'L', u"Kalispel-Pend d'Oreille", u'\r\n'),
-	(u'flh', u'', u'', u'', u'I', u'L', u'Foau', u'\r\n'),
-	(u'fli', u'', u'', u'', u'I', u'L', u'Fali', u'\r\n'),
-	(u'fll', u'', u'', u'', u'I', u'L', u'North Fali', u'\r\n'),
-	(u'fln', u'', u'', u'', u'I', u'E', u'Flinders Island', u'\r\n'),
-	(u'flr', u'', u'', u'', u'I', u'L', u'Fuliiru', u'\r\n'),
-	(u'fly', u'', u'', u'', u'I', u'L', u'Tsotsitaal', u'\r\n'),
-	(u'fmp', u'', u'', u'', u'I', u'L', u"Fe'fe'", u'\r\n'),
-	(u'fmu', u'', u'', u'', u'I', u'L', u'Far Western Muria', u'\r\n'),
-	(u'fng', u'', u'', u'', u'I', u'L', u'Fanagalo', u'\r\n'),
-	(u'fni', u'', u'', u'', u'I', u'L', u'Fania', u'\r\n'),
-	(u'fod', u'', u'', u'', u'I', u'L', u'Foodo', u'\r\n'),
-	(u'foi', u'', u'', u'', u'I', u'L', u'Foi', u'\r\n'),
-	(u'fom', u'', u'', u'', u'I', u'L', u'Foma', u'\r\n'),
-	(u'fon', u'fon', u'fon', u'', u'I', u'L', u'Fon', u'\r\n'),
-	(u'for', u'', u'', u'', u'I', u'L', u'Fore', u'\r\n'),
-	(u'fos', u'', u'', u'', u'I', u'E', u'Siraya', u'\r\n'),
-	(u'fpe', u'', u'', u'', u'I', u'L', u'Fernando Po Creole English', u'\r\n'),
-	(u'fqs', u'', u'', u'', u'I', u'L', u'Fas', u'\r\n'),
-	(u'fra', u'fre', u'fra', u'fr', u'I', u'L', u'French', u'\r\n'),
-	(u'frc', u'', u'', u'', u'I', u'L', u'Cajun French', u'\r\n'),
-	(u'frd', u'', u'', u'', u'I', u'L', u'Fordata', u'\r\n'),
-	(u'frk', u'', u'', u'', u'I', u'E', u'Frankish', u'\r\n'),
-	(u'frm', u'frm', u'frm', u'', u'I', u'H', u'Middle French (ca. 1400-1600)', u'\r\n'),
-	(u'fro', u'fro', u'fro', u'', u'I', u'H', u'Old French (842-ca. 1400)', u'\r\n'),
-	(u'frp', u'', u'', u'', u'I', u'L', u'Arpitan', u'\r\n'),
-	(u'frq', u'', u'', u'', u'I', u'L', u'Forak', u'\r\n'),
-	(u'frr', u'frr', u'frr', u'', u'I', u'L', u'Northern Frisian', u'\r\n'),
-	(u'frs', u'frs', u'frs', u'', u'I', u'L', u'Eastern Frisian', u'\r\n'),
-	(u'frt', u'', u'', u'', u'I', u'L', u'Fortsenal', u'\r\n'),
-	(u'fry', u'fry', u'fry', u'fy', u'I', u'L', u'Western Frisian', u'\r\n'),
-	(u'fse', u'', u'', u'', u'I', u'L', u'Finnish Sign Language', u'\r\n'),
-	(u'fsl', u'', u'', u'', u'I', u'L', u'French Sign Language', u'\r\n'),
-	(u'fss', u'', u'', u'', u'I', u'L', u'Finland-Swedish Sign Language', u'\r\n'),
-	(u'fub', u'', u'', u'', u'I', u'L', u'Adamawa Fulfulde', u'\r\n'),
-	(u'fuc', u'', u'', u'', u'I', u'L', u'Pulaar', u'\r\n'),
-	(u'fud', u'', u'', u'', u'I', u'L', u'East Futuna', u'\r\n'),
-	(u'fue', u'', u'', u'', u'I', u'L', u'Borgu Fulfulde', u'\r\n'),
-	(u'fuf', u'', u'', u'', u'I', u'L', u'Pular', u'\r\n'),
-	(u'fuh', u'', u'', u'', u'I', u'L', u'Western Niger Fulfulde', u'\r\n'),
-	(u'fui', u'', u'', u'', u'I', u'L', u'Bagirmi Fulfulde', u'\r\n'),
-	(u'fuj', u'', u'', u'', u'I', u'L', u'Ko', u'\r\n'),
-	(u'ful', u'ful', u'ful', u'ff', u'M', u'L', u'Fulah', u'\r\n'),
-	(u'fum', u'', u'', u'', u'I', u'L', u'Fum', u'\r\n'),
-	(u'fun', u'', u'', u'', u'I', u'L', u'Fulni\xf4', u'\r\n'),
-	(u'fuq', u'', u'', u'', u'I', u'L', u'Central-Eastern Niger Fulfulde', u'\r\n'),
-	(u'fur', u'fur', u'fur', u'', u'I', u'L', u'Friulian', u'\r\n'),
-	(u'fut', u'', u'', u'', u'I', u'L', u'Futuna-Aniwa', u'\r\n'),
-	(u'fuu', u'', u'', u'', u'I', u'L', u'Furu', u'\r\n'),
-	(u'fuv', u'', u'', u'', u'I', u'L', u'Nigerian Fulfulde', u'\r\n'),
-	(u'fuy', u'', u'', u'', u'I', u'L', u'Fuyug', u'\r\n'),
-	(u'fvr', u'', u'', u'', u'I', u'L', u'Fur', u'\r\n'),
-	(u'fwa', u'', u'', u'', u'I', u'L', u'Fw\xe2i', u'\r\n'),
-	(u'fwe', u'', u'', u'', u'I', u'L', u'Fwe', u'\r\n'),
-	(u'gaa', u'gaa', u'gaa', u'', u'I', u'L', u'Ga', u'\r\n'),
-	(u'gab', u'', u'', u'', u'I', u'L', u'Gabri', u'\r\n'),
-	(u'gac', u'', u'', u'', u'I', u'L', u'Mixed Great Andamanese', u'\r\n'),
-	(u'gad', u'', u'', u'', u'I', u'L', u'Gaddang', u'\r\n'),
-	(u'gae', u'', u'', u'', u'I', u'L', u'Guarequena', u'\r\n'),
-	(u'gaf', u'', u'', u'', u'I', u'L', u'Gende', u'\r\n'),
-	(u'gag', u'', u'', u'', u'I', u'L', u'Gagauz', u'\r\n'),
-	(u'gah', u'', u'', u'', u'I', u'L', u'Alekano', u'\r\n'),
-	(u'gai', u'', u'', u'', u'I', u'L', u'Borei', u'\r\n'),
-	(u'gaj', u'', u'', u'', u'I', u'L', u'Gadsup', u'\r\n'),
-	(u'gak', u'', u'', u'', u'I', u'L', u'Gamkonora', u'\r\n'),
-	(u'gal', u'', u'', u'', u'I', u'L', u'Galoli', u'\r\n'),
-	(u'gam', u'', u'', u'', u'I', u'L', u'Kandawo', u'\r\n'),
-	(u'gan', u'', u'', u'', u'I', u'L', u'Gan Chinese', u'\r\n'),
-	(u'gao', u'', u'', u'', u'I', u'L', u'Gants', u'\r\n'),
-	(u'gap', u'', u'', u'', u'I', u'L', u'Gal', u'\r\n'),
-	(u'gaq', u'', u'', u'', u'I', u'L', u"Gata'", u'\r\n'),
-	(u'gar', u'', u'', u'', u'I', u'L', u'Galeya', u'\r\n'),
-	(u'gas', u'', u'', u'', u'I', u'L', u'Adiwasi Garasia', u'\r\n'),
-	(u'gat', u'', u'', u'', u'I', u'L', u'Kenati', u'\r\n'),
-	(u'gau', u'', u'', u'', u'I', u'L', u'Mudhili Gadaba', u'\r\n'),
-	(u'gaw', u'', u'', u'', u'I', u'L', u'Nobonob', u'\r\n'),
-	(u'gax', u'', u'', u'', u'I', u'L', u'Borana-Arsi-Guji Oromo', u'\r\n'),
-	(u'gay', u'gay', u'gay', u'', u'I', u'L', u'Gayo', u'\r\n'),
-	(u'gaz', u'', u'', u'', u'I', u'L', u'West Central Oromo', u'\r\n'),
-	(u'gba', u'gba', u'gba', u'', u'M', u'L', u'Gbaya (Central African Republic)', u'\r\n'),
-	(u'gbb', u'', u'', u'', u'I', u'L', u'Kaytetye', u'\r\n'),
-	(u'gbc', u'', u'', u'', u'I', u'L', u'Garawa', u'\r\n'),
-	(u'gbd', u'', u'', u'', u'I', u'L', u'Karadjeri', u'\r\n'),
-	(u'gbe', u'', u'', u'', u'I', u'L', u'Niksek', u'\r\n'),
-	(u'gbf', u'', u'', u'', u'I', u'L', u'Gaikundi', u'\r\n'),
-	(u'gbg', u'', u'', u'', u'I', u'L', u'Gbanziri', u'\r\n'),
-	(u'gbh', u'', u'', u'', u'I', u'L', u'Defi Gbe', u'\r\n'),
-	(u'gbi', u'', u'', u'', u'I', u'L', u'Galela', u'\r\n'),
-	(u'gbj', u'', u'', u'', u'I', u'L', u'Bodo Gadaba', u'\r\n'),
-	(u'gbk', u'', u'', u'', u'I', u'L', u'Gaddi', u'\r\n'),
-	(u'gbl', u'', u'', u'', u'I', u'L', u'Gamit', u'\r\n'),
-	(u'gbm', u'', u'', u'', u'I', u'L', u'Garhwali', u'\r\n'),
-	(u'gbn', u'', u'', u'', u'I', u'L', u"Mo'da", u'\r\n'),
-	(u'gbo', u'', u'', u'', u'I', u'L', u'Northern Grebo', u'\r\n'),
-	(u'gbp', u'', u'', u'', u'I', u'L', u'Gbaya-Bossangoa', u'\r\n'),
-	(u'gbq', u'', u'', u'', u'I', u'L', u'Gbaya-Bozoum', u'\r\n'),
-	(u'gbr', u'', u'', u'', u'I', u'L', u'Gbagyi', u'\r\n'),
-	(u'gbs', u'', u'', u'', u'I', u'L', u'Gbesi Gbe', u'\r\n'),
-	(u'gbu', u'', u'', u'', u'I', u'L', u'Gagadu', u'\r\n'),
-	(u'gbv', u'', u'', u'', u'I', u'L', u'Gbanu', u'\r\n'),
-	(u'gbx', u'', u'', u'', u'I', u'L', u'Eastern Xwla Gbe', u'\r\n'),
-	(u'gby', u'', u'', u'', u'I', u'L', u'Gbari', u'\r\n'),
-	(u'gbz', u'', u'', u'', u'I', u'L', u'Zoroastrian Dari', u'\r\n'),
-	(u'gcc', u'', u'', u'', u'I', u'L', u'Mali', u'\r\n'),
-	(u'gcd', u'', u'', u'', u'I', u'E', u'Ganggalida', u'\r\n'),
-	(u'gce', u'', u'', u'', u'I', u'E', u'Galice', u'\r\n'),
-	(u'gcf', u'', u'', u'', u'I', u'L', u'Guadeloupean Creole French', u'\r\n'),
-	(u'gcl', u'', u'', u'', u'I', u'L', u'Grenadian Creole English', u'\r\n'),
-	(u'gcn', u'', u'', u'', u'I', u'L', u'Gaina', u'\r\n'),
-	(u'gcr', u'', u'', u'', u'I', u'L', u'Guianese Creole French', u'\r\n'),
-	(u'gct', u'', u'', u'', u'I', u'L', u'Colonia Tovar German', u'\r\n'),
-	(u'gda', u'', u'', u'', u'I', u'L', u'Gade Lohar', u'\r\n'),
-	(u'gdb', u'', u'', u'', u'I', u'L', u'Pottangi Ollar Gadaba', u'\r\n'),
-	(u'gdc', u'', u'', u'', u'I', u'E', u'Gugu Badhun', u'\r\n'),
-	(u'gdd', u'', u'', u'', u'I', u'L', u'Gedaged', u'\r\n'),
-	(u'gde', u'', u'', u'', u'I', u'L', u'Gude', u'\r\n'),
-	(u'gdf', u'', u'', u'', u'I', u'L', u'Guduf-Gava', u'\r\n'),
-	(u'gdg', u'', u'', u'', u'I', u'L', u"Ga'dang", u'\r\n'),
-	(u'gdh', u'', u'', u'', u'I', u'L', u'Gadjerawang', u'\r\n'),
-	(u'gdi', u'', u'', u'', u'I', u'L', u'Gundi', u'\r\n'),
-	(u'gdj', u'', u'', u'', u'I', u'L', u'Gurdjar', u'\r\n'),
-	(u'gdk', u'', u'', u'', u'I', u'L', u'Gadang', u'\r\n'),
-	(u'gdl', u'', u'', u'', u'I', u'L', u'Dirasha', u'\r\n'),
-	(u'gdm', u'', u'', u'', u'I', u'L', u'Laal', u'\r\n'),
-	(u'gdn', u'', u'', u'', u'I', u'L', u'Umanakaina', u'\r\n'),
-	(u'gdo', u'', u'', u'', u'I', u'L', u'Ghodoberi', u'\r\n'),
-	(u'gdq', u'', u'', u'', u'I', u'L', u'Mehri', u'\r\n'),
-	(u'gdr', u'', u'', u'', u'I', u'L', u'Wipi', u'\r\n'),
-	(u'gdu', u'', u'', u'', u'I', u'L', u'Gudu', u'\r\n'),
-	(u'gdx', u'', u'', u'', u'I', u'L', u'Godwari', u'\r\n'),
-	(u'gea', u'', u'', u'', u'I', u'L', u'Geruma', u'\r\n'),
-	(u'geb', u'', u'', u'', u'I', u'L', u'Kire', u'\r\n'),
-	(u'gec', u'', u'', u'', u'I', u'L', u'Gboloo Grebo', u'\r\n'),
-	(u'ged', u'', u'', u'', u'I', u'L', u'Gade', u'\r\n'),
-	(u'geg', u'', u'', u'', u'I', u'L', u'Gengle', u'\r\n'),
-	(u'geh', u'', u'', u'', u'I', u'L', u'Hutterite German', u'\r\n'),
-	(u'gei', u'', u'', u'', u'I', u'L', u'Gebe', u'\r\n'),
-	(u'gej', u'', u'', u'', u'I', u'L', u'Gen', u'\r\n'),
-	(u'gek', u'', u'', u'', u'I', u'L', u'Yiwom', u'\r\n'),
-	(u'gel', u'', u'', u'', u'I', u'L', u'Kag-Fer-Jiir-Koor-Ror-Us-Zuksun', u'\r\n'),
-	(u'geq', u'', u'', u'', u'I', u'L', u'Geme', u'\r\n'),
-	(u'ges', u'', u'', u'', u'I', u'L', u'Geser-Gorom', u'\r\n'),
-	(u'gew', u'', u'', u'', u'I', u'L', u'Gera', u'\r\n'),
-	(u'gex', u'', u'', u'', u'I', u'L', u'Garre', u'\r\n'),
-	(u'gey', u'', u'', u'', u'I', u'L', u'Enya', u'\r\n'),
-	(u'gez', u'gez', u'gez', u'', u'I', u'A', u'Geez', u'\r\n'),
-	(u'gfk', u'', u'', u'', u'I', u'L', u'Patpatar', u'\r\n'),
-	(u'gft', u'', u'', u'', u'I', u'E', u'Gafat', u'\r\n'),
-	(u'gga', u'', u'', u'', u'I', u'L', u'Gao', u'\r\n'),
-	(u'ggb', u'', u'', u'', u'I', u'L', u'Gbii', u'\r\n'),
-	(u'ggd', u'', u'', u'', u'I', u'E', u'Gugadj', u'\r\n'),
-	(u'gge', u'', u'', u'', u'I', u'L', u'Guragone', u'\r\n'),
-	(u'ggg', u'', u'', u'', u'I', u'L', u'Gurgula', u'\r\n'),
-	(u'ggk', u'', u'', u'', u'I', u'E', u'Kungarakany', u'\r\n'),
-	(u'ggl', u'', u'', u'', u'I', u'L', u'Ganglau', u'\r\n'),
-	(u'ggn', u'', u'', u'', u'I', u'L', u'Eastern Gurung', u'\r\n'),
-	(u'ggo', u'', u'', u'', u'I', u'L', u'Southern Gondi', u'\r\n'),
-	(u'ggr', u'', u'', u'', u'I', u'E', u'Aghu Tharnggalu', u'\r\n'),
-	(u'ggt', u'', u'', u'', u'I', u'L', u'Gitua', u'\r\n'),
-	(u'ggu', u'', u'', u'', u'I', u'L', u'Gagu', u'\r\n'),
-	(u'ggw', u'', u'', u'', u'I', u'L', u'Gogodala', u'\r\n'),
-	(u'gha', u'', u'', u'', u'I', u'L', u'Ghadam\xe8s', u'\r\n'),
-	(u'ghc', u'', u'', u'', u'I', u'E', u'Hiberno-Scottish Gaelic', u'\r\n'),
-	(u'ghe', u'', u'', u'', u'I', u'L', u'Southern Ghale', u'\r\n'),
-	(u'ghh', u'', u'', u'', u'I', u'L', u'Northern Ghale', u'\r\n'),
-	(u'ghk', u'', u'', u'', u'I', u'L', u'Geko Karen', u'\r\n'),
-	(u'ghl', u'', u'', u'', u'I', u'L', u'Ghulfan', u'\r\n'),
-	(u'ghn', u'', u'', u'', u'I', u'L', u'Ghanongga', u'\r\n'),
-	(u'gho', u'', u'', u'', u'I', u'E', u'Ghomara', u'\r\n'),
-	(u'ghr', u'', u'', u'', u'I', u'L', u'Ghera', u'\r\n'),
-	(u'ghs', u'', u'', u'', u'I', u'L', u'Guhu-Samane', u'\r\n'),
-	(u'ght', u'', u'', u'', u'I', u'L', u'Kutang Ghale', u'\r\n'),
-	(u'gia', u'', u'', u'', u'I', u'L', u'Kitja', u'\r\n'),
-	(u'gib', u'', u'', u'', u'I', u'L', u'Gibanawa', u'\r\n'),
-	(u'gic', u'', u'', u'', u'I', u'L', u'Gail', u'\r\n'),
-	(u'gid', u'', u'', u'', u'I', u'L', u'Gidar', u'\r\n'),
-	(u'gig', u'', u'', u'', u'I', u'L', u'Goaria', u'\r\n'),
-	(u'gil', u'gil', u'gil', u'', u'I', u'L', u'Gilbertese', u'\r\n'),
-	(u'gim', u'', u'', u'', u'I', u'L', u'Gimi (Eastern Highlands)', u'\r\n'),
-	(u'gin', u'', u'', u'', u'I', u'L', u'Hinukh', u'\r\n'),
-	(u'gio', u'', u'', u'', u'I', u'L', u'Gelao', u'\r\n'),
-	(u'gip', u'', u'', u'', u'I', u'L', u'Gimi (West New Britain)', u'\r\n'),
-	(u'giq', u'', u'', u'', u'I', u'L', u'Green Gelao', u'\r\n'),
-	(u'gir', u'', u'', u'', u'I', u'L', u'Red Gelao', u'\r\n'),
-	(u'gis', u'', u'', u'', u'I', u'L', u'North Giziga', u'\r\n'),
-	(u'git', u'', u'', u'', u'I', u'L', u'Gitxsan', u'\r\n'),
-	(u'giw', u'', u'', u'', u'I', u'L', u'White Gelao', u'\r\n'),
-	(u'gix', u'', u'', u'', u'I', u'L', u'Gilima', u'\r\n'),
-	(u'giy', u'', u'', u'', u'I', u'L', u'Giyug', u'\r\n'),
-	(u'giz', u'', u'', u'', u'I', u'L', u'South Giziga', u'\r\n'),
-	(u'gji', u'', u'', u'', u'I', u'L', u'Geji', u'\r\n'),
-	(u'gjk', u'', u'', u'', u'I', u'L', u'Kachi Koli', u'\r\n'),
-	(u'gjn', u'', u'', u'', u'I', u'L', u'Gonja', u'\r\n'),
-	(u'gju', u'', u'', u'', u'I', u'L', u'Gujari', u'\r\n'),
-	(u'gka', u'', u'', u'', u'I', u'L', u'Guya', u'\r\n'),
-	(u'gke', u'', u'', u'', u'I', u'L', u'Ndai', u'\r\n'),
-	(u'gkn', u'', u'', u'', u'I', u'L', u'Gokana', u'\r\n'),
-	(u'gkp', u'', u'', u'', u'I', u'L', u'Guinea Kpelle', u'\r\n'),
-	(u'gla', u'gla', u'gla', u'gd', u'I', u'L', u'Scottish Gaelic', u'\r\n'),
-	(u'glc', u'', u'', u'', u'I', u'L', u'Bon Gula', u'\r\n'),
-	(u'gld', u'', u'', u'', u'I', u'L', u'Nanai', u'\r\n'),
-	(u'gle', u'gle', u'gle', u'ga', u'I', u'L', u'Irish', u'\r\n'),
-	(u'glg', u'glg', u'glg', u'gl', u'I', u'L', u'Galician', u'\r\n'),
-	(u'glh', u'', u'', u'', u'I', u'L', u'Northwest Pashayi', u'\r\n'),
-	(u'gli', u'', u'', u'', u'I', u'E', u'Guliguli', u'\r\n'),
-	(u'glj', u'', u'', u'', u'I', u'L', u'Gula Iro', u'\r\n'),
-	(u'glk', u'', u'', u'', u'I', u'L', u'Gilaki', u'\r\n'),
-	(u'glo', u'', u'', u'', u'I', u'L', u'Galambu', u'\r\n'),
-	(u'glr', u'', u'', u'', u'I', u'L', u'Glaro-Twabo', u'\r\n'),
-	(u'glu', u'', u'', u'', u'I', u'L', u'Gula (Chad)', u'\r\n'),
-	(u'glv', u'glv', u'glv', u'gv', u'I', u'L', u'Manx', u'\r\n'),
-	(u'glw', u'', u'', u'', u'I', u'L', u'Glavda', u'\r\n'),
-	(u'gly', u'', u'', u'', u'I', u'E', u'Gule', u'\r\n'),
-	(u'gma', u'', u'', u'', u'I', u'E', u'Gambera', u'\r\n'),
-	(u'gmb', u'', u'', u'', u'I', u'L', u"Gula'alaa", u'\r\n'),
-	(u'gmd', u'', u'', u'', u'I', u'L', u'M\xe1ghd\xec', u'\r\n'),
-	(u'gmh', u'gmh', u'gmh', u'', u'I', u'H', u'Middle High German (ca. 1050-1500)', u'\r\n'),
-	(u'gml', u'', u'', u'', u'I', u'H', u'Middle Low German', u'\r\n'),
-	(u'gmm', u'', u'', u'', u'I', u'L', u'Gbaya-Mbodomo', u'\r\n'),
-	(u'gmn', u'', u'', u'', u'I', u'L', u'Gimnime', u'\r\n'),
-	(u'gmu', u'', u'', u'', u'I', u'L', u'Gumalu', u'\r\n'),
-	(u'gmv', u'', u'', u'', u'I', u'L', u'Gamo', u'\r\n'),
-	(u'gmx', u'', u'', u'', u'I', u'L', u'Magoma', u'\r\n'),
-	(u'gmy', u'', u'', u'', u'I', u'A', u'Mycenaean Greek', u'\r\n'),
-	(u'gna', u'', u'', u'', u'I', u'L', u'Kaansa', u'\r\n'),
-	(u'gnb', u'', u'', u'', u'I', u'L', u'Gangte', u'\r\n'),
-	(u'gnc', u'', u'', u'', u'I', u'E', u'Guanche', u'\r\n'),
-	(u'gnd', u'', u'', u'', u'I', u'L', u'Zulgo-Gemzek', u'\r\n'),
-	(u'gne', u'', u'', u'', u'I', u'L', u'Ganang', u'\r\n'),
-	(u'gng', u'', u'', u'', u'I', u'L', u'Ngangam', u'\r\n'),
-	(u'gnh', u'', u'', u'', u'I', u'L', u'Lere', u'\r\n'),
-	(u'gni', u'', u'', u'', u'I', u'L', u'Gooniyandi', u'\r\n'),
-	(u'gnk', u'', u'', u'', u'I', u'L', u'//Gana', u'\r\n'),
-	(u'gnl', u'', u'', u'', u'I', u'E', u'Gangulu', u'\r\n'),
-	(u'gnm', u'', u'', u'', u'I', u'L', u'Ginuman', u'\r\n'),
-	(u'gnn', u'', u'', u'', u'I', u'L', u'Gumatj', u'\r\n'),
-	(u'gno', u'', u'', u'', u'I', u'L', u'Northern Gondi', u'\r\n'),
-	(u'gnq', u'', u'', u'', u'I', u'L', u'Gana', u'\r\n'),
-	(u'gnr', u'', u'', u'', u'I', u'E', u'Gureng Gureng', u'\r\n'),
-	(u'gnt', u'', u'', u'', u'I', u'L', u'Guntai', u'\r\n'),
-	(u'gnu', u'', u'', u'', u'I', u'L', u'Gnau', u'\r\n'),
-	(u'gnw', u'', u'', u'', u'I', u'L', u'Western Bolivian Guaran\xed', u'\r\n'),
-	(u'gnz', u'', u'', u'', u'I', u'L', u'Ganzi', u'\r\n'),
-	(u'goa', u'', u'', u'', u'I', u'L', u'Guro', u'\r\n'),
-	(u'gob', u'', u'', u'', u'I', u'L', u'Playero', u'\r\n'),
-	(u'goc', u'', u'', u'', u'I', u'L', u'Gorakor', u'\r\n'),
-	(u'god', u'', u'', u'', u'I', u'L', u'Godi\xe9', u'\r\n'),
-	(u'goe', u'', u'', u'', u'I', u'L', u'Gongduk', u'\r\n'),
-	(u'gof', u'', u'', u'', u'I', u'L', u'Gofa', u'\r\n'),
-	(u'gog', u'', u'', u'', u'I', u'L', u'Gogo', u'\r\n'),
-	(u'goh', u'goh', u'goh', u'', u'I', u'H', u'Old High German (ca. 750-1050)', u'\r\n'),
-	(u'goi', u'', u'', u'', u'I', u'L', u'Gobasi', u'\r\n'),
-	(u'goj', u'', u'', u'', u'I', u'L', u'Gowlan', u'\r\n'),
-	(u'gok', u'', u'', u'', u'I', u'L', u'Gowli', u'\r\n'),
-	(u'gol', u'', u'', u'', u'I', u'L', u'Gola', u'\r\n'),
-	(u'gom', u'', u'', u'', u'I', u'L', u'Goan Konkani', u'\r\n'),
-	(u'gon', u'gon', u'gon', u'', u'M', u'L', u'Gondi', u'\r\n'),
-	(u'goo', u'', u'', u'', u'I', u'L', u'Gone Dau', u'\r\n'),
-	(u'gop', u'', u'', u'', u'I', u'L', u'Yeretuar', u'\r\n'),
-	(u'goq', u'', u'', u'', u'I', u'L', u'Gorap', u'\r\n'),
-	(u'gor', u'gor', u'gor', u'', u'I', u'L', u'Gorontalo', u'\r\n'),
-	(u'gos', u'', u'', u'', u'I', u'L', u'Gronings', u'\r\n'),
-	(u'got', u'got', u'got', u'', u'I', u'A', u'Gothic', u'\r\n'),
-	(u'gou', u'', u'', u'', u'I', u'L', u'Gavar', u'\r\n'),
-	(u'gow', u'', u'', u'', u'I', u'L', u'Gorowa', u'\r\n'),
-	(u'gox', u'', u'', u'', u'I', u'L', u'Gobu', u'\r\n'),
-	(u'goy', u'', u'', u'', u'I', u'L', u'Goundo', u'\r\n'),
-	(u'goz', u'', u'', u'', u'I', u'L', u'Gozarkhani', u'\r\n'),
-	(u'gpa', u'', u'', u'', u'I', u'L', u'Gupa-Abawa', u'\r\n'),
-	(u'gpn', u'', u'', u'', u'I', u'L', u'Taiap', u'\r\n'),
-	(u'gqa', u'', u'', u'', u'I', u'L', u"Ga'anda", u'\r\n'),
-	(u'gqi', u'', u'', u'', u'I', u'L', u'Guiqiong', u'\r\n'),
-	(u'gqn', u'', u'', u'', u'I', u'E', u'Guana (Brazil)', u'\r\n'),
-	(u'gqr', u'', u'', u'', u'I', u'L', u'Gor', u'\r\n'),
-	(u'gra', u'', u'', u'', u'I', u'L', u'Rajput Garasia', u'\r\n'),
-	(u'grb', u'grb', u'grb', u'', u'M', u'L', u'Grebo', u'\r\n'),
-	(u'grc', u'grc', u'grc', u'', u'I', u'H', u'Ancient Greek (to 1453)', u'\r\n'),
-	(u'grd', u'', u'', u'', u'I', u'L', u'Guruntum-Mbaaru', u'\r\n'),
-	(u'grg', u'', u'', u'', u'I', u'L', u'Madi', u'\r\n'),
-	(u'grh', u'', u'', u'', u'I', u'L', u'Gbiri-Niragu', u'\r\n'),
-	(u'gri', u'', u'', u'', u'I', u'L', u'Ghari', u'\r\n'),
-	(u'grj', u'', u'', u'', u'I', u'L', u'Southern Grebo', u'\r\n'),
-	(u'grm', u'', u'', u'', u'I', u'L', u'Kota Marudu Talantang', u'\r\n'),
-	(u'grn', u'grn', u'grn', u'gn', u'M', u'L', u'Guarani', u'\r\n'),
-	(u'gro', u'', u'', u'', u'I', u'L', u'Groma', u'\r\n'),
-	(u'grq', u'', u'', u'', u'I', u'L', u'Gorovu', u'\r\n'),
-	(u'grr', u'', u'', u'', u'I', u'L', u'Taznatit', u'\r\n'),
-	(u'grs', u'', u'', u'', u'I', u'L', u'Gresi', u'\r\n'),
-	(u'grt', u'', u'', u'', u'I', u'L', u'Garo', u'\r\n'),
-	(u'gru', u'', u'', u'', u'I', u'L', u'Kistane', u'\r\n'),
-	(u'grv', u'', u'', u'', u'I', u'L', u'Central Grebo', u'\r\n'),
-	(u'grw', u'', u'', u'', u'I', u'L', u'Gweda', u'\r\n'),
-	(u'grx', u'', u'', u'', u'I', u'L', u'Guriaso', u'\r\n'),
-	(u'gry', u'', u'', u'', u'I', u'L', u'Barclayville Grebo', u'\r\n'),
-	(u'grz', u'', u'', u'', u'I', u'L', u'Guramalum', u'\r\n'),
-	(u'gse', u'', u'', u'', u'I', u'L', u'Ghanaian Sign Language', u'\r\n'),
-	(u'gsg', u'', u'', u'', u'I', u'L', u'German Sign Language', u'\r\n'),
-	(u'gsl', u'', u'', u'', u'I', u'L', u'Gusilay', u'\r\n'),
-	(u'gsm', u'', u'', u'', u'I', u'L', u'Guatemalan Sign Language', u'\r\n'),
-	(u'gsn', u'', u'', u'', u'I', u'L', u'Gusan', u'\r\n'),
-	(u'gso', u'', u'', u'', u'I', u'L', u'Southwest Gbaya', u'\r\n'),
-	(u'gsp', u'', u'', u'', u'I', u'L', u'Wasembo', u'\r\n'),
-	(u'gss', u'', u'', u'', u'I', u'L', u'Greek Sign Language', u'\r\n'),
-	(u'gsw', u'gsw', u'gsw', u'', u'I', u'L', u'Swiss German', u'\r\n'),
-	(u'gta', u'', u'', u'', u'I', u'L', u'Guat\xf3', u'\r\n'),
-	(u'gti', u'', u'', u'', u'I', u'L', u'Gbati-ri', u'\r\n'),
-	(u'gua', u'', u'', u'', u'I', u'L', u'Shiki', u'\r\n'),
-	(u'gub', u'', u'', u'', u'I', u'L', u'Guajaj\xe1ra', u'\r\n'),
-	(u'guc', u'', u'', u'', u'I', u'L', u'Wayuu', u'\r\n'),
-	(u'gud', u'', u'', u'', u'I', u'L', u'Yocobou\xe9 Dida', u'\r\n'),
-	(u'gue', u'', u'', u'', u'I', u'L', u'Gurinji', u'\r\n'),
-	(u'guf', u'', u'', u'', u'I', u'L', u'Gupapuyngu', u'\r\n'),
-	(u'gug', u'', u'', u'', u'I', u'L', u'Paraguayan Guaran\xed', u'\r\n'),
-	(u'guh', u'', u'', u'', u'I', u'L', u'Guahibo', u'\r\n'),
-	(u'gui', u'', u'', u'', u'I', u'L', u'Eastern Bolivian Guaran\xed', u'\r\n'),
-	(u'guj', u'guj', u'guj', u'gu', u'I', u'L', u'Gujarati', u'\r\n'),
-	(u'guk', u'', u'', u'', u'I', u'L', u'Gumuz', u'\r\n'),
-	(u'gul', u'', u'', u'', u'I', u'L', u'Sea Island Creole English', u'\r\n'),
-	(u'gum', u'', u'', u'', u'I', u'L', u'Guambiano', u'\r\n'),
-	(u'gun', u'', u'', u'', u'I', u'L', u'Mby\xe1 Guaran\xed', u'\r\n'),
-	(u'guo', u'', u'', u'', u'I', u'L', u'Guayabero', u'\r\n'),
-	(u'gup', u'', u'', u'', u'I', u'L', u'Gunwinggu', u'\r\n'),
-	(u'guq', u'', u'', u'', u'I', u'L', u'Ach\xe9', u'\r\n'),
-	(u'gur', u'', u'', u'', u'I', u'L', u'Farefare', u'\r\n'),
-	(u'gus', u'', u'', u'', u'I', u'L', u'Guinean Sign Language', u'\r\n'),
-	(u'gut', u'', u'', u'', u'I', u'L', u'Mal\xe9ku Ja\xedka', u'\r\n'),
-	(u'guu', u'', u'', u'', u'I', u'L', u'Yanomam\xf6', u'\r\n'),
-	(u'guv', u'', u'', u'', u'I', u'E', u'Gey', u'\r\n'),
-	(u'guw', u'', u'', u'', u'I', u'L', u'Gun', u'\r\n'),
-	(u'gux', u'', u'', u'', u'I', u'L', u'Gourmanch\xe9ma', u'\r\n'),
-	(u'guz', u'', u'', u'', u'I', u'L', u'Gusii', u'\r\n'),
-	(u'gva', u'', u'', u'', u'I', u'L', u'Guana (Paraguay)', u'\r\n'),
-	(u'gvc', u'', u'', u'', u'I', u'L', u'Guanano', u'\r\n'),
-	(u'gve', u'', u'', u'', u'I', u'L', u'Duwet', u'\r\n'),
-	(u'gvf', u'', u'', u'', u'I', u'L', u'Golin', u'\r\n'),
-	(u'gvj', u'', u'', u'', u'I', u'L', u'Guaj\xe1', u'\r\n'),
-	(u'gvl', u'', u'', u'', u'I', u'L', u'Gulay', u'\r\n'),
-	(u'gvm', u'', u'', u'', u'I', u'L', u'Gurmana', u'\r\n'),
-	(u'gvn', u'', u'', u'', u'I', u'L', u'Kuku-Yalanji', u'\r\n'),
-	(u'gvo', u'', u'', u'', u'I', u'L', u'Gavi\xe3o Do Jiparan\xe1', u'\r\n'),
-	(u'gvp', u'', u'', u'', u'I', u'L', u'Par\xe1 Gavi\xe3o', u'\r\n'),
-	(u'gvr', u'', u'', u'', u'I', u'L', u'Western Gurung', u'\r\n'),
-	(u'gvs', u'', u'', u'', u'I', u'L', u'Gumawana', u'\r\n'),
-	(u'gvy', u'', u'', u'', u'I', u'E', u'Guyani', u'\r\n'),
-	(u'gwa', u'', u'', u'', u'I', u'L', u'Mbato', u'\r\n'),
-	(u'gwb', u'', u'', u'', u'I', u'L', u'Gwa', u'\r\n'),
-	(u'gwc', u'', u'', u'', u'I', u'L', u'Kalami', u'\r\n'),
-	(u'gwd', u'', u'', u'', u'I', u'L', u'Gawwada', u'\r\n'),
-	(u'gwe', u'', u'', u'', u'I', u'L', u'Gweno', u'\r\n'),
-	(u'gwf', u'', u'', u'', u'I', u'L', u'Gowro', u'\r\n'),
-	(u'gwg', u'', u'', u'', u'I', u'L', u'Moo', u'\r\n'),
-	(u'gwi', u'gwi', u'gwi', u'', u'I', u'L', u'Gwich\u02bcin', u'\r\n'),
-	(u'gwj', u'', u'', u'', u'I', u'L', u'/Gwi', u'\r\n'),
-	(u'gwn', u'', u'', u'', u'I', u'L', u'Gwandara', u'\r\n'),
-	(u'gwr', u'', u'', u'', u'I', u'L', u'Gwere', u'\r\n'),
-	(u'gwt', u'', u'', u'', u'I', u'L', u'Gawar-Bati', u'\r\n'),
-	(u'gwu', u'', u'', u'', u'I', u'E', u'Guwamu', u'\r\n'),
-	(u'gww', u'', u'', u'', u'I', u'L', u'Kwini', u'\r\n'),
-	(u'gwx', u'', u'', u'', u'I', u'L', u'Gua', u'\r\n'),
-	(u'gxx', u'', u'', u'', u'I', u'L', u'W\xe8 Southern', u'\r\n'),
-	(u'gya', u'', u'', u'', u'I', u'L', u'Northwest Gbaya', u'\r\n'),
-	(u'gyb', u'', u'', u'', u'I', u'L', u'Garus', u'\r\n'),
-	(u'gyd', u'', u'', u'', u'I', u'L', u'Kayardild', u'\r\n'),
-	(u'gye', u'', u'', u'', u'I', u'L', u'Gyem', u'\r\n'),
-	(u'gyf', u'', u'', u'', u'I', u'E', u'Gungabula', u'\r\n'),
-	(u'gyg', u'', u'', u'', u'I', u'L', u'Gbayi', u'\r\n'),
-	(u'gyi', u'', u'', u'', u'I', u'L', u'Gyele', u'\r\n'),
-	(u'gyl', u'', u'', u'', u'I', u'L', u'Gayil', u'\r\n'),
-	(u'gym', u'', u'', u'', u'I', u'L', u'Ng\xe4bere', u'\r\n'),
-	(u'gyn', u'', u'', u'', u'I', u'L', u'Guyanese Creole English', u'\r\n'),
-	(u'gyr', u'', u'', u'', u'I', u'L', u'Guarayu', u'\r\n'),
-	(u'gyy', u'', u'', u'', u'I', u'E', u'Gunya', u'\r\n'),
-	(u'gza', u'', u'', u'', u'I', u'L', u'Ganza', u'\r\n'),
-	(u'gzi', u'', u'', u'', u'I', u'L', u'Gazi', u'\r\n'),
-	(u'gzn', u'', u'', u'', u'I', u'L', u'Gane', u'\r\n'),
-	(u'haa', u'', u'', u'', u'I', u'L', u'Han', u'\r\n'),
-	(u'hab', u'', u'', u'', u'I', u'L', u'Hanoi Sign Language', u'\r\n'),
-	(u'hac', u'', u'', u'', u'I', u'L', u'Gurani', u'\r\n'),
-	(u'had', u'', u'', u'', u'I', u'L', u'Hatam', u'\r\n'),
-	(u'hae', u'', u'', u'', u'I', u'L', u'Eastern Oromo', u'\r\n'),
-	(u'haf', u'', u'', u'', u'I', u'L', u'Haiphong Sign Language', u'\r\n'),
-	(u'hag', u'', u'', u'', u'I', u'L', u'Hanga', u'\r\n'),
-	(u'hah', u'', u'', u'', u'I', u'L', u'Hahon', u'\r\n'),
-	(u'hai', u'hai', u'hai', u'', u'M', u'L', u'Haida', u'\r\n'),
-	(u'haj', u'', u'', u'', u'I', u'L', u'Hajong', u'\r\n'),
-	(u'hak', u'', u'', u'', u'I', u'L', u'Hakka Chinese', u'\r\n'),
-	(u'hal', u'', u'', u'', u'I', u'L', u'Halang', u'\r\n'),
-	(u'ham', u'', u'', u'', u'I', u'L', u'Hewa', u'\r\n'),
-	(u'han', u'', u'', u'', u'I', u'L', u'Hangaza', u'\r\n'),
-	(u'hao', u'', u'', u'', u'I', u'L', u'Hak\xf6', u'\r\n'),
-	(u'hap', u'', u'', u'', u'I', u'L', u'Hupla', u'\r\n'),
-	(u'haq', u'', u'', u'', u'I', u'L', u'Ha', u'\r\n'),
-	(u'har', u'', u'', u'', u'I', u'L', u'Harari', u'\r\n'),
-	(u'has', u'', u'', u'', u'I', u'L', u'Haisla', u'\r\n'),
-	(u'hat', u'hat', u'hat', u'ht', u'I', u'L', u'Haitian', u'\r\n'),
-	(u'hau', u'hau', u'hau', u'ha', u'I', u'L', u'Hausa', u'\r\n'),
-	(u'hav', u'', u'', u'', u'I', u'L', u'Havu', u'\r\n'),
-	(u'haw', u'haw', u'haw', u'', u'I', u'L', u'Hawaiian', u'\r\n'),
-	(u'hax', u'', u'', u'', u'I', u'L', u'Southern Haida', u'\r\n'),
-	(u'hay', u'', u'', u'', u'I', u'L', u'Haya', u'\r\n'),
-	(u'haz', u'', u'', u'', u'I', u'L', u'Hazaragi', u'\r\n'),
-	(u'hba', u'', u'', u'', u'I', u'L', u'Hamba', u'\r\n'),
-	(u'hbb', u'', u'', u'', u'I', u'L', u'Huba', u'\r\n'),
-	(u'hbn', u'', u'', u'', u'I', u'L', u'Heiban', u'\r\n'),
-	(u'hbo', u'', u'', u'', u'I', u'H', u'Ancient Hebrew', u'\r\n'),
-	(u'hbs', u'', u'', u'sh', u'M', u'L', u'Serbo-Croatian', u'Code element for 639-1 has been deprecated\r\n'),
-	(u'hbu', u'', u'', u'', u'I', u'L', u'Habu', u'\r\n'),
-	(u'hca', u'', u'', u'', u'I', u'L', u'Andaman Creole Hindi', u'\r\n'),
-	(u'hch', u'', u'', u'', u'I', u'L', u'Huichol', u'\r\n'),
-	(u'hdn', u'', u'', u'', u'I', u'L', u'Northern Haida', u'\r\n'),
-	(u'hds', u'', u'', u'', u'I', u'L', u'Honduras Sign Language', u'\r\n'),
-	(u'hdy', u'', u'', u'', u'I', u'L', u'Hadiyya', u'\r\n'),
-	(u'hea', u'', u'', u'', u'I', u'L', u'Northern Qiandong Miao', u'\r\n'),
-	(u'heb', u'heb', u'heb', u'he', u'I', u'L', u'Hebrew', u'\r\n'),
-	(u'hed', u'', u'', u'', u'I', u'L', u'Herd\xe9', u'\r\n'),
-	(u'heg', u'', u'', u'', u'I', u'L', u'Helong', u'\r\n'),
-	(u'heh', u'', u'', u'', u'I', u'L', u'Hehe', u'\r\n'),
-	(u'hei', u'', u'', u'', u'I', u'L', u'Heiltsuk', u'\r\n'),
-	(u'hem', u'', u'', u'', u'I', u'L', u'Hemba', u'\r\n'),
-	(u'her', u'her', u'her', u'hz', u'I', u'L', u'Herero', u'\r\n'),
-	(u'hgm', u'', u'', u'', u'I', u'L', u'Hai//om', u'\r\n'),
-	(u'hgw', u'', u'', u'', u'I', u'L', u'Haigwai', u'\r\n'),
-	(u'hhi', u'', u'', u'', u'I', u'L', u'Hoia Hoia', u'\r\n'),
-	(u'hhr', u'', u'', u'', u'I', u'L', u'Kerak', u'\r\n'),
-	(u'hhy', u'', u'', u'', u'I', u'L', u'Hoyahoya', u'\r\n'),
-	(u'hia', u'', u'', u'', u'I', u'L', u'Lamang', u'\r\n'),
-	(u'hib', u'', u'', u'', u'I', u'E', u'Hibito', u'\r\n'),
-	(u'hid', u'', u'', u'', u'I', u'L', u'Hidatsa', u'\r\n'),
-	(u'hif', u'', u'', u'', u'I', u'L', u'Fiji Hindi', u'\r\n'),
-	(u'hig', u'', u'', u'', u'I', u'L', u'Kamwe', u'\r\n'),
-	(u'hih', u'', u'', u'', u'I', u'L', u'Pamosu', u'\r\n'),
-	(u'hii', u'', u'', u'', u'I', u'L', u'Hinduri', u'\r\n'),
-	(u'hij', u'', u'', u'', u'I', u'L', u'Hijuk', u'\r\n'),
-	(u'hik', u'', u'', u'', u'I', u'L', u'Seit-Kaitetu', u'\r\n'),
-	(u'hil', u'hil', u'hil', u'', u'I', u'L', u'Hiligaynon', u'\r\n'),
-	(u'hin', u'hin', u'hin', u'hi', u'I', u'L', u'Hindi', u'\r\n'),
-	(u'hio', u'', u'', u'', u'I', u'L', u'Tsoa', u'\r\n'),
-	(u'hir', u'', u'', u'', u'I', u'L', u'Himarim\xe3', u'\r\n'),
-	(u'hit', u'hit', u'hit', u'', u'I', u'A', u'Hittite', u'\r\n'),
-	(u'hiw', u'', u'', u'', u'I', u'L', u'Hiw', u'\r\n'),
-	(u'hix', u'', u'', u'', u'I', u'L', u'Hixkary\xe1na', u'\r\n'),
-	(u'hji', u'', u'', u'', u'I', u'L', u'Haji', u'\r\n'),
-	(u'hka', u'', u'', u'', u'I', u'L', u'Kahe', u'\r\n'),
-	(u'hke', u'', u'', u'', u'I', u'L', u'Hunde', u'\r\n'),
-	(u'hkk', u'', u'', u'', u'I', u'L', u'Hunjara-Kaina Ke', u'\r\n'),
-	(u'hks', u'', u'', u'', u'I', u'L', u'Hong Kong Sign Language', u'\r\n'),
-	(u'hla', u'', u'', u'', u'I', u'L', u'Halia', u'\r\n'),
-	(u'hlb', u'', u'', u'', u'I', u'L', u'Halbi', u'\r\n'),
-	(u'hld', u'', u'', u'', u'I', u'L', u'Halang Doan', u'\r\n'),
-	(u'hle', u'', u'', u'', u'I', u'L', u'Hlersu', u'\r\n'),
-	(u'hlt', u'', u'', u'', u'I', u'L', u'Nga La', u'\r\n'),
-	(u'hlu', u'', u'', u'', u'I', u'A', u'Hieroglyphic Luwian', u'\r\n'),
-	(u'hma', u'', u'', u'', u'I', u'L', u'Southern Mashan Hmong', u'\r\n'),
-	(u'hmb', u'', u'', u'', u'I', u'L', u'Humburi Senni Songhay', u'\r\n'),
-	(u'hmc', u'', u'', u'', u'I', u'L', u'Central Huishui Hmong', u'\r\n'),
-	(u'hmd', u'', u'', u'', u'I', u'L', u'Large Flowery Miao', u'\r\n'),
-	(u'hme', u'', u'', u'', u'I', u'L', u'Eastern Huishui Hmong', u'\r\n'),
-	(u'hmf', u'', u'', u'', u'I', u'L', u'Hmong Don', u'\r\n'),
-	(u'hmg', u'', u'', u'', u'I', u'L', u'Southwestern Guiyang Hmong', u'\r\n'),
-	(u'hmh', u'', u'', u'', u'I', u'L', u'Southwestern Huishui Hmong', u'\r\n'),
-	(u'hmi', u'', u'', u'', u'I', u'L', u'Northern Huishui Hmong', u'\r\n'),
-	(u'hmj', u'', u'', u'', u'I', u'L', u'Ge', u'\r\n'),
-	(u'hmk', u'', u'', u'', u'I', u'E', u'Maek', u'\r\n'),
-	(u'hml', u'', u'', u'', u'I', u'L', u'Luopohe Hmong', u'\r\n'),
-	(u'hmm', u'', u'', u'', u'I', u'L', u'Central Mashan Hmong', u'\r\n'),
-	(u'hmn', u'hmn', u'hmn', u'', u'M', u'L', u'Hmong', u'\r\n'),
-	(u'hmo', u'hmo', u'hmo', u'ho', u'I', u'L', u'Hiri Motu', u'\r\n'),
-	(u'hmp', u'', u'', u'', u'I', u'L', u'Northern Mashan Hmong', u'\r\n'),
-	(u'hmq', u'', u'', u'', u'I', u'L', u'Eastern Qiandong Miao', u'\r\n'),
-	(u'hmr', u'', u'', u'', u'I', u'L', u'Hmar', u'\r\n'),
-	(u'hms', u'', u'', u'', u'I', u'L', u'Southern Qiandong Miao', u'\r\n'),
-	(u'hmt', u'', u'', u'', u'I', u'L', u'Hamtai', u'\r\n'),
-	(u'hmu', u'', u'', u'', u'I', u'L', u'Hamap', u'\r\n'),
-	(u'hmv', u'', u'', u'', u'I', u'L', u'Hmong D\xf4', u'\r\n'),
-	(u'hmw', u'', u'', u'', u'I', u'L', u'Western Mashan Hmong', u'\r\n'),
-	(u'hmy', u'', u'', u'', u'I', u'L', u'Southern Guiyang Hmong', u'\r\n'),
-	(u'hmz', u'', u'', u'', u'I', u'L', u'Hmong Shua', u'\r\n'),
-	(u'hna', u'', u'', u'', u'I', u'L', u'Mina (Cameroon)', u'\r\n'),
-	(u'hnd', u'', u'', u'', u'I', u'L', u'Southern Hindko', u'\r\n'),
-	(u'hne', u'', u'', u'', u'I', u'L', u'Chhattisgarhi', u'\r\n'),
-	(u'hnh', u'', u'', u'', u'I', u'L', u'//Ani', u'\r\n'),
-	(u'hni', u'', u'', u'', u'I', u'L', u'Hani', u'\r\n'),
-	(u'hnj', u'', u'', u'', u'I', u'L', u'Hmong Njua', u'\r\n'),
-	(u'hnn', u'', u'', u'', u'I', u'L', u'Hanunoo', u'\r\n'),
-	(u'hno', u'', u'', u'', u'I', u'L', u'Northern Hindko', u'\r\n'),
-	(u'hns', u'', u'', u'', u'I', u'L', u'Caribbean Hindustani', u'\r\n'),
-	(u'hnu', u'', u'', u'', u'I', u'L', u'Hung', u'\r\n'),
-	(u'hoa', u'', u'', u'', u'I', u'L', u'Hoava', u'\r\n'),
-	(u'hob', u'', u'', u'', u'I', u'L', u'Mari (Madang Province)', u'\r\n'),
-	(u'hoc', u'', u'', u'', u'I', u'L', u'Ho', u'\r\n'),
-	(u'hod', u'', u'', u'', u'I', u'E', u'Holma', u'\r\n'),
-	(u'hoe', u'', u'', u'', u'I', u'L', u'Horom', u'\r\n'),
-	(u'hoh', u'', u'', u'', u'I', u'L', u'Hoby\xf3t', u'\r\n'),
-	(u'hoi', u'', u'', u'', u'I', u'L', u'Holikachuk', u'\r\n'),
-	(u'hoj', u'', u'', u'', u'I', u'L', u'Hadothi', u'\r\n'),
-	(u'hol', u'', u'', u'', u'I', u'L', u'Holu', u'\r\n'),
-	(u'hom', u'', u'', u'', u'I', u'E', u'Homa', u'\r\n'),
-	(u'hoo', u'', u'', u'', u'I', u'L', u'Holoholo', u'\r\n'),
-	(u'hop', u'', u'', u'', u'I', u'L', u'Hopi', u'\r\n'),
-	(u'hor', u'', u'', u'', u'I', u'E', u'Horo', u'\r\n'),
-	(u'hos', u'', u'', u'', u'I', u'L', u'Ho Chi Minh City Sign Language', u'\r\n'),
-	(u'hot', u'', u'', u'', u'I', u'L', u'Hote', u'\r\n'),
-	(u'hov', u'', u'', u'', u'I', u'L', u'Hovongan', u'\r\n'),
-	(u'how', u'', u'', u'', u'I', u'L', u'Honi', u'\r\n'),
-	(u'hoy', u'', u'', u'', u'I', u'L', u'Holiya', u'\r\n'),
-	(u'hoz', u'', u'', u'', u'I', u'L', u'Hozo', u'\r\n'),
-	(u'hpo', u'', u'', u'', u'I', u'L', u'Hpon', u'\r\n'),
-	(u'hps', u'', u'', u'', u'I', u'L', u"Hawai'i Pidgin Sign Language", u'\r\n'),
-	(u'hra', u'', u'', u'', u'I', u'L', u'Hrangkhol', u'\r\n'),
-	(u'hre', u'', u'', u'', u'I', u'L', u'Hre', u'\r\n'),
-	(u'hrk', u'', u'', u'', u'I', u'L', u'Haruku', u'\r\n'),
-	(u'hrm', u'', u'', u'', u'I', u'L', u'Horned Miao', u'\r\n'),
-	(u'hro', u'', u'', u'', u'I', u'L', u'Haroi', u'\r\n'),
-	(u'hrr', u'', u'', u'', u'I', u'L', u'Horuru', u'\r\n'),
-	(u'hrt', u'', u'', u'', u'I', u'L', u'H\xe9rtevin', u'\r\n'),
-	(u'hru', u'', u'', u'', u'I', u'L', u'Hruso', u'\r\n'),
-	(u'hrv', u'hrv', u'hrv', u'hr', u'I', u'L', u'Croatian', u'\r\n'),
-	(u'hrx', u'', u'', u'', u'I', u'L', u'Hunsrik', u'\r\n'),
-	(u'hrz', u'', u'', u'', u'I', u'L', u'Harzani', u'\r\n'),
-	(u'hsb', u'hsb', u'hsb', u'', u'I', u'L', u'Upper Sorbian', u'\r\n'),
-	(u'hsh', u'', u'', u'', u'I', u'L', u'Hungarian Sign Language', u'\r\n'),
-	(u'hsl', u'', u'', u'', u'I', u'L', u'Hausa Sign Language', u'\r\n'),
-	(u'hsn', u'', u'', u'', u'I', u'L', u'Xiang Chinese', u'\r\n'),
-	(u'hss', u'', u'', u'', u'I', u'L', u'Harsusi', u'\r\n'),
-	(u'hti', u'', u'', u'', u'I', u'L', u'Hoti', u'\r\n'),
-	(u'hto', u'', u'', u'', u'I', u'L', u'Minica Huitoto', u'\r\n'),
-	(u'hts', u'', u'', u'', u'I', u'L', u'Hadza', u'\r\n'),
-	(u'htu', u'', u'', u'', u'I', u'L', u'Hitu', u'\r\n'),
-	(u'htx', u'', u'', u'', u'I', u'A', u'Middle Hittite', u'\r\n'),
-	(u'hub', u'', u'', u'', u'I', u'L', u'Huambisa', u'\r\n'),
-	(u'huc', u'', u'', u'', u'I', u'L', u'=/Hua', u'\r\n'),
-	(u'hud', u'', u'', u'', u'I', u'L', u'Huaulu', u'\r\n'),
-	(u'hue', u'', u'', u'', u'I', u'L', u'San Francisco Del Mar Huave', u'\r\n'),
-	(u'huf', u'', u'', u'', u'I', u'L', u'Humene', u'\r\n'),
-	(u'hug', u'', u'', u'', u'I', u'L', u'Huachipaeri', u'\r\n'),
-	(u'huh', u'', u'', u'', u'I', u'L', u'Huilliche', u'\r\n'),
-	(u'hui', u'', u'', u'', u'I', u'L', u'Huli', u'\r\n'),
-	(u'huj', u'', u'', u'', u'I', u'L', u'Northern Guiyang Hmong', u'\r\n'),
-	(u'huk', u'', u'', u'', u'I', u'L', u'Hulung', u'\r\n'),
-	(u'hul', u'', u'', u'', u'I', u'L', u'Hula', u'\r\n'),
-	(u'hum', u'', u'', u'', u'I', u'L', u'Hungana', u'\r\n'),
-	(u'hun', u'hun', u'hun', u'hu', u'I', u'L', u'Hungarian', u'\r\n'),
-	(u'huo', u'', u'', u'', u'I', u'L', u'Hu', u'\r\n'),
-	(u'hup', u'hup', u'hup', u'', u'I', u'L', u'Hupa', u'\r\n'),
-	(u'huq', u'', u'', u'', u'I', u'L', u'Tsat', u'\r\n'),
-	(u'hur', u'', u'', u'', u'I', u'L', u'Halkomelem', u'\r\n'),
-	(u'hus', u'', u'', u'', u'I', u'L', u'Huastec', u'\r\n'),
-	(u'hut', u'', u'', u'', u'I', u'L', u'Humla', u'\r\n'),
-	(u'huu', u'', u'', u'', u'I', u'L', u'Murui Huitoto', u'\r\n'),
-	(u'huv', u'', u'', u'', u'I', u'L', u'San Mateo Del Mar Huave', u'\r\n'),
-	(u'huw', u'', u'', u'', u'I', u'E', u'Hukumina', u'\r\n'),
-	(u'hux', u'', u'', u'', u'I', u'L', u'N\xfcpode Huitoto', u'\r\n'),
-	(u'huy', u'', u'', u'', u'I', u'L', u'Hulaul\xe1', u'\r\n'),
-	(u'huz', u'', u'', u'', u'I', u'L', u'Hunzib', u'\r\n'),
-	(u'hvc', u'', u'', u'', u'I', u'L', u'Haitian Vodoun Culture Language', u'\r\n'),
-	(u'hve', u'', u'', u'', u'I', u'L', u'San Dionisio Del Mar Huave', u'\r\n'),
-	(u'hvk', u'', u'', u'', u'I', u'L', u'Haveke', u'\r\n'),
-	(u'hvn', u'', u'', u'', u'I', u'L', u'Sabu', u'\r\n'),
-	(u'hvv', u'', u'', u'', u'I', u'L', u'Santa Mar\xeda Del Mar Huave', u'\r\n'),
-	(u'hwa', u'', u'', u'', u'I', u'L', u'Wan\xe9', u'\r\n'),
-	(u'hwc', u'', u'', u'', u'I', u'L', u"Hawai'i Creole English", u'\r\n'),
-	(u'hwo', u'', u'', u'', u'I', u'L', u'Hwana', u'\r\n'),
-	(u'hya', u'', u'', u'', u'I', u'L', u'Hya', u'\r\n'),
-	(u'hye', u'arm', u'hye', u'hy', u'I', u'L', u'Armenian', u'\r\n'),
-	(u'iai', u'', u'', u'', u'I', u'L', u'Iaai', u'\r\n'),
-	(u'ian', u'', u'', u'', u'I', u'L', u'Iatmul', u'\r\n'),
-	(u'iap', u'', u'', u'', u'I', u'L', u'Iapama', u'\r\n'),
-	(u'iar', u'', u'', u'', u'I', u'L', u'Purari', u'\r\n'),
-	(u'iba', u'iba', u'iba', u'', u'I', u'L', u'Iban', u'\r\n'),
-	(u'ibb', u'', u'', u'', u'I', u'L', u'Ibibio', u'\r\n'),
-	(u'ibd', u'', u'', u'', u'I', u'L', u'Iwaidja', u'\r\n'),
-	(u'ibe', u'', u'', u'', u'I', u'L', u'Akpes', u'\r\n'),
-	(u'ibg', u'', u'', u'', u'I', u'L', u'Ibanag', u'\r\n'),
-	(u'ibi', u'', u'', u'', u'I', u'L', u'Ibilo', u'\r\n'),
-	(u'ibl', u'', u'', u'', u'I', u'L', u'Ibaloi', u'\r\n'),
-	(u'ibm', u'', u'', u'', u'I', u'L', u'Agoi', u'\r\n'),
-	(u'ibn', u'', u'', u'', u'I', u'L', u'Ibino', u'\r\n'),
-	(u'ibo', u'ibo', u'ibo', u'ig', u'I', u'L', u'Igbo', u'\r\n'),
-	(u'ibr', u'', u'', u'', u'I', u'L', u'Ibuoro', u'\r\n'),
-	(u'ibu', u'', u'', u'', u'I', u'L', u'Ibu', u'\r\n'),
-	(u'iby', u'', u'', u'', u'I', u'L', u'Ibani', u'\r\n'),
-	(u'ica', u'', u'', u'', u'I', u'L', u'Ede Ica', u'\r\n'),
-	(u'ich', u'', u'', u'', u'I', u'L', u'Etkywan', u'\r\n'),
-	(u'icl', u'', u'', u'', u'I', u'L', u'Icelandic Sign Language', u'\r\n'),
-	(u'icr', u'', u'', u'', u'I', u'L', u'Islander Creole English', u'\r\n'),
-	(u'ida', u'', u'', u'', u'I', u'L', u'Idakho-Isukha-Tiriki', u'\r\n'),
-	(u'idb', u'', u'', u'', u'I', u'L', u'Indo-Portuguese', u'\r\n'),
-	(u'idc', u'', u'', u'', u'I', u'L', u'Idon', u'\r\n'),
-	(u'idd', u'', u'', u'', u'I', u'L', u'Ede Idaca', u'\r\n'),
-	(u'ide', u'', u'', u'', u'I', u'L', u'Idere', u'\r\n'),
-	(u'idi', u'', u'', u'', u'I', u'L', u'Idi', u'\r\n'),
-	(u'ido', u'ido', u'ido', u'io', u'I', u'C', u'Ido', u'\r\n'),
-	(u'idr', u'', u'', u'', u'I', u'L', u'Indri', u'\r\n'),
-	(u'ids', u'', u'', u'', u'I', u'L', u'Idesa', u'\r\n'),
-	(u'idt', u'', u'', u'', u'I', u'L', u'Idat\xe9', u'\r\n'),
-	(u'idu', u'', u'', u'', u'I', u'L', u'Idoma', u'\r\n'),
-	(u'ifa', u'', u'', u'', u'I', u'L', u'Amganad Ifugao', u'\r\n'),
-	(u'ifb', u'', u'', u'', u'I', u'L', u'Batad Ifugao', u'\r\n'),
-	(u'ife', u'', u'', u'', u'I', u'L', u'If\xe8', u'\r\n'),
-	(u'iff', u'', u'', u'', u'I', u'E', u'Ifo', u'\r\n'),
-	(u'ifk', u'', u'', u'', u'I', u'L', u'Tuwali Ifugao', u'\r\n'),
-	(u'ifm', u'', u'', u'', u'I', u'L', u'Teke-Fuumu', u'\r\n'),
-	(u'ifu', u'', u'', u'', u'I', u'L', u'Mayoyao Ifugao', u'\r\n'),
-	(u'ify', u'', u'', u'', u'I', u'L', u'Keley-I Kallahan', u'\r\n'),
-	(u'igb', u'', u'', u'', u'I', u'L', u'Ebira', u'\r\n'),
-	(u'ige', u'', u'', u'', u'I', u'L', u'Igede', u'\r\n'),
-	(u'igg', u'', u'', u'', u'I', u'L', u'Igana', u'\r\n'),
-	(u'igl', u'', u'', u'', u'I', u'L', u'Igala', u'\r\n'),
-	(u'igm', u'', u'', u'', u'I', u'L', u'Kanggape', u'\r\n'),
-	(u'ign', u'', u'', u'', u'I', u'L', u'Ignaciano', u'\r\n'),
-	(u'igo', u'', u'', u'', u'I', u'L', u'Isebe', u'\r\n'),
-	(u'igs', u'', u'', u'', u'I', u'C', u'Interglossa', u'\r\n'),
-	(u'igw', u'', u'', u'', u'I', u'L', u'Igwe', u'\r\n'),
-	(u'ihb', u'', u'', u'', u'I', u'L', u'Iha Based Pidgin', u'\r\n'),
-	(u'ihi', u'', u'', u'', u'I', u'L', u'Ihievbe', u'\r\n'),
-	(u'ihp', u'', u'', u'', u'I', u'L', u'Iha', u'\r\n'),
-	(u'iii', u'iii', u'iii', u'ii', u'I', u'L', u'Sichuan Yi', u'\r\n'),
-	(u'ijc', u'', u'', u'', u'I', u'L', u'Izon', u'\r\n'),
-	(u'ije', u'', u'', u'', u'I', u'L', u'Biseni', u'\r\n'),
-	(u'ijj', u'', u'', u'', u'I', u'L', u'Ede Ije', u'\r\n'),
-	(u'ijn', u'', u'', u'', u'I', u'L', u'Kalabari', u'\r\n'),
-	(u'ijs', u'', u'', u'', u'I', u'L', u'Southeast Ijo', u'\r\n'),
-	(u'ike', u'', u'', u'', u'I', u'L', u'Eastern Canadian Inuktitut', u'\r\n'),
-	(u'iki', u'', u'', u'', u'I', u'L', u'Iko', u'\r\n'),
-	(u'ikk', u'', u'', u'', u'I', u'L', u'Ika', u'\r\n'),
-	(u'ikl', u'', u'', u'', u'I', u'L', u'Ikulu', u'\r\n'),
-	(u'iko', u'', u'', u'', u'I', u'L', u'Olulumo-Ikom', u'\r\n'),
-	(u'ikp', u'', u'', u'', u'I', u'L', u'Ikpeshi', u'\r\n'),
-	(u'ikt', u'', u'', u'', u'I', u'L', u'Western Canadian Inuktitut', u'\r\n'),
-	(u'iku', u'iku', u'iku', u'iu', u'M', u'L', u'Inuktitut', u'\r\n'),
-	(u'ikv', u'', u'', u'', u'I', u'L', u'Iku-Gora-Ankwa', u'\r\n'),
-	(u'ikw', u'', u'', u'', u'I', u'L', u'Ikwere', u'\r\n'),
-	(u'ikx', u'', u'', u'', u'I', u'L', u'Ik', u'\r\n'),
-	(u'ikz', u'', u'', u'', u'I', u'L', u'Ikizu', u'\r\n'),
-	(u'ila', u'', u'', u'', u'I', u'L', u'Ile Ape', u'\r\n'),
-	(u'ilb', u'', u'', u'', u'I', u'L', u'Ila', u'\r\n'),
-	(u'ile', u'ile', u'ile', u'ie', u'I', u'C', u'Interlingue', u'\r\n'),
-	(u'ilg', u'', u'', u'', u'I', u'E', u'Garig-Ilgar', u'\r\n'),
-	(u'ili', u'', u'', u'', u'I', u'L', u'Ili Turki', u'\r\n'),
-	(u'ilk', u'', u'', u'', u'I', u'L', u'Ilongot', u'\r\n'),
-	(u'ill', u'', u'', u'', u'I', u'L', u'Iranun', u'\r\n'),
-	(u'ilo', u'ilo', u'ilo', u'', u'I', u'L', u'Iloko', u'\r\n'),
-	(u'ils', u'', u'', u'', u'I', u'L', u'International Sign', u'\r\n'),
-	(u'ilu', u'', u'', u'', u'I', u'L', u"Ili'uun", u'\r\n'),
-	(u'ilv', u'', u'', u'', u'I', u'L', u'Ilue', u'\r\n'),
-	(u'ilw', u'', u'', u'', u'I', u'L', u'Talur', u'\r\n'),
-	(u'ima', u'', u'', u'', u'I', u'L', u'Mala Malasar', u'\r\n'),
-	(u'ime', u'', u'', u'', u'I', u'L', u'Imeraguen', u'\r\n'),
-	(u'imi', u'', u'', u'', u'I', u'L', u'Anamgura', u'\r\n'),
-	(u'iml', u'', u'', u'', u'I', u'E', u'Miluk', u'\r\n'),
-	(u'imn', u'', u'', u'', u'I', u'L', u'Imonda', u'\r\n'),
-	(u'imo', u'', u'', u'', u'I', u'L', u'Imbongu', u'\r\n'),
-	(u'imr', u'', u'', u'', u'I', u'L', u'Imroing', u'\r\n'),
-	(u'ims', u'', u'', u'', u'I', u'A', u'Marsian', u'\r\n'),
-	(u'imy', u'', u'', u'', u'I', u'A', u'Milyan', u'\r\n'),
-	(u'ina', u'ina', u'ina', u'ia', u'I', u'C', u'Interlingua (International Auxiliary Language Association)', u'\r\n'),
-	(u'inb', u'', u'', u'', u'I', u'L', u'Inga', u'\r\n'),
-	(u'ind', u'ind', u'ind', u'id', u'I', u'L', u'Indonesian', u'\r\n'),
-	(u'ing', u'', u'', u'', u'I', u'L', u"Degexit'an", u'\r\n'),
-	(u'inh', u'inh', u'inh', u'', u'I', u'L', u'Ingush', u'\r\n'),
-	(u'inj', u'', u'', u'', u'I', u'L', u'Jungle Inga', u'\r\n'),
-	(u'inl', u'', u'', u'', u'I', u'L', u'Indonesian Sign Language', u'\r\n'),
-	(u'inm', u'', u'', u'', u'I', u'A', u'Minaean', u'\r\n'),
-	(u'inn', u'', u'', u'', u'I', u'L', u'Isinai', u'\r\n'),
-	(u'ino', u'', u'', u'', u'I', u'L', u'Inoke-Yate', u'\r\n'),
-	(u'inp', u'', u'', u'', u'I', u'L', u'I\xf1apari', u'\r\n'),
-	(u'ins', u'', u'', u'', u'I', u'L', u'Indian Sign Language', u'\r\n'),
-	(u'int', u'', u'', u'', u'I', u'L', u'Intha', u'\r\n'),
-	(u'inz', u'', u'', u'', u'I', u'E', u'Inese\xf1o', u'\r\n'),
-	(u'ior', u'', u'', u'', u'I', u'L', u'Inor', u'\r\n'),
-	(u'iou', u'', u'', u'', u'I', u'L', u'Tuma-Irumu', u'\r\n'),
-	(u'iow', u'', u'', u'', u'I', u'E', u'Iowa-Oto', u'\r\n'),
-	(u'ipi', u'', u'', u'', u'I', u'L', u'Ipili', u'\r\n'),
-	(u'ipk', u'ipk', u'ipk', u'ik', u'M', u'L', u'Inupiaq', u'\r\n'),
-	(u'ipo', u'', u'', u'', u'I', u'L', u'Ipiko', u'\r\n'),
-	(u'iqu', u'', u'', u'', u'I', u'L', u'Iquito', u'\r\n'),
-	(u'ire', u'', u'', u'', u'I', u'L', u'Iresim', u'\r\n'),
-	(u'irh', u'', u'', u'', u'I', u'L', u'Irarutu', u'\r\n'),
-	(u'iri', u'', u'', u'', u'I', u'L', u'Irigwe', u'\r\n'),
-	(u'irk', u'', u'', u'', u'I', u'L', u'Iraqw', u'\r\n'),
-	(u'irn', u'', u'', u'', u'I', u'L', u'Ir\xe1ntxe', u'\r\n'),
-	(u'irr', u'', u'', u'', u'I', u'L', u'Ir', u'\r\n'),
-	(u'iru', u'', u'', u'', u'I', u'L', u'Irula', u'\r\n'),
-	(u'irx', u'', u'', u'', u'I', u'L', u'Kamberau', u'\r\n'),
-	(u'iry', u'', u'', u'', u'I', u'L', u'Iraya', u'\r\n'),
-	(u'isa', u'', u'', u'', u'I', u'L', u'Isabi', u'\r\n'),
-	(u'isc', u'', u'', u'', u'I', u'L', u'Isconahua', u'\r\n'),
-	(u'isd', u'', u'', u'', u'I', u'L', u'Isnag', u'\r\n'),
-	(u'ise', u'', u'', u'', u'I', u'L', u'Italian Sign Language', u'\r\n'),
-	(u'isg', u'', u'', u'', u'I', u'L', u'Irish Sign Language', u'\r\n'),
-	(u'ish', u'', u'', u'', u'I', u'L', u'Esan', u'\r\n'),
-	(u'isi', u'', u'', u'', u'I', u'L', u'Nkem-Nkum', u'\r\n'),
-	(u'isk', u'', u'', u'', u'I', u'L', u'Ishkashimi', u'\r\n'),
-	(u'isl', u'ice', u'isl', u'is', u'I', u'L', u'Icelandic', u'\r\n'),
-	(u'ism', u'', u'', u'', u'I', u'L', u'Masimasi', u'\r\n'),
-	(u'isn', u'', u'', u'', u'I', u'L', u'Isanzu', u'\r\n'),
-	(u'iso', u'', u'', u'', u'I', u'L', u'Isoko', u'\r\n'),
-	(u'isr', u'', u'', u'', u'I', u'L', u'Israeli Sign Language', u'\r\n'),
-	(u'ist', u'', u'', u'', u'I', u'L', u'Istriot', u'\r\n'),
-	(u'isu', u'', u'', u'', u'I', u'L', u'Isu (Menchum Division)', u'\r\n'),
-	(u'ita', u'ita', u'ita', u'it', u'I', u'L', u'Italian', u'\r\n'),
-	(u'itb', u'', u'', u'', u'I', u'L', u'Binongan Itneg', u'\r\n'),
-	(u'ite', u'', u'', u'', u'I', u'E', u'Itene', u'\r\n'),
-	(u'iti', u'', u'', u'', u'I', u'L', u'Inlaod Itneg', u'\r\n'),
-	(u'itk', u'', u'', u'', u'I', u'L', u'Judeo-Italian', u'\r\n'),
-	(u'itl', u'', u'', u'', u'I', u'L', u'Itelmen', u'\r\n'),
-	(u'itm', u'', u'', u'', u'I', u'L', u'Itu Mbon Uzo', u'\r\n'),
-	(u'ito', u'', u'', u'', u'I', u'L', u'Itonama', u'\r\n'),
-	(u'itr', u'', u'', u'', u'I', u'L', u'Iteri', u'\r\n'),
-	(u'its', u'', u'', u'', u'I', u'L', u'Isekiri', u'\r\n'),
-	(u'itt', u'', u'', u'', u'I', u'L', u'Maeng Itneg', u'\r\n'),
-	(u'itv', u'', u'', u'', u'I', u'L', u'Itawit', u'\r\n'),
-	(u'itw', u'', u'', u'', u'I', u'L', u'Ito', u'\r\n'),
-	(u'itx', u'', u'', u'', u'I', u'L', u'Itik', u'\r\n'),
-	(u'ity', u'', u'', u'', u'I', u'L', u'Moyadan Itneg', u'\r\n'),
-	(u'itz', u'', u'', u'', u'I', u'L', u'Itz\xe1', u'\r\n'),
-	(u'ium', u'', u'', u'', u'I', u'L', u'Iu Mien', u'\r\n'),
-	(u'ivb', u'', u'', u'', u'I', u'L', u'Ibatan', u'\r\n'),
-	(u'ivv', u'', u'', u'', u'I', u'L', u'Ivatan', u'\r\n'),
-	(u'iwk', u'', u'', u'', u'I', u'L', u'I-Wak', u'\r\n'),
-	(u'iwm', u'', u'', u'', u'I', u'L', u'Iwam', u'\r\n'),
-	(u'iwo', u'', u'', u'', u'I', u'L', u'Iwur', u'\r\n'),
-	(u'iws', u'', u'', u'', u'I', u'L', u'Sepik Iwam', u'\r\n'),
-	(u'ixc', u'', u'', u'', u'I', u'L', u'Ixcatec', u'\r\n'),
-	(u'ixl', u'', u'', u'', u'I', u'L', u'Ixil', u'\r\n'),
-	(u'iya', u'', u'', u'', u'I', u'L', u'Iyayu', u'\r\n'),
-	(u'iyo', u'', u'', u'', u'I', u'L', u'Mesaka', u'\r\n'),
-	(u'iyx', u'', u'', u'', u'I', u'L', u'Yaka (Congo)', u'\r\n'),
-	(u'izh', u'', u'', u'', u'I', u'L', u'Ingrian', u'\r\n'),
-	(u'izi', u'', u'', u'', u'I', u'L', u'Izi-Ezaa-Ikwo-Mgbo', u'\r\n'),
-	(u'izr', u'', u'', u'', u'I', u'L', u'Izere', u'\r\n'),
-	(u'jaa', u'', u'', u'', u'I', u'L', u'Jamamad\xed', u'\r\n'),
-	(u'jab', u'', u'', u'', u'I', u'L', u'Hyam', u'\r\n'),
-	(u'jac', u'', u'', u'', u'I', u'L', u"Popti'", u'\r\n'),
-	(u'jad', u'', u'', u'', u'I', u'L', u'Jahanka', u'\r\n'),
-	(u'jae', u'', u'', u'', u'I', u'L', u'Yabem', u'\r\n'),
-	(u'jaf', u'', u'', u'', u'I', u'L', u'Jara', u'\r\n'),
-	(u'jah', u'', u'', u'', u'I', u'L', u'Jah Hut', u'\r\n'),
-	(u'jaj', u'', u'', u'', u'I', u'L', u'Zazao', u'\r\n'),
-	(u'jak', u'', u'', u'', u'I', u'L', u'Jakun', u'\r\n'),
-	(u'jal', u'', u'', u'', u'I', u'L', u'Yalahatan', u'\r\n'),
-	(u'jam', u'', u'', u'', u'I', u'L', u'Jamaican Creole English', u'\r\n'),
-	(u'jao', u'', u'', u'', u'I', u'L', u'Yanyuwa', u'\r\n'),
-	(u'jaq', u'', u'', u'', u'I', u'L', u'Yaqay', u'\r\n'),
-	(u'jar', u'', u'', u'', u'I', u'L', u'Jarawa (Nigeria)', u'\r\n'),
-	(u'jas', u'', u'', u'', u'I', u'L', u'New Caledonian Javanese', u'\r\n'),
-	(u'jat', u'', u'', u'', u'I', u'L', u'Jakati', u'\r\n'),
-	(u'jau', u'', u'', u'', u'I', u'L', u'Yaur', u'\r\n'),
-	(u'jav', u'jav', u'jav', u'jv', u'I', u'L', u'Javanese', u'\r\n'),
-	(u'jax', u'', u'', u'', u'I', u'L', u'Jambi Malay', u'\r\n'),
-	(u'jay', u'', u'', u'', u'I', u'L', u'Yan-nhangu', u'\r\n'),
-	(u'jaz', u'', u'', u'', u'I', u'L', u'Jawe', u'\r\n'),
-	(u'jbe', u'', u'', u'', u'I', u'L', u'Judeo-Berber', u'\r\n'),
-	(u'jbj', u'', u'', u'', u'I', u'L', u'Arandai', u'\r\n'),
-	(u'jbn', u'', u'', u'', u'I', u'L', u'Nafusi', u'\r\n'),
-	(u'jbo', u'jbo', u'jbo', u'', u'I', u'C', u'Lojban', u'\r\n'),
-	(u'jbr', u'', u'', u'', u'I', u'L', u'Jofotek-Bromnya', u'\r\n'),
-	(u'jbt', u'', u'', u'', u'I', u'L', u'Jabut\xed', u'\r\n'),
-	(u'jbu', u'', u'', u'', u'I', u'L', u'Jukun Takum', u'\r\n'),
-	(u'jcs', u'', u'', u'', u'I', u'L', u'Jamaican Country Sign Language', u'\r\n'),
-	(u'jct', u'', u'', u'', u'I', u'L', u'Krymchak', u'\r\n'),
-	(u'jda', u'', u'', u'', u'I', u'L', u'Jad', u'\r\n'),
-	(u'jdg', u'', u'', u'', u'I', u'L', u'Jadgali', u'\r\n'),
-	(u'jdt', u'', u'', u'', u'I', u'L', u'Judeo-Tat', u'\r\n'),
-	(u'jeb', u'', u'', u'', u'I', u'L', u'Jebero', u'\r\n'),
-	(u'jee', u'', u'', u'', u'I', u'L', u'Jerung', u'\r\n'),
-	(u'jeg', u'', u'', u'', u'I', u'L', u'Jeng', u'\r\n'),
-	(u'jeh', u'', u'', u'', u'I', u'L', u'Jeh', u'\r\n'),
-	(u'jei', u'', u'', u'', u'I', u'L', u'Yei', u'\r\n'),
-	(u'jek', u'', u'', u'', u'I', u'L', u'Jeri Kuo', u'\r\n'),
-	(u'jel', u'', u'', u'', u'I', u'L', u'Yelmek', u'\r\n'),
-	(u'jen', u'', u'', u'', u'I', u'L', u'Dza', u'\r\n'),
-	(u'jer', u'', u'', u'', u'I', u'L', u'Jere', u'\r\n'),
-	(u'jet', u'', u'', u'', u'I', u'L', u'Manem', u'\r\n'),
-	(u'jeu', u'', u'', u'', u'I', u'L', u'Jonkor Bourmataguil', u'\r\n'),
-	(u'jgb', u'', u'', u'', u'I', u'E', u'Ngbee', u'\r\n'),
-	(u'jge', u'', u'', u'', u'I', u'L', u'Judeo-Georgian', u'\r\n'),
-	(u'jgo', u'', u'', u'', u'I', u'L', u'Ngomba', u'\r\n'),
-	(u'jhi', u'', u'', u'', u'I', u'L', u'Jehai', u'\r\n'),
-	(u'jhs', u'', u'', u'', u'I', u'L', u'Jhankot Sign Language', u'\r\n'),
-	(u'jia', u'', u'', u'', u'I', u'L', u'Jina', u'\r\n'),
-	(u'jib', u'', u'', u'', u'I', u'L', u'Jibu', u'\r\n'),
-	(u'jic', u'', u'', u'', u'I', u'L', u'Tol', u'\r\n'),
-	(u'jid', u'', u'', u'', u'I', u'L', u'Bu', u'\r\n'),
-	(u'jie', u'', u'', u'', u'I', u'L', u'Jilbe', u'\r\n'),
-	(u'jig', u'', u'', u'', u'I', u'L', u'Djingili', u'\r\n'),
-	(u'jih', u'', u'', u'', u'I', u'L', u'Shangzhai', u'\r\n'),
-	(u'jii', u'', u'', u'', u'I', u'L', u'Jiiddu', u'\r\n'),
-	(u'jil', u'', u'', u'', u'I', u'L', u'Jilim', u'\r\n'),
-	(u'jim', u'', u'', u'', u'I', u'L', u'Jimi (Cameroon)', u'\r\n'),
-	(u'jio', u'', u'', u'', u'I', u'L', u'Jiamao', u'\r\n'),
-	(u'jiq', u'', u'', u'', u'I', u'L', u'Guanyinqiao', u'\r\n'),
-	(u'jit', u'', u'', u'', u'I', u'L', u'Jita', u'\r\n'),
-	(u'jiu', u'', u'', u'', u'I', u'L', u'Youle Jinuo', u'\r\n'),
-	(u'jiv', u'', u'', u'', u'I', u'L', u'Shuar', u'\r\n'),
-	(u'jiy', u'', u'', u'', u'I', u'L', u'Buyuan Jinuo', u'\r\n'),
-	(u'jko', u'', u'', u'', u'I', u'L', u'Kubo', u'\r\n'),
-	(u'jku', u'', u'', u'', u'I', u'L', u'Labir', u'\r\n'),
-	(u'jle', u'', u'', u'', u'I', u'L', u'Ngile', u'\r\n'),
-	(u'jls', u'', u'', u'', u'I', u'L', u'Jamaican Sign Language', u'\r\n'),
-	(u'jma', u'', u'', u'', u'I', u'L', u'Dima', u'\r\n'),
-	(u'jmb', u'', u'', u'', u'I', u'L', u'Zumbun', u'\r\n'),
-	(u'jmc', u'', u'', u'', u'I', u'L', u'Machame', u'\r\n'),
-	(u'jmd', u'', u'', u'', u'I', u'L', u'Yamdena', u'\r\n'),
-	(u'jmi', u'', u'', u'', u'I', u'L', u'Jimi (Nigeria)', u'\r\n'),
-	(u'jml', u'', u'', u'', u'I', u'L', u'Jumli', u'\r\n'),
-	(u'jmn', u'', u'', u'', u'I', u'L', u'Makuri Naga', u'\r\n'),
-	(u'jmr', u'', u'', u'', u'I', u'L', u'Kamara', u'\r\n'),
-	(u'jms', u'', u'', u'', u'I', u'L', u'Mashi (Nigeria)', u'\r\n'),
-	(u'jmx', u'', u'', u'', u'I', u'L', u'Western Juxtlahuaca Mixtec', u'\r\n'),
-	(u'jna', u'', u'', u'', u'I', u'L', u'Jangshung', u'\r\n'),
-	(u'jnd', u'', u'', u'', u'I', u'L', u'Jandavra', u'\r\n'),
-	(u'jng', u'', u'', u'', u'I', u'E', u'Yangman', u'\r\n'),
-	(u'jni', u'', u'', u'', u'I', u'L', u'Janji', u'\r\n'),
-	(u'jnj', u'', u'', u'', u'I', u'L', u'Yemsa', u'\r\n'),
-	(u'jnl', u'', u'', u'', u'I', u'L', u'Rawat', u'\r\n'),
-	(u'jns', u'', u'', u'', u'I', u'L', u'Jaunsari', u'\r\n'),
-	(u'job', u'', u'', u'', u'I', u'L', u'Joba', u'\r\n'),
-	(u'jod', u'', u'', u'', u'I', u'L', u'Wojenaka', u'\r\n'),
-	(u'jor', u'', u'', u'', u'I', u'E', u'Jor\xe1', u'\r\n'),
-	(u'jos', u'', u'', u'', u'I', u'L', u'Jordanian Sign Language', u'\r\n'),
-	(u'jow', u'', u'', u'', u'I', u'L', u'Jowulu', u'\r\n'),
-	(u'jpa', u'', u'', u'', u'I', u'H', u'Jewish Palestinian Aramaic', u'\r\n'),
-	(u'jpn', u'jpn', u'jpn', u'ja', u'I', u'L', u'Japanese', u'\r\n'),
-	(u'jpr', u'jpr', u'jpr', u'', u'I', u'L', u'Judeo-Persian', u'\r\n'),
-	(u'jqr', u'', u'', u'', u'I', u'L', u'Jaqaru', u'\r\n'),
-	(u'jra', u'', u'', u'', u'I', u'L', u'Jarai', u'\r\n'),
-	(u'jrb', u'jrb', u'jrb', u'', u'M', u'L', u'Judeo-Arabic', u'\r\n'),
-	(u'jrr', u'', u'', u'', u'I', u'L', u'Jiru', u'\r\n'),
-	(u'jrt', u'', u'', u'', u'I', u'L', u'Jorto', u'\r\n'),
-	(u'jru', u'', u'', u'', u'I', u'L', u'Japrer\xeda', u'\r\n'),
-	(u'jsl', u'', u'', u'', u'I', u'L', u'Japanese Sign Language', u'\r\n'),
-	(u'jua', u'', u'', u'', u'I', u'L', u'J\xfama', u'\r\n'),
-	(u'jub', u'', u'', u'', u'I', u'L', u'Wannu', u'\r\n'),
-	(u'juc', u'', u'', u'', u'I', u'E', u'Jurchen', u'\r\n'),
-	(u'jud', u'', u'', u'', u'I', u'L', u'Worodougou', u'\r\n'),
-	(u'juh', u'', u'', u'', u'I', u'L', u'H\xf5ne', u'\r\n'),
-	(u'juk', u'', u'', u'', u'I', u'L', u'Wapan', u'\r\n'),
-	(u'jul', u'', u'', u'', u'I', u'L', u'Jirel', u'\r\n'),
-	(u'jum', u'', u'', u'', u'I', u'L', u'Jumjum', u'\r\n'),
-	(u'jun', u'', u'', u'', u'I', u'L', u'Juang', u'\r\n'),
-	(u'juo', u'', u'', u'', u'I', u'L', u'Jiba', u'\r\n'),
-	(u'jup', u'', u'', u'', u'I', u'L', u'Hupd\xeb', u'\r\n'),
-	(u'jur', u'', u'', u'', u'I', u'L', u'Jur\xfana', u'\r\n'),
-	(u'jus', u'', u'', u'', u'I', u'L', u'Jumla Sign Language', u'\r\n'),
-	(u'jut', u'', u'', u'', u'I', u'L', u'Jutish', u'\r\n'),
-	(u'juu', u'', u'', u'', u'I', u'L', u'Ju', u'\r\n'),
-	(u'juw', u'', u'', u'', u'I', u'L', u'W\xe3pha', u'\r\n'),
-	(u'juy', u'', u'', u'', u'I', u'L', u'Juray', u'\r\n'),
-	(u'jvd', u'', u'', u'', u'I', u'E', u'Javindo', u'\r\n'),
-	(u'jvn', u'', u'', u'', u'I', u'L', u'Caribbean Javanese', u'\r\n'),
-	(u'jwi', u'', u'', u'', u'I', u'L', u'Jwira-Pepesa', u'\r\n'),
-	(u'jya', u'', u'', u'', u'I', u'L', u'Jiarong', u'\r\n'),
-	(u'jye', u'', u'', u'', u'I', u'L', u'Judeo-Yemeni Arabic', u'\r\n'),
-	(u'jyy', u'', u'', u'', u'I', u'L', u'Jaya', u'\r\n'),
-	(u'kaa', u'kaa', u'kaa', u'', u'I', u'L', u'Kara-Kalpak', u'\r\n'),
-	(u'kab', u'kab', u'kab', u'', u'I', u'L', u'Kabyle', u'\r\n'),
-	(u'kac', u'kac', u'kac', u'', u'I', u'L', u'Kachin', u'\r\n'),
-	(u'kad', u'', u'', u'', u'I', u'L', u'Kadara', u'\r\n'),
-	(u'kae', u'', u'', u'', u'I', u'E', u'Ketangalan', u'\r\n'),
-	(u'kaf', u'', u'', u'', u'I', u'L', u'Katso', u'\r\n'),
-	(u'kag', u'', u'', u'', u'I', u'L', u'Kajaman', u'\r\n'),
-	(u'kah', u'', u'', u'', u'I', u'L', u'Kara (Central African Republic)', u'\r\n'),
-	(u'kai', u'', u'', u'', u'I', u'L', u'Karekare', u'\r\n'),
-	(u'kaj', u'', u'', u'', u'I', u'L', u'Jju', u'\r\n'),
-	(u'kak', u'', u'', u'', u'I', u'L', u'Kayapa Kallahan', u'\r\n'),
-	(u'kal', u'kal', u'kal', u'kl', u'I', u'L', u'Kalaallisut', u'\r\n'),
-	(u'kam', u'kam', u'kam', u'', u'I', u'L', u'Kamba (Kenya)', u'\r\n'),
-	(u'kan', u'kan', u'kan', u'kn', u'I', u'L', u'Kannada', u'\r\n'),
-	(u'kao', u'', u'', u'', u'I', u'L', u'Xaasongaxango', u'\r\n'),
-	(u'kap', u'', u'', u'', u'I', u'L', u'Bezhta', u'\r\n'),
-	(u'kaq', u'', u'', u'', u'I', u'L', u'Capanahua', u'\r\n'),
-	(u'kas', u'kas', u'kas', u'ks', u'I', u'L', u'Kashmiri', u'\r\n'),
-	(u'kat', u'geo', u'kat', u'ka', u'I', u'L', u'Georgian', u'\r\n'),
-	(u'kau', u'kau', u'kau', u'kr', u'M', u'L', u'Kanuri', u'\r\n'),
-	(u'kav', u'', u'', u'', u'I', u'L', u'Katuk\xedna', u'\r\n'),
-	(u'kaw', u'kaw', u'kaw', u'', u'I', u'A', u'Kawi', u'\r\n'),
-	(u'kax', u'', u'', u'', u'I', u'L', u'Kao', u'\r\n'),
-	(u'kay', u'', u'', u'', u'I', u'L', u'Kamayur\xe1', u'\r\n'),
-	(u'kaz', u'kaz', u'kaz', u'kk', u'I', u'L', u'Kazakh', u'\r\n'),
-	(u'kba', u'', u'', u'', u'I', u'E', u'Kalarko', u'\r\n'),
-	(u'kbb', u'', u'', u'', u'I', u'E', u'Kaxui\xe2na', u'\r\n'),
-	(u'kbc', u'', u'', u'', u'I', u'L', u'Kadiw\xe9u', u'\r\n'),
-	(u'kbd', u'kbd', u'kbd', u'', u'I', u'L', u'Kabardian', u'\r\n'),
-	(u'kbe', u'', u'', u'', u'I', u'L', u'Kanju', u'\r\n'),
-	(u'kbf', u'', u'', u'', u'I', u'E', u'Kakauhua', u'\r\n'),
-	(u'kbg', u'', u'', u'', u'I', u'L', u'Khamba', u'\r\n'),
-	(u'kbh', u'', u'', u'', u'I', u'L', u'Cams\xe1', u'\r\n'),
-	(u'kbi', u'', u'', u'', u'I', u'L', u'Kaptiau', u'\r\n'),
-	(u'kbj', u'', u'', u'', u'I', u'L', u'Kari', u'\r\n'),
-	(u'kbk', u'', u'', u'', u'I', u'L', u'Grass Koiari', u'\r\n'),
-	(u'kbl', u'', u'', u'', u'I', u'L', u'Kanembu', u'\r\n'),
-	(u'kbm', u'', u'', u'', u'I', u'L', u'Iwal', u'\r\n'),
-	(u'kbn', u'', u'', u'', u'I', u'L', u'Kare (Central African Republic)', u'\r\n'),
-	(u'kbo', u'', u'', u'', u'I', u'L', u'Keliko', u'\r\n'),
-	(u'kbp', u'', u'', u'', u'I', u'L', u'Kabiy\xe8', u'\r\n'),
-	(u'kbq', u'', u'', u'', u'I', u'L', u'Kamano', u'\r\n'),
-	(u'kbr', u'', u'', u'', u'I', u'L', u'Kafa', u'\r\n'),
-	(u'kbs', u'', u'', u'', u'I', u'L', u'Kande', u'\r\n'),
-	(u'kbt', u'', u'', u'', u'I', u'L', u'Abadi', u'\r\n'),
-	(u'kbu', u'', u'', u'', u'I', u'L', u'Kabutra', u'\r\n'),
-	(u'kbv', u'', u'', u'', u'I', u'L', u'Dera (Indonesia)', u'\r\n'),
-	(u'kbw', u'', u'', u'', u'I', u'L', u'Kaiep', u'\r\n'),
-	(u'kbx', u'', u'', u'', u'I', u'L', u'Ap Ma', u'\r\n'),
-	(u'kby', u'', u'', u'', u'I', u'L', u'Manga Kanuri', u'\r\n'),
-	(u'kbz', u'', u'', u'', u'I', u'L', u'Duhwa', u'\r\n'),
-	(u'kca', u'', u'', u'', u'I', u'L', u'Khanty', u'\r\n'),
-	(u'kcb', u'', u'', u'', u'I', u'L', u'Kawacha', u'\r\n'),
-	(u'kcc', u'', u'', u'', u'I', u'L', u'Lubila', u'\r\n'),
-	(u'kcd', u'', u'', u'', u'I', u'L', u'Ngk\xe2lmpw Kanum', u'\r\n'),
-	(u'kce', u'', u'', u'', u'I', u'L', u'Kaivi', u'\r\n'),
-	(u'kcf', u'', u'', u'', u'I', u'L', u'Ukaan', u'\r\n'),
-	(u'kcg', u'', u'', u'', u'I', u'L', u'Tyap', u'\r\n'),
-	(u'kch', u'', u'', u'', u'I', u'L', u'Vono', u'\r\n'),
-	(u'kci', u'', u'', u'', u'I', u'L', u'Kamantan', u'\r\n'),
-	(u'kcj', u'', u'', u'', u'I', u'L', u'Kobiana', u'\r\n'),
-	(u'kck', u'', u'', u'', u'I', u'L', u'Kalanga', u'\r\n'),
-	(u'kcl', u'', u'', u'', u'I', u'L', u'Kela (Papua New Guinea)', u'\r\n'),
-	(u'kcm', u'', u'', u'', u'I', u'L', u'Gula (Central African Republic)', u'\r\n'),
-	(u'kcn', u'', u'', u'', u'I', u'L', u'Nubi', u'\r\n'),
-	(u'kco', u'', u'', u'', u'I', u'L', u'Kinalakna', u'\r\n'),
-	(u'kcp', u'', u'', u'', u'I', u'L', u'Kanga', u'\r\n'),
-	(u'kcq', u'', u'', u'', u'I', u'L', u'Kamo', u'\r\n'),
-	(u'kcr', u'', u'', u'', u'I', u'L', u'Katla', u'\r\n'),
-	(u'kcs', u'', u'', u'', u'I', u'L', u'Koenoem', u'\r\n'),
-	(u'kct', u'', u'', u'', u'I', u'L', u'Kaian', u'\r\n'),
-	(u'kcu', u'', u'', u'', u'I', u'L', u'Kami (Tanzania)', u'\r\n'),
-	(u'kcv', u'', u'', u'', u'I', u'L', u'Kete', u'\r\n'),
-	(u'kcw', u'', u'', u'', u'I', u'L', u'Kabwari', u'\r\n'),
-	(u'kcx', u'', u'', u'', u'I', u'L', u'Kachama-Ganjule', u'\r\n'),
-	(u'kcy', u'', u'', u'', u'I', u'L', u'Korandje', u'\r\n'),
-	(u'kcz', u'', u'', u'', u'I', u'L', u'Konongo', u'\r\n'),
-	(u'kda', u'', u'', u'', u'I', u'E', u'Worimi', u'\r\n'),
-	(u'kdc', u'', u'', u'', u'I', u'L', u'Kutu', u'\r\n'),
-	(u'kdd', u'', u'', u'', u'I', u'L', u'Yankunytjatjara', u'\r\n'),
-	(u'kde', u'', u'', u'', u'I', u'L', u'Makonde', u'\r\n'),
-	(u'kdf', u'', u'', u'', u'I', u'L', u'Mamusi', u'\r\n'),
-	(u'kdg', u'', u'', u'', u'I', u'L', u'Seba', u'\r\n'),
-	(u'kdh', u'', u'', u'', u'I', u'L', u'Tem', u'\r\n'),
-	(u'kdi', u'', u'', u'', u'I', u'L', u'Kumam', u'\r\n'),
-	(u'kdj', u'', u'', u'', u'I', u'L', u'Karamojong', u'\r\n'),
-	(u'kdk', u'', u'', u'', u'I', u'L', u'Numee', u'\r\n'),
-	(u'kdl', u'', u'', u'', u'I', u'L', u'Tsikimba', u'\r\n'),
-	(u'kdm', u'', u'', u'', u'I', u'L', u'Kagoma', u'\r\n'),
-	(u'kdn', u'', u'', u'', u'I', u'L', u'Kunda', u'\r\n'),
-	(u'kdp', u'', u'', u'', u'I', u'L', u'Kaningdon-Nindem', u'\r\n'),
-	(u'kdq', u'', u'', u'', u'I', u'L', u'Koch', u'\r\n'),
-	(u'kdr', u'', u'', u'', u'I', u'L', u'Karaim', u'\r\n'),
-	(u'kdt', u'', u'', u'', u'I', u'L', u'Kuy', u'\r\n'),
-	(u'kdu', u'', u'', u'', u'I', u'L', u'Kadaru', u'\r\n'),
-	(u'kdv', u'', u'', u'', u'I', u'L', u'Kado', u'\r\n'),
-	(u'kdw', u'', u'', u'', u'I', u'L', u'Koneraw', u'\r\n'),
-	(u'kdx', u'', u'', u'', u'I', u'L', u'Kam', u'\r\n'),
-	(u'kdy', u'', u'', u'', u'I', u'L', u'Keder', u'\r\n'),
-	(u'kdz', u'', u'', u'', u'I', u'L', u'Kwaja', u'\r\n'),
-	(u'kea', u'', u'', u'', u'I', u'L', u'Kabuverdianu', u'\r\n'),
-	(u'keb', u'', u'', u'', u'I', u'L', u'K\xe9l\xe9', u'\r\n'),
-	(u'kec', u'', u'', u'', u'I', u'L', u'Keiga', u'\r\n'),
-	(u'ked', u'', u'', u'', u'I', u'L', u'Kerewe', u'\r\n'),
-	(u'kee', u'', u'', u'', u'I', u'L', u'Eastern Keres', u'\r\n'),
-	(u'kef', u'', u'', u'', u'I', u'L', u'Kpessi', u'\r\n'),
-	(u'keg', u'', u'', u'', u'I', u'L', u'Tese', u'\r\n'),
-	(u'keh', u'', u'', u'', u'I', u'L', u'Keak', u'\r\n'),
-	(u'kei', u'', u'', u'', u'I', u'L', u'Kei', u'\r\n'),
-	(u'kej', u'', u'', u'', u'I', u'L', u'Kadar', u'\r\n'),
-	(u'kek', u'', u'', u'', u'I', u'L', u'Kekch\xed', u'\r\n'),
-	(u'kel', u'', u'', u'', u'I', u'L', u'Kela (Democratic Republic of Congo)', u'\r\n'),
-	(u'kem', u'', u'', u'', u'I', u'L', u'Kemak', u'\r\n'),
-	(u'ken', u'', u'', u'', u'I', u'L', u'Kenyang', u'\r\n'),
-	(u'keo', u'', u'', u'', u'I', u'L', u'Kakwa', u'\r\n'),
-	(u'kep', u'', u'', u'', u'I', u'L', u'Kaikadi', u'\r\n'),
-	(u'keq', u'', u'', u'', u'I', u'L', u'Kamar', u'\r\n'),
-	(u'ker', u'', u'', u'', u'I', u'L', u'Kera', u'\r\n'),
-	(u'kes', u'', u'', u'', u'I', u'L', u'Kugbo', u'\r\n'),
-	(u'ket', u'', u'', u'', u'I', u'L', u'Ket', u'\r\n'),
-	(u'keu', u'', u'', u'', u'I', u'L', u'Akebu', u'\r\n'),
-	(u'kev', u'', u'', u'', u'I', u'L', u'Kanikkaran', u'\r\n'),
-	(u'kew', u'', u'', u'', u'I', u'L', u'West Kewa', u'\r\n'),
-	(u'kex', u'', u'', u'', u'I', u'L', u'Kukna', u'\r\n'),
-	(u'key', u'', u'', u'', u'I', u'L', u'Kupia', u'\r\n'),
-	(u'kez', u'', u'', u'', u'I', u'L', u'Kukele', u'\r\n'),
-	(u'kfa', u'', u'', u'', u'I', u'L', u'Kodava', u'\r\n'),
-	(u'kfb', u'', u'', u'', u'I', u'L', u'Northwestern Kolami', u'\r\n'),
-	(u'kfc', u'', u'', u'', u'I', u'L', u'Konda-Dora', u'\r\n'),
-	(u'kfd', u'', u'', u'', u'I', u'L', u'Korra Koraga', u'\r\n'),
-	(u'kfe', u'', u'', u'', u'I', u'L', u'Kota (India)', u'\r\n'),
-	(u'kff', u'', u'', u'', u'I', u'L', u'Koya', u'\r\n'),
-	(u'kfg', u'', u'', u'', u'I', u'L', u'Kudiya', u'\r\n'),
-	(u'kfh', u'', u'', u'', u'I', u'L', u'Kurichiya', u'\r\n'),
-	(u'kfi', u'', u'', u'', u'I', u'L', u'Kannada Kurumba', u'\r\n'),
-	(u'kfj', u'', u'', u'', u'I', u'L', u'Kemiehua', u'\r\n'),
-	(u'kfk', u'', u'', u'', u'I', u'L', u'Kinnauri', u'\r\n'),
-	(u'kfl', u'', u'', u'', u'I', u'L', u'Kung', u'\r\n'),
-	(u'kfm', u'', u'', u'', u'I', u'L', u'Khunsari', u'\r\n'),
-	(u'kfn', u'', u'', u'', u'I', u'L', u'Kuk', u'\r\n'),
-	(u'kfo', u'', u'', u'', u'I', u'L', u"Koro (C\xf4te d'Ivoire)", u'\r\n'),
-	(u'kfp', u'', u'', u'', u'I', u'L', u'Korwa', u'\r\n'),
-	(u'kfq', u'', u'', u'', u'I', u'L', u'Korku', u'\r\n'),
-	(u'kfr', u'', u'', u'', u'I', u'L', u'Kachchi', u'\r\n'),
-	(u'kfs', u'', u'', u'', u'I', u'L', u'Bilaspuri', u'\r\n'),
-	(u'kft', u'', u'', u'', u'I', u'L', u'Kanjari', u'\r\n'),
-	(u'kfu', u'', u'', u'', u'I', u'L', u'Katkari', u'\r\n'),
-	(u'kfv', u'', u'', u'', u'I', u'L', u'Kurmukar', u'\r\n'),
-	(u'kfw', u'', u'', u'', u'I', u'L', u'Kharam Naga', u'\r\n'),
-	(u'kfx', u'', u'', u'', u'I', u'L', u'Kullu Pahari', u'\r\n'),
-	(u'kfy', u'', u'', u'', u'I', u'L', u'Kumaoni', u'\r\n'),
-	(u'kfz', u'', u'', u'', u'I', u'L', u'Koromf\xe9', u'\r\n'),
-	(u'kga', u'', u'', u'', u'I', u'L', u'Koyaga', u'\r\n'),
-	(u'kgb', u'', u'', u'', u'I', u'L', u'Kawe', u'\r\n'),
-	(u'kgc', u'', u'', u'', u'I', u'L', u'Kasseng', u'\r\n'),
-	(u'kgd', u'', u'', u'', u'I', u'L', u'Kataang', u'\r\n'),
-	(u'kge', u'', u'', u'', u'I', u'L', u'Komering', u'\r\n'),
-	(u'kgf', u'', u'', u'', u'I', u'L', u'Kube', u'\r\n'),
-	(u'kgg', u'', u'', u'', u'I', u'L', u'Kusunda', u'\r\n'),
-	(u'kgh', u'', u'', u'', u'I', u'L', u'Upper Tanudan Kalinga', u'\r\n'),
-	(u'kgi', u'', u'', u'', u'I', u'L', u'Selangor Sign Language', u'\r\n'),
-	(u'kgj', u'', u'', u'', u'I', u'L', u'Gamale Kham', u'\r\n'),
-	(u'kgk', u'', u'', u'', u'I', u'L', u'Kaiw\xe1', u'\r\n'),
-	(u'kgl', u'', u'', u'', u'I', u'E', u'Kunggari', u'\r\n'),
-	(u'kgm', u'', u'', u'', u'I', u'E', u'Karip\xfana', u'\r\n'),
-	(u'kgn', u'', u'', u'', u'I', u'L', u'Karingani', u'\r\n'),
-	(u'kgo', u'', u'', u'', u'I', u'L', u'Krongo', u'\r\n'),
-	(u'kgp', u'', u'', u'', u'I', u'L', u'Kaingang', u'\r\n'),
-	(u'kgq', u'', u'', u'', u'I', u'L', u'Kamoro', u'\r\n'),
-	(u'kgr', u'', u'', u'', u'I', u'L', u'Abun', u'\r\n'),
-	(u'kgs', u'', u'', u'', u'I', u'L', u'Kumbainggar', u'\r\n'),
-	(u'kgt', u'', u'', u'', u'I', u'L', u'Somyev', u'\r\n'),
-	(u'kgu', u'', u'', u'', u'I', u'L', u'Kobol', u'\r\n'),
-	(u'kgv', u'', u'', u'', u'I', u'L', u'Karas', u'\r\n'),
-	(u'kgw', u'', u'', u'', u'I', u'L', u'Karon Dori', u'\r\n'),
-	(u'kgx', u'', u'', u'', u'I', u'L', u'Kamaru', u'\r\n'),
-	(u'kgy', u'', u'', u'', u'I', u'L', u'Kyerung', u'\r\n'),
-	(u'kha', u'kha', u'kha', u'', u'I', u'L', u'Khasi', u'\r\n'),
-	(u'khb', u'', u'', u'', u'I', u'L', u'L\xfc', u'\r\n'),
-	(u'khc', u'', u'', u'', u'I', u'L', u'Tukang Besi North', u'\r\n'),
-	(u'khd', u'', u'', u'', u'I', u'L', u'B\xe4di Kanum', u'\r\n'),
-	(u'khe', u'', u'', u'', u'I', u'L', u'Korowai', u'\r\n'),
-	(u'khf', u'', u'', u'', u'I', u'L', u'Khuen', u'\r\n'),
-	(u'khg', u'', u'', u'', u'I', u'L', u'Khams Tibetan', u'\r\n'),
-	(u'khh', u'', u'', u'', u'I', u'L', u'Kehu', u'\r\n'),
-	(u'khj', u'', u'', u'', u'I', u'L', u'Kuturmi', u'\r\n'),
-	(u'khk', u'', u'', u'', u'I', u'L', u'Halh Mongolian', u'\r\n'),
-	(u'khl', u'', u'', u'', u'I', u'L', u'Lusi', u'\r\n'),
-	(u'khm', u'khm', u'khm', u'km', u'I', u'L', u'Central Khmer', u'\r\n'),
-	(u'khn', u'', u'', u'', u'I', u'L', u'Khandesi', u'\r\n'),
-	(u'kho', u'kho', u'kho', u'', u'I', u'A', u'Khotanese', u'\r\n'),
-	(u'khp', u'', u'', u'', u'I', u'L', u'Kapori', u'\r\n'),
-	(u'khq', u'', u'', u'', u'I', u'L', u'Koyra Chiini Songhay', u'\r\n'),
-	(u'khr', u'', u'', u'', u'I', u'L', u'Kharia', u'\r\n'),
-	(u'khs', u'', u'', u'', u'I', u'L', u'Kasua', u'\r\n'),
-	(u'kht', u'', u'', u'', u'I', u'L', u'Khamti', u'\r\n'),
-	(u'khu', u'', u'', u'', u'I', u'L', u'Nkhumbi', u'\r\n'),
-	(u'khv', u'', u'', u'', u'I', u'L', u'Khvarshi', u'\r\n'),
-	(u'khw', u'', u'', u'', u'I', u'L', u'Khowar', u'\r\n'),
-	(u'khx', u'', u'', u'', u'I', u'L', u'Kanu', u'\r\n'),
-	(u'khy', u'', u'', u'', u'I', u'L', u'Kele (Democratic Republic of Congo)', u'\r\n'),
-	(u'khz', u'', u'', u'', u'I', u'L', u'Keapara', u'\r\n'),
-	(u'kia', u'', u'', u'', u'I', u'L', u'Kim', u'\r\n'),
-	(u'kib', u'', u'', u'', u'I', u'L', u'Koalib', u'\r\n'),
-	(u'kic', u'', u'', u'', u'I', u'L', u'Kickapoo', u'\r\n'),
-	(u'kid', u'', u'', u'', u'I', u'L', u'Koshin', u'\r\n'),
-	(u'kie', u'', u'', u'', u'I', u'L', u'Kibet', u'\r\n'),
-	(u'kif', u'', u'', u'', u'I', u'L', u'Eastern Parbate Kham', u'\r\n'),
-	(u'kig', u'', u'', u'', u'I', u'L', u'Kimaama', u'\r\n'),
-	(u'kih', u'', u'', u'', u'I', u'L', u'Kilmeri', u'\r\n'),
-	(u'kii', u'', u'', u'', u'I', u'E', u'Kitsai', u'\r\n'),
-	(u'kij', u'', u'', u'', u'I', u'L', u'Kilivila', u'\r\n'),
-	(u'kik', u'kik', u'kik', u'ki', u'I', u'L', u'Kikuyu', u'\r\n'),
-	(u'kil', u'', u'', u'', u'I', u'L', u'Kariya', u'\r\n'),
-	(u'kim', u'', u'', u'', u'I', u'L', u'Karagas', u'\r\n'),
-	(u'kin', u'kin', u'kin', u'rw', u'I', u'L', u'Kinyarwanda', u'\r\n'),
-	(u'kio', u'', u'', u'', u'I', u'L', u'Kiowa', u'\r\n'),
-	(u'kip', u'', u'', u'', u'I', u'L', u'Sheshi Kham', u'\r\n'),
-	(u'kiq', u'', u'', u'', u'I', u'L', u'Kosadle', u'\r\n'),
-	(u'kir', u'kir', u'kir', u'ky', u'I', u'L', u'Kirghiz', u'\r\n'),
-	(u'kis', u'', u'', u'', u'I', u'L', u'Kis', u'\r\n'),
-	(u'kit', u'', u'', u'', u'I', u'L', u'Agob', u'\r\n'),
-	(u'kiu', u'', u'', u'', u'I', u'L', u'Kirmanjki (individual language)', u'\r\n'),
-	(u'kiv', u'', u'', u'', u'I', u'L', u'Kimbu', u'\r\n'),
-	(u'kiw', u'', u'', u'', u'I', u'L', u'Northeast Kiwai', u'\r\n'),
-	(u'kix', u'', u'', u'', u'I', u'L', u'Khiamniungan Naga', u'\r\n'),
-	(u'kiy', u'', u'', u'', u'I', u'L', u'Kirikiri', u'\r\n'),
-	(u'kiz', u'', u'', u'', u'I', u'L', u'Kisi', u'\r\n'),
-	(u'kja', u'', u'', u'', u'I', u'L', u'Mlap', u'\r\n'),
-	(u'kjb', u'', u'', u'', u'I', u'L', u"Q'anjob'al", u'\r\n'),
-	(u'kjc', u'', u'', u'', u'I', u'L', u'Coastal Konjo', u'\r\n'),
-	(u'kjd', u'', u'', u'', u'I', u'L', u'Southern Kiwai', u'\r\n'),
-	(u'kje', u'', u'', u'', u'I', u'L', u'Kisar', u'\r\n'),
-	(u'kjf', u'', u'', u'', u'I', u'L', u'Khalaj', u'\r\n'),
-	(u'kjg', u'', u'', u'', u'I', u'L', u'Khmu', u'\r\n'),
-	(u'kjh', u'', u'', u'', u'I', u'L', u'Khakas', u'\r\n'),
-	(u'kji', u'', u'', u'', u'I', u'L', u'Zabana', u'\r\n'),
-	(u'kjj', u'', u'', u'', u'I', u'L', u'Khinalugh', u'\r\n'),
-	(u'kjk', u'', u'', u'', u'I', u'L', u'Highland Konjo', u'\r\n'),
-	(u'kjl', u'', u'', u'', u'I', u'L', u'Western Parbate Kham', u'\r\n'),
-	(u'kjm', u'', u'', u'', u'I', u'L', u'Kh\xe1ng', u'\r\n'),
-	(u'kjn', u'', u'', u'', u'I', u'L', u'Kunjen', u'\r\n'),
-	(u'kjo', u'', u'', u'', u'I', u'L', u'Harijan Kinnauri', u'\r\n'),
-	(u'kjp', u'', u'', u'', u'I', u'L', u'Pwo Eastern Karen', u'\r\n'),
-	(u'kjq', u'', u'', u'', u'I', u'L', u'Western Keres', u'\r\n'),
-	(u'kjr', u'', u'', u'', u'I', u'L', u'Kurudu', u'\r\n'),
-	(u'kjs', u'', u'', u'', u'I', u'L', u'East Kewa', u'\r\n'),
-	(u'kjt', u'', u'', u'', u'I', u'L', u'Phrae Pwo Karen', u'\r\n'),
-	(u'kju', u'', u'', u'', u'I', u'L', u'Kashaya', u'\r\n'),
-	(u'kjx', u'', u'', u'', u'I', u'L', u'Ramopa', u'\r\n'),
-	(u'kjy', u'', u'', u'', u'I', u'L', u'Erave', u'\r\n'),
-	(u'kjz', u'', u'', u'', u'I', u'L', u'Bumthangkha', u'\r\n'),
-	(u'kka', u'', u'', u'', u'I', u'L', u'Kakanda', u'\r\n'),
-	(u'kkb', u'', u'', u'', u'I', u'L', u'Kwerisa', u'\r\n'),
-	(u'kkc', u'', u'', u'', u'I', u'L', u'Odoodee', u'\r\n'),
-	(u'kkd', u'', u'', u'', u'I', u'L', u'Kinuku', u'\r\n'),
-	(u'kke', u'', u'', u'', u'I', u'L', u'Kakabe', u'\r\n'),
-	(u'kkf', u'', u'', u'', u'I', u'L', u'Kalaktang Monpa', u'\r\n'),
-	(u'kkg', u'', u'', u'', u'I', u'L', u'Mabaka Valley Kalinga', u'\r\n'),
-	(u'kkh', u'', u'', u'', u'I', u'L', u'Kh\xfcn', u'\r\n'),
-	(u'kki', u'', u'', u'', u'I', u'L', u'Kagulu', u'\r\n'),
-	(u'kkj', u'', u'', u'', u'I', u'L', u'Kako', u'\r\n'),
-	(u'kkk', u'', u'', u'', u'I', u'L', u'Kokota', u'\r\n'),
-	(u'kkl', u'', u'', u'', u'I', u'L', u'Kosarek Yale', u'\r\n'),
-	(u'kkm', u'', u'', u'', u'I', u'L', u'Kiong', u'\r\n'),
-	(u'kkn', u'', u'', u'', u'I', u'L', u'Kon Keu', u'\r\n'),
-	(u'kko', u'', u'', u'', u'I', u'L', u'Karko', u'\r\n'),
-	(u'kkp', u'', u'', u'', u'I', u'L', u'Gugubera', u'\r\n'),
-	(u'kkq', u'', u'', u'', u'I', u'L', u'Kaiku', u'\r\n'),
-	(u'kkr', u'', u'', u'', u'I', u'L', u'Kir-Balar', u'\r\n'),
-	(u'kks', u'', u'', u'', u'I', u'L', u'Giiwo', u'\r\n'),
-	(u'kkt', u'', u'', u'', u'I', u'L', u'Koi', u'\r\n'),
-	(u'kku', u'', u'', u'', u'I', u'L', u'Tumi', u'\r\n'),
-	(u'kkv', u'', u'', u'', u'I', u'L', u'Kangean', u'\r\n'),
-	(u'kkw', u'', u'', u'', u'I', u'L', u'Teke-Kukuya', u'\r\n'),
-	(u'kkx', u'', u'', u'', u'I', u'L', u'Kohin', u'\r\n'),
-	(u'kky', u'', u'', u'', u'I', u'L', u'Guguyimidjir', u'\r\n'),
-	(u'kkz', u'', u'', u'', u'I', u'L', u'Kaska', u'\r\n'),
-	(u'kla', u'', u'', u'', u'I', u'E', u'Klamath-Modoc', u'\r\n'),
-	(u'klb', u'', u'', u'', u'I', u'L', u'Kiliwa', u'\r\n'),
-	(u'klc', u'', u'', u'', u'I', u'L', u'Kolbila', u'\r\n'),
-	(u'kld', u'', u'', u'', u'I', u'L', u'Gamilaraay', u'\r\n'),
-	(u'kle', u'', u'', u'', u'I', u'L', u'Kulung (Nepal)', u'\r\n'),
-	(u'klf', u'', u'', u'', u'I', u'L', u'Kendeje', u'\r\n'),
-	(u'klg', u'', u'', u'', u'I', u'L', u'Tagakaulo', u'\r\n'),
-	(u'klh', u'', u'', u'', u'I', u'L', u'Weliki', u'\r\n'),
-	(u'kli', u'', u'', u'', u'I', u'L', u'Kalumpang', u'\r\n'),
-	(u'klj', u'', u'', u'', u'I', u'L', u'Turkic Khalaj', u'\r\n'),
-	(u'klk', u'', u'', u'', u'I', u'L', u'Kono (Nigeria)', u'\r\n'),
-	(u'kll', u'', u'', u'', u'I', u'L', u'Kagan Kalagan', u'\r\n'),
-	(u'klm', u'', u'', u'', u'I', u'L', u'Migum', u'\r\n'),
-	(u'kln', u'', u'', u'', u'M', u'L', u'Kalenjin', u'\r\n'),
-	(u'klo', u'', u'', u'', u'I', u'L', u'Kapya', u'\r\n'),
-	(u'klp', u'', u'', u'', u'I', u'L', u'Kamasa', u'\r\n'),
-	(u'klq', u'', u'', u'', u'I', u'L', u'Rumu', u'\r\n'),
-	(u'klr', u'', u'', u'', u'I', u'L', u'Khaling', u'\r\n'),
-	(u'kls', u'', u'', u'', u'I', u'L', u'Kalasha', u'\r\n'),
-	(u'klt', u'', u'', u'', u'I', u'L', u'Nukna', u'\r\n'),
-	(u'klu', u'', u'', u'', u'I', u'L', u'Klao', u'\r\n'),
-	(u'klv', u'', u'', u'', u'I', u'L', u'Maskelynes', u'\r\n'),
-	(u'klw', u'', u'', u'', u'I', u'L', u'Lindu', u'\r\n'),
-	(u'klx', u'', u'', u'', u'I', u'L', u'Koluwawa', u'\r\n'),
-	(u'kly', u'', u'', u'', u'I', u'L', u'Kalao', u'\r\n'),
-	(u'klz', u'', u'', u'', u'I', u'L', u'Kabola', u'\r\n'),
-	(u'kma', u'', u'', u'', u'I', u'L', u'Konni', u'\r\n'),
-	(u'kmb', u'kmb', u'kmb', u'', u'I', u'L', u'Kimbundu', u'\r\n'),
-	(u'kmc', u'', u'', u'', u'I', u'L', u'Southern Dong', u'\r\n'),
-	(u'kmd', u'', u'', u'', u'I', u'L', u'Majukayang Kalinga', u'\r\n'),
-	(u'kme', u'', u'', u'', u'I', u'L', u'Bakole', u'\r\n'),
-	(u'kmf', u'', u'', u'', u'I', u'L', u'Kare (Papua New Guinea)', u'\r\n'),
-	(u'kmg', u'', u'', u'', u'I', u'L', u'K\xe2te', u'\r\n'),
-	(u'kmh', u'', u'', u'', u'I', u'L', u'Kalam', u'\r\n'),
-	(u'kmi', u'', u'', u'', u'I', u'L', u'Kami (Nigeria)', u'\r\n'),
-	(u'kmj', u'', u'', u'', u'I', u'L', u'Kumarbhag Paharia', u'\r\n'),
-	(u'kmk', u'', u'', u'', u'I', u'L', u'Limos Kalinga', u'\r\n'),
-	(u'kml', u'', u'', u'', u'I', u'L', u'Lower Tanudan Kalinga', u'\r\n'),
-	(u'kmm', u'', u'', u'', u'I', u'L', u'Kom (India)', u'\r\n'),
-	(u'kmn', u'', u'', u'', u'I', u'L', u'Awtuw', u'\r\n'),
-	(u'kmo', u'', u'', u'', u'I', u'L', u'Kwoma', u'\r\n'),
-	(u'kmp', u'', u'', u'', u'I', u'L', u'Gimme', u'\r\n'),
-	(u'kmq', u'', u'', u'', u'I', u'L', u'Kwama', u'\r\n'),
-	(u'kmr', u'', u'', u'', u'I', u'L', u'Northern Kurdish', u'\r\n'),
-	(u'kms', u'', u'', u'', u'I', u'L', u'Kamasau', u'\r\n'),
-	(u'kmt', u'', u'', u'', u'I', u'L', u'Kemtuik', u'\r\n'),
-	(u'kmu', u'', u'', u'', u'I', u'L', u'Kanite', u'\r\n'),
-	(u'kmv', u'', u'', u'', u'I', u'L', u'Karip\xfana Creole French', u'\r\n'),
-	(u'kmw', u'', u'', u'', u'I', u'L', u'Komo (Democratic Republic of Congo)', u'\r\n'),
-	(u'kmx', u'', u'', u'', u'I', u'L', u'Waboda', u'\r\n'),
-	(u'kmy', u'', u'', u'', u'I', u'L', u'Koma', u'\r\n'),
-	(u'kmz', u'', u'', u'', u'I', u'L', u'Khorasani Turkish', u'\r\n'),
-	(u'kna', u'', u'', u'', u'I', u'L', u'Dera (Nigeria)', u'\r\n'),
-	(u'knb', u'', u'', u'', u'I', u'L', u'Lubuagan Kalinga', u'\r\n'),
-	(u'knc', u'', u'', u'', u'I', u'L', u'Central Kanuri', u'\r\n'),
-	(u'knd', u'', u'', u'', u'I', u'L', u'Konda', u'\r\n'),
-	(u'kne', u'', u'', u'', u'I', u'L', u'Kankanaey', u'\r\n'),
-	(u'knf', u'', u'', u'', u'I', u'L', u'Mankanya', u'\r\n'),
-	(u'kng', u'', u'', u'', u'I', u'L', u'Koongo', u'\r\n'),
-	(u'kni', u'', u'', u'', u'I', u'L', u'Kanufi', u'\r\n'),
-	(u'knj', u'', u'', u'', u'I', u'L', u'Western Kanjobal', u'\r\n'),
-	(u'knk', u'', u'', u'', u'I', u'L', u'Kuranko', u'\r\n'),
-	(u'knl', u'', u'', u'', u'I', u'L', u'Keninjal', u'\r\n'),
-	(u'knm', u'', u'', u'', u'I', u'L', u'Kanamar\xed', u'\r\n'),
-	(u'knn', u'', u'', u'', u'I', u'L', u'Konkani (individual language)', u'\r\n'),
-	(u'kno', u'', u'', u'', u'I', u'L', u'Kono (Sierra Leone)', u'\r\n'),
-	(u'knp', u'', u'', u'', u'I', u'L', u'Kwanja', u'\r\n'),
-	(u'knq', u'', u'', u'', u'I', u'L', u'Kintaq', u'\r\n'),
-	(u'knr', u'', u'', u'', u'I', u'L', u'Kaningra', u'\r\n'),
-	(u'kns', u'', u'', u'', u'I', u'L', u'Kensiu', u'\r\n'),
-	(u'knt', u'', u'', u'', u'I', u'L', u'Panoan Katuk\xedna', u'\r\n'),
-	(u'knu', u'', u'', u'', u'I', u'L', u'Kono (Guinea)', u'\r\n'),
-	(u'knv', u'', u'', u'', u'I', u'L', u'Tabo', u'\r\n'),
-	(u'knw', u'', u'', u'', u'I', u'L', u'Kung-Ekoka', u'\r\n'),
-	(u'knx', u'', u'', u'', u'I', u'L', u'Kendayan', u'\r\n'),
-	(u'kny', u'', u'', u'', u'I', u'L', u'Kanyok', u'\r\n'),
-	(u'knz', u'', u'', u'', u'I', u'L', u'Kalams\xe9', u'\r\n'),
-	(u'koa', u'', u'', u'', u'I', u'L', u'Konomala', u'\r\n'),
-	(u'koc', u'', u'', u'', u'I', u'E', u'Kpati', u'\r\n'),
-	(u'kod', u'', u'', u'', u'I', u'L', u'Kodi', u'\r\n'),
-	(u'koe', u'', u'', u'', u'I', u'L', u'Kacipo-Balesi', u'\r\n'),
-	(u'kof', u'', u'', u'', u'I', u'E', u'Kubi', u'\r\n'),
-	(u'kog', u'', u'', u'', u'I', u'L', u'Cogui', u'\r\n'),
-	(u'koh', u'', u'', u'', u'I', u'L', u'Koyo', u'\r\n'),
-	(u'koi', u'', u'', u'', u'I', u'L', u'Komi-Permyak', u'\r\n'),
-	(u'koj', u'', u'', u'', u'I', u'L', u'Sara Dunjo', u'\r\n'),
-	(u'kok', u'kok', u'kok', u'', u'M', u'L', u'Konkani (macrolanguage)', u'\r\n'),
-	(u'kol', u'', u'', u'', u'I', u'L', u'Kol (Papua New Guinea)', u'\r\n'),
-	(u'kom', u'kom', u'kom', u'kv', u'M', u'L', u'Komi', u'\r\n'),
-	(u'kon', u'kon', u'kon', u'kg', u'M', u'L', u'Kongo', u'\r\n'),
-	(u'koo', u'', u'', u'', u'I', u'L', u'Konzo', u'\r\n'),
-	(u'kop', u'', u'', u'', u'I', u'L', u'Kwato', u'\r\n'),
-	(u'koq', u'', u'', u'', u'I', u'L', u'Kota (Gabon)', u'\r\n'),
-	(u'kor', u'kor', u'kor', u'ko', u'I', u'L', u'Korean', u'\r\n'),
-	(u'kos', u'kos', u'kos', u'', u'I', u'L', u'Kosraean', u'\r\n'),
-	(u'kot', u'', u'', u'', u'I', u'L', u'Lagwan', u'\r\n'),
-	(u'kou', u'', u'', u'', u'I', u'L', u'Koke', u'\r\n'),
-	(u'kov', u'', u'', u'', u'I', u'L', u'Kudu-Camo', u'\r\n'),
-	(u'kow', u'', u'', u'', u'I', u'L', u'Kugama', u'\r\n'),
-	(u'kox', u'', u'', u'', u'I', u'E', u'Coxima', u'\r\n'),
-	(u'koy', u'', u'', u'', u'I', u'L', u'Koyukon', u'\r\n'),
-	(u'koz', u'', u'', u'', u'I', u'L', u'Korak', u'\r\n'),
-	(u'kpa', u'', u'', u'', u'I', u'L', u'Kutto', u'\r\n'),
-	(u'kpb', u'', u'', u'', u'I', u'L', u'Mullu Kurumba', u'\r\n'),
-	(u'kpc', u'', u'', u'', u'I', u'L', u'Curripaco', u'\r\n'),
-	(u'kpd', u'', u'', u'', u'I', u'L', u'Koba', u'\r\n'),
-	(u'kpe', u'kpe', u'kpe', u'', u'M', u'L', u'Kpelle', u'\r\n'),
-	(u'kpf', u'', u'', u'', u'I', u'L', u'Komba', u'\r\n'),
-	(u'kpg', u'', u'', u'', u'I', u'L', u'Kapingamarangi', u'\r\n'),
-	(u'kph', u'', u'', u'', u'I', u'L', u'Kplang', u'\r\n'),
-	(u'kpi', u'', u'', u'', u'I', u'L', u'Kofei', u'\r\n'),
-	(u'kpj', u'', u'', u'', u'I', u'L', u'Karaj\xe1', u'\r\n'),
-	(u'kpk', u'', u'', u'', u'I', u'L', u'Kpan', u'\r\n'),
-	(u'kpl', u'', u'', u'', u'I', u'L', u'Kpala', u'\r\n'),
-	(u'kpm', u'', u'', u'', u'I', u'L', u'Koho', u'\r\n'),
-	(u'kpn', u'', u'', u'', u'I', u'E', u'Kepkiriw\xe1t', u'\r\n'),
-	(u'kpo', u'', u'', u'', u'I', u'L', u'Ikposo', u'\r\n'),
-	(u'kpp', u'', u'', u'', u'I', u'L', u'Paku Karen', u'\r\n'),
-	(u'kpq', u'', u'', u'', u'I', u'L', u'Korupun-Sela', u'\r\n'),
-	(u'kpr', u'', u'', u'', u'I', u'L', u'Korafe-Yegha', u'\r\n'),
-	(u'kps', u'', u'', u'', u'I', u'L', u'Tehit', u'\r\n'),
-	(u'kpt', u'', u'', u'', u'I', u'L', u'Karata', u'\r\n'),
-	(u'kpu', u'', u'', u'', u'I', u'L', u'Kafoa', u'\r\n'),
-	(u'kpv', u'', u'', u'', u'I', u'L', u'Komi-Zyrian', u'\r\n'),
-	(u'kpw', u'', u'', u'', u'I', u'L', u'Kobon', u'\r\n'),
-	(u'kpx', u'', u'', u'', u'I', u'L', u'Mountain Koiali', u'\r\n'),
-	(u'kpy', u'', u'', u'', u'I', u'L', u'Koryak', u'\r\n'),
-	(u'kpz', u'', u'', u'', u'I', u'L', u'Kupsabiny', u'\r\n'),
-	(u'kqa', u'', u'', u'', u'I', u'L', u'Mum', u'\r\n'),
-	(u'kqb', u'', u'', u'', u'I', u'L', u'Kovai', u'\r\n'),
-	(u'kqc', u'', u'', u'', u'I', u'L', u'Doromu-Koki', u'\r\n'),
-	(u'kqd', u'', u'', u'', u'I', u'L', u'Koy Sanjaq Surat', u'\r\n'),
-	(u'kqe', u'', u'', u'', u'I', u'L', u'Kalagan', u'\r\n'),
-	(u'kqf', u'', u'', u'', u'I', u'L', u'Kakabai', u'\r\n'),
-	(u'kqg', u'', u'', u'', u'I', u'L', u'Khe', u'\r\n'),
-	(u'kqh', u'', u'', u'', u'I', u'L', u'Kisankasa', u'\r\n'),
-	(u'kqi', u'', u'', u'', u'I', u'L', u'Koitabu', u'\r\n'),
-	(u'kqj', u'', u'', u'', u'I', u'L', u'Koromira', u'\r\n'),
-	(u'kqk', u'', u'', u'', u'I', u'L', u'Kotafon Gbe', u'\r\n'),
-	(u'kql', u'', u'', u'', u'I', u'L', u'Kyenele', u'\r\n'),
-	(u'kqm', u'', u'', u'', u'I', u'L', u'Khisa', u'\r\n'),
-	(u'kqn', u'', u'', u'', u'I', u'L', u'Kaonde', u'\r\n'),
-	(u'kqo', u'', u'', u'', u'I', u'L', u'Eastern Krahn', u'\r\n'),
-	(u'kqp', u'', u'', u'', u'I', u'L', u'Kimr\xe9', u'\r\n'),
-	(u'kqq', u'', u'', u'', u'I', u'L', u'Krenak', u'\r\n'),
-	(u'kqr', u'', u'', u'', u'I', u'L', u'Kimaragang', u'\r\n'),
-	(u'kqs', u'', u'', u'', u'I', u'L', u'Northern Kissi', u'\r\n'),
-	(u'kqt', u'', u'', u'', u'I', u'L', u'Klias River Kadazan', u'\r\n'),
-	(u'kqu', u'', u'', u'', u'I', u'E', u'Seroa', u'\r\n'),
-	(u'kqv', u'', u'', u'', u'I', u'L', u'Okolod', u'\r\n'),
-	(u'kqw', u'', u'', u'', u'I', u'L', u'Kandas', u'\r\n'),
-	(u'kqx', u'', u'', u'', u'I', u'L', u'Mser', u'\r\n'),
-	(u'kqy', u'', u'', u'', u'I', u'L', u'Koorete', u'\r\n'),
-	(u'kqz', u'', u'', u'', u'I', u'E', u'Korana', u'\r\n'),
-	(u'kra', u'', u'', u'', u'I', u'L', u'Kumhali', u'\r\n'),
-	(u'krb', u'', u'', u'', u'I', u'E', u'Karkin', u'\r\n'),
-	(u'krc', u'krc', u'krc', u'', u'I', u'L', u'Karachay-Balkar', u'\r\n'),
-	(u'krd', u'', u'', u'', u'I', u'L', u'Kairui-Midiki', u'\r\n'),
-	(u'kre', u'', u'', u'', u'I', u'L', u'Panar\xe1', u'\r\n'),
-	(u'krf', u'', u'', u'', u'I', u'L', u'Koro (Vanuatu)', u'\r\n'),
-	(u'krh', u'', u'', u'', u'I', u'L', u'Kurama', u'\r\n'),
-	(u'kri', u'', u'', u'', u'I', u'L', u'Krio', u'\r\n'),
-	(u'krj', u'', u'', u'', u'I', u'L', u'Kinaray-A', u'\r\n'),
-	(u'krk', u'', u'', u'', u'I', u'E', u'Kerek', u'\r\n'),
-	(u'krl', u'krl', u'krl', u'', u'I', u'L', u'Karelian', u'\r\n'),
-	(u'krm', u'', u'', u'', u'I', u'L', u'Krim', u'\r\n'),
-	(u'krn', u'', u'', u'', u'I', u'L', u'Sapo', u'\r\n'),
-	(u'krp', u'', u'', u'', u'I', u'L', u'Korop', u'\r\n'),
-	(u'krr', u'', u'', u'', u'I', u'L', u"Kru'ng 2", u'\r\n'),
-	(u'krs', u'', u'', u'', u'I', u'L', u'Gbaya (Sudan)', u'\r\n'),
-	(u'krt', u'', u'', u'', u'I', u'L', u'Tumari Kanuri', u'\r\n'),
-	(u'kru', u'kru', u'kru', u'', u'I', u'L', u'Kurukh', u'\r\n'),
-	(u'krv', u'', u'', u'', u'I', u'L', u'Kavet', u'\r\n'),
-	(u'krw', u'', u'', u'', u'I', u'L', u'Western Krahn', u'\r\n'),
-	(u'krx', u'', u'', u'', u'I', u'L', u'Karon', u'\r\n'),
-	(u'kry', u'', u'', u'', u'I', u'L', u'Kryts', u'\r\n'),
-	(u'krz', u'', u'', u'', u'I', u'L', u'Sota Kanum', u'\r\n'),
-	(u'ksa', u'', u'', u'', u'I', u'L', u'Shuwa-Zamani', u'\r\n'),
-	(u'ksb', u'', u'', u'', u'I', u'L', u'Shambala', u'\r\n'),
-	(u'ksc', u'', u'', u'', u'I', u'L', u'Southern Kalinga', u'\r\n'),
-	(u'ksd', u'', u'', u'', u'I', u'L', u'Kuanua', u'\r\n'),
-	(u'kse', u'', u'', u'', u'I', u'L', u'Kuni', u'\r\n'),
-	(u'ksf', u'', u'', u'', u'I', u'L', u'Bafia', u'\r\n'),
-	(u'ksg', u'', u'', u'', u'I', u'L', u'Kusaghe', u'\r\n'),
-	(u'ksh', u'', u'', u'', u'I', u'L', u'K\xf6lsch', u'\r\n'),
-	(u'ksi', u'', u'', u'', u'I', u'L', u'Krisa', u'\r\n'),
-	(u'ksj', u'', u'', u'', u'I', u'L', u'Uare', u'\r\n'),
-	(u'ksk', u'', u'', u'', u'I', u'L', u'Kansa', u'\r\n'),
-	(u'ksl', u'', u'', u'', u'I', u'L', u'Kumalu', u'\r\n'),
-	(u'ksm', u'', u'', u'', u'I', u'L', u'Kumba', u'\r\n'),
-	(u'ksn', u'', u'', u'', u'I', u'L', u'Kasiguranin', u'\r\n'),
-	(u'kso', u'', u'', u'', u'I', u'L', u'Kofa', u'\r\n'),
-	(u'ksp', u'', u'', u'', u'I', u'L', u'Kaba', u'\r\n'),
-	(u'ksq', u'', u'', u'', u'I', u'L', u'Kwaami', u'\r\n'),
-	(u'ksr', u'', u'', u'', u'I', u'L', u'Borong', u'\r\n'),
-	(u'kss', u'', u'', u'', u'I', u'L', u'Southern Kisi', u'\r\n'),
-	(u'kst', u'', u'', u'', u'I', u'L', u'Winy\xe9', u'\r\n'),
-	(u'ksu', u'', u'', u'', u'I', u'L', u'Khamyang', u'\r\n'),
-	(u'ksv', u'', u'', u'', u'I', u'L', u'Kusu', u'\r\n'),
-	(u'ksw', u'', u'', u'', u'I', u'L', u"S'gaw Karen", u'\r\n'),
-	(u'ksx', u'', u'', u'', u'I', u'L', u'Kedang', u'\r\n'),
-	(u'ksy', u'', u'', u'', u'I', u'L', u'Kharia Thar', u'\r\n'),
-	(u'ksz', u'', u'', u'', u'I', u'L', u'Kodaku', u'\r\n'),
-	(u'kta', u'', u'', u'', u'I', u'L', u'Katua', u'\r\n'),
-	(u'ktb', u'', u'', u'', u'I', u'L', u'Kambaata', u'\r\n'),
-	(u'ktc', u'', u'', u'', u'I', u'L', u'Kholok', u'\r\n'),
-	(u'ktd', u'', u'', u'', u'I', u'L', u'Kokata', u'\r\n'),
-	(u'kte', u'', u'', u'', u'I', u'L', u'Nubri', u'\r\n'),
-	(u'ktf', u'', u'', u'', u'I', u'L', u'Kwami', u'\r\n'),
-	(u'ktg', u'', u'', u'', u'I', u'E', u'Kalkutung', u'\r\n'),
-	(u'kth', u'', u'', u'', u'I', u'L', u'Karanga', u'\r\n'),
-	(u'kti', u'', u'', u'', u'I', u'L', u'North Muyu', u'\r\n'),
-	(u'ktj', u'', u'', u'', u'I', u'L', u'Plapo Krumen', u'\r\n'),
-	(u'ktk', u'', u'', u'', u'I', u'E', u'Kaniet', u'\r\n'),
-	(u'ktl', u'', u'', u'', u'I', u'L', u'Koroshi', u'\r\n'),
-	(u'ktm', u'', u'', u'', u'I', u'L', u'Kurti', u'\r\n'),
-	(u'ktn', u'', u'', u'', u'I', u'L', u'Kariti\xe2na', u'\r\n'),
-	(u'kto', u'', u'', u'', u'I', u'L', u'Kuot', u'\r\n'),
-	(u'ktp', u'', u'', u'', u'I', u'L', u'Kaduo', u'\r\n'),
-	(u'ktq', u'', u'', u'', u'I', u'E', u'Katabaga', u'\r\n'),
-	(u'ktr', u'', u'', u'', u'I', u'L', u'Kota Marudu Tinagas', u'\r\n'),
-	(u'kts', u'', u'', u'', u'I', u'L', u'South Muyu', u'\r\n'),
-	(u'ktt', u'', u'', u'', u'I', u'L', u'Ketum', u'\r\n'),
-	(u'ktu', u'', u'', u'', u'I', u'L', u'Kituba (Democratic Republic of Congo)', u'\r\n'),
-	(u'ktv', u'', u'', u'', u'I', u'L', u'Eastern Katu', u'\r\n'),
-	(u'ktw', u'', u'', u'', u'I', u'E', u'Kato', u'\r\n'),
-	(u'ktx', u'', u'', u'', u'I', u'L', u'Kaxarar\xed', u'\r\n'),
-	(u'kty', u'', u'', u'', u'I', u'L', u'Kango (Bas-U\xe9l\xe9 District)', u'\r\n'),
-	(u'ktz', u'', u'', u'', u'I', u'L', u"Ju/'hoan", u'\r\n'),
-	(u'kua', u'kua', u'kua', u'kj', u'I', u'L', u'Kuanyama', u'\r\n'),
-	(u'kub', u'', u'', u'', u'I', u'L', u'Kutep', u'\r\n'),
-	(u'kuc', u'', u'', u'', u'I', u'L', u'Kwinsu', u'\r\n'),
-	(u'kud', u'', u'', u'', u'I', u'L', u"'Auhelawa", u'\r\n'),
-	(u'kue', u'', u'', u'', u'I', u'L', u'Kuman', u'\r\n'),
-	(u'kuf', u'', u'', u'', u'I', u'L', u'Western Katu', u'\r\n'),
-	(u'kug', u'', u'', u'', u'I', u'L', u'Kupa', u'\r\n'),
-	(u'kuh', u'', u'', u'', u'I', u'L', u'Kushi', u'\r\n'),
-	(u'kui', u'', u'', u'', u'I', u'L', u'Kuik\xfaro-Kalap\xe1lo', u'\r\n'),
-	(u'kuj', u'', u'', u'', u'I', u'L', u'Kuria', u'\r\n'),
-	(u'kuk', u'', u'', u'', u'I', u'L', u"Kepo'", u'\r\n'),
-	(u'kul', u'', u'', u'', u'I', u'L', u'Kulere', u'\r\n'),
-	(u'kum', u'kum', u'kum', u'', u'I', u'L', u'Kumyk', u'\r\n'),
-	(u'kun', u'', u'', u'', u'I', u'L', u'Kunama', u'\r\n'),
-	(u'kuo', u'', u'', u'', u'I', u'L', u'Kumukio', u'\r\n'),
-	(u'kup', u'', u'', u'', u'I', u'L', u'Kunimaipa', u'\r\n'),
-	(u'kuq', u'', u'', u'', u'I', u'L', u'Karipuna', u'\r\n'),
-	(u'kur', u'kur', u'kur', u'ku', u'M', u'L', u'Kurdish', u'\r\n'),
-	(u'kus', u'', u'', u'', u'I', u'L', u'Kusaal', u'\r\n'),
-	(u'kut', u'kut', u'kut', u'', u'I', u'L', u'Kutenai', u'\r\n'),
-	(u'kuu', u'', u'', u'', u'I', u'L', u'Upper Kuskokwim', u'\r\n'),
-	(u'kuv', u'', u'', u'', u'I', u'L', u'Kur', u'\r\n'),
-	(u'kuw', u'', u'', u'', u'I', u'L', u'Kpagua', u'\r\n'),
-	(u'kux', u'', u'', u'', u'I', u'L', u'Kukatja', u'\r\n'),
-	(u'kuy', u'', u'', u'', u'I', u'L', u"Kuuku-Ya'u", u'\r\n'),
-	(u'kuz', u'', u'', u'', u'I', u'E', u'Kunza', u'\r\n'),
-	(u'kva', u'', u'', u'', u'I', u'L', u'Bagvalal', u'\r\n'),
-	(u'kvb', u'', u'', u'', u'I', u'L', u'Kubu', u'\r\n'),
-	(u'kvc', u'', u'', u'', u'I', u'L', u'Kove', u'\r\n'),
-	(u'kvd', u'', u'', u'', u'I', u'L', u'Kui (Indonesia)', u'\r\n'),
-	(u'kve', u'', u'', u'', u'I', u'L', u'Kalabakan', u'\r\n'),
-	(u'kvf', u'', u'', u'', u'I', u'L', u'Kabalai', u'\r\n'),
-	(u'kvg', u'', u'', u'', u'I', u'L', u'Kuni-Boazi', u'\r\n'),
-	(u'kvh', u'', u'', u'', u'I', u'L', u'Komodo', u'\r\n'),
-	(u'kvi', u'', u'', u'', u'I', u'L', u'Kwang', u'\r\n'),
-	(u'kvj', u'', u'', u'', u'I', u'L', u'Psikye', u'\r\n'),
-	(u'kvk', u'', u'', u'', u'I', u'L', u'Korean Sign Language', u'\r\n'),
-	(u'kvl', u'', u'', u'', u'I', u'L', u'Brek Karen', u'\r\n'),
-	(u'kvm', u'', u'', u'', u'I', u'L', u'Kendem', u'\r\n'),
-	(u'kvn', u'', u'', u'', u'I', u'L', u'Border Kuna', u'\r\n'),
-	(u'kvo', u'', u'', u'', u'I', u'L', u'Dobel', u'\r\n'),
-	(u'kvp', u'', u'', u'', u'I', u'L', u'Kompane', u'\r\n'),
-	(u'kvq', u'', u'', u'', u'I', u'L', u'Geba Karen', u'\r\n'),
-	(u'kvr', u'', u'', u'', u'I', u'L', u'Kerinci', u'\r\n'),
-	(u'kvs', u'', u'', u'', u'I', u'L', u'Kunggara', u'\r\n'),
-	(u'kvt', u'', u'', u'', u'I', u'L', u'Lahta Karen', u'\r\n'),
-	(u'kvu', u'', u'', u'', u'I', u'L', u'Yinbaw Karen', u'\r\n'),
-	(u'kvv', u'', u'', u'', u'I', u'L', u'Kola', u'\r\n'),
-	(u'kvw', u'', u'', u'', u'I', u'L', u'Wersing', u'\r\n'),
-	(u'kvx', u'', u'', u'', u'I', u'L', u'Parkari Koli', u'\r\n'),
-	(u'kvy', u'', u'', u'', u'I', u'L', u'Yintale Karen', u'\r\n'),
-	(u'kvz', u'', u'', u'', u'I', u'L', u'Tsakwambo', u'\r\n'),
-	(u'kwa', u'', u'', u'', u'I', u'L', u'D\xe2w', u'\r\n'),
-	(u'kwb', u'', u'', u'', u'I', u'L', u'Kwa', u'\r\n'),
-	(u'kwc', u'', u'', u'', u'I', u'L', u'Likwala', u'\r\n'),
-	(u'kwd', u'', u'', u'', u'I', u'L', u'Kwaio', u'\r\n'),
-	(u'kwe', u'', u'', u'', u'I', u'L', u'Kwerba', u'\r\n'),
-	(u'kwf', u'', u'', u'', u'I', u'L', u"Kwara'ae", u'\r\n'),
-	(u'kwg', u'', u'', u'', u'I', u'L', u'Sara Kaba Deme', u'\r\n'),
-	(u'kwh', u'', u'', u'', u'I', u'L', u'Kowiai', u'\r\n'),
-	(u'kwi', u'', u'', u'', u'I', u'L', u'Awa-Cuaiquer', u'\r\n'),
-	(u'kwj', u'', u'', u'', u'I', u'L', u'Kwanga', u'\r\n'),
-	(u'kwk', u'', u'', u'', u'I', u'L', u'Kwakiutl', u'\r\n'),
-	(u'kwl', u'', u'', u'', u'I', u'L', u'Kofyar', u'\r\n'),
-	(u'kwm', u'', u'', u'', u'I', u'L', u'Kwambi', u'\r\n'),
-	(u'kwn', u'', u'', u'', u'I', u'L', u'Kwangali', u'\r\n'),
-	(u'kwo', u'', u'', u'', u'I', u'L', u'Kwomtari', u'\r\n'),
-	(u'kwp', u'', u'', u'', u'I', u'L', u'Kodia', u'\r\n'),
-	(u'kwq', u'', u'', u'', u'I', u'L', u'Kwak', u'\r\n'),
-	(u'kwr', u'', u'', u'', u'I', u'L', u'Kwer', u'\r\n'),
-	(u'kws', u'', u'', u'', u'I', u'L', u'Kwese', u'\r\n'),
-	(u'kwt', u'', u'', u'', u'I', u'L', u'Kwesten', u'\r\n'),
-	(u'kwu', u'', u'', u'', u'I', u'L', u'Kwakum', u'\r\n'),
-	(u'kwv', u'', u'', u'', u'I', u'L', u'Sara Kaba N\xe1\xe0', u'\r\n'),
-	(u'kww', u'', u'', u'', u'I', u'L', u'Kwinti', u'\r\n'),
-	(u'kwx', u'', u'', u'', u'I', u'L', u'Khirwar', u'\r\n'),
-	(u'kwy', u'', u'', u'', u'I', u'L', u'San Salvador Kongo', u'\r\n'),
-	(u'kwz', u'', u'', u'', u'I', u'E', u'Kwadi', u'\r\n'),
-	(u'kxa', u'', u'', u'', u'I', u'L', u'Kairiru', u'\r\n'),
-	(u'kxb', u'', u'', u'', u'I', u'L', u'Krobu', u'\r\n'),
-	(u'kxc', u'', u'', u'', u'I', u'L', u'Konso', u'\r\n'),
-	(u'kxd', u'', u'', u'', u'I', u'L', u'Brunei', u'\r\n'),
-	(u'kxe', u'', u'', u'', u'I', u'L', u'Kakihum', u'\r\n'),
-	(u'kxf', u'', u'', u'', u'I', u'L', u'Manumanaw Karen', u'\r\n'),
-	(u'kxh', u'', u'', u'', u'I', u'L', u'Karo (Ethiopia)', u'\r\n'),
-	(u'kxi', u'', u'', u'', u'I', u'L', u'Keningau Murut', u'\r\n'),
-	(u'kxj', u'', u'', u'', u'I', u'L', u'Kulfa', u'\r\n'),
-	(u'kxk', u'', u'', u'', u'I', u'L', u'Zayein Karen', u'\r\n'),
-	(u'kxl', u'', u'', u'', u'I', u'L', u'Nepali Kurux', u'\r\n'),
-	(u'kxm', u'', u'', u'', u'I', u'L', u'Northern Khmer', u'\r\n'),
-	(u'kxn', u'', u'', u'', u'I', u'L', u'Kanowit-Tanjong Melanau', u'\r\n'),
-	(u'kxo', u'', u'', u'', u'I', u'E', u'Kano\xe9', u'\r\n'),
-	(u'kxp', u'', u'', u'', u'I', u'L', u'Wadiyara Koli', u'\r\n'),
-	(u'kxq', u'', u'', u'', u'I', u'L', u'Sm\xe4rky Kanum', u'\r\n'),
-	(u'kxr', u'', u'', u'', u'I', u'L', u'Koro (Papua New Guinea)', u'\r\n'),
-	(u'kxs', u'', u'', u'', u'I', u'L', u'Kangjia', u'\r\n'),
-	(u'kxt', u'', u'', u'', u'I', u'L', u'Koiwat', u'\r\n'),
-	(u'kxu', u'', u'', u'', u'I', u'L', u'Kui (India)', u'\r\n'),
-	(u'kxv', u'', u'', u'', u'I', u'L', u'Kuvi', u'\r\n'),
-	(u'kxw', u'', u'', u'', u'I', u'L', u'Konai', u'\r\n'),
-	(u'kxx', u'', u'', u'', u'I', u'L', u'Likuba', u'\r\n'),
-	(u'kxy', u'', u'', u'', u'I', u'L', u'Kayong', u'\r\n'),
-	(u'kxz', u'', u'', u'', u'I', u'L', u'Kerewo', u'\r\n'),
-	(u'kya', u'', u'', u'', u'I', u'L', u'Kwaya', u'\r\n'),
-	(u'kyb', u'', u'', u'', u'I', u'L', u'Butbut Kalinga', u'\r\n'),
-	(u'kyc', u'', u'', u'', u'I', u'L', u'Kyaka', u'\r\n'),
-	(u'kyd', u'', u'', u'', u'I', u'L', u'Karey', u'\r\n'),
-	(u'kye', u'', u'', u'', u'I', u'L', u'Krache', u'\r\n'),
-	(u'kyf', u'', u'', u'', u'I', u'L', u'Kouya', u'\r\n'),
-	(u'kyg', u'', u'', u'', u'I', u'L', u'Keyagana', u'\r\n'),
-	(u'kyh', u'', u'', u'', u'I', u'L', u'Karok', u'\r\n'),
-	(u'kyi', u'', u'', u'', u'I', u'L', u'Kiput', u'\r\n'),
-	(u'kyj', u'', u'', u'', u'I', u'L', u'Karao', u'\r\n'),
-	(u'kyk', u'', u'', u'', u'I', u'L', u'Kamayo', u'\r\n'),
-	(u'kyl', u'', u'', u'', u'I', u'L', u'Kalapuya', u'\r\n'),
-	(u'kym', u'', u'', u'', u'I', u'L', u'Kpatili', u'\r\n'),
-	(u'kyn', u'', u'', u'', u'I', u'L', u'Northern Binukidnon', u'\r\n'),
-	(u'kyo', u'', u'', u'', u'I', u'L', u'Kelon', u'\r\n'),
-	(u'kyp', u'', u'', u'', u'I', u'L', u'Kang', u'\r\n'),
-	(u'kyq', u'', u'', u'', u'I', u'L', u'Kenga', u'\r\n'),
-	(u'kyr', u'', u'', u'', u'I', u'L', u'Kuru\xe1ya', u'\r\n'),
-	(u'kys', u'', u'', u'', u'I', u'L', u'Baram Kayan', u'\r\n'),
-	(u'kyt', u'', u'', u'', u'I', u'L', u'Kayagar', u'\r\n'),
-	(u'kyu', u'', u'', u'', u'I', u'L', u'Western Kayah', u'\r\n'),
-	(u'kyv', u'', u'', u'', u'I', u'L', u'Kayort', u'\r\n'),
-	(u'kyw', u'', u'', u'', u'I', u'L', u'Kudmali', u'\r\n'),
-	(u'kyx', u'', u'', u'', u'I', u'L', u'Rapoisi', u'\r\n'),
-	(u'kyy', u'', u'', u'', u'I', u'L', u'Kambaira', u'\r\n'),
-	(u'kyz', u'', u'', u'', u'I', u'L', u'Kayab\xed', u'\r\n'),
-	(u'kza', u'', u'', u'', u'I', u'L', u'Western Karaboro', u'\r\n'),
-	(u'kzb', u'', u'', u'', u'I', u'L', u'Kaibobo', u'\r\n'),
-	(u'kzc', u'', u'', u'', u'I', u'L', u'Bondoukou Kulango', u'\r\n'),
-	(u'kzd', u'', u'', u'', u'I', u'L', u'Kadai', u'\r\n'),
-	(u'kze', u'', u'', u'', u'I', u'L', u'Kosena', u'\r\n'),
-	(u'kzf', u'', u'', u'', u'I', u'L', u"Da'a Kaili", u'\r\n'),
-	(u'kzg', u'', u'', u'', u'I', u'L', u'Kikai', u'\r\n'),
-	(u'kzh', u'', u'', u'', u'I', u'L', u'Kenuzi-Dongola', u'\r\n'),
-	(u'kzi', u'', u'', u'', u'I', u'L', u'Kelabit', u'\r\n'),
-	(u'kzj', u'', u'', u'', u'I', u'L', u'Coastal Kadazan', u'\r\n'),
-	(u'kzk', u'', u'', u'', u'I', u'E', u'Kazukuru', u'\r\n'),
-	(u'kzl', u'', u'', u'', u'I', u'L', u'Kayeli', u'\r\n'),
-	(u'kzm', u'', u'', u'', u'I', u'L', u'Kais', u'\r\n'),
-	(u'kzn', u'', u'', u'', u'I', u'L', u'Kokola', u'\r\n'),
-	(u'kzo', u'', u'', u'', u'I', u'L', u'Kaningi', u'\r\n'),
-	(u'kzp', u'', u'', u'', u'I', u'L', u'Kaidipang', u'\r\n'),
-	(u'kzq', u'', u'', u'', u'I', u'L', u'Kaike', u'\r\n'),
-	(u'kzr', u'', u'', u'', u'I', u'L', u'Karang', u'\r\n'),
-	(u'kzs', u'', u'', u'', u'I', u'L', u'Sugut Dusun', u'\r\n'),
-	(u'kzt', u'', u'', u'', u'I', u'L', u'Tambunan Dusun', u'\r\n'),
-	(u'kzu', u'', u'', u'', u'I', u'L', u'Kayupulau', u'\r\n'),
-	(u'kzv', u'', u'', u'', u'I', u'L', u'Komyandaret', u'\r\n'),
-	(u'kzw', u'', u'', u'', u'I', u'E', u'Karir\xed-Xoc\xf3', u'\r\n'),
-	(u'kzx', u'', u'', u'', u'I', u'L', u'Kamarian', u'\r\n'),
-	(u'kzy', u'', u'', u'', u'I', u'L', u'Kango (Tshopo District)', u'\r\n'),
-	(u'kzz', u'', u'', u'', u'I', u'L', u'Kalabra', u'\r\n'),
-	(u'laa', u'', u'', u'', u'I', u'L', u'Southern Subanen', u'\r\n'),
-	(u'lab', u'', u'', u'', u'I', u'A', u'Linear A', u'\r\n'),
-	(u'lac', u'', u'', u'', u'I', u'L', u'Lacandon', u'\r\n'),
-	(u'lad', u'lad', u'lad', u'', u'I', u'L', u'Ladino', u'\r\n'),
-	(u'lae', u'', u'', u'', u'I', u'L', u'Pattani', u'\r\n'),
-	(u'laf', u'', u'', u'', u'I', u'L', u'Lafofa', u'\r\n'),
-	(u'lag', u'', u'', u'', u'I', u'L', u'Langi', u'\r\n'),
-	(u'lah', u'lah', u'lah', u'', u'M', u'L', u'Lahnda', u'\r\n'),
-	(u'lai', u'', u'', u'', u'I', u'L', u'Lambya', u'\r\n'),
-	(u'laj', u'', u'', u'', u'I', u'L', u'Lango (Uganda)', u'\r\n'),
-	(u'lak', u'', u'', u'', u'I', u'L', u'Laka (Nigeria)', u'\r\n'),
-	(u'lal', u'', u'', u'', u'I', u'L', u'Lalia', u'\r\n'),
-	(u'lam', u'lam', u'lam', u'', u'I', u'L', u'Lamba', u'\r\n'),
-	(u'lan', u'', u'', u'', u'I', u'L', u'Laru', u'\r\n'),
-	(u'lao', u'lao', u'lao', u'lo', u'I', u'L', u'Lao', u'\r\n'),
-	(u'lap', u'', u'', u'', u'I', u'L', u'Laka (Chad)', u'\r\n'),
-	(u'laq', u'', u'', u'', u'I', u'L', u'Qabiao', u'\r\n'),
-	(u'lar', u'', u'', u'', u'I', u'L', u'Larteh', u'\r\n'),
-	(u'las', u'', u'', u'', u'I', u'L', u'Lama (Togo)', u'\r\n'),
-	(u'lat', u'lat', u'lat', u'la', u'I', u'A', u'Latin', u'\r\n'),
-	(u'lau', u'', u'', u'', u'I', u'L', u'Laba', u'\r\n'),
-	(u'lav', u'lav', u'lav', u'lv', u'M', u'L', u'Latvian', u'\r\n'),
-	(u'law', u'', u'', u'', u'I', u'L', u'Lauje', u'\r\n'),
-	(u'lax', u'', u'', u'', u'I', u'L', u'Tiwa', u'\r\n'),
-	(u'lay', u'', u'', u'', u'I', u'L', u'Lama (Myanmar)', u'\r\n'),
-	(u'laz', u'', u'', u'', u'I', u'E', u'Aribwatsa', u'\r\n'),
-	(u'lba', u'', u'', u'', u'I', u'L', u'Lui', u'\r\n'),
-	(u'lbb', u'', u'', u'', u'I', u'L', u'Label', u'\r\n'),
-	(u'lbc', u'', u'', u'', u'I', u'L', u'Lakkia', u'\r\n'),
-	(u'lbe', u'', u'', u'', u'I', u'L', u'Lak', u'\r\n'),
-	(u'lbf', u'', u'', u'', u'I', u'L', u'Tinani', u'\r\n'),
-	(u'lbg', u'', u'', u'', u'I', u'L', u'Laopang', u'\r\n'),
-	(u'lbi', u'', u'', u'', u'I', u'L', u"La'bi", u'\r\n'),
-	(u'lbj', u'', u'', u'', u'I', u'L', u'Ladakhi', u'\r\n'),
-	(u'lbk', u'', u'', u'', u'I', u'L', u'Central Bontok', u'\r\n'),
-	(u'lbl', u'', u'', u'', u'I', u'L', u'Libon Bikol', u'\r\n'),
-	(u'lbm', u'', u'', u'', u'I', u'L', u'Lodhi', u'\r\n'),
-	(u'lbn', u'', u'', u'', u'I', u'L', u'Lamet', u'\r\n'),
-	(u'lbo', u'', u'', u'', u'I', u'L', u'Laven', u'\r\n'),
-	(u'lbq', u'', u'', u'', u'I', u'L', u'Wampar', u'\r\n'),
-	(u'lbr', u'', u'', u'', u'I', u'L', u'Northern Lorung', u'\r\n'),
-	(u'lbs', u'', u'', u'', u'I', u'L', u'Libyan Sign Language', u'\r\n'),
-	(u'lbt', u'', u'', u'', u'I', u'L', u'Lachi', u'\r\n'),
-	(u'lbu', u'', u'', u'', u'I', u'L', u'Labu', u'\r\n'),
-	(u'lbv', u'', u'', u'', u'I', u'L', u'Lavatbura-Lamusong', u'\r\n'),
-	(u'lbw', u'', u'', u'', u'I', u'L', u'Tolaki', u'\r\n'),
-	(u'lbx', u'', u'', u'', u'I', u'L', u'Lawangan', u'\r\n'),
-	(u'lby', u'', u'', u'', u'I', u'E', u'Lamu-Lamu', u'\r\n'),
-	(u'lbz', u'', u'', u'', u'I', u'L', u'Lardil', u'\r\n'),
-	(u'lcc', u'', u'', u'', u'I', u'L', u'Legenyem', u'\r\n'),
-	(u'lcd', u'', u'', u'', u'I', u'L', u'Lola', u'\r\n'),
-	(u'lce', u'', u'', u'', u'I', u'L', u'Loncong', u'\r\n'),
-	(u'lcf', u'', u'', u'', u'I', u'L', u'Lubu', u'\r\n'),
-	(u'lch', u'', u'', u'', u'I', u'L', u'Luchazi', u'\r\n'),
-	(u'lcl', u'', u'', u'', u'I', u'L', u'Lisela', u'\r\n'),
-	(u'lcm', u'', u'', u'', u'I', u'L', u'Tungag', u'\r\n'),
-	(u'lcp', u'', u'', u'', u'I', u'L', u'Western Lawa', u'\r\n'),
-	(u'lcq', u'', u'', u'', u'I', u'L', u'Luhu', u'\r\n'),
-	(u'lcs', u'', u'', u'', u'I', u'L', u'Lisabata-Nuniali', u'\r\n'),
-	(u'ldb', u'', u'', u'', u'I', u'L', u'Idun', u'\r\n'),
-	(u'ldd', u'', u'', u'', u'I', u'L', u'Luri', u'\r\n'),
-	(u'ldg', u'', u'', u'', u'I', u'L', u'Lenyima', u'\r\n'),
-	(u'ldh', u'', u'', u'', u'I', u'L', u'Lamja-Dengsa-Tola', u'\r\n'),
-	(u'ldi', u'', u'', u'', u'I', u'L', u'Laari', u'\r\n'),
-	(u'ldj', u'', u'', u'', u'I', u'L', u'Lemoro', u'\r\n'),
-	(u'ldk', u'', u'', u'', u'I', u'L', u'Leelau', u'\r\n'),
-	(u'ldl', u'', u'', u'', u'I', u'L', u'Kaan', u'\r\n'),
-	(u'ldm', u'', u'', u'', u'I', u'L', u'Landoma', u'\r\n'),
-	(u'ldn', u'', u'', u'', u'I', u'C', u'L\xe1adan', u'\r\n'),
-	(u'ldo', u'', u'', u'', u'I', u'L', u'Loo', u'\r\n'),
-	(u'ldp', u'', u'', u'', u'I', u'L', u'Tso', u'\r\n'),
-	(u'ldq', u'', u'', u'', u'I', u'L', u'Lufu', u'\r\n'),
-	(u'lea', u'', u'', u'', u'I', u'L', u'Lega-Shabunda', u'\r\n'),
-	(u'leb', u'', u'', u'', u'I', u'L', u'Lala-Bisa', u'\r\n'),
-	(u'lec', u'', u'', u'', u'I', u'L', u'Leco', u'\r\n'),
-	(u'led', u'', u'', u'', u'I', u'L', u'Lendu', u'\r\n'),
-	(u'lee', u'', u'', u'', u'I', u'L', u'Ly\xe9l\xe9', u'\r\n'),
-	(u'lef', u'', u'', u'', u'I', u'L', u'Lelemi', u'\r\n'),
-	(u'leg', u'', u'', u'', u'I', u'L', u'Lengua', u'\r\n'),
-	(u'leh', u'', u'', u'', u'I', u'L', u'Lenje', u'\r\n'),
-	(u'lei', u'', u'', u'', u'I', u'L', u'Lemio', u'\r\n'),
-	(u'lej', u'', u'', u'', u'I', u'L', u'Lengola', u'\r\n'),
-	(u'lek', u'', u'', u'', u'I', u'L', u'Leipon', u'\r\n'),
-	(u'lel', u'', u'', u'', u'I', u'L', u'Lele (Democratic Republic of Congo)', u'\r\n'),
-	(u'lem', u'', u'', u'', u'I', u'L', u'Nomaande', u'\r\n'),
-	(u'len', u'', u'', u'', u'I', u'E', u'Lenca', u'\r\n'),
-	(u'leo', u'', u'', u'', u'I', u'L', u'Leti (Cameroon)', u'\r\n'),
-	(u'lep', u'', u'', u'', u'I', u'L', u'Lepcha', u'\r\n'),
-	(u'leq', u'', u'', u'', u'I', u'L', u'Lembena', u'\r\n'),
-	(u'ler', u'', u'', u'', u'I', u'L', u'Lenkau', u'\r\n'),
-	(u'les', u'', u'', u'', u'I', u'L', u'Lese', u'\r\n'),
-	(u'let', u'', u'', u'', u'I', u'L', u'Lesing-Gelimi', u'\r\n'),
-	(u'leu', u'', u'', u'', u'I', u'L', u'Kara (Papua New Guinea)', u'\r\n'),
-	(u'lev', u'', u'', u'', u'I', u'L', u'Lamma', u'\r\n'),
-	(u'lew', u'', u'', u'', u'I', u'L', u'Ledo Kaili', u'\r\n'),
-	(u'lex', u'', u'', u'', u'I', u'L', u'Luang', u'\r\n'),
-	(u'ley', u'', u'', u'', u'I', u'L', u'Lemolang', u'\r\n'),
-	(u'lez', u'lez', u'lez', u'', u'I', u'L', u'Lezghian', u'\r\n'),
-	(u'lfa', u'', u'', u'', u'I', u'L', u'Lefa', u'\r\n'),
-	(u'lfn', u'', u'', u'', u'I', u'C', u'Lingua Franca Nova', u'\r\n'),
-	(u'lga', u'', u'', u'', u'I', u'L', u'Lungga', u'\r\n'),
-	(u'lgb', u'', u'', u'', u'I', u'L', u'Laghu', u'\r\n'),
-	(u'lgg', u'', u'', u'', u'I', u'L', u'Lugbara', u'\r\n'),
-	(u'lgh', u'', u'', u'', u'I', u'L', u'Laghuu', u'\r\n'),
-	(u'lgi', u'', u'', u'', u'I', u'L', u'Lengilu', u'\r\n'),
-	(u'lgk', u'', u'', u'', u'I', u'L', u'Lingarak', u'\r\n'),
-	(u'lgl', u'', u'', u'', u'I', u'L', u'Wala', u'\r\n'),
-	(u'lgm', u'', u'', u'', u'I', u'L', u'Lega-Mwenga', u'\r\n'),
-	(u'lgn', u'', u'', u'', u'I', u'L', u'Opuuo', u'\r\n'),
-	(u'lgq', u'', u'', u'', u'I', u'L', u'Logba', u'\r\n'),
-	(u'lgr', u'', u'', u'', u'I', u'L', u'Lengo', u'\r\n'),
-	(u'lgt', u'', u'', u'', u'I', u'L', u'Pahi', u'\r\n'),
-	(u'lgu', u'', u'', u'', u'I', u'L', u'Longgu', u'\r\n'),
-	(u'lgz', u'', u'', u'', u'I', u'L', u'Ligenza', u'\r\n'),
-	(u'lha', u'', u'', u'', u'I', u'L', u'Laha (Viet Nam)', u'\r\n'),
-	(u'lhh', u'', u'', u'', u'I', u'L', u'Laha (Indonesia)', u'\r\n'),
-	(u'lhi', u'', u'', u'', u'I', u'L', u'Lahu Shi', u'\r\n'),
-	(u'lhl', u'', u'', u'', u'I', u'L', u'Lahul Lohar', u'\r\n'),
-	(u'lhm', u'', u'', u'', u'I', u'L', u'Lhomi', u'\r\n'),
-	(u'lhn', u'', u'', u'', u'I', u'L', u'Lahanan', u'\r\n'),
-	(u'lhp', u'', u'', u'', u'I', u'L', u'Lhokpu', u'\r\n'),
-	(u'lhs', u'', u'', u'', u'I', u'E', u'Mlahs\xf6', u'\r\n'),
-	(u'lht', u'', u'', u'', u'I', u'L', u'Lo-Toga', u'\r\n'),
-	(u'lhu', u'', u'', u'', u'I', u'L', u'Lahu', u'\r\n'),
-	(u'lia', u'', u'', u'', u'I', u'L', u'West-Central Limba', u'\r\n'),
-	(u'lib', u'', u'', u'', u'I', u'L', u'Likum', u'\r\n'),
-	(u'lic', u'', u'', u'', u'I', u'L', u'Hlai', u'\r\n'),
-	(u'lid', u'', u'', u'', u'I', u'L', u'Nyindrou', u'\r\n'),
-	(u'lie', u'', u'', u'', u'I', u'L', u'Likila', u'\r\n'),
-	(u'lif', u'', u'', u'', u'I', u'L', u'Limbu', u'\r\n'),
-	(u'lig', u'', u'', u'', u'I', u'L', u'Ligbi', u'\r\n'),
-	(u'lih', u'', u'', u'', u'I', u'L', u'Lihir', u'\r\n'),
-	(u'lii', u'', u'', u'', u'I', u'L', u'Lingkhim', u'\r\n'),
-	(u'lij', u'', u'', u'', u'I', u'L', u'Ligurian', u'\r\n'),
-	(u'lik', u'', u'', u'', u'I', u'L', u'Lika', u'\r\n'),
-	(u'lil', u'', u'', u'', u'I', u'L', u'Lillooet', u'\r\n'),
-	(u'lim', u'lim', u'lim', u'li', u'I', u'L', u'Limburgan', u'\r\n'),
-	(u'lin', u'lin', u'lin', u'ln', u'I', u'L', u'Lingala', u'\r\n'),
-	(u'lio', u'', u'', u'', u'I', u'L', u'Liki', u'\r\n'),
-	(u'lip', u'', u'', u'', u'I', u'L', u'Sekpele', u'\r\n'),
-	(u'liq', u'', u'', u'', u'I', u'L', u'Libido', u'\r\n'),
-	(u'lir', u'', u'', u'', u'I', u'L', u'Liberian English', u'\r\n'),
-	(u'lis', u'', u'', u'', u'I', u'L', u'Lisu', u'\r\n'),
-	(u'lit', u'lit', u'lit', u'lt', u'I', u'L', u'Lithuanian', u'\r\n'),
-	(u'liu', u'', u'', u'', u'I', u'L', u'Logorik', u'\r\n'),
-	(u'liv', u'', u'', u'', u'I', u'L', u'Liv', u'\r\n'),
-	(u'liw', u'', u'', u'', u'I', u'L', u'Col', u'\r\n'),
-	(u'lix', u'', u'', u'', u'I', u'L', u'Liabuku', u'\r\n'),
-	(u'liy', u'', u'', u'', u'I', u'L', u'Banda-Bambari', u'\r\n'),
-	(u'liz', u'', u'', u'', u'I', u'L', u'Libinza', u'\r\n'),
-	(u'lje', u'', u'', u'', u'I', u'L', u'Rampi', u'\r\n'),
-	(u'lji', u'', u'', u'', u'I', u'L', u'Laiyolo', u'\r\n'),
-	(u'ljl', u'', u'', u'', u'I', u'L', u"Li'o", u'\r\n'),
-	(u'ljp', u'', u'', u'', u'I', u'L', u'Lampung Api', u'\r\n'),
-	(u'lka', u'', u'', u'', u'I', u'L', u'Lakalei', u'\r\n'),
-	(u'lkb', u'', u'', u'', u'I', u'L', u'Kabras', u'\r\n'),
-	(u'lkc', u'', u'', u'', u'I', u'L', u'Kucong', u'\r\n'),
-	(u'lkd', u'', u'', u'', u'I', u'L', u'Lakond\xea', u'\r\n'),
-	(u'lke', u'', u'', u'', u'I', u'L', u'Kenyi', u'\r\n'),
-	(u'lkh', u'', u'', u'', u'I', u'L', u'Lakha', u'\r\n'),
-	(u'lki', u'', u'', u'', u'I', u'L', u'Laki', u'\r\n'),
-	(u'lkj', u'', u'', u'', u'I', u'L', u'Remun', u'\r\n'),
-	(u'lkl', u'', u'', u'', u'I', u'L', u'Laeko-Libuat', u'\r\n'),
-	(u'lkn', u'', u'', u'', u'I', u'L', u'Lakon', u'\r\n'),
-	(u'lko', u'', u'', u'', u'I', u'L', u'Khayo', u'\r\n'),
-	(u'lkr', u'', u'', u'', u'I', u'L', u'P\xe4ri', u'\r\n'),
-	(u'lks', u'', u'', u'', u'I', u'L', u'Kisa', u'\r\n'),
-	(u'lkt', u'', u'', u'', u'I', u'L', u'Lakota', u'\r\n'),
-	(u'lky', u'', u'', u'', u'I', u'L', u'Lokoya', u'\r\n'),
-	(u'lla', u'', u'', u'', u'I', u'L', u'Lala-Roba', u'\r\n'),
-	(u'llb', u'', u'', u'', u'I', u'L', u'Lolo', u'\r\n'),
-	(u'llc', u'', u'', u'', u'I', u'L', u'Lele (Guinea)', u'\r\n'),
-	(u'lld', u'', u'', u'', u'I', u'L', u'Ladin', u'\r\n'),
-	(u'lle', u'', u'', u'', u'I', u'L', u'Lele (Papua New Guinea)', u'\r\n'),
-	(u'llf', u'', u'', u'', u'I', u'E', u'Hermit', u'\r\n'),
-	(u'llg', u'', u'', u'', u'I', u'L', u'Lole', u'\r\n'),
-	(u'llh', u'', u'', u'', u'I', u'L', u'Lamu', u'\r\n'),
-	(u'lli', u'', u'', u'', u'I', u'L', u'Teke-Laali', u'\r\n'),
-	(u'llk', u'', u'', u'', u'I', u'E', u'Lelak', u'\r\n'),
-	(u'lll', u'', u'', u'', u'I', u'L', u'Lilau', u'\r\n'),
-	(u'llm', u'', u'', u'', u'I', u'L', u'Lasalimu', u'\r\n'),
-	(u'lln', u'', u'', u'', u'I', u'L', u'Lele (Chad)', u'\r\n'),
-	(u'llo', u'', u'', u'', u'I', u'L', u'Khlor', u'\r\n'),
-	(u'llp', u'', u'', u'', u'I', u'L', u'North Efate', u'\r\n'),
-	(u'llq', u'', u'', u'', u'I', u'L', u'Lolak', u'\r\n'),
-	(u'lls', u'', u'', u'', u'I', u'L', u'Lithuanian Sign Language', u'\r\n'),
-	(u'llu', u'', u'', u'', u'I', u'L', u'Lau', u'\r\n'),
-	(u'llx', u'', u'', u'', u'I', u'L', u'Lauan', u'\r\n'),
-	(u'lma', u'', u'', u'', u'I', u'L', u'East Limba', u'\r\n'),
-	(u'lmb', u'', u'', u'', u'I', u'L', u'Merei', u'\r\n'),
-	(u'lmc', u'', u'', u'', u'I', u'E', u'Limilngan', u'\r\n'),
-	(u'lmd', u'', u'', u'', u'I', u'L', u'Lumun', u'\r\n'),
-	(u'lme', u'', u'', u'', u'I', u'L', u'P\xe9v\xe9', u'\r\n'),
-	(u'lmf', u'', u'', u'', u'I', u'L', u'South Lembata', u'\r\n'),
-	(u'lmg', u'', u'', u'', u'I', u'L', u'Lamogai', u'\r\n'),
-	(u'lmh', u'', u'', u'', u'I', u'L', u'Lambichhong', u'\r\n'),
-	(u'lmi', u'', u'', u'', u'I', u'L', u'Lombi', u'\r\n'),
-	(u'lmj', u'', u'', u'', u'I', u'L', u'West Lembata', u'\r\n'),
-	(u'lmk', u'', u'', u'', u'I', u'L', u'Lamkang', u'\r\n'),
-	(u'lml', u'', u'', u'', u'I', u'L', u'Hano', u'\r\n'),
-	(u'lmm', u'', u'', u'', u'I', u'L', u'Lamam', u'\r\n'),
-	(u'lmn', u'', u'', u'', u'I', u'L', u'Lambadi', u'\r\n'),
-	(u'lmo', u'', u'', u'', u'I', u'L', u'Lombard', u'\r\n'),
-	(u'lmp', u'', u'', u'', u'I', u'L', u'Limbum', u'\r\n'),
-	(u'lmq', u'', u'', u'', u'I', u'L', u'Lamatuka', u'\r\n'),
-	(u'lmr', u'', u'', u'', u'I', u'L', u'Lamalera', u'\r\n'),
-	(u'lmu', u'', u'', u'', u'I', u'L', u'Lamenu', u'\r\n'),
-	(u'lmv', u'', u'', u'', u'I', u'L', u'Lomaiviti', u'\r\n'),
-	(u'lmw', u'', u'', u'', u'I', u'L', u'Lake Miwok', u'\r\n'),
-	(u'lmx', u'', u'', u'', u'I', u'L', u'Laimbue', u'\r\n'),
-	(u'lmy', u'', u'', u'', u'I', u'L', u'Lamboya', u'\r\n'),
-	(u'lmz', u'', u'', u'', u'I', u'E', u'Lumbee', u'\r\n'),
-	(u'lna', u'', u'', u'', u'I', u'L', u'Langbashe', u'\r\n'),
-	(u'lnb', u'', u'', u'', u'I', u'L', u'Mbalanhu', u'\r\n'),
-	(u'lnd', u'', u'', u'', u'I', u'L', u'Lundayeh', u'\r\n'),
-	(u'lng', u'', u'', u'', u'I', u'A', u'Langobardic', u'\r\n'),
-	(u'lnh', u'', u'', u'', u'I', u'L', u'Lanoh', u'\r\n'),
-	(u'lni', u'', u'', u'', u'I', u'L', u"Daantanai'", u'\r\n'),
-	(u'lnj', u'', u'', u'', u'I', u'E', u'Leningitij', u'\r\n'),
-	(u'lnl', u'', u'', u'', u'I', u'L', u'South Central Banda', u'\r\n'),
-	(u'lnm', u'', u'', u'', u'I', u'L', u'Langam', u'\r\n'),
-	(u'lnn', u'', u'', u'', u'I', u'L', u'Lorediakarkar', u'\r\n'),
-	(u'lno', u'', u'', u'', u'I', u'L', u'Lango (Sudan)', u'\r\n'),
-	(u'lns', u'', u'', u'', u'I', u'L', u"Lamnso'", u'\r\n'),
-	(u'lnu', u'', u'', u'', u'I', u'L', u'Longuda', u'\r\n'),
-	(u'lnz', u'', u'', u'', u'I', u'L', u'Lonzo', u'\r\n'),
-	(u'loa', u'', u'', u'', u'I', u'L', u'Loloda', u'\r\n'),
-	(u'lob', u'', u'', u'', u'I', u'L', u'Lobi', u'\r\n'),
-	(u'loc', u'', u'', u'', u'I', u'L', u'Inonhan', u'\r\n'),
-	(u'loe', u'', u'', u'', u'I', u'L', u'Saluan', u'\r\n'),
-	(u'lof', u'', u'', u'', u'I', u'L', u'Logol', u'\r\n'),
-	(u'log', u'', u'', u'', u'I', u'L', u'Logo', u'\r\n'),
-	(u'loh', u'', u'', u'', u'I', u'L', u'Narim', u'\r\n'),
-	(u'loi', u'', u'', u'', u'I', u'L', u"Loma (C\xf4te d'Ivoire)", u'\r\n'),
-	(u'loj', u'', u'', u'', u'I', u'L', u'Lou', u'\r\n'),
-	(u'lok', u'', u'', u'', u'I', u'L', u'Loko', u'\r\n'),
-	(u'lol', u'lol', u'lol', u'', u'I', u'L', u'Mongo', u'\r\n'),
-	(u'lom', u'', u'', u'', u'I', u'L', u'Loma (Liberia)', u'\r\n'),
-	(u'lon', u'', u'', u'', u'I', u'L', u'Malawi Lomwe', u'\r\n'),
-	(u'loo', u'', u'', u'', u'I', u'L', u'Lombo', u'\r\n'),
-	(u'lop', u'', u'', u'', u'I', u'L', u'Lopa', u'\r\n'),
-	(u'loq', u'', u'', u'', u'I', u'L', u'Lobala', u'\r\n'),
-	(u'lor', u'', u'', u'', u'I', u'L', u'T\xe9\xe9n', u'\r\n'),
-	(u'los', u'', u'', u'', u'I', u'L', u'Loniu', u'\r\n'),
-	(u'lot', u'', u'', u'', u'I', u'L', u'Otuho', u'\r\n'),
-	(u'lou', u'', u'', u'', u'I', u'L', u'Louisiana Creole French', u'\r\n'),
-	(u'lov', u'', u'', u'', u'I', u'L', u'Lopi', u'\r\n'),
-	(u'low', u'', u'', u'', u'I', u'L', u'Tampias Lobu', u'\r\n'),
-	(u'lox', u'', u'', u'', u'I', u'L', u'Loun', u'\r\n'),
-	(u'loy', u'', u'', u'', u'I', u'L', u'Lowa', u'\r\n'),
-	(u'loz', u'loz', u'loz', u'', u'I', u'L', u'Lozi', u'\r\n'),
-	(u'lpa', u'', u'', u'', u'I', u'L', u'Lelepa', u'\r\n'),
-	(u'lpe', u'', u'', u'', u'I', u'L', u'Lepki', u'\r\n'),
-	(u'lpn', u'', u'', u'', u'I', u'L', u'Long Phuri Naga', u'\r\n'),
-	(u'lpo', u'', u'', u'', u'I', u'L', u'Lipo', u'\r\n'),
-	(u'lpx', u'', u'', u'', u'I', u'L', u'Lopit', u'\r\n'),
-	(u'lra', u'', u'', u'', u'I', u'L', u"Rara Bakati'", u'\r\n'),
-	(u'lrc', u'', u'', u'', u'I', u'L', u'Northern Luri', u'\r\n'),
-	(u'lre', u'', u'', u'', u'I', u'E', u'Laurentian', u'\r\n'),
-	(u'lrg', u'', u'', u'', u'I', u'E', u'Laragia', u'\r\n'),
-	(u'lri', u'', u'', u'', u'I', u'L', u'Marachi', u'\r\n'),
-	(u'lrk', u'', u'', u'', u'I', u'L', u'Loarki', u'\r\n'),
-	(u'lrl', u'', u'', u'', u'I', u'L', u'Lari', u'\r\n'),
-	(u'lrm', u'', u'', u'', u'I', u'L', u'Marama', u'\r\n'),
-	(u'lrn', u'', u'', u'', u'I', u'L', u'Lorang', u'\r\n'),
-	(u'lro', u'', u'', u'', u'I', u'L', u'Laro', u'\r\n'),
-	(u'lrr', u'', u'', u'', u'I', u'L', u'Southern Lorung', u'\r\n'),
-	(u'lrt', u'', u'', u'', u'I', u'L', u'Larantuka Malay', u'\r\n'),
-	(u'lrv', u'', u'', u'', u'I', u'L', u'Larevat', u'\r\n'),
-	(u'lrz', u'', u'', u'', u'I', u'L', u'Lemerig', u'\r\n'),
-	(u'lsa', u'', u'', u'', u'I', u'L', u'Lasgerdi', u'\r\n'),
-	(u'lsd', u'', u'', u'', u'I', u'L', u'Lishana Deni', u'\r\n'),
-	(u'lse', u'', u'', u'', u'I', u'L', u'Lusengo', u'\r\n'),
-	(u'lsg', u'', u'', u'', u'I', u'L', u'Lyons Sign Language', u'\r\n'),
-	(u'lsh', u'', u'', u'', u'I', u'L', u'Lish', u'\r\n'),
-	(u'lsi', u'', u'', u'', u'I', u'L', u'Lashi', u'\r\n'),
-	(u'lsl', u'', u'', u'', u'I', u'L', u'Latvian Sign Language', u'\r\n'),
-	(u'lsm', u'', u'', u'', u'I', u'L', u'Saamia', u'\r\n'),
-	(u'lso', u'', u'', u'', u'I', u'L', u'Laos Sign Language', u'\r\n'),
-	(u'lsp', u'', u'', u'', u'I', u'L', u'Panamanian Sign Language', u'\r\n'),
-	(u'lsr', u'', u'', u'', u'I', u'L', u'Aruop', u'\r\n'),
-	(u'lss', u'', u'', u'', u'I', u'L', u'Lasi', u'\r\n'),
-	(u'lst', u'', u'', u'', u'I', u'L', u'Trinidad and Tobago Sign Language', u'\r\n'),
-	(u'lsy', u'', u'', u'', u'I', u'L', u'Mauritian Sign Language', u'\r\n'),
-	(u'ltc', u'', u'', u'', u'I', u'H', u'Late Middle Chinese', u'\r\n'),
-	(u'ltg', u'', u'', u'', u'I', u'L', u'Latgalian', u'\r\n'),
-	(u'lti', u'', u'', u'', u'I', u'L', u'Leti (Indonesia)', u'\r\n'),
-	(u'ltn', u'', u'', u'', u'I', u'L', u'Latund\xea', u'\r\n'),
-	(u'lto', u'', u'', u'', u'I', u'L', u'Tsotso', u'\r\n'),
-	(u'lts', u'', u'', u'', u'I', u'L', u'Tachoni', u'\r\n'),
-	(u'ltu', u'', u'', u'', u'I', u'L', u'Latu', u'\r\n'),
-	(u'ltz', u'ltz', u'ltz', u'lb', u'I', u'L', u'Luxembourgish', u'\r\n'),
-	(u'lua', u'lua', u'lua', u'', u'I', u'L', u'Luba-Lulua', u'\r\n'),
-	(u'lub', u'lub', u'lub', u'lu', u'I', u'L', u'Luba-Katanga', u'\r\n'),
-	(u'luc', u'', u'', u'', u'I', u'L', u'Aringa', u'\r\n'),
-	(u'lud', u'', u'', u'', u'I', u'L', u'Ludian', u'\r\n'),
-	(u'lue', u'', u'', u'', u'I', u'L', u'Luvale', u'\r\n'),
-	(u'luf', u'', u'', u'', u'I', u'L', u'Laua', u'\r\n'),
-	(u'lug', u'lug', u'lug', u'lg', u'I', u'L', u'Ganda', u'\r\n'),
-	(u'lui', u'lui', u'lui', u'', u'I', u'L', u'Luiseno', u'\r\n'),
-	(u'luj', u'', u'', u'', u'I', u'L', u'Luna', u'\r\n'),
-	(u'luk', u'', u'', u'', u'I', u'L', u'Lunanakha', u'\r\n'),
-	(u'lul', u'', u'', u'', u'I', u'L', u"Olu'bo", u'\r\n'),
-	(u'lum', u'', u'', u'', u'I', u'L', u'Luimbi', u'\r\n'),
-	(u'lun', u'lun', u'lun', u'', u'I', u'L', u'Lunda', u'\r\n'),
-	(u'luo', u'luo', u'luo', u'', u'I', u'L', u'Luo (Kenya and Tanzania)', u'\r\n'),
-	(u'lup', u'', u'', u'', u'I', u'L', u'Lumbu', u'\r\n'),
-	(u'luq', u'', u'', u'', u'I', u'L', u'Lucumi', u'\r\n'),
-	(u'lur', u'', u'', u'', u'I', u'L', u'Laura', u'\r\n'),
-	(u'lus', u'lus', u'lus', u'', u'I', u'L', u'Lushai', u'\r\n'),
-	(u'lut', u'', u'', u'', u'I', u'L', u'Lushootseed', u'\r\n'),
-	(u'luu', u'', u'', u'', u'I', u'L', u'Lumba-Yakkha', u'\r\n'),
-	(u'luv', u'', u'', u'', u'I', u'L', u'Luwati', u'\r\n'),
-	(u'luw', u'', u'', u'', u'I', u'L', u'Luo (Cameroon)', u'\r\n'),
-	(u'luy', u'', u'', u'', u'M', u'L', u'Luyia', u'\r\n'),
-	(u'luz', u'', u'', u'', u'I', u'L', u'Southern Luri', u'\r\n'),
-	(u'lva', u'', u'', u'', u'I', u'L', u"Maku'a", u'\r\n'),
-	(u'lvk', u'', u'', u'', u'I', u'L', u'Lavukaleve', u'\r\n'),
-	(u'lvs', u'', u'', u'', u'I', u'L', u'Standard Latvian', u'\r\n'),
-	(u'lvu', u'', u'', u'', u'I', u'L', u'Levuka', u'\r\n'),
-	(u'lwa', u'', u'', u'', u'I', u'L', u'Lwalu', u'\r\n'),
-	(u'lwe', u'', u'', u'', u'I', u'L', u'Lewo Eleng', u'\r\n'),
-	(u'lwg', u'', u'', u'', u'I', u'L', u'Wanga', u'\r\n'),
-	(u'lwh', u'', u'', u'', u'I', u'L', u'White Lachi', u'\r\n'),
-	(u'lwl', u'', u'', u'', u'I', u'L', u'Eastern Lawa', u'\r\n'),
-	(u'lwm', u'', u'', u'', u'I', u'L', u'Laomian', u'\r\n'),
-	(u'lwo', u'', u'', u'', u'I', u'L', u'Luwo', u'\r\n'),
-	(u'lwt', u'', u'', u'', u'I', u'L', u'Lewotobi', u'\r\n'),
-	(u'lww', u'', u'', u'', u'I', u'L', u'Lewo', u'\r\n'),
-	(u'lya', u'', u'', u'', u'I', u'L', u'Layakha', u'\r\n'),
-	(u'lyg', u'', u'', u'', u'I', u'L', u'Lyngngam', u'\r\n'),
-	(u'lyn', u'', u'', u'', u'I', u'L', u'Luyana', u'\r\n'),
-	(u'lzh', u'', u'', u'', u'I', u'H', u'Literary Chinese', u'\r\n'),
-	(u'lzl', u'', u'', u'', u'I', u'L', u'Litzlitz', u'\r\n'),
-	(u'lzn', u'', u'', u'', u'I', u'L', u'Leinong Naga', u'\r\n'),
-	(u'lzz', u'', u'', u'', u'I', u'L', u'Laz', u'\r\n'),
-	(u'maa', u'', u'', u'', u'I', u'L', u'San Jer\xf3nimo Tec\xf3atl Mazatec', u'\r\n'),
-	(u'mab', u'', u'', u'', u'I', u'L', u'Yutanduchi Mixtec', u'\r\n'),
-	(u'mad', u'mad', u'mad', u'', u'I', u'L', u'Madurese', u'\r\n'),
-	(u'mae', u'', u'', u'', u'I', u'L', u'Bo-Rukul', u'\r\n'),
-	(u'maf', u'', u'', u'', u'I', u'L', u'Mafa', u'\r\n'),
-	(u'mag', u'mag', u'mag', u'', u'I', u'L', u'Magahi', u'\r\n'),
-	(u'mah', u'mah', u'mah', u'mh', u'I', u'L', u'Marshallese', u'\r\n'),
-	(u'mai', u'mai', u'mai', u'', u'I', u'L', u'Maithili', u'\r\n'),
-	(u'maj', u'', u'', u'', u'I', u'L', u'Jalapa De D\xedaz Mazatec', u'\r\n'),
-	(u'mak', u'mak', u'mak', u'', u'I', u'L', u'Makasar', u'\r\n'),
-	(u'mal', u'mal', u'mal', u'ml', u'I', u'L', u'Malayalam', u'\r\n'),
-	(u'mam', u'', u'', u'', u'I', u'L', u'Mam', u'\r\n'),
-	(u'man', u'man', u'man', u'', u'M', u'L', u'Mandingo', u'\r\n'),
-	(u'maq', u'', u'', u'', u'I', u'L', u'Chiquihuitl\xe1n Mazatec', u'\r\n'),
-	(u'mar', u'mar', u'mar', u'mr', u'I', u'L', u'Marathi', u'\r\n'),
-	(u'mas', u'mas', u'mas', u'', u'I', u'L', u'Masai', u'\r\n'),
-	(u'mat', u'', u'', u'', u'I', u'L', u'San Francisco Matlatzinca', u'\r\n'),
-	(u'mau', u'', u'', u'', u'I', u'L', u'Huautla Mazatec', u'\r\n'),
-	(u'mav', u'', u'', u'', u'I', u'L', u'Sater\xe9-Maw\xe9', u'\r\n'),
-	(u'maw', u'', u'', u'', u'I', u'L', u'Mampruli', u'\r\n'),
-	(u'max', u'', u'', u'', u'I', u'L', u'North Moluccan Malay', u'\r\n'),
-	(u'maz', u'', u'', u'', u'I', u'L', u'Central Mazahua', u'\r\n'),
-	(u'mba', u'', u'', u'', u'I', u'L', u'Higaonon', u'\r\n'),
-	(u'mbb', u'', u'', u'', u'I', u'L', u'Western Bukidnon Manobo', u'\r\n'),
-	(u'mbc', u'', u'', u'', u'I', u'L', u'Macushi', u'\r\n'),
-	(u'mbd', u'', u'', u'', u'I', u'L', u'Dibabawon Manobo', u'\r\n'),
-	(u'mbe', u'', u'', u'', u'I', u'E', u'Molale', u'\r\n'),
-	(u'mbf', u'', u'', u'', u'I', u'L', u'Baba Malay', u'\r\n'),
-	(u'mbh', u'', u'', u'', u'I', u'L', u'Mangseng', u'\r\n'),
-	(u'mbi', u'', u'', u'', u'I', u'L', u'Ilianen Manobo', u'\r\n'),
-	(u'mbj', u'', u'', u'', u'I', u'L', u'Nad\xebb', u'\r\n'),
-	(u'mbk', u'', u'', u'', u'I', u'L', u'Malol', u'\r\n'),
-	(u'mbl', u'', u'', u'', u'I', u'L', u'Maxakal\xed', u'\r\n'),
-	(u'mbm', u'', u'', u'', u'I', u'L', u'Ombamba', u'\r\n'),
-	(u'mbn', u'', u'', u'', u'I', u'L', u'Macagu\xe1n', u'\r\n'),
-	(u'mbo', u'', u'', u'', u'I', u'L', u'Mbo (Cameroon)', u'\r\n'),
-	(u'mbp', u'', u'', u'', u'I', u'L', u'Malayo', u'\r\n'),
-	(u'mbq', u'', u'', u'', u'I', u'L', u'Maisin', u'\r\n'),
-	(u'mbr', u'', u'', u'', u'I', u'L', u'Nukak Mak\xfa', u'\r\n'),
-	(u'mbs', u'', u'', u'', u'I', u'L', u'Sarangani Manobo', u'\r\n'),
-	(u'mbt', u'', u'', u'', u'I', u'L', u'Matigsalug Manobo', u'\r\n'),
-	(u'mbu', u'', u'', u'', u'I', u'L', u'Mbula-Bwazza', u'\r\n'),
-	(u'mbv', u'', u'', u'', u'I', u'L', u'Mbulungish', u'\r\n'),
-	(u'mbw', u'', u'', u'', u'I', u'L', u'Maring', u'\r\n'),
-	(u'mbx', u'', u'', u'', u'I', u'L', u'Mari (East Sepik Province)', u'\r\n'),
-	(u'mby', u'', u'', u'', u'I', u'L', u'Memoni', u'\r\n'),
-	(u'mbz', u'', u'', u'', u'I', u'L', u'Amoltepec Mixtec', u'\r\n'),
-	(u'mca', u'', u'', u'', u'I', u'L', u'Maca', u'\r\n'),
-	(u'mcb', u'', u'', u'', u'I', u'L', u'Machiguenga', u'\r\n'),
-	(u'mcc', u'', u'', u'', u'I', u'L', u'Bitur', u'\r\n'),
-	(u'mcd', u'', u'', u'', u'I', u'L', u'Sharanahua', u'\r\n'),
-	(u'mce', u'', u'', u'', u'I', u'L', u'Itundujia Mixtec', u'\r\n'),
-	(u'mcf', u'', u'', u'', u'I', u'L', u'Mats\xe9s', u'\r\n'),
-	(u'mcg', u'', u'', u'', u'I', u'L', u'Mapoyo', u'\r\n'),
-	(u'mch', u'', u'', u'', u'I', u'L', u'Maquiritari', u'\r\n'),
-	(u'mci', u'', u'', u'', u'I', u'L', u'Mese', u'\r\n'),
-	(u'mcj', u'', u'', u'', u'I', u'L', u'Mvanip', u'\r\n'),
-	(u'mck', u'', u'', u'', u'I', u'L', u'Mbunda', u'\r\n'),
-	(u'mcl', u'', u'', u'', u'I', u'E', u'Macaguaje', u'\r\n'),
-	(u'mcm', u'', u'', u'', u'I', u'L', u'Malaccan Creole Portuguese', u'\r\n'),
-	(u'mcn', u'', u'', u'', u'I', u'L', u'Masana', u'\r\n'),
-	(u'mco', u'', u'', u'', u'I', u'L', u'Coatl\xe1n Mixe', u'\r\n'),
-	(u'mcp', u'', u'', u'', u'I', u'L', u'Makaa', u'\r\n'),
-	(u'mcq', u'', u'', u'', u'I', u'L', u'Ese', u'\r\n'),
-	(u'mcr', u'', u'', u'', u'I', u'L', u'Menya', u'\r\n'),
-	(u'mcs', u'', u'', u'', u'I', u'L', u'Mambai', u'\r\n'),
-	(u'mct', u'', u'', u'', u'I', u'L', u'Mengisa', u'\r\n'),
-	(u'mcu', u'', u'', u'', u'I', u'L', u'Cameroon Mambila', u'\r\n'),
-	(u'mcv', u'', u'', u'', u'I', u'L', u'Minanibai', u'\r\n'),
-	(u'mcw', u'', u'', u'', u'I', u'L', u'Mawa (Chad)', u'\r\n'),
-	(u'mcx', u'', u'', u'', u'I', u'L', u'Mpiemo', u'\r\n'),
-	(u'mcy', u'', u'', u'', u'I', u'L', u'South Watut', u'\r\n'),
-	(u'mcz', u'', u'', u'', u'I', u'L', u'Mawan', u'\r\n'),
-	(u'mda', u'', u'', u'', u'I', u'L', u'Mada (Nigeria)', u'\r\n'),
-	(u'mdb', u'', u'', u'', u'I', u'L', u'Morigi', u'\r\n'),
-	(u'mdc', u'', u'', u'', u'I', u'L', u'Male (Papua New Guinea)', u'\r\n'),
-	(u'mdd', u'', u'', u'', u'I', u'L', u'Mbum', u'\r\n'),
-	(u'mde', u'', u'', u'', u'I', u'L', u'Maba (Chad)', u'\r\n'),
-	(u'mdf', u'mdf', u'mdf', u'', u'I', u'L', u'Moksha', u'\r\n'),
-	(u'mdg', u'', u'', u'', u'I', u'L', u'Massalat', u'\r\n'),
-	(u'mdh', u'', u'', u'', u'I', u'L', u'Maguindanaon', u'\r\n'),
-	(u'mdi', u'', u'', u'', u'I', u'L', u'Mamvu', u'\r\n'),
-	(u'mdj', u'', u'', u'', u'I', u'L', u'Mangbetu', u'\r\n'),
-	(u'mdk', u'', u'', u'', u'I', u'L', u'Mangbutu', u'\r\n'),
-	(u'mdl', u'', u'', u'', u'I', u'L', u'Maltese Sign Language', u'\r\n'),
-	(u'mdm', u'', u'', u'', u'I', u'L', u'Mayogo', u'\r\n'),
-	(u'mdn', u'', u'', u'', u'I', u'L', u'Mbati', u'\r\n'),
-	(u'mdp', u'', u'', u'', u'I', u'L', u'Mbala', u'\r\n'),
-	(u'mdq', u'', u'', u'', u'I', u'L', u'Mbole', u'\r\n'),
-	(u'mdr', u'mdr', u'mdr', u'', u'I', u'L', u'Mandar', u'\r\n'),
-	(u'mds', u'', u'', u'', u'I', u'L', u'Maria (Papua New Guinea)', u'\r\n'),
-	(u'mdt', u'', u'', u'', u'I', u'L', u'Mbere', u'\r\n'),
-	(u'mdu', u'', u'', u'', u'I', u'L', u'Mboko', u'\r\n'),
-	(u'mdv', u'', u'', u'', u'I', u'L', u'Santa Luc\xeda Monteverde Mixtec', u'\r\n'),
-	(u'mdw', u'', u'', u'', u'I', u'L', u'Mbosi', u'\r\n'),
-	(u'mdx', u'', u'', u'', u'I', u'L', u'Dizin', u'\r\n'),
-	(u'mdy', u'', u'', u'', u'I', u'L', u'Male (Ethiopia)', u'\r\n'),
-	(u'mdz', u'', u'', u'', u'I', u'L', u'Suru\xed Do Par\xe1', u'\r\n'),
-	(u'mea', u'', u'', u'', u'I', u'L', u'Menka', u'\r\n'),
-	(u'meb', u'', u'', u'', u'I', u'L', u'Ikobi-Mena', u'\r\n'),
-	(u'mec', u'', u'', u'', u'I', u'L', u'Mara', u'\r\n'),
-	(u'med', u'', u'', u'', u'I', u'L', u'Melpa', u'\r\n'),
-	(u'mee', u'', u'', u'', u'I', u'L', u'Mengen', u'\r\n'),
-	(u'mef', u'', u'', u'', u'I', u'L', u'Megam', u'\r\n'),
-	(u'meg', u'', u'', u'', u'I', u'L', u'Mea', u'\r\n'),
-	(u'meh', u'', u'', u'', u'I', u'L', u'Southwestern Tlaxiaco Mixtec', u'\r\n'),
-	(u'mei', u'', u'', u'', u'I', u'L', u'Midob', u'\r\n'),
-	(u'mej', u'', u'', u'', u'I', u'L', u'Meyah', u'\r\n'),
-	(u'mek', u'', u'', u'', u'I', u'L', u'Mekeo', u'\r\n'),
-	(u'mel', u'', u'', u'', u'I', u'L', u'Central Melanau', u'\r\n'),
-	(u'mem', u'', u'', u'', u'I', u'E', u'Mangala', u'\r\n'),
-	(u'men', u'men', u'men', u'', u'I', u'L', u'Mende (Sierra Leone)', u'\r\n'),
-	(u'meo', u'', u'', u'', u'I', u'L', u'Kedah Malay', u'\r\n'),
-	(u'mep', u'', u'', u'', u'I', u'L', u'Miriwung', u'\r\n'),
-	(u'meq', u'', u'', u'', u'I', u'L', u'Merey', u'\r\n'),
-	(u'mer', u'', u'', u'', u'I', u'L', u'Meru', u'\r\n'),
-	(u'mes', u'', u'', u'', u'I', u'L', u'Masmaje', u'\r\n'),
-	(u'met', u'', u'', u'', u'I', u'L', u'Mato', u'\r\n'),
-	(u'meu', u'', u'', u'', u'I', u'L', u'Motu', u'\r\n'),
-	(u'mev', u'', u'', u'', u'I', u'L', u'Mann', u'\r\n'),
-	(u'mew', u'', u'', u'', u'I', u'L', u'Maaka', u'\r\n'),
-	(u'mey', u'', u'', u'', u'I', u'L', u'Hassaniyya', u'\r\n'),
-	(u'mez', u'', u'', u'', u'I', u'L', u'Menominee', u'\r\n'),
-	(u'mfa', u'', u'', u'', u'I', u'L', u'Pattani Malay', u'\r\n'),
-	(u'mfb', u'', u'', u'', u'I', u'L', u'Bangka', u'\r\n'),
-	(u'mfc', u'', u'', u'', u'I', u'L', u'Mba', u'\r\n'),
-	(u'mfd', u'', u'', u'', u'I', u'L', u'Mendankwe-Nkwen', u'\r\n'),
-	(u'mfe', u'', u'', u'', u'I', u'L', u'Morisyen', u'\r\n'),
-	(u'mff', u'', u'', u'', u'I', u'L', u'Naki', u'\r\n'),
-	(u'mfg', u'', u'', u'', u'I', u'L', u'Mixifore', u'\r\n'),
-	(u'mfh', u'', u'', u'', u'I', u'L', u'Matal', u'\r\n'),
-	(u'mfi', u'', u'', u'', u'I', u'L', u'Wandala', u'\r\n'),
-	(u'mfj', u'', u'', u'', u'I', u'L', u'Mefele', u'\r\n'),
-	(u'mfk', u'', u'', u'', u'I', u'L', u'North Mofu', u'\r\n'),
-	(u'mfl', u'', u'', u'', u'I', u'L', u'Putai', u'\r\n'),
-	(u'mfm', u'', u'', u'', u'I', u'L', u'Marghi South', u'\r\n'),
-	(u'mfn', u'', u'', u'', u'I', u'L', u'Cross River Mbembe', u'\r\n'),
-	(u'mfo', u'', u'', u'', u'I', u'L', u'Mbe', u'\r\n'),
-	(u'mfp', u'', u'', u'', u'I', u'L', u'Makassar Malay', u'\r\n'),
-	(u'mfq', u'', u'', u'', u'I', u'L', u'Moba', u'\r\n'),
-	(u'mfr', u'', u'', u'', u'I', u'L', u'Marithiel', u'\r\n'),
-	(u'mfs', u'', u'', u'', u'I', u'L', u'Mexican Sign Language', u'\r\n'),
-	(u'mft', u'', u'', u'', u'I', u'L', u'Mokerang', u'\r\n'),
-	(u'mfu', u'', u'', u'', u'I', u'L', u'Mbwela', u'\r\n'),
-	(u'mfv', u'', u'', u'', u'I', u'L', u'Mandjak', u'\r\n'),
-	(u'mfw', u'', u'', u'', u'I', u'E', u'Mulaha', u'\r\n'),
-	(u'mfx', u'', u'', u'', u'I', u'L', u'Melo', u'\r\n'),
-	(u'mfy', u'', u'', u'', u'I', u'L', u'Mayo', u'\r\n'),
-	(u'mfz', u'', u'', u'', u'I', u'L', u'Mabaan', u'\r\n'),
-	(u'mga', u'mga', u'mga', u'', u'I', u'H', u'Middle Irish (900-1200)', u'\r\n'),
-	(u'mgb', u'', u'', u'', u'I', u'L', u'Mararit', u'\r\n'),
-	(u'mgc', u'', u'', u'', u'I', u'L', u'Morokodo', u'\r\n'),
-	(u'mgd', u'', u'', u'', u'I', u'L', u'Moru', u'\r\n'),
-	(u'mge', u'', u'', u'', u'I', u'L', u'Mango', u'\r\n'),
-	(u'mgf', u'', u'', u'', u'I', u'L', u'Maklew', u'\r\n'),
-	(u'mgg', u'', u'', u'', u'I', u'L', u'Mpongmpong', u'\r\n'),
-	(u'mgh', u'', u'', u'', u'I', u'L', u'Makhuwa-Meetto', u'\r\n'),
-	(u'mgi', u'', u'', u'', u'I', u'L', u'Lijili', u'\r\n'),
-	(u'mgj', u'', u'', u'', u'I', u'L', u'Abureni', u'\r\n'),
-	(u'mgk', u'', u'', u'', u'I', u'L', u'Mawes', u'\r\n'),
-	(u'mgl', u'', u'', u'', u'I', u'L', u'Maleu-Kilenge', u'\r\n'),
-	(u'mgm', u'', u'', u'', u'I', u'L', u'Mambae', u'\r\n'),
-	(u'mgn', u'', u'', u'', u'I', u'L', u'Mbangi', u'\r\n'),
-	(u'mgo', u'', u'', u'', u'I', u'L', u"Meta'", u'\r\n'),
-	(u'mgp', u'', u'', u'', u'I', u'L', u'Eastern Magar', u'\r\n'),
-	(u'mgq', u'', u'', u'', u'I', u'L', u'Malila', u'\r\n'),
-	(u'mgr', u'', u'', u'', u'I', u'L', u'Mambwe-Lungu', u'\r\n'),
-	(u'mgs', u'', u'', u'', u'I', u'L', u'Manda (Tanzania)', u'\r\n'),
-	(u'mgt', u'', u'', u'', u'I', u'L', u'Mongol', u'\r\n'),
-	(u'mgu', u'', u'', u'', u'I', u'L', u'Mailu', u'\r\n'),
-	(u'mgv', u'', u'', u'', u'I', u'L', u'Matengo', u'\r\n'),
-	(u'mgw', u'', u'', u'', u'I', u'L', u'Matumbi', u'\r\n'),
-	(u'mgx', u'', u'', u'', u'I', u'L', u'Omati', u'\r\n'),
-	(u'mgy', u'', u'', u'', u'I', u'L', u'Mbunga', u'\r\n'),
-	(u'mgz', u'', u'', u'', u'I', u'L', u'Mbugwe', u'\r\n'),
-	(u'mha', u'', u'', u'', u'I', u'L', u'Manda (India)', u'\r\n'),
-	(u'mhb', u'', u'', u'', u'I', u'L', u'Mahongwe', u'\r\n'),
-	(u'mhc', u'', u'', u'', u'I', u'L', u'Mocho', u'\r\n'),
-	(u'mhd', u'', u'', u'', u'I', u'L', u'Mbugu', u'\r\n'),
-	(u'mhe', u'', u'', u'', u'I', u'L', u'Besisi', u'\r\n'),
-	(u'mhf', u'', u'', u'', u'I', u'L', u'Mamaa', u'\r\n'),
-	(u'mhg', u'', u'', u'', u'I', u'L', u'Margu', u'\r\n'),
-	(u'mhh', u'', u'', u'', u'I', u'L', u'Maskoy Pidgin', u'\r\n'),
-	(u'mhi', u'', u'', u'', u'I', u'L', u"Ma'di", u'\r\n'),
-	(u'mhj', u'', u'', u'', u'I', u'L', u'Mogholi', u'\r\n'),
-	(u'mhk', u'', u'', u'', u'I', u'L', u'Mungaka', u'\r\n'),
-	(u'mhl', u'', u'', u'', u'I', u'L', u'Mauwake', u'\r\n'),
-	(u'mhm', u'', u'', u'', u'I', u'L', u'Makhuwa-Moniga', u'\r\n'),
-	(u'mhn', u'', u'', u'', u'I', u'L', u'M\xf3cheno', u'\r\n'),
-	(u'mho', u'', u'', u'', u'I', u'L', u'Mashi (Zambia)', u'\r\n'),
-	(u'mhp', u'', u'', u'', u'I', u'L', u'Balinese Malay', u'\r\n'),
-	(u'mhq', u'', u'', u'', u'I', u'L', u'Mandan', u'\r\n'),
-	(u'mhr', u'', u'', u'', u'I', u'L', u'Eastern Mari', u'\r\n'),
-	(u'mhs', u'', u'', u'', u'I', u'L', u'Buru (Indonesia)', u'\r\n'),
-	(u'mht', u'', u'', u'', u'I', u'L', u'Mandahuaca', u'\r\n'),
-	(u'mhu', u'', u'', u'', u'I', u'L', u'Digaro-Mishmi', u'\r\n'),
-	(u'mhw', u'', u'', u'', u'I', u'L', u'Mbukushu', u'\r\n'),
-	(u'mhx', u'', u'', u'', u'I', u'L', u'Maru', u'\r\n'),
-	(u'mhy', u'', u'', u'', u'I', u'L', u"Ma'anyan", u'\r\n'),
-	(u'mhz', u'', u'', u'', u'I', u'L', u'Mor (Mor Islands)', u'\r\n'),
-	(u'mia', u'', u'', u'', u'I', u'L', u'Miami', u'\r\n'),
-	(u'mib', u'', u'', u'', u'I', u'L', u'Atatl\xe1huca Mixtec', u'\r\n'),
-	(u'mic', u'mic', u'mic', u'', u'I', u'L', u"Mi'kmaq", u'\r\n'),
-	(u'mid', u'', u'', u'', u'I', u'L', u'Mandaic', u'\r\n'),
-	(u'mie', u'', u'', u'', u'I', u'L', u'Ocotepec Mixtec', u'\r\n'),
-	(u'mif', u'', u'', u'', u'I', u'L', u'Mofu-Gudur', u'\r\n'),
-	(u'mig', u'', u'', u'', u'I', u'L', u'San Miguel El Grande Mixtec', u'\r\n'),
-	(u'mih', u'', u'', u'', u'I', u'L', u'Chayuco Mixtec', u'\r\n'),
-	(u'mii', u'', u'', u'', u'I', u'L', u'Chigmecatitl\xe1n Mixtec', u'\r\n'),
-	(u'mij', u'', u'', u'', u'I', u'L', u'Abar', u'\r\n'),
-	(u'mik', u'', u'', u'', u'I', u'L', u'Mikasuki', u'\r\n'),
-	(u'mil', u'', u'', u'', u'I', u'L', u'Pe\xf1oles Mixtec', u'\r\n'),
-	(u'mim', u'', u'', u'', u'I', u'L', u'Alacatlatzala Mixtec', u'\r\n'),
-	(u'min', u'min', u'min', u'', u'I', u'L', u'Minangkabau', u'\r\n'),
-	(u'mio', u'', u'', u'', u'I', u'L', u'Pinotepa Nacional Mixtec', u'\r\n'),
-	(u'mip', u'', u'', u'', u'I', u'L', u'Apasco-Apoala Mixtec', u'\r\n'),
-	(u'miq', u'', u'', u'', u'I', u'L', u'M\xedskito', u'\r\n'),
-	(u'mir', u'', u'', u'', u'I', u'L', u'Isthmus Mixe', u'\r\n'),
-	(u'mis', u'mis', u'mis', u'', u'S', u'S', u'Uncoded languages', u'\r\n'),
-	(u'mit', u'', u'', u'', u'I', u'L', u'Southern Puebla Mixtec', u'\r\n'),
-	(u'miu', u'', u'', u'', u'I', u'L', u'Cacaloxtepec Mixtec', u'\r\n'),
-	(u'miw', u'', u'', u'', u'I', u'L', u'Akoye', u'\r\n'),
-	(u'mix', u'', u'', u'', u'I', u'L', u'Mixtepec Mixtec', u'\r\n'),
-	(u'miy', u'', u'', u'', u'I', u'L', u'Ayutla Mixtec', u'\r\n'),
-	(u'miz', u'', u'', u'', u'I', u'L', u'Coatzospan Mixtec', u'\r\n'),
-	(u'mja', u'', u'', u'', u'I', u'L', u'Mahei', u'\r\n'),
-	(u'mjc', u'', u'', u'', u'I', u'L', u'San Juan Colorado Mixtec', u'\r\n'),
-	(u'mjd', u'', u'', u'', u'I', u'L', u'Northwest Maidu', u'\r\n'),
-	(u'mje', u'', u'', u'', u'I', u'E', u'Muskum', u'\r\n'),
-	(u'mjg', u'', u'', u'', u'I', u'L', u'Tu', u'\r\n'),
-	(u'mjh', u'', u'', u'', u'I', u'L', u'Mwera (Nyasa)', u'\r\n'),
-	(u'mji', u'', u'', u'', u'I', u'L', u'Kim Mun', u'\r\n'),
-	(u'mjj', u'', u'', u'', u'I', u'L', u'Mawak', u'\r\n'),
-	(u'mjk', u'', u'', u'', u'I', u'L', u'Matukar', u'\r\n'),
-	(u'mjl', u'', u'', u'', u'I', u'L', u'Mandeali', u'\r\n'),
-	(u'mjm', u'', u'', u'', u'I', u'L', u'Medebur', u'\r\n'),
-	(u'mjn', u'', u'', u'', u'I', u'L', u'Ma (Papua New Guinea)', u'\r\n'),
-	(u'mjo', u'', u'', u'', u'I', u'L', u'Malankuravan', u'\r\n'),
-	(u'mjp', u'', u'', u'', u'I', u'L', u'Malapandaram', u'\r\n'),
-	(u'mjq', u'', u'', u'', u'I', u'E', u'Malaryan', u'\r\n'),
-	(u'mjr', u'', u'', u'', u'I', u'L', u'Malavedan', u'\r\n'),
-	(u'mjs', u'', u'', u'', u'I', u'L', u'Miship', u'\r\n'),
-	(u'mjt', u'', u'', u'', u'I', u'L', u'Sauria Paharia', u'\r\n'),
-	(u'mju', u'', u'', u'', u'I', u'L', u'Manna-Dora', u'\r\n'),
-	(u'mjv', u'', u'', u'', u'I', u'L', u'Mannan', u'\r\n'),
-	(u'mjw', u'', u'', u'', u'I', u'L', u'Karbi', u'\r\n'),
-	(u'mjx', u'', u'', u'', u'I', u'L', u'Mahali', u'\r\n'),
-	(u'mjy', u'', u'', u'', u'I', u'E', u'Mahican', u'\r\n'),
-	(u'mjz', u'', u'', u'', u'I', u'L', u'Majhi', u'\r\n'),
-	(u'mka', u'', u'', u'', u'I', u'L', u'Mbre', u'\r\n'),
-	(u'mkb', u'', u'', u'', u'I', u'L', u'Mal Paharia', u'\r\n'),
-	(u'mkc', u'', u'', u'', u'I', u'L', u'Siliput', u'\r\n'),
-	(u'mkd', u'mac', u'mkd', u'mk', u'I', u'L', u'Macedonian', u'\r\n'),
-	(u'mke', u'', u'', u'', u'I', u'L', u'Mawchi', u'\r\n'),
-	(u'mkf', u'', u'', u'', u'I', u'L', u'Miya', u'\r\n'),
-	(u'mkg', u'', u'', u'', u'I', u'L', u'Mak (China)', u'\r\n'),
-	(u'mki', u'', u'', u'', u'I', u'L', u'Dhatki', u'\r\n'),
-	(u'mkj', u'', u'', u'', u'I', u'L', u'Mokilese', u'\r\n'),
-	(u'mkk', u'', u'', u'', u'I', u'L', u'Byep', u'\r\n'),
-	(u'mkl', u'', u'', u'', u'I', u'L', u'Mokole', u'\r\n'),
-	(u'mkm', u'', u'', u'', u'I', u'L', u'Moklen', u'\r\n'),
-	(u'mkn', u'', u'', u'', u'I', u'L', u'Kupang Malay', u'\r\n'),
-	(u'mko', u'', u'', u'', u'I', u'L', u'Mingang Doso', u'\r\n'),
-	(u'mkp', u'', u'', u'', u'I', u'L', u'Moikodi', u'\r\n'),
-	(u'mkq', u'', u'', u'', u'I', u'E', u'Bay Miwok', u'\r\n'),
-	(u'mkr', u'', u'', u'', u'I', u'L', u'Malas', u'\r\n'),
-	(u'mks', u'', u'', u'', u'I', u'L', u'Silacayoapan Mixtec', u'\r\n'),
-	(u'mkt', u'', u'', u'', u'I', u'L', u'Vamale', u'\r\n'),
-	(u'mku', u'', u'', u'', u'I', u'L', u'Konyanka Maninka', u'\r\n'),
-	(u'mkv', u'', u'', u'', u'I', u'L', u'Mafea', u'\r\n'),
-	(u'mkw', u'', u'', u'', u'I', u'L', u'Kituba (Congo)', u'\r\n'),
-	(u'mkx', u'', u'', u'', u'I', u'L', u'Kinamiging Manobo', u'\r\n'),
-	(u'mky', u'', u'', u'', u'I', u'L', u'East Makian', u'\r\n'),
-	(u'mkz', u'', u'', u'', u'I', u'L', u'Makasae', u'\r\n'),
-	(u'mla', u'', u'', u'', u'I', u'L', u'Malo', u'\r\n'),
-	(u'mlb', u'', u'', u'', u'I', u'L', u'Mbule', u'\r\n'),
-	(u'mlc', u'', u'', u'', u'I', u'L', u'Cao Lan', u'\r\n'),
-	(u'mld', u'', u'', u'', u'I', u'L', u'Malakhel', u'\r\n'),
-	(u'mle', u'', u'', u'', u'I', u'L', u'Manambu', u'\r\n'),
-	(u'mlf', u'', u'', u'', u'I', u'L', u'Mal', u'\r\n'),
-	(u'mlg', u'mlg', u'mlg', u'mg', u'M', u'L', u'Malagasy', u'\r\n'),
-	(u'mlh', u'', u'', u'', u'I', u'L', u'Mape', u'\r\n'),
-	(u'mli', u'', u'', u'', u'I', u'L', u'Malimpung', u'\r\n'),
-	(u'mlj', u'', u'', u'', u'I', u'L', u'Miltu', u'\r\n'),
-	(u'mlk', u'', u'', u'', u'I', u'L', u'Ilwana', u'\r\n'),
-	(u'mll', u'', u'', u'', u'I', u'L', u'Malua Bay', u'\r\n'),
-	(u'mlm', u'', u'', u'', u'I', u'L', u'Mulam', u'\r\n'),
-	(u'mln', u'', u'', u'', u'I', u'L', u'Malango', u'\r\n'),
-	(u'mlo', u'', u'', u'', u'I', u'L', u'Mlomp', u'\r\n'),
-	(u'mlp', u'', u'', u'', u'I', u'L', u'Bargam', u'\r\n'),
-	(u'mlq', u'', u'', u'', u'I', u'L', u'Western Maninkakan', u'\r\n'),
-	(u'mlr', u'', u'', u'', u'I', u'L', u'Vame', u'\r\n'),
-	(u'mls', u'', u'', u'', u'I', u'L', u'Masalit', u'\r\n'),
-	(u'mlt', u'mlt', u'mlt', u'mt', u'I', u'L', u'Maltese', u'\r\n'),
-	(u'mlu', u'', u'', u'', u'I', u'L', u"To'abaita", u'\r\n'),
-	(u'mlv', u'', u'', u'', u'I', u'L', u'Motlav', u'\r\n'),
-	(u'mlw', u'', u'', u'', u'I', u'L', u'Moloko', u'\r\n'),
-	(u'mlx', u'', u'', u'', u'I', u'L', u'Malfaxal', u'\r\n'),
-	(u'mlz', u'', u'', u'', u'I', u'L', u'Malaynon', u'\r\n'),
-	(u'mma', u'', u'', u'', u'I', u'L', u'Mama', u'\r\n'),
-	(u'mmb', u'', u'', u'', u'I', u'L', u'Momina', u'\r\n'),
-	(u'mmc', u'', u'', u'', u'I', u'L', u'Michoac\xe1n Mazahua', u'\r\n'),
-	(u'mmd', u'', u'', u'', u'I', u'L', u'Maonan', u'\r\n'),
-	(u'mme', u'', u'', u'', u'I', u'L', u'Mae', u'\r\n'),
-	(u'mmf', u'', u'', u'', u'I', u'L', u'Mundat', u'\r\n'),
-	(u'mmg', u'', u'', u'', u'I', u'L', u'North Ambrym', u'\r\n'),
-	(u'mmh', u'', u'', u'', u'I', u'L', u'Mehin\xe1ku', u'\r\n'),
-	(u'mmi', u'', u'', u'', u'I', u'L', u'Musar', u'\r\n'),
-	(u'mmj', u'', u'', u'', u'I', u'L', u'Majhwar', u'\r\n'),
-	(u'mmk', u'', u'', u'', u'I', u'L', u'Mukha-Dora', u'\r\n'),
-	(u'mml', u'', u'', u'', u'I', u'L', u'Man Met', u'\r\n'),
-	(u'mmm', u'', u'', u'', u'I', u'L', u'Maii', u'\r\n'),
-	(u'mmn', u'', u'', u'', u'I', u'L', u'Mamanwa', u'\r\n'),
-	(u'mmo', u'', u'', u'', u'I', u'L', u'Mangga Buang', u'\r\n'),
-	(u'mmp', u'', u'', u'', u'I', u'L', u'Siawi', u'\r\n'),
-	(u'mmq', u'', u'', u'', u'I', u'L', u'Musak', u'\r\n'),
-	(u'mmr', u'', u'', u'', u'I', u'L', u'Western Xiangxi Miao', u'\r\n'),
-	(u'mmt', u'', u'', u'', u'I', u'L', u'Malalamai', u'\r\n'),
-	(u'mmu', u'', u'', u'', u'I', u'L', u'Mmaala', u'\r\n'),
-	(u'mmv', u'', u'', u'', u'I', u'E', u'Miriti', u'\r\n'),
-	(u'mmw', u'', u'', u'', u'I', u'L', u'Emae', u'\r\n'),
-	(u'mmx', u'', u'', u'', u'I', u'L', u'Madak', u'\r\n'),
-	(u'mmy', u'', u'', u'', u'I', u'L', u'Migaama', u'\r\n'),
-	(u'mmz', u'', u'', u'', u'I', u'L', u'Mabaale', u'\r\n'),
-	(u'mna', u'', u'', u'', u'I', u'L', u'Mbula', u'\r\n'),
-	(u'mnb', u'', u'', u'', u'I', u'L', u'Muna', u'\r\n'),
-	(u'mnc', u'mnc', u'mnc', u'', u'I', u'L', u'Manchu', u'\r\n'),
-	(u'mnd', u'', u'', u'', u'I', u'L', u'Mond\xe9', u'\r\n'),
-	(u'mne', u'', u'', u'', u'I', u'L', u'Naba', u'\r\n'),
-	(u'mnf', u'', u'', u'', u'I', u'L', u'Mundani', u'\r\n'),
-	(u'mng', u'', u'', u'', u'I', u'L', u'Eastern Mnong', u'\r\n'),
-	(u'mnh', u'', u'', u'', u'I', u'L', u'Mono (Democratic Republic of Congo)', u'\r\n'),
-	(u'mni', u'mni', u'mni', u'', u'I', u'L', u'Manipuri', u'\r\n'),
-	(u'mnj', u'', u'', u'', u'I', u'L', u'Munji', u'\r\n'),
-	(u'mnk', u'', u'', u'', u'I', u'L', u'Mandinka', u'\r\n'),
-	(u'mnl', u'', u'', u'', u'I', u'L', u'Tiale', u'\r\n'),
-	(u'mnm', u'', u'', u'', u'I', u'L', u'Mapena', u'\r\n'),
-	(u'mnn', u'', u'', u'', u'I', u'L', u'Southern Mnong', u'\r\n'),
-	(u'mnp', u'', u'', u'', u'I', u'L', u'Min Bei Chinese', u'\r\n'),
-	(u'mnq', u'', u'', u'', u'I', u'L', u'Minriq', u'\r\n'),
-	(u'mnr', u'', u'', u'', u'I', u'L', u'Mono (USA)', u'\r\n'),
-	(u'mns', u'', u'', u'', u'I', u'L', u'Mansi', u'\r\n'),
-	(u'mnt', u'', u'', u'', u'I', u'E', u'Maykulan', u'\r\n'),
-	(u'mnu', u'', u'', u'', u'I', u'L', u'Mer', u'\r\n'),
-	(u'mnv', u'', u'', u'', u'I', u'L', u'Rennell-Bellona', u'\r\n'),
-	(u'mnw', u'', u'', u'', u'I', u'L', u'Mon', u'\r\n'),
-	(u'mnx', u'', u'', u'', u'I', u'L', u'Manikion', u'\r\n'),
-	(u'mny', u'', u'', u'', u'I', u'L', u'Manyawa', u'\r\n'),
-	(u'mnz', u'', u'', u'', u'I', u'L', u'Moni', u'\r\n'),
-	(u'moa', u'', u'', u'', u'I', u'L', u'Mwan', u'\r\n'),
-	(u'moc', u'', u'', u'', u'I', u'L', u'Mocov\xed', u'\r\n'),
-	(u'mod', u'', u'', u'', u'I', u'E', u'Mobilian', u'\r\n'),
-	(u'moe', u'', u'', u'', u'I', u'L', u'Montagnais', u'\r\n'),
-	(u'mog', u'', u'', u'', u'I', u'L', u'Mongondow', u'\r\n'),
-	(u'moh', u'moh', u'moh', u'', u'I', u'L', u'Mohawk', u'\r\n'),
-	(u'moi', u'', u'', u'', u'I', u'L', u'Mboi', u'\r\n'),
-	(u'moj', u'', u'', u'', u'I', u'L', u'Monzombo', u'\r\n'),
-	(u'mok', u'', u'', u'', u'I', u'L', u'Morori', u'\r\n'),
-	(u'mom', u'', u'', u'', u'I', u'E', u'Mangue', u'\r\n'),
-	(u'mon', u'mon', u'mon', u'mn', u'M', u'L', u'Mongolian', u'\r\n'),
-	(u'moo', u'', u'', u'', u'I', u'L', u'Monom', u'\r\n'),
-	(u'mop', u'', u'', u'', u'I', u'L', u'Mop\xe1n Maya', u'\r\n'),
-	(u'moq', u'', u'', u'', u'I', u'L', u'Mor (Bomberai Peninsula)', u'\r\n'),
-	(u'mor', u'', u'', u'', u'I', u'L', u'Moro', u'\r\n'),
-	(u'mos', u'mos', u'mos', u'', u'I', u'L', u'Mossi', u'\r\n'),
-	(u'mot', u'', u'', u'', u'I', u'L', u'Bar\xed', u'\r\n'),
-	(u'mou', u'', u'', u'', u'I', u'L', u'Mogum', u'\r\n'),
-	(u'mov', u'', u'', u'', u'I', u'L', u'Mohave', u'\r\n'),
-	(u'mow', u'', u'', u'', u'I', u'L', u'Moi (Congo)', u'\r\n'),
-	(u'mox', u'', u'', u'', u'I', u'L', u'Molima', u'\r\n'),
-	(u'moy', u'', u'', u'', u'I', u'L', u'Shekkacho', u'\r\n'),
-	(u'moz', u'', u'', u'', u'I', u'L', u'Mukulu', u'\r\n'),
-	(u'mpa', u'', u'', u'', u'I', u'L', u'Mpoto', u'\r\n'),
-	(u'mpb', u'', u'', u'', u'I', u'L', u'Mullukmulluk', u'\r\n'),
-	(u'mpc', u'', u'', u'', u'I', u'L', u'Mangarayi', u'\r\n'),
-	(u'mpd', u'', u'', u'', u'I', u'L', u'Machinere', u'\r\n'),
-	(u'mpe', u'', u'', u'', u'I', u'L', u'Majang', u'\r\n'),
-	(u'mpg', u'', u'', u'', u'I', u'L', u'Marba', u'\r\n'),
-	(u'mph', u'', u'', u'', u'I', u'L', u'Maung', u'\r\n'),
-	(u'mpi', u'', u'', u'', u'I', u'L', u'Mpade', u'\r\n'),
-	(u'mpj', u'', u'', u'', u'I', u'L', u'Martu Wangka', u'\r\n'),
-	(u'mpk', u'', u'', u'', u'I', u'L', u'Mbara (Chad)', u'\r\n'),
-	(u'mpl', u'', u'', u'', u'I', u'L', u'Middle Watut', u'\r\n'),
-	(u'mpm', u'', u'', u'', u'I', u'L', u'Yosond\xfaa Mixtec', u'\r\n'),
-	(u'mpn', u'', u'', u'', u'I', u'L', u'Mindiri', u'\r\n'),
-	(u'mpo', u'', u'', u'', u'I', u'L', u'Miu', u'\r\n'),
-	(u'mpp', u'', u'', u'', u'I', u'L', u'Migabac', u'\r\n'),
-	(u'mpq', u'', u'', u'', u'I', u'L', u'Mat\xeds', u'\r\n'),
-	(u'mpr', u'', u'', u'', u'I', u'L', u'Vangunu', u'\r\n'),
-	(u'mps', u'', u'', u'', u'I', u'L', u'Dadibi', u'\r\n'),
-	(u'mpt', u'', u'', u'', u'I', u'L', u'Mian', u'\r\n'),
-	(u'mpu', u'', u'', u'', u'I', u'L', u'Makur\xe1p', u'\r\n'),
-	(u'mpv', u'', u'', u'', u'I', u'L', u'Mungkip', u'\r\n'),
-	(u'mpw', u'', u'', u'', u'I', u'L', u'Mapidian', u'\r\n'),
-	(u'mpx', u'', u'', u'', u'I', u'L', u'Misima-Paneati', u'\r\n'),
-	(u'mpy', u'', u'', u'', u'I', u'L', u'Mapia', u'\r\n'),
-	(u'mpz', u'', u'', u'', u'I', u'L', u'Mpi', u'\r\n'),
-	(u'mqa', u'', u'', u'', u'I', u'L', u'Maba (Indonesia)', u'\r\n'),
-	(u'mqb', u'', u'', u'', u'I', u'L', u'Mbuko', u'\r\n'),
-	(u'mqc', u'', u'', u'', u'I', u'L', u'Mangole', u'\r\n'),
-	(u'mqe', u'', u'', u'', u'I', u'L', u'Matepi', u'\r\n'),
-	(u'mqf', u'', u'', u'', u'I', u'L', u'Momuna', u'\r\n'),
-	(u'mqg', u'', u'', u'', u'I', u'L', u'Kota Bangun Kutai Malay', u'\r\n'),
-	(u'mqh', u'', u'', u'', u'I', u'L', u'Tlazoyaltepec Mixtec', u'\r\n'),
-	(u'mqi', u'', u'', u'', u'I', u'L', u'Mariri', u'\r\n'),
-	(u'mqj', u'', u'', u'', u'I', u'L', u'Mamasa', u'\r\n'),
-	(u'mqk', u'', u'', u'', u'I', u'L', u'Rajah Kabunsuwan Manobo', u'\r\n'),
-	(u'mql', u'', u'', u'', u'I', u'L', u'Mbelime', u'\r\n'),
-	(u'mqm', u'', u'', u'', u'I', u'L', u'South Marquesan', u'\r\n'),
-	(u'mqn', u'', u'', u'', u'I', u'L', u'Moronene', u'\r\n'),
-	(u'mqo', u'', u'', u'', u'I', u'L', u'Modole', u'\r\n'),
-	(u'mqp', u'', u'', u'', u'I', u'L', u'Manipa', u'\r\n'),
-	(u'mqq', u'', u'', u'', u'I', u'L', u'Minokok', u'\r\n'),
-	(u'mqr', u'', u'', u'', u'I', u'L', u'Mander', u'\r\n'),
-	(u'mqs', u'', u'', u'', u'I', u'L', u'West Makian', u'\r\n'),
-	(u'mqt', u'', u'', u'', u'I', u'L', u'Mok', u'\r\n'),
-	(u'mqu', u'', u'', u'', u'I', u'L', u'Mandari', u'\r\n'),
-	(u'mqv', u'', u'', u'', u'I', u'L', u'Mosimo', u'\r\n'),
-	(u'mqw', u'', u'', u'', u'I', u'L', u'Murupi', u'\r\n'),
-	(u'mqx', u'', u'', u'', u'I', u'L', u'Mamuju', u'\r\n'),
-	(u'mqy', u'', u'', u'', u'I', u'L', u'Manggarai', u'\r\n'),
-	(u'mqz', u'', u'', u'', u'I', u'L', u'Malasanga', u'\r\n'),
-	(u'mra', u'', u'', u'', u'I', u'L', u'Mlabri', u'\r\n'),
-	(u'mrb', u'', u'', u'', u'I', u'L', u'Marino', u'\r\n'),
-	(u'mrc', u'', u'', u'', u'I', u'L', u'Maricopa', u'\r\n'),
-	(u'mrd', u'', u'', u'', u'I', u'L', u'Western Magar', u'\r\n'),
-	(u'mre', u'', u'', u'', u'I', u'E', u"Martha's Vineyard Sign Language", u'\r\n'),
-	(u'mrf', u'', u'', u'', u'I', u'L', u'Elseng', u'\r\n'),
-	(u'mrg', u'', u'', u'', u'I', u'L', u'Miri', u'\r\n'),
-	(u'mrh', u'', u'', u'', u'I', u'L', u'Mara Chin', u'\r\n'),
-	(u'mri', u'mao', u'mri', u'mi', u'I', u'L', u'Maori', u'\r\n'),
-	(u'mrj', u'', u'', u'', u'I', u'L', u'Western Mari', u'\r\n'),
-	(u'mrk', u'', u'', u'', u'I', u'L', u'Hmwaveke', u'\r\n'),
-	(u'mrl', u'', u'', u'', u'I', u'L', u'Mortlockese', u'\r\n'),
-	(u'mrm', u'', u'', u'', u'I', u'L', u'Merlav', u'\r\n'),
-	(u'mrn', u'', u'', u'', u'I', u'L', u'Cheke Holo', u'\r\n'),
-	(u'mro', u'', u'', u'', u'I', u'L', u'Mru', u'\r\n'),
-	(u'mrp', u'', u'', u'', u'I', u'L', u'Morouas', u'\r\n'),
-	(u'mrq', u'', u'', u'', u'I', u'L', u'North Marquesan', u'\r\n'),
-	(u'mrr', u'', u'', u'', u'I', u'L', u'Maria (India)', u'\r\n'),
-	(u'mrs', u'', u'', u'', u'I', u'L', u'Maragus', u'\r\n'),
-	(u'mrt', u'', u'', u'', u'I', u'L', u'Marghi Central', u'\r\n'),
-	(u'mru', u'', u'', u'', u'I', u'L', u'Mono (Cameroon)', u'\r\n'),
-	(u'mrv', u'', u'', u'', u'I', u'L', u'Mangareva', u'\r\n'),
-	(u'mrw', u'', u'', u'', u'I', u'L', u'Maranao', u'\r\n'),
-	(u'mrx', u'', u'', u'', u'I', u'L', u'Maremgi', u'\r\n'),
-	(u'mry', u'', u'', u'', u'I', u'L', u'Mandaya', u'\r\n'),
-	(u'mrz', u'', u'', u'', u'I', u'L', u'Marind', u'\r\n'),
-	(u'msa', u'may', u'msa', u'ms', u'M', u'L', u'Malay (macrolanguage)', u'\r\n'),
-	(u'msb', u'', u'', u'', u'I', u'L', u'Masbatenyo', u'\r\n'),
-	(u'msc', u'', u'', u'', u'I', u'L', u'Sankaran Maninka', u'\r\n'),
-	(u'msd', u'', u'', u'', u'I', u'L', u'Yucatec Maya Sign Language', u'\r\n'),
-	(u'mse', u'', u'', u'', u'I', u'L', u'Musey', u'\r\n'),
-	(u'msf', u'', u'', u'', u'I', u'L', u'Mekwei', u'\r\n'),
-	(u'msg', u'', u'', u'', u'I', u'L', u'Moraid', u'\r\n'),
-	(u'msh', u'', u'', u'', u'I', u'L', u'Masikoro Malagasy', u'\r\n'),
-	(u'msi', u'', u'', u'', u'I', u'L', u'Sabah Malay', u'\r\n'),
-	(u'msj', u'', u'', u'', u'I', u'L', u'Ma (Democratic Republic of Congo)', u'\r\n'),
-	(u'msk', u'', u'', u'', u'I', u'L', u'Mansaka', u'\r\n'),
-	(u'msl', u'', u'', u'', u'I', u'L', u'Molof', u'\r\n'),
-	(u'msm', u'', u'', u'', u'I', u'L', u'Agusan Manobo', u'\r\n'),
-	(u'msn', u'', u'', u'', u'I', u'L', u'Vur\xebs', u'\r\n'),
-	(u'mso', u'', u'', u'', u'I', u'L', u'Mombum', u'\r\n'),
-	(u'msp', u'', u'', u'', u'I', u'E', u'Maritsau\xe1', u'\r\n'),
-	(u'msq', u'', u'', u'', u'I', u'L', u'Caac', u'\r\n'),
-	(u'msr', u'', u'', u'', u'I', u'L', u'Mongolian Sign Language', u'\r\n'),
-	(u'mss', u'', u'', u'', u'I', u'L', u'West Masela', u'\r\n'),
-	(u'msu', u'', u'', u'', u'I', u'L', u'Musom', u'\r\n'),
-	(u'msv', u'', u'', u'', u'I', u'L', u'Maslam', u'\r\n'),
-	(u'msw', u'', u'', u'', u'I', u'L', u'Mansoanka', u'\r\n'),
-	(u'msx', u'', u'', u'', u'I', u'L', u'Moresada', u'\r\n'),
-	(u'msy', u'', u'', u'', u'I', u'L', u'Aruamu', u'\r\n'),
-	(u'msz', u'', u'', u'', u'I', u'L', u'Momare', u'\r\n'),
-	(u'mta', u'', u'', u'', u'I', u'L', u'Cotabato Manobo', u'\r\n'),
-	(u'mtb', u'', u'', u'', u'I', u'L', u'Anyin Morofo', u'\r\n'),
-	(u'mtc', u'', u'', u'', u'I', u'L', u'Munit', u'\r\n'),
-	(u'mtd', u'', u'', u'', u'I', u'L', u'Mualang', u'\r\n'),
-	(u'mte', u'', u'', u'', u'I', u'L', u'Mono (Solomon Islands)', u'\r\n'),
-	(u'mtf', u'', u'', u'', u'I', u'L', u'Murik (Papua New Guinea)', u'\r\n'),
-	(u'mtg', u'', u'', u'', u'I', u'L', u'Una', u'\r\n'),
-	(u'mth', u'', u'', u'', u'I', u'L', u'Munggui', u'\r\n'),
-	(u'mti', u'', u'', u'', u'I', u'L', u'Maiwa (Papua New Guinea)', u'\r\n'),
-	(u'mtj', u'', u'', u'', u'I', u'L', u'Moskona', u'\r\n'),
-	(u'mtk', u'', u'', u'', u'I', u'L', u"Mbe'", u'\r\n'),
-	(u'mtl', u'', u'', u'', u'I', u'L', u'Montol', u'\r\n'),
-	(u'mtm', u'', u'', u'', u'I', u'E', u'Mator', u'\r\n'),
-	(u'mtn', u'', u'', u'', u'I', u'E', u'Matagalpa', u'\r\n'),
-	(u'mto', u'', u'', u'', u'I', u'L', u'Totontepec Mixe', u'\r\n'),
-	(u'mtp', u'', u'', u'', u'I', u'L', u'Wich\xed Lhamt\xe9s Nocten', u'\r\n'),
-	(u'mtq', u'', u'', u'', u'I', u'L', u'Muong', u'\r\n'),
-	(u'mtr', u'', u'', u'', u'I', u'L', u'Mewari', u'\r\n'),
-	(u'mts', u'', u'', u'', u'I', u'L', u'Yora', u'\r\n'),
-	(u'mtt', u'', u'', u'', u'I', u'L', u'Mota', u'\r\n'),
-	(u'mtu', u'', u'', u'', u'I', u'L', u'Tututepec Mixtec', u'\r\n'),
-	(u'mtv', u'', u'', u'', u'I', u'L', u"Asaro'o", u'\r\n'),
-	(u'mtw', u'', u'', u'', u'I', u'L', u'Southern Binukidnon', u'\r\n'),
-	(u'mtx', u'', u'', u'', u'I', u'L', u'Tida\xe1 Mixtec', u'\r\n'),
-	(u'mty', u'', u'', u'', u'I', u'L', u'Nabi', u'\r\n'),
-	(u'mua', u'', u'', u'', u'I', u'L', u'Mundang', u'\r\n'),
-	(u'mub', u'', u'', u'', u'I', u'L', u'Mubi', u'\r\n'),
-	(u'muc', u'', u'', u'', u'I', u'L', u"Mbu'", u'\r\n'),
-	(u'mud', u'', u'', u'', u'I', u'L', u'Mednyj Aleut', u'\r\n'),
-	(u'mue', u'', u'', u'', u'I', u'L', u'Media Lengua', u'\r\n'),
-	(u'mug', u'', u'', u'', u'I', u'L', u'Musgu', u'\r\n'),
-	(u'muh', u'', u'', u'', u'I', u'L', u'M\xfcnd\xfc', u'\r\n'),
-	(u'mui', u'', u'', u'', u'I', u'L', u'Musi', u'\r\n'),
-	(u'muj', u'', u'', u'', u'I', u'L', u'Mabire', u'\r\n'),
-	(u'muk', u'', u'', u'', u'I', u'L', u'Mugom', u'\r\n'),
-	(u'mul', u'mul', u'mul', u'', u'S', u'S', u'Multiple languages', u'\r\n'),
-	(u'mum', u'', u'', u'', u'I', u'L', u'Maiwala', u'\r\n'),
-	(u'muo', u'', u'', u'', u'I', u'L', u'Nyong', u'\r\n'),
-	(u'mup', u'', u'', u'', u'I', u'L', u'Malvi', u'\r\n'),
-	(u'muq', u'', u'', u'', u'I', u'L', u'Eastern Xiangxi Miao', u'\r\n'),
-	(u'mur', u'', u'', u'', u'I', u'L', u'Murle', u'\r\n'),
-	(u'mus', u'mus', u'mus', u'', u'I', u'L', u'Creek', u'\r\n'),
-	(u'mut', u'', u'', u'', u'I', u'L', u'Western Muria', u'\r\n'),
-	(u'muu', u'', u'', u'', u'I', u'L', u'Yaaku', u'\r\n'),
-	(u'muv', u'', u'', u'', u'I', u'L', u'Muthuvan', u'\r\n'),
-	(u'mux', u'', u'', u'', u'I', u'L', u'Bo-Ung', u'\r\n'),
-	(u'muy', u'', u'', u'', u'I', u'L', u'Muyang', u'\r\n'),
-	(u'muz', u'', u'', u'', u'I', u'L', u'Mursi', u'\r\n'),
-	(u'mva', u'', u'', u'', u'I', u'L', u'Manam', u'\r\n'),
-	(u'mvb', u'', u'', u'', u'I', u'E', u'Mattole', u'\r\n'),
-	(u'mvd', u'', u'', u'', u'I', u'L', u'Mamboru', u'\r\n'),
-	(u'mve', u'', u'', u'', u'I', u'L', u'Marwari (Pakistan)', u'\r\n'),
-	(u'mvf', u'', u'', u'', u'I', u'L', u'Peripheral Mongolian', u'\r\n'),
-	(u'mvg', u'', u'', u'', u'I', u'L', u'Yucua\xf1e Mixtec', u'\r\n'),
-	(u'mvh', u'', u'', u'', u'I', u'L', u'Mire', u'\r\n'),
-	(u'mvi', u'', u'', u'', u'I', u'L', u'Miyako', u'\r\n'),
-	(u'mvk', u'', u'', u'', u'I', u'L', u'Mekmek', u'\r\n'),
-	(u'mvl', u'', u'', u'', u'I', u'E', u'Mbara (Australia)', u'\r\n'),
-	(u'mvm', u'', u'', u'', u'I', u'L', u'Muya', u'\r\n'),
-	(u'mvn', u'', u'', u'', u'I', u'L', u'Minaveha', u'\r\n'),
-	(u'mvo', u'', u'', u'', u'I', u'L', u'Marovo', u'\r\n'),
-	(u'mvp', u'', u'', u'', u'I', u'L', u'Duri', u'\r\n'),
-	(u'mvq', u'', u'', u'', u'I', u'L', u'Moere', u'\r\n'),
-	(u'mvr', u'', u'', u'', u'I', u'L', u'Marau', u'\r\n'),
-	(u'mvs', u'', u'', u'', u'I', u'L', u'Massep', u'\r\n'),
-	(u'mvt', u'', u'', u'', u'I', u'L', u'Mpotovoro', u'\r\n'),
-	(u'mvu', u'', u'', u'', u'I', u'L', u'Marfa', u'\r\n'),
-	(u'mvv', u'', u'', u'', u'I', u'L', u'Tagal Murut', u'\r\n'),
-	(u'mvw', u'', u'', u'', u'I', u'L', u'Machinga', u'\r\n'),
-	(u'mvx', u'', u'', u'', u'I', u'L', u'Meoswar', u'\r\n'),
-	(u'mvy', u'', u'', u'', u'I', u'L', u'Indus Kohistani', u'\r\n'),
-	(u'mvz', u'', u'', u'', u'I', u'L', u'Mesqan', u'\r\n'),
-	(u'mwa', u'', u'', u'', u'I', u'L', u'Mwatebu', u'\r\n'),
-	(u'mwb', u'', u'', u'', u'I', u'L', u'Juwal', u'\r\n'),
-	(u'mwc', u'', u'', u'', u'I', u'L', u'Are', u'\r\n'),
-	(u'mwd', u'', u'', u'', u'I', u'L', u'Mudbura', u'\r\n'),
-	(u'mwe', u'', u'', u'', u'I', u'L', u'Mwera (Chimwera)', u'\r\n'),
-	(u'mwf', u'', u'', u'', u'I', u'L', u'Murrinh-Patha', u'\r\n'),
-	(u'mwg', u'', u'', u'', u'I', u'L', u'Aiklep', u'\r\n'),
-	(u'mwh', u'', u'', u'', u'I', u'L', u'Mouk-Aria', u'\r\n'),
-	(u'mwi', u'', u'', u'', u'I', u'L', u'Labo', u'\r\n'),
-	(u'mwj', u'', u'', u'', u'I', u'L', u'Maligo', u'\r\n'),
-	(u'mwk', u'', u'', u'', u'I', u'L', u'Kita Maninkakan', u'\r\n'),
-	(u'mwl', u'mwl', u'mwl', u'', u'I', u'L', u'Mirandese', u'\r\n'),
-	(u'mwm', u'', u'', u'', u'I', u'L', u'Sar', u'\r\n'),
-	(u'mwn', u'', u'', u'', u'I', u'L', u'Nyamwanga', u'\r\n'),
-	(u'mwo', u'', u'', u'', u'I', u'L', u'Central Maewo', u'\r\n'),
-	(u'mwp', u'', u'', u'', u'I', u'L', u'Kala Lagaw Ya', u'\r\n'),
-	(u'mwq', u'', u'', u'', u'I', u'L', u'M\xfcn Chin', u'\r\n'),
-	(u'mwr', u'mwr', u'mwr', u'', u'M', u'L', u'Marwari', u'\r\n'),
-	(u'mws', u'', u'', u'', u'I', u'L', u'Mwimbi-Muthambi', u'\r\n'),
-	(u'mwt', u'', u'', u'', u'I', u'L', u'Moken', u'\r\n'),
-	(u'mwu', u'', u'', u'', u'I', u'E', u'Mittu', u'\r\n'),
-	(u'mwv', u'', u'', u'', u'I', u'L', u'Mentawai', u'\r\n'),
-	(u'mww', u'', u'', u'', u'I', u'L', u'Hmong Daw', u'\r\n'),
-	(u'mwx', u'', u'', u'', u'I', u'L', u'Mediak', u'\r\n'),
-	(u'mwy', u'', u'', u'', u'I', u'L', u'Mosiro', u'\r\n'),
-	(u'mwz', u'', u'', u'', u'I', u'L', u'Moingi', u'\r\n'),
-	(u'mxa', u'', u'', u'', u'I', u'L', u'Northwest Oaxaca Mixtec', u'\r\n'),
-	(u'mxb', u'', u'', u'', u'I', u'L', u'Tezoatl\xe1n Mixtec', u'\r\n'),
-	(u'mxc', u'', u'', u'', u'I', u'L', u'Manyika', u'\r\n'),
-	(u'mxd', u'', u'', u'', u'I', u'L', u'Modang', u'\r\n'),
-	(u'mxe', u'', u'', u'', u'I', u'L', u'Mele-Fila', u'\r\n'),
-	(u'mxf', u'', u'', u'', u'I', u'L', u'Malgbe', u'\r\n'),
-	(u'mxg', u'', u'', u'', u'I', u'L', u'Mbangala', u'\r\n'),
-	(u'mxh', u'', u'', u'', u'I', u'L', u'Mvuba', u'\r\n'),
-	(u'mxi', u'', u'', u'', u'I', u'E', u'Mozarabic', u'\r\n'),
-	(u'mxj', u'', u'', u'', u'I', u'L', u'Miju-Mishmi', u'\r\n'),
-	(u'mxk', u'', u'', u'', u'I', u'L', u'Monumbo', u'\r\n'),
-	(u'mxl', u'', u'', u'', u'I', u'L', u'Maxi Gbe', u'\r\n'),
-	(u'mxm', u'', u'', u'', u'I', u'L', u'Meramera', u'\r\n'),
-	(u'mxn', u'', u'', u'', u'I', u'L', u'Moi (Indonesia)', u'\r\n'),
-	(u'mxo', u'', u'', u'', u'I', u'L', u'Mbowe', u'\r\n'),
-	(u'mxp', u'', u'', u'', u'I', u'L', u'Tlahuitoltepec Mixe', u'\r\n'),
-	(u'mxq', u'', u'', u'', u'I', u'L', u'Juquila Mixe', u'\r\n'),
-	(u'mxr', u'', u'', u'', u'I', u'L', u'Murik (Malaysia)', u'\r\n'),
-	(u'mxs', u'', u'', u'', u'I', u'L', u'Huitepec Mixtec', u'\r\n'),
-	(u'mxt', u'', u'', u'', u'I', u'L', u'Jamiltepec Mixtec', u'\r\n'),
-	(u'mxu', u'', u'', u'', u'I', u'L', u'Mada (Cameroon)', u'\r\n'),
-	(u'mxv', u'', u'', u'', u'I', u'L', u'Metlat\xf3noc Mixtec', u'\r\n'),
-	(u'mxw', u'', u'', u'', u'I', u'L', u'Namo', u'\r\n'),
-	(u'mxx', u'', u'', u'', u'I', u'L', u'Mahou', u'\r\n'),
-	(u'mxy', u'', u'', u'', u'I', u'L', u'Southeastern Nochixtl\xe1n Mixtec', u'\r\n'),
-	(u'mxz', u'', u'', u'', u'I', u'L', u'Central Masela', u'\r\n'),
-	(u'mya', u'bur', u'mya', u'my', u'I', u'L', u'Burmese', u'\r\n'),
-	(u'myb', u'', u'', u'', u'I', u'L', u'Mbay', u'\r\n'),
-	(u'myc', u'', u'', u'', u'I', u'L', u'Mayeka', u'\r\n'),
-	(u'myd', u'', u'', u'', u'I', u'L', u'Maramba', u'\r\n'),
-	(u'mye', u'', u'', u'', u'I', u'L', u'Myene', u'\r\n'),
-	(u'myf', u'', u'', u'', u'I', u'L', u'Bambassi', u'\r\n'),
-	(u'myg', u'', u'', u'', u'I', u'L', u'Manta', u'\r\n'),
-	(u'myh', u'', u'', u'', u'I', u'L', u'Makah', u'\r\n'),
-	(u'myi', u'', u'', u'', u'I', u'L', u'Mina (India)', u'\r\n'),
-	(u'myj', u'', u'', u'', u'I', u'L', u'Mangayat', u'\r\n'),
-	(u'myk', u'', u'', u'', u'I', u'L', u'Mamara Senoufo', u'\r\n'),
-	(u'myl', u'', u'', u'', u'I', u'L', u'Moma', u'\r\n'),
-	(u'mym', u'', u'', u'', u'I', u'L', u"Me'en", u'\r\n'),
-	(u'myo', u'', u'', u'', u'I', u'L', u'Anfillo', u'\r\n'),
-	(u'myp', u'', u'', u'', u'I', u'L', u'Pirah\xe3', u'\r\n'),
-	(u'myq', u'', u'', u'', u'I', u'L', u'Forest Maninka', u'\r\n'),
-	(u'myr', u'', u'', u'', u'I', u'L', u'Muniche', u'\r\n'),
-	(u'mys', u'', u'', u'', u'I', u'E', u'Mesmes', u'\r\n'),
-	(u'myu', u'', u'', u'', u'I', u'L', u'Munduruk\xfa', u'\r\n'),
-	(u'myv', u'myv', u'myv', u'', u'I', u'L', u'Erzya', u'\r\n'),
-	(u'myw', u'', u'', u'', u'I', u'L', u'Muyuw', u'\r\n'),
-	(u'myx', u'', u'', u'', u'I', u'L', u'Masaaba', u'\r\n'),
-	(u'myy', u'', u'', u'', u'I', u'L', u'Macuna', u'\r\n'),
-	(u'myz', u'', u'', u'', u'I', u'H', u'Classical Mandaic', u'\r\n'),
-	(u'mza', u'', u'', u'', u'I', u'L', u'Santa Mar\xeda Zacatepec Mixtec', u'\r\n'),
-	(u'mzb', u'', u'', u'', u'I', u'L', u'Tumzabt', u'\r\n'),
-	(u'mzc', u'', u'', u'', u'I', u'L', u'Madagascar Sign Language', u'\r\n'),
-	(u'mzd', u'', u'', u'', u'I', u'L', u'Malimba', u'\r\n'),
-	(u'mze', u'', u'', u'', u'I', u'L', u'Morawa', u'\r\n'),
-	(u'mzg', u'', u'', u'', u'I', u'L', u'Monastic Sign Language', u'\r\n'),
-	(u'mzh', u'', u'', u'', u'I', u'L', u'Wich\xed Lhamt\xe9s G\xfcisnay', u'\r\n'),
-	(u'mzi', u'', u'', u'', u'I', u'L', u'Ixcatl\xe1n Mazatec', u'\r\n'),
-	(u'mzj', u'', u'', u'', u'I', u'L', u'Manya', u'\r\n'),
-	(u'mzk', u'', u'', u'', u'I', u'L', u'Nigeria Mambila', u'\r\n'),
-	(u'mzl', u'', u'', u'', u'I', u'L', u'Mazatl\xe1n Mixe', u'\r\n'),
-	(u'mzm', u'', u'', u'', u'I', u'L', u'Mumuye', u'\r\n'),
-	(u'mzn', u'', u'', u'', u'I', u'L', u'Mazanderani', u'\r\n'),
-	(u'mzo', u'', u'', u'', u'I', u'E', u'Matipuhy', u'\r\n'),
-	(u'mzp', u'', u'', u'', u'I', u'L', u'Movima', u'\r\n'),
-	(u'mzq', u'', u'', u'', u'I', u'L', u'Mori Atas', u'\r\n'),
-	(u'mzr', u'', u'', u'', u'I', u'L', u'Mar\xfabo', u'\r\n'),
-	(u'mzs', u'', u'', u'', u'I', u'L', u'Macanese', u'\r\n'),
-	(u'mzt', u'', u'', u'', u'I', u'L', u'Mintil', u'\r\n'),
-	(u'mzu', u'', u'', u'', u'I', u'L', u'Inapang', u'\r\n'),
-	(u'mzv', u'', u'', u'', u'I', u'L', u'Manza', u'\r\n'),
-	(u'mzw', u'', u'', u'', u'I', u'L', u'Deg', u'\r\n'),
-	(u'mzx', u'', u'', u'', u'I', u'L', u'Mawayana', u'\r\n'),
-	(u'mzy', u'', u'', u'', u'I', u'L', u'Mozambican Sign Language', u'\r\n'),
-	(u'mzz', u'', u'', u'', u'I', u'L', u'Maiadomu', u'\r\n'),
-	(u'naa', u'', u'', u'', u'I', u'L', u'Namla', u'\r\n'),
-	(u'nab', u'', u'', u'', u'I', u'L', u'Southern Nambiku\xe1ra', u'\r\n'),
-	(u'nac', u'', u'', u'', u'I', u'L', u'Narak', u'\r\n'),
-	(u'nad', u'', u'', u'', u'I', u'L', u'Nijadali', u'\r\n'),
-	(u'nae', u'', u'', u'', u'I', u'L', u"Naka'ela", u'\r\n'),
-	(u'naf', u'', u'', u'', u'I', u'L', u'Nabak', u'\r\n'),
-	(u'nag', u'', u'', u'', u'I', u'L', u'Naga Pidgin', u'\r\n'),
-	(u'naj', u'', u'', u'', u'I', u'L', u'Nalu', u'\r\n'),
-	(u'nak', u'', u'', u'', u'I', u'L', u'Nakanai', u'\r\n'),
-	(u'nal', u'', u'', u'', u'I', u'L', u'Nalik', u'\r\n'),
-	(u'nam', u'', u'', u'', u'I', u'L', u'Nangikurrunggurr', u'\r\n'),
-	(u'nan', u'', u'', u'', u'I', u'L', u'Min Nan Chinese', u'\r\n'),
-	(u'nao', u'', u'', u'', u'I', u'L', u'Naaba', u'\r\n'),
-	(u'nap', u'nap', u'nap', u'', u'I', u'L', u'Neapolitan', u'\r\n'),
-	(u'naq', u'', u'', u'', u'I', u'L', u'Nama (Namibia)', u'\r\n'),
-	(u'nar', u'', u'', u'', u'I', u'L', u'Iguta', u'\r\n'),
-	(u'nas', u'', u'', u'', u'I', u'L', u'Naasioi', u'\r\n'),
-	(u'nat', u'', u'', u'', u'I', u'L', u'Hungworo', u'\r\n'),
-	(u'nau', u'nau', u'nau', u'na', u'I', u'L', u'Nauru', u'\r\n'),
-	(u'nav', u'nav', u'nav', u'nv', u'I', u'L', u'Navajo', u'\r\n'),
-	(u'naw', u'', u'', u'', u'I', u'L', u'Nawuri', u'\r\n'),
-	(u'nax', u'', u'', u'', u'I', u'L', u'Nakwi', u'\r\n'),
-	(u'nay', u'', u'', u'', u'I', u'E', u'Narrinyeri', u'\r\n'),
-	(u'naz', u'', u'', u'', u'I', u'L', u'Coatepec Nahuatl', u'\r\n'),
-	(u'nba', u'', u'', u'', u'I', u'L', u'Nyemba', u'\r\n'),
-	(u'nbb', u'', u'', u'', u'I', u'L', u'Ndoe', u'\r\n'),
-	(u'nbc', u'', u'', u'', u'I', u'L', u'Chang Naga', u'\r\n'),
-	(u'nbd', u'', u'', u'', u'I', u'L', u'Ngbinda', u'\r\n'),
-	(u'nbe', u'', u'', u'', u'I', u'L', u'Konyak Naga', u'\r\n'),
-	(u'nbf', u'', u'', u'', u'I', u'L', u'Naxi', u'\r\n'),
-	(u'nbg', u'', u'', u'', u'I', u'L', u'Nagarchal', u'\r\n'),
-	(u'nbh', u'', u'', u'', u'I', u'L', u'Ngamo', u'\r\n'),
-	(u'nbi', u'', u'', u'', u'I', u'L', u'Mao Naga', u'\r\n'),
-	(u'nbj', u'', u'', u'', u'I', u'L', u'Ngarinman', u'\r\n'),
-	(u'nbk', u'', u'', u'', u'I', u'L', u'Nake', u'\r\n'),
-	(u'nbl', u'nbl', u'nbl', u'nr', u'I', u'L', u'South Ndebele', u'\r\n'),
-	(u'nbm', u'', u'', u'', u'I', u'L', u"Ngbaka Ma'bo", u'\r\n'),
-	(u'nbn', u'', u'', u'', u'I', u'L', u'Kuri', u'\r\n'),
-	(u'nbo', u'', u'', u'', u'I', u'L', u'Nkukoli', u'\r\n'),
-	(u'nbp', u'', u'', u'', u'I', u'L', u'Nnam', u'\r\n'),
-	(u'nbq', u'', u'', u'', u'I', u'L', u'Nggem', u'\r\n'),
-	(u'nbr', u'', u'', u'', u'I', u'L', u'Numana-Nunku-Gbantu-Numbu', u'\r\n'),
-	(u'nbs', u'', u'', u'', u'I', u'L', u'Namibian Sign Language', u'\r\n'),
-	(u'nbt', u'', u'', u'', u'I', u'L', u'Na', u'\r\n'),
-	(u'nbu', u'', u'', u'', u'I', u'L', u'Rongmei Naga', u'\r\n'),
-	(u'nbv', u'', u'', u'', u'I', u'L', u'Ngamambo', u'\r\n'),
-	(u'nbw', u'', u'', u'', u'I', u'L', u'Southern Ngbandi', u'\r\n'),
-	(u'nbx', u'', u'', u'', u'I', u'E', u'Ngura', u'\r\n'),
-	(u'nby', u'', u'', u'', u'I', u'L', u'Ningera', u'\r\n'),
-	(u'nca', u'', u'', u'', u'I', u'L', u'Iyo', u'\r\n'),
-	(u'ncb', u'', u'', u'', u'I', u'L', u'Central Nicobarese', u'\r\n'),
-	(u'ncc', u'', u'', u'', u'I', u'L', u'Ponam', u'\r\n'),
-	(u'ncd', u'', u'', u'', u'I', u'L', u'Nachering', u'\r\n'),
-	(u'nce', u'', u'', u'', u'I', u'L', u'Yale', u'\r\n'),
-	(u'ncf', u'', u'', u'', u'I', u'L', u'Notsi', u'\r\n'),
-	(u'ncg', u'', u'', u'', u'I', u'L', u"Nisga'a", u'\r\n'),
-	(u'nch', u'', u'', u'', u'I', u'L', u'Central Huasteca Nahuatl', u'\r\n'),
-	(u'nci', u'', u'', u'', u'I', u'H', u'Classical Nahuatl', u'\r\n'),
-	(u'ncj', u'', u'', u'', u'I', u'L', u'Northern Puebla Nahuatl', u'\r\n'),
-	(u'nck', u'', u'', u'', u'I', u'L', u'Nakara', u'\r\n'),
-	(u'ncl', u'', u'', u'', u'I', u'L', u'Michoac\xe1n Nahuatl', u'\r\n'),
-	(u'ncm', u'', u'', u'', u'I', u'L', u'Nambo', u'\r\n'),
-	(u'ncn', u'', u'', u'', u'I', u'L', u'Nauna', u'\r\n'),
-	(u'nco', u'', u'', u'', u'I', u'L', u'Sibe', u'\r\n'),
-	(u'ncp', u'', u'', u'', u'I', u'L', u'Ndaktup', u'\r\n'),
-	(u'ncr', u'', u'', u'', u'I', u'L', u'Ncane', u'\r\n'),
-	(u'ncs', u'', u'', u'', u'I', u'L', u'Nicaraguan Sign Language', u'\r\n'),
-	(u'nct', u'', u'', u'', u'I', u'L', u'Chothe Naga', u'\r\n'),
-	(u'ncu', u'', u'', u'', u'I', u'L', u'Chumburung', u'\r\n'),
-	(u'ncx', u'', u'', u'', u'I', u'L', u'Central Puebla Nahuatl', u'\r\n'),
-	(u'ncz', u'', u'', u'', u'I', u'E', u'Natchez', u'\r\n'),
-	(u'nda', u'', u'', u'', u'I', u'L', u'Ndasa', u'\r\n'),
-	(u'ndb', u'', u'', u'', u'I', u'L', u'Kenswei Nsei', u'\r\n'),
-	(u'ndc', u'', u'', u'', u'I', u'L', u'Ndau', u'\r\n'),
-	(u'ndd', u'', u'', u'', u'I', u'L', u'Nde-Nsele-Nta', u'\r\n'),
-	(u'nde', u'nde', u'nde', u'nd', u'I', u'L', u'North Ndebele', u'\r\n'),
-	(u'ndf', u'', u'', u'', u'I', u'E', u'Nadruvian', u'\r\n'),
-	(u'ndg', u'', u'', u'', u'I', u'L', u'Ndengereko', u'\r\n'),
-	(u'ndh', u'', u'', u'', u'I', u'L', u'Ndali', u'\r\n'),
-	(u'ndi', u'', u'', u'', u'I', u'L', u'Samba Leko', u'\r\n'),
-	(u'ndj', u'', u'', u'', u'I', u'L', u'Ndamba', u'\r\n'),
-	(u'ndk', u'', u'', u'', u'I', u'L', u'Ndaka', u'\r\n'),
-	(u'ndl', u'', u'', u'', u'I', u'L', u'Ndolo', u'\r\n'),
-	(u'ndm', u'', u'', u'', u'I', u'L', u'Ndam', u'\r\n'),
-	(u'ndn', u'', u'', u'', u'I', u'L', u'Ngundi', u'\r\n'),
-	(u'ndo', u'ndo', u'ndo', u'ng', u'I', u'L', u'Ndonga', u'\r\n'),
-	(u'ndp', u'', u'', u'', u'I', u'L', u'Ndo', u'\r\n'),
-	(u'ndq', u'', u'', u'', u'I', u'L', u'Ndombe', u'\r\n'),
-	(u'ndr', u'', u'', u'', u'I', u'L', u'Ndoola', u'\r\n'),
-	(u'nds', u'nds', u'nds', u'', u'I', u'L', u'Low German', u'\r\n'),
-	(u'ndt', u'', u'', u'', u'I', u'L', u'Ndunga', u'\r\n'),
-	(u'ndu', u'', u'', u'', u'I', u'L', u'Dugun', u'\r\n'),
-	(u'ndv', u'', u'', u'', u'I', u'L', u'Ndut', u'\r\n'),
-	(u'ndw', u'', u'', u'', u'I', u'L', u'Ndobo', u'\r\n'),
-	(u'ndx', u'', u'', u'', u'I', u'L', u'Nduga', u'\r\n'),
-	(u'ndy', u'', u'', u'', u'I', u'L', u'Lutos', u'\r\n'),
-	(u'ndz', u'', u'', u'', u'I', u'L', u'Ndogo', u'\r\n'),
-	(u'nea', u'', u'', u'', u'I', u'L', u"Eastern Ngad'a", u'\r\n'),
-	(u'neb', u'', u'', u'', u'I', u'L', u"Toura (C\xf4te d'Ivoire)", u'\r\n'),
-	(u'nec', u'', u'', u'', u'I', u'L', u'Nedebang', u'\r\n'),
-	(u'ned', u'', u'', u'', u'I', u'L', u'Nde-Gbite', u'\r\n'),
-	(u'nee', u'', u'', u'', u'I', u'L', u'Kumak', u'\r\n'),
-	(u'nef', u'', u'', u'', u'I', u'L', u'Nefamese', u'\r\n'),
-	(u'neg', u'', u'', u'', u'I', u'L', u'Negidal', u'\r\n'),
-	(u'neh', u'', u'', u'', u'I', u'L', u'Nyenkha', u'\r\n'),
-	(u'nei', u'', u'', u'', u'I', u'A', u'Neo-Hittite', u'\r\n'),
-	(u'nej', u'', u'', u'', u'I', u'L', u'Neko', u'\r\n'),
-	(u'nek', u'', u'', u'', u'I', u'L', u'Neku', u'\r\n'),
-	(u'nem', u'', u'', u'', u'I', u'L', u'Nemi', u'\r\n'),
-	(u'nen', u'', u'', u'', u'I', u'L', u'Nengone', u'\r\n'),
-	(u'neo', u'', u'', u'', u'I', u'L', u'N\xe1-Meo', u'\r\n'),
-	(u'nep', u'nep', u'nep', u'ne', u'I', u'L', u'Nepali', u'\r\n'),
-	(u'neq', u'', u'', u'', u'I', u'L', u'North Central Mixe', u'\r\n'),
-	(u'ner', u'', u'', u'', u'I', u'L', u'Yahadian', u'\r\n'),
-	(u'nes', u'', u'', u'', u'I', u'L', u'Bhoti Kinnauri', u'\r\n'),
-	(u'net', u'', u'', u'', u'I', u'L', u'Nete', u'\r\n'),
-	(u'nev', u'', u'', u'', u'I', u'L', u'Nyaheun', u'\r\n'),
-	(u'new', u'new', u'new', u'', u'I', u'L', u'Newari', u'\r\n'),
-	(u'nex', u'', u'', u'', u'I', u'L', u'Neme', u'\r\n'),
-	(u'ney', u'', u'', u'', u'I', u'L', u'Neyo', u'\r\n'),
-	(u'nez', u'', u'', u'', u'I', u'L', u'Nez Perce', u'\r\n'),
-	(u'nfa', u'', u'', u'', u'I', u'L', u'Dhao', u'\r\n'),
-	(u'nfd', u'', u'', u'', u'I', u'L', u'Ahwai', u'\r\n'),
-	(u'nfl', u'', u'', u'', u'I', u'L', u'Ayiwo', u'\r\n'),
-	(u'nfr', u'', u'', u'', u'I', u'L', u'Nafaanra', u'\r\n'),
-	(u'nfu', u'', u'', u'', u'I', u'L', u'Mfumte', u'\r\n'),
-	(u'nga', u'', u'', u'', u'I', u'L', u'Ngbaka', u'\r\n'),
-	(u'ngb', u'', u'', u'', u'I', u'L', u'Northern Ngbandi', u'\r\n'),
-	(u'ngc', u'', u'', u'', u'I', u'L', u'Ngombe (Democratic Republic of Congo)', u'\r\n'),
-	(u'ngd', u'', u'', u'', u'I', u'L', u'Ngando (Central African Republic)', u'\r\n'),
-	(u'nge', u'', u'', u'', u'I', u'L', u'Ngemba', u'\r\n'),
-	(u'ngg', u'', u'', u'', u'I', u'L', u'Ngbaka Manza', u'\r\n'),
-	(u'ngh', u'', u'', u'', u'I', u'L', u'N/u', u'\r\n'),
-	(u'ngi', u'', u'', u'', u'I', u'L', u'Ngizim', u'\r\n'),
-	(u'ngj', u'', u'', u'', u'I', u'L', u'Ngie', u'\r\n'),
-	(u'ngk', u'', u'', u'', u'I', u'L', u'Ngalkbun', u'\r\n'),
-	(u'ngl', u'', u'', u'', u'I', u'L', u'Lomwe', u'\r\n'),
-	(u'ngm', u'', u'', u'', u'I', u'L', u"Ngatik Men's Creole", u'\r\n'),
-	(u'ngn', u'', u'', u'', u'I', u'L', u'Ngwo', u'\r\n'),
-	(u'ngo', u'', u'', u'', u'I', u'L', u'Ngoni', u'\r\n'),
-	(u'ngp', u'', u'', u'', u'I', u'L', u'Ngulu', u'\r\n'),
-	(u'ngq', u'', u'', u'', u'I', u'L', u'Ngurimi', u'\r\n'),
-	(u'ngr', u'', u'', u'', u'I', u'L', u'Nanggu', u'\r\n'),
-	(u'ngs', u'', u'', u'', u'I', u'L', u'Gvoko', u'\r\n'),
-	(u'ngt', u'', u'', u'', u'I', u'L', u'Ngeq', u'\r\n'),
-	(u'ngu', u'', u'', u'', u'I', u'L', u'Guerrero Nahuatl', u'\r\n'),
-	(u'ngv', u'', u'', u'', u'I', u'E', u'Nagumi', u'\r\n'),
-	(u'ngw', u'', u'', u'', u'I', u'L', u'Ngwaba', u'\r\n'),
-	(u'ngx', u'', u'', u'', u'I', u'L', u'Nggwahyi', u'\r\n'),
-	(u'ngy', u'', u'', u'', u'I', u'L', u'Tibea', u'\r\n'),
-	(u'ngz', u'', u'', u'', u'I', u'L', u'Ngungwel', u'\r\n'),
-	(u'nha', u'', u'', u'', u'I', u'L', u'Nhanda', u'\r\n'),
-	(u'nhb', u'', u'', u'', u'I', u'L', u'Beng', u'\r\n'),
-	(u'nhc', u'', u'', u'', u'I', u'E', u'Tabasco Nahuatl', u'\r\n'),
-	(u'nhd', u'', u'', u'', u'I', u'L', u'Chirip\xe1', u'\r\n'),
-	(u'nhe', u'', u'', u'', u'I', u'L', u'Eastern Huasteca Nahuatl', u'\r\n'),
-	(u'nhf', u'', u'', u'', u'I', u'L', u'Nhuwala', u'\r\n'),
-	(u'nhg', u'', u'', u'', u'I', u'L', u'Tetelcingo Nahuatl', u'\r\n'),
-	(u'nhh', u'', u'', u'', u'I', u'L', u'Nahari', u'\r\n'),
-	(u'nhi', u'', u'', u'', u'I', u'L', u'Zacatl\xe1n-Ahuacatl\xe1n-Tepetzintla Nahuatl', u'\r\n'),
-	(u'nhk', u'', u'', u'', u'I', u'L', u'Isthmus-Cosoleacaque Nahuatl', u'\r\n'),
-	(u'nhm', u'', u'', u'', u'I', u'L', u'Morelos Nahuatl', u'\r\n'),
-	(u'nhn', u'', u'', u'', u'I', u'L', u'Central Nahuatl', u'\r\n'),
-	(u'nho', u'', u'', u'', u'I', u'L', u'Takuu', u'\r\n'),
-	(u'nhp', u'', u'', u'', u'I', u'L', u'Isthmus-Pajapan Nahuatl', u'\r\n'),
-	(u'nhq', u'', u'', u'', u'I', u'L', u'Huaxcaleca Nahuatl', u'\r\n'),
-	(u'nhr', u'', u'', u'', u'I', u'L', u'Naro', u'\r\n'),
-	(u'nht', u'', u'', u'', u'I', u'L', u'Ometepec Nahuatl', u'\r\n'),
-	(u'nhu', u'', u'', u'', u'I', u'L', u'Noone', u'\r\n'),
-	(u'nhv', u'', u'', u'', u'I', u'L', u'Temascaltepec Nahuatl', u'\r\n'),
-	(u'nhw', u'', u'', u'', u'I', u'L', u'Western Huasteca Nahuatl', u'\r\n'),
-	(u'nhx', u'', u'', u'', u'I', u'L', u'Isthmus-Mecayapan Nahuatl', u'\r\n'),
-	(u'nhy', u'', u'', u'', u'I', u'L', u'Northern Oaxaca Nahuatl', u'\r\n'),
-	(u'nhz', u'', u'', u'', u'I', u'L', u'Santa Mar\xeda La Alta Nahuatl', u'\r\n'),
-	(u'nia', u'nia', u'nia', u'', u'I', u'L', u'Nias', u'\r\n'),
-	(u'nib', u'', u'', u'', u'I', u'L', u'Nakama', u'\r\n'),
-	(u'nid', u'', u'', u'', u'I', u'E', u'Ngandi', u'\r\n'),
-	(u'nie', u'', u'', u'', u'I', u'L', u'Niellim', u'\r\n'),
-	(u'nif', u'', u'', u'', u'I', u'L', u'Nek', u'\r\n'),
-	(u'nig', u'', u'', u'', u'I', u'E', u'Ngalakan', u'\r\n'),
-	(u'nih', u'', u'', u'', u'I', u'L', u'Nyiha (Tanzania)', u'\r\n'),
-	(u'nii', u'', u'', u'', u'I', u'L', u'Nii', u'\r\n'),
-	(u'nij', u'', u'', u'', u'I', u'L', u'Ngaju', u'\r\n'),
-	(u'nik', u'', u'', u'', u'I', u'L', u'Southern Nicobarese', u'\r\n'),
-	(u'nil', u'', u'', u'', u'I', u'L', u'Nila', u'\r\n'),
-	(u'nim', u'', u'', u'', u'I', u'L', u'Nilamba', u'\r\n'),
-	(u'nin', u'', u'', u'', u'I', u'L', u'Ninzo', u'\r\n'),
-	(u'nio', u'', u'', u'', u'I', u'L', u'Nganasan', u'\r\n'),
-	(u'niq', u'', u'', u'', u'I', u'L', u'Nandi', u'\r\n'),
-	(u'nir', u'', u'', u'', u'I', u'L', u'Nimboran', u'\r\n'),
-	(u'nis', u'', u'', u'', u'I', u'L', u'Nimi', u'\r\n'),
-	(u'nit', u'', u'', u'', u'I', u'L', u'Southeastern Kolami', u'\r\n'),
-	(u'niu', u'niu', u'niu', u'', u'I', u'L', u'Niuean', u'\r\n'),
-	(u'niv', u'', u'', u'', u'I', u'L', u'Gilyak', u'\r\n'),
-	(u'niw', u'', u'', u'', u'I', u'L', u'Nimo', u'\r\n'),
-	(u'nix', u'', u'', u'', u'I', u'L', u'Hema', u'\r\n'),
-	(u'niy', u'', u'', u'', u'I', u'L', u'Ngiti', u'\r\n'),
-	(u'niz', u'', u'', u'', u'I', u'L', u'Ningil', u'\r\n'),
-	(u'nja', u'', u'', u'', u'I', u'L', u'Nzanyi', u'\r\n'),
-	(u'njb', u'', u'', u'', u'I', u'L', u'Nocte Naga', u'\r\n'),
-	(u'njd', u'', u'', u'', u'I', u'L', u'Ndonde Hamba', u'\r\n'),
-	(u'njh', u'', u'', u'', u'I', u'L', u'Lotha Naga', u'\r\n'),
-	(u'nji', u'', u'', u'', u'I', u'L', u'Gudanji', u'\r\n'),
-	(u'njj', u'', u'', u'', u'I', u'L', u'Njen', u'\r\n'),
-	(u'njl', u'', u'', u'', u'I', u'L', u'Njalgulgule', u'\r\n'),
-	(u'njm', u'', u'', u'', u'I', u'L', u'Angami Naga', u'\r\n'),
-	(u'njn', u'', u'', u'', u'I', u'L', u'Liangmai Naga', u'\r\n'),
-	(u'njo', u'', u'', u'', u'I', u'L', u'Ao Naga', u'\r\n'),
-	(u'njr', u'', u'', u'', u'I', u'L', u'Njerep', u'\r\n'),
-	(u'njs', u'', u'', u'', u'I', u'L', u'Nisa', u'\r\n'),
-	(u'njt', u'', u'', u'', u'I', u'L', u'Ndyuka-Trio Pidgin', u'\r\n'),
-	(u'nju', u'', u'', u'', u'I', u'L', u'Ngadjunmaya', u'\r\n'),
-	(u'njx', u'', u'', u'', u'I', u'L', u'Kunyi', u'\r\n'),
-	(u'njy', u'', u'', u'', u'I', u'L', u'Njyem', u'\r\n'),
-	(u'nka', u'', u'', u'', u'I', u'L', u'Nkoya', u'\r\n'),
-	(u'nkb', u'', u'', u'', u'I', u'L', u'Khoibu Naga', u'\r\n'),
-	(u'nkc', u'', u'', u'', u'I', u'L', u'Nkongho', u'\r\n'),
-	(u'nkd', u'', u'', u'', u'I', u'L', u'Koireng', u'\r\n'),
-	(u'nke', u'', u'', u'', u'I', u'L', u'Duke', u'\r\n'),
-	(u'nkf', u'', u'', u'', u'I', u'L', u'Inpui Naga', u'\r\n'),
-	(u'nkg', u'', u'', u'', u'I', u'L', u'Nekgini', u'\r\n'),
-	(u'nkh', u'', u'', u'', u'I', u'L', u'Khezha Naga', u'\r\n'),
-	(u'nki', u'', u'', u'', u'I', u'L', u'Thangal Naga', u'\r\n'),
-	(u'nkj', u'', u'', u'', u'I', u'L', u'Nakai', u'\r\n'),
-	(u'nkk', u'', u'', u'', u'I', u'L', u'Nokuku', u'\r\n'),
-	(u'nkm', u'', u'', u'', u'I', u'L', u'Namat', u'\r\n'),
-	(u'nkn', u'', u'', u'', u'I', u'L', u'Nkangala', u'\r\n'),
-	(u'nko', u'', u'', u'', u'I', u'L', u'Nkonya', u'\r\n'),
-	(u'nkp', u'', u'', u'', u'I', u'E', u'Niuatoputapu', u'\r\n'),
-	(u'nkq', u'', u'', u'', u'I', u'L', u'Nkami', u'\r\n'),
-	(u'nkr', u'', u'', u'', u'I', u'L', u'Nukuoro', u'\r\n'),
-	(u'nks', u'', u'', u'', u'I', u'L', u'North Asmat', u'\r\n'),
-	(u'nkt', u'', u'', u'', u'I', u'L', u'Nyika (Tanzania)', u'\r\n'),
-	(u'nku', u'', u'', u'', u'I', u'L', u'Bouna Kulango', u'\r\n'),
-	(u'nkv', u'', u'', u'', u'I', u'L', u'Nyika (Malawi and Zambia)', u'\r\n'),
-	(u'nkw', u'', u'', u'', u'I', u'L', u'Nkutu', u'\r\n'),
-	(u'nkx', u'', u'', u'', u'I', u'L', u'Nkoroo', u'\r\n'),
-	(u'nkz', u'', u'', u'', u'I', u'L', u'Nkari', u'\r\n'),
-	(u'nla', u'', u'', u'', u'I', u'L', u'Ngombale', u'\r\n'),
-	(u'nlc', u'', u'', u'', u'I', u'L', u'Nalca', u'\r\n'),
-	(u'nld', u'dut', u'nld', u'nl', u'I', u'L', u'Dutch', u'\r\n'),
-	(u'nle', u'', u'', u'', u'I', u'L', u'East Nyala', u'\r\n'),
-	(u'nlg', u'', u'', u'', u'I', u'L', u'Gela', u'\r\n'),
-	(u'nli', u'', u'', u'', u'I', u'L', u'Grangali', u'\r\n'),
-	(u'nlj', u'', u'', u'', u'I', u'L', u'Nyali', u'\r\n'),
-	(u'nlk', u'', u'', u'', u'I', u'L', u'Ninia Yali', u'\r\n'),
-	(u'nll', u'', u'', u'', u'I', u'L', u'Nihali', u'\r\n'),
-	(u'nln', u'', u'', u'', u'I', u'L', u'Durango Nahuatl', u'\r\n'),
-	(u'nlo', u'', u'', u'', u'I', u'L', u'Ngul', u'\r\n'),
-	(u'nlr', u'', u'', u'', u'I', u'L', u'Ngarla', u'\r\n'),
-	(u'nlu', u'', u'', u'', u'I', u'L', u'Nchumbulu', u'\r\n'),
-	(u'nlv', u'', u'', u'', u'I', u'L', u'Orizaba Nahuatl', u'\r\n'),
-	(u'nlx', u'', u'', u'', u'I', u'L', u'Nahali', u'\r\n'),
-	(u'nly', u'', u'', u'', u'I', u'L', u'Nyamal', u'\r\n'),
-	(u'nlz', u'', u'', u'', u'I', u'L', u'Nal\xf6go', u'\r\n'),
-	(u'nma', u'', u'', u'', u'I', u'L', u'Maram Naga', u'\r\n'),
-	(u'nmb', u'', u'', u'', u'I', u'L', u'Big Nambas', u'\r\n'),
-	(u'nmc', u'', u'', u'', u'I', u'L', u'Ngam', u'\r\n'),
-	(u'nmd', u'', u'', u'', u'I', u'L', u'Ndumu', u'\r\n'),
-	(u'nme', u'', u'', u'', u'I', u'L', u'Mzieme Naga', u'\r\n'),
-	(u'nmf', u'', u'', u'', u'I', u'L', u'Tangkhul Naga', u'\r\n'),
-	(u'nmg', u'', u'', u'', u'I', u'L', u'Kwasio', u'\r\n'),
-	(u'nmh', u'', u'', u'', u'I', u'L', u'Monsang Naga', u'\r\n'),
-	(u'nmi', u'', u'', u'', u'I', u'L', u'Nyam', u'\r\n'),
-	(u'nmj', u'', u'', u'', u'I', u'L', u'Ngombe (Central African Republic)', u'\r\n'),
-	(u'nmk', u'', u'', u'', u'I', u'L', u'Namakura', u'\r\n'),
-	(u'nml', u'', u'', u'', u'I', u'L', u'Ndemli', u'\r\n'),
-	(u'nmm', u'', u'', u'', u'I', u'L', u'Manangba', u'\r\n'),
-	(u'nmn', u'', u'', u'', u'I', u'L', u'!X\xf3\xf5', u'\r\n'),
-	(u'nmo', u'', u'', u'', u'I', u'L', u'Moyon Naga', u'\r\n'),
-	(u'nmp', u'', u'', u'', u'I', u'E', u'Nimanbur', u'\r\n'),
-	(u'nmq', u'', u'', u'', u'I', u'L', u'Nambya', u'\r\n'),
-	(u'nmr', u'', u'', u'', u'I', u'E', u'Nimbari', u'\r\n'),
-	(u'nms', u'', u'', u'', u'I', u'L', u'Letemboi', u'\r\n'),
-	(u'nmt', u'', u'', u'', u'I', u'L', u'Namonuito', u'\r\n'),
-	(u'nmu', u'', u'', u'', u'I', u'L', u'Northeast Maidu', u'\r\n'),
-	(u'nmv', u'', u'', u'', u'I', u'E', u'Ngamini', u'\r\n'),
-	(u'nmw', u'', u'', u'', u'I', u'L', u'Nimoa', u'\r\n'),
-	(u'nmx', u'', u'', u'', u'I', u'L', u'Nama (Papua New Guinea)', u'\r\n'),
-	(u'nmy', u'', u'', u'', u'I', u'L', u'Namuyi', u'\r\n'),
-	(u'nmz', u'', u'', u'', u'I', u'L', u'Nawdm', u'\r\n'),
-	(u'nna', u'', u'', u'', u'I', u'L', u'Nyangumarta', u'\r\n'),
-	(u'nnb', u'', u'', u'', u'I', u'L', u'Nande', u'\r\n'),
-	(u'nnc', u'', u'', u'', u'I', u'L', u'Nancere', u'\r\n'),
-	(u'nnd', u'', u'', u'', u'I', u'L', u'West Ambae', u'\r\n'),
-	(u'nne', u'', u'', u'', u'I', u'L', u'Ngandyera', u'\r\n'),
-	(u'nnf', u'', u'', u'', u'I', u'L', u'Ngaing', u'\r\n'),
-	(u'nng', u'', u'', u'', u'I', u'L', u'Maring Naga', u'\r\n'),
-	(u'nnh', u'', u'', u'', u'I', u'L', u'Ngiemboon', u'\r\n'),
-	(u'nni', u'', u'', u'', u'I', u'L', u'North Nuaulu', u'\r\n'),
-	(u'nnj', u'', u'', u'', u'I', u'L', u'Nyangatom', u'\r\n'),
-	(u'nnk', u'', u'', u'', u'I', u'L', u'Nankina', u'\r\n'),
-	(u'nnl', u'', u'', u'', u'I', u'L', u'Northern Rengma Naga', u'\r\n'),
-	(u'nnm', u'', u'', u'', u'I', u'L', u'Namia', u'\r\n'),
-	(u'nnn', u'', u'', u'', u'I', u'L', u'Ngete', u'\r\n'),
-	(u'nno', u'nno', u'nno', u'nn', u'I', u'L', u'Norwegian Nynorsk', u'\r\n'),
-	(u'nnp', u'', u'', u'', u'I', u'L', u'Wancho Naga', u'\r\n'),
-	(u'nnq', u'', u'', u'', u'I', u'L', u'Ngindo', u'\r\n'),
-	(u'nnr', u'', u'', u'', u'I', u'E', u'Narungga', u'\r\n'),
-	(u'nns', u'', u'', u'', u'I', u'L', u'Ningye', u'\r\n'),
-	(u'nnt', u'', u'', u'', u'I', u'E', u'Nanticoke', u'\r\n'),
-	(u'nnu', u'', u'', u'', u'I', u'L', u'Dwang', u'\r\n'),
-	(u'nnv', u'', u'', u'', u'I', u'E', u'Nugunu (Australia)', u'\r\n'),
-	(u'nnw', u'', u'', u'', u'I', u'L', u'Southern Nuni', u'\r\n'),
-	(u'nnx', u'', u'', u'', u'I', u'L', u'Ngong', u'\r\n'),
-	(u'nny', u'', u'', u'', u'I', u'E', u'Nyangga', u'\r\n'),
-	(u'nnz', u'', u'', u'', u'I', u'L', u"Nda'nda'", u'\r\n'),
-	(u'noa', u'', u'', u'', u'I', u'L', u'Woun Meu', u'\r\n'),
-	(u'nob', u'nob', u'nob', u'nb', u'I', u'L', u'Norwegian Bokm\xe5l', u'\r\n'),
-	(u'noc', u'', u'', u'', u'I', u'L', u'Nuk', u'\r\n'),
-	(u'nod', u'', u'', u'', u'I', u'L', u'Northern Thai', u'\r\n'),
-	(u'noe', u'', u'', u'', u'I', u'L', u'Nimadi', u'\r\n'),
-	(u'nof', u'', u'', u'', u'I', u'L', u'Nomane', u'\r\n'),
-	(u'nog', u'nog', u'nog', u'', u'I', u'L', u'Nogai', u'\r\n'),
-	(u'noh', u'', u'', u'', u'I', u'L', u'Nomu', u'\r\n'),
-	(u'noi', u'', u'', u'', u'I', u'L', u'Noiri', u'\r\n'),
-	(u'noj', u'', u'', u'', u'I', u'L', u'Nonuya', u'\r\n'),
-	(u'nok', u'', u'', u'', u'I', u'E', u'Nooksack', u'\r\n'),
-	(u'nom', u'', u'', u'', u'I', u'E', u'Nocam\xe1n', u'\r\n'),
-	(u'non', u'non', u'non', u'', u'I', u'H', u'Old Norse', u'\r\n'),
-	(u'noo', u'', u'', u'', u'I', u'L', u'Nootka', u'\r\n'),
-	(u'nop', u'', u'', u'', u'I', u'L', u'Numanggang', u'\r\n'),
-	(u'noq', u'', u'', u'', u'I', u'L', u'Ngongo', u'\r\n'),
-	(u'nor', u'nor', u'nor', u'no', u'M', u'L', u'Norwegian', u'\r\n'),
-	(u'nos', u'', u'', u'', u'I', u'L', u'Eastern Nisu', u'\r\n'),
-	(u'not', u'', u'', u'', u'I', u'L', u'Nomatsiguenga', u'\r\n'),
-	(u'nou', u'', u'', u'', u'I', u'L', u'Ewage-Notu', u'\r\n'),
-	(u'nov', u'', u'', u'', u'I', u'C', u'Novial', u'\r\n'),
-	(u'now', u'', u'', u'', u'I', u'L', u'Nyambo', u'\r\n'),
-	(u'noy', u'', u'', u'', u'I', u'L', u'Noy', u'\r\n'),
-	(u'noz', u'', u'', u'', u'I', u'L', u'Nayi', u'\r\n'),
-	(u'npa', u'', u'', u'', u'I', u'L', u'Nar Phu', u'\r\n'),
-	(u'npb', u'', u'', u'', u'I', u'L', u'Nupbikha', u'\r\n'),
-	(u'nph', u'', u'', u'', u'I', u'L', u'Phom Naga', u'\r\n'),
-	(u'npl', u'', u'', u'', u'I', u'L', u'Southeastern Puebla Nahuatl', u'\r\n'),
-	(u'npn', u'', u'', u'', u'I', u'L', u'Mondropolon', u'\r\n'),
-	(u'npo', u'', u'', u'', u'I', u'L', u'Pochuri Naga', u'\r\n'),
-	(u'nps', u'', u'', u'', u'I', u'L', u'Nipsan', u'\r\n'),
-	(u'npu', u'', u'', u'', u'I', u'L', u'Puimei Naga', u'\r\n'),
-	(u'npy', u'', u'', u'', u'I', u'L', u'Napu', u'\r\n'),
-	(u'nqg', u'', u'', u'', u'I', u'L', u'Southern Nago', u'\r\n'),
-	(u'nqk', u'', u'', u'', u'I', u'L', u'Kura Ede Nago', u'\r\n'),
-	(u'nqm', u'', u'', u'', u'I', u'L', u'Ndom', u'\r\n'),
-	(u'nqn', u'', u'', u'', u'I', u'L', u'Nen', u'\r\n'),
-	(u'nqo', u'nqo', u'nqo', u'', u'I', u'L', u"N'Ko", u'\r\n'),
-	(u'nra', u'', u'', u'', u'I', u'L', u'Ngom', u'\r\n'),
-	(u'nrb', u'', u'', u'', u'I', u'L', u'Nara', u'\r\n'),
-	(u'nrc', u'', u'', u'', u'I', u'A', u'Noric', u'\r\n'),
-	(u'nre', u'', u'', u'', u'I', u'L', u'Southern Rengma Naga', u'\r\n'),
-	(u'nrg', u'', u'', u'', u'I', u'L', u'Narango', u'\r\n'),
-	(u'nri', u'', u'', u'', u'I', u'L', u'Chokri Naga', u'\r\n'),
-	(u'nrl', u'', u'', u'', u'I', u'L', u'Ngarluma', u'\r\n'),
-	(u'nrm', u'', u'', u'', u'I', u'L', u'Narom', u'\r\n'),
-	(u'nrn', u'', u'', u'', u'I', u'E', u'Norn', u'\r\n'),
-	(u'nrp', u'', u'', u'', u'I', u'A', u'North Picene', u'\r\n'),
-	(u'nrr', u'', u'', u'', u'I', u'L', u'Norra', u'\r\n'),
-	(u'nrt', u'', u'', u'', u'I', u'E', u'Northern Kalapuya', u'\r\n'),
-	(u'nrx', u'', u'', u'', u'I', u'E', u'Ngurmbur', u'\r\n'),
-	(u'nrz', u'', u'', u'', u'I', u'L', u'Lala', u'\r\n'),
-	(u'nsa', u'', u'', u'', u'I', u'L', u'Sangtam Naga', u'\r\n'),
-	(u'nsc', u'', u'', u'', u'I', u'L', u'Nshi', u'\r\n'),
-	(u'nsd', u'', u'', u'', u'I', u'L', u'Southern Nisu', u'\r\n'),
-	(u'nse', u'', u'', u'', u'I', u'L', u'Nsenga', u'\r\n'),
-	(u'nsg', u'', u'', u'', u'I', u'L', u'Ngasa', u'\r\n'),
-	(u'nsh', u'', u'', u'', u'I', u'L', u'Ngoshie', u'\r\n'),
-	(u'nsi', u'', u'', u'', u'I', u'L', u'Nigerian Sign Language', u'\r\n'),
-	(u'nsk', u'', u'', u'', u'I', u'L', u'Naskapi', u'\r\n'),
-	(u'nsl', u'', u'', u'', u'I', u'L', u'Norwegian Sign Language', u'\r\n'),
-	(u'nsm', u'', u'', u'', u'I', u'L', u'Sumi Naga', u'\r\n'),
-	(u'nsn', u'', u'', u'', u'I', u'L', u'Nehan', u'\r\n'),
-	(u'nso', u'nso', u'nso', u'', u'I', u'L', u'Pedi', u'\r\n'),
-	(u'nsp', u'', u'', u'', u'I', u'L', u'Nepalese Sign Language', u'\r\n'),
-	(u'nsq', u'', u'', u'', u'I', u'L', u'Northern Sierra Miwok', u'\r\n'),
-	(u'nsr', u'', u'', u'', u'I', u'L', u'Maritime Sign Language', u'\r\n'),
-	(u'nss', u'', u'', u'', u'I', u'L', u'Nali', u'\r\n'),
-	(u'nst', u'', u'', u'', u'I', u'L', u'Tase Naga', u'\r\n'),
-	(u'nsu', u'', u'', u'', u'I', u'L', u'Sierra Negra Nahuatl', u'\r\n'),
-	(u'nsv', u'', u'', u'', u'I', u'L', u'Southwestern Nisu', u'\r\n'),
-	(u'nsw', u'', u'', u'', u'I', u'L', u'Navut', u'\r\n'),
-	(u'nsx', u'', u'', u'', u'I', u'L', u'Nsongo', u'\r\n'),
-	(u'nsy', u'', u'', u'', u'I', u'L', u'Nasal', u'\r\n'),
-	(u'nsz', u'', u'', u'', u'I', u'L', u'Nisenan', u'\r\n'),
-	(u'nte', u'', u'', u'', u'I', u'L', u'Nathembo', u'\r\n'),
-	(u'nti', u'', u'', u'', u'I', u'L', u'Natioro', u'\r\n'),
-	(u'ntj', u'', u'', u'', u'I', u'L', u'Ngaanyatjarra', u'\r\n'),
-	(u'ntk', u'', u'', u'', u'I', u'L', u'Ikoma-Nata-Isenye', u'\r\n'),
-	(u'ntm', u'', u'', u'', u'I', u'L', u'Nateni', u'\r\n'),
-	(u'nto', u'', u'', u'', u'I', u'L', u'Ntomba', u'\r\n'),
-	(u'ntp', u'', u'', u'', u'I', u'L', u'Northern Tepehuan', u'\r\n'),
-	(u'ntr', u'', u'', u'', u'I', u'L', u'Delo', u'\r\n'),
-	(u'nts', u'', u'', u'', u'I', u'E', u'Natagaimas', u'\r\n'),
-	(u'ntu', u'', u'', u'', u'I', u'L', u'Nat\xfcgu', u'\r\n'),
-	(u'ntw', u'', u'', u'', u'I', u'E', u'Nottoway', u'\r\n'),
-	(u'nty', u'', u'', u'', u'I', u'L', u'Mantsi', u'\r\n'),
-	(u'ntz', u'', u'', u'', u'I', u'L', u'Natanzi', u'\r\n'),
-	(u'nua', u'', u'', u'', u'I', u'L', u'Yuaga', u'\r\n'),
-	(u'nuc', u'', u'', u'', u'I', u'E', u'Nukuini', u'\r\n'),
-	(u'nud', u'', u'', u'', u'I', u'L', u'Ngala', u'\r\n'),
-	(u'nue', u'', u'', u'', u'I', u'L', u'Ngundu', u'\r\n'),
-	(u'nuf', u'', u'', u'', u'I', u'L', u'Nusu', u'\r\n'),
-	(u'nug', u'', u'', u'', u'I', u'E', u'Nungali', u'\r\n'),
-	(u'nuh', u'', u'', u'', u'I', u'L', u'Ndunda', u'\r\n'),
-	(u'nui', u'', u'', u'', u'I', u'L', u'Ngumbi', u'\r\n'),
-	(u'nuj', u'', u'', u'', u'I', u'L', u'Nyole', u'\r\n'),
-	(u'nul', u'', u'', u'', u'I', u'L', u'Nusa Laut', u'\r\n'),
-	(u'num', u'', u'', u'', u'I', u'L', u"Niuafo'ou", u'\r\n'),
-	(u'nun', u'', u'', u'', u'I', u'L', u'Nung (Myanmar)', u'\r\n'),
-	(u'nuo', u'', u'', u'', u'I', u'L', u'Ngu\xf4n', u'\r\n'),
-	(u'nup', u'', u'', u'', u'I', u'L', u'Nupe-Nupe-Tako', u'\r\n'),
-	(u'nuq', u'', u'', u'', u'I', u'L', u'Nukumanu', u'\r\n'),
-	(u'nur', u'', u'', u'', u'I', u'L', u'Nukuria', u'\r\n'),
-	(u'nus', u'', u'', u'', u'I', u'L', u'Nuer', u'\r\n'),
-	(u'nut', u'', u'', u'', u'I', u'L', u'Nung (Viet Nam)', u'\r\n'),
-	(u'nuu', u'', u'', u'', u'I', u'L', u'Ngbundu', u'\r\n'),
-	(u'nuv', u'', u'', u'', u'I', u'L', u'Northern Nuni', u'\r\n'),
-	(u'nuw', u'', u'', u'', u'I', u'L', u'Nguluwan', u'\r\n'),
-	(u'nux', u'', u'', u'', u'I', u'L', u'Mehek', u'\r\n'),
-	(u'nuy', u'', u'', u'', u'I', u'L', u'Nunggubuyu', u'\r\n'),
-	(u'nuz', u'', u'', u'', u'I', u'L', u'Tlamacazapa Nahuatl', u'\r\n'),
-	(u'nvh', u'', u'', u'', u'I', u'L', u'Nasarian', u'\r\n'),
-	(u'nvm', u'', u'', u'', u'I', u'L', u'Namiae', u'\r\n'),
-	(u'nwa', u'', u'', u'', u'I', u'E', u'Nawathinehena', u'\r\n'),
-	(u'nwb', u'', u'', u'', u'I', u'L', u'Nyabwa', u'\r\n'),
-	(u'nwc', u'nwc', u'nwc', u'', u'I', u'H', u'Classical Newari', u'\r\n'),
-	(u'nwe', u'', u'', u'', u'I', u'L', u'Ngwe', u'\r\n'),
-	(u'nwi', u'', u'', u'', u'I', u'L', u'Southwest Tanna', u'\r\n'),
-	(u'nwm', u'', u'', u'', u'I', u'L', u'Nyamusa-Molo', u'\r\n'),
-	(u'nwr', u'', u'', u'', u'I', u'L', u'Nawaru', u'\r\n'),
-	(u'nwx', u'', u'', u'', u'I', u'H', u'Middle Newar', u'\r\n'),
-	(u'nwy', u'', u'', u'', u'I', u'E', u'Nottoway-Meherrin', u'\r\n'),
-	(u'nxa', u'', u'', u'', u'I', u'L', u'Nauete', u'\r\n'),
-	(u'nxd', u'', u'', u'', u'I', u'L', u'Ngando (Democratic Republic of Congo)', u'\r\n'),
-	(u'nxe', u'', u'', u'', u'I', u'L', u'Nage', u'\r\n'),
-	(u'nxg', u'', u'', u'', u'I', u'L', u"Ngad'a", u'\r\n'),
-	(u'nxi', u'', u'', u'', u'I', u'L', u'Nindi', u'\r\n'),
-	(u'nxl', u'', u'', u'', u'I', u'L', u'South Nuaulu', u'\r\n'),
-	(u'nxm', u'', u'', u'', u'I', u'A', u'Numidian', u'\r\n'),
-	(u'nxn', u'', u'', u'', u'I', u'E', u'Ngawun', u'\r\n'),
-	(u'nxr', u'', u'', u'', u'I', u'L', u'Ninggerum', u'\r\n'),
-	(u'nxu', u'', u'', u'', u'I', u'L', u'Narau', u'\r\n'),
-	(u'nxx', u'', u'', u'', u'I', u'L', u'Nafri', u'\r\n'),
-	(u'nya', u'nya', u'nya', u'ny', u'I', u'L', u'Nyanja', u'\r\n'),
-	(u'nyb', u'', u'', u'', u'I', u'L', u'Nyangbo', u'\r\n'),
-	(u'nyc', u'', u'', u'', u'I', u'L', u'Nyanga-li', u'\r\n'),
-	(u'nyd', u'', u'', u'', u'I', u'L', u'Nyore', u'\r\n'),
-	(u'nye', u'', u'', u'', u'I', u'L', u'Nyengo', u'\r\n'),
-	(u'nyf', u'', u'', u'', u'I', u'L', u'Giryama', u'\r\n'),
-	(u'nyg', u'', u'', u'', u'I', u'L', u'Nyindu', u'\r\n'),
-	(u'nyh', u'', u'', u'', u'I', u'L', u'Nyigina', u'\r\n'),
-	(u'nyi', u'', u'', u'', u'I', u'L', u'Ama (Sudan)', u'\r\n'),
-	(u'nyj', u'', u'', u'', u'I', u'L', u'Nyanga', u'\r\n'),
-	(u'nyk', u'', u'', u'', u'I', u'L', u'Nyaneka', u'\r\n'),
-	(u'nyl', u'', u'', u'', u'I', u'L', u'Nyeu', u'\r\n'),
-	(u'nym', u'nym', u'nym', u'', u'I', u'L', u'Nyamwezi', u'\r\n'),
-	(u'nyn', u'nyn', u'nyn', u'', u'I', u'L', u'Nyankole', u'\r\n'),
-	(u'nyo', u'nyo', u'nyo', u'', u'I', u'L', u'Nyoro', u'\r\n'),
-	(u'nyp', u'', u'', u'', u'I', u'E', u"Nyang'i", u'\r\n'),
-	(u'nyq', u'', u'', u'', u'I', u'L', u'Nayini', u'\r\n'),
-	(u'nyr', u'', u'', u'', u'I', u'L', u'Nyiha (Malawi)', u'\r\n'),
-	(u'nys', u'', u'', u'', u'I', u'L', u'Nyunga', u'\r\n'),
-	(u'nyt', u'', u'', u'', u'I', u'E', u'Nyawaygi', u'\r\n'),
-	(u'nyu', u'', u'', u'', u'I', u'L', u'Nyungwe', u'\r\n'),
-	(u'nyv', u'', u'', u'', u'I', u'E', u'Nyulnyul', u'\r\n'),
-	(u'nyw', u'', u'', u'', u'I', u'L', u'Nyaw', u'\r\n'),
-	(u'nyx', u'', u'', u'', u'I', u'E', u'Nganyaywana', u'\r\n'),
-	(u'nyy', u'', u'', u'', u'I', u'L', u'Nyakyusa-Ngonde', u'\r\n'),
-	(u'nza', u'', u'', u'', u'I', u'L', u'Tigon Mbembe', u'\r\n'),
-	(u'nzb', u'', u'', u'', u'I', u'L', u'Njebi', u'\r\n'),
-	(u'nzi', u'nzi', u'nzi', u'', u'I', u'L', u'Nzima', u'\r\n'),
-	(u'nzk', u'', u'', u'', u'I', u'L', u'Nzakara', u'\r\n'),
-	(u'nzm', u'', u'', u'', u'I', u'L', u'Zeme Naga', u'\r\n'),
-	(u'nzs', u'', u'', u'', u'I', u'L', u'New Zealand Sign Language', u'\r\n'),
-	(u'nzu', u'', u'', u'', u'I', u'L', u'Teke-Nzikou', u'\r\n'),
-	(u'nzy', u'', u'', u'', u'I', u'L', u'Nzakambay', u'\r\n'),
-	(u'nzz', u'', u'', u'', u'I', u'L', u'Nanga Dama Dogon', u'\r\n'),
-	(u'oaa', u'', u'', u'', u'I', u'L', u'Orok', u'\r\n'),
-	(u'oac', u'', u'', u'', u'I', u'L', u'Oroch', u'\r\n'),
-	(u'oar', u'', u'', u'', u'I', u'A', u'Old Aramaic (up to 700 BCE)', u'\r\n'),
-	(u'oav', u'', u'', u'', u'I', u'H', u'Old Avar', u'\r\n'),
-	(u'obi', u'', u'', u'', u'I', u'E', u'Obispe\xf1o', u'\r\n'),
-	(u'obk', u'', u'', u'', u'I', u'L', u'Southern Bontok', u'\r\n'),
-	(u'obl', u'', u'', u'', u'I', u'L', u'Oblo', u'\r\n'),
-	(u'obm', u'', u'', u'', u'I', u'A', u'Moabite', u'\r\n'),
-	(u'obo', u'', u'', u'', u'I', u'L', u'Obo Manobo', u'\r\n'),
-	(u'obr', u'', u'', u'', u'I', u'H', u'Old Burmese', u'\r\n'),
-	(u'obt', u'', u'', u'', u'I', u'H', u'Old Breton', u'\r\n'),
-	(u'obu', u'', u'', u'', u'I', u'L', u'Obulom', u'\r\n'),
-	(u'oca', u'', u'', u'', u'I', u'L', u'Ocaina', u'\r\n'),
-	(u'och', u'', u'', u'', u'I', u'A', u'Old Chinese', u'\r\n'),
-	(u'oci', u'oci', u'oci', u'oc', u'I', u'L', u'Occitan (post 1500)', u'\r\n'),
-	(u'oco', u'', u'', u'', u'I', u'H', u'Old Cornish', u'\r\n'),
-	(u'ocu', u'', u'', u'', u'I', u'L', u'Atzingo Matlatzinca', u'\r\n'),
-	(u'oda', u'', u'', u'', u'I', u'L', u'Odut', u'\r\n'),
-	(u'odk', u'', u'', u'', u'I', u'L', u'Od', u'\r\n'),
-	(u'odt', u'', u'', u'', u'I', u'H', u'Old Dutch', u'\r\n'),
-	(u'odu', u'', u'', u'', u'I', u'L', u'Odual', u'\r\n'),
-	(u'ofo', u'', u'', u'', u'I', u'E', u'Ofo', u'\r\n'),
-	(u'ofs', u'', u'', u'', u'I', u'H', u'Old Frisian', u'\r\n'),
-	(u'ofu', u'', u'', u'', u'I', u'L', u'Efutop', u'\r\n'),
-	(u'ogb', u'', u'', u'', u'I', u'L', u'Ogbia', u'\r\n'),
-	(u'ogc', u'', u'', u'', u'I', u'L', u'Ogbah', u'\r\n'),
-	(u'oge', u'', u'', u'', u'I', u'H', u'Old Georgian', u'\r\n'),
-	(u'ogg', u'', u'', u'', u'I', u'L', u'Ogbogolo', u'\r\n'),
-	(u'ogo', u'', u'', u'', u'I', u'L', u'Khana', u'\r\n'),
-	(u'ogu', u'', u'', u'', u'I', u'L', u'Ogbronuagum', u'\r\n'),
-	(u'oht', u'', u'', u'', u'I', u'A', u'Old Hittite', u'\r\n'),
-	(u'ohu', u'', u'', u'', u'I', u'H', u'Old Hungarian', u'\r\n'),
-	(u'oia', u'', u'', u'', u'I', u'L', u'Oirata', u'\r\n'),
-	(u'oin', u'', u'', u'', u'I', u'L', u'Inebu One', u'\r\n'),
-	(u'ojb', u'', u'', u'', u'I', u'L', u'Northwestern Ojibwa', u'\r\n'),
-	(u'ojc', u'', u'', u'', u'I', u'L', u'Central Ojibwa', u'\r\n'),
-	(u'ojg', u'', u'', u'', u'I', u'L', u'Eastern Ojibwa', u'\r\n'),
-	(u'oji', u'oji', u'oji', u'oj', u'M', u'L', u'Ojibwa', u'\r\n'),
-	(u'ojp', u'', u'', u'', u'I', u'H', u'Old Japanese', u'\r\n'),
-	(u'ojs', u'', u'', u'', u'I', u'L', u'Severn Ojibwa', u'\r\n'),
-	(u'ojv', u'', u'', u'', u'I', u'L', u'Ontong Java', u'\r\n'),
-	(u'ojw', u'', u'', u'', u'I', u'L', u'Western Ojibwa', u'\r\n'),
-	(u'oka', u'', u'', u'', u'I', u'L', u'Okanagan', u'\r\n'),
-	(u'okb', u'', u'', u'', u'I', u'L', u'Okobo', u'\r\n'),
-	(u'okd', u'', u'', u'', u'I', u'L', u'Okodia', u'\r\n'),
-	(u'oke', u'', u'', u'', u'I', u'L', u'Okpe (Southwestern Edo)', u'\r\n'),
-	(u'okh', u'', u'', u'', u'I', u'L', u'Koresh-e Rostam', u'\r\n'),
-	(u'oki', u'', u'', u'', u'I', u'L', u'Okiek', u'\r\n'),
-	(u'okj', u'', u'', u'', u'I', u'E', u'Oko-Juwoi', u'\r\n'),
-	(u'okk', u'', u'', u'', u'I', u'L', u'Kwamtim One', u'\r\n'),
-	(u'okl', u'', u'', u'', u'I', u'E', u'Old Kentish Sign Language', u'\r\n'),
-	(u'okm', u'', u'', u'', u'I', u'H', u'Middle Korean (10th-16th cent.)', u'\r\n'),
-	(u'okn', u'', u'', u'', u'I', u'L', u'Oki-No-Erabu', u'\r\n'),
-	(u'oko', u'', u'', u'', u'I', u'H', u'Old Korean (3rd-9th cent.)', u'\r\n'),
-	(u'okr', u'', u'', u'', u'I', u'L', u'Kirike', u'\r\n'),
-	(u'oks', u'', u'', u'', u'I', u'L', u'Oko-Eni-Osayen', u'\r\n'),
-	(u'oku', u'', u'', u'', u'I', u'L', u'Oku', u'\r\n'),
-	(u'okv', u'', u'', u'', u'I', u'L', u'Orokaiva', u'\r\n'),
-	(u'okx', u'', u'', u'', u'I', u'L', u'Okpe (Northwestern Edo)', u'\r\n'),
-	(u'ola', u'', u'', u'', u'I', u'L', u'Walungge', u'\r\n'),
-	(u'old', u'', u'', u'', u'I', u'L', u'Mochi', u'\r\n'),
-	(u'ole', u'', u'', u'', u'I', u'L', u'Olekha', u'\r\n'),
-	(u'olm', u'', u'', u'', u'I', u'L', u'Oloma', u'\r\n'),
-	(u'olo', u'', u'', u'', u'I', u'L', u'Livvi', u'\r\n'),
-	(u'olr', u'', u'', u'', u'I', u'L', u'Olrat', u'\r\n'),
-	(u'oma', u'', u'', u'', u'I', u'L', u'Omaha-Ponca', u'\r\n'),
-	(u'omb', u'', u'', u'', u'I', u'L', u'East Ambae', u'\r\n'),
-	(u'omc', u'', u'', u'', u'I', u'E', u'Mochica', u'\r\n'),
-	(u'ome', u'', u'', u'', u'I', u'E', u'Omejes', u'\r\n'),
-	(u'omg', u'', u'', u'', u'I', u'L', u'Omagua', u'\r\n'),
-	(u'omi', u'', u'', u'', u'I', u'L', u'Omi', u'\r\n'),
-	(u'omk', u'', u'', u'', u'I', u'E', u'Omok', u'\r\n'),
-	(u'oml', u'', u'', u'', u'I', u'L', u'Ombo', u'\r\n'),
-	(u'omn', u'', u'', u'', u'I', u'A', u'Minoan', u'\r\n'),
-	(u'omo', u'', u'', u'', u'I', u'L', u'Utarmbung', u'\r\n'),
-	(u'omp', u'', u'', u'', u'I', u'H', u'Old Manipuri', u'\r\n'),
-	(u'omr', u'', u'', u'', u'I', u'H', u'Old Marathi', u'\r\n'),
-	(u'omt', u'', u'', u'', u'I', u'L', u'Omotik', u'\r\n'),
-	(u'omu', u'', u'', u'', u'I', u'E', u'Omurano', u'\r\n'),
-	(u'omw', u'', u'', u'', u'I', u'L', u'South Tairora', u'\r\n'),
-	(u'omx', u'', u'', u'', u'I', u'H', u'Old Mon', u'\r\n'),
-	(u'ona', u'', u'', u'', u'I', u'L', u'Ona', u'\r\n'),
-	(u'onb', u'', u'', u'', u'I', u'L', u'Lingao', u'\r\n'),
-	(u'one', u'', u'', u'', u'I', u'L', u'Oneida', u'\r\n'),
-	(u'ong', u'', u'', u'', u'I', u'L', u'Olo', u'\r\n'),
-	(u'oni', u'', u'', u'', u'I', u'L', u'Onin', u'\r\n'),
-	(u'onj', u'', u'', u'', u'I', u'L', u'Onjob', u'\r\n'),
-	(u'onk', u'', u'', u'', u'I', u'L', u'Kabore One', u'\r\n'),
-	(u'onn', u'', u'', u'', u'I', u'L', u'Onobasulu', u'\r\n'),
-	(u'ono', u'', u'', u'', u'I', u'L', u'Onondaga', u'\r\n'),
-	(u'onp', u'', u'', u'', u'I', u'L', u'Sartang', u'\r\n'),
-	(u'onr', u'', u'', u'', u'I', u'L', u'Northern One', u'\r\n'),
-	(u'ons', u'', u'', u'', u'I', u'L', u'Ono', u'\r\n'),
-	(u'ont', u'', u'', u'', u'I', u'L', u'Ontenu', u'\r\n'),
-	(u'onu', u'', u'', u'', u'I', u'L', u'Unua', u'\r\n'),
-	(u'onw', u'', u'', u'', u'I', u'H', u'Old Nubian', u'\r\n'),
-	(u'onx', u'', u'', u'', u'I', u'L', u'Onin Based Pidgin', u'\r\n'),
-	(u'ood', u'', u'', u'', u'I', u'L', u"Tohono O'odham", u'\r\n'),
-	(u'oog', u'', u'', u'', u'I', u'L', u'Ong', u'\r\n'),
-	(u'oon', u'', u'', u'', u'I', u'L', u'\xd6nge', u'\r\n'),
-	(u'oor', u'', u'', u'', u'I', u'L', u'Oorlams', u'\r\n'),
-	(u'oos', u'', u'', u'', u'I', u'A', u'Old Ossetic', u'\r\n'),
-	(u'opa', u'', u'', u'', u'I', u'L', u'Okpamheri', u'\r\n'),
-	(u'opk', u'', u'', u'', u'I', u'L', u'Kopkaka', u'\r\n'),
-	(u'opm', u'', u'', u'', u'I', u'L', u'Oksapmin', u'\r\n'),
-	(u'opo', u'', u'', u'', u'I', u'L', u'Opao', u'\r\n'),
-	(u'opt', u'', u'', u'', u'I', u'E', u'Opata', u'\r\n'),
-	(u'opy', u'', u'', u'', u'I', u'L', u'Ofay\xe9', u'\r\n'),
-	(u'ora', u'', u'', u'', u'I', u'L', u'Oroha', u'\r\n'),
-	(u'orc', u'', u'', u'', u'I', u'L', u'Orma', u'\r\n'),
-	(u'ore', u'', u'', u'', u'I', u'L', u'Orej\xf3n', u'\r\n'),
-	(u'org', u'', u'', u'', u'I', u'L', u'Oring', u'\r\n'),
-	(u'orh', u'', u'', u'', u'I', u'L', u'Oroqen', u'\r\n'),
-	(u'ori', u'ori', u'ori', u'or', u'I', u'L', u'Oriya', u'\r\n'),
-	(u'orm', u'orm', u'orm', u'om', u'M', u'L', u'Oromo', u'\r\n'),
-	(u'orn', u'', u'', u'', u'I', u'L', u'Orang Kanaq', u'\r\n'),
-	(u'oro', u'', u'', u'', u'I', u'L', u'Orokolo', u'\r\n'),
-	(u'orr', u'', u'', u'', u'I', u'L', u'Oruma', u'\r\n'),
-	(u'ors', u'', u'', u'', u'I', u'L', u'Orang Seletar', u'\r\n'),
-	(u'ort', u'', u'', u'', u'I', u'L', u'Adivasi Oriya', u'\r\n'),
-	(u'oru', u'', u'', u'', u'I', u'L', u'Ormuri', u'\r\n'),
-	(u'orv', u'', u'', u'', u'I', u'H', u'Old Russian', u'\r\n'),
-	(u'orw', u'', u'', u'', u'I', u'L', u'Oro Win', u'\r\n'),
-	(u'orx', u'', u'', u'', u'I', u'L', u'Oro', u'\r\n'),
-	(u'orz', u'', u'', u'', u'I', u'L', u'Ormu', u'\r\n'),
-	(u'osa', u'osa', u'osa', u'', u'I', u'L', u'Osage', u'\r\n'),
-	(u'osc', u'', u'', u'', u'I', u'A', u'Oscan', u'\r\n'),
-	(u'osi', u'', u'', u'', u'I', u'L', u'Osing', u'\r\n'),
-	(u'oso', u'', u'', u'', u'I', u'L', u'Ososo', u'\r\n'),
-	(u'osp', u'', u'', u'', u'I', u'H', u'Old Spanish', u'\r\n'),
-	(u'oss', u'oss', u'oss', u'os', u'I', u'L', u'Ossetian', u'\r\n'),
-	(u'ost', u'', u'', u'', u'I', u'L', u'Osatu', u'\r\n'),
-	(u'osu', u'', u'', u'', u'I', u'L', u'Southern One', u'\r\n'),
-	(u'osx', u'', u'', u'', u'I', u'H', u'Old Saxon', u'\r\n'),
-	(u'ota', u'ota', u'ota', u'', u'I', u'H', u'Ottoman Turkish (1500-1928)', u'\r\n'),
-	(u'otb', u'', u'', u'', u'I', u'H', u'Old Tibetan', u'\r\n'),
-	(u'otd', u'', u'', u'', u'I', u'L', u'Ot Danum', u'\r\n'),
-	(u'ote', u'', u'', u'', u'I', u'L', u'Mezquital Otomi', u'\r\n'),
-	(u'oti', u'', u'', u'', u'I', u'E', u'Oti', u'\r\n'),
-	(u'otk', u'', u'', u'', u'I', u'H', u'Old Turkish', u'\r\n'),
-	(u'otl', u'', u'', u'', u'I', u'L', u'Tilapa Otomi', u'\r\n'),
-	(u'otm', u'', u'', u'', u'I', u'L', u'Eastern Highland Otomi', u'\r\n'),
-	(u'otn', u'', u'', u'', u'I', u'L', u'Tenango Otomi', u'\r\n'),
-	(u'otq', u'', u'', u'', u'I', u'L', u'Quer\xe9taro Otomi', u'\r\n'),
-	(u'otr', u'', u'', u'', u'I', u'L', u'Otoro', u'\r\n'),
-	(u'ots', u'', u'', u'', u'I', u'L', u'Estado de M\xe9xico Otomi', u'\r\n'),
-	(u'ott', u'', u'', u'', u'I', u'L', u'Temoaya Otomi', u'\r\n'),
-	(u'otu', u'', u'', u'', u'I', u'E', u'Otuke', u'\r\n'),
-	(u'otw', u'', u'', u'', u'I', u'L', u'Ottawa', u'\r\n'),
-	(u'otx', u'', u'', u'', u'I', u'L', u'Texcatepec Otomi', u'\r\n'),
-	(u'oty', u'', u'', u'', u'I', u'A', u'Old Tamil', u'\r\n'),
-	(u'otz', u'', u'', u'', u'I', u'L', u'Ixtenco Otomi', u'\r\n'),
-	(u'oua', u'', u'', u'', u'I', u'L', u'Tagargrent', u'\r\n'),
-	(u'oub', u'', u'', u'', u'I', u'L', u'Glio-Oubi', u'\r\n'),
-	(u'oue', u'', u'', u'', u'I', u'L', u'Ounge', u'\r\n'),
-	(u'oui', u'', u'', u'', u'I', u'H', u'Old Uighur', u'\r\n'),
-	(u'oum', u'', u'', u'', u'I', u'E', u'Ouma', u'\r\n'),
-	(u'oun', u'', u'', u'', u'I', u'L', u'!O!ung', u'\r\n'),
-	(u'owi', u'', u'', u'', u'I', u'L', u'Owiniga', u'\r\n'),
-	(u'owl', u'', u'', u'', u'I', u'H', u'Old Welsh', u'\r\n'),
-	(u'oyb', u'', u'', u'', u'I', u'L', u'Oy', u'\r\n'),
-	(u'oyd', u'', u'', u'', u'I', u'L', u'Oyda', u'\r\n'),
-	(u'oym', u'', u'', u'', u'I', u'L', u'Wayampi', u'\r\n'),
-	(u'oyy', u'', u'', u'', u'I', u'L', u"Oya'oya", u'\r\n'),
-	(u'ozm', u'', u'', u'', u'I', u'L', u'Koonzime', u'\r\n'),
-	(u'pab', u'', u'', u'', u'I', u'L', u'Parec\xeds', u'\r\n'),
-	(u'pac', u'', u'', u'', u'I', u'L', u'Pacoh', u'\r\n'),
-	(u'pad', u'', u'', u'', u'I', u'L', u'Paumar\xed', u'\r\n'),
-	(u'pae', u'', u'', u'', u'I', u'L', u'Pagibete', u'\r\n'),
-	(u'paf', u'', u'', u'', u'I', u'E', u'Paranaw\xe1t', u'\r\n'),
-	(u'pag', u'pag', u'pag', u'', u'I', u'L', u'Pangasinan', u'\r\n'),
-	(u'pah', u'', u'', u'', u'I', u'L', u'Tenharim', u'\r\n'),
-	(u'pai', u'', u'', u'', u'I', u'L', u'Pe', u'\r\n'),
-	(u'pak', u'', u'', u'', u'I', u'L', u'Parakan\xe3', u'\r\n'),
-	(u'pal', u'pal', u'pal', u'', u'I', u'A', u'Pahlavi', u'\r\n'),
-	(u'pam', u'pam', u'pam', u'', u'I', u'L', u'Pampanga', u'\r\n'),
-	(u'pan', u'pan', u'pan', u'pa', u'I', u'L', u'Panjabi', u'\r\n'),
-	(u'pao', u'', u'', u'', u'I', u'L', u'Northern Paiute', u'\r\n'),
-	(u'pap', u'pap', u'pap', u'', u'I', u'L', u'Papiamento', u'\r\n'),
-	(u'paq', u'', u'', u'', u'I', u'L', u'Parya', u'\r\n'),
-	(u'par', u'', u'', u'', u'I', u'L', u'Panamint', u'\r\n'),
-	(u'pas', u'', u'', u'', u'I', u'L', u'Papasena', u'\r\n'),
-	(u'pat', u'', u'', u'', u'I', u'L', u'Papitalai', u'\r\n'),
-	(u'pau', u'pau', u'pau', u'', u'I', u'L', u'Palauan', u'\r\n'),
-	(u'pav', u'', u'', u'', u'I', u'L', u'Paka\xe1snovos', u'\r\n'),
-	(u'paw', u'', u'', u'', u'I', u'L', u'Pawnee', u'\r\n'),
-	(u'pax', u'', u'', u'', u'I', u'E', u'Pankarar\xe9', u'\r\n'),
-	(u'pay', u'', u'', u'', u'I', u'L', u'Pech', u'\r\n'),
-	(u'paz', u'', u'', u'', u'I', u'E', u'Pankarar\xfa', u'\r\n'),
-	(u'pbb', u'', u'', u'', u'I', u'L', u'P\xe1ez', u'\r\n'),
-	(u'pbc', u'', u'', u'', u'I', u'L', u'Patamona', u'\r\n'),
-	(u'pbe', u'', u'', u'', u'I', u'L', u'Mezontla Popoloca', u'\r\n'),
-	(u'pbf', u'', u'', u'', u'I', u'L', u'Coyotepec Popoloca', u'\r\n'),
-	(u'pbg', u'', u'', u'', u'I', u'E', u'Paraujano', u'\r\n'),
-	(u'pbh', u'', u'', u'', u'I', u'L', u"E'\xf1apa Woromaipu", u'\r\n'),
-	(u'pbi', u'', u'', u'', u'I', u'L', u'Parkwa', u'\r\n'),
-	(u'pbl', u'', u'', u'', u'I', u'L', u'Mak (Nigeria)', u'\r\n'),
-	(u'pbn', u'', u'', u'', u'I', u'L', u'Kpasam', u'\r\n'),
-	(u'pbo', u'', u'', u'', u'I', u'L', u'Papel', u'\r\n'),
-	(u'pbp', u'', u'', u'', u'I', u'L', u'Badyara', u'\r\n'),
-	(u'pbr', u'', u'', u'', u'I', u'L', u'Pangwa', u'\r\n'),
-	(u'pbs', u'', u'', u'', u'I', u'L', u'Central Pame', u'\r\n'),
-	(u'pbt', u'', u'', u'', u'I', u'L', u'Southern Pashto', u'\r\n'),
-	(u'pbu', u'', u'', u'', u'I', u'L', u'Northern Pashto', u'\r\n'),
-	(u'pbv', u'', u'', u'', u'I', u'L', u'Pnar', u'\r\n'),
-	(u'pby', u'', u'', u'', u'I', u'L', u'Pyu', u'\r\n'),
-	(u'pbz', u'', u'', u'', u'I', u'L', u'Palu', u'\r\n'),
-	(u'pca', u'', u'', u'', u'I', u'L', u'Santa In\xe9s Ahuatempan Popoloca', u'\r\n'),
-	(u'pcb', u'', u'', u'', u'I', u'L', u'Pear', u'\r\n'),
-	(u'pcc', u'', u'', u'', u'I', u'L', u'Bouyei', u'\r\n'),
-	(u'pcd', u'', u'', u'', u'I', u'L', u'Picard', u'\r\n'),
-	(u'pce', u'', u'', u'', u'I', u'L', u'Ruching Palaung', u'\r\n'),
-	(u'pcf', u'', u'', u'', u'I', u'L', u'Paliyan', u'\r\n'),
-	(u'pcg', u'', u'', u'', u'I', u'L', u'Paniya', u'\r\n'),
-	(u'pch', u'', u'', u'', u'I', u'L', u'Pardhan', u'\r\n'),
-	(u'pci', u'', u'', u'', u'I', u'L', u'Duruwa', u'\r\n'),
-	(u'pcj', u'', u'', u'', u'I', u'L', u'Parenga', u'\r\n'),
-	(u'pck', u'', u'', u'', u'I', u'L', u'Paite Chin', u'\r\n'),
-	(u'pcl', u'', u'', u'', u'I', u'L', u'Pardhi', u'\r\n'),
-	(u'pcm', u'', u'', u'', u'I', u'L', u'Nigerian Pidgin', u'\r\n'),
-	(u'pcn', u'', u'', u'', u'I', u'L', u'Piti', u'\r\n'),
-	(u'pcp', u'', u'', u'', u'I', u'L', u'Pacahuara', u'\r\n'),
-	(u'pcr', u'', u'', u'', u'I', u'L', u'Panang', u'\r\n'),
-	(u'pcw', u'', u'', u'', u'I', u'L', u'Pyapun', u'\r\n'),
-	(u'pda', u'', u'', u'', u'I', u'L', u'Anam', u'\r\n'),
-	(u'pdc', u'', u'', u'', u'I', u'L', u'Pennsylvania German', u'\r\n'),
-	(u'pdi', u'', u'', u'', u'I', u'L', u'Pa Di', u'\r\n'),
-	(u'pdn', u'', u'', u'', u'I', u'L', u'Podena', u'\r\n'),
-	(u'pdo', u'', u'', u'', u'I', u'L', u'Padoe', u'\r\n'),
-	(u'pdt', u'', u'', u'', u'I', u'L', u'Plautdietsch', u'\r\n'),
-	(u'pdu', u'', u'', u'', u'I', u'L', u'Kayan', u'\r\n'),
-	(u'pea', u'', u'', u'', u'I', u'L', u'Peranakan Indonesian', u'\r\n'),
-	(u'peb', u'', u'', u'', u'I', u'E', u'Eastern Pomo', u'\r\n'),
-	(u'ped', u'', u'', u'', u'I', u'L', u'Mala (Papua New Guinea)', u'\r\n'),
-	(u'pee', u'', u'', u'', u'I', u'L', u'Taje', u'\r\n'),
-	(u'pef', u'', u'', u'', u'I', u'E', u'Northeastern Pomo', u'\r\n'),
-	(u'peg', u'', u'', u'', u'I', u'L', u'Pengo', u'\r\n'),
-	(u'peh', u'', u'', u'', u'I', u'L', u'Bonan', u'\r\n'),
-	(u'pei', u'', u'', u'', u'I', u'L', u'Chichimeca-Jonaz', u'\r\n'),
-	(u'pej', u'', u'', u'', u'I', u'E', u'Northern Pomo', u'\r\n'),
-	(u'pek', u'', u'', u'', u'I', u'L', u'Penchal', u'\r\n'),
-	(u'pel', u'', u'', u'', u'I', u'L', u'Pekal', u'\r\n'),
-	(u'pem', u'', u'', u'', u'I', u'L', u'Phende', u'\r\n'),
-	(u'peo', u'peo', u'peo', u'', u'I', u'H', u'Old Persian (ca. 600-400 B.C.)', u'\r\n'),
-	(u'pep', u'', u'', u'', u'I', u'L', u'Kunja', u'\r\n'),
-	(u'peq', u'', u'', u'', u'I', u'L', u'Southern Pomo', u'\r\n'),
-	(u'pes', u'', u'', u'', u'I', u'L', u'Iranian Persian', u'\r\n'),
-	(u'pev', u'', u'', u'', u'I', u'L', u'P\xe9mono', u'\r\n'),
-	(u'pex', u'', u'', u'', u'I', u'L', u'Petats', u'\r\n'),
-	(u'pey', u'', u'', u'', u'I', u'L', u'Petjo', u'\r\n'),
-	(u'pez', u'', u'', u'', u'I', u'L', u'Eastern Penan', u'\r\n'),
-	(u'pfa', u'', u'', u'', u'I', u'L', u'P\xe1\xe1fang', u'\r\n'),
-	(u'pfe', u'', u'', u'', u'I', u'L', u'Peere', u'\r\n'),
-	(u'pfl', u'', u'', u'', u'I', u'L', u'Pfaelzisch', u'\r\n'),
-	(u'pga', u'', u'', u'', u'I', u'L', u'Sudanese Creole Arabic', u'\r\n'),
-	(u'pgg', u'', u'', u'', u'I', u'L', u'Pangwali', u'\r\n'),
-	(u'pgi', u'', u'', u'', u'I', u'L', u'Pagi', u'\r\n'),
-	(u'pgk', u'', u'', u'', u'I', u'L', u'Rerep', u'\r\n'),
-	(u'pgn', u'', u'', u'', u'I', u'A', u'Paelignian', u'\r\n'),
-	(u'pgs', u'', u'', u'', u'I', u'L', u'Pangseng', u'\r\n'),
-	(u'pgu', u'', u'', u'', u'I', u'L', u'Pagu', u'\r\n'),
-	(u'pgy', u'', u'', u'', u'I', u'L', u'Pongyong', u'\r\n'),
-	(u'pha', u'', u'', u'', u'I', u'L', u'Pa-Hng', u'\r\n'),
-	(u'phd', u'', u'', u'', u'I', u'L', u'Phudagi', u'\r\n'),
-	(u'phg', u'', u'', u'', u'I', u'L', u'Phuong', u'\r\n'),
-	(u'phh', u'', u'', u'', u'I', u'L', u'Phukha', u'\r\n'),
-	(u'phk', u'', u'', u'', u'I', u'L', u'Phake', u'\r\n'),
-	(u'phl', u'', u'', u'', u'I', u'L', u'Phalura', u'\r\n'),
-	(u'phm', u'', u'', u'', u'I', u'L', u'Phimbi', u'\r\n'),
-	(u'phn', u'phn', u'phn', u'', u'I', u'A', u'Phoenician', u'\r\n'),
-	(u'pho', u'', u'', u'', u'I', u'L', u'Phunoi', u'\r\n'),
-	(u'phq', u'', u'', u'', u'I', u'L', u"Phana'", u'\r\n'),
-	(u'phr', u'', u'', u'', u'I', u'L', u'Pahari-Potwari', u'\r\n'),
-	(u'pht', u'', u'', u'', u'I', u'L', u'Phu Thai', u'\r\n'),
-	(u'phu', u'', u'', u'', u'I', u'L', u'Phuan', u'\r\n'),
-	(u'phv', u'', u'', u'', u'I', u'L', u'Pahlavani', u'\r\n'),
-	(u'phw', u'', u'', u'', u'I', u'L', u'Phangduwali', u'\r\n'),
-	(u'pia', u'', u'', u'', u'I', u'L', u'Pima Bajo', u'\r\n'),
-	(u'pib', u'', u'', u'', u'I', u'L', u'Yine', u'\r\n'),
-	(u'pic', u'', u'', u'', u'I', u'L', u'Pinji', u'\r\n'),
-	(u'pid', u'', u'', u'', u'I', u'L', u'Piaroa', u'\r\n'),
-	(u'pie', u'', u'', u'', u'I', u'E', u'Piro', u'\r\n'),
-	(u'pif', u'', u'', u'', u'I', u'L', u'Pingelapese', u'\r\n'),
-	(u'pig', u'', u'', u'', u'I', u'L', u'Pisabo', u'\r\n'),
-	(u'pih', u'', u'', u'', u'I', u'L', u'Pitcairn-Norfolk', u'\r\n'),
-	(u'pii', u'', u'', u'', u'I', u'L', u'Pini', u'\r\n'),
-	(u'pij', u'', u'', u'', u'I', u'E', u'Pijao', u'\r\n'),
-	(u'pil', u'', u'', u'', u'I', u'L', u'Yom', u'\r\n'),
-	(u'pim', u'', u'', u'', u'I', u'E', u'Powhatan', u'\r\n'),
-	(u'pin', u'', u'', u'', u'I', u'L', u'Piame', u'\r\n'),
-	(u'pio', u'', u'', u'', u'I', u'L', u'Piapoco', u'\r\n'),
-	(u'pip', u'', u'', u'', u'I', u'L', u'Pero', u'\r\n'),
-	(u'pir', u'', u'', u'', u'I', u'L', u'Piratapuyo', u'\r\n'),
-	(u'pis', u'', u'', u'', u'I', u'L', u'Pijin', u'\r\n'),
-	(u'pit', u'', u'', u'', u'I', u'E', u'Pitta Pitta', u'\r\n'),
-	(u'piu', u'', u'', u'', u'I', u'L', u'Pintupi-Luritja', u'\r\n'),
-	(u'piv', u'', u'', u'', u'I', u'L', u'Pileni', u'\r\n'),
-	(u'piw', u'', u'', u'', u'I', u'L', u'Pimbwe', u'\r\n'),
-	(u'pix', u'', u'', u'', u'I', u'L', u'Piu', u'\r\n'),
-	(u'piy', u'', u'', u'', u'I', u'L', u'Piya-Kwonci', u'\r\n'),
-	(u'piz', u'', u'', u'', u'I', u'L', u'Pije', u'\r\n'),
-	(u'pjt', u'', u'', u'', u'I', u'L', u'Pitjantjatjara', u'\r\n'),
-	(u'pka', u'', u'', u'', u'I', u'H', u'Ardham\u0101gadh\u012b Pr\u0101krit', u'\r\n'),
-	(u'pkb', u'', u'', u'', u'I', u'L', u'Pokomo', u'\r\n'),
-	(u'pkc', u'', u'', u'', u'I', u'E', u'Paekche', u'\r\n'),
-	(u'pkg', u'', u'', u'', u'I', u'L', u'Pak-Tong', u'\r\n'),
-	(u'pkh', u'', u'', u'', u'I', u'L', u'Pankhu', u'\r\n'),
-	(u'pkn', u'', u'', u'', u'I', u'L', u'Pakanha', u'\r\n'),
-	(u'pko', u'', u'', u'', u'I', u'L', u'P\xf6koot', u'\r\n'),
-	(u'pkp', u'', u'', u'', u'I', u'L', u'Pukapuka', u'\r\n'),
-	(u'pkr', u'', u'', u'', u'I', u'L', u'Attapady Kurumba', u'\r\n'),
-	(u'pks', u'', u'', u'', u'I', u'L', u'Pakistan Sign Language', u'\r\n'),
-	(u'pkt', u'', u'', u'', u'I', u'L', u'Maleng', u'\r\n'),
-	(u'pku', u'', u'', u'', u'I', u'L', u'Paku', u'\r\n'),
-	(u'pla', u'', u'', u'', u'I', u'L', u'Miani', u'\r\n'),
-	(u'plb', u'', u'', u'', u'I', u'L', u'Polonombauk', u'\r\n'),
-	(u'plc', u'', u'', u'', u'I', u'L', u'Central Palawano', u'\r\n'),
-	(u'pld', u'', u'', u'', u'I', u'L', u'Polari', u'\r\n'),
-	(u'ple', u'', u'', u'', u'I', u'L', u"Palu'e", u'\r\n'),
-	(u'plg', u'', u'', u'', u'I', u'L', u'Pilag\xe1', u'\r\n'),
-	(u'plh', u'', u'', u'', u'I', u'L', u'Paulohi', u'\r\n'),
-	(u'pli', u'pli', u'pli', u'pi', u'I', u'A', u'Pali', u'\r\n'),
-	(u'plj', u'', u'', u'', u'I', u'L', u'Polci', u'\r\n'),
-	(u'plk', u'', u'', u'', u'I', u'L', u'Kohistani Shina', u'\r\n'),
-	(u'pll', u'', u'', u'', u'I', u'L', u'Shwe Palaung', u'\r\n'),
-	(u'pln', u'', u'', u'', u'I', u'L', u'Palenquero', u'\r\n'),
-	(u'plo', u'', u'', u'', u'I', u'L', u'Oluta Popoluca', u'\r\n'),
-	(u'plp', u'', u'', u'', u'I', u'L', u'Palpa', u'\r\n'),
-	(u'plq', u'', u'', u'', u'I', u'A', u'Palaic', u'\r\n'),
-	(u'plr', u'', u'', u'', u'I', u'L', u'Palaka Senoufo', u'\r\n'),
-	(u'pls', u'', u'', u'', u'I', u'L', u'San Marcos Tlalcoyalco Popoloca', u'\r\n'),
-	(u'plt', u'', u'', u'', u'I', u'L', u'Plateau Malagasy', u'\r\n'),
-	(u'plu', u'', u'', u'', u'I', u'L', u'Palik\xfar', u'\r\n'),
-	(u'plv', u'', u'', u'', u'I', u'L', u'Southwest Palawano', u'\r\n'),
-	(u'plw', u'', u'', u'', u'I', u'L', u"Brooke's Point Palawano", u'\r\n'),
-	(u'ply', u'', u'', u'', u'I', u'L', u'Bolyu', u'\r\n'),
-	(u'plz', u'', u'', u'', u'I', u'L', u'Paluan', u'\r\n'),
-	(u'pma', u'', u'', u'', u'I', u'L', u'Paama', u'\r\n'),
-	(u'pmb', u'', u'', u'', u'I', u'L', u'Pambia', u'\r\n'),
-	(u'pmc', u'', u'', u'', u'I', u'E', u'Palumata', u'\r\n'),
-	(u'pme', u'', u'', u'', u'I', u'L', u'Pwaamei', u'\r\n'),
-	(u'pmf', u'', u'', u'', u'I', u'L', u'Pamona', u'\r\n'),
-	(u'pmh', u'', u'', u'', u'I', u'H', u'M\u0101h\u0101r\u0101\u1e63\u1e6dri Pr\u0101krit', u'\r\n'),
-	(u'pmi', u'', u'', u'', u'I', u'L', u'Northern Pumi', u'\r\n'),
-	(u'pmj', u'', u'', u'', u'I', u'L', u'Southern Pumi', u'\r\n'),
-	(u'pmk', u'', u'', u'', u'I', u'E', u'Pamlico', u'\r\n'),
-	(u'pml', u'', u'', u'', u'I', u'E', u'Lingua Franca', u'\r\n'),
-	(u'pmm', u'', u'', u'', u'I', u'L', u'Pomo', u'\r\n'),
-	(u'pmn', u'', u'', u'', u'I', u'L', u'Pam', u'\r\n'),
-	(u'pmo', u'', u'', u'', u'I', u'L', u'Pom', u'\r\n'),
-	(u'pmq', u'', u'', u'', u'I', u'L', u'Northern Pame', u'\r\n'),
-	(u'pmr', u'', u'', u'', u'I', u'L', u'Paynamar', u'\r\n'),
-	(u'pms', u'', u'', u'', u'I', u'L', u'Piemontese', u'\r\n'),
-	(u'pmt', u'', u'', u'', u'I', u'L', u'Tuamotuan', u'\r\n'),
-	(u'pmu', u'', u'', u'', u'I', u'L', u'Mirpur Panjabi', u'\r\n'),
-	(u'pmw', u'', u'', u'', u'I', u'L', u'Plains Miwok', u'\r\n'),
-	(u'pmx', u'', u'', u'', u'I', u'L', u'Poumei Naga', u'\r\n'),
-	(u'pmy', u'', u'', u'', u'I', u'L', u'Papuan Malay', u'\r\n'),
-	(u'pmz', u'', u'', u'', u'I', u'E', u'Southern Pame', u'\r\n'),
-	(u'pna', u'', u'', u'', u'I', u'L', u'Punan Bah-Biau', u'\r\n'),
-	(u'pnb', u'', u'', u'', u'I', u'L', u'Western Panjabi', u'\r\n'),
-	(u'pnc', u'', u'', u'', u'I', u'L', u'Pannei', u'\r\n'),
-	(u'pne', u'', u'', u'', u'I', u'L', u'Western Penan', u'\r\n'),
-	(u'png', u'', u'', u'', u'I', u'L', u'Pongu', u'\r\n'),
-	(u'pnh', u'', u'', u'', u'I', u'L', u'Penrhyn', u'\r\n'),
-	(u'pni', u'', u'', u'', u'I', u'L', u'Aoheng', u'\r\n'),
-	(u'pnm', u'', u'', u'', u'I', u'L', u'Punan Batu 1', u'\r\n'),
-	(u'pnn', u'', u'', u'', u'I', u'L', u'Pinai-Hagahai', u'\r\n'),
-	(u'pno', u'', u'', u'', u'I', u'E', u'Panobo', u'\r\n'),
-	(u'pnp', u'', u'', u'', u'I', u'L', u'Pancana', u'\r\n'),
-	(u'pnq', u'', u'', u'', u'I', u'L', u'Pana (Burkina Faso)', u'\r\n'),
-	(u'pnr', u'', u'', u'', u'I', u'L', u'Panim', u'\r\n'),
-	(u'pns', u'', u'', u'', u'I', u'L', u'Ponosakan', u'\r\n'),
-	(u'pnt', u'', u'', u'', u'I', u'L', u'Pontic', u'\r\n'),
-	(u'pnu', u'', u'', u'', u'I', u'L', u'Jiongnai Bunu', u'\r\n'),
-	(u'pnv', u'', u'', u'', u'I', u'L', u'Pinigura', u'\r\n'),
-	(u'pnw', u'', u'', u'', u'I', u'L', u'Panytyima', u'\r\n'),
-	(u'pnx', u'', u'', u'', u'I', u'L', u'Phong-Kniang', u'\r\n'),
-	(u'pny', u'', u'', u'', u'I', u'L', u'Pinyin', u'\r\n'),
-	(u'pnz', u'', u'', u'', u'I', u'L', u'Pana (Central African Republic)', u'\r\n'),
-	(u'poc', u'', u'', u'', u'I', u'L', u'Poqomam', u'\r\n'),
-	(u'pod', u'', u'', u'', u'I', u'E', u'Ponares', u'\r\n'),
-	(u'poe', u'', u'', u'', u'I', u'L', u'San Juan Atzingo Popoloca', u'\r\n'),
-	(u'pof', u'', u'', u'', u'I', u'L', u'Poke', u'\r\n'),
-	(u'pog', u'', u'', u'', u'I', u'E', u'Potigu\xe1ra', u'\r\n'),
-	(u'poh', u'', u'', u'', u'I', u'L', u"Poqomchi'", u'\r\n'),
-	(u'poi', u'', u'', u'', u'I', u'L', u'Highland Popoluca', u'\r\n'),
-	(u'pok', u'', u'', u'', u'I', u'L', u'Pokang\xe1', u'\r\n'),
-	(u'pol', u'pol', u'pol', u'pl', u'I', u'L', u'Polish', u'\r\n'),
-	(u'pom', u'', u'', u'', u'I', u'L', u'Southeastern Pomo', u'\r\n'),
-	(u'pon', u'pon', u'pon', u'', u'I', u'L', u'Pohnpeian', u'\r\n'),
-	(u'poo', u'', u'', u'', u'I', u'L', u'Central Pomo', u'\r\n'),
-	(u'pop', u'', u'', u'', u'I', u'L', u'Pwapwa', u'\r\n'),
-	(u'poq', u'', u'', u'', u'I', u'L', u'Texistepec Popoluca', u'\r\n'),
-	(u'por', u'por', u'por', u'pt', u'I', u'L', u'Portuguese', u'\r\n'),
-	(u'pos', u'', u'', u'', u'I', u'L', u'Sayula Popoluca', u'\r\n'),
-	(u'pot', u'', u'', u'', u'I', u'L', u'Potawatomi', u'\r\n'),
-	(u'pov', u'', u'', u'', u'I', u'L', u'Upper Guinea Crioulo', u'\r\n'),
-	(u'pow', u'', u'', u'', u'I', u'L', u'San Felipe Otlaltepec Popoloca', u'\r\n'),
-	(u'pox', u'', u'', u'', u'I', u'E', u'Polabian', u'\r\n'),
-	(u'poy', u'', u'', u'', u'I', u'L', u'Pogolo', u'\r\n'),
-	(u'ppa', u'', u'', u'', u'I', u'L', u'Pao', u'\r\n'),
-	(u'ppe', u'', u'', u'', u'I', u'L', u'Papi', u'\r\n'),
-	(u'ppi', u'', u'', u'', u'I', u'L', u'Paipai', u'\r\n'),
-	(u'ppk', u'', u'', u'', u'I', u'L', u'Uma', u'\r\n'),
-	(u'ppl', u'', u'', u'', u'I', u'L', u'Pipil', u'\r\n'),
-	(u'ppm', u'', u'', u'', u'I', u'L', u'Papuma', u'\r\n'),
-	(u'ppn', u'', u'', u'', u'I', u'L', u'Papapana', u'\r\n'),
-	(u'ppo', u'', u'', u'', u'I', u'L', u'Folopa', u'\r\n'),
-	(u'ppp', u'', u'', u'', u'I', u'L', u'Pelende', u'\r\n'),
-	(u'ppq', u'', u'', u'', u'I', u'L', u'Pei', u'\r\n'),
-	(u'ppr', u'', u'', u'', u'I', u'L', u'Piru', u'\r\n'),
-	(u'pps', u'', u'', u'', u'I', u'L', u'San Lu\xeds Temalacayuca Popoloca', u'\r\n'),
-	(u'ppt', u'', u'', u'', u'I', u'L', u'Pare', u'\r\n'),
-	(u'ppu', u'', u'', u'', u'I', u'E', u'Papora', u'\r\n'),
-	(u'pqa', u'', u'', u'', u'I', u'L', u"Pa'a", u'\r\n'),
-	(u'pqm', u'', u'', u'', u'I', u'L', u'Malecite-Passamaquoddy', u'\r\n'),
-	(u'prb', u'', u'', u'', u'I', u'L', u"Lua'", u'\r\n'),
-	(u'prc', u'', u'', u'', u'I', u'L', u'Parachi', u'\r\n'),
-	(u'prd', u'', u'', u'', u'I', u'L', u'Parsi-Dari', u'\r\n'),
-	(u'pre', u'', u'', u'', u'I', u'L', u'Principense', u'\r\n'),
-	(u'prf', u'', u'', u'', u'I', u'L', u'Paranan', u'\r\n'),
-	(u'prg', u'', u'', u'', u'I', u'L', u'Prussian', u'\r\n'),
-	(u'prh', u'', u'', u'', u'I', u'L', u'Porohanon', u'\r\n'),
-	(u'pri', u'', u'', u'', u'I', u'L', u'Paic\xee', u'\r\n'),
-	(u'prk', u'', u'', u'', u'I', u'L', u'Parauk', u'\r\n'),
-	(u'prl', u'', u'', u'', u'I', u'L', u'Peruvian Sign Language', u'\r\n'),
-	(u'prm', u'', u'', u'', u'I', u'L', u'Kibiri', u'\r\n'),
-	(u'prn', u'', u'', u'', u'I', u'L', u'Prasuni', u'\r\n'),
-	(u'pro', u'pro', u'pro', u'', u'I', u'H', u'Old Proven\xe7al (to 1500)', u'\r\n'),
-	(u'prp', u'', u'', u'', u'I', u'L', u'Parsi', u'\r\n'),
-	(u'prq', u'', u'', u'', u'I', u'L', u'Ash\xe9ninka Peren\xe9', u'\r\n'),
-	(u'prr', u'', u'', u'', u'I', u'E', u'Puri', u'\r\n'),
-	(u'prs', u'', u'', u'', u'I', u'L', u'Dari', u'\r\n'),
-	(u'prt', u'', u'', u'', u'I', u'L', u'Phai', u'\r\n'),
-	(u'pru', u'', u'', u'', u'I', u'L', u'Puragi', u'\r\n'),
-	(u'prw', u'', u'', u'', u'I', u'L', u'Parawen', u'\r\n'),
-	(u'prx', u'', u'', u'', u'I', u'L', u'Purik', u'\r\n'),
-	(u'pry', u'', u'', u'', u'I', u'L', u'Pray 3', u'\r\n'),
-	(u'prz', u'', u'', u'', u'I', u'L', u'Providencia Sign Language', u'\r\n'),
-	(u'psa', u'', u'', u'', u'I', u'L', u'Asue Awyu', u'\r\n'),
-	(u'psc', u'', u'', u'', u'I', u'L', u'Persian Sign Language', u'\r\n'),
-	(u'psd', u'', u'', u'', u'I', u'L', u'Plains Indian Sign Language', u'\r\n'),
-	(u'pse', u'', u'', u'', u'I', u'L', u'Central Malay', u'\r\n'),
-	(u'psg', u'', u'', u'', u'I', u'L', u'Penang Sign Language', u'\r\n'),
-	(u'psh', u'', u'', u'', u'I', u'L', u'Southwest Pashayi', u'\r\n'),
-	(u'psi', u'', u'', u'', u'I', u'L', u'Southeast Pashayi', u'\r\n'),
-	(u'psl', u'', u'', u'', u'I', u'L', u'Puerto Rican Sign Language', u'\r\n'),
-	(u'psm', u'', u'', u'', u'I', u'E', u'Pauserna', u'\r\n'),
-	(u'psn', u'', u'', u'', u'I', u'L', u'Panasuan', u'\r\n'),
-	(u'pso', u'', u'', u'', u'I', u'L', u'Polish Sign Language', u'\r\n'),
-	(u'psp', u'', u'', u'', u'I', u'L', u'Philippine Sign Language', u'\r\n'),
-	(u'psq', u'', u'', u'', u'I', u'L', u'Pasi', u'\r\n'),
-	(u'psr', u'', u'', u'', u'I', u'L', u'Portuguese Sign Language', u'\r\n'),
-	(u'pss', u'', u'', u'', u'I', u'L', u'Kaulong', u'\r\n'),
-	(u'pst', u'', u'', u'', u'I', u'L', u'Central Pashto', u'\r\n'),
-	(u'psu', u'', u'', u'', u'I', u'H', u'Sauraseni Pr\u0101krit', u'\r\n'),
-	(u'psw', u'', u'', u'', u'I', u'L', u'Port Sandwich', u'\r\n'),
-	(u'psy', u'', u'', u'', u'I', u'E', u'Piscataway', u'\r\n'),
-	(u'pta', u'', u'', u'', u'I', u'L', u'Pai Tavytera', u'\r\n'),
-	(u'pth', u'', u'', u'', u'I', u'E', u'Patax\xf3 H\xe3-Ha-H\xe3e', u'\r\n'),
-	(u'pti', u'', u'', u'', u'I', u'L', u'Pintiini', u'\r\n'),
-	(u'ptn', u'', u'', u'', u'I', u'L', u'Patani', u'\r\n'),
-	(u'pto', u'', u'', u'', u'I', u'L', u"Zo'\xe9", u'\r\n'),
-	(u'ptp', u'', u'', u'', u'I', u'L', u'Patep', u'\r\n'),
-	(u'ptr', u'', u'', u'', u'I', u'L', u'Piamatsina', u'\r\n'),
-	(u'ptt', u'', u'', u'', u'I', u'L', u'Enrekang', u'\r\n'),
-	(u'ptu', u'', u'', u'', u'I', u'L', u'Bambam', u'\r\n'),
-	(u'ptv', u'', u'', u'', u'I', u'L', u'Port Vato', u'\r\n'),
-	(u'ptw', u'', u'', u'', u'I', u'E', u'Pentlatch', u'\r\n'),
-	(u'pty', u'', u'', u'', u'I', u'L', u'Pathiya', u'\r\n'),
-	(u'pua', u'', u'', u'', u'I', u'L', u'Western Highland Purepecha', u'\r\n'),
-	(u'pub', u'', u'', u'', u'I', u'L', u'Purum', u'\r\n'),
-	(u'puc', u'', u'', u'', u'I', u'L', u'Punan Merap', u'\r\n'),
-	(u'pud', u'', u'', u'', u'I', u'L', u'Punan Aput', u'\r\n'),
-	(u'pue', u'', u'', u'', u'I', u'L', u'Puelche', u'\r\n'),
-	(u'puf', u'', u'', u'', u'I', u'L', u'Punan Merah', u'\r\n'),
-	(u'pug', u'', u'', u'', u'I', u'L', u'Phuie', u'\r\n'),
-	(u'pui', u'', u'', u'', u'I', u'L', u'Puinave', u'\r\n'),
-	(u'puj', u'', u'', u'', u'I', u'L', u'Punan Tubu', u'\r\n'),
-	(u'puk', u'', u'', u'', u'I', u'L', u'Pu Ko', u'\r\n'),
-	(u'pum', u'', u'', u'', u'I', u'L', u'Puma', u'\r\n'),
-	(u'puo', u'', u'', u'', u'I', u'L', u'Puoc', u'\r\n'),
-	(u'pup', u'', u'', u'', u'I', u'L', u'Pulabu', u'\r\n'),
-	(u'puq', u'', u'', u'', u'I', u'E', u'Puquina', u'\r\n'),
-	(u'pur', u'', u'', u'', u'I', u'L', u'Purubor\xe1', u'\r\n'),
-	(u'pus', u'pus', u'pus', u'ps', u'M', u'L', u'Pushto', u'\r\n'),
-	(u'put', u'', u'', u'', u'I', u'L', u'Putoh', u'\r\n'),
-	(u'puu', u'', u'', u'', u'I', u'L', u'Punu', u'\r\n'),
-	(u'puw', u'', u'', u'', u'I', u'L', u'Puluwatese', u'\r\n'),
-	(u'pux', u'', u'', u'', u'I', u'L', u'Puare', u'\r\n'),
-	(u'puy', u'', u'', u'', u'I', u'E', u'Purisime\xf1o', u'\r\n'),
-	(u'puz', u'', u'', u'', u'I', u'L', u'Purum Naga', u'\r\n'),
-	(u'pwa', u'', u'', u'', u'I', u'L', u'Pawaia', u'\r\n'),
-	(u'pwb', u'', u'', u'', u'I', u'L', u'Panawa', u'\r\n'),
-	(u'pwg', u'', u'', u'', u'I', u'L', u'Gapapaiwa', u'\r\n'),
-	(u'pwm', u'', u'', u'', u'I', u'L', u'Molbog', u'\r\n'),
-	(u'pwn', u'', u'', u'', u'I', u'L', u'Paiwan', u'\r\n'),
-	(u'pwo', u'', u'', u'', u'I', u'L', u'Pwo Western Karen', u'\r\n'),
-	(u'pwr', u'', u'', u'', u'I', u'L', u'Powari', u'\r\n'),
-	(u'pww', u'', u'', u'', u'I', u'L', u'Pwo Northern Karen', u'\r\n'),
-	(u'pxm', u'', u'', u'', u'I', u'L', u'Quetzaltepec Mixe', u'\r\n'),
-	(u'pye', u'', u'', u'', u'I', u'L', u'Pye Krumen', u'\r\n'),
-	(u'pym', u'', u'', u'', u'I', u'L', u'Fyam', u'\r\n'),
-	(u'pyn', u'', u'', u'', u'I', u'L', u'Poyan\xe1wa', u'\r\n'),
-	(u'pys', u'', u'', u'', u'I', u'L', u'Paraguayan Sign Language', u'\r\n'),
-	(u'pyu', u'', u'', u'', u'I', u'L', u'Puyuma', u'\r\n'),
-	(u'pyx', u'', u'', u'', u'I', u'A', u'Pyu (Myanmar)', u'\r\n'),
-	(u'pyy', u'', u'', u'', u'I', u'L', u'Pyen', u'\r\n'),
-	(u'pzn', u'', u'', u'', u'I', u'L', u'Para Naga', u'\r\n'),
-	(u'qua', u'', u'', u'', u'I', u'L', u'Quapaw', u'\r\n'),
-	(u'qub', u'', u'', u'', u'I', u'L', u'Huallaga Hu\xe1nuco Quechua', u'\r\n'),
-	(u'quc', u'', u'', u'', u'I', u'L', u"K'iche'", u'\r\n'),
-	(u'qud', u'', u'', u'', u'I', u'L', u'Calder\xf3n Highland Quichua', u'\r\n'),
-	(u'que', u'que', u'que', u'qu', u'M', u'L', u'Quechua', u'\r\n'),
-	(u'quf', u'', u'', u'', u'I', u'L', u'Lambayeque Quechua', u'\r\n'),
-	(u'qug', u'', u'', u'', u'I', u'L', u'Chimborazo Highland Quichua', u'\r\n'),
-	(u'quh', u'', u'', u'', u'I', u'L', u'South Bolivian Quechua', u'\r\n'),
-	(u'qui', u'', u'', u'', u'I', u'L', u'Quileute', u'\r\n'),
-	(u'quk', u'', u'', u'', u'I', u'L', u'Chachapoyas Quechua', u'\r\n'),
-	(u'qul', u'', u'', u'', u'I', u'L', u'North Bolivian Quechua', u'\r\n'),
-	(u'qum', u'', u'', u'', u'I', u'L', u'Sipacapense', u'\r\n'),
-	(u'qun', u'', u'', u'', u'I', u'E', u'Quinault', u'\r\n'),
-	(u'qup', u'', u'', u'', u'I', u'L', u'Southern Pastaza Quechua', u'\r\n'),
-	(u'quq', u'', u'', u'', u'I', u'L', u'Quinqui', u'\r\n'),
-	(u'qur', u'', u'', u'', u'I', u'L', u'Yanahuanca Pasco Quechua', u'\r\n'),
-	(u'qus', u'', u'', u'', u'I', u'L', u'Santiago del Estero Quichua', u'\r\n'),
-	(u'quv', u'', u'', u'', u'I', u'L', u'Sacapulteco', u'\r\n'),
-	(u'quw', u'', u'', u'', u'I', u'L', u'Tena Lowland Quichua', u'\r\n'),
-	(u'qux', u'', u'', u'', u'I', u'L', u'Yauyos Quechua', u'\r\n'),
-	(u'quy', u'', u'', u'', u'I', u'L', u'Ayacucho Quechua', u'\r\n'),
-	(u'quz', u'', u'', u'', u'I', u'L', u'Cusco Quechua', u'\r\n'),
-	(u'qva', u'', u'', u'', u'I', u'L', u'Ambo-Pasco Quechua', u'\r\n'),
-	(u'qvc', u'', u'', u'', u'I', u'L', u'Cajamarca Quechua', u'\r\n'),
-	(u'qve', u'', u'', u'', u'I', u'L', u'Eastern Apur\xedmac Quechua', u'\r\n'),
-	(u'qvh', u'', u'', u'', u'I', u'L', u'Huamal\xedes-Dos de Mayo Hu\xe1nuco Quechua', u'\r\n'),
-	(u'qvi', u'', u'', u'', u'I', u'L', u'Imbabura Highland Quichua', u'\r\n'),
-	(u'qvj', u'', u'', u'', u'I', u'L', u'Loja Highland Quichua', u'\r\n'),
-	(u'qvl', u'', u'', u'', u'I', u'L', u'Cajatambo North Lima Quechua', u'\r\n'),
-	(u'qvm', u'', u'', u'', u'I', u'L', u'Margos-Yarowilca-Lauricocha Quechua', u'\r\n'),
-	(u'qvn', u'', u'', u'', u'I', u'L', u'North Jun\xedn Quechua', u'\r\n'),
-	(u'qvo', u'', u'', u'', u'I', u'L', u'Napo Lowland Quechua', u'\r\n'),
-	(u'qvp', u'', u'', u'', u'I', u'L', u'Pacaraos Quechua', u'\r\n'),
-	(u'qvs', u'', u'', u'', u'I', u'L', u'San Mart\xedn Quechua', u'\r\n'),
-	(u'qvw', u'', u'', u'', u'I', u'L', u'Huaylla Wanca Quechua', u'\r\n'),
-	(u'qvy', u'', u'', u'', u'I', u'L', u'Queyu', u'\r\n'),
-	(u'qvz', u'', u'', u'', u'I', u'L', u'Northern Pastaza Quichua', u'\r\n'),
-	(u'qwa', u'', u'', u'', u'I', u'L', u'Corongo Ancash Quechua', u'\r\n'),
-	(u'qwc', u'', u'', u'', u'I', u'H', u'Classical Quechua', u'\r\n'),
-	(u'qwh', u'', u'', u'', u'I', u'L', u'Huaylas Ancash Quechua', u'\r\n'),
-	(u'qwm', u'', u'', u'', u'I', u'E', u'Kuman (Russia)', u'\r\n'),
-	(u'qws', u'', u'', u'', u'I', u'L', u'Sihuas Ancash Quechua', u'\r\n'),
-	(u'qwt', u'', u'', u'', u'I', u'E', u'Kwalhioqua-Tlatskanai', u'\r\n'),
-	(u'qxa', u'', u'', u'', u'I', u'L', u'Chiqui\xe1n Ancash Quechua', u'\r\n'),
-	(u'qxc', u'', u'', u'', u'I', u'L', u'Chincha Quechua', u'\r\n'),
-	(u'qxh', u'', u'', u'', u'I', u'L', u'Panao Hu\xe1nuco Quechua', u'\r\n'),
-	(u'qxl', u'', u'', u'', u'I', u'L', u'Salasaca Highland Quichua', u'\r\n'),
-	(u'qxn', u'', u'', u'', u'I', u'L', u'Northern Conchucos Ancash Quechua', u'\r\n'),
-	(u'qxo', u'', u'', u'', u'I', u'L', u'Southern Conchucos Ancash Quechua', u'\r\n'),
-	(u'qxp', u'', u'', u'', u'I', u'L', u'Puno Quechua', u'\r\n'),
-	(u'qxq', u'', u'', u'', u'I', u'L', u"Qashqa'i", u'\r\n'),
-	(u'qxr', u'', u'', u'', u'I', u'L', u'Ca\xf1ar Highland Quichua', u'\r\n'),
-	(u'qxs', u'', u'', u'', u'I', u'L', u'Southern Qiang', u'\r\n'),
-	(u'qxt', u'', u'', u'', u'I', u'L', u'Santa Ana de Tusi Pasco Quechua', u'\r\n'),
-	(u'qxu', u'', u'', u'', u'I', u'L', u'Arequipa-La Uni\xf3n Quechua', u'\r\n'),
-	(u'qxw', u'', u'', u'', u'I', u'L', u'Jauja Wanca Quechua', u'\r\n'),
-	(u'qya', u'', u'', u'', u'I', u'C', u'Quenya', u'\r\n'),
-	(u'qyp', u'', u'', u'', u'I', u'E', u'Quiripi', u'\r\n'),
-	(u'raa', u'', u'', u'', u'I', u'L', u'Dungmali', u'\r\n'),
-	(u'rab', u'', u'', u'', u'I', u'L', u'Camling', u'\r\n'),
-	(u'rac', u'', u'', u'', u'I', u'L', u'Rasawa', u'\r\n'),
-	(u'rad', u'', u'', u'', u'I', u'L', u'Rade', u'\r\n'),
-	(u'raf', u'', u'', u'', u'I', u'L', u'Western Meohang', u'\r\n'),
-	(u'rag', u'', u'', u'', u'I', u'L', u'Logooli', u'\r\n'),
-	(u'rah', u'', u'', u'', u'I', u'L', u'Rabha', u'\r\n'),
-	(u'rai', u'', u'', u'', u'I', u'L', u'Ramoaaina', u'\r\n'),
-	(u'raj', u'raj', u'raj', u'', u'M', u'L', u'Rajasthani', u'\r\n'),
-	(u'rak', u'', u'', u'', u'I', u'L', u'Tulu-Bohuai', u'\r\n'),
-	(u'ral', u'', u'', u'', u'I', u'L', u'Ralte', u'\r\n'),
-	(u'ram', u'', u'', u'', u'I', u'L', u'Canela', u'\r\n'),
-	(u'ran', u'', u'', u'', u'I', u'L', u'Riantana', u'\r\n'),
-	(u'rao', u'', u'', u'', u'I', u'L', u'Rao', u'\r\n'),
-	(u'rap', u'rap', u'rap', u'', u'I', u'L', u'Rapanui', u'\r\n'),
-	(u'raq', u'', u'', u'', u'I', u'L', u'Saam', u'\r\n'),
-	(u'rar', u'rar', u'rar', u'', u'I', u'L', u'Rarotongan', u'\r\n'),
-	(u'ras', u'', u'', u'', u'I', u'L', u'Tegali', u'\r\n'),
-	(u'rat', u'', u'', u'', u'I', u'L', u'Razajerdi', u'\r\n'),
-	(u'rau', u'', u'', u'', u'I', u'L', u'Raute', u'\r\n'),
-	(u'rav', u'', u'', u'', u'I', u'L', u'Sampang', u'\r\n'),
-	(u'raw', u'', u'', u'', u'I', u'L', u'Rawang', u'\r\n'),
-	(u'rax', u'', u'', u'', u'I', u'L', u'Rang', u'\r\n'),
-	(u'ray', u'', u'', u'', u'I', u'L', u'Rapa', u'\r\n'),
-	(u'raz', u'', u'', u'', u'I', u'L', u'Rahambuu', u'\r\n'),
-	(u'rbb', u'', u'', u'', u'I', u'L', u'Rumai Palaung', u'\r\n'),
-	(u'rbk', u'', u'', u'', u'I', u'L', u'Northern Bontok', u'\r\n'),
-	(u'rbl', u'', u'', u'', u'I', u'L', u'Miraya Bikol', u'\r\n'),
-	(u'rcf', u'', u'', u'', u'I', u'L', u'R\xe9union Creole French', u'\r\n'),
-	(u'rdb', u'', u'', u'', u'I', u'L', u'Rudbari', u'\r\n'),
-	(u'rea', u'', u'', u'', u'I', u'L', u'Rerau', u'\r\n'),
-	(u'reb', u'', u'', u'', u'I', u'L', u'Rembong', u'\r\n'),
-	(u'ree', u'', u'', u'', u'I', u'L', u'Rejang Kayan', u'\r\n'),
-	(u'reg', u'', u'', u'', u'I', u'L', u'Kara (Tanzania)', u'\r\n'),
-	(u'rei', u'', u'', u'', u'I', u'L', u'Reli', u'\r\n'),
-	(u'rej', u'', u'', u'', u'I', u'L', u'Rejang', u'\r\n'),
-	(u'rel', u'', u'', u'', u'I', u'L', u'Rendille', u'\r\n'),
-	(u'rem', u'', u'', u'', u'I', u'E', u'Remo', u'\r\n'),
-	(u'ren', u'', u'', u'', u'I', u'L', u'Rengao', u'\r\n'),
-	(u'rer', u'', u'', u'', u'I', u'E', u'Rer Bare', u'\r\n'),
-	(u'res', u'', u'', u'', u'I', u'L', u'Reshe', u'\r\n'),
-	(u'ret', u'', u'', u'', u'I', u'L', u'Retta', u'\r\n'),
-	(u'rey', u'', u'', u'', u'I', u'L', u'Reyesano', u'\r\n'),
-	(u'rga', u'', u'', u'', u'I', u'L', u'Roria', u'\r\n'),
-	(u'rge', u'', u'', u'', u'I', u'L', u'Romano-Greek', u'\r\n'),
-	(u'rgk', u'', u'', u'', u'I', u'E', u'Rangkas', u'\r\n'),
-	(u'rgn', u'', u'', u'', u'I', u'L', u'Romagnol', u'\r\n'),
-	(u'rgr', u'', u'', u'', u'I', u'L', u'Res\xedgaro', u'\r\n'),
-	(u'rgs', u'', u'', u'', u'I', u'L', u'Southern Roglai', u'\r\n'),
-	(u'rgu', u'', u'', u'', u'I', u'L', u'Ringgou', u'\r\n'),
-	(u'rhg', u'', u'', u'', u'I', u'L', u'Rohingya', u'\r\n'),
-	(u'rhp', u'', u'', u'', u'I', u'L', u'Yahang', u'\r\n'),
-	(u'ria', u'', u'', u'', u'I', u'L', u'Riang (India)', u'\r\n'),
-	(u'rie', u'', u'', u'', u'I', u'L', u'Rien', u'\r\n'),
-	(u'rif', u'', u'', u'', u'I', u'L', u'Tarifit', u'\r\n'),
-	(u'ril', u'', u'', u'', u'I', u'L', u'Riang (Myanmar)', u'\r\n'),
-	(u'rim', u'', u'', u'', u'I', u'L', u'Nyaturu', u'\r\n'),
-	(u'rin', u'', u'', u'', u'I', u'L', u'Nungu', u'\r\n'),
-	(u'rir', u'', u'', u'', u'I', u'L', u'Ribun', u'\r\n'),
-	(u'rit', u'', u'', u'', u'I', u'L', u'Ritarungo', u'\r\n'),
-	(u'riu', u'', u'', u'', u'I', u'L', u'Riung', u'\r\n'),
-	(u'rjg', u'', u'', u'', u'I', u'L', u'Rajong', u'\r\n'),
-	(u'rji', u'', u'', u'', u'I', u'L', u'Raji', u'\r\n'),
-	(u'rjs', u'', u'', u'', u'I', u'L', u'Rajbanshi', u'\r\n'),
-	(u'rka', u'', u'', u'', u'I', u'L', u'Kraol', u'\r\n'),
-	(u'rkb', u'', u'', u'', u'I', u'L', u'Rikbaktsa', u'\r\n'),
-	(u'rkh', u'', u'', u'', u'I', u'L', u'Rakahanga-Manihiki', u'\r\n'),
-	(u'rki', u'', u'', u'', u'I', u'L', u'Rakhine', u'\r\n'),
-	(u'rkm', u'', u'', u'', u'I', u'L', u'Marka', u'\r\n'),
-	(u'rkt', u'', u'', u'', u'I', u'L', u'Rangpuri', u'\r\n'),
-	(u'rma', u'', u'', u'', u'I', u'L', u'Rama', u'\r\n'),
-	(u'rmb', u'', u'', u'', u'I', u'L', u'Rembarunga', u'\r\n'),
-	(u'rmc', u'', u'', u'', u'I', u'L', u'Carpathian Romani', u'\r\n'),
-	(u'rmd', u'', u'', u'', u'I', u'E', u'Traveller Danish', u'\r\n'),
-	(u'rme', u'', u'', u'', u'I', u'L', u'Angloromani', u'\r\n'),
-	(u'rmf', u'', u'', u'', u'I', u'L', u'Kalo Finnish Romani', u'\r\n'),
-	(u'rmg', u'', u'', u'', u'I', u'L', u'Traveller Norwegian', u'\r\n'),
-	(u'rmh', u'', u'', u'', u'I', u'L', u'Murkim', u'\r\n'),
-	(u'rmi', u'', u'', u'', u'I', u'L', u'Lomavren', u'\r\n'),
-	(u'rmk', u'', u'', u'', u'I', u'L', u'Romkun', u'\r\n'),
-	(u'rml', u'', u'', u'', u'I', u'L', u'Baltic Romani', u'\r\n'),
-	(u'rmm', u'', u'', u'', u'I', u'L', u'Roma', u'\r\n'),
-	(u'rmn', u'', u'', u'', u'I', u'L', u'Balkan Romani', u'\r\n'),
-	(u'rmo', u'', u'', u'', u'I', u'L', u'Sinte Romani', u'\r\n'),
-	(u'rmp', u'', u'', u'', u'I', u'L', u'Rempi', u'\r\n'),
-	(u'rmq', u'', u'', u'', u'I', u'L', u'Cal\xf3', u'\r\n'),
-	(u'rms', u'', u'', u'', u'I', u'L', u'Romanian Sign Language', u'\r\n'),
-	(u'rmt', u'', u'', u'', u'I', u'L', u'Domari', u'\r\n'),
-	(u'rmu', u'', u'', u'', u'I', u'L', u'Tavringer Romani', u'\r\n'),
-	(u'rmv', u'', u'', u'', u'I', u'C', u'Romanova', u'\r\n'),
-	(u'rmw', u'', u'', u'', u'I', u'L', u'Welsh Romani', u'\r\n'),
-	(u'rmx', u'', u'', u'', u'I', u'L', u'Romam', u'\r\n'),
-	(u'rmy', u'', u'', u'', u'I', u'L', u'Vlax Romani', u'\r\n'),
-	(u'rmz', u'', u'', u'', u'I', u'L', u'Marma', u'\r\n'),
-	(u'rna', u'', u'', u'', u'I', u'E', u'Runa', u'\r\n'),
-	(u'rnd', u'', u'', u'', u'I', u'L', u'Ruund', u'\r\n'),
-	(u'rng', u'', u'', u'', u'I', u'L', u'Ronga', u'\r\n'),
-	(u'rnl', u'', u'', u'', u'I', u'L', u'Ranglong', u'\r\n'),
-	(u'rnn', u'', u'', u'', u'I', u'L', u'Roon', u'\r\n'),
-	(u'rnp', u'', u'', u'', u'I', u'L', u'Rongpo', u'\r\n'),
-	(u'rnw', u'', u'', u'', u'I', u'L', u'Rungwa', u'\r\n'),
-	(u'rob', u'', u'', u'', u'I', u'L', u"Tae'", u'\r\n'),
-	(u'roc', u'', u'', u'', u'I', u'L', u'Cacgia Roglai', u'\r\n'),
-	(u'rod', u'', u'', u'', u'I', u'L', u'Rogo', u'\r\n'),
-	(u'roe', u'', u'', u'', u'I', u'L', u'Ronji', u'\r\n'),
-	(u'rof', u'', u'', u'', u'I', u'L', u'Rombo', u'\r\n'),
-	(u'rog', u'', u'', u'', u'I', u'L', u'Northern Roglai', u'\r\n'),
-	(u'roh', u'roh', u'roh', u'rm', u'I', u'L', u'Romansh', u'\r\n'),
-	(u'rol', u'', u'', u'', u'I', u'L', u'Romblomanon', u'\r\n'),
-	(u'rom', u'rom', u'rom', u'', u'M', u'L', u'Romany', u'\r\n'),
-	(u'ron', u'rum', u'ron', u'ro', u'I', u'L', u'Romanian', u'\r\n'),
-	(u'roo', u'', u'', u'', u'I', u'L', u'Rotokas', u'\r\n'),
-	(u'rop', u'', u'', u'', u'I', u'L', u'Kriol', u'\r\n'),
-	(u'ror', u'', u'', u'', u'I', u'L', u'Rongga', u'\r\n'),
-	(u'rou', u'', u'', u'', u'I', u'L', u'Runga', u'\r\n'),
-	(u'row', u'', u'', u'', u'I', u'L', u'Dela-Oenale', u'\r\n'),
-	(u'rpn', u'', u'', u'', u'I', u'L', u'Repanbitip', u'\r\n'),
-	(u'rpt', u'', u'', u'', u'I', u'L', u'Rapting', u'\r\n'),
-	(u'rri', u'', u'', u'', u'I', u'L', u'Ririo', u'\r\n'),
-	(u'rro', u'', u'', u'', u'I', u'L', u'Waima', u'\r\n'),
-	(u'rsb', u'', u'', u'', u'I', u'L', u'Romano-Serbian', u'\r\n'),
-	(u'rsi', u'', u'', u'', u'I', u'L', u'Rennellese Sign Language', u'\r\n'),
-	(u'rsl', u'', u'', u'', u'I', u'L', u'Russian Sign Language', u'\r\n'),
-	(u'rth', u'', u'', u'', u'I', u'L', u'Ratahan', u'\r\n'),
-	(u'rtm', u'', u'', u'', u'I', u'L', u'Rotuman', u'\r\n'),
-	(u'rtw', u'', u'', u'', u'I', u'L', u'Rathawi', u'\r\n'),
-	(u'rub', u'', u'', u'', u'I', u'L', u'Gungu', u'\r\n'),
-	(u'ruc', u'', u'', u'', u'I', u'L', u'Ruuli', u'\r\n'),
-	(u'rue', u'', u'', u'', u'I', u'L', u'Rusyn', u'\r\n'),
-	(u'ruf', u'', u'', u'', u'I', u'L', u'Luguru', u'\r\n'),
-	(u'rug', u'', u'', u'', u'I', u'L', u'Roviana', u'\r\n'),
-	(u'ruh', u'', u'', u'', u'I', u'L', u'Ruga', u'\r\n'),
-	(u'rui', u'', u'', u'', u'I', u'L', u'Rufiji', u'\r\n'),
-	(u'ruk', u'', u'', u'', u'I', u'L', u'Che', u'\r\n'),
-	(u'run', u'run', u'run', u'rn', u'I', u'L', u'Rundi', u'\r\n'),
-	(u'ruo', u'', u'', u'', u'I', u'L', u'Istro Romanian', u'\r\n'),
-	(u'rup', u'rup', u'rup', u'', u'I', u'L', u'Macedo-Romanian', u'\r\n'),
-	(u'ruq', u'', u'', u'', u'I', u'L', u'Megleno Romanian', u'\r\n'),
-	(u'rus', u'rus', u'rus', u'ru', u'I', u'L', u'Russian', u'\r\n'),
-	(u'rut', u'', u'', u'', u'I', u'L', u'Rutul', u'\r\n'),
-	(u'ruu', u'', u'', u'', u'I', u'L', u'Lanas Lobu', u'\r\n'),
-	(u'ruy', u'', u'', u'', u'I', u'L', u'Mala (Nigeria)', u'\r\n'),
-	(u'ruz', u'', u'', u'', u'I', u'L', u'Ruma', u'\r\n'),
-	(u'rwa', u'', u'', u'', u'I', u'L', u'Rawo', u'\r\n'),
-	(u'rwk', u'', u'', u'', u'I', u'L', u'Rwa', u'\r\n'),
-	(u'rwm', u'', u'', u'', u'I', u'L', u'Amba (Uganda)', u'\r\n'),
-	(u'rwo', u'', u'', u'', u'I', u'L', u'Rawa', u'\r\n'),
-	(u'rwr', u'', u'', u'', u'I', u'L', u'Marwari (India)', u'\r\n'),
-	(u'ryn', u'', u'', u'', u'I', u'L', u'Northern Amami-Oshima', u'\r\n'),
-	(u'rys', u'', u'', u'', u'I', u'L', u'Yaeyama', u'\r\n'),
-	(u'ryu', u'', u'', u'', u'I', u'L', u'Central Okinawan', u'\r\n'),
-	(u'saa', u'', u'', u'', u'I', u'L', u'Saba', u'\r\n'),
-	(u'sab', u'', u'', u'', u'I', u'L', u'Buglere', u'\r\n'),
-	(u'sac', u'', u'', u'', u'I', u'L', u'Meskwaki', u'\r\n'),
-	(u'sad', u'sad', u'sad', u'', u'I', u'L', u'Sandawe', u'\r\n'),
-	(u'sae', u'', u'', u'', u'I', u'L', u'Saban\xea', u'\r\n'),
-	(u'saf', u'', u'', u'', u'I', u'L', u'Safaliba', u'\r\n'),
-	(u'sag', u'sag', u'sag', u'sg', u'I', u'L', u'Sango', u'\r\n'),
-	(u'sah', u'sah', u'sah', u'', u'I', u'L', u'Yakut', u'\r\n'),
-	(u'saj', u'', u'', u'', u'I', u'L', u'Sahu', u'\r\n'),
-	(u'sak', u'', u'', u'', u'I', u'L', u'Sake', u'\r\n'),
-	(u'sam', u'sam', u'sam', u'', u'I', u'E', u'Samaritan Aramaic', u'\r\n'),
-	(u'san', u'san', u'san', u'sa', u'I', u'A', u'Sanskrit', u'\r\n'),
-	(u'sao', u'', u'', u'', u'I', u'L', u'Sause', u'\r\n'),
-	(u'sap', u'', u'', u'', u'I', u'L', u'Sanapan\xe1', u'\r\n'),
-	(u'saq', u'', u'', u'', u'I', u'L', u'Samburu', u'\r\n'),
-	(u'sar', u'', u'', u'', u'I', u'E', u'Saraveca', u'\r\n'),
-	(u'sas', u'sas', u'sas', u'', u'I', u'L', u'Sasak', u'\r\n'),
-	(u'sat', u'sat', u'sat', u'', u'I', u'L', u'Santali', u'\r\n'),
-	(u'sau', u'', u'', u'', u'I', u'L', u'Saleman', u'\r\n'),
-	(u'sav', u'', u'', u'', u'I', u'L', u'Saafi-Saafi', u'\r\n'),
-	(u'saw', u'', u'', u'', u'I', u'L', u'Sawi', u'\r\n'),
-	(u'sax', u'', u'', u'', u'I', u'L', u'Sa', u'\r\n'),
-	(u'say', u'', u'', u'', u'I', u'L', u'Saya', u'\r\n'),
-	(u'saz', u'', u'', u'', u'I', u'L', u'Saurashtra', u'\r\n'),
-	(u'sba', u'', u'', u'', u'I', u'L', u'Ngambay', u'\r\n'),
-	(u'sbb', u'', u'', u'', u'I', u'L', u'Simbo', u'\r\n'),
-	(u'sbc', u'', u'', u'', u'I', u'L', u'Kele (Papua New Guinea)', u'\r\n'),
-	(u'sbd', u'', u'', u'', u'I', u'L', u'Southern Samo', u'\r\n'),
-	(u'sbe', u'', u'', u'', u'I', u'L', u'Saliba', u'\r\n'),
-	(u'sbf', u'', u'', u'', u'I', u'L', u'Shabo', u'\r\n'),
-	(u'sbg', u'', u'', u'', u'I', u'L', u'Seget', u'\r\n'),
-	(u'sbh', u'', u'', u'', u'I', u'L', u'Sori-Harengan', u'\r\n'),
-	(u'sbi', u'', u'', u'', u'I', u'L', u'Seti', u'\r\n'),
-	(u'sbj', u'', u'', u'', u'I', u'L', u'Surbakhal', u'\r\n'),
-	(u'sbk', u'', u'', u'', u'I', u'L', u'Safwa', u'\r\n'),
-	(u'sbl', u'', u'', u'', u'I', u'L', u'Botolan Sambal', u'\r\n'),
-	(u'sbm', u'', u'', u'', u'I', u'L', u'Sagala', u'\r\n'),
-	(u'sbn', u'', u'', u'', u'I', u'L', u'Sindhi Bhil', u'\r\n'),
-	(u'sbo', u'', u'', u'', u'I', u'L', u'Sab\xfcm', u'\r\n'),
-	(u'sbp', u'', u'', u'', u'I', u'L', u'Sangu (Tanzania)', u'\r\n'),
-	(u'sbq', u'', u'', u'', u'I', u'L', u'Sileibi', u'\r\n'),
-	(u'sbr', u'', u'', u'', u'I', u'L', u'Sembakung Murut', u'\r\n'),
-	(u'sbs', u'', u'', u'', u'I', u'L', u'Subiya', u'\r\n'),
-	(u'sbt', u'', u'', u'', u'I', u'L', u'Kimki', u'\r\n'),
-	(u'sbu', u'', u'', u'', u'I', u'L', u'Stod Bhoti', u'\r\n'),
-	(u'sbv', u'', u'', u'', u'I', u'A', u'Sabine', u'\r\n'),
-	(u'sbw', u'', u'', u'', u'I', u'L', u'Simba', u'\r\n'),
-	(u'sbx', u'', u'', u'', u'I', u'L', u'Seberuang', u'\r\n'),
-	(u'sby', u'', u'', u'', u'I', u'L', u'Soli', u'\r\n'),
-	(u'sbz', u'', u'', u'', u'I', u'L', u'Sara Kaba', u'\r\n'),
-	(u'sca', u'', u'', u'', u'I', u'L', u'Sansu', u'\r\n'),
-	(u'scb', u'', u'', u'', u'I', u'L', u'Chut', u'\r\n'),
-	(u'sce', u'', u'', u'', u'I', u'L', u'Dongxiang', u'\r\n'),
-	(u'scf', u'', u'', u'', u'I', u'L', u'San Miguel Creole French', u'\r\n'),
-	(u'scg', u'', u'', u'', u'I', u'L', u'Sanggau', u'\r\n'),
-	(u'sch', u'', u'', u'', u'I', u'L', u'Sakachep', u'\r\n'),
-	(u'sci', u'', u'', u'', u'I', u'L', u'Sri Lankan Creole Malay', u'\r\n'),
-	(u'sck', u'', u'', u'', u'I', u'L', u'Sadri', u'\r\n'),
-	(u'scl', u'', u'', u'', u'I', u'L', u'Shina', u'\r\n'),
-	(u'scn', u'scn', u'scn', u'', u'I', u'L', u'Sicilian', u'\r\n'),
-	(u'sco', u'sco', u'sco', u'', u'I', u'L', u'Scots', u'\r\n'),
-	(u'scp', u'', u'', u'', u'I', u'L', u'Helambu Sherpa', u'\r\n'),
-	(u'scq', u'', u'', u'', u'I', u'L', u"Sa'och", u'\r\n'),
-	(u'scs', u'', u'', u'', u'I', u'L', u'North Slavey', u'\r\n'),
-	(u'scu', u'', u'', u'', u'I', u'L', u'Shumcho', u'\r\n'),
-	(u'scv', u'', u'', u'', u'I', u'L', u'Sheni', u'\r\n'),
-	(u'scw', u'', u'', u'', u'I', u'L', u'Sha', u'\r\n'),
-	(u'scx', u'', u'', u'', u'I', u'A', u'Sicel', u'\r\n'),
-	(u'sda', u'', u'', u'', u'I', u'L', u"Toraja-Sa'dan", u'\r\n'),
-	(u'sdb', u'', u'', u'', u'I', u'L', u'Shabak', u'\r\n'),
-	(u'sdc', u'', u'', u'', u'I', u'L', u'Sassarese Sardinian', u'\r\n'),
-	(u'sde', u'', u'', u'', u'I', u'L', u'Surubu', u'\r\n'),
-	(u'sdf', u'', u'', u'', u'I', u'L', u'Sarli', u'\r\n'),
-	(u'sdg', u'', u'', u'', u'I', u'L', u'Savi', u'\r\n'),
-	(u'sdh', u'', u'', u'', u'I', u'L', u'Southern Kurdish', u'\r\n'),
-	(u'sdj', u'', u'', u'', u'I', u'L', u'Suundi', u'\r\n'),
-	(u'sdk', u'', u'', u'', u'I', u'L', u'Sos Kundi', u'\r\n'),
-	(u'sdl', u'', u'', u'', u'I', u'L', u'Saudi Arabian Sign Language', u'\r\n'),
-	(u'sdm', u'', u'', u'', u'I', u'L', u'Semandang', u'\r\n'),
-	(u'sdn', u'', u'', u'', u'I', u'L', u'Gallurese Sardinian', u'\r\n'),
-	(u'sdo', u'', u'', u'', u'I', u'L', u'Bukar-Sadung Bidayuh', u'\r\n'),
-	(u'sdp', u'', u'', u'', u'I', u'L', u'Sherdukpen', u'\r\n'),
-	(u'sdr', u'', u'', u'', u'I', u'L', u'Oraon Sadri', u'\r\n'),
-	(u'sds', u'', u'', u'', u'I', u'E', u'Sened', u'\r\n'),
-	(u'sdt', u'', u'', u'', u'I', u'E', u'Shuadit', u'\r\n'),
-	(u'sdu', u'', u'', u'', u'I', u'L', u'Sarudu', u'\r\n'),
-	(u'sdx', u'', u'', u'', u'I', u'L', u'Sibu Melanau', u'\r\n'),
-	(u'sdz', u'', u'', u'', u'I', u'L', u'Sallands', u'\r\n'),
-	(u'sea', u'', u'', u'', u'I', u'L', u'Semai', u'\r\n'),
-	(u'seb', u'', u'', u'', u'I', u'L', u'Shempire Senoufo', u'\r\n'),
-	(u'sec', u'', u'', u'', u'I', u'L', u'Sechelt', u'\r\n'),
-	(u'sed', u'', u'', u'', u'I', u'L', u'Sedang', u'\r\n'),
-	(u'see', u'', u'', u'', u'I', u'L', u'Seneca', u'\r\n'),
-	(u'sef', u'', u'', u'', u'I', u'L', u'Cebaara Senoufo', u'\r\n'),
-	(u'seg', u'', u'', u'', u'I', u'L', u'Segeju', u'\r\n'),
-	(u'seh', u'', u'', u'', u'I', u'L', u'Sena', u'\r\n'),
-	(u'sei', u'', u'', u'', u'I', u'L', u'Seri', u'\r\n'),
-	(u'sej', u'', u'', u'', u'I', u'L', u'Sene', u'\r\n'),
-	(u'sek', u'', u'', u'', u'I', u'L', u'Sekani', u'\r\n'),
-	(u'sel', u'sel', u'sel', u'', u'I', u'L', u'Selkup', u'\r\n'),
-	(u'sen', u'', u'', u'', u'I', u'L', u'Nanerig\xe9 S\xe9noufo', u'\r\n'),
-	(u'seo', u'', u'', u'', u'I', u'L', u'Suarmin', u'\r\n'),
-	(u'sep', u'', u'', u'', u'I', u'L', u'S\xecc\xect\xe9 S\xe9noufo', u'\r\n'),
-	(u'seq', u'', u'', u'', u'I', u'L', u'Senara S\xe9noufo', u'\r\n'),
-	(u'ser', u'', u'', u'', u'I', u'L', u'Serrano', u'\r\n'),
-	(u'ses', u'', u'', u'', u'I', u'L', u'Koyraboro Senni Songhai', u'\r\n'),
-	(u'set', u'', u'', u'', u'I', u'L', u'Sentani', u'\r\n'),
-	(u'seu', u'', u'', u'', u'I', u'L', u'Serui-Laut', u'\r\n'),
-	(u'sev', u'', u'', u'', u'I', u'L', u'Nyarafolo Senoufo', u'\r\n'),
-	(u'sew', u'', u'', u'', u'I', u'L', u'Sewa Bay', u'\r\n'),
-	(u'sey', u'', u'', u'', u'I', u'L', u'Secoya', u'\r\n'),
-	(u'sez', u'', u'', u'', u'I', u'L', u'Senthang Chin', u'\r\n'),
-	(u'sfb', u'', u'', u'', u'I', u'L', u'Langue des signes de Belgique Francophone', u'\r\n'),
-	(u'sfm', u'', u'', u'', u'I', u'L', u'Small Flowery Miao', u'\r\n'),
-	(u'sfs', u'', u'', u'', u'I', u'L', u'South African Sign Language', u'\r\n'),
-	(u'sfw', u'', u'', u'', u'I', u'L', u'Sehwi', u'\r\n'),
-	(u'sga', u'sga', u'sga', u'', u'I', u'H', u'Old Irish (to 900)', u'\r\n'),
-	(u'sgb', u'', u'', u'', u'I', u'L', u'Mag-antsi Ayta', u'\r\n'),
-	(u'sgc', u'', u'', u'', u'I', u'L', u'Kipsigis', u'\r\n'),
-	(u'sgd', u'', u'', u'', u'I', u'L', u'Surigaonon', u'\r\n'),
-	(u'sge', u'', u'', u'', u'I', u'L', u'Segai', u'\r\n'),
-	(u'sgg', u'', u'', u'', u'I', u'L', u'Swiss-German Sign Language', u'\r\n'),
-	(u'sgh', u'', u'', u'', u'I', u'L', u'Shughni', u'\r\n'),
-	(u'sgi', u'', u'', u'', u'I', u'L', u'Suga', u'\r\n'),
-	(u'sgk', u'', u'', u'', u'I', u'L', u'Sangkong', u'\r\n'),
-	(u'sgm', u'', u'', u'', u'I', u'E', u'Singa', u'\r\n'),
-	(u'sgo', u'', u'', u'', u'I', u'L', u'Songa', u'\r\n'),
-	(u'sgp', u'', u'', u'', u'I', u'L', u'Singpho', u'\r\n'),
-	(u'sgr', u'', u'', u'', u'I', u'L', u'Sangisari', u'\r\n'),
-	(u'sgs', u'', u'', u'', u'I', u'L', u'Samogitian', u'\r\n'),
-	(u'sgt', u'', u'', u'', u'I', u'L', u'Brokpake', u'\r\n'),
-	(u'sgu', u'', u'', u'', u'I', u'L', u'Salas', u'\r\n'),
-	(u'sgw', u'', u'', u'', u'I', u'L', u'Sebat Bet Gurage', u'\r\n'),
-	(u'sgx', u'', u'', u'', u'I', u'L', u'Sierra Leone Sign Language', u'\r\n'),
-	(u'sgy', u'', u'', u'', u'I', u'L', u'Sanglechi', u'\r\n'),
-	(u'sgz', u'', u'', u'', u'I', u'L', u'Sursurunga', u'\r\n'),
-	(u'sha', u'', u'', u'', u'I', u'L', u'Shall-Zwall', u'\r\n'),
-	(u'shb', u'', u'', u'', u'I', u'L', u'Ninam', u'\r\n'),
-	(u'shc', u'', u'', u'', u'I', u'L', u'Sonde', u'\r\n'),
-	(u'shd', u'', u'', u'', u'I', u'L', u'Kundal Shahi', u'\r\n'),
-	(u'she', u'', u'', u'', u'I', u'L', u'Sheko', u'\r\n'),
-	(u'shg', u'', u'', u'', u'I', u'L', u'Shua', u'\r\n'),
-	(u'shh', u'', u'', u'', u'I', u'L', u'Shoshoni', u'\r\n'),
-	(u'shi', u'', u'', u'', u'I', u'L', u'Tachelhit', u'\r\n'),
-	(u'shj', u'', u'', u'', u'I', u'L', u'Shatt', u'\r\n'),
-	(u'shk', u'', u'', u'', u'I', u'L', u'Shilluk', u'\r\n'),
-	(u'shl', u'', u'', u'', u'I', u'L', u'Shendu', u'\r\n'),
-	(u'shm', u'', u'', u'', u'I', u'L', u'Shahrudi', u'\r\n'),
-	(u'shn', u'shn', u'shn', u'', u'I', u'L', u'Shan', u'\r\n'),
-	(u'sho', u'', u'', u'', u'I', u'L', u'Shanga', u'\r\n'),
-	(u'shp', u'', u'', u'', u'I', u'L', u'Shipibo-Conibo', u'\r\n'),
-	(u'shq', u'', u'', u'', u'I', u'L', u'Sala', u'\r\n'),
-	(u'shr', u'', u'', u'', u'I', u'L', u'Shi', u'\r\n'),
-	(u'shs', u'', u'', u'', u'I', u'L', u'Shuswap', u'\r\n'),
-	(u'sht', u'', u'', u'', u'I', u'E', u'Shasta', u'\r\n'),
-	(u'shu', u'', u'', u'', u'I', u'L', u'Chadian Arabic', u'\r\n'),
-	(u'shv', u'', u'', u'', u'I', u'L', u'Shehri', u'\r\n'),
-	(u'shw', u'', u'', u'', u'I', u'L', u'Shwai', u'\r\n'),
-	(u'shx', u'', u'', u'', u'I', u'L', u'She', u'\r\n'),
-	(u'shy', u'', u'', u'', u'I', u'L', u'Tachawit', u'\r\n'),
-	(u'shz', u'', u'', u'', u'I', u'L', u'Syenara Senoufo', u'\r\n'),
-	(u'sia', u'', u'', u'', u'I', u'E', u'Akkala Sami', u'\r\n'),
-	(u'sib', u'', u'', u'', u'I', u'L', u'Sebop', u'\r\n'),
-	(u'sid', u'sid', u'sid', u'', u'I', u'L', u'Sidamo', u'\r\n'),
-	(u'sie', u'', u'', u'', u'I', u'L', u'Simaa', u'\r\n'),
-	(u'sif', u'', u'', u'', u'I', u'L', u'Siamou', u'\r\n'),
-	(u'sig', u'', u'', u'', u'I', u'L', u'Paasaal', u'\r\n'),
-	(u'sih', u'', u'', u'', u'I', u'L', u'Zire', u'\r\n'),
-	(u'sii', u'', u'', u'', u'I', u'L', u'Shom Peng', u'\r\n'),
-	(u'sij', u'', u'', u'', u'I', u'L', u'Numbami', u'\r\n'),
-	(u'sik', u'', u'', u'', u'I', u'L', u'Sikiana', u'\r\n'),
-	(u'sil', u'', u'', u'', u'I', u'L', u'Tumulung Sisaala', u'\r\n'),
-	(u'sim', u'', u'', u'', u'I', u'L', u'Mende (Papua New Guinea)', u'\r\n'),
-	(u'sin', u'sin', u'sin', u'si', u'I', u'L', u'Sinhala', u'\r\n'),
-	(u'sip', u'', u'', u'', u'I', u'L', u'Sikkimese', u'\r\n'),
-	(u'siq', u'', u'', u'', u'I', u'L', u'Sonia', u'\r\n'),
-	(u'sir', u'', u'', u'', u'I', u'L', u'Siri', u'\r\n'),
-	(u'sis', u'', u'', u'', u'I', u'E', u'Siuslaw', u'\r\n'),
-	(u'siu', u'', u'', u'', u'I', u'L', u'Sinagen', u'\r\n'),
-	(u'siv', u'', u'', u'', u'I', u'L', u'Sumariup', u'\r\n'),
-	(u'siw', u'', u'', u'', u'I', u'L', u'Siwai', u'\r\n'),
-	(u'six', u'', u'', u'', u'I', u'L', u'Sumau', u'\r\n'),
-	(u'siy', u'', u'', u'', u'I', u'L', u'Sivandi', u'\r\n'),
-	(u'siz', u'', u'', u'', u'I', u'L', u'Siwi', u'\r\n'),
-	(u'sja', u'', u'', u'', u'I', u'L', u'Epena', u'\r\n'),
-	(u'sjb', u'', u'', u'', u'I', u'L', u'Sajau Basap', u'\r\n'),
-	(u'sjd', u'', u'', u'', u'I', u'L', u'Kildin Sami', u'\r\n'),
-	(u'sje', u'', u'', u'', u'I', u'L', u'Pite Sami', u'\r\n'),
-	(u'sjg', u'', u'', u'', u'I', u'L', u'Assangori', u'\r\n'),
-	(u'sjk', u'', u'', u'', u'I', u'E', u'Kemi Sami', u'\r\n'),
-	(u'sjl', u'', u'', u'', u'I', u'L', u'Sajalong', u'\r\n'),
-	(u'sjm', u'', u'', u'', u'I', u'L', u'Mapun', u'\r\n'),
-	(u'sjn', u'', u'', u'', u'I', u'C', u'Sindarin', u'\r\n'),
-	(u'sjo', u'', u'', u'', u'I', u'L', u'Xibe', u'\r\n'),
-	(u'sjp', u'', u'', u'', u'I', u'L', u'Surjapuri', u'\r\n'),
-	(u'sjr', u'', u'', u'', u'I', u'L', u'Siar-Lak', u'\r\n'),
-	(u'sjs', u'', u'', u'', u'I', u'E', u'Senhaja De Srair', u'\r\n'),
-	(u'sjt', u'', u'', u'', u'I', u'L', u'Ter Sami', u'\r\n'),
-	(u'sju', u'', u'', u'', u'I', u'L', u'Ume Sami', u'\r\n'),
-	(u'sjw', u'', u'', u'', u'I', u'L', u'Shawnee', u'\r\n'),
-	(u'ska', u'', u'', u'', u'I', u'L', u'Skagit', u'\r\n'),
-	(u'skb', u'', u'', u'', u'I', u'L', u'Saek', u'\r\n'),
-	(u'skc', u'', u'', u'', u'I', u'L', u'Sauk', u'\r\n'),
-	(u'skd', u'', u'', u'', u'I', u'L', u'Southern Sierra Miwok', u'\r\n'),
-	(u'ske', u'', u'', u'', u'I', u'L', u'Seke (Vanuatu)', u'\r\n'),
-	(u'skf', u'', u'', u'', u'I', u'L', u'Sakirabi\xe1', u'\r\n'),
-	(u'skg', u'', u'', u'', u'I', u'L', u'Sakalava Malagasy', u'\r\n'),
-	(u'skh', u'', u'', u'', u'I', u'L', u'Sikule', u'\r\n'),
-	(u'ski', u'', u'', u'', u'I', u'L', u'Sika', u'\r\n'),
-	(u'skj', u'', u'', u'', u'I', u'L', u'Seke (Nepal)', u'\r\n'),
-	(u'skk', u'', u'', u'', u'I', u'L', u'Sok', u'\r\n'),
-	(u'skm', u'', u'', u'', u'I', u'L', u'Sakam', u'\r\n'),
-	(u'skn', u'', u'', u'', u'I', u'L', u'Kolibugan Subanon', u'\r\n'),
-	(u'sko', u'', u'', u'', u'I', u'L', u'Seko Tengah', u'\r\n'),
-	(u'skp', u'', u'', u'', u'I', u'L', u'Sekapan', u'\r\n'),
-	(u'skq', u'', u'', u'', u'I', u'L', u'Sininkere', u'\r\n'),
-	(u'skr', u'', u'', u'', u'I', u'L', u'Seraiki', u'\r\n'),
-	(u'sks', u'', u'', u'', u'I', u'L', u'Maia', u'\r\n'),
-	(u'skt', u'', u'', u'', u'I', u'L', u'Sakata', u'\r\n'),
-	(u'sku', u'', u'', u'', u'I', u'L', u'Sakao', u'\r\n'),
-	(u'skv', u'', u'', u'', u'I', u'L', u'Skou', u'\r\n'),
-	(u'skw', u'', u'', u'', u'I', u'E', u'Skepi Creole Dutch', u'\r\n'),
-	(u'skx', u'', u'', u'', u'I', u'L', u'Seko Padang', u'\r\n'),
-	(u'sky', u'', u'', u'', u'I', u'L', u'Sikaiana', u'\r\n'),
-	(u'skz', u'', u'', u'', u'I', u'L', u'Sekar', u'\r\n'),
-	(u'slc', u'', u'', u'', u'I', u'L', u'S\xe1liba', u'\r\n'),
-	(u'sld', u'', u'', u'', u'I', u'L', u'Sissala', u'\r\n'),
-	(u'sle', u'', u'', u'', u'I', u'L', u'Sholaga', u'\r\n'),
-	(u'slf', u'', u'', u'', u'I', u'L', u'Swiss-Italian Sign Language', u'\r\n'),
-	(u'slg', u'', u'', u'', u'I', u'L', u'Selungai Murut', u'\r\n'),
-	(u'slh', u'', u'', u'', u'I', u'L', u'Southern Puget Sound Salish', u'\r\n'),
-	(u'sli', u'', u'', u'', u'I', u'L', u'Lower Silesian', u'\r\n'),
-	(u'slj', u'', u'', u'', u'I', u'L', u'Salum\xe1', u'\r\n'),
-	(u'slk', u'slo', u'slk', u'sk', u'I', u'L', u'Slovak', u'\r\n'),
-	(u'sll', u'', u'', u'', u'I', u'L', u'Salt-Yui', u'\r\n'),
-	(u'slm', u'', u'', u'', u'I', u'L', u'Pangutaran Sama', u'\r\n'),
-	(u'sln', u'', u'', u'', u'I', u'E', u'Salinan', u'\r\n'),
-	(u'slp', u'', u'', u'', u'I', u'L', u'Lamaholot', u'\r\n'),
-	(u'slq', u'', u'', u'', u'I', u'L', u'Salchuq', u'\r\n'),
-	(u'slr', u'', u'', u'', u'I', u'L', u'Salar', u'\r\n'),
-	(u'sls', u'', u'', u'', u'I', u'L', u'Singapore Sign Language', u'\r\n'),
-	(u'slt', u'', u'', u'', u'I', u'L', u'Sila', u'\r\n'),
-	(u'slu', u'', u'', u'', u'I', u'L', u'Selaru', u'\r\n'),
-	(u'slv', u'slv', u'slv', u'sl', u'I', u'L', u'Slovenian', u'\r\n'),
-	(u'slw', u'', u'', u'', u'I', u'L', u'Sialum', u'\r\n'),
-	(u'slx', u'', u'', u'', u'I', u'L', u'Salampasu', u'\r\n'),
-	(u'sly', u'', u'', u'', u'I', u'L', u'Selayar', u'\r\n'),
-	(u'slz', u'', u'', u'', u'I', u'L', u"Ma'ya", u'\r\n'),
-	(u'sma', u'sma', u'sma', u'', u'I', u'L', u'Southern Sami', u'\r\n'),
-	(u'smb', u'', u'', u'', u'I', u'L', u'Simbari', u'\r\n'),
-	(u'smc', u'', u'', u'', u'I', u'L', u'Som', u'\r\n'),
-	(u'smd', u'', u'', u'', u'I', u'L', u'Sama', u'\r\n'),
-	(u'sme', u'sme', u'sme', u'se', u'I', u'L', u'Northern Sami', u'\r\n'),
-	(u'smf', u'', u'', u'', u'I', u'L', u'Auwe', u'\r\n'),
-	(u'smg', u'', u'', u'', u'I', u'L', u'Simbali', u'\r\n'),
-	(u'smh', u'', u'', u'', u'I', u'L', u'Samei', u'\r\n'),
-	(u'smj', u'smj', u'smj', u'', u'I', u'L', u'Lule Sami', u'\r\n'),
-	(u'smk', u'', u'', u'', u'I', u'L', u'Bolinao', u'\r\n'),
-	(u'sml', u'', u'', u'', u'I', u'L', u'Central Sama', u'\r\n'),
-	(u'smm', u'', u'', u'', u'I', u'L', u'Musasa', u'\r\n'),
-	(u'smn', u'smn', u'smn', u'', u'I', u'L', u'Inari Sami', u'\r\n'),
-	(u'smo', u'smo', u'smo', u'sm', u'I', u'L', u'Samoan', u'\r\n'),
-	(u'smp', u'', u'', u'', u'I', u'E', u'Samaritan', u'\r\n'),
-	(u'smq', u'', u'', u'', u'I', u'L', u'Samo', u'\r\n'),
-	(u'smr', u'', u'', u'', u'I', u'L', u'Simeulue', u'\r\n'),
-	(u'sms', u'sms', u'sms', u'', u'I', u'L', u'Skolt Sami', u'\r\n'),
-	(u'smt', u'', u'', u'', u'I', u'L', u'Simte', u'\r\n'),
-	(u'smu', u'', u'', u'', u'I', u'E', u'Somray', u'\r\n'),
-	(u'smv', u'', u'', u'', u'I', u'L', u'Samvedi', u'\r\n'),
-	(u'smw', u'', u'', u'', u'I', u'L', u'Sumbawa', u'\r\n'),
-	(u'smx', u'', u'', u'', u'I', u'L', u'Samba', u'\r\n'),
-	(u'smy', u'', u'', u'', u'I', u'L', u'Semnani', u'\r\n'),
-	(u'smz', u'', u'', u'', u'I', u'L', u'Simeku', u'\r\n'),
-	(u'sna', u'sna', u'sna', u'sn', u'I', u'L', u'Shona', u'\r\n'),
-	(u'snb', u'', u'', u'', u'I', u'L', u'Sebuyau', u'\r\n'),
-	(u'snc', u'', u'', u'', u'I', u'L', u'Sinaugoro', u'\r\n'),
-	(u'snd', u'snd', u'snd', u'sd', u'I', u'L', u'Sindhi', u'\r\n'),
-	(u'sne', u'', u'', u'', u'I', u'L', u'Bau Bidayuh', u'\r\n'),
-	(u'snf', u'', u'', u'', u'I', u'L', u'Noon', u'\r\n'),
-	(u'sng', u'', u'', u'', u'I', u'L', u'Sanga (Democratic Republic of Congo)', u'\r\n'),
-	(u'snh', u'', u'', u'', u'I', u'E', u'Shinabo', u'\r\n'),
-	(u'sni', u'', u'', u'', u'I', u'E', u'Sensi', u'\r\n'),
-	(u'snj', u'', u'', u'', u'I', u'L', u'Riverain Sango', u'\r\n'),
-	(u'snk', u'snk', u'snk', u'', u'I', u'L', u'Soninke', u'\r\n'),
-	(u'snl', u'', u'', u'', u'I', u'L', u'Sangil', u'\r\n'),
-	(u'snm', u'', u'', u'', u'I', u'L', u"Southern Ma'di", u'\r\n'),
-	(u'snn', u'', u'', u'', u'I', u'L', u'Siona', u'\r\n'),
-	(u'sno', u'', u'', u'', u'I', u'L', u'Snohomish', u'\r\n'),
-	(u'snp', u'', u'', u'', u'I', u'L', u'Siane', u'\r\n'),
-	(u'snq', u'', u'', u'', u'I', u'L', u'Sangu (Gabon)', u'\r\n'),
-	(u'snr', u'', u'', u'', u'I', u'L', u'Sihan', u'\r\n'),
-	(u'sns', u'', u'', u'', u'I', u'L', u'South West Bay', u'\r\n'),
-	(u'snu', u'', u'', u'', u'I', u'L', u'Senggi', u'\r\n'),
-	(u'snv', u'', u'', u'', u'I', u'L', u"Sa'ban", u'\r\n'),
-	(u'snw', u'', u'', u'', u'I', u'L', u'Selee', u'\r\n'),
-	(u'snx', u'', u'', u'', u'I', u'L', u'Sam', u'\r\n'),
-	(u'sny', u'', u'', u'', u'I', u'L', u'Saniyo-Hiyewe', u'\r\n'),
-	(u'snz', u'', u'', u'', u'I', u'L', u'Sinsauru', u'\r\n'),
-	(u'soa', u'', u'', u'', u'I', u'L', u'Thai Song', u'\r\n'),
-	(u'sob', u'', u'', u'', u'I', u'L', u'Sobei', u'\r\n'),
-	(u'soc', u'', u'', u'', u'I', u'L', u'So (Democratic Republic of Congo)', u'\r\n'),
-	(u'sod', u'', u'', u'', u'I', u'L', u'Songoora', u'\r\n'),
-	(u'soe', u'', u'', u'', u'I', u'L', u'Songomeno', u'\r\n'),
-	(u'sog', u'sog', u'sog', u'', u'I', u'A', u'Sogdian', u'\r\n'),
-	(u'soh', u'', u'', u'', u'I', u'L', u'Aka', u'\r\n'),
-	(u'soi', u'', u'', u'', u'I', u'L', u'Sonha', u'\r\n'),
-	(u'soj', u'', u'', u'', u'I', u'L', u'Soi', u'\r\n'),
-	(u'sok', u'', u'', u'', u'I', u'L', u'Sokoro', u'\r\n'),
-	(u'sol', u'', u'', u'', u'I', u'L', u'Solos', u'\r\n'),
-	(u'som', u'som', u'som', u'so', u'I', u'L', u'Somali', u'\r\n'),
-	(u'soo', u'', u'', u'', u'I', u'L', u'Songo', u'\r\n'),
-	(u'sop', u'', u'', u'', u'I', u'L', u'Songe', u'\r\n'),
-	(u'soq', u'', u'', u'', u'I', u'L', u'Kanasi', u'\r\n'),
-	(u'sor', u'', u'', u'', u'I', u'L', u'Somrai', u'\r\n'),
-	(u'sos', u'', u'', u'', u'I', u'L', u'Seeku', u'\r\n'),
-	(u'sot', u'sot', u'sot', u'st', u'I', u'L', u'Southern Sotho', u'\r\n'),
-	(u'sou', u'', u'', u'', u'I', u'L', u'Southern Thai', u'\r\n'),
-	(u'sov', u'', u'', u'', u'I', u'L', u'Sonsorol', u'\r\n'),
-	(u'sow', u'', u'', u'', u'I', u'L', u'Sowanda', u'\r\n'),
-	(u'sox', u'', u'', u'', u'I', u'L', u'So (Cameroon)', u'\r\n'),
-	(u'soy', u'', u'', u'', u'I', u'L', u'Miyobe', u'\r\n'),
-	(u'soz', u'', u'', u'', u'I', u'L', u'Temi', u'\r\n'),
-	(u'spa', u'spa', u'spa', u'es', u'I', u'L', u'Spanish', u'\r\n'),
-	(u'spb', u'', u'', u'', u'I', u'L', u'Sepa (Indonesia)', u'\r\n'),
-	(u'spc', u'', u'', u'', u'I', u'L', u'Sap\xe9', u'\r\n'),
-	(u'spd', u'', u'', u'', u'I', u'L', u'Saep', u'\r\n'),
-	(u'spe', u'', u'', u'', u'I', u'L', u'Sepa (Papua New Guinea)', u'\r\n'),
-	(u'spg', u'', u'', u'', u'I', u'L', u'Sian', u'\r\n'),
-	(u'spi', u'', u'', u'', u'I', u'L', u'Saponi', u'\r\n'),
-	(u'spk', u'', u'', u'', u'I', u'L', u'Sengo', u'\r\n'),
-	(u'spl', u'', u'', u'', u'I', u'L', u'Selepet', u'\r\n'),
-	(u'spm', u'', u'', u'', u'I', u'L', u'Sepen', u'\r\n'),
-	(u'spo', u'', u'', u'', u'I', u'L', u'Spokane', u'\r\n'),
-	(u'spp', u'', u'', u'', u'I', u'L', u'Supyire Senoufo', u'\r\n'),
-	(u'spq', u'', u'', u'', u'I', u'L', u'Loreto-Ucayali Spanish', u'\r\n'),
-	(u'spr', u'', u'', u'', u'I', u'L', u'Saparua', u'\r\n'),
-	(u'sps', u'', u'', u'', u'I', u'L', u'Saposa', u'\r\n'),
-	(u'spt', u'', u'', u'', u'I', u'L', u'Spiti Bhoti', u'\r\n'),
-	(u'spu', u'', u'', u'', u'I', u'L', u'Sapuan', u'\r\n'),
-	(u'spx', u'', u'', u'', u'I', u'A', u'South Picene', u'\r\n'),
-	(u'spy', u'', u'', u'', u'I', u'L', u'Sabaot', u'\r\n'),
-	(u'sqa', u'', u'', u'', u'I', u'L', u'Shama-Sambuga', u'\r\n'),
-	(u'sqh', u'', u'', u'', u'I', u'L', u'Shau', u'\r\n'),
-	(u'sqi', u'alb', u'sqi', u'sq', u'M', u'L', u'Albanian', u'\r\n'),
-	(u'sqm', u'', u'', u'', u'I', u'L', u'Suma', u'\r\n'),
-	(u'sqn', u'', u'', u'', u'I', u'E', u'Susquehannock', u'\r\n'),
-	(u'sqo', u'', u'', u'', u'I', u'L', u'Sorkhei', u'\r\n'),
-	(u'sqq', u'', u'', u'', u'I', u'L', u'Sou', u'\r\n'),
-	(u'sqr', u'', u'', u'', u'I', u'H', u'Siculo Arabic', u'\r\n'),
-	(u'sqs', u'', u'', u'', u'I', u'L', u'Sri Lankan Sign Language', u'\r\n'),
-	(u'sqt', u'', u'', u'', u'I', u'L', u'Soqotri', u'\r\n'),
-	(u'squ', u'', u'', u'', u'I', u'L', u'Squamish', u'\r\n'),
-	(u'sra', u'', u'', u'', u'I', u'L', u'Saruga', u'\r\n'),
-	(u'srb', u'', u'', u'', u'I', u'L', u'Sora', u'\r\n'),
-	(u'src', u'', u'', u'', u'I', u'L', u'Logudorese Sardinian', u'\r\n'),
-	(u'srd', u'srd', u'srd', u'sc', u'M', u'L', u'Sardinian', u'\r\n'),
-	(u'sre', u'', u'', u'', u'I', u'L', u'Sara', u'\r\n'),
-	(u'srf', u'', u'', u'', u'I', u'L', u'Nafi', u'\r\n'),
-	(u'srg', u'', u'', u'', u'I', u'L', u'Sulod', u'\r\n'),
-	(u'srh', u'', u'', u'', u'I', u'L', u'Sarikoli', u'\r\n'),
-	(u'sri', u'', u'', u'', u'I', u'L', u'Siriano', u'\r\n'),
-	(u'srk', u'', u'', u'', u'I', u'L', u'Serudung Murut', u'\r\n'),
-	(u'srl', u'', u'', u'', u'I', u'L', u'Isirawa', u'\r\n'),
-	(u'srm', u'', u'', u'', u'I', u'L', u'Saramaccan', u'\r\n'),
-	(u'srn', u'srn', u'srn', u'', u'I', u'L', u'Sranan Tongo', u'\r\n'),
-	(u'sro', u'', u'', u'', u'I', u'L', u'Campidanese Sardinian', u'\r\n'),
-	(u'srp', u'srp', u'srp', u'sr', u'I', u'L', u'Serbian', u'\r\n'),
-	(u'srq', u'', u'', u'', u'I', u'L', u'Sirion\xf3', u'\r\n'),
-	(u'srr', u'srr', u'srr', u'', u'I', u'L', u'Serer', u'\r\n'),
-	(u'srs', u'', u'', u'', u'I', u'L', u'Sarsi', u'\r\n'),
-	(u'srt', u'', u'', u'', u'I', u'L', u'Sauri', u'\r\n'),
-	(u'sru', u'', u'', u'', u'I', u'L', u'Suru\xed', u'\r\n'),
-	(u'srv', u'', u'', u'', u'I', u'L', u'Southern Sorsoganon', u'\r\n'),
-	(u'srw', u'', u'', u'', u'I', u'L', u'Serua', u'\r\n'),
-	(u'srx', u'', u'', u'', u'I', u'L', u'Sirmauri', u'\r\n'),
-	(u'sry', u'', u'', u'', u'I', u'L', u'Sera', u'\r\n'),
-	(u'srz', u'', u'', u'', u'I', u'L', u'Shahmirzadi', u'\r\n'),
-	(u'ssb', u'', u'', u'', u'I', u'L', u'Southern Sama', u'\r\n'),
-	(u'ssc', u'', u'', u'', u'I', u'L', u'Suba-Simbiti', u'\r\n'),
-	(u'ssd', u'', u'', u'', u'I', u'L', u'Siroi', u'\r\n'),
-	(u'sse', u'', u'', u'', u'I', u'L', u'Balangingi', u'\r\n'),
-	(u'ssf', u'', u'', u'', u'I', u'L', u'Thao', u'\r\n'),
-	(u'ssg', u'', u'', u'', u'I', u'L', u'Seimat', u'\r\n'),
-	(u'ssh', u'', u'', u'', u'I', u'L', u'Shihhi Arabic', u'\r\n'),
-	(u'ssi', u'', u'', u'', u'I', u'L', u'Sansi', u'\r\n'),
-	(u'ssj', u'', u'', u'', u'I', u'L', u'Sausi', u'\r\n'),
-	(u'ssk', u'', u'', u'', u'I', u'L', u'Sunam', u'\r\n'),
-	(u'ssl', u'', u'', u'', u'I', u'L', u'Western Sisaala', u'\r\n'),
-	(u'ssm', u'', u'', u'', u'I', u'L', u'Semnam', u'\r\n'),
-	(u'ssn', u'', u'', u'', u'I', u'L', u'Waata', u'\r\n'),
-	(u'sso', u'', u'', u'', u'I', u'L', u'Sissano', u'\r\n'),
-	(u'ssp', u'', u'', u'', u'I', u'L', u'Spanish Sign Language', u'\r\n'),
-	(u'ssq', u'', u'', u'', u'I', u'L', u"So'a", u'\r\n'),
-	(u'ssr', u'', u'', u'', u'I', u'L', u'Swiss-French Sign Language', u'\r\n'),
-	(u'sss', u'', u'', u'', u'I', u'L', u'S\xf4', u'\r\n'),
-	(u'sst', u'', u'', u'', u'I', u'L', u'Sinasina', u'\r\n'),
-	(u'ssu', u'', u'', u'', u'I', u'L', u'Susuami', u'\r\n'),
-	(u'ssv', u'', u'', u'', u'I', u'L', u'Shark Bay', u'\r\n'),
-	(u'ssw', u'ssw', u'ssw', u'ss', u'I', u'L', u'Swati', u'\r\n'),
-	(u'ssx', u'', u'', u'', u'I', u'L', u'Samberigi', u'\r\n'),
-	(u'ssy', u'', u'', u'', u'I', u'L', u'Saho', u'\r\n'),
-	(u'ssz', u'', u'', u'', u'I', u'L', u'Sengseng', u'\r\n'),
-	(u'sta', u'', u'', u'', u'I', u'L', u'Settla', u'\r\n'),
-	(u'stb', u'', u'', u'', u'I', u'L', u'Northern Subanen', u'\r\n'),
-	(u'std', u'', u'', u'', u'I', u'L', u'Sentinel', u'\r\n'),
-	(u'ste', u'', u'', u'', u'I', u'L', u'Liana-Seti', u'\r\n'),
-	(u'stf', u'', u'', u'', u'I', u'L', u'Seta', u'\r\n'),
-	(u'stg', u'', u'', u'', u'I', u'L', u'Trieng', u'\r\n'),
-	(u'sth', u'', u'', u'', u'I', u'L', u'Shelta', u'\r\n'),
-	(u'sti', u'', u'', u'', u'I', u'L', u'Bulo Stieng', u'\r\n'),
-	(u'stj', u'', u'', u'', u'I', u'L', u'Matya Samo', u'\r\n'),
-	(u'stk', u'', u'', u'', u'I', u'L', u'Arammba', u'\r\n'),
-	(u'stl', u'', u'', u'', u'I', u'L', u'Stellingwerfs', u'\r\n'),
-	(u'stm', u'', u'', u'', u'I', u'L', u'Setaman', u'\r\n'),
-	(u'stn', u'', u'', u'', u'I', u'L', u'Owa', u'\r\n'),
-	(u'sto', u'', u'', u'', u'I', u'L', u'Stoney', u'\r\n'),
-	(u'stp', u'', u'', u'', u'I', u'L', u'Southeastern Tepehuan', u'\r\n'),
-	(u'stq', u'', u'', u'', u'I', u'L', u'Saterfriesisch', u'\r\n'),
-	(u'str', u'', u'', u'', u'I', u'L', u'Straits Salish', u'\r\n'),
-	(u'sts', u'', u'', u'', u'I', u'L', u'Shumashti', u'\r\n'),
-	(u'stt', u'', u'', u'', u'I', u'L', u'Budeh Stieng', u'\r\n'),
-	(u'stu', u'', u'', u'', u'I', u'L', u'Samtao', u'\r\n'),
-	(u'stv', u'', u'', u'', u'I', u'L', u"Silt'e", u'\r\n'),
-	(u'stw', u'', u'', u'', u'I', u'L', u'Satawalese', u'\r\n'),
-	(u'sua', u'', u'', u'', u'I', u'L', u'Sulka', u'\r\n'),
-	(u'sub', u'', u'', u'', u'I', u'L', u'Suku', u'\r\n'),
-	(u'suc', u'', u'', u'', u'I', u'L', u'Western Subanon', u'\r\n'),
-	(u'sue', u'', u'', u'', u'I', u'L', u'Suena', u'\r\n'),
-	(u'sug', u'', u'', u'', u'I', u'L', u'Suganga', u'\r\n'),
-	(u'sui', u'', u'', u'', u'I', u'L', u'Suki', u'\r\n'),
-	(u'suj', u'', u'', u'', u'I', u'L', u'Shubi', u'\r\n'),
-	(u'suk', u'suk', u'suk', u'', u'I', u'L', u'Sukuma', u'\r\n'),
-	(u'sun', u'sun', u'sun', u'su', u'I', u'L', u'Sundanese', u'\r\n'),
-	(u'suq', u'', u'', u'', u'I', u'L', u'Suri', u'\r\n'),
-	(u'sur', u'', u'', u'', u'I', u'L', u'Mwaghavul', u'\r\n'),
-	(u'sus', u'sus', u'sus', u'', u'I', u'L', u'Susu', u'\r\n'),
-	(u'sut', u'', u'', u'', u'I', u'E', u'Subtiaba', u'\r\n'),
-	(u'suv', u'', u'', u'', u'I', u'L', u'Sulung', u'\r\n'),
-	(u'suw', u'', u'', u'', u'I', u'L', u'Sumbwa', u'\r\n'),
-	(u'sux', u'sux', u'sux', u'', u'I', u'A', u'Sumerian', u'\r\n'),
-	(u'suy', u'', u'', u'', u'I', u'L', u'Suy\xe1', u'\r\n'),
-	(u'suz', u'', u'', u'', u'I', u'L', u'Sunwar', u'\r\n'),
-	(u'sva', u'', u'', u'', u'I', u'L', u'Svan', u'\r\n'),
-	(u'svb', u'', u'', u'', u'I', u'L', u'Ulau-Suain', u'\r\n'),
-	(u'svc', u'', u'', u'', u'I', u'L', u'Vincentian Creole English', u'\r\n'),
-	(u'sve', u'', u'', u'', u'I', u'L', u'Serili', u'\r\n'),
-	(u'svk', u'', u'', u'', u'I', u'L', u'Slovakian Sign Language', u'\r\n'),
-	(u'svr', u'', u'', u'', u'I', u'L', u'Savara', u'\r\n'),
-	(u'svs', u'', u'', u'', u'I', u'L', u'Savosavo', u'\r\n'),
-	(u'svx', u'', u'', u'', u'I', u'E', u'Skalvian', u'\r\n'),
-	(u'swa', u'swa', u'swa', u'sw', u'M', u'L', u'Swahili (macrolanguage)', u'\r\n'),
-	(u'swb', u'', u'', u'', u'I', u'L', u'Maore Comorian', u'\r\n'),
-	(u'swc', u'', u'', u'', u'I', u'L', u'Congo Swahili', u'\r\n'),
-	(u'swe', u'swe', u'swe', u'sv', u'I', u'L', u'Swedish', u'\r\n'),
-	(u'swf', u'', u'', u'', u'I', u'L', u'Sere', u'\r\n'),
-	(u'swg', u'', u'', u'', u'I', u'L', u'Swabian', u'\r\n'),
-	(u'swh', u'', u'', u'', u'I', u'L', u'Swahili (individual language)', u'\r\n'),
-	(u'swi', u'', u'', u'', u'I', u'L', u'Sui', u'\r\n'),
-	(u'swj', u'', u'', u'', u'I', u'L', u'Sira', u'\r\n'),
-	(u'swk', u'', u'', u'', u'I', u'L', u'Malawi Sena', u'\r\n'),
-	(u'swl', u'', u'', u'', u'I', u'L', u'Swedish Sign Language', u'\r\n'),
-	(u'swm', u'', u'', u'', u'I', u'L', u'Samosa', u'\r\n'),
-	(u'swn', u'', u'', u'', u'I', u'L', u'Sawknah', u'\r\n'),
-	(u'swo', u'', u'', u'', u'I', u'L', u'Shanenawa', u'\r\n'),
-	(u'swp', u'', u'', u'', u'I', u'L', u'Suau', u'\r\n'),
-	(u'swq', u'', u'', u'', u'I', u'L', u'Sharwa', u'\r\n'),
-	(u'swr', u'', u'', u'', u'I', u'L', u'Saweru', u'\r\n'),
-	(u'sws', u'', u'', u'', u'I', u'L', u'Seluwasan', u'\r\n'),
-	(u'swt', u'', u'', u'', u'I', u'L', u'Sawila', u'\r\n'),
-	(u'swu', u'', u'', u'', u'I', u'L', u'Suwawa', u'\r\n'),
-	(u'swv', u'', u'', u'', u'I', u'L', u'Shekhawati', u'\r\n'),
-	(u'sww', u'', u'', u'', u'I', u'E', u'Sowa', u'\r\n'),
-	(u'swx', u'', u'', u'', u'I', u'L', u'Suruah\xe1', u'\r\n'),
-	(u'swy', u'', u'', u'', u'I', u'L', u'Sarua', u'\r\n'),
-	(u'sxb', u'', u'', u'', u'I', u'L', u'Suba', u'\r\n'),
-	(u'sxc', u'', u'', u'', u'I', u'A', u'Sicanian', u'\r\n'),
-	(u'sxe', u'', u'', u'', u'I', u'L', u'Sighu', u'\r\n'),
-	(u'sxg', u'', u'', u'', u'I', u'L', u'Shixing', u'\r\n'),
-	(u'sxk', u'', u'', u'', u'I', u'E', u'Southern Kalapuya', u'\r\n'),
-	(u'sxl', u'', u'', u'', u'I', u'E', u'Selian', u'\r\n'),
-	(u'sxm', u'', u'', u'', u'I', u'L', u'Samre', u'\r\n'),
-	(u'sxn', u'', u'', u'', u'I', u'L', u'Sangir', u'\r\n'),
-	(u'sxo', u'', u'', u'', u'I', u'A', u'Sorothaptic', u'\r\n'),
-	(u'sxr', u'', u'', u'', u'I', u'L', u'Saaroa', u'\r\n'),
-	(u'sxs', u'', u'', u'', u'I', u'L', u'Sasaru', u'\r\n'),
-	(u'sxu', u'', u'', u'', u'I', u'L', u'Upper Saxon', u'\r\n'),
-	(u'sxw', u'', u'', u'', u'I', u'L', u'Saxwe Gbe', u'\r\n'),
-	(u'sya', u'', u'', u'', u'I', u'L', u'Siang', u'\r\n'),
-	(u'syb', u'', u'', u'', u'I', u'L', u'Central Subanen', u'\r\n'),
-	(u'syc', u'syc', u'syc', u'', u'I', u'H', u'Classical Syriac', u'\r\n'),
-	(u'syi', u'', u'', u'', u'I', u'L', u'Seki', u'\r\n'),
-	(u'syk', u'', u'', u'', u'I', u'L', u'Sukur', u'\r\n'),
-	(u'syl', u'', u'', u'', u'I', u'L', u'Sylheti', u'\r\n'),
-	(u'sym', u'', u'', u'', u'I', u'L', u'Maya Samo', u'\r\n'),
-	(u'syn', u'', u'', u'', u'I', u'L', u'Senaya', u'\r\n'),
-	(u'syo', u'', u'', u'', u'I', u'L', u'Suoy', u'\r\n'),
-	(u'syr', u'syr', u'syr', u'', u'M', u'L', u'Syriac', u'\r\n'),
-	(u'sys', u'', u'', u'', u'I', u'L', u'Sinyar', u'\r\n'),
-	(u'syw', u'', u'', u'', u'I', u'L', u'Kagate', u'\r\n'),
-	(u'syy', u'', u'', u'', u'I', u'L', u'Al-Sayyid Bedouin Sign Language', u'\r\n'),
-	(u'sza', u'', u'', u'', u'I', u'L', u'Semelai', u'\r\n'),
-	(u'szb', u'', u'', u'', u'I', u'L', u'Ngalum', u'\r\n'),
-	(u'szc', u'', u'', u'', u'I', u'L', u'Semaq Beri', u'\r\n'),
-	(u'szd', u'', u'', u'', u'I', u'E', u'Seru', u'\r\n'),
-	(u'sze', u'', u'', u'', u'I', u'L', u'Seze', u'\r\n'),
-	(u'szg', u'', u'', u'', u'I', u'L', u'Sengele', u'\r\n'),
-	(u'szl', u'', u'', u'', u'I', u'L', u'Silesian', u'\r\n'),
-	(u'szn', u'', u'', u'', u'I', u'L', u'Sula', u'\r\n'),
-	(u'szp', u'', u'', u'', u'I', u'L', u'Suabo', u'\r\n'),
-	(u'szv', u'', u'', u'', u'I', u'L', u'Isu (Fako Division)', u'\r\n'),
-	(u'szw', u'', u'', u'', u'I', u'L', u'Sawai', u'\r\n'),
-	(u'taa', u'', u'', u'', u'I', u'L', u'Lower Tanana', u'\r\n'),
-	(u'tab', u'', u'', u'', u'I', u'L', u'Tabassaran', u'\r\n'),
-	(u'tac', u'', u'', u'', u'I', u'L', u'Lowland Tarahumara', u'\r\n'),
-	(u'tad', u'', u'', u'', u'I', u'L', u'Tause', u'\r\n'),
-	(u'tae', u'', u'', u'', u'I', u'L', u'Tariana', u'\r\n'),
-	(u'taf', u'', u'', u'', u'I', u'L', u'Tapirap\xe9', u'\r\n'),
-	(u'tag', u'', u'', u'', u'I', u'L', u'Tagoi', u'\r\n'),
-	(u'tah', u'tah', u'tah', u'ty', u'I', u'L', u'Tahitian', u'\r\n'),
-	(u'taj', u'', u'', u'', u'I', u'L', u'Eastern Tamang', u'\r\n'),
-	(u'tak', u'', u'', u'', u'I', u'L', u'Tala', u'\r\n'),
-	(u'tal', u'', u'', u'', u'I', u'L', u'Tal', u'\r\n'),
-	(u'tam', u'tam', u'tam', u'ta', u'I', u'L', u'Tamil', u'\r\n'),
-	(u'tan', u'', u'', u'', u'I', u'L', u'Tangale', u'\r\n'),
-	(u'tao', u'', u'', u'', u'I', u'L', u'Yami', u'\r\n'),
-	(u'tap', u'', u'', u'', u'I', u'L', u'Taabwa', u'\r\n'),
-	(u'taq', u'', u'', u'', u'I', u'L', u'Tamasheq', u'\r\n'),
-	(u'tar', u'', u'', u'', u'I', u'L', u'Central Tarahumara', u'\r\n'),
-	(u'tas', u'', u'', u'', u'I', u'E', u'Tay Boi', u'\r\n'),
-	(u'tat', u'tat', u'tat', u'tt', u'I', u'L', u'Tatar', u'\r\n'),
-	(u'tau', u'', u'', u'', u'I', u'L', u'Upper Tanana', u'\r\n'),
-	(u'tav', u'', u'', u'', u'I', u'L', u'Tatuyo', u'\r\n'),
-	(u'taw', u'', u'', u'', u'I', u'L', u'Tai', u'\r\n'),
-	(u'tax', u'', u'', u'', u'I', u'L', u'Tamki', u'\r\n'),
-	(u'tay', u'', u'', u'', u'I', u'L', u'Atayal', u'\r\n'),
-	(u'taz', u'', u'', u'', u'I', u'L', u'Tocho', u'\r\n'),
-	(u'tba', u'', u'', u'', u'I', u'L', u'Aikan\xe3', u'\r\n'),
-	(u'tbb', u'', u'', u'', u'I', u'E', u'Tapeba', u'\r\n'),
-	(u'tbc', u'', u'', u'', u'I', u'L', u'Takia', u'\r\n'),
-	(u'tbd', u'', u'', u'', u'I', u'L', u'Kaki Ae', u'\r\n'),
-	(u'tbe', u'', u'', u'', u'I', u'L', u'Tanimbili', u'\r\n'),
-	(u'tbf', u'', u'', u'', u'I', u'L', u'Mandara', u'\r\n'),
-	(u'tbg', u'', u'', u'', u'I', u'L', u'North Tairora', u'\r\n'),
-	(u'tbh', u'', u'', u'', u'I', u'E', u'Thurawal', u'\r\n'),
-	(u'tbi', u'', u'', u'', u'I', u'L', u'Gaam', u'\r\n'),
-	(u'tbj', u'', u'', u'', u'I', u'L', u'Tiang', u'\r\n'),
-	(u'tbk', u'', u'', u'', u'I', u'L', u'Calamian Tagbanwa', u'\r\n'),
-	(u'tbl', u'', u'', u'', u'I', u'L', u'Tboli', u'\r\n'),
-	(u'tbm', u'', u'', u'', u'I', u'L', u'Tagbu', u'\r\n'),
-	(u'tbn', u'', u'', u'', u'I', u'L', u'Barro Negro Tunebo', u'\r\n'),
-	(u'tbo', u'', u'', u'', u'I', u'L', u'Tawala', u'\r\n'),
-	(u'tbp', u'', u'', u'', u'I', u'L', u'Taworta', u'\r\n'),
-	(u'tbr', u'', u'', u'', u'I', u'L', u'Tumtum', u'\r\n'),
-	(u'tbs', u'', u'', u'', u'I', u'L', u'Tanguat', u'\r\n'),
-	(u'tbt', u'', u'', u'', u'I', u'L', u'Tembo (Kitembo)', u'\r\n'),
-	(u'tbu', u'', u'', u'', u'I', u'E', u'Tubar', u'\r\n'),
-	(u'tbv', u'', u'', u'', u'I', u'L', u'Tobo', u'\r\n'),
-	(u'tbw', u'', u'', u'', u'I', u'L', u'Tagbanwa', u'\r\n'),
-	(u'tbx', u'', u'', u'', u'I', u'L', u'Kapin', u'\r\n'),
-	(u'tby', u'', u'', u'', u'I', u'L', u'Tabaru', u'\r\n'),
-	(u'tbz', u'', u'', u'', u'I', u'L', u'Ditammari', u'\r\n'),
-	(u'tca', u'', u'', u'', u'I', u'L', u'Ticuna', u'\r\n'),
-	(u'tcb', u'', u'', u'', u'I', u'L', u'Tanacross', u'\r\n'),
-	(u'tcc', u'', u'', u'', u'I', u'L', u'Datooga', u'\r\n'),
-	(u'tcd', u'', u'', u'', u'I', u'L', u'Tafi', u'\r\n'),
-	(u'tce', u'', u'', u'', u'I', u'L', u'Southern Tutchone', u'\r\n'),
-	(u'tcf', u'', u'', u'', u'I', u'L', u"Malinaltepec Me'phaa", u'\r\n'),
-	(u'tcg', u'', u'', u'', u'I', u'L', u'Tamagario', u'\r\n'),
-	(u'tch', u'', u'', u'', u'I', u'L', u'Turks And Caicos Creole English', u'\r\n'),
-	(u'tci', u'', u'', u'', u'I', u'L', u'W\xe1ra', u'\r\n'),
-	(u'tck', u'', u'', u'', u'I', u'L', u'Tchitchege', u'\r\n'),
-	(u'tcl', u'', u'', u'', u'I', u'E', u'Taman (Myanmar)', u'\r\n'),
-	(u'tcm', u'', u'', u'', u'I', u'L', u'Tanahmerah', u'\r\n'),
-	(u'tcn', u'', u'', u'', u'I', u'L', u'Tichurong', u'\r\n'),
-	(u'tco', u'', u'', u'', u'I', u'L', u'Taungyo', u'\r\n'),
-	(u'tcp', u'', u'', u'', u'I', u'L', u'Tawr Chin', u'\r\n'),
-	(u'tcq', u'', u'', u'', u'I', u'L', u'Kaiy', u'\r\n'),
-	(u'tcs', u'', u'', u'', u'I', u'L', u'Torres Strait Creole', u'\r\n'),
-	(u'tct', u'', u'', u'', u'I', u'L', u"T'en", u'\r\n'),
-	(u'tcu', u'', u'', u'', u'I', u'L', u'Southeastern Tarahumara', u'\r\n'),
-	(u'tcw', u'', u'', u'', u'I', u'L', u'Tecpatl\xe1n Totonac', u'\r\n'),
-	(u'tcx', u'', u'', u'', u'I', u'L', u'Toda', u'\r\n'),
-	(u'tcy', u'', u'', u'', u'I', u'L', u'Tulu', u'\r\n'),
-	(u'tcz', u'', u'', u'', u'I', u'L', u'Thado Chin', u'\r\n'),
-	(u'tda', u'', u'', u'', u'I', u'L', u'Tagdal', u'\r\n'),
-	(u'tdb', u'', u'', u'', u'I', u'L', u'Panchpargania', u'\r\n'),
-	(u'tdc', u'', u'', u'', u'I', u'L', u'Ember\xe1-Tad\xf3', u'\r\n'),
-	(u'tdd', u'', u'', u'', u'I', u'L', u'Tai N\xfca', u'\r\n'),
-	(u'tde', u'', u'', u'', u'I', u'L', u'Tiranige Diga Dogon', u'\r\n'),
-	(u'tdf', u'', u'', u'', u'I', u'L', u'Talieng', u'\r\n'),
-	(u'tdg', u'', u'', u'', u'I', u'L', u'Western Tamang', u'\r\n'),
-	(u'tdh', u'', u'', u'', u'I', u'L', u'Thulung', u'\r\n'),
-	(u'tdi', u'', u'', u'', u'I', u'L', u'Tomadino', u'\r\n'),
-	(u'tdj', u'', u'', u'', u'I', u'L', u'Tajio', u'\r\n'),
-	(u'tdk', u'', u'', u'', u'I', u'L', u'Tambas', u'\r\n'),
-	(u'tdl', u'', u'', u'', u'I', u'L', u'Sur', u'\r\n'),
-	(u'tdn', u'', u'', u'', u'I', u'L', u'Tondano', u'\r\n'),
-	(u'tdo', u'', u'', u'', u'I', u'L', u'Teme', u'\r\n'),
-	(u'tdq', u'', u'', u'', u'I', u'L', u'Tita', u'\r\n'),
-	(u'tdr', u'', u'', u'', u'I', u'L', u'Todrah', u'\r\n'),
-	(u'tds', u'', u'', u'', u'I', u'L', u'Doutai', u'\r\n'),
-	(u'tdt', u'', u'', u'', u'I', u'L', u'Tetun Dili', u'\r\n'),
-	(u'tdu', u'', u'', u'', u'I', u'L', u'Tempasuk Dusun', u'\r\n'),
-	(u'tdv', u'', u'', u'', u'I', u'L', u'Toro', u'\r\n'),
-	(u'tdx', u'', u'', u'', u'I', u'L', u'Tandroy-Mahafaly Malagasy', u'\r\n'),
-	(u'tdy', u'', u'', u'', u'I', u'L', u'Tadyawan', u'\r\n'),
-	(u'tea', u'', u'', u'', u'I', u'L', u'Temiar', u'\r\n'),
-	(u'teb', u'', u'', u'', u'I', u'E', u'Tetete', u'\r\n'),
-	(u'tec', u'', u'', u'', u'I', u'L', u'Terik', u'\r\n'),
-	(u'ted', u'', u'', u'', u'I', u'L', u'Tepo Krumen', u'\r\n'),
-	(u'tee', u'', u'', u'', u'I', u'L', u'Huehuetla Tepehua', u'\r\n'),
-	(u'tef', u'', u'', u'', u'I', u'L', u'Teressa', u'\r\n'),
-	(u'teg', u'', u'', u'', u'I', u'L', u'Teke-Tege', u'\r\n'),
-	(u'teh', u'', u'', u'', u'I', u'L', u'Tehuelche', u'\r\n'),
-	(u'tei', u'', u'', u'', u'I', u'L', u'Torricelli', u'\r\n'),
-	(u'tek', u'', u'', u'', u'I', u'L', u'Ibali Teke', u'\r\n'),
-	(u'tel', u'tel', u'tel', u'te', u'I', u'L', u'Telugu', u'\r\n'),
-	(u'tem', u'tem', u'tem', u'', u'I', u'L', u'Timne', u'\r\n'),
-	(u'ten', u'', u'', u'', u'I', u'E', u'Tama (Colombia)', u'\r\n'),
-	(u'teo', u'', u'', u'', u'I', u'L', u'Teso', u'\r\n'),
-	(u'tep', u'', u'', u'', u'I', u'E', u'Tepecano', u'\r\n'),
-	(u'teq', u'', u'', u'', u'I', u'L', u'Temein', u'\r\n'),
-	(u'ter', u'ter', u'ter', u'', u'I', u'L', u'Tereno', u'\r\n'),
-	(u'tes', u'', u'', u'', u'I', u'L', u'Tengger', u'\r\n'),
-	(u'tet', u'tet', u'tet', u'', u'I', u'L', u'Tetum', u'\r\n'),
-	(u'teu', u'', u'', u'', u'I', u'L', u'Soo', u'\r\n'),
-	(u'tev', u'', u'', u'', u'I', u'L', u'Teor', u'\r\n'),
-	(u'tew', u'', u'', u'', u'I', u'L', u'Tewa (USA)', u'\r\n'),
-	(u'tex', u'', u'', u'', u'I', u'L', u'Tennet', u'\r\n'),
-	(u'tey', u'', u'', u'', u'I', u'L', u'Tulishi', u'\r\n'),
-	(u'tfi', u'', u'', u'', u'I', u'L', u'Tofin Gbe', u'\r\n'),
-	(u'tfn', u'', u'', u'', u'I', u'L', u'Tanaina', u'\r\n'),
-	(u'tfo', u'', u'', u'', u'I', u'L', u'Tefaro', u'\r\n'),
-	(u'tfr', u'', u'', u'', u'I', u'L', u'Teribe', u'\r\n'),
-	(u'tft', u'', u'', u'', u'I', u'L', u'Ternate', u'\r\n'),
-	(u'tga', u'', u'', u'', u'I', u'L', u'Sagalla', u'\r\n'),
-	(u'tgb', u'', u'', u'', u'I', u'L', u'Tobilung', u'\r\n'),
-	(u'tgc', u'', u'', u'', u'I', u'L', u'Tigak', u'\r\n'),
-	(u'tgd', u'', u'', u'', u'I', u'L', u'Ciwogai', u'\r\n'),
-	(u'tge', u'', u'', u'', u'I', u'L', u'Eastern Gorkha Tamang', u'\r\n'),
-	(u'tgf', u'', u'', u'', u'I', u'L', u'Chalikha', u'\r\n'),
-	(u'tgg', u'', u'', u'', u'I', u'L', u'Tangga', u'\r\n'),
-	(u'tgh', u'', u'', u'', u'I', u'L', u'Tobagonian Creole English', u'\r\n'),
-	(u'tgi', u'', u'', u'', u'I', u'L', u'Lawunuia', u'\r\n'),
-	(u'tgk', u'tgk', u'tgk', u'tg', u'I', u'L', u'Tajik', u'\r\n'),
-	(u'tgl', u'tgl', u'tgl', u'tl', u'I', u'L', u'Tagalog', u'\r\n'),
-	(u'tgn', u'', u'', u'', u'I', u'L', u'Tandaganon', u'\r\n'),
-	(u'tgo', u'', u'', u'', u'I', u'L', u'Sudest', u'\r\n'),
-	(u'tgp', u'', u'', u'', u'I', u'L', u'Tangoa', u'\r\n'),
-	(u'tgq', u'', u'', u'', u'I', u'L', u'Tring', u'\r\n'),
-	(u'tgr', u'', u'', u'', u'I', u'L', u'Tareng', u'\r\n'),
-	(u'tgs', u'', u'', u'', u'I', u'L', u'Nume', u'\r\n'),
-	(u'tgt', u'', u'', u'', u'I', u'L', u'Central Tagbanwa', u'\r\n'),
-	(u'tgu', u'', u'', u'', u'I', u'L', u'Tanggu', u'\r\n'),
-	(u'tgv', u'', u'', u'', u'I', u'E', u'Tingui-Boto', u'\r\n'),
-	(u'tgw', u'', u'', u'', u'I', u'L', u'Tagwana Senoufo', u'\r\n'),
-	(u'tgx', u'', u'', u'', u'I', u'L', u'Tagish', u'\r\n'),
-	(u'tgy', u'', u'', u'', u'I', u'E', u'Togoyo', u'\r\n'),
-	(u'tha', u'tha', u'tha', u'th', u'I', u'L', u'Thai', u'\r\n'),
-	(u'thc', u'', u'', u'', u'I', u'L', u'Tai Hang Tong', u'\r\n'),
-	(u'thd', u'', u'', u'', u'I', u'L', u'Thayore', u'\r\n'),
-	(u'the', u'', u'', u'', u'I', u'L', u'Chitwania Tharu', u'\r\n'),
-	(u'thf', u'', u'', u'', u'I', u'L', u'Thangmi', u'\r\n'),
-	(u'thh', u'', u'', u'', u'I', u'L', u'Northern Tarahumara', u'\r\n'),
-	(u'thi', u'', u'', u'', u'I', u'L', u'Tai Long', u'\r\n'),
-	(u'thk', u'', u'', u'', u'I', u'L', u'Tharaka', u'\r\n'),
-	(u'thl', u'', u'', u'', u'I', u'L', u'Dangaura Tharu', u'\r\n'),
-	(u'thm', u'', u'', u'', u'I', u'L', u'Aheu', u'\r\n'),
-	(u'thn', u'', u'', u'', u'I', u'L', u'Thachanadan', u'\r\n'),
-	(u'thp', u'', u'', u'', u'I', u'L', u'Thompson', u'\r\n'),
-	(u'thq', u'', u'', u'', u'I', u'L', u'Kochila Tharu', u'\r\n'),
-	(u'thr', u'', u'', u'', u'I', u'L', u'Rana Tharu', u'\r\n'),
-	(u'ths', u'', u'', u'', u'I', u'L', u'Thakali', u'\r\n'),
-	(u'tht', u'', u'', u'', u'I', u'L', u'Tahltan', u'\r\n'),
-	(u'thu', u'', u'', u'', u'I', u'L', u'Thuri', u'\r\n'),
-	(u'thv', u'', u'', u'', u'I', u'L', u'Tahaggart Tamahaq', u'\r\n'),
-	(u'thw', u'', u'', u'', u'I', u'L', u'Thudam', u'\r\n'),
-	(u'thx', u'', u'', u'', u'I', u'L', u'The', u'\r\n'),
-	(u'thy', u'', u'', u'', u'I', u'L', u'Tha', u'\r\n'),
-	(u'thz', u'', u'', u'', u'I', u'L', u'Tayart Tamajeq', u'\r\n'),
-	(u'tia', u'', u'', u'', u'I', u'L', u'Tidikelt Tamazight', u'\r\n'),
-	(u'tic', u'', u'', u'', u'I', u'L', u'Tira', u'\r\n'),
-	(u'tid', u'', u'', u'', u'I', u'L', u'Tidong', u'\r\n'),
-	(u'tie', u'', u'', u'', u'I', u'L', u'Tingal', u'\r\n'),
-	(u'tif', u'', u'', u'', u'I', u'L', u'Tifal', u'\r\n'),
-	(u'tig', u'tig', u'tig', u'', u'I', u'L', u'Tigre', u'\r\n'),
-	(u'tih', u'', u'', u'', u'I', u'L', u'Timugon Murut', u'\r\n'),
-	(u'tii', u'', u'', u'', u'I', u'L', u'Tiene', u'\r\n'),
-	(u'tij', u'', u'', u'', u'I', u'L', u'Tilung', u'\r\n'),
-	(u'tik', u'', u'', u'', u'I', u'L', u'Tikar', u'\r\n'),
-	(u'til', u'', u'', u'', u'I', u'E', u'Tillamook', u'\r\n'),
-	(u'tim', u'', u'', u'', u'I', u'L', u'Timbe', u'\r\n'),
-	(u'tin', u'', u'', u'', u'I', u'L', u'Tindi', u'\r\n'),
-	(u'tio', u'', u'', u'', u'I', u'L', u'Teop', u'\r\n'),
-	(u'tip', u'', u'', u'', u'I', u'L', u'Trimuris', u'\r\n'),
-	(u'tiq', u'', u'', u'', u'I', u'L', u'Ti\xe9fo', u'\r\n'),
-	(u'tir', u'tir', u'tir', u'ti', u'I', u'L', u'Tigrinya', u'\r\n'),
-	(u'tis', u'', u'', u'', u'I', u'L', u'Masadiit Itneg', u'\r\n'),
-	(u'tit', u'', u'', u'', u'I', u'L', u'Tinigua', u'\r\n'),
-	(u'tiu', u'', u'', u'', u'I', u'L', u'Adasen', u'\r\n'),
-	(u'tiv', u'tiv', u'tiv', u'', u'I', u'L', u'Tiv', u'\r\n'),
-	(u'tiw', u'', u'', u'', u'I', u'L', u'Tiwi', u'\r\n'),
-	(u'tix', u'', u'', u'', u'I', u'L', u'Southern Tiwa', u'\r\n'),
-	(u'tiy', u'', u'', u'', u'I', u'L', u'Tiruray', u'\r\n'),
-	(u'tiz', u'', u'', u'', u'I', u'L', u'Tai Hongjin', u'\r\n'),
-	(u'tja', u'', u'', u'', u'I', u'L', u'Tajuasohn', u'\r\n'),
-	(u'tjg', u'', u'', u'', u'I', u'L', u'Tunjung', u'\r\n'),
-	(u'tji', u'', u'', u'', u'I', u'L', u'Northern Tujia', u'\r\n'),
-	(u'tjm', u'', u'', u'', u'I', u'E', u'Timucua', u'\r\n'),
-	(u'tjn', u'', u'', u'', u'I', u'E', u'Tonjon', u'\r\n'),
-	(u'tjo', u'', u'', u'', u'I', u'L', u'Temacine Tamazight', u'\r\n'),
-	(u'tjs', u'', u'', u'', u'I', u'L', u'Southern Tujia', u'\r\n'),
-	(u'tju', u'', u'', u'', u'I', u'E', u'Tjurruru', u'\r\n'),
-	(u'tka', u'', u'', u'', u'I', u'E', u'Truk\xe1', u'\r\n'),
-	(u'tkb', u'', u'', u'', u'I', u'L', u'Buksa', u'\r\n'),
-	(u'tkd', u'', u'', u'', u'I', u'L', u'Tukudede', u'\r\n'),
-	(u'tke', u'', u'', u'', u'I', u'L', u'Takwane', u'\r\n'),
-	(u'tkf', u'', u'', u'', u'I', u'E', u'Tukumanf\xe9d', u'\r\n'),
-	(u'tkk', u'', u'', u'', u'I', u'L', u'Takpa', u'\r\n'),
-	(u'tkl', u'tkl', u'tkl', u'', u'I', u'L', u'Tokelau', u'\r\n'),
-	(u'tkm', u'', u'', u'', u'I', u'E', u'Takelma', u'\r\n'),
-	(u'tkn', u'', u'', u'', u'I', u'L', u'Toku-No-Shima', u'\r\n'),
-	(u'tkp', u'', u'', u'', u'I', u'L', u'Tikopia', u'\r\n'),
-	(u'tkq', u'', u'', u'', u'I', u'L', u'Tee', u'\r\n'),
-	(u'tkr', u'', u'', u'', u'I', u'L', u'Tsakhur', u'\r\n'),
-	(u'tks', u'', u'', u'', u'I', u'L', u'Takestani', u'\r\n'),
-	(u'tkt', u'', u'', u'', u'I', u'L', u'Kathoriya Tharu', u'\r\n'),
-	(u'tku', u'', u'', u'', u'I', u'L', u'Upper Necaxa Totonac', u'\r\n'),
-	(u'tkw', u'', u'', u'', u'I', u'L', u'Teanu', u'\r\n'),
-	(u'tkx', u'', u'', u'', u'I', u'L', u'Tangko', u'\r\n'),
-	(u'tkz', u'', u'', u'', u'I', u'L', u'Takua', u'\r\n'),
-	(u'tla', u'', u'', u'', u'I', u'L', u'Southwestern Tepehuan', u'\r\n'),
-	(u'tlb', u'', u'', u'', u'I', u'L', u'Tobelo', u'\r\n'),
-	(u'tlc', u'', u'', u'', u'I', u'L', u'Yecuatla Totonac', u'\r\n'),
-	(u'tld', u'', u'', u'', u'I', u'L', u'Talaud', u'\r\n'),
-	(u'tlf', u'', u'', u'', u'I', u'L', u'Telefol', u'\r\n'),
-	(u'tlg', u'', u'', u'', u'I', u'L', u'Tofanma', u'\r\n'),
-	(u'tlh', u'tlh', u'tlh', u'', u'I', u'C', u'Klingon', u'\r\n'),
-	(u'tli', u'tli', u'tli', u'', u'I', u'L', u'Tlingit', u'\r\n'),
-	(u'tlj', u'', u'', u'', u'I', u'L', u'Talinga-Bwisi', u'\r\n'),
-	(u'tlk', u'', u'', u'', u'I', u'L', u'Taloki', u'\r\n'),
-	(u'tll', u'', u'', u'', u'I', u'L', u'Tetela', u'\r\n'),
-	(u'tlm', u'', u'', u'', u'I', u'L', u'Tolomako', u'\r\n'),
-	(u'tln', u'', u'', u'', u'I', u'L', u"Talondo'", u'\r\n'),
-	(u'tlo', u'', u'', u'', u'I', u'L', u'Talodi', u'\r\n'),
-	(u'tlp', u'', u'', u'', u'I', u'L', u'Filomena Mata-Coahuitl\xe1n Totonac', u'\r\n'),
-	(u'tlq', u'', u'', u'', u'I', u'L', u'Tai Loi', u'\r\n'),
-	(u'tlr', u'', u'', u'', u'I', u'L', u'Talise', u'\r\n'),
-	(u'tls', u'', u'', u'', u'I', u'L', u'Tambotalo', u'\r\n'),
-	(u'tlt', u'', u'', u'', u'I', u'L', u'Teluti', u'\r\n'),
-	(u'tlu', u'', u'', u'', u'I', u'L', u'Tulehu', u'\r\n'),
-	(u'tlv', u'', u'', u'', u'I', u'L', u'Taliabu', u'\r\n'),
-	(u'tlw', u'', u'', u'', u'I', u'L', u'South Wemale', u'\r\n'),
-	(u'tlx', u'', u'', u'', u'I', u'L', u'Khehek', u'\r\n'),
-	(u'tly', u'', u'', u'', u'I', u'L', u'Talysh', u'\r\n'),
-	(u'tma', u'', u'', u'', u'I', u'L', u'Tama (Chad)', u'\r\n'),
-	(u'tmb', u'', u'', u'', u'I', u'L', u'Katbol', u'\r\n'),
-	(u'tmc', u'', u'', u'', u'I', u'L', u'Tumak', u'\r\n'),
-	(u'tmd', u'', u'', u'', u'I', u'L', u'Haruai', u'\r\n'),
-	(u'tme', u'', u'', u'', u'I', u'E', u'Trememb\xe9', u'\r\n'),
-	(u'tmf', u'', u'', u'', u'I', u'L', u'Toba-Maskoy', u'\r\n'),
-	(u'tmg', u'', u'', u'', u'I', u'E', u'Ternate\xf1o', u'\r\n'),
-	(u'tmh', u'tmh', u'tmh', u'', u'M', u'L', u'Tamashek', u'\r\n'),
-	(u'tmi', u'', u'', u'', u'I', u'L', u'Tutuba', u'\r\n'),
-	(u'tmj', u'', u'', u'', u'I', u'L', u'Samarokena', u'\r\n'),
-	(u'tmk', u'', u'', u'', u'I', u'L', u'Northwestern Tamang', u'\r\n'),
-	(u'tml', u'', u'', u'', u'I', u'L', u'Tamnim Citak', u'\r\n'),
-	(u'tmm', u'', u'', u'', u'I', u'L', u'Tai Thanh', u'\r\n'),
-	(u'tmn', u'', u'', u'', u'I', u'L', u'Taman (Indonesia)', u'\r\n'),
-	(u'tmo', u'', u'', u'', u'I', u'L', u'Temoq', u'\r\n'),
-	(u'tmp', u'', u'', u'', u'I', u'L', u'Tai M\xe8ne', u'\r\n'),
-	(u'tmq', u'', u'', u'', u'I', u'L', u'Tumleo', u'\r\n'),
-	(u'tmr', u'', u'', u'', u'I', u'E', u'Jewish Babylonian Aramaic (ca. 200-1200 CE)', u'\r\n'),
-	(u'tms', u'', u'', u'', u'I', u'L', u'Tima', u'\r\n'),
-	(u'tmt', u'', u'', u'', u'I', u'L', u'Tasmate', u'\r\n'),
-	(u'tmu', u'', u'', u'', u'I', u'L', u'Iau', u'\r\n'),
-	(u'tmv', u'', u'', u'', u'I', u'L', u'Tembo (Motembo)', u'\r\n'),
-	(u'tmw', u'', u'', u'', u'I', u'L', u'Temuan', u'\r\n'),
-	(u'tmy', u'', u'', u'', u'I', u'L', u'Tami', u'\r\n'),
-	(u'tmz', u'', u'', u'', u'I', u'E', u'Tamanaku', u'\r\n'),
-	(u'tna', u'', u'', u'', u'I', u'L', u'Tacana', u'\r\n'),
-	(u'tnb', u'', u'', u'', u'I', u'L', u'Western Tunebo', u'\r\n'),
-	(u'tnc', u'', u'', u'', u'I', u'L', u'Tanimuca-Retuar\xe3', u'\r\n'),
-	(u'tnd', u'', u'', u'', u'I', u'L', u'Angosturas Tunebo', u'\r\n'),
-	(u'tne', u'', u'', u'', u'I', u'L', u'Tinoc Kallahan', u'\r\n'),
-	(u'tng', u'', u'', u'', u'I', u'L', u'Tobanga', u'\r\n'),
-	(u'tnh', u'', u'', u'', u'I', u'L', u'Maiani', u'\r\n'),
-	(u'tni', u'', u'', u'', u'I', u'L', u'Tandia', u'\r\n'),
-	(u'tnk', u'', u'', u'', u'I', u'L', u'Kwamera', u'\r\n'),
-	(u'tnl', u'', u'', u'', u'I', u'L', u'Lenakel', u'\r\n'),
-	(u'tnm', u'', u'', u'', u'I', u'L', u'Tabla', u'\r\n'),
-	(u'tnn', u'', u'', u'', u'I', u'L', u'North Tanna', u'\r\n'),
-	(u'tno', u'', u'', u'', u'I', u'L', u'Toromono', u'\r\n'),
-	(u'tnp', u'', u'', u'', u'I', u'L', u'Whitesands', u'\r\n'),
-	(u'tnq', u'', u'', u'', u'I', u'E', u'Taino', u'\r\n'),
-	(u'tnr', u'', u'', u'', u'I', u'L', u'Bedik', u'\r\n'),
-	(u'tns', u'', u'', u'', u'I', u'L', u'Tenis', u'\r\n'),
-	(u'tnt', u'', u'', u'', u'I', u'L', u'Tontemboan', u'\r\n'),
-	(u'tnu', u'', u'', u'', u'I', u'L', u'Tay Khang', u'\r\n'),
-	(u'tnv', u'', u'', u'', u'I', u'L', u'Tangchangya', u'\r\n'),
-	(u'tnw', u'', u'', u'', u'I', u'L', u'Tonsawang', u'\r\n'),
-	(u'tnx', u'', u'', u'', u'I', u'L', u'Tanema', u'\r\n'),
-	(u'tny', u'', u'', u'', u'I', u'L', u'Tongwe', u'\r\n'),
-	(u'tnz', u'', u'', u'', u'I', u'L', u'Tonga (Thailand)', u'\r\n'),
-	(u'tob', u'', u'', u'', u'I', u'L', u'Toba', u'\r\n'),
-	(u'toc', u'', u'', u'', u'I', u'L', u'Coyutla Totonac', u'\r\n'),
-	(u'tod', u'', u'', u'', u'I', u'L', u'Toma', u'\r\n'),
-	(u'toe', u'', u'', u'', u'I', u'E', u'Tomedes', u'\r\n'),
-	(u'tof', u'', u'', u'', u'I', u'L', u'Gizrra', u'\r\n'),
-	(u'tog', u'tog', u'tog', u'', u'I', u'L', u'Tonga (Nyasa)', u'\r\n'),
-	(u'toh', u'', u'', u'', u'I', u'L', u'Gitonga', u'\r\n'),
-	(u'toi', u'', u'', u'', u'I', u'L', u'Tonga (Zambia)', u'\r\n'),
-	(u'toj', u'', u'', u'', u'I', u'L', u'Tojolabal', u'\r\n'),
-	(u'tol', u'', u'', u'', u'I', u'L', u'Tolowa', u'\r\n'),
-	(u'tom', u'', u'', u'', u'I', u'L', u'Tombulu', u'\r\n'),
-	(u'ton', u'ton', u'ton', u'to', u'I', u'L', u'Tonga (Tonga Islands)', u'\r\n'),
-	(u'too', u'', u'', u'', u'I', u'L', u'Xicotepec De Ju\xe1rez Totonac', u'\r\n'),
-	(u'top', u'', u'', u'', u'I', u'L', u'Papantla Totonac', u'\r\n'),
-	(u'toq', u'', u'', u'', u'I', u'L', u'Toposa', u'\r\n'),
-	(u'tor', u'', u'', u'', u'I', u'L', u'Togbo-Vara Banda', u'\r\n'),
-	(u'tos', u'', u'', u'', u'I', u'L', u'Highland Totonac', u'\r\n'),
-	(u'tou', u'', u'', u'', u'I', u'L', u'Tho', u'\r\n'),
-	(u'tov', u'', u'', u'', u'I', u'L', u'Upper Taromi', u'\r\n'),
-	(u'tow', u'', u'', u'', u'I', u'L', u'Jemez', u'\r\n'),
-	(u'tox', u'', u'', u'', u'I', u'L', u'Tobian', u'\r\n'),
-	(u'toy', u'', u'', u'', u'I', u'L', u'Topoiyo', u'\r\n'),
-	(u'toz', u'', u'', u'', u'I', u'L', u'To', u'\r\n'),
-	(u'tpa', u'', u'', u'', u'I', u'L', u'Taupota', u'\r\n'),
-	(u'tpc', u'', u'', u'', u'I', u'L', u"Azoy\xfa Me'phaa", u'\r\n'),
-	(u'tpe', u'', u'', u'', u'I', u'L', u'Tippera', u'\r\n'),
-	(u'tpf', u'', u'', u'', u'I', u'L', u'Tarpia', u'\r\n'),
-	(u'tpg', u'', u'', u'', u'I', u'L', u'Kula', u'\r\n'),
-	(u'tpi', u'tpi', u'tpi', u'', u'I', u'L', u'Tok Pisin', u'\r\n'),
-	(u'tpj', u'', u'', u'', u'I', u'L', u'Tapiet\xe9', u'\r\n'),
-	(u'tpk', u'', u'', u'', u'I', u'E', u'Tupinikin', u'\r\n'),
-	(u'tpl', u'', u'', u'', u'I', u'L', u"Tlacoapa Me'phaa", u'\r\n'),
-	(u'tpm', u'', u'', u'', u'I', u'L', u'Tampulma', u'\r\n'),
-	(u'tpn', u'', u'', u'', u'I', u'E', u'Tupinamb\xe1', u'\r\n'),
-	(u'tpo', u'', u'', u'', u'I', u'L', u'Tai Pao', u'\r\n'),
-	(u'tpp', u'', u'', u'', u'I', u'L', u'Pisaflores Tepehua', u'\r\n'),
-	(u'tpq', u'', u'', u'', u'I', u'L', u'Tukpa', u'\r\n'),
-	(u'tpr', u'', u'', u'', u'I', u'L', u'Tupar\xed', u'\r\n'),
-	(u'tpt', u'', u'', u'', u'I', u'L', u'Tlachichilco Tepehua', u'\r\n'),
-	(u'tpu', u'', u'', u'', u'I', u'L', u'Tampuan', u'\r\n'),
-	(u'tpv', u'', u'', u'', u'I', u'L', u'Tanapag', u'\r\n'),
-	(u'tpw', u'', u'', u'', u'I', u'E', u'Tup\xed', u'\r\n'),
-	(u'tpx', u'', u'', u'', u'I', u'L', u"Acatepec Me'phaa", u'\r\n'),
-	(u'tpy', u'', u'', u'', u'I', u'L', u'Trumai', u'\r\n'),
-	(u'tpz', u'', u'', u'', u'I', u'L', u'Tinputz', u'\r\n'),
-	(u'tqb', u'', u'', u'', u'I', u'L', u'Temb\xe9', u'\r\n'),
-	(u'tql', u'', u'', u'', u'I', u'L', u'Lehali', u'\r\n'),
-	(u'tqm', u'', u'', u'', u'I', u'L', u'Turumsa', u'\r\n'),
-	(u'tqn', u'', u'', u'', u'I', u'L', u'Tenino', u'\r\n'),
-	(u'tqo', u'', u'', u'', u'I', u'L', u'Toaripi', u'\r\n'),
-	(u'tqp', u'', u'', u'', u'I', u'L', u'Tomoip', u'\r\n'),
-	(u'tqq', u'', u'', u'', u'I', u'L', u'Tunni', u'\r\n'),
-	(u'tqr', u'', u'', u'', u'I', u'E', u'Torona', u'\r\n'),
-	(u'tqt', u'', u'', u'', u'I', u'L', u'Western Totonac', u'\r\n'),
-	(u'tqu', u'', u'', u'', u'I', u'L', u'Touo', u'\r\n'),
-	(u'tqw', u'', u'', u'', u'I', u'E', u'Tonkawa', u'\r\n'),
-	(u'tra', u'', u'', u'', u'I', u'L', u'Tirahi', u'\r\n'),
-	(u'trb', u'', u'', u'', u'I', u'L', u'Terebu', u'\r\n'),
-	(u'trc', u'', u'', u'', u'I', u'L', u'Copala Triqui', u'\r\n'),
-	(u'trd', u'', u'', u'', u'I', u'L', u'Turi', u'\r\n'),
-	(u'tre', u'', u'', u'', u'I', u'L', u'East Tarangan', u'\r\n'),
-	(u'trf', u'', u'', u'', u'I', u'L', u'Trinidadian Creole English', u'\r\n'),
-	(u'trg', u'', u'', u'', u'I', u'L', u'Lish\xe1n Did\xe1n', u'\r\n'),
-	(u'trh', u'', u'', u'', u'I', u'L', u'Turaka', u'\r\n'),
-	(u'tri', u'', u'', u'', u'I', u'L', u'Tri\xf3', u'\r\n'),
-	(u'trj', u'', u'', u'', u'I', u'L', u'Toram', u'\r\n'),
-	(u'trl', u'', u'', u'', u'I', u'L', u'Traveller Scottish', u'\r\n'),
-	(u'trm', u'', u'', u'', u'I', u'L', u'Tregami', u'\r\n'),
-	(u'trn', u'', u'', u'', u'I', u'L', u'Trinitario', u'\r\n'),
-	(u'tro', u'', u'', u'', u'I', u'L', u'Tarao Naga', u'\r\n'),
-	(u'trp', u'', u'', u'', u'I', u'L', u'Kok Borok', u'\r\n'),
-	(u'trq', u'', u'', u'', u'I', u'L', u'San Mart\xedn Itunyoso Triqui', u'\r\n'),
-	(u'trr', u'', u'', u'', u'I', u'L', u'Taushiro', u'\r\n'),
-	(u'trs', u'', u'', u'', u'I', u'L', u'Chicahuaxtla Triqui', u'\r\n'),
-	(u'trt', u'', u'', u'', u'I', u'L', u'Tunggare', u'\r\n'),
-	(u'tru', u'', u'', u'', u'I', u'L', u'Turoyo', u'\r\n'),
-	(u'trv', u'', u'', u'', u'I', u'L', u'Taroko', u'\r\n'),
-	(u'trw', u'', u'', u'', u'I', u'L', u'Torwali', u'\r\n'),
-	(u'trx', u'', u'', u'', u'I', u'L', u'Tringgus-Sembaan Bidayuh', u'\r\n'),
-	(u'try', u'', u'', u'', u'I', u'E', u'Turung', u'\r\n'),
-	(u'trz', u'', u'', u'', u'I', u'E', u'Tor\xe1', u'\r\n'),
-	(u'tsa', u'', u'', u'', u'I', u'L', u'Tsaangi', u'\r\n'),
-	(u'tsb', u'', u'', u'', u'I', u'L', u'Tsamai', u'\r\n'),
-	(u'tsc', u'', u'', u'', u'I', u'L', u'Tswa', u'\r\n'),
-	(u'tsd', u'', u'', u'', u'I', u'L', u'Tsakonian', u'\r\n'),
-	(u'tse', u'', u'', u'', u'I', u'L', u'Tunisian Sign Language', u'\r\n'),
-	(u'tsf', u'', u'', u'', u'I', u'L', u'Southwestern Tamang', u'\r\n'),
-	(u'tsg', u'', u'', u'', u'I', u'L', u'Tausug', u'\r\n'),
-	(u'tsh', u'', u'', u'', u'I', u'L', u'Tsuvan', u'\r\n'),
-	(u'tsi', u'tsi', u'tsi', u'', u'I', u'L', u'Tsimshian', u'\r\n'),
-	(u'tsj', u'', u'', u'', u'I', u'L', u'Tshangla', u'\r\n'),
-	(u'tsk', u'', u'', u'', u'I', u'L', u'Tseku', u'\r\n'),
-	(u'tsl', u'', u'', u'', u'I', u'L', u"Ts'\xfcn-Lao", u'\r\n'),
-	(u'tsm', u'', u'', u'', u'I', u'L', u'Turkish Sign Language', u'\r\n'),
-	(u'tsn', u'tsn', u'tsn', u'tn', u'I', u'L', u'Tswana', u'\r\n'),
-	(u'tso', u'tso', u'tso', u'ts', u'I', u'L', u'Tsonga', u'\r\n'),
-	(u'tsp', u'', u'', u'', u'I', u'L', u'Northern Toussian', u'\r\n'),
-	(u'tsq', u'', u'', u'', u'I', u'L', u'Thai Sign Language', u'\r\n'),
-	(u'tsr', u'', u'', u'', u'I', u'L', u'Akei', u'\r\n'),
-	(u'tss', u'', u'', u'', u'I', u'L', u'Taiwan Sign Language', u'\r\n'),
-	(u'tsu', u'', u'', u'', u'I', u'L', u'Tsou', u'\r\n'),
-	(u'tsv', u'', u'', u'', u'I', u'L', u'Tsogo', u'\r\n'),
-	(u'tsw', u'', u'', u'', u'I', u'L', u'Tsishingini', u'\r\n'),
-	(u'tsx', u'', u'', u'', u'I', u'L', u'Mubami', u'\r\n'),
-	(u'tsy', u'', u'', u'', u'I', u'L', u'Tebul Sign Language', u'\r\n'),
-	(u'tsz', u'', u'', u'', u'I', u'L', u'Purepecha', u'\r\n'),
-	(u'tta', u'', u'', u'', u'I', u'E', u'Tutelo', u'\r\n'),
-	(u'ttb', u'', u'', u'', u'I', u'L', u'Gaa', u'\r\n'),
-	(u'ttc', u'', u'', u'', u'I', u'L', u'Tektiteko', u'\r\n'),
-	(u'ttd', u'', u'', u'', u'I', u'L', u'Tauade', u'\r\n'),
-	(u'tte', u'', u'', u'', u'I', u'L', u'Bwanabwana', u'\r\n'),
-	(u'ttf', u'', u'', u'', u'I', u'L', u'Tuotomb', u'\r\n'),
-	(u'ttg', u'', u'', u'', u'I', u'L', u'Tutong', u'\r\n'),
-	(u'tth', u'', u'', u'', u'I', u'L', u"Upper Ta'oih", u'\r\n'),
-	(u'tti', u'', u'', u'', u'I', u'L', u'Tobati', u'\r\n'),
-	(u'ttj', u'', u'', u'', u'I', u'L', u'Tooro', u'\r\n'),
-	(u'ttk', u'', u'', u'', u'I', u'L', u'Totoro', u'\r\n'),
-	(u'ttl', u'', u'', u'', u'I', u'L', u'Totela', u'\r\n'),
-	(u'ttm', u'', u'', u'', u'I', u'L', u'Northern Tutchone', u'\r\n'),
-	(u'ttn', u'', u'', u'', u'I', u'L', u'Towei', u'\r\n'),
-	(u'tto', u'', u'', u'', u'I', u'L', u"Lower Ta'oih", u'\r\n'),
-	(u'ttp', u'', u'', u'', u'I', u'L', u'Tombelala', u'\r\n'),
-	(u'ttq', u'', u'', u'', u'I', u'L', u'Tawallammat Tamajaq', u'\r\n'),
-	(u'ttr', u'', u'', u'', u'I', u'L', u'Tera', u'\r\n'),
-	(u'tts', u'', u'', u'', u'I', u'L', u'Northeastern Thai', u'\r\n'),
-	(u'ttt', u'', u'', u'', u'I', u'L', u'Muslim Tat', u'\r\n'),
-	(u'ttu', u'', u'', u'', u'I', u'L', u'Torau', u'\r\n'),
-	(u'ttv', u'', u'', u'', u'I', u'L', u'Titan', u'\r\n'),
-	(u'ttw', u'', u'', u'', u'I', u'L', u'Long Wat', u'\r\n'),
-	(u'tty', u'', u'', u'', u'I', u'L', u'Sikaritai', u'\r\n'),
-	(u'ttz', u'', u'', u'', u'I', u'L', u'Tsum', u'\r\n'),
-	(u'tua', u'', u'', u'', u'I', u'L', u'Wiarumus', u'\r\n'),
-	(u'tub', u'', u'', u'', u'I', u'L', u'T\xfcbatulabal', u'\r\n'),
-	(u'tuc', u'', u'', u'', u'I', u'L', u'Mutu', u'\r\n'),
-	(u'tud', u'', u'', u'', u'I', u'E', u'Tux\xe1', u'\r\n'),
-	(u'tue', u'', u'', u'', u'I', u'L', u'Tuyuca', u'\r\n'),
-	(u'tuf', u'', u'', u'', u'I', u'L', u'Central Tunebo', u'\r\n'),
-	(u'tug', u'', u'', u'', u'I', u'L', u'Tunia', u'\r\n'),
-	(u'tuh', u'', u'', u'', u'I', u'L', u'Taulil', u'\r\n'),
-	(u'tui', u'', u'', u'', u'I', u'L', u'Tupuri', u'\r\n'),
-	(u'tuj', u'', u'', u'', u'I', u'L', u'Tugutil', u'\r\n'),
-	(u'tuk', u'tuk', u'tuk', u'tk', u'I', u'L', u'Turkmen', u'\r\n'),
-	(u'tul', u'', u'', u'', u'I', u'L', u'Tula', u'\r\n'),
-	(u'tum', u'tum', u'tum', u'', u'I', u'L', u'Tumbuka', u'\r\n'),
-	(u'tun', u'', u'', u'', u'I', u'E', u'Tunica', u'\r\n'),
-	(u'tuo', u'', u'', u'', u'I', u'L', u'Tucano', u'\r\n'),
-	(u'tuq', u'', u'', u'', u'I', u'L', u'Tedaga', u'\r\n'),
-	(u'tur', u'tur', u'tur', u'tr', u'I', u'L', u'Turkish', u'\r\n'),
-	(u'tus', u'', u'', u'', u'I', u'L', u'Tuscarora', u'\r\n'),
-	(u'tuu', u'', u'', u'', u'I', u'L', u'Tututni', u'\r\n'),
-	(u'tuv', u'', u'', u'', u'I', u'L', u'Turkana', u'\r\n'),
-	(u'tux', u'', u'', u'', u'I', u'E', u'Tuxin\xe1wa', u'\r\n'),
-	(u'tuy', u'', u'', u'', u'I', u'L', u'Tugen', u'\r\n'),
-	(u'tuz', u'', u'', u'', u'I', u'L', u'Turka', u'\r\n'),
-	(u'tva', u'', u'', u'', u'I', u'L', u'Vaghua', u'\r\n'),
-	(u'tvd', u'', u'', u'', u'I', u'L', u'Tsuvadi', u'\r\n'),
-	(u'tve', u'', u'', u'', u'I', u'L', u"Te'un", u'\r\n'),
-	(u'tvk', u'', u'', u'', u'I', u'L', u'Southeast Ambrym', u'\r\n'),
-	(u'tvl', u'tvl', u'tvl', u'', u'I', u'L', u'Tuvalu', u'\r\n'),
-	(u'tvm', u'', u'', u'', u'I', u'L', u'Tela-Masbuar', u'\r\n'),
-	(u'tvn', u'', u'', u'', u'I', u'L', u'Tavoyan', u'\r\n'),
-	(u'tvo', u'', u'', u'', u'I', u'L', u'Tidore', u'\r\n'),
-	(u'tvs', u'', u'', u'', u'I', u'L', u'Taveta', u'\r\n'),
-	(u'tvt', u'', u'', u'', u'I', u'L', u'Tutsa Naga', u'\r\n'),
-	(u'tvw', u'', u'', u'', u'I', u'L', u'Sedoa', u'\r\n'),
-	(u'tvy', u'', u'', u'', u'I', u'E', u'Timor Pidgin', u'\r\n'),
-	(u'twa', u'', u'', u'', u'I', u'E', u'Twana', u'\r\n'),
-	(u'twb', u'', u'', u'', u'I', u'L', u'Western Tawbuid', u'\r\n'),
-	(u'twc', u'', u'', u'', u'I', u'E', u'Teshenawa', u'\r\n'),
-	(u'twd', u'', u'', u'', u'I', u'L', u'Twents', u'\r\n'),
-	(u'twe', u'', u'', u'', u'I', u'L', u'Tewa (Indonesia)', u'\r\n'),
-	(u'twf', u'', u'', u'', u'I', u'L', u'Northern Tiwa', u'\r\n'),
-	(u'twg', u'', u'', u'', u'I', u'L', u'Tereweng', u'\r\n'),
-	(u'twh', u'', u'', u'', u'I', u'L', u'Tai D\xf3n', u'\r\n'),
-	(u'twi', u'twi', u'twi', u'tw', u'I', u'L', u'Twi', u'\r\n'),
-	(u'twl', u'', u'', u'', u'I', u'L', u'Tawara', u'\r\n'),
-	(u'twm', u'', u'', u'', u'I', u'L', u'Tawang Monpa', u'\r\n'),
-	(u'twn', u'', u'', u'', u'I', u'L', u'Twendi', u'\r\n'),
-	(u'two', u'', u'', u'', u'I', u'L', u'Tswapong', u'\r\n'),
-	(u'twp', u'', u'', u'', u'I', u'L', u'Ere', u'\r\n'),
-	(u'twq', u'', u'', u'', u'I', u'L', u'Tasawaq', u'\r\n'),
-	(u'twr', u'', u'', u'', u'I', u'L', u'Southwestern Tarahumara', u'\r\n'),
-	(u'twt', u'', u'', u'', u'I', u'E', u'Turiw\xe1ra', u'\r\n'),
-	(u'twu', u'', u'', u'', u'I', u'L', u'Termanu', u'\r\n'),
-	(u'tww', u'', u'', u'', u'I', u'L', u'Tuwari', u'\r\n'),
-	(u'twx', u'', u'', u'', u'I', u'L', u'Tewe', u'\r\n'),
-	(u'twy', u'', u'', u'', u'I', u'L', u'Tawoyan', u'\r\n'),
-	(u'txa', u'', u'', u'', u'I', u'L', u'Tombonuo', u'\r\n'),
-	(u'txb', u'', u'', u'', u'I', u'A', u'Tokharian B', u'\r\n'),
-	(u'txc', u'', u'', u'', u'I', u'E', u'Tsetsaut', u'\r\n'),
-	(u'txe', u'', u'', u'', u'I', u'L', u'Totoli', u'\r\n'),
-	(u'txg', u'', u'', u'', u'I', u'A', u'Tangut', u'\r\n'),
-	(u'txh', u'', u'', u'', u'I', u'A', u'Thracian', u'\r\n'),
-	(u'txi', u'', u'', u'', u'I', u'L', u'Ikpeng', u'\r\n'),
-	(u'txm', u'', u'', u'', u'I', u'L', u'Tomini', u'\r\n'),
-	(u'txn', u'', u'', u'', u'I', u'L', u'West Tarangan', u'\r\n'),
-	(u'txo', u'', u'', u'', u'I', u'L', u'Toto', u'\r\n'),
-	(u'txq', u'', u'', u'', u'I', u'L', u'Tii', u'\r\n'),
-	(u'txr', u'', u'', u'', u'I', u'A', u'Tartessian', u'\r\n'),
-	(u'txs', u'', u'', u'', u'I', u'L', u'Tonsea', u'\r\n'),
-	(u'txt', u'', u'', u'', u'I', u'L', u'Citak', u'\r\n'),
-	(u'txu', u'', u'', u'', u'I', u'L', u'Kayap\xf3', u'\r\n'),
-	(u'txx', u'', u'', u'', u'I', u'L', u'Tatana', u'\r\n'),
-	(u'txy', u'', u'', u'', u'I', u'L', u'Tanosy Malagasy', u'\r\n'),
-	(u'tya', u'', u'', u'', u'I', u'L', u'Tauya', u'\r\n'),
-	(u'tye', u'', u'', u'', u'I', u'L', u'Kyenga', u'\r\n'),
-	(u'tyh', u'', u'', u'', u'I', u'L', u"O'du", u'\r\n'),
-	(u'tyi', u'', u'', u'', u'I', u'L', u'Teke-Tsaayi', u'\r\n'),
-	(u'tyj', u'', u'', u'', u'I', u'L', u'Tai Do', u'\r\n'),
-	(u'tyl', u'', u'', u'', u'I', u'L', u'Thu Lao', u'\r\n'),
-	(u'tyn', u'', u'', u'', u'I', u'L', u'Kombai', u'\r\n'),
-	(u'typ', u'', u'', u'', u'I', u'E', u'Thaypan', u'\r\n'),
-	(u'tyr', u'', u'', u'', u'I', u'L', u'Tai Daeng', u'\r\n'),
-	(u'tys', u'', u'', u'', u'I', u'L', u'T\xe0y Sa Pa', u'\r\n'),
-	(u'tyt', u'', u'', u'', u'I', u'L', u'T\xe0y Tac', u'\r\n'),
-	(u'tyu', u'', u'', u'', u'I', u'L', u'Kua', u'\r\n'),
-	(u'tyv', u'tyv', u'tyv', u'', u'I', u'L', u'Tuvinian', u'\r\n'),
-	(u'tyx', u'', u'', u'', u'I', u'L', u'Teke-Tyee', u'\r\n'),
-	(u'tyz', u'', u'', u'', u'I', u'L', u'T\xe0y', u'\r\n'),
-	(u'tza', u'', u'', u'', u'I', u'L', u'Tanzanian Sign Language', u'\r\n'),
-	(u'tzh', u'', u'', u'', u'I', u'L', u'Tzeltal', u'\r\n'),
-	(u'tzj', u'', u'', u'', u'I', u'L', u"Tz'utujil", u'\r\n'),
-	(u'tzm', u'', u'', u'', u'I', u'L', u'Central Atlas Tamazight', u'\r\n'),
-	(u'tzn', u'', u'', u'', u'I', u'L', u'Tugun', u'\r\n'),
-	(u'tzo', u'', u'', u'', u'I', u'L', u'Tzotzil', u'\r\n'),
-	(u'tzx', u'', u'', u'', u'I', u'L', u'Tabriak', u'\r\n'),
-	(u'uam', u'', u'', u'', u'I', u'E', u'Uamu\xe9', u'\r\n'),
-	(u'uan', u'', u'', u'', u'I', u'L', u'Kuan', u'\r\n'),
-	(u'uar', u'', u'', u'', u'I', u'L', u'Tairuma', u'\r\n'),
-	(u'uba', u'', u'', u'', u'I', u'L', u'Ubang', u'\r\n'),
-	(u'ubi', u'', u'', u'', u'I', u'L', u'Ubi', u'\r\n'),
-	(u'ubl', u'', u'', u'', u'I', u'L', u"Buhi'non Bikol", u'\r\n'),
-	(u'ubr', u'', u'', u'', u'I', u'L', u'Ubir', u'\r\n'),
-	(u'ubu', u'', u'', u'', u'I', u'L', u'Umbu-Ungu', u'\r\n'),
-	(u'uby', u'', u'', u'', u'I', u'E', u'Ubykh', u'\r\n'),
-	(u'uda', u'', u'', u'', u'I', u'L', u'Uda', u'\r\n'),
-	(u'ude', u'', u'', u'', u'I', u'L', u'Udihe', u'\r\n'),
-	(u'udg', u'', u'', u'', u'I', u'L', u'Muduga', u'\r\n'),
-	(u'udi', u'', u'', u'', u'I', u'L', u'Udi', u'\r\n'),
-	(u'udj', u'', u'', u'', u'I', u'L', u'Ujir', u'\r\n'),
-	(u'udl', u'', u'', u'', u'I', u'L', u'Wuzlam', u'\r\n'),
-	(u'udm', u'udm', u'udm', u'', u'I', u'L', u'Udmurt', u'\r\n'),
-	(u'udu', u'', u'', u'', u'I', u'L', u'Uduk', u'\r\n'),
-	(u'ues', u'', u'', u'', u'I', u'L', u'Kioko', u'\r\n'),
-	(u'ufi', u'', u'', u'', u'I', u'L', u'Ufim', u'\r\n'),
-	(u'uga', u'uga', u'uga', u'', u'I', u'A', u'Ugaritic', u'\r\n'),
-	(u'ugb', u'', u'', u'', u'I', u'E', u'Kuku-Ugbanh', u'\r\n'),
-	(u'uge', u'', u'', u'', u'I', u'L', u'Ughele', u'\r\n'),
-	(u'ugn', u'', u'', u'', u'I', u'L', u'Ugandan Sign Language', u'\r\n'),
-	(u'ugo', u'', u'', u'', u'I', u'L', u'Ugong', u'\r\n'),
-	(u'ugy', u'', u'', u'', u'I', u'L', u'Uruguayan Sign Language', u'\r\n'),
-	(u'uha', u'', u'', u'', u'I', u'L', u'Uhami', u'\r\n'),
-	(u'uhn', u'', u'', u'', u'I', u'L', u'Damal', u'\r\n'),
-	(u'uig', u'uig', u'uig', u'ug', u'I', u'L', u'Uighur', u'\r\n'),
-	(u'uis', u'', u'', u'', u'I', u'L', u'Uisai', u'\r\n'),
-	(u'uiv', u'', u'', u'', u'I', u'L', u'Iyive', u'\r\n'),
-	(u'uji', u'', u'', u'', u'I', u'L', u'Tanjijili', u'\r\n'),
-	(u'uka', u'', u'', u'', u'I', u'L', u'Kaburi', u'\r\n'),
-	(u'ukg', u'', u'', u'', u'I', u'L', u'Ukuriguma', u'\r\n'),
-	(u'ukh', u'', u'', u'', u'I', u'L', u'Ukhwejo', u'\r\n'),
-	(u'ukl', u'', u'', u'', u'I', u'L', u'Ukrainian Sign Language', u'\r\n'),
-	(u'ukp', u'', u'', u'', u'I', u'L', u'Ukpe-Bayobiri', u'\r\n'),
-	(u'ukq', u'', u'', u'', u'I', u'L', u'Ukwa', u'\r\n'),
-	(u'ukr', u'ukr', u'ukr', u'uk', u'I', u'L', u'Ukrainian', u'\r\n'),
-	(u'uks', u'', u'', u'', u'I', u'L', u'Urub\xfa-Kaapor Sign Language', u'\r\n'),
-	(u'uku', u'', u'', u'', u'I', u'L', u'Ukue', u'\r\n'),
-	(u'ukw', u'', u'', u'', u'I', u'L', u'Ukwuani-Aboh-Ndoni', u'\r\n'),
-	(u'ula', u'', u'', u'', u'I', u'L', u'Fungwa', u'\r\n'),
-	(u'ulb', u'', u'', u'', u'I', u'L', u'Ulukwumi', u'\r\n'),
-	(u'ulc', u'', u'', u'', u'I', u'L', u'Ulch', u'\r\n'),
-	(u'ulf', u'', u'', u'', u'I', u'L', u'Usku', u'\r\n'),
-	(u'uli', u'', u'', u'', u'I', u'L', u'Ulithian', u'\r\n'),
-	(u'ulk', u'', u'', u'', u'I', u'L', u'Meriam', u'\r\n'),
-	(u'ull', u'', u'', u'', u'I', u'L', u'Ullatan', u'\r\n'),
-	(u'ulm', u'', u'', u'', u'I', u'L', u"Ulumanda'", u'\r\n'),
-	(u'uln', u'', u'', u'', u'I', u'L', u'Unserdeutsch', u'\r\n'),
-	(u'ulu', u'', u'', u'', u'I', u'L', u"Uma' Lung", u'\r\n'),
-	(u'ulw', u'', u'', u'', u'I', u'L', u'Ulwa', u'\r\n'),
-	(u'uma', u'', u'', u'', u'I', u'L', u'Umatilla', u'\r\n'),
-	(u'umb', u'umb', u'umb', u'', u'I', u'L', u'Umbundu', u'\r\n'),
-	(u'umc', u'', u'', u'', u'I', u'A', u'Marrucinian', u'\r\n'),
-	(u'umd', u'', u'', u'', u'I', u'E', u'Umbindhamu', u'\r\n'),
-	(u'umg', u'', u'', u'', u'I', u'E', u'Umbuygamu', u'\r\n'),
-	(u'umi', u'', u'', u'', u'I', u'L', u'Ukit', u'\r\n'),
-	(u'umm', u'', u'', u'', u'I', u'L', u'Umon', u'\r\n'),
-	(u'umn', u'', u'', u'', u'I', u'L', u'Makyan Naga', u'\r\n'),
-	(u'umo', u'', u'', u'', u'I', u'E', u'Umot\xedna', u'\r\n'),
-	(u'ump', u'', u'', u'', u'I', u'L', u'Umpila', u'\r\n'),
-	(u'umr', u'', u'', u'', u'I', u'E', u'Umbugarla', u'\r\n'),
-	(u'ums', u'', u'', u'', u'I', u'L', u'Pendau', u'\r\n'),
-	(u'umu', u'', u'', u'', u'I', u'L', u'Munsee', u'\r\n'),
-	(u'una', u'', u'', u'', u'I', u'L', u'North Watut', u'\r\n'),
-	(u'und', u'und', u'und', u'', u'S', u'S', u'Undetermined', u'\r\n'),
-	(u'une', u'', u'', u'', u'I', u'L', u'Uneme', u'\r\n'),
-	(u'ung', u'', u'', u'', u'I', u'L', u'Ngarinyin', u'\r\n'),
-	(u'unk', u'', u'', u'', u'I', u'L', u'Enawen\xe9-Naw\xe9', u'\r\n'),
-	(u'unm', u'', u'', u'', u'I', u'E', u'Unami', u'\r\n'),
-	(u'unp', u'', u'', u'', u'I', u'L', u'Worora', u'\r\n'),
-	(u'unr', u'', u'', u'', u'I', u'L', u'Mundari', u'\r\n'),
-	(u'unx', u'', u'', u'', u'I', u'L', u'Munda', u'\r\n'),
-	(u'unz', u'', u'', u'', u'I', u'L', u'Unde Kaili', u'\r\n'),
-	(u'uok', u'', u'', u'', u'I', u'L', u'Uokha', u'\r\n'),
-	(u'upi', u'', u'', u'', u'I', u'L', u'Umeda', u'\r\n'),
-	(u'upv', u'', u'', u'', u'I', u'L', u'Uripiv-Wala-Rano-Atchin', u'\r\n'),
-	(u'ura', u'', u'', u'', u'I', u'L', u'Urarina', u'\r\n'),
-	(u'urb', u'', u'', u'', u'I', u'L', u'Urub\xfa-Kaapor', u'\r\n'),
-	(u'urc', u'', u'', u'', u'I', u'E', u'Urningangg', u'\r\n'),
-	(u'urd', u'urd', u'urd', u'ur', u'I', u'L', u'Urdu', u'\r\n'),
-	(u'ure', u'', u'', u'', u'I', u'L', u'Uru', u'\r\n'),
-	(u'urf', u'', u'', u'', u'I', u'E', u'Uradhi', u'\r\n'),
-	(u'urg', u'', u'', u'', u'I', u'L', u'Urigina', u'\r\n'),
-	(u'urh', u'', u'', u'', u'I', u'L', u'Urhobo', u'\r\n'),
-	(u'uri', u'', u'', u'', u'I', u'L', u'Urim', u'\r\n'),
-	(u'urk', u'', u'', u'', u'I', u'L', u"Urak Lawoi'", u'\r\n'),
-	(u'url', u'', u'', u'', u'I', u'L', u'Urali', u'\r\n'),
-	(u'urm', u'', u'', u'', u'I', u'L', u'Urapmin', u'\r\n'),
-	(u'urn', u'', u'', u'', u'I', u'L', u'Uruangnirin', u'\r\n'),
-	(u'uro', u'', u'', u'', u'I', u'L', u'Ura (Papua New Guinea)', u'\r\n'),
-	(u'urp', u'', u'', u'', u'I', u'L', u'Uru-Pa-In', u'\r\n'),
-	(u'urr', u'', u'', u'', u'I', u'L', u'Lehalurup', u'\r\n'),
-	(u'urt', u'', u'', u'', u'I', u'L', u'Urat', u'\r\n'),
-	(u'uru', u'', u'', u'', u'I', u'E', u'Urumi', u'\r\n'),
-	(u'urv', u'', u'', u'', u'I', u'E', u'Uruava', u'\r\n'),
-	(u'urw', u'', u'', u'', u'I', u'L', u'Sop', u'\r\n'),
-	(u'urx', u'', u'', u'', u'I', u'L', u'Urimo', u'\r\n'),
-	(u'ury', u'', u'', u'', u'I', u'L', u'Orya', u'\r\n'),
-	(u'urz', u'', u'', u'', u'I', u'L', u'Uru-Eu-Wau-Wau', u'\r\n'),
-	(u'usa', u'', u'', u'', u'I', u'L', u'Usarufa', u'\r\n'),
-	(u'ush', u'', u'', u'', u'I', u'L', u'Ushojo', u'\r\n'),
-	(u'usi', u'', u'', u'', u'I', u'L', u'Usui', u'\r\n'),
-	(u'usk', u'', u'', u'', u'I', u'L', u'Usaghade', u'\r\n'),
-	(u'usp', u'', u'', u'', u'I', u'L', u'Uspanteco', u'\r\n'),
-	(u'usu', u'', u'', u'', u'I', u'L', u'Uya', u'\r\n'),
-	(u'uta', u'', u'', u'', u'I', u'L', u'Otank', u'\r\n'),
-	(u'ute', u'', u'', u'', u'I', u'L', u'Ute-Southern Paiute', u'\r\n'),
-	(u'utp', u'', u'', u'', u'I', u'L', u'Amba (Solomon Islands)', u'\r\n'),
-	(u'utr', u'', u'', u'', u'I', u'L', u'Etulo', u'\r\n'),
-	(u'utu', u'', u'', u'', u'I', u'L', u'Utu', u'\r\n'),
-	(u'uum', u'', u'', u'', u'I', u'L', u'Urum', u'\r\n'),
-	(u'uun', u'', u'', u'', u'I', u'L', u'Kulon-Pazeh', u'\r\n'),
-	(u'uur', u'', u'', u'', u'I', u'L', u'Ura (Vanuatu)', u'\r\n'),
-	(u'uuu', u'', u'', u'', u'I', u'L', u'U', u'\r\n'),
-	(u'uve', u'', u'', u'', u'I', u'L', u'West Uvean', u'\r\n'),
-	(u'uvh', u'', u'', u'', u'I', u'L', u'Uri', u'\r\n'),
-	(u'uvl', u'', u'', u'', u'I', u'L', u'Lote', u'\r\n'),
-	(u'uwa', u'', u'', u'', u'I', u'L', u'Kuku-Uwanh', u'\r\n'),
-	(u'uya', u'', u'', u'', u'I', u'L', u'Doko-Uyanga', u'\r\n'),
-	(u'uzb', u'uzb', u'uzb', u'uz', u'M', u'L', u'Uzbek', u'\r\n'),
-	(u'uzn', u'', u'', u'', u'I', u'L', u'Northern Uzbek', u'\r\n'),
-	(u'uzs', u'', u'', u'', u'I', u'L', u'Southern Uzbek', u'\r\n'),
-	(u'vaa', u'', u'', u'', u'I', u'L', u'Vaagri Booli', u'\r\n'),
-	(u'vae', u'', u'', u'', u'I', u'L', u'Vale', u'\r\n'),
-	(u'vaf', u'', u'', u'', u'I', u'L', u'Vafsi', u'\r\n'),
-	(u'vag', u'', u'', u'', u'I', u'L', u'Vagla', u'\r\n'),
-	(u'vah', u'', u'', u'', u'I', u'L', u'Varhadi-Nagpuri', u'\r\n'),
-	(u'vai', u'vai', u'vai', u'', u'I', u'L', u'Vai', u'\r\n'),
-	(u'vaj', u'', u'', u'', u'I', u'L', u'Vasekela Bushman', u'\r\n'),
-	(u'val', u'', u'', u'', u'I', u'L', u'Vehes', u'\r\n'),
-	(u'vam', u'', u'', u'', u'I', u'L', u'Vanimo', u'\r\n'),
-	(u'van', u'', u'', u'', u'I', u'L', u'Valman', u'\r\n'),
-	(u'vao', u'', u'', u'', u'I', u'L', u'Vao', u'\r\n'),
-	(u'vap', u'', u'', u'', u'I', u'L', u'Vaiphei', u'\r\n'),
-	(u'var', u'', u'', u'', u'I', u'L', u'Huarijio', u'\r\n'),
-	(u'vas', u'', u'', u'', u'I', u'L', u'Vasavi', u'\r\n'),
-	(u'vau', u'', u'', u'', u'I', u'L', u'Vanuma', u'\r\n'),
-	(u'vav', u'', u'', u'', u'I', u'L', u'Varli', u'\r\n'),
-	(u'vay', u'', u'', u'', u'I', u'L', u'Wayu', u'\r\n'),
-	(u'vbb', u'', u'', u'', u'I', u'L', u'Southeast Babar', u'\r\n'),
-	(u'vbk', u'', u'', u'', u'I', u'L', u'Southwestern Bontok', u'\r\n'),
-	(u'vec', u'', u'', u'', u'I', u'L', u'Venetian', u'\r\n'),
-	(u'ved', u'', u'', u'', u'I', u'L', u'Veddah', u'\r\n'),
-	(u'vel', u'', u'', u'', u'I', u'L', u'Veluws', u'\r\n'),
-	(u'vem', u'', u'', u'', u'I', u'L', u'Vemgo-Mabas', u'\r\n'),
-	(u'ven', u'ven', u'ven', u've', u'I', u'L', u'Venda', u'\r\n'),
-	(u'veo', u'', u'', u'', u'I', u'E', u'Venture\xf1o', u'\r\n'),
-	(u'vep', u'', u'', u'', u'I', u'L', u'Veps', u'\r\n'),
-	(u'ver', u'', u'', u'', u'I', u'L', u'Mom Jango', u'\r\n'),
-	(u'vgr', u'', u'', u'', u'I', u'L', u'Vaghri', u'\r\n'),
-	(u'vgt', u'', u'', u'', u'I', u'L', u'Vlaamse Gebarentaal', u'\r\n'),
-	(u'vic', u'', u'', u'', u'I', u'L', u'Virgin Islands Creole English', u'\r\n'),
-	(u'vid', u'', u'', u'', u'I', u'L', u'Vidunda', u'\r\n'),
-	(u'vie', u'vie', u'vie', u'vi', u'I', u'L', u'Vietnamese', u'\r\n'),
-	(u'vif', u'', u'', u'', u'I', u'L', u'Vili', u'\r\n'),
-	(u'vig', u'', u'', u'', u'I', u'L', u'Viemo', u'\r\n'),
-	(u'vil', u'', u'', u'', u'I', u'L', u'Vilela', u'\r\n'),
-	(u'vin', u'', u'', u'', u'I', u'L', u'Vinza', u'\r\n'),
-	(u'vis', u'', u'', u'', u'I', u'L', u'Vishavan', u'\r\n'),
-	(u'vit', u'', u'', u'', u'I', u'L', u'Viti', u'\r\n'),
-	(u'viv', u'', u'', u'', u'I', u'L', u'Iduna', u'\r\n'),
-	(u'vka', u'', u'', u'', u'I', u'E', u'Kariyarra', u'\r\n'),
-	(u'vki', u'', u'', u'', u'I', u'L', u'Ija-Zuba', u'\r\n'),
-	(u'vkj', u'', u'', u'', u'I', u'L', u'Kujarge', u'\r\n'),
-	(u'vkk', u'', u'', u'', u'I', u'L', u'Kaur', u'\r\n'),
-	(u'vkl', u'', u'', u'', u'I', u'L', u'Kulisusu', u'\r\n'),
-	(u'vkm', u'', u'', u'', u'I', u'E', u'Kamakan', u'\r\n'),
-	(u'vko', u'', u'', u'', u'I', u'L', u'Kodeoha', u'\r\n'),
-	(u'vkp', u'', u'', u'', u'I', u'L', u'Korlai Creole Portuguese', u'\r\n'),
-	(u'vkt', u'', u'', u'', u'I', u'L', u'Tenggarong Kutai Malay', u'\r\n'),
-	(u'vku', u'', u'', u'', u'I', u'L', u'Kurrama', u'\r\n'),
-	(u'vlp', u'', u'', u'', u'I', u'L', u'Valpei', u'\r\n'),
-	(u'vls', u'', u'', u'', u'I', u'L', u'Vlaams', u'\r\n'),
-	(u'vma', u'', u'', u'', u'I', u'L', u'Martuyhunira', u'\r\n'),
-	(u'vmb', u'', u'', u'', u'I', u'E', u'Mbabaram', u'\r\n'),
-	(u'vmc', u'', u'', u'', u'I', u'L', u'Juxtlahuaca Mixtec', u'\r\n'),
-	(u'vmd', u'', u'', u'', u'I', u'L', u'Mudu Koraga', u'\r\n'),
-	(u'vme', u'', u'', u'', u'I', u'L', u'East Masela', u'\r\n'),
-	(u'vmf', u'', u'', u'', u'I', u'L', u'Mainfr\xe4nkisch', u'\r\n'),
-	(u'vmg', u'', u'', u'', u'I', u'L', u'Minigir', u'\r\n'),
-	(u'vmh', u'', u'', u'', u'I', u'L', u'Maraghei', u'\r\n'),
-	(u'vmi', u'', u'', u'', u'I', u'E', u'Miwa', u'\r\n'),
-	(u'vmj', u'', u'', u'', u'I', u'L', u'Ixtayutla Mixtec', u'\r\n'),
-	(u'vmk', u'', u'', u'', u'I', u'L', u'Makhuwa-Shirima', u'\r\n'),
-	(u'vml', u'', u'', u'', u'I', u'E', u'Malgana', u'\r\n'),
-	(u'vmm', u'', u'', u'', u'I', u'L', u'Mitlatongo Mixtec', u'\r\n'),
-	(u'vmp', u'', u'', u'', u'I', u'L', u'Soyaltepec Mazatec', u'\r\n'),
-	(u'vmq', u'', u'', u'', u'I', u'L', u'Soyaltepec Mixtec', u'\r\n'),
-	(u'vmr', u'', u'', u'', u'I', u'L', u'Marenje', u'\r\n'),
-	(u'vms', u'', u'', u'', u'I', u'E', u'Moksela', u'\r\n'),
-	(u'vmu', u'', u'', u'', u'I', u'E', u'Muluridyi', u'\r\n'),
-	(u'vmv', u'', u'', u'', u'I', u'E', u'Valley Maidu', u'\r\n'),
-	(u'vmw', u'', u'', u'', u'I', u'L', u'Makhuwa', u'\r\n'),
-	(u'vmx', u'', u'', u'', u'I', u'L', u'Tamazola Mixtec', u'\r\n'),
-	(u'vmy', u'', u'', u'', u'I', u'L', u'Ayautla Mazatec', u'\r\n'),
-	(u'vmz', u'', u'', u'', u'I', u'L', u'Mazatl\xe1n Mazatec', u'\r\n'),
-	(u'vnk', u'', u'', u'', u'I', u'L', u'Vano', u'\r\n'),
-	(u'vnm', u'', u'', u'', u'I', u'L', u'Vinmavis', u'\r\n'),
-	(u'vnp', u'', u'', u'', u'I', u'L', u'Vunapu', u'\r\n'),
-	(u'vol', u'vol', u'vol', u'vo', u'I', u'C', u'Volap\xfck', u'\r\n'),
-	(u'vor', u'', u'', u'', u'I', u'L', u'Voro', u'\r\n'),
-	(u'vot', u'vot', u'vot', u'', u'I', u'L', u'Votic', u'\r\n'),
-	(u'vra', u'', u'', u'', u'I', u'L', u"Vera'a", u'\r\n'),
-	(u'vro', u'', u'', u'', u'I', u'L', u'V\xf5ro', u'\r\n'),
-	(u'vrs', u'', u'', u'', u'I', u'L', u'Varisi', u'\r\n'),
-	(u'vrt', u'', u'', u'', u'I', u'L', u'Burmbar', u'\r\n'),
-	(u'vsi', u'', u'', u'', u'I', u'L', u'Moldova Sign Language', u'\r\n'),
-	(u'vsl', u'', u'', u'', u'I', u'L', u'Venezuelan Sign Language', u'\r\n'),
-	(u'vsv', u'', u'', u'', u'I', u'L', u'Valencian Sign Language', u'\r\n'),
-	(u'vto', u'', u'', u'', u'I', u'L', u'Vitou', u'\r\n'),
-	(u'vum', u'', u'', u'', u'I', u'L', u'Vumbu', u'\r\n'),
-	(u'vun', u'', u'', u'', u'I', u'L', u'Vunjo', u'\r\n'),
-	(u'vut', u'', u'', u'', u'I', u'L', u'Vute', u'\r\n'),
-	(u'vwa', u'', u'', u'', u'I', u'L', u'Awa (China)', u'\r\n'),
-	(u'waa', u'', u'', u'', u'I', u'L', u'Walla Walla', u'\r\n'),
-	(u'wab', u'', u'', u'', u'I', u'L', u'Wab', u'\r\n'),
-	(u'wac', u'', u'', u'', u'I', u'L', u'Wasco-Wishram', u'\r\n'),
-	(u'wad', u'', u'', u'', u'I', u'L', u'Wandamen', u'\r\n'),
-	(u'wae', u'', u'', u'', u'I', u'L', u'Walser', u'\r\n'),
-	(u'waf', u'', u'', u'', u'I', u'E', u'Wakon\xe1', u'\r\n'),
-	(u'wag', u'', u'', u'', u'I', u'L', u"Wa'ema", u'\r\n'),
-	(u'wah', u'', u'', u'', u'I', u'L', u'Watubela', u'\r\n'),
-	(u'wai', u'', u'', u'', u'I', u'L', u'Wares', u'\r\n'),
-	(u'waj', u'', u'', u'', u'I', u'L', u'Waffa', u'\r\n'),
-	(u'wal', u'wal', u'wal', u'', u'I', u'L', u'Wolaytta', u'\r\n'),
-	(u'wam', u'', u'', u'', u'I', u'E', u'Wampanoag', u'\r\n'),
-	(u'wan', u'', u'', u'', u'I', u'L', u'Wan', u'\r\n'),
-	(u'wao', u'', u'', u'', u'I', u'E', u'Wappo', u'\r\n'),
-	(u'wap', u'', u'', u'', u'I', u'L', u'Wapishana', u'\r\n'),
-	(u'waq', u'', u'', u'', u'I', u'L', u'Wageman', u'\r\n'),
-	(u'war', u'war', u'war', u'', u'I', u'L', u'Waray (Philippines)', u'\r\n'),
-	(u'was', u'was', u'was', u'', u'I', u'L', u'Washo', u'\r\n'),
-	(u'wat', u'', u'', u'', u'I', u'L', u'Kaninuwa', u'\r\n'),
-	(u'wau', u'', u'', u'', u'I', u'L', u'Waur\xe1', u'\r\n'),
-	(u'wav', u'', u'', u'', u'I', u'L', u'Waka', u'\r\n'),
-	(u'waw', u'', u'', u'', u'I', u'L', u'Waiwai', u'\r\n'),
-	(u'wax', u'', u'', u'', u'I', u'L', u'Watam', u'\r\n'),
-	(u'way', u'', u'', u'', u'I', u'L', u'Wayana', u'\r\n'),
-	(u'waz', u'', u'', u'', u'I', u'L', u'Wampur', u'\r\n'),
-	(u'wba', u'', u'', u'', u'I', u'L', u'Warao', u'\r\n'),
-	(u'wbb', u'', u'', u'', u'I', u'L', u'Wabo', u'\r\n'),
-	(u'wbe', u'', u'', u'', u'I', u'L', u'Waritai', u'\r\n'),
-	(u'wbf', u'', u'', u'', u'I', u'L', u'Wara', u'\r\n'),
-	(u'wbh', u'', u'', u'', u'I', u'L', u'Wanda', u'\r\n'),
-	(u'wbi', u'', u'', u'', u'I', u'L', u'Vwanji', u'\r\n'),
-	(u'wbj', u'', u'', u'', u'I', u'L', u'Alagwa', u'\r\n'),
-	(u'wbk', u'', u'', u'', u'I', u'L', u'Waigali', u'\r\n'),
-	(u'wbl', u'', u'', u'', u'I', u'L', u'Wakhi', u'\r\n'),
-	(u'wbm', u'', u'', u'', u'I', u'L', u'Wa', u'\r\n'),
-	(u'wbp', u'', u'', u'', u'I', u'L', u'Warlpiri', u'\r\n'),
-	(u'wbq', u'', u'', u'', u'I', u'L', u'Waddar', u'\r\n'),
-	(u'wbr', u'', u'', u'', u'I', u'L', u'Wagdi', u'\r\n'),
-	(u'wbt', u'', u'', u'', u'I', u'L', u'Wanman', u'\r\n'),
-	(u'wbv', u'', u'', u'', u'I', u'L', u'Wajarri', u'\r\n'),
-	(u'wbw', u'', u'', u'', u'I', u'L', u'Woi', u'\r\n'),
-	(u'wca', u'', u'', u'', u'I', u'L', u'Yanom\xe1mi', u'\r\n'),
-	(u'wci', u'', u'', u'', u'I', u'L', u'Waci Gbe', u'\r\n'),
-	(u'wdd', u'', u'', u'', u'I', u'L', u'Wandji', u'\r\n'),
-	(u'wdg', u'', u'', u'', u'I', u'L', u'Wadaginam', u'\r\n'),
-	(u'wdj', u'', u'', u'', u'I', u'L', u'Wadjiginy', u'\r\n'),
-	(u'wdu', u'', u'', u'', u'I', u'E', u'Wadjigu', u'\r\n'),
-	(u'wea', u'', u'', u'', u'I', u'L', u'Wewaw', u'\r\n'),
-	(u'wec', u'', u'', u'', u'I', u'L', u'W\xe8 Western', u'\r\n'),
-	(u'wed', u'', u'', u'', u'I', u'L', u'Wedau', u'\r\n'),
-	(u'weh', u'', u'', u'', u'I', u'L', u'Weh', u'\r\n'),
-	(u'wei', u'', u'', u'', u'I', u'L', u'Were', u'\r\n'),
-	(u'wem', u'', u'', u'', u'I', u'L', u'Weme Gbe', u'\r\n'),
-	(u'weo', u'', u'', u'', u'I', u'L', u'North Wemale', u'\r\n'),
-	(u'wep', u'', u'', u'', u'I', u'L', u'Westphalien', u'\r\n'),
-	(u'wer', u'', u'', u'', u'I', u'L', u'Weri', u'\r\n'),
-	(u'wes', u'', u'', u'', u'I', u'L', u'Cameroon Pidgin', u'\r\n'),
-	(u'wet', u'', u'', u'', u'I', u'L', u'Perai', u'\r\n'),
-	(u'weu', u'', u'', u'', u'I', u'L', u'Welaung', u'\r\n'),
-	(u'wew', u'', u'', u'', u'I', u'L', u'Wejewa', u'\r\n'),
-	(u'wfg', u'', u'', u'', u'I', u'L', u'Yafi', u'\r\n'),
-	(u'wga', u'', u'', u'', u'I', u'E', u'Wagaya', u'\r\n'),
-	(u'wgb', u'', u'', u'', u'I', u'L', u'Wagawaga', u'\r\n'),
-	(u'wgg', u'', u'', u'', u'I', u'E', u'Wangganguru', u'\r\n'),
-	(u'wgi', u'', u'', u'', u'I', u'L', u'Wahgi', u'\r\n'),
-	(u'wgo', u'', u'', u'', u'I', u'L', u'Waigeo', u'\r\n'),
-	(u'wgy', u'', u'', u'', u'I', u'L', u'Warrgamay', u'\r\n'),
-	(u'wha', u'', u'', u'', u'I', u'L', u'Manusela', u'\r\n'),
-	(u'whg', u'', u'', u'', u'I', u'L', u'North Wahgi', u'\r\n'),
-	(u'whk', u'', u'', u'', u'I', u'L', u'Wahau Kenyah', u'\r\n'),
-	(u'whu', u'', u'', u'', u'I', u'L', u'Wahau Kayan', u'\r\n'),
-	(u'wib', u'', u'', u'', u'I', u'L', u'Southern Toussian', u'\r\n'),
-	(u'wic', u'', u'', u'', u'I', u'L', u'Wichita', u'\r\n'),
-	(u'wie', u'', u'', u'', u'I', u'E', u'Wik-Epa', u'\r\n'),
-	(u'wif', u'', u'', u'', u'I', u'E', u'Wik-Keyangan', u'\r\n'),
-	(u'wig', u'', u'', u'', u'I', u'L', u'Wik-Ngathana', u'\r\n'),
-	(u'wih', u'', u'', u'', u'I', u'L', u"Wik-Me'anha", u'\r\n'),
-	(u'wii', u'', u'', u'', u'I', u'L', u'Minidien', u'\r\n'),
-	(u'wij', u'', u'', u'', u'I', u'L', u'Wik-Iiyanh', u'\r\n'),
-	(u'wik', u'', u'', u'', u'I', u'L', u'Wikalkan', u'\r\n'),
-	(u'wil', u'', u'', u'', u'I', u'E', u'Wilawila', u'\r\n'),
-	(u'wim', u'', u'', u'', u'I', u'L', u'Wik-Mungkan', u'\r\n'),
-	(u'win', u'', u'', u'', u'I', u'L', u'Ho-Chunk', u'\r\n'),
-	(u'wir', u'', u'', u'', u'I', u'E', u'Wiraf\xe9d', u'\r\n'),
-	(u'wit', u'', u'', u'', u'I', u'L', u'Wintu', u'\r\n'),
-	(u'wiu', u'', u'', u'', u'I', u'L', u'Wiru', u'\r\n'),
-	(u'wiv', u'', u'', u'', u'I', u'L', u'Muduapa', u'\r\n'),
-	(u'wiw', u'', u'', u'', u'I', u'L', u'Wirangu', u'\r\n'),
-	(u'wiy', u'', u'', u'', u'I', u'E', u'Wiyot', u'\r\n'),
-	(u'wja', u'', u'', u'', u'I', u'L', u'Waja', u'\r\n'),
-	(u'wji', u'', u'', u'', u'I', u'L', u'Warji', u'\r\n'),
-	(u'wka', u'', u'', u'', u'I', u'E', u"Kw'adza", u'\r\n'),
-	(u'wkb', u'', u'', u'', u'I', u'L', u'Kumbaran', u'\r\n'),
-	(u'wkd', u'', u'', u'', u'I', u'L', u'Wakde', u'\r\n'),
-	(u'wkl', u'', u'', u'', u'I', u'L', u'Kalanadi', u'\r\n'),
-	(u'wku', u'', u'', u'', u'I', u'L', u'Kunduvadi', u'\r\n'),
-	(u'wkw', u'', u'', u'', u'I', u'E', u'Wakawaka', u'\r\n'),
-	(u'wla', u'', u'', u'', u'I', u'L', u'Walio', u'\r\n'),
-	(u'wlc', u'', u'', u'', u'I', u'L', u'Mwali Comorian', u'\r\n'),
-	(u'wle', u'', u'', u'', u'I', u'L', u'Wolane', u'\r\n'),
-	(u'wlg', u'', u'', u'', u'I', u'L', u'Kunbarlang', u'\r\n'),
-	(u'wli', u'', u'', u'', u'I', u'L', u'Waioli', u'\r\n'),
-	(u'wlk', u'', u'', u'', u'I', u'E', u'Wailaki', u'\r\n'),
-	(u'wll', u'', u'', u'', u'I', u'L', u'Wali (Sudan)', u'\r\n'),
-	(u'wlm', u'', u'', u'', u'I', u'H', u'Middle Welsh', u'\r\n'),
-	(u'wln', u'wln', u'wln', u'wa', u'I', u'L', u'Walloon', u'\r\n'),
-	(u'wlo', u'', u'', u'', u'I', u'L', u'Wolio', u'\r\n'),
-	(u'wlr', u'', u'', u'', u'I', u'L', u'Wailapa', u'\r\n'),
-	(u'wls', u'', u'', u'', u'I', u'L', u'Wallisian', u'\r\n'),
-	(u'wlu', u'', u'', u'', u'I', u'E', u'Wuliwuli', u'\r\n'),
-	(u'wlv', u'', u'', u'', u'I', u'L', u'Wich\xed Lhamt\xe9s Vejoz', u'\r\n'),
-	(u'wlw', u'', u'', u'', u'I', u'L', u'Walak', u'\r\n'),
-	(u'wlx', u'', u'', u'', u'I', u'L', u'Wali (Ghana)', u'\r\n'),
-	(u'wly', u'', u'', u'', u'I', u'E', u'Waling', u'\r\n'),
-	(u'wma', u'', u'', u'', u'I', u'E', u'Mawa (Nigeria)', u'\r\n'),
-	(u'wmb', u'', u'', u'', u'I', u'L', u'Wambaya', u'\r\n'),
-	(u'wmc', u'', u'', u'', u'I', u'L', u'Wamas', u'\r\n'),
-	(u'wmd', u'', u'', u'', u'I', u'L', u'Mamaind\xe9', u'\r\n'),
-	(u'wme', u'', u'', u'', u'I', u'L', u'Wambule', u'\r\n'),
-	(u'wmh', u'', u'', u'', u'I', u'L', u"Waima'a", u'\r\n'),
-	(u'wmi', u'', u'', u'', u'I', u'E', u'Wamin', u'\r\n'),
-	(u'wmm', u'', u'', u'', u'I', u'L', u'Maiwa (Indonesia)', u'\r\n'),
-	(u'wmn', u'', u'', u'', u'I', u'E', u'Waamwang', u'\r\n'),
-	(u'wmo', u'', u'', u'', u'I', u'L', u'Wom (Papua New Guinea)', u'\r\n'),
-	(u'wms', u'', u'', u'', u'I', u'L', u'Wambon', u'\r\n'),
-	(u'wmt', u'', u'', u'', u'I', u'L', u'Walmajarri', u'\r\n'),
-	(u'wmw', u'', u'', u'', u'I', u'L', u'Mwani', u'\r\n'),
-	(u'wmx', u'', u'', u'', u'I', u'L', u'Womo', u'\r\n'),
-	(u'wnb', u'', u'', u'', u'I', u'L', u'Wanambre', u'\r\n'),
-	(u'wnc', u'', u'', u'', u'I', u'L', u'Wantoat', u'\r\n'),
-	(u'wnd', u'', u'', u'', u'I', u'E', u'Wandarang', u'\r\n'),
-	(u'wne', u'', u'', u'', u'I', u'L', u'Waneci', u'\r\n'),
-	(u'wng', u'', u'', u'', u'I', u'L', u'Wanggom', u'\r\n'),
-	(u'wni', u'', u'', u'', u'I', u'L', u'Ndzwani Comorian', u'\r\n'),
-	(u'wnk', u'', u'', u'', u'I', u'L', u'Wanukaka', u'\r\n'),
-	(u'wnm', u'', u'', u'', u'I', u'E', u'Wanggamala', u'\r\n'),
-	(u'wno', u'', u'', u'', u'I', u'L', u'Wano', u'\r\n'),
-	(u'wnp', u'', u'', u'', u'I', u'L', u'Wanap', u'\r\n'),
-	(u'wnu', u'', u'', u'', u'I', u'L', u'Usan', u'\r\n'),
-	(u'woa', u'', u'', u'', u'I', u'L', u'Tyaraity', u'\r\n'),
-	(u'wob', u'', u'', u'', u'I', u'L', u'W\xe8 Northern', u'\r\n'),
-	(u'woc', u'', u'', u'', u'I', u'L', u'Wogeo', u'\r\n'),
-	(u'wod', u'', u'', u'', u'I', u'L', u'Wolani', u'\r\n'),
-	(u'woe', u'', u'', u'', u'I', u'L', u'Woleaian', u'\r\n'),
-	(u'wof', u'', u'', u'', u'I', u'L', u'Gambian Wolof', u'\r\n'),
-	(u'wog', u'', u'', u'', u'I', u'L', u'Wogamusin', u'\r\n'),
-	(u'woi', u'', u'', u'', u'I', u'L', u'Kamang', u'\r\n'),
-	(u'wok', u'', u'', u'', u'I', u'L', u'Longto', u'\r\n'),
-	(u'wol', u'wol', u'wol', u'wo', u'I', u'L', u'Wolof', u'\r\n'),
-	(u'wom', u'', u'', u'', u'I', u'L', u'Wom (Nigeria)', u'\r\n'),
-	(u'won', u'', u'', u'', u'I', u'L', u'Wongo', u'\r\n'),
-	(u'woo', u'', u'', u'', u'I', u'L', u'Manombai', u'\r\n'),
-	(u'wor', u'', u'', u'', u'I', u'L', u'Woria', u'\r\n'),
-	(u'wos', u'', u'', u'', u'I', u'L', u'Hanga Hundi', u'\r\n'),
-	(u'wow', u'', u'', u'', u'I', u'L', u'Wawonii', u'\r\n'),
-	(u'woy', u'', u'', u'', u'I', u'E', u'Weyto', u'\r\n'),
-	(u'wpc', u'', u'', u'', u'I', u'L', u'Maco', u'\r\n'),
-	(u'wra', u'', u'', u'', u'I', u'L', u'Warapu', u'\r\n'),
-	(u'wrb', u'', u'', u'', u'I', u'E', u'Warluwara', u'\r\n'),
-	(u'wrd', u'', u'', u'', u'I', u'L', u'Warduji', u'\r\n'),
-	(u'wrg', u'', u'', u'', u'I', u'E', u'Warungu', u'\r\n'),
-	(u'wrh', u'', u'', u'', u'I', u'E', u'Wiradhuri', u'\r\n'),
-	(u'wri', u'', u'', u'', u'I', u'E', u'Wariyangga', u'\r\n'),
-	(u'wrl', u'', u'', u'', u'I', u'L', u'Warlmanpa', u'\r\n'),
-	(u'wrm', u'', u'', u'', u'I', u'L', u'Warumungu', u'\r\n'),
-	(u'wrn', u'', u'', u'', u'I', u'L', u'Warnang', u'\r\n'),
-	(u'wrp', u'', u'', u'', u'I', u'L', u'Waropen', u'\r\n'),
-	(u'wrr', u'', u'', u'', u'I', u'L', u'Wardaman', u'\r\n'),
-	(u'wrs', u'', u'', u'', u'I', u'L', u'Waris', u'\r\n'),
-	(u'wru', u'', u'', u'', u'I', u'L', u'Waru', u'\r\n'),
-	(u'wrv', u'', u'', u'', u'I', u'L', u'Waruna', u'\r\n'),
-	(u'wrw', u'', u'', u'', u'I', u'E', u'Gugu Warra', u'\r\n'),
-	(u'wrx', u'', u'', u'', u'I', u'L', u'Wae Rana', u'\r\n'),
-	(u'wry', u'', u'', u'', u'I', u'L', u'Merwari', u'\r\n'),
-	(u'wrz', u'', u'', u'', u'I', u'E', u'Waray (Australia)', u'\r\n'),
-	(u'wsa', u'', u'', u'', u'I', u'L', u'Warembori', u'\r\n'),
-	(u'wsi', u'', u'', u'', u'I', u'L', u'Wusi', u'\r\n'),
-	(u'wsk', u'', u'', u'', u'I', u'L', u'Waskia', u'\r\n'),
-	(u'wsr', u'', u'', u'', u'I', u'L', u'Owenia', u'\r\n'),
-	(u'wss', u'', u'', u'', u'I', u'L', u'Wasa', u'\r\n'),
-	(u'wsu', u'', u'', u'', u'I', u'E', u'Wasu', u'\r\n'),
-	(u'wsv', u'', u'', u'', u'I', u'E', u'Wotapuri-Katarqalai', u'\r\n'),
-	(u'wtf', u'', u'', u'', u'I', u'L', u'Dumpu', u'\r\n'),
-	(u'wti', u'', u'', u'', u'I', u'L', u'Berta', u'\r\n'),
-	(u'wtk', u'', u'', u'', u'I', u'L', u'Watakataui', u'\r\n'),
-	(u'wtm', u'', u'', u'', u'I', u'L', u'Mewati', u'\r\n'),
-	(u'wtw', u'', u'', u'', u'I', u'L', u'Wotu', u'\r\n'),
-	(u'wua', u'', u'', u'', u'I', u'L', u'Wikngenchera', u'\r\n'),
-	(u'wub', u'', u'', u'', u'I', u'L', u'Wunambal', u'\r\n'),
-	(u'wud', u'', u'', u'', u'I', u'L', u'Wudu', u'\r\n'),
-	(u'wuh', u'', u'', u'', u'I', u'L', u'Wutunhua', u'\r\n'),
-	(u'wul', u'', u'', u'', u'I', u'L', u'Silimo', u'\r\n'),
-	(u'wum', u'', u'', u'', u'I', u'L', u'Wumbvu', u'\r\n'),
-	(u'wun', u'', u'', u'', u'I', u'L', u'Bungu', u'\r\n'),
-	(u'wur', u'', u'', u'', u'I', u'E', u'Wurrugu', u'\r\n'),
-	(u'wut', u'', u'', u'', u'I', u'L', u'Wutung', u'\r\n'),
-	(u'wuu', u'', u'', u'', u'I', u'L', u'Wu Chinese', u'\r\n'),
-	(u'wuv', u'', u'', u'', u'I', u'L', u'Wuvulu-Aua', u'\r\n'),
-	(u'wux', u'', u'', u'', u'I', u'L', u'Wulna', u'\r\n'),
-	(u'wuy', u'', u'', u'', u'I', u'L', u'Wauyai', u'\r\n'),
-	(u'wwa', u'', u'', u'', u'I', u'L', u'Waama', u'\r\n'),
-	(u'wwo', u'', u'', u'', u'I', u'L', u'Wetamut', u'\r\n'),
-	(u'wwr', u'', u'', u'', u'I', u'E', u'Warrwa', u'\r\n'),
-	(u'www', u'', u'', u'', u'I', u'L', u'Wawa', u'\r\n'),
-	(u'wxa', u'', u'', u'', u'I', u'L', u'Waxianghua', u'\r\n'),
-	(u'wya', u'', u'', u'', u'I', u'L', u'Wyandot', u'\r\n'),
-	(u'wyb', u'', u'', u'', u'I', u'L', u'Wangaaybuwan-Ngiyambaa', u'\r\n'),
-	(u'wym', u'', u'', u'', u'I', u'L', u'Wymysorys', u'\r\n'),
-	(u'wyr', u'', u'', u'', u'I', u'L', u'Wayor\xf3', u'\r\n'),
-	(u'wyy', u'', u'', u'', u'I', u'L', u'Western Fijian', u'\r\n'),
-	(u'xaa', u'', u'', u'', u'I', u'H', u'Andalusian Arabic', u'\r\n'),
-	(u'xab', u'', u'', u'', u'I', u'L', u'Sambe', u'\r\n'),
-	(u'xac', u'', u'', u'', u'I', u'L', u'Kachari', u'\r\n'),
-	(u'xad', u'', u'', u'', u'I', u'E', u'Adai', u'\r\n'),
-	(u'xae', u'', u'', u'', u'I', u'A', u'Aequian', u'\r\n'),
-	(u'xag', u'', u'', u'', u'I', u'E', u'Aghwan', u'\r\n'),
-	(u'xai', u'', u'', u'', u'I', u'E', u'Kaimb\xe9', u'\r\n'),
-	(u'xal', u'xal', u'xal', u'', u'I', u'L', u'Kalmyk', u'\r\n'),
-	(u'xam', u'', u'', u'', u'I', u'E', u'/Xam', u'\r\n'),
-	(u'xan', u'', u'', u'', u'I', u'L', u'Xamtanga', u'\r\n'),
-	(u'xao', u'', u'', u'', u'I', u'L', u'Khao', u'\r\n'),
-	(u'xap', u'', u'', u'', u'I', u'E', u'Apalachee', u'\r\n'),
-	(u'xaq', u'', u'', u'', u'I', u'A', u'Aquitanian', u'\r\n'),
-	(u'xar', u'', u'', u'', u'I', u'E', u'Karami', u'\r\n'),
-	(u'xas', u'', u'', u'', u'I', u'E', u'Kamas', u'\r\n'),
-	(u'xat', u'', u'', u'', u'I', u'L', u'Katawixi', u'\r\n'),
-	(u'xau', u'', u'', u'', u'I', u'L', u'Kauwera', u'\r\n'),
-	(u'xav', u'', u'', u'', u'I', u'L', u'Xav\xe1nte', u'\r\n'),
-	(u'xaw', u'', u'', u'', u'I', u'L', u'Kawaiisu', u'\r\n'),
-	(u'xay', u'', u'', u'', u'I', u'L', u'Kayan Mahakam', u'\r\n'),
-	(u'xba', u'', u'', u'', u'I', u'E', u'Kamba (Brazil)', u'\r\n'),
-	(u'xbb', u'', u'', u'', u'I', u'E', u'Lower Burdekin', u'\r\n'),
-	(u'xbc', u'', u'', u'', u'I', u'A', u'Bactrian', u'\r\n'),
-	(u'xbi', u'', u'', u'', u'I', u'L', u'Kombio', u'\r\n'),
-	(u'xbm', u'', u'', u'', u'I', u'H', u'Middle Breton', u'\r\n'),
-	(u'xbn', u'', u'', u'', u'I', u'E', u'Kenaboi', u'\r\n'),
-	(u'xbo', u'', u'', u'', u'I', u'E', u'Bolgarian', u'\r\n'),
-	(u'xbr', u'', u'', u'', u'I', u'L', u'Kambera', u'\r\n'),
-	(u'xbw', u'', u'', u'', u'I', u'E', u'Kambiw\xe1', u'\r\n'),
-	(u'xbx', u'', u'', u'', u'I', u'E', u'Kabix\xed', u'\r\n'),
-	(u'xcb', u'', u'', u'', u'I', u'E', u'Cumbric', u'\r\n'),
-	(u'xcc', u'', u'', u'', u'I', u'A', u'Camunic', u'\r\n'),
-	(u'xce', u'', u'', u'', u'I', u'A', u'Celtiberian', u'\r\n'),
-	(u'xcg', u'', u'', u'', u'I', u'A', u'Cisalpine Gaulish', u'\r\n'),
-	(u'xch', u'', u'', u'', u'I', u'E', u'Chemakum', u'\r\n'),
-	(u'xcl', u'', u'', u'', u'I', u'H', u'Classical Armenian', u'\r\n'),
-	(u'xcm', u'', u'', u'', u'I', u'E', u'Comecrudo', u'\r\n'),
-	(u'xcn', u'', u'', u'', u'I', u'E', u'Cotoname', u'\r\n'),
-	(u'xco', u'', u'', u'', u'I', u'A', u'Chorasmian', u'\r\n'),
-	(u'xcr', u'', u'', u'', u'I', u'A', u'Carian', u'\r\n'),
-	(u'xct', u'', u'', u'', u'I', u'H', u'Classical Tibetan', u'\r\n'),
-	(u'xcu', u'', u'', u'', u'I', u'E', u'Curonian', u'\r\n'),
-	(u'xcv', u'', u'', u'', u'I', u'E', u'Chuvantsy', u'\r\n'),
-	(u'xcw', u'', u'', u'', u'I', u'E', u'Coahuilteco', u'\r\n'),
-	(u'xcy', u'', u'', u'', u'I', u'E', u'Cayuse', u'\r\n'),
-	(u'xdc', u'', u'', u'', u'I', u'A', u'Dacian', u'\r\n'),
-	(u'xdm', u'', u'', u'', u'I', u'A', u'Edomite', u'\r\n'),
-	(u'xdy', u'', u'', u'', u'I', u'L', u'Malayic Dayak', u'\r\n'),
-	(u'xeb', u'', u'', u'', u'I', u'A', u'Eblan', u'\r\n'),
-	(u'xed', u'', u'', u'', u'I', u'L', u'Hdi', u'\r\n'),
-	(u'xeg', u'', u'', u'', u'I', u'E', u'//Xegwi', u'\r\n'),
-	(u'xel', u'', u'', u'', u'I', u'L', u'Kelo', u'\r\n'),
-	(u'xem', u'', u'', u'', u'I', u'L', u'Kembayan', u'\r\n'),
-	(u'xep', u'', u'', u'', u'I', u'A', u'Epi-Olmec', u'\r\n'),
-	(u'xer', u'', u'', u'', u'I', u'L', u'Xer\xe9nte', u'\r\n'),
-	(u'xes', u'', u'', u'', u'I', u'L', u'Kesawai', u'\r\n'),
-	(u'xet', u'', u'', u'', u'I', u'L', u'Xet\xe1', u'\r\n'),
-	(u'xeu', u'', u'', u'', u'I', u'L', u'Keoru-Ahia', u'\r\n'),
-	(u'xfa', u'', u'', u'', u'I', u'A', u'Faliscan', u'\r\n'),
-	(u'xga', u'', u'', u'', u'I', u'A', u'Galatian', u'\r\n'),
-	(u'xgf', u'', u'', u'', u'I', u'E', u'Gabrielino-Fernande\xf1o', u'\r\n'),
-	(u'xgl', u'', u'', u'', u'I', u'E', u'Galindan', u'\r\n'),
-	(u'xgr', u'', u'', u'', u'I', u'E', u'Garza', u'\r\n'),
-	(u'xha', u'', u'', u'', u'I', u'A', u'Harami', u'\r\n'),
-	(u'xhc', u'', u'', u'', u'I', u'E', u'Hunnic', u'\r\n'),
-	(u'xhd', u'', u'', u'', u'I', u'A', u'Hadrami', u'\r\n'),
-	(u'xhe', u'', u'', u'', u'I', u'L', u'Khetrani', u'\r\n'),
-	(u'xho', u'xho', u'xho', u'xh', u'I', u'L', u'Xhosa', u'\r\n'),
-	(u'xhr', u'', u'', u'', u'I', u'A', u'Hernican', u'\r\n'),
-	(u'xht', u'', u'', u'', u'I', u'A', u'Hattic', u'\r\n'),
-	(u'xhu', u'', u'', u'', u'I', u'A', u'Hurrian', u'\r\n'),
-	(u'xhv', u'', u'', u'', u'I', u'L', u'Khua', u'\r\n'),
-	(u'xia', u'', u'', u'', u'I', u'L', u'Xiandao', u'\r\n'),
-	(u'xib', u'', u'', u'', u'I', u'A', u'Iberian', u'\r\n'),
-	(u'xii', u'', u'', u'', u'I', u'L', u'Xiri', u'\r\n'),
-	(u'xil', u'', u'', u'', u'I', u'A', u'Illyrian', u'\r\n'),
-	(u'xin', u'', u'', u'', u'I', u'E', u'Xinca', u'\r\n'),
-	(u'xip', u'', u'', u'', u'I', u'E', u'Xipin\xe1wa', u'\r\n'),
-	(u'xir', u'', u'', u'', u'I', u'E', u'Xiri\xe2na', u'\r\n'),
-	(u'xiv', u'', u'', u'', u'I', u'A', u'Indus Valley Language', u'\r\n'),
-	(u'xiy', u'', u'', u'', u'I', u'L', u'Xipaya', u'\r\n'),
-	(u'xka', u'', u'', u'', u'I', u'L', u'Kalkoti', u'\r\n'),
-	(u'xkb', u'', u'', u'', u'I', u'L', u'Northern Nago', u'\r\n'),
-	(u'xkc', u'', u'', u'', u'I', u'L', u"Kho'ini", u'\r\n'),
-	(u'xkd', u'', u'', u'', u'I', u'L', u'Mendalam Kayan', u'\r\n'),
-	(u'xke', u'', u'', u'', u'I', u'L', u'Kereho', u'\r\n'),
-	(u'xkf', u'', u'', u'', u'I', u'L', u'Khengkha', u'\r\n'),
-	(u'xkg', u'', u'', u'', u'I', u'L', u'Kagoro', u'\r\n'),
-	(u'xkh', u'', u'', u'', u'I', u'L', u'Karahawyana', u'\r\n'),
-	(u'xki', u'', u'', u'', u'I', u'L', u'Kenyan Sign Language', u'\r\n'),
-	(u'xkj', u'', u'', u'', u'I', u'L', u'Kajali', u'\r\n'),
-	(u'xkk', u'', u'', u'', u'I', u'L', u"Kaco'", u'\r\n'),
-	(u'xkl', u'', u'', u'', u'I', u'L', u'Mainstream Kenyah', u'\r\n'),
-	(u'xkn', u'', u'', u'', u'I', u'L', u'Kayan River Kayan', u'\r\n'),
-	(u'xko', u'', u'', u'', u'I', u'L', u'Kiorr', u'\r\n'),
-	(u'xkp', u'', u'', u'', u'I', u'L', u'Kabatei', u'\r\n'),
-	(u'xkq', u'', u'', u'', u'I', u'L', u'Koroni', u'\r\n'),
-	(u'xkr', u'', u'', u'', u'I', u'E', u'Xakriab\xe1', u'\r\n'),
-	(u'xks', u'', u'', u'', u'I', u'L', u'Kumbewaha', u'\r\n'),
-	(u'xkt', u'', u'', u'', u'I', u'L', u'Kantosi', u'\r\n'),
-	(u'xku', u'', u'', u'', u'I', u'L', u'Kaamba', u'\r\n'),
-	(u'xkv', u'', u'', u'', u'I', u'L', u'Kgalagadi', u'\r\n'),
-	(u'xkw', u'', u'', u'', u'I', u'L', u'Kembra', u'\r\n'),
-	(u'xkx', u'', u'', u'', u'I', u'L', u'Karore', u'\r\n'),
-	(u'xky', u'', u'', u'', u'I', u'L', u"Uma' Lasan", u'\r\n'),
-	(u'xkz', u'', u'', u'', u'I', u'L', u'Kurtokha', u'\r\n'),
-	(u'xla', u'', u'', u'', u'I', u'L', u'Kamula', u'\r\n'),
-	(u'xlb', u'', u'', u'', u'I', u'E', u'Loup B', u'\r\n'),
-	(u'xlc', u'', u'', u'', u'I', u'A', u'Lycian', u'\r\n'),
-	(u'xld', u'', u'', u'', u'I', u'A', u'Lydian', u'\r\n'),
-	(u'xle', u'', u'', u'', u'I', u'A', u'Lemnian', u'\r\n'),
-	(u'xlg', u'', u'', u'', u'I', u'A', u'Ligurian (Ancient)', u'\r\n'),
-	(u'xli', u'', u'', u'', u'I', u'A', u'Liburnian', u'\r\n'),
-	(u'xln', u'', u'', u'', u'I', u'A', u'Alanic', u'\r\n'),
-	(u'xlo', u'', u'', u'', u'I', u'E', u'Loup A', u'\r\n'),
-	(u'xlp', u'', u'', u'', u'I', u'A', u'Lepontic', u'\r\n'),
-	(u'xls', u'', u'', u'', u'I', u'A', u'Lusitanian', u'\r\n'),
-	(u'xlu', u'', u'', u'', u'I', u'A', u'Cuneiform Luwian', u'\r\n'),
-	(u'xly', u'', u'', u'', u'I', u'A', u'Elymian', u'\r\n'),
-	(u'xma', u'', u'', u'', u'I', u'L', u'Mushungulu', u'\r\n'),
-	(u'xmb', u'', u'', u'', u'I', u'L', u'Mbonga', u'\r\n'),
-	(u'xmc', u'', u'', u'', u'I', u'L', u'Makhuwa-Marrevone', u'\r\n'),
-	(u'xmd', u'', u'', u'', u'I', u'L', u'Mbedam', u'\r\n'),
-	(u'xme', u'', u'', u'', u'I', u'A', u'Median', u'\r\n'),
-	(u'xmf', u'', u'', u'', u'I', u'L', u'Mingrelian', u'\r\n'),
-	(u'xmg', u'', u'', u'', u'I', u'L', u'Mengaka', u'\r\n'),
-	(u'xmh', u'', u'', u'', u'I', u'L', u'Kuku-Muminh', u'\r\n'),
-	(u'xmj', u'', u'', u'', u'I', u'L', u'Majera', u'\r\n'),
-	(u'xmk', u'', u'', u'', u'I', u'A', u'Ancient Macedonian', u'\r\n'),
-	(u'xml', u'', u'', u'', u'I', u'L', u'Malaysian Sign Language', u'\r\n'),
-	(u'xmm', u'', u'', u'', u'I', u'L', u'Manado Malay', u'\r\n'),
-	(u'xmn', u'', u'', u'', u'I', u'H', u'Manichaean Middle Persian', u'\r\n'),
-	(u'xmo', u'', u'', u'', u'I', u'L', u'Morerebi', u'\r\n'),
-	(u'xmp', u'', u'', u'', u'I', u'E', u"Kuku-Mu'inh", u'\r\n'),
-	(u'xmq', u'', u'', u'', u'I', u'E', u'Kuku-Mangk', u'\r\n'),
-	(u'xmr', u'', u'', u'', u'I', u'A', u'Meroitic', u'\r\n'),
-	(u'xms', u'', u'', u'', u'I', u'L', u'Moroccan Sign Language', u'\r\n'),
-	(u'xmt', u'', u'', u'', u'I', u'L', u'Matbat', u'\r\n'),
-	(u'xmu', u'', u'', u'', u'I', u'E', u'Kamu', u'\r\n'),
-	(u'xmv', u'', u'', u'', u'I', u'L', u'Antankarana Malagasy', u'\r\n'),
-	(u'xmw', u'', u'', u'', u'I', u'L', u'Tsimihety Malagasy', u'\r\n'),
-	(u'xmx', u'', u'', u'', u'I', u'L', u'Maden', u'\r\n'),
-	(u'xmy', u'', u'', u'', u'I', u'L', u'Mayaguduna', u'\r\n'),
-	(u'xmz', u'', u'', u'', u'I', u'L', u'Mori Bawah', u'\r\n'),
-	(u'xna', u'', u'', u'', u'I', u'A', u'Ancient North Arabian', u'\r\n'),
-	(u'xnb', u'', u'', u'', u'I', u'L', u'Kanakanabu', u'\r\n'),
-	(u'xng', u'', u'', u'', u'I', u'H', u'Middle Mongolian', u'\r\n'),
-	(u'xnh', u'', u'', u'', u'I', u'L', u'Kuanhua', u'\r\n'),
-	(u'xnn', u'', u'', u'', u'I', u'L', u'Northern Kankanay', u'\r\n'),
-	(u'xno', u'', u'', u'', u'I', u'H', u'Anglo-Norman', u'\r\n'),
-	(u'xnr', u'', u'', u'', u'I', u'L', u'Kangri', u'\r\n'),
-	(u'xns', u'', u'', u'', u'I', u'L', u'Kanashi', u'\r\n'),
-	(u'xnt', u'', u'', u'', u'I', u'E', u'Narragansett', u'\r\n'),
-	(u'xoc', u'', u'', u'', u'I', u'E', u"O'chi'chi'", u'\r\n'),
-	(u'xod', u'', u'', u'', u'I', u'L', u'Kokoda', u'\r\n'),
-	(u'xog', u'', u'', u'', u'I', u'L', u'Soga', u'\r\n'),
-	(u'xoi', u'', u'', u'', u'I', u'L', u'Kominimung', u'\r\n'),
-	(u'xok', u'', u'', u'', u'I', u'L', u'Xokleng', u'\r\n'),
-	(u'xom', u'', u'', u'', u'I', u'L', u'Komo (Sudan)', u'\r\n'),
-	(u'xon', u'', u'', u'', u'I', u'L', u'Konkomba', u'\r\n'),
-	(u'xoo', u'', u'', u'', u'I', u'E', u'Xukur\xfa', u'\r\n'),
-	(u'xop', u'', u'', u'', u'I', u'L', u'Kopar', u'\r\n'),
-	(u'xor', u'', u'', u'', u'I', u'L', u'Korubo', u'\r\n'),
-	(u'xow', u'', u'', u'', u'I', u'L', u'Kowaki', u'\r\n'),
-	(u'xpc', u'', u'', u'', u'I', u'E', u'Pecheneg', u'\r\n'),
-	(u'xpe', u'', u'', u'', u'I', u'L', u'Liberia Kpelle', u'\r\n'),
-	(u'xpg', u'', u'', u'', u'I', u'A', u'Phrygian', u'\r\n'),
-	(u'xpi', u'', u'', u'', u'I', u'E', u'Pictish', u'\r\n'),
-	(u'xpk', u'', u'', u'', u'I', u'L', u'Kulina Pano', u'\r\n'),
-	(u'xpm', u'', u'', u'', u'I', u'E', u'Pumpokol', u'\r\n'),
-	(u'xpn', u'', u'', u'', u'I', u'E', u'Kapinaw\xe1', u'\r\n'),
-	(u'xpo', u'', u'', u'', u'I', u'E', u'Pochutec', u'\r\n'),
-	(u'xpp', u'', u'', u'', u'I', u'E', u'Puyo-Paekche', u'\r\n'),
-	(u'xpq', u'', u'', u'', u'I', u'E', u'Mohegan-Pequot', u'\r\n'),
-	(u'xpr', u'', u'', u'', u'I', u'A', u'Parthian', u'\r\n'),
-	(u'xps', u'', u'', u'', u'I', u'E', u'Pisidian', u'\r\n'),
-	(u'xpu', u'', u'', u'', u'I', u'A', u'Punic', u'\r\n'),
-	(u'xpy', u'', u'', u'', u'I', u'E', u'Puyo', u'\r\n'),
-	(u'xqa', u'', u'', u'', u'I', u'H', u'Karakhanid', u'\r\n'),
-	(u'xqt', u'', u'', u'', u'I', u'A', u'Qatabanian', u'\r\n'),
-	(u'xra', u'', u'', u'', u'I', u'L', u'Krah\xf4', u'\r\n'),
-	(u'xrb', u'', u'', u'', u'I', u'L', u'Eastern Karaboro', u'\r\n'),
-	(u'xre', u'', u'', u'', u'I', u'L', u'Kreye', u'\r\n'),
-	(u'xri', u'', u'', u'', u'I', u'L', u'Krikati-Timbira', u'\r\n'),
-	(u'xrm', u'', u'', u'', u'I', u'E', u'Armazic', u'\r\n'),
-	(u'xrn', u'', u'', u'', u'I', u'E', u'Arin', u'\r\n'),
-	(u'xrr', u'', u'', u'', u'I', u'A', u'Raetic', u'\r\n'),
-	(u'xrt', u'', u'', u'', u'I', u'E', u'Aranama-Tamique', u'\r\n'),
-	(u'xru', u'', u'', u'', u'I', u'L', u'Marriammu', u'\r\n'),
-	(u'xrw', u'', u'', u'', u'I', u'L', u'Karawa', u'\r\n'),
-	(u'xsa', u'', u'', u'', u'I', u'A', u'Sabaean', u'\r\n'),
-	(u'xsb', u'', u'', u'', u'I', u'L', u'Tin\xe0 Sambal', u'\r\n'),
-	(u'xsc', u'', u'', u'', u'I', u'A', u'Scythian', u'\r\n'),
-	(u'xsd', u'', u'', u'', u'I', u'A', u'Sidetic', u'\r\n'),
-	(u'xse', u'', u'', u'', u'I', u'L', u'Sempan', u'\r\n'),
-	(u'xsh', u'', u'', u'', u'I', u'L', u'Shamang', u'\r\n'),
-	(u'xsi', u'', u'', u'', u'I', u'L', u'Sio', u'\r\n'),
-	(u'xsj', u'', u'', u'', u'I', u'L', u'Subi', u'\r\n'),
-	(u'xsl', u'', u'', u'', u'I', u'L', u'South Slavey', u'\r\n'),
-	(u'xsm', u'', u'', u'', u'I', u'L', u'Kasem', u'\r\n'),
-	(u'xsn', u'', u'', u'', u'I', u'L', u'Sanga (Nigeria)', u'\r\n'),
-	(u'xso', u'', u'', u'', u'I', u'E', u'Solano', u'\r\n'),
-	(u'xsp', u'', u'', u'', u'I', u'L', u'Silopi', u'\r\n'),
-	(u'xsq', u'', u'', u'', u'I', u'L', u'Makhuwa-Saka', u'\r\n'),
-	(u'xsr', u'', u'', u'', u'I', u'L', u'Sherpa', u'\r\n'),
-	(u'xss', u'', u'', u'', u'I', u'E', u'Assan', u'\r\n'),
-	(u'xsu', u'', u'', u'', u'I', u'L', u'Sanum\xe1', u'\r\n'),
-	(u'xsv', u'', u'', u'', u'I', u'E', u'Sudovian', u'\r\n'),
-	(u'xsy', u'', u'', u'', u'I', u'L', u'Saisiyat', u'\r\n'),
-	(u'xta', u'', u'', u'', u'I', u'L', u'Alcozauca Mixtec', u'\r\n'),
-	(u'xtb', u'', u'', u'', u'I', u'L', u'Chazumba Mixtec', u'\r\n'),
-	(u'xtc', u'', u'', u'', u'I', u'L', u'Katcha-Kadugli-Miri', u'\r\n'),
-	(u'xtd', u'', u'', u'', u'I', u'L', u'Diuxi-Tilantongo Mixtec', u'\r\n'),
-	(u'xte', u'', u'', u'', u'I', u'L', u'Ketengban', u'\r\n'),
-	(u'xtg', u'', u'', u'', u'I', u'A', u'Transalpine Gaulish', u'\r\n'),
-	(u'xti', u'', u'', u'', u'I', u'L', u'Sinicahua Mixtec', u'\r\n'),
-	(u'xtj', u'', u'', u'', u'I', u'L', u'San Juan Teita Mixtec', u'\r\n'),
-	(u'xtl', u'', u'', u'', u'I', u'L', u'Tijaltepec Mixtec', u'\r\n'),
-	(u'xtm', u'', u'', u'', u'I', u'L', u'Magdalena Pe\xf1asco Mixtec', u'\r\n'),
-	(u'xtn', u'', u'', u'', u'I', u'L', u'Northern Tlaxiaco Mixtec', u'\r\n'),
-	(u'xto', u'', u'', u'', u'I', u'A', u'Tokharian A', u'\r\n'),
-	(u'xtp', u'', u'', u'', u'I', u'L', u'San Miguel Piedras Mixtec', u'\r\n'),
-	(u'xtq', u'', u'', u'', u'I', u'H', u'Tumshuqese', u'\r\n'),
-	(u'xtr', u'', u'', u'', u'I', u'A', u'Early Tripuri', u'\r\n'),
-	(u'xts', u'', u'', u'', u'I', u'L', u'Sindihui Mixtec', u'\r\n'),
-	(u'xtt', u'', u'', u'', u'I', u'L', u'Tacahua Mixtec', u'\r\n'),
-	(u'xtu', u'', u'', u'', u'I', u'L', u'Cuyamecalco Mixtec', u'\r\n'),
-	(u'xtw', u'', u'', u'', u'I', u'L', u'Tawand\xea', u'\r\n'),
-	(u'xty', u'', u'', u'', u'I', u'L', u'Yoloxochitl Mixtec', u'\r\n'),
-	(u'xtz', u'', u'', u'', u'I', u'E', u'Tasmanian', u'\r\n'),
-	(u'xua', u'', u'', u'', u'I', u'L', u'Alu Kurumba', u'\r\n'),
-	(u'xub', u'', u'', u'', u'I', u'L', u'Betta Kurumba', u'\r\n'),
-	(u'xug', u'', u'', u'', u'I', u'L', u'Kunigami', u'\r\n'),
-	(u'xuj', u'', u'', u'', u'I', u'L', u'Jennu Kurumba', u'\r\n'),
-	(u'xum', u'', u'', u'', u'I', u'A', u'Umbrian', u'\r\n'),
-	(u'xuo', u'', u'', u'', u'I', u'L', u'Kuo', u'\r\n'),
-	(u'xup', u'', u'', u'', u'I', u'E', u'Upper Umpqua', u'\r\n'),
-	(u'xur', u'', u'', u'', u'I', u'A', u'Urartian', u'\r\n'),
-	(u'xut', u'', u'', u'', u'I', u'E', u'Kuthant', u'\r\n'),
-	(u'xuu', u'', u'', u'', u'I', u'L', u'Kxoe', u'\r\n'),
-	(u'xve', u'', u'', u'', u'I', u'A', u'Venetic', u'\r\n'),
-	(u'xvi', u'', u'', u'', u'I', u'L', u'Kamviri', u'\r\n'),
-	(u'xvn', u'', u'', u'', u'I', u'A', u'Vandalic', u'\r\n'),
-	(u'xvo', u'', u'', u'', u'I', u'A', u'Volscian', u'\r\n'),
-	(u'xvs', u'', u'', u'', u'I', u'A', u'Vestinian', u'\r\n'),
-	(u'xwa', u'', u'', u'', u'I', u'L', u'Kwaza', u'\r\n'),
-	(u'xwc', u'', u'', u'', u'I', u'E', u'Woccon', u'\r\n'),
-	(u'xwe', u'', u'', u'', u'I', u'L', u'Xwela Gbe', u'\r\n'),
-	(u'xwg', u'', u'', u'', u'I', u'L', u'Kwegu', u'\r\n'),
-	(u'xwl', u'', u'', u'', u'I', u'L', u'Western Xwla Gbe', u'\r\n'),
-	(u'xwo', u'', u'', u'', u'I', u'E', u'Written Oirat', u'\r\n'),
-	(u'xwr', u'', u'', u'', u'I', u'L', u'Kwerba Mamberamo', u'\r\n'),
-	(u'xxb', u'', u'', u'', u'I', u'E', u'Boro (Ghana)', u'\r\n'),
-	(u'xxk', u'', u'', u'', u'I', u'L', u"Ke'o", u'\r\n'),
-	(u'xxr', u'', u'', u'', u'I', u'E', u'Korop\xf3', u'\r\n'),
-	(u'xxt', u'', u'', u'', u'I', u'E', u'Tambora', u'\r\n'),
-	(u'xyl', u'', u'', u'', u'I', u'E', u'Yalakalore', u'\r\n'),
-	(u'xzh', u'', u'', u'', u'I', u'A', u'Zhang-Zhung', u'\r\n'),
-	(u'xzm', u'', u'', u'', u'I', u'E', u'Zemgalian', u'\r\n'),
-	(u'xzp', u'', u'', u'', u'I', u'H', u'Ancient Zapotec', u'\r\n'),
-	(u'yaa', u'', u'', u'', u'I', u'L', u'Yaminahua', u'\r\n'),
-	(u'yab', u'', u'', u'', u'I', u'L', u'Yuhup', u'\r\n'),
-	(u'yac', u'', u'', u'', u'I', u'L', u'Pass Valley Yali', u'\r\n'),
-	(u'yad', u'', u'', u'', u'I', u'L', u'Yagua', u'\r\n'),
-	(u'yae', u'', u'', u'', u'I', u'L', u'Pum\xe9', u'\r\n'),
-	(u'yaf', u'', u'', u'', u'I', u'L', u'Yaka (Democratic Republic of Congo)', u'\r\n'),
-	(u'yag', u'', u'', u'', u'I', u'L', u'Y\xe1mana', u'\r\n'),
-	(u'yah', u'', u'', u'', u'I', u'L', u'Yazgulyam', u'\r\n'),
-	(u'yai', u'', u'', u'', u'I', u'L', u'Yagnobi', u'\r\n'),
-	(u'yaj', u'', u'', u'', u'I', u'L', u'Banda-Yangere', u'\r\n'),
-	(u'yak', u'', u'', u'', u'I', u'L', u'Yakama', u'\r\n'),
-	(u'yal', u'', u'', u'', u'I', u'L', u'Yalunka', u'\r\n'),
-	(u'yam', u'', u'', u'', u'I', u'L', u'Yamba', u'\r\n'),
-	(u'yan', u'', u'', u'', u'I', u'L', u'Mayangna', u'\r\n'),
-	(u'yao', u'yao', u'yao', u'', u'I', u'L', u'Yao', u'\r\n'),
-	(u'yap', u'yap', u'yap', u'', u'I', u'L', u'Yapese', u'\r\n'),
-	(u'yaq', u'', u'', u'', u'I', u'L', u'Yaqui', u'\r\n'),
-	(u'yar', u'', u'', u'', u'I', u'L', u'Yabarana', u'\r\n'),
-	(u'yas', u'', u'', u'', u'I', u'L', u'Nugunu (Cameroon)', u'\r\n'),
-	(u'yat', u'', u'', u'', u'I', u'L', u'Yambeta', u'\r\n'),
-	(u'yau', u'', u'', u'', u'I', u'L', u'Yuwana', u'\r\n'),
-	(u'yav', u'', u'', u'', u'I', u'L', u'Yangben', u'\r\n'),
-	(u'yaw', u'', u'', u'', u'I', u'L', u'Yawalapit\xed', u'\r\n'),
-	(u'yax', u'', u'', u'', u'I', u'L', u'Yauma', u'\r\n'),
-	(u'yay', u'', u'', u'', u'I', u'L', u'Agwagwune', u'\r\n'),
-	(u'yaz', u'', u'', u'', u'I', u'L', u'Lokaa', u'\r\n'),
-	(u'yba', u'', u'', u'', u'I', u'L', u'Yala', u'\r\n'),
-	(u'ybb', u'', u'', u'', u'I', u'L', u'Yemba', u'\r\n'),
-	(u'ybd', u'', u'', u'', u'I', u'L', u'Yangbye', u'\r\n'),
-	(u'ybe', u'', u'', u'', u'I', u'L', u'West Yugur', u'\r\n'),
-	(u'ybh', u'', u'', u'', u'I', u'L', u'Yakha', u'\r\n'),
-	(u'ybi', u'', u'', u'', u'I', u'L', u'Yamphu', u'\r\n'),
-	(u'ybj', u'', u'', u'', u'I', u'L', u'Hasha', u'\r\n'),
-	(u'ybk', u'', u'', u'', u'I', u'L', u'Bokha', u'\r\n'),
-	(u'ybl', u'', u'', u'', u'I', u'L', u'Yukuben', u'\r\n'),
-	(u'ybm', u'', u'', u'', u'I', u'L', u'Yaben', u'\r\n'),
-	(u'ybn', u'', u'', u'', u'I', u'E', u'Yaba\xe2na', u'\r\n'),
-	(u'ybo', u'', u'', u'', u'I', u'L', u'Yabong', u'\r\n'),
-	(u'ybx', u'', u'', u'', u'I', u'L', u'Yawiyo', u'\r\n'),
-	(u'yby', u'', u'', u'', u'I', u'L', u'Yaweyuha', u'\r\n'),
-	(u'ych', u'', u'', u'', u'I', u'L', u'Chesu', u'\r\n'),
-	(u'ycl', u'', u'', u'', u'I', u'L', u'Lolopo', u'\r\n'),
-	(u'ycn', u'', u'', u'', u'I', u'L', u'Yucuna', u'\r\n'),
-	(u'ycp', u'', u'', u'', u'I', u'L', u'Chepya', u'\r\n'),
-	(u'ydd', u'', u'', u'', u'I', u'L', u'Eastern Yiddish', u'\r\n'),
-	(u'yde', u'', u'', u'', u'I', u'L', u'Yangum Dey', u'\r\n'),
-	(u'ydg', u'', u'', u'', u'I', u'L', u'Yidgha', u'\r\n'),
-	(u'ydk', u'', u'', u'', u'I', u'L', u'Yoidik', u'\r\n'),
-	(u'yds', u'', u'', u'', u'I', u'L', u'Yiddish Sign Language', u'\r\n'),
-	(u'yea', u'', u'', u'', u'I', u'L', u'Ravula', u'\r\n'),
-	(u'yec', u'', u'', u'', u'I', u'L', u'Yeniche', u'\r\n'),
-	(u'yee', u'', u'', u'', u'I', u'L', u'Yimas', u'\r\n'),
-	(u'yei', u'', u'', u'', u'I', u'E', u'Yeni', u'\r\n'),
-	(u'yej', u'', u'', u'', u'I', u'L', u'Yevanic', u'\r\n'),
-	(u'yel', u'', u'', u'', u'I', u'L', u'Yela', u'\r\n'),
-	(u'yen', u'', u'', u'', u'I', u'L', u'Yendang', u'\r\n'),
-	(u'yer', u'', u'', u'', u'I', u'L', u'Tarok', u'\r\n'),
-	(u'yes', u'', u'', u'', u'I', u'L', u'Yeskwa', u'\r\n'),
-	(u'yet', u'', u'', u'', u'I', u'L', u'Yetfa', u'\r\n'),
-	(u'yeu', u'', u'', u'', u'I', u'L', u'Yerukula', u'\r\n'),
-	(u'yev', u'', u'', u'', u'I', u'L', u'Yapunda', u'\r\n'),
-	(u'yey', u'', u'', u'', u'I', u'L', u'Yeyi', u'\r\n'),
-	(u'ygl', u'', u'', u'', u'I', u'L', u'Yangum Gel', u'\r\n'),
-	(u'ygm', u'', u'', u'', u'I', u'L', u'Yagomi', u'\r\n'),
-	(u'ygp', u'', u'', u'', u'I', u'L', u'Gepo', u'\r\n'),
-	(u'ygr', u'', u'', u'', u'I', u'L', u'Yagaria', u'\r\n'),
-	(u'ygw', u'', u'', u'', u'I', u'L', u'Yagwoia', u'\r\n'),
-	(u'yha', u'', u'', u'', u'I', u'L', u'Baha Buyang', u'\r\n'),
-	(u'yhd', u'', u'', u'', u'I', u'L', u'Judeo-Iraqi Arabic', u'\r\n'),
-	(u'yhl', u'', u'', u'', u'I', u'L', u'Hlepho Phowa', u'\r\n'),
-	(u'yia', u'', u'', u'', u'I', u'L', u'Yinggarda', u'\r\n'),
-	(u'yid', u'yid', u'yid', u'yi', u'M', u'L', u'Yiddish', u'\r\n'),
-	(u'yif', u'', u'', u'', u'I', u'L', u'Ache', u'\r\n'),
-	(u'yig', u'', u'', u'', u'I', u'L', u'Wusa Nasu', u'\r\n'),
-	(u'yih', u'', u'', u'', u'I', u'L', u'Western Yiddish', u'\r\n'),
-	(u'yii', u'', u'', u'', u'I', u'L', u'Yidiny', u'\r\n'),
-	(u'yij', u'', u'', u'', u'I', u'L', u'Yindjibarndi', u'\r\n'),
-	(u'yik', u'', u'', u'', u'I', u'L', u'Dongshanba Lalo', u'\r\n'),
-	(u'yil', u'', u'', u'', u'I', u'E', u'Yindjilandji', u'\r\n'),
-	(u'yim', u'', u'', u'', u'I', u'L', u'Yimchungru Naga', u'\r\n'),
-	(u'yin', u'', u'', u'', u'I', u'L', u'Yinchia', u'\r\n'),
-	(u'yip', u'', u'', u'', u'I', u'L', u'Pholo', u'\r\n'),
-	(u'yiq', u'', u'', u'', u'I', u'L', u'Miqie', u'\r\n'),
-	(u'yir', u'', u'', u'', u'I', u'L', u'North Awyu', u'\r\n'),
-	(u'yis', u'', u'', u'', u'I', u'L', u'Yis', u'\r\n'),
-	(u'yit', u'', u'', u'', u'I', u'L', u'Eastern Lalu', u'\r\n'),
-	(u'yiu', u'', u'', u'', u'I', u'L', u'Awu', u'\r\n'),
-	(u'yiv', u'', u'', u'', u'I', u'L', u'Northern Nisu', u'\r\n'),
-	(u'yix', u'', u'', u'', u'I', u'L', u'Axi Yi', u'\r\n'),
-	(u'yiy', u'', u'', u'', u'I', u'L', u'Yir Yoront', u'\r\n'),
-	(u'yiz', u'', u'', u'', u'I', u'L', u'Azhe', u'\r\n'),
-	(u'yka', u'', u'', u'', u'I', u'L', u'Yakan', u'\r\n'),
-	(u'ykg', u'', u'', u'', u'I', u'L', u'Northern Yukaghir', u'\r\n'),
-	(u'yki', u'', u'', u'', u'I', u'L', u'Yoke', u'\r\n'),
-	(u'ykk', u'', u'', u'', u'I', u'L', u'Yakaikeke', u'\r\n'),
-	(u'ykl', u'', u'', u'', u'I', u'L', u'Khlula', u'\r\n'),
-	(u'ykm', u'', u'', u'', u'I', u'L', u'Kap', u'\r\n'),
-	(u'yko', u'', u'', u'', u'I', u'L', u'Yasa', u'\r\n'),
-	(u'ykr', u'', u'', u'', u'I', u'L', u'Yekora', u'\r\n'),
-	(u'ykt', u'', u'', u'', u'I', u'L', u'Kathu', u'\r\n'),
-	(u'yky', u'', u'', u'', u'I', u'L', u'Yakoma', u'\r\n'),
-	(u'yla', u'', u'', u'', u'I', u'L', u'Yaul', u'\r\n'),
-	(u'ylb', u'', u'', u'', u'I', u'L', u'Yaleba', u'\r\n'),
-	(u'yle', u'', u'', u'', u'I', u'L', u'Yele', u'\r\n'),
-	(u'ylg', u'', u'', u'', u'I', u'L', u'Yelogu', u'\r\n'),
-	(u'yli', u'', u'', u'', u'I', u'L', u'Angguruk Yali', u'\r\n'),
-	(u'yll', u'', u'', u'', u'I', u'L', u'Yil', u'\r\n'),
-	(u'ylm', u'', u'', u'', u'I', u'L', u'Limi', u'\r\n'),
-	(u'yln', u'', u'', u'', u'I', u'L', u'Langnian Buyang', u'\r\n'),
-	(u'ylo', u'', u'', u'', u'I', u'L', u'Naluo Yi', u'\r\n'),
-	(u'ylr', u'', u'', u'', u'I', u'E', u'Yalarnnga', u'\r\n'),
-	(u'ylu', u'', u'', u'', u'I', u'L', u'Aribwaung', u'\r\n'),
-	(u'yly', u'', u'', u'', u'I', u'L', u'Ny\xe2layu', u'\r\n'),
-	(u'yma', u'', u'', u'', u'I', u'L', u'Yamphe', u'\r\n'),
-	(u'ymb', u'', u'', u'', u'I', u'L', u'Yambes', u'\r\n'),
-	(u'ymc', u'', u'', u'', u'I', u'L', u'Southern Muji', u'\r\n'),
-	(u'ymd', u'', u'', u'', u'I', u'L', u'Muda', u'\r\n'),
-	(u'yme', u'', u'', u'', u'I', u'E', u'Yameo', u'\r\n'),
-	(u'ymg', u'', u'', u'', u'I', u'L', u'Yamongeri', u'\r\n'),
-	(u'ymh', u'', u'', u'', u'I', u'L', u'Mili', u'\r\n'),
-	(u'ymi', u'', u'', u'', u'I', u'L', u'Moji', u'\r\n'),
-	(u'ymk', u'', u'', u'', u'I', u'L', u'Makwe', u'\r\n'),
-	(u'yml', u'', u'', u'', u'I', u'L', u'Iamalele', u'\r\n'),
-	(u'ymm', u'', u'', u'', u'I', u'L', u'Maay', u'\r\n'),
-	(u'ymn', u'', u'', u'', u'I', u'L', u'Yamna', u'\r\n'),
-	(u'ymo', u'', u'', u'', u'I', u'L', u'Yangum Mon', u'\r\n'),
-	(u'ymp', u'', u'', u'', u'I', u'L', u'Yamap', u'\r\n'),
-	(u'ymq', u'', u'', u'', u'I', u'L', u'Qila Muji', u'\r\n'),
-	(u'ymr', u'', u'', u'', u'I', u'L', u'Malasar', u'\r\n'),
-	(u'yms', u'', u'', u'', u'I', u'A', u'Mysian', u'\r\n'),
-	(u'ymt', u'', u'', u'', u'I', u'E', u'Mator-Taygi-Karagas', u'\r\n'),
-	(u'ymx', u'', u'', u'', u'I', u'L', u'Northern Muji', u'\r\n'),
-	(u'ymz', u'', u'', u'', u'I', u'L', u'Muzi', u'\r\n'),
-	(u'yna', u'', u'', u'', u'I', u'L', u'Aluo', u'\r\n'),
-	(u'ynd', u'', u'', u'', u'I', u'E', u'Yandruwandha', u'\r\n'),
-	(u'yne', u'', u'', u'', u'I', u'L', u"Lang'e", u'\r\n'),
-	(u'yng', u'', u'', u'', u'I', u'L', u'Yango', u'\r\n'),
-	(u'ynh', u'', u'', u'', u'I', u'L', u'Yangho', u'\r\n'),
-	(u'ynk', u'', u'', u'', u'I', u'L', u'Naukan Yupik', u'\r\n'),
-	(u'ynl', u'', u'', u'', u'I', u'L', u'Yangulam', u'\r\n'),
-	(u'ynn', u'', u'', u'', u'I', u'E', u'Yana', u'\r\n'),
-	(u'yno', u'', u'', u'', u'I', u'L', u'Yong', u'\r\n'),
-	(u'yns', u'', u'', u'', u'I', u'L', u'Yansi', u'\r\n'),
-	(u'ynu', u'', u'', u'', u'I', u'E', u'Yahuna', u'\r\n'),
-	(u'yob', u'', u'', u'', u'I', u'E', u'Yoba', u'\r\n'),
-	(u'yog', u'', u'', u'', u'I', u'L', u'Yogad', u'\r\n'),
-	(u'yoi', u'', u'', u'', u'I', u'L', u'Yonaguni', u'\r\n'),
-	(u'yok', u'', u'', u'', u'I', u'L', u'Yokuts', u'\r\n'),
-	(u'yol', u'', u'', u'', u'I', u'E', u'Yola', u'\r\n'),
-	(u'yom', u'', u'', u'', u'I', u'L', u'Yombe', u'\r\n'),
-	(u'yon', u'', u'', u'', u'I', u'L', u'Yonggom', u'\r\n'),
-	(u'yor', u'yor', u'yor', u'yo', u'I', u'L', u'Yoruba', u'\r\n'),
-	(u'yos', u'', u'', u'', u'I', u'L', u'Yos', u'\r\n'),
-	(u'yox', u'', u'', u'', u'I', u'L', u'Yoron', u'\r\n'),
-	(u'yoy', u'', u'', u'', u'I', u'L', u'Yoy', u'\r\n'),
-	(u'ypa', u'', u'', u'', u'I', u'L', u'Phala', u'\r\n'),
-	(u'ypb', u'', u'', u'', u'I', u'L', u'Labo Phowa', u'\r\n'),
-	(u'ypg', u'', u'', u'', u'I', u'L', u'Phola', u'\r\n'),
-	(u'yph', u'', u'', u'', u'I', u'L', u'Phupha', u'\r\n'),
-	(u'ypm', u'', u'', u'', u'I', u'L', u'Phuma', u'\r\n'),
-	(u'ypn', u'', u'', u'', u'I', u'L', u'Ani Phowa', u'\r\n'),
-	(u'ypo', u'', u'', u'', u'I', u'L', u'Alo Phola', u'\r\n'),
-	(u'ypp', u'', u'', u'', u'I', u'L', u'Phupa', u'\r\n'),
-	(u'ypz', u'', u'', u'', u'I', u'L', u'Phuza', u'\r\n'),
-	(u'yra', u'', u'', u'', u'I', u'L', u'Yerakai', u'\r\n'),
-	(u'yrb', u'', u'', u'', u'I', u'L', u'Yareba', u'\r\n'),
-	(u'yre', u'', u'', u'', u'I', u'L', u'Yaour\xe9', u'\r\n'),
-	(u'yri', u'', u'', u'', u'I', u'L', u'Yar\xed', u'\r\n'),
-	(u'yrk', u'', u'', u'', u'I', u'L', u'Nenets', u'\r\n'),
-	(u'yrl', u'', u'', u'', u'I', u'L', u'Nhengatu', u'\r\n'),
-	(u'yrn', u'', u'', u'', u'I', u'L', u'Yerong', u'\r\n'),
-	(u'yrs', u'', u'', u'', u'I', u'L', u'Yarsun', u'\r\n'),
-	(u'yrw', u'', u'', u'', u'I', u'L', u'Yarawata', u'\r\n'),
-	(u'ysc', u'', u'', u'', u'I', u'E', u'Yassic', u'\r\n'),
-	(u'ysd', u'', u'', u'', u'I', u'L', u'Samatao', u'\r\n'),
-	(u'ysl', u'', u'', u'', u'I', u'L', u'Yugoslavian Sign Language', u'\r\n'),
-	(u'ysn', u'', u'', u'', u'I', u'L', u'Sani', u'\r\n'),
-	(u'yso', u'', u'', u'', u'I', u'L', u'Nisi (China)', u'\r\n'),
-	(u'ysp', u'', u'', u'', u'I', u'L', u'Southern Lolopo', u'\r\n'),
-	(u'ysr', u'', u'', u'', u'I', u'E', u'Sirenik Yupik', u'\r\n'),
-	(u'yss', u'', u'', u'', u'I', u'L', u'Yessan-Mayo', u'\r\n'),
-	(u'ysy', u'', u'', u'', u'I', u'L', u'Sanie', u'\r\n'),
-	(u'yta', u'', u'', u'', u'I', u'L', u'Talu', u'\r\n'),
-	(u'ytl', u'', u'', u'', u'I', u'L', u'Tanglang', u'\r\n'),
-	(u'ytp', u'', u'', u'', u'I', u'L', u'Thopho', u'\r\n'),
-	(u'ytw', u'', u'', u'', u'I', u'L', u'Yout Wam', u'\r\n'),
-	(u'yua', u'', u'', u'', u'I', u'L', u'Yucateco', u'\r\n'),
-	(u'yub', u'', u'', u'', u'I', u'E', u'Yugambal', u'\r\n'),
-	(u'yuc', u'', u'', u'', u'I', u'L', u'Yuchi', u'\r\n'),
-	(u'yud', u'', u'', u'', u'I', u'L', u'Judeo-Tripolitanian Arabic', u'\r\n'),
-	(u'yue', u'', u'', u'', u'I', u'L', u'Yue Chinese', u'\r\n'),
-	(u'yuf', u'', u'', u'', u'I', u'L', u'Havasupai-Walapai-Yavapai', u'\r\n'),
-	(u'yug', u'', u'', u'', u'I', u'E', u'Yug', u'\r\n'),
-	(u'yui', u'', u'', u'', u'I', u'L', u'Yurut\xed', u'\r\n'),
-	(u'yuj', u'', u'', u'', u'I', u'L', u'Karkar-Yuri', u'\r\n'),
-	(u'yuk', u'', u'', u'', u'I', u'E', u'Yuki', u'\r\n'),
-	(u'yul', u'', u'', u'', u'I', u'L', u'Yulu', u'\r\n'),
-	(u'yum', u'', u'', u'', u'I', u'L', u'Quechan', u'\r\n'),
-	(u'yun', u'', u'', u'', u'I', u'L', u'Bena (Nigeria)', u'\r\n'),
-	(u'yup', u'', u'', u'', u'I', u'L', u'Yukpa', u'\r\n'),
-	(u'yuq', u'', u'', u'', u'I', u'L', u'Yuqui', u'\r\n'),
-	(u'yur', u'', u'', u'', u'I', u'L', u'Yurok', u'\r\n'),
-	(u'yut', u'', u'', u'', u'I', u'L', u'Yopno', u'\r\n'),
-	(u'yuu', u'', u'', u'', u'I', u'L', u'Yugh', u'\r\n'),
-	(u'yuw', u'', u'', u'', u'I', u'L', u'Yau (Morobe Province)', u'\r\n'),
-	(u'yux', u'', u'', u'', u'I', u'L', u'Southern Yukaghir', u'\r\n'),
-	(u'yuy', u'', u'', u'', u'I', u'L', u'East Yugur', u'\r\n'),
-	(u'yuz', u'', u'', u'', u'I', u'L', u'Yuracare', u'\r\n'),
-	(u'yva', u'', u'', u'', u'I', u'L', u'Yawa', u'\r\n'),
-	(u'yvt', u'', u'', u'', u'I', u'E', u'Yavitero', u'\r\n'),
-	(u'ywa', u'', u'', u'', u'I', u'L', u'Kalou', u'\r\n'),
-	(u'ywl', u'', u'', u'', u'I', u'L', u'Western Lalu', u'\r\n'),
-	(u'ywn', u'', u'', u'', u'I', u'L', u'Yawanawa', u'\r\n'),
-	(u'ywq', u'', u'', u'', u'I', u'L', u'Wuding-Luquan Yi', u'\r\n'),
-	(u'ywr', u'', u'', u'', u'I', u'L', u'Yawuru', u'\r\n'),
-	(u'ywt', u'', u'', u'', u'I', u'L', u'Xishanba Lalo', u'\r\n'),
-	(u'ywu', u'', u'', u'', u'I', u'L', u'Wumeng Nasu', u'\r\n'),
-	(u'yww', u'', u'', u'', u'I', u'E', u'Yawarawarga', u'\r\n'),
-	(u'yyu', u'', u'', u'', u'I', u'L', u'Yau (Sandaun Province)', u'\r\n'),
-	(u'yyz', u'', u'', u'', u'I', u'L', u'Ayizi', u'\r\n'),
-	(u'yzg', u'', u'', u'', u'I', u'L', u"E'ma Buyang", u'\r\n'),
-	(u'yzk', u'', u'', u'', u'I', u'L', u'Zokhuo', u'\r\n'),
-	(u'zaa', u'', u'', u'', u'I', u'L', u'Sierra de Ju\xe1rez Zapotec', u'\r\n'),
-	(u'zab', u'', u'', u'', u'I', u'L', u'San Juan Guelav\xeda Zapotec', u'\r\n'),
-	(u'zac', u'', u'', u'', u'I', u'L', u'Ocotl\xe1n Zapotec', u'\r\n'),
-	(u'zad', u'', u'', u'', u'I', u'L', u'Cajonos Zapotec', u'\r\n'),
-	(u'zae', u'', u'', u'', u'I', u'L', u'Yareni Zapotec', u'\r\n'),
-	(u'zaf', u'', u'', u'', u'I', u'L', u'Ayoquesco Zapotec', u'\r\n'),
-	(u'zag', u'', u'', u'', u'I', u'L', u'Zaghawa', u'\r\n'),
-	(u'zah', u'', u'', u'', u'I', u'L', u'Zangwal', u'\r\n'),
-	(u'zai', u'', u'', u'', u'I', u'L', u'Isthmus Zapotec', u'\r\n'),
-	(u'zaj', u'', u'', u'', u'I', u'L', u'Zaramo', u'\r\n'),
-	(u'zak', u'', u'', u'', u'I', u'L', u'Zanaki', u'\r\n'),
-	(u'zal', u'', u'', u'', u'I', u'L', u'Zauzou', u'\r\n'),
-	(u'zam', u'', u'', u'', u'I', u'L', u'Miahuatl\xe1n Zapotec', u'\r\n'),
-	(u'zao', u'', u'', u'', u'I', u'L', u'Ozolotepec Zapotec', u'\r\n'),
-	(u'zap', u'zap', u'zap', u'', u'M', u'L', u'Zapotec', u'\r\n'),
-	(u'zaq', u'', u'', u'', u'I', u'L', u'Alo\xe1pam Zapotec', u'\r\n'),
-	(u'zar', u'', u'', u'', u'I', u'L', u'Rinc\xf3n Zapotec', u'\r\n'),
-	(u'zas', u'', u'', u'', u'I', u'L', u'Santo Domingo Albarradas Zapotec', u'\r\n'),
-	(u'zat', u'', u'', u'', u'I', u'L', u'Tabaa Zapotec', u'\r\n'),
-	(u'zau', u'', u'', u'', u'I', u'L', u'Zangskari', u'\r\n'),
-	(u'zav', u'', u'', u'', u'I', u'L', u'Yatzachi Zapotec', u'\r\n'),
-	(u'zaw', u'', u'', u'', u'I', u'L', u'Mitla Zapotec', u'\r\n'),
-	(u'zax', u'', u'', u'', u'I', u'L', u'Xadani Zapotec', u'\r\n'),
-	(u'zay', u'', u'', u'', u'I', u'L', u'Zayse-Zergulla', u'\r\n'),
-	(u'zaz', u'', u'', u'', u'I', u'L', u'Zari', u'\r\n'),
-	(u'zbc', u'', u'', u'', u'I', u'L', u'Central Berawan', u'\r\n'),
-	(u'zbe', u'', u'', u'', u'I', u'L', u'East Berawan', u'\r\n'),
-	(u'zbl', u'zbl', u'zbl', u'', u'I', u'C', u'Blissymbols', u'\r\n'),
-	(u'zbt', u'', u'', u'', u'I', u'L', u'Batui', u'\r\n'),
-	(u'zbw', u'', u'', u'', u'I', u'L', u'West Berawan', u'\r\n'),
-	(u'zca', u'', u'', u'', u'I', u'L', u'Coatecas Altas Zapotec', u'\r\n'),
-	(u'zch', u'', u'', u'', u'I', u'L', u'Central Hongshuihe Zhuang', u'\r\n'),
-	(u'zdj', u'', u'', u'', u'I', u'L', u'Ngazidja Comorian', u'\r\n'),
-	(u'zea', u'', u'', u'', u'I', u'L', u'Zeeuws', u'\r\n'),
-	(u'zeg', u'', u'', u'', u'I', u'L', u'Zenag', u'\r\n'),
-	(u'zeh', u'', u'', u'', u'I', u'L', u'Eastern Hongshuihe Zhuang', u'\r\n'),
-	(u'zen', u'zen', u'zen', u'', u'I', u'L', u'Zenaga', u'\r\n'),
-	(u'zga', u'', u'', u'', u'I', u'L', u'Kinga', u'\r\n'),
-	(u'zgb', u'', u'', u'', u'I', u'L', u'Guibei Zhuang', u'\r\n'),
-	(u'zgm', u'', u'', u'', u'I', u'L', u'Minz Zhuang', u'\r\n'),
-	(u'zgn', u'', u'', u'', u'I', u'L', u'Guibian Zhuang', u'\r\n'),
-	(u'zgr', u'', u'', u'', u'I', u'L', u'Magori', u'\r\n'),
-	(u'zha', u'zha', u'zha', u'za', u'M', u'L', u'Zhuang', u'\r\n'),
-	(u'zhb', u'', u'', u'', u'I', u'L', u'Zhaba', u'\r\n'),
-	(u'zhd', u'', u'', u'', u'I', u'L', u'Dai Zhuang', u'\r\n'),
-	(u'zhi', u'', u'', u'', u'I', u'L', u'Zhire', u'\r\n'),
-	(u'zhn', u'', u'', u'', u'I', u'L', u'Nong Zhuang', u'\r\n'),
-	(u'zho', u'chi', u'zho', u'zh', u'M', u'L', u'Chinese', u'\r\n'),
-	(u'zhw', u'', u'', u'', u'I', u'L', u'Zhoa', u'\r\n'),
-	(u'zia', u'', u'', u'', u'I', u'L', u'Zia', u'\r\n'),
-	(u'zib', u'', u'', u'', u'I', u'L', u'Zimbabwe Sign Language', u'\r\n'),
-	(u'zik', u'', u'', u'', u'I', u'L', u'Zimakani', u'\r\n'),
-	(u'zim', u'', u'', u'', u'I', u'L', u'Mesme', u'\r\n'),
-	(u'zin', u'', u'', u'', u'I', u'L', u'Zinza', u'\r\n'),
-	(u'zir', u'', u'', u'', u'I', u'E', u'Ziriya', u'\r\n'),
-	(u'ziw', u'', u'', u'', u'I', u'L', u'Zigula', u'\r\n'),
-	(u'ziz', u'', u'', u'', u'I', u'L', u'Zizilivakan', u'\r\n'),
-	(u'zka', u'', u'', u'', u'I', u'L', u'Kaimbulawa', u'\r\n'),
-	(u'zkb', u'', u'', u'', u'I', u'E', u'Koibal', u'\r\n'),
-	(u'zkg', u'', u'', u'', u'I', u'E', u'Koguryo', u'\r\n'),
-	(u'zkh', u'', u'', u'', u'I', u'E', u'Khorezmian', u'\r\n'),
-	(u'zkk', u'', u'', u'', u'I', u'E', u'Karankawa', u'\r\n'),
-	(u'zko', u'', u'', u'', u'I', u'E', u'Kott', u'\r\n'),
-	(u'zkp', u'', u'', u'', u'I', u'E', u'S\xe3o Paulo Kaing\xe1ng', u'\r\n'),
-	(u'zkr', u'', u'', u'', u'I', u'L', u'Zakhring', u'\r\n'),
-	(u'zkt', u'', u'', u'', u'I', u'E', u'Kitan', u'\r\n'),
-	(u'zku', u'', u'', u'', u'I', u'E', u'Kaurna', u'\r\n'),
-	(u'zkv', u'', u'', u'', u'I', u'E', u'Krevinian', u'\r\n'),
-	(u'zkz', u'', u'', u'', u'I', u'E', u'Khazar', u'\r\n'),
-	(u'zlj', u'', u'', u'', u'I', u'L', u'Liujiang Zhuang', u'\r\n'),
-	(u'zlm', u'', u'', u'', u'I', u'L', u'Malay (individual language)', u'\r\n'),
-	(u'zln', u'', u'', u'', u'I', u'L', u'Lianshan Zhuang', u'\r\n'),
-	(u'zlq', u'', u'', u'', u'I', u'L', u'Liuqian Zhuang', u'\r\n'),
-	(u'zma', u'', u'', u'', u'I', u'L', u'Manda (Australia)', u'\r\n'),
-	(u'zmb', u'', u'', u'', u'I', u'L', u'Zimba', u'\r\n'),
-	(u'zmc', u'', u'', u'', u'I', u'E', u'Margany', u'\r\n'),
-	(u'zmd', u'', u'', u'', u'I', u'L', u'Maridan', u'\r\n'),
-	(u'zme', u'', u'', u'', u'I', u'E', u'Mangerr', u'\r\n'),
-	(u'zmf', u'', u'', u'', u'I', u'L', u'Mfinu', u'\r\n'),
-	(u'zmg', u'', u'', u'', u'I', u'L', u'Marti Ke', u'\r\n'),
-	(u'zmh', u'', u'', u'', u'I', u'E', u'Makolkol', u'\r\n'),
-	(u'zmi', u'', u'', u'', u'I', u'L', u'Negeri Sembilan Malay', u'\r\n'),
-	(u'zmj', u'', u'', u'', u'I', u'L', u'Maridjabin', u'\r\n'),
-	(u'zmk', u'', u'', u'', u'I', u'E', u'Mandandanyi', u'\r\n'),
-	(u'zml', u'', u'', u'', u'I', u'L', u'Madngele', u'\r\n'),
-	(u'zmm', u'', u'', u'', u'I', u'L', u'Marimanindji', u'\r\n'),
-	(u'zmn', u'', u'', u'', u'I', u'L', u'Mbangwe', u'\r\n'),
-	(u'zmo', u'', u'', u'', u'I', u'L', u'Molo', u'\r\n'),
-	(u'zmp', u'', u'', u'', u'I', u'L', u'Mpuono', u'\r\n'),
-	(u'zmq', u'', u'', u'', u'I', u'L', u'Mituku', u'\r\n'),
-	(u'zmr', u'', u'', u'', u'I', u'L', u'Maranunggu', u'\r\n'),
-	(u'zms', u'', u'', u'', u'I', u'L', u'Mbesa', u'\r\n'),
-	(u'zmt', u'', u'', u'', u'I', u'L', u'Maringarr', u'\r\n'),
-	(u'zmu', u'', u'', u'', u'I', u'E', u'Muruwari', u'\r\n'),
-	(u'zmv', u'', u'', u'', u'I', u'E', u'Mbariman-Gudhinma', u'\r\n'),
-	(u'zmw', u'', u'', u'', u'I', u'L', u'Mbo (Democratic Republic of Congo)', u'\r\n'),
-	(u'zmx', u'', u'', u'', u'I', u'L', u'Bomitaba', u'\r\n'),
-	(u'zmy', u'', u'', u'', u'I', u'L', u'Mariyedi', u'\r\n'),
-	(u'zmz', u'', u'', u'', u'I', u'L', u'Mbandja', u'\r\n'),
-	(u'zna', u'', u'', u'', u'I', u'L', u'Zan Gula', u'\r\n'),
-	(u'zne', u'', u'', u'', u'I', u'L', u'Zande (individual language)', u'\r\n'),
-	(u'zng', u'', u'', u'', u'I', u'L', u'Mang', u'\r\n'),
-	(u'znk', u'', u'', u'', u'I', u'E', u'Manangkari', u'\r\n'),
-	(u'zns', u'', u'', u'', u'I', u'L', u'Mangas', u'\r\n'),
-	(u'zoc', u'', u'', u'', u'I', u'L', u'Copainal\xe1 Zoque', u'\r\n'),
-	(u'zoh', u'', u'', u'', u'I', u'L', u'Chimalapa Zoque', u'\r\n'),
-	(u'zom', u'', u'', u'', u'I', u'L', u'Zou', u'\r\n'),
-	(u'zoo', u'', u'', u'', u'I', u'L', u'Asunci\xf3n Mixtepec Zapotec', u'\r\n'),
-	(u'zoq', u'', u'', u'', u'I', u'L', u'Tabasco Zoque', u'\r\n'),
-	(u'zor', u'', u'', u'', u'I', u'L', u'Ray\xf3n Zoque', u'\r\n'),
-	(u'zos', u'', u'', u'', u'I', u'L', u'Francisco Le\xf3n Zoque', u'\r\n'),
-	(u'zpa', u'', u'', u'', u'I', u'L', u'Lachiguiri Zapotec', u'\r\n'),
-	(u'zpb', u'', u'', u'', u'I', u'L', u'Yautepec Zapotec', u'\r\n'),
-	(u'zpc', u'', u'', u'', u'I', u'L', u'Choapan Zapotec', u'\r\n'),
-	(u'zpd', u'', u'', u'', u'I', u'L', u'Southeastern Ixtl\xe1n Zapotec', u'\r\n'),
-	(u'zpe', u'', u'', u'', u'I', u'L', u'Petapa Zapotec', u'\r\n'),
-	(u'zpf', u'', u'', u'', u'I', u'L', u'San Pedro Quiatoni Zapotec', u'\r\n'),
-	(u'zpg', u'', u'', u'', u'I', u'L', u'Guevea De Humboldt Zapotec', u'\r\n'),
-	(u'zph', u'', u'', u'', u'I', u'L', u'Totomachapan Zapotec', u'\r\n'),
-	(u'zpi', u'', u'', u'', u'I', u'L', u'Santa Mar\xeda Quiegolani Zapotec', u'\r\n'),
-	(u'zpj', u'', u'', u'', u'I', u'L', u'Quiavicuzas Zapotec', u'\r\n'),
-	(u'zpk', u'', u'', u'', u'I', u'L', u'Tlacolulita Zapotec', u'\r\n'),
-	(u'zpl', u'', u'', u'', u'I', u'L', u'Lachix\xedo Zapotec', u'\r\n'),
-	(u'zpm', u'', u'', u'', u'I', u'L', u'Mixtepec Zapotec', u'\r\n'),
-	(u'zpn', u'', u'', u'', u'I', u'L', u'Santa In\xe9s Yatzechi Zapotec', u'\r\n'),
-	(u'zpo', u'', u'', u'', u'I', u'L', u'Amatl\xe1n Zapotec', u'\r\n'),
-	(u'zpp', u'', u'', u'', u'I', u'L', u'El Alto Zapotec', u'\r\n'),
-	(u'zpq', u'', u'', u'', u'I', u'L', u'Zoogocho Zapotec', u'\r\n'),
-	(u'zpr', u'', u'', u'', u'I', u'L', u'Santiago Xanica Zapotec', u'\r\n'),
-	(u'zps', u'', u'', u'', u'I', u'L', u'Coatl\xe1n Zapotec', u'\r\n'),
-	(u'zpt', u'', u'', u'', u'I', u'L', u'San Vicente Coatl\xe1n Zapotec', u'\r\n'),
-	(u'zpu', u'', u'', u'', u'I', u'L', u'Yal\xe1lag Zapotec', u'\r\n'),
-	(u'zpv', u'', u'', u'', u'I', u'L', u'Chichicapan Zapotec', u'\r\n'),
-	(u'zpw', u'', u'', u'', u'I', u'L', u'Zaniza Zapotec', u'\r\n'),
-	(u'zpx', u'', u'', u'', u'I', u'L', u'San Baltazar Loxicha Zapotec', u'\r\n'),
-	(u'zpy', u'', u'', u'', u'I', u'L', u'Mazaltepec Zapotec', u'\r\n'),
-	(u'zpz', u'', u'', u'', u'I', u'L', u'Texmelucan Zapotec', u'\r\n'),
-	(u'zqe', u'', u'', u'', u'I', u'L', u'Qiubei Zhuang', u'\r\n'),
-	(u'zra', u'', u'', u'', u'I', u'E', u'Kara (Korea)', u'\r\n'),
-	(u'zrg', u'', u'', u'', u'I', u'L', u'Mirgan', u'\r\n'),
-	(u'zrn', u'', u'', u'', u'I', u'L', u'Zerenkel', u'\r\n'),
-	(u'zro', u'', u'', u'', u'I', u'L', u'Z\xe1paro', u'\r\n'),
-	(u'zrp', u'', u'', u'', u'I', u'E', u'Zarphatic', u'\r\n'),
-	(u'zrs', u'', u'', u'', u'I', u'L', u'Mairasi', u'\r\n'),
-	(u'zsa', u'', u'', u'', u'I', u'L', u'Sarasira', u'\r\n'),
-	(u'zsk', u'', u'', u'', u'I', u'A', u'Kaskean', u'\r\n'),
-	(u'zsl', u'', u'', u'', u'I', u'L', u'Zambian Sign Language', u'\r\n'),
-	(u'zsm', u'', u'', u'', u'I', u'L', u'Standard Malay', u'\r\n'),
-	(u'zsr', u'', u'', u'', u'I', u'L', u'Southern Rincon Zapotec', u'\r\n'),
-	(u'zsu', u'', u'', u'', u'I', u'L', u'Sukurum', u'\r\n'),
-	(u'zte', u'', u'', u'', u'I', u'L', u'Elotepec Zapotec', u'\r\n'),
-	(u'ztg', u'', u'', u'', u'I', u'L', u'Xanagu\xeda Zapotec', u'\r\n'),
-	(u'ztl', u'', u'', u'', u'I', u'L', u'Lapagu\xeda-Guivini Zapotec', u'\r\n'),
-	(u'ztm', u'', u'', u'', u'I', u'L', u'San Agust\xedn Mixtepec Zapotec', u'\r\n'),
-	(u'ztn', u'', u'', u'', u'I', u'L', u'Santa Catarina Albarradas Zapotec', u'\r\n'),
-	(u'ztp', u'', u'', u'', u'I', u'L', u'Loxicha Zapotec', u'\r\n'),
-	(u'ztq', u'', u'', u'', u'I', u'L', u'Quioquitani-Quier\xed Zapotec', u'\r\n'),
-	(u'zts', u'', u'', u'', u'I', u'L', u'Tilquiapan Zapotec', u'\r\n'),
-	(u'ztt', u'', u'', u'', u'I', u'L', u'Tejalapan Zapotec', u'\r\n'),
-	(u'ztu', u'', u'', u'', u'I', u'L', u'G\xfcil\xe1 Zapotec', u'\r\n'),
-	(u'ztx', u'', u'', u'', u'I', u'L', u'Zaachila Zapotec', u'\r\n'),
-	(u'zty', u'', u'', u'', u'I', u'L', u'Yatee Zapotec', u'\r\n'),
-	(u'zua', u'', u'', u'', u'I', u'L', u'Zeem', u'\r\n'),
-	(u'zuh', u'', u'', u'', u'I', u'L', u'Tokano', u'\r\n'),
-	(u'zul', u'zul', u'zul', u'zu', u'I', u'L', u'Zulu', u'\r\n'),
-	(u'zum', u'', u'', u'', u'I', u'L', u'Kumzari', u'\r\n'),
-	(u'zun', u'zun', u'zun', u'', u'I', u'L', u'Zuni', u'\r\n'),
-	(u'zuy', u'', u'', u'', u'I', u'L', u'Zumaya', u'\r\n'),
-	(u'zwa', u'', u'', u'', u'I', u'L', u'Zay', u'\r\n'),
-	(u'zxx', u'zxx', u'zxx', u'', u'S', u'S', u'No linguistic content', u'\r\n'),
-	(u'zyb', u'', u'', u'', u'I', u'L', u'Yongbei Zhuang', u'\r\n'),
-	(u'zyg', u'', u'', u'', u'I', u'L', u'Yang Zhuang', u'\r\n'),
-	(u'zyj', u'', u'', u'', u'I', u'L', u'Youjiang Zhuang', u'\r\n'),
-	(u'zyn', u'', u'', u'', u'I', u'L', u'Yongnan Zhuang', u'\r\n'),
-	(u'zyp', u'', u'', u'', u'I', u'L', u'Zyphe', u'\r\n'),
-	(u'zza', u'zza', u'zza', u'', u'M', u'L', u'Zaza', u'\r\n'),
-	(u'zzj', u'', u'', u'', u'I', u'L', u'Zuojiang Zhuang', u'')
-)
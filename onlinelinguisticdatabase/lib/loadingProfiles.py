@@ -0,0 +1,183 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Named eager loading profiles for Form queries.
+
+All of the relations of Form are lazy, so a page that displays n Forms makes
+one query for the Forms and then one query per Form for each relation that the
+view touches (the "N+1 queries" problem).  A loading profile lists the
+relations that a view touches; applying it to the query loads them along with
+the Forms themselves:
+
+    query = withLoadingProfile(meta.Session.query(model.Form), 'IGT')
+
+The many-to-one relations and the first collection (one-to-many or
+many-to-many relation) of a profile are loaded with LEFT OUTER JOINs.  Joining
+a second collection would return the cartesian product of the two collections'
+rows for each Form, so the other collections are loaded after the Forms are
+fetched, with one query per collection for IN_CLAUSE_MAX Forms at a time (see
+LoadingProfileQuery).
+
+"""
+
+from sqlalchemy import orm
+from sqlalchemy.orm import eagerload, Query
+from sqlalchemy.orm.attributes import set_committed_value
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+from morphemeIndex import chunk, IN_CLAUSE_MAX
+
+# The many-to-one relations displayed with a Form
+FORM_DETAILS = ['syntacticCategory', 'elicitationMethod', 'speaker', 'source',
+                'elicitor', 'enterer', 'verifier']
+
+# The collections of a Form
+FORM_COLLECTIONS = ['glosses', 'keywords', 'files', 'collections']
+
+LOADING_PROFILES = {
+    # Form.getHTMLRowRepresentation (the tabular form view)
+    'results-table': ['glosses', 'keywords', 'files', 'collections'] +
+        FORM_DETAILS,
+
+    # Form.getHTMLRepresentation and getIGTHTMLTable (the IGT form view)
+    'IGT': ['glosses', 'keywords', 'files'] + FORM_DETAILS,
+
+    # The form formatters of lib/exporter
+    'export': ['glosses', 'keywords'] + FORM_DETAILS,
+
+    # Word lists (e.g., the dictionary) that show transcriptions and glosses
+    'summary': ['glosses', 'keywords'],
+
+    # h.userIsAuthorizedToAccessForm
+    'access': ['keywords']
+}
+
+
+def splitProfile(profile):
+    """Return the relations of the named loading profile as a list of those
+    to be joined and a list of the collections to be loaded in batches.
+
+    """
+
+    joined = []
+    batched = []
+    for relation in LOADING_PROFILES[profile]:
+        if relation in FORM_COLLECTIONS and \
+                [r for r in joined if r in FORM_COLLECTIONS]:
+            batched.append(relation)
+        else:
+            joined.append(relation)
+    return joined, batched
+
+
+def getLoadingOptions(profile):
+    return [eagerload(relation) for relation in splitProfile(profile)[0]]
+
+
+def getFormIDColumn(table):
+    """Return the column of table that references form.id.
+
+    """
+
+    return [c for c in table.c if c.references(model.form_table.c.id)][0]
+
+
+def loadCollections(forms, relations):
+    """Load the named collections of the Forms that have not loaded them yet,
+    with one query per collection for IN_CLAUSE_MAX Forms at a time.
+
+    """
+
+    forms = dict([(form.id, form) for form in forms])
+    for relation in relations:
+        pending = [form for form in forms.values()
+                   if relation not in form.__dict__]
+        if not pending:
+            continue
+        prop = orm.class_mapper(model.Form).get_property(relation)
+        target = prop.mapper.class_
+        if prop.secondary is None:
+            column = getFormIDColumn(prop.mapper.mapped_table)
+        else:
+            column = getFormIDColumn(prop.secondary)
+        values = dict([(form.id, []) for form in pending])
+        for ids in chunk(values.keys(), IN_CLAUSE_MAX):
+            query = meta.Session.query(target, column).filter(
+                column.in_(ids))
+            if prop.secondary is not None:
+                query = query.filter(prop.secondaryjoin)
+            query = query.order_by(*prop.mapper.primary_key)
+            for instance, formID in query:
+                values[formID].append(instance)
+        for form in pending:
+            set_committed_value(form, relation, values[form.id])
+
+
+class LoadingProfileQuery(Query):
+    """A query whose results are fetched all at once so that the collections
+    in batchedRelations of the Forms among them can be loaded in batches.
+    Each row of the results may be a Form or a tuple containing Forms.
+
+    """
+
+    batchedRelations = ()
+
+    def __iter__(self):
+        results = list(Query.__iter__(self))
+        forms = []
+        for row in results:
+            if not isinstance(row, tuple):
+                row = (row,)
+            forms.extend([x for x in row if isinstance(x, model.Form)])
+        if forms:
+            loadCollections(forms, self.batchedRelations)
+        return iter(results)
+
+
+def withLoadingProfile(query, profile):
+    """Return query (a Form query) with the relations of the named loading
+    profile eagerly loaded.
+
+    """
+
+    joined, batched = splitProfile(profile)
+    query = query.options(*[eagerload(relation) for relation in joined])
+    if batched:
+        # Copy the query into a LoadingProfileQuery (as Query._clone does);
+        #  the queries generated from it are LoadingProfileQuerys too.
+        profiled = LoadingProfileQuery.__new__(LoadingProfileQuery)
+        profiled.__dict__ = query.__dict__.copy()
+        profiled.batchedRelations = tuple([r for r in
+            getattr(query, 'batchedRelations', ()) if r not in batched]) + \
+            tuple(batched)
+        query = profiled
+    return query
+
+
+def getFormViewProfile(formView):
+    """Return the name of the loading profile of the user's default form view
+    ('tabular' or 'IGT').
+
+    """
+
+    if formView == 'tabular':
+        return 'results-table'
+    return 'IGT'
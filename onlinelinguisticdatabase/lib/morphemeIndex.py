@@ -0,0 +1,143 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""This module defines MorphemeIndex, a lookup table from morpheme forms and
+glosses to the lexical entries (Forms) that match them.
+
+Form.getMorphemeIDLists used to issue up to three queries per morpheme (full
+Form objects plus a lazy-loaded syntactic category each).  A MorphemeIndex is
+built with one column-only query for all of the morphemes and glosses of one or
+more Forms (plus one query for the syntactic category names) and then answers
+every lookup from three dicts:
+
+    byBreakAndGloss: (morphemeBreak, morphemeGloss) -> matches
+    byBreak:         morphemeBreak -> matches
+    byGloss:         morphemeGloss -> matches
+
+where matches is a list of (id, morphemeBreak, morphemeGloss, syncatName)
+tuples ordered by id.
+
+The model and meta modules are passed in (as they are to getMorphemeIDLists)
+because the model imports this package.
+
+"""
+
+import re
+
+from sqlalchemy.sql import or_
+
+# Maximum number of values in a single SQL IN clause (SQLite's limit on host
+# parameters is 999).
+IN_CLAUSE_MAX = 400
+
+
+def chunk(list_, size):
+    return [list_[i:i + size] for i in range(0, len(list_), size)]
+
+
+def getMorphemesAndGlosses(forms, delimiters):
+    """Return a (morphemes, glosses) pair of sets containing every morpheme and
+    gloss in the morphemeBreak and morphemeGloss values of forms.
+
+    """
+
+    patt = re.compile(u'[%s\\s]' % u''.join([re.escape(d) for d in delimiters]))
+    morphemes = set()
+    glosses = set()
+    for form in forms:
+        if form.morphemeBreak:
+            morphemes.update(patt.split(form.morphemeBreak))
+        if form.morphemeGloss:
+            glosses.update(patt.split(form.morphemeGloss))
+    morphemes.discard(u'')
+    glosses.discard(u'')
+    return morphemes, glosses
+
+
+class MorphemeIndex(object):
+    """Index of the lexical entries matching a set of morphemes and glosses.
+
+    If morphemes and glosses are both None, every Form with a morphemeBreak or
+    morphemeGloss value is indexed; this is what bulk recomputations use.  In
+    that case, if the morpheme delimiters are supplied, values containing a
+    delimiter or a space are skipped since they can never equal a single
+    morpheme or gloss.
+
+    """
+
+    def __init__(self, meta, model, morphemes=None, glosses=None,
+                 delimiters=None):
+        self.byBreakAndGloss = {}
+        self.byBreak = {}
+        self.byGloss = {}
+        self.load(meta, model, morphemes, glosses, delimiters)
+
+    def load(self, meta, model, morphemes, glosses, delimiters=None):
+        syncats = dict(meta.Session.query(model.SyntacticCategory.id,
+                                          model.SyntacticCategory.name).all())
+        columns = (model.Form.id, model.Form.morphemeBreak,
+                   model.Form.morphemeGloss, model.Form.syntacticcategory_id)
+        patt = None
+        if morphemes is None and glosses is None:
+            rows = meta.Session.query(*columns).filter(or_(
+                model.Form.morphemeBreak != u'',
+                model.Form.morphemeGloss != u'')).order_by(
+                model.Form.id).yield_per(1000)
+            if delimiters:
+                patt = re.compile(u'[%s\\s]' % u''.join(
+                    [re.escape(d) for d in delimiters]))
+        else:
+            rows = {}
+            conditions = [model.Form.morphemeBreak.in_(c) for c in
+                          chunk(list(morphemes or []), IN_CLAUSE_MAX)] + \
+                         [model.Form.morphemeGloss.in_(c) for c in
+                          chunk(list(glosses or []), IN_CLAUSE_MAX)]
+            for condition in conditions:
+                for row in meta.Session.query(*columns).filter(condition):
+                    rows[row[0]] = row
+            rows = [rows[id] for id in sorted(rows)]
+        for id, mb, mg, syncatId in rows:
+            self.add(id, mb, mg, syncats.get(syncatId), patt)
+
+    def add(self, id, morphemeBreak, morphemeGloss, syncatName, patt=None):
+        """Index the Form.  If patt (a compiled delimiter regex) is given, a
+        value that it matches is not used as a key.
+
+        """
+
+        match = (id, morphemeBreak, morphemeGloss, syncatName)
+        indexBreak = morphemeBreak and not (patt and patt.search(morphemeBreak))
+        indexGloss = morphemeGloss and not (patt and patt.search(morphemeGloss))
+        if indexBreak:
+            self.byBreak.setdefault(morphemeBreak, []).append(match)
+        if indexGloss:
+            self.byGloss.setdefault(morphemeGloss, []).append(match)
+        if indexBreak and indexGloss:
+            self.byBreakAndGloss.setdefault(
+                (morphemeBreak, morphemeGloss), []).append(match)
+
+    def getPerfectMatches(self, morpheme, gloss):
+        return self.byBreakAndGloss.get((morpheme, gloss), [])
+
+    def getMorphemeMatches(self, morpheme):
+        return self.byBreak.get(morpheme, [])
+
+    def getGlossMatches(self, gloss):
+        return self.byGloss.get(gloss, [])
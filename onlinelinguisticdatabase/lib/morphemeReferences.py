@@ -0,0 +1,351 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""This module keeps the morphemeBreakIDs, morphemeGlossIDs and
+syntacticCategoryString values of Forms up to date.
+
+These values are computed by Form.getMorphemeIDLists when a Form is saved, but
+they also depend on the lexical entries that the Form's morphemes match.  So
+when a lexical entry is added, edited or deleted, the values of every Form that
+uses its morpheme or gloss go stale.
+
+There are two ways of fixing this:
+
+1. Incrementally.  scheduleMorphemeReferenceUpdate is called (after commit)
+   with the old and new (morphemeBreak, morphemeGloss, syntacticcategory_id)
+   values of a created, saved or deleted Form and queues them for a background
+   thread.  The thread looks up the Forms that contain the old or new morpheme
+   or gloss in a morpheme -> Form ids inverted index and recomputes the values
+   of those Forms only.  A Form saved while its values were being recomputed
+   is left as the save wrote it.
+
+2. From scratch.  recomputeAllMorphemeReferences walks all Forms in batches
+   of ids, using a MorphemeIndex of the whole database for the lookups and
+   expunging each batch from the session once it is committed, so memory use
+   does not grow with the size of the database.
+
+The inverted index is built by the background thread when it is first needed
+(so no request waits for it) and kept in memory; it only sees the changes made
+through this process, so the full rebuild should be run if several
+processes share one database.
+
+"""
+
+import re
+import time
+import logging
+import threading
+import Queue
+
+from pylons import app_globals
+
+from sqlalchemy.sql import and_
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+from morphemeIndex import MorphemeIndex, getMorphemesAndGlosses
+
+log = logging.getLogger(__name__)
+
+# Number of Forms loaded, recomputed and committed at a time
+BATCH_SIZE = 500
+
+
+def getMorphemeKey(form):
+    """Return the (morphemeBreak, morphemeGloss, syntacticcategory_id) values
+    that other Forms' morpheme references depend on.
+
+    """
+
+    return (form.morphemeBreak, form.morphemeGloss, form.syntacticcategory_id)
+
+
+def getDelimiterPattern(delimiters):
+    return re.compile(u'[%s\\s]' % u''.join([re.escape(d) for d in delimiters]))
+
+
+class InvertedMorphemeIndex(object):
+    """Maps each morpheme and each gloss to the set of ids of the Forms whose
+    morphemeBreak/morphemeGloss values contain it.
+
+    """
+
+    def __init__(self, delimiters):
+        self.patt = getDelimiterPattern(delimiters)
+        self.byMorpheme = {}
+        self.byGloss = {}
+        self.keys = {}      # form id -> (morphemes, glosses)
+        self.lock = threading.Lock()
+
+    def build(self):
+        query = meta.Session.query(model.Form.id, model.Form.morphemeBreak,
+                                   model.Form.morphemeGloss)
+        for id, morphemeBreak, morphemeGloss in query.yield_per(1000):
+            self.add(id, morphemeBreak, morphemeGloss)
+
+    def split(self, value):
+        if not value:
+            return frozenset()
+        return frozenset([x for x in self.patt.split(value) if x])
+
+    def add(self, id, morphemeBreak, morphemeGloss):
+        morphemes = self.split(morphemeBreak)
+        glosses = self.split(morphemeGloss)
+        self.keys[id] = (morphemes, glosses)
+        for morpheme in morphemes:
+            self.byMorpheme.setdefault(morpheme, set()).add(id)
+        for gloss in glosses:
+            self.byGloss.setdefault(gloss, set()).add(id)
+
+    def remove(self, id):
+        morphemes, glosses = self.keys.pop(id, (frozenset(), frozenset()))
+        for morpheme in morphemes:
+            self.byMorpheme.get(morpheme, set()).discard(id)
+        for gloss in glosses:
+            self.byGloss.get(gloss, set()).discard(id)
+
+    def update(self, id, morphemeBreak, morphemeGloss):
+        self.lock.acquire()
+        try:
+            self.remove(id)
+            if morphemeBreak is not None or morphemeGloss is not None:
+                self.add(id, morphemeBreak, morphemeGloss)
+        finally:
+            self.lock.release()
+
+    def getFormIDs(self, morphemes=(), glosses=()):
+        """Return the set of ids of Forms containing any of the morphemes or
+        glosses.
+
+        """
+
+        self.lock.acquire()
+        try:
+            result = set()
+            for morpheme in morphemes:
+                result.update(self.byMorpheme.get(morpheme, ()))
+            for gloss in glosses:
+                result.update(self.byGloss.get(gloss, ()))
+            return result
+        finally:
+            self.lock.release()
+
+
+_invertedIndex = None
+_invertedIndexLock = threading.Lock()
+
+
+def getInvertedMorphemeIndex():
+    global _invertedIndex
+    if _invertedIndex is None:
+        _invertedIndexLock.acquire()
+        try:
+            if _invertedIndex is None:
+                index = InvertedMorphemeIndex(app_globals.morphDelimiters)
+                index.build()
+                _invertedIndex = index
+        finally:
+            _invertedIndexLock.release()
+    return _invertedIndex
+
+
+def resetInvertedMorphemeIndex():
+    """Discard the inverted index; it will be rebuilt when next needed.
+
+    """
+
+    global _invertedIndex
+    _invertedIndex = None
+
+
+def getAffectedFormIDs(id, oldKey, newKey):
+    """Return the ids of the Forms (other than Form id) whose morpheme
+    references may change because Form id's key changed from oldKey to newKey.
+    A key is a (morphemeBreak, morphemeGloss, syntacticcategory_id) tuple or
+    None if the Form did not (or no longer does) exist.  This also updates the
+    inverted index.
+
+    """
+
+    index = getInvertedMorphemeIndex()
+    newMB, newMG = newKey and newKey[:2] or (None, None)
+    index.update(id, newMB, newMG)
+    if oldKey == newKey:
+        return set()
+    # Only values that are single morphemes/glosses can be matched
+    morphemes = [key[0] for key in (oldKey, newKey)
+                 if key and key[0] and not index.patt.search(key[0])]
+    glosses = [key[1] for key in (oldKey, newKey)
+               if key and key[1] and not index.patt.search(key[1])]
+    result = index.getFormIDs(morphemes, glosses)
+    result.discard(id)
+    return result
+
+
+def recomputeMorphemeReferencesFor(formIDs, batchSize=BATCH_SIZE):
+    """Recompute the morpheme references of the Forms with the given ids,
+    batchSize Forms at a time.  A Form whose datetimeModified has changed
+    since it was loaded (i.e., that a user has saved in the meantime) is not
+    written, since its references were computed from stale values.  Return
+    the number of Forms recomputed.
+
+    """
+
+    table = model.form_table
+    formIDs = sorted(formIDs)
+    count = 0
+    for i in range(0, len(formIDs), batchSize):
+        forms = meta.Session.query(model.Form).filter(
+            model.Form.id.in_(formIDs[i:i + batchSize])).all()
+        morphemes, glosses = getMorphemesAndGlosses(
+            forms, app_globals.morphDelimiters)
+        morphemeIndex = MorphemeIndex(meta, model, morphemes, glosses)
+        updates = []
+        for form in forms:
+            form.getMorphemeIDLists(meta, model, morphemeIndex)
+            updates.append((form.id, form.datetimeModified, {
+                'morphemeBreakIDs': form.morphemeBreakIDs,
+                'morphemeGlossIDs': form.morphemeGlossIDs,
+                'syntacticCategoryString': form.syntacticCategoryString}))
+        # Write the values only where the Form is unchanged, not through the
+        #  ORM (which would overwrite a concurrent save)
+        meta.Session.expunge_all()
+        for id, datetimeModified, values in updates:
+            count += meta.Session.execute(table.update(and_(
+                table.c.id == id,
+                table.c.datetimeModified == datetimeModified),
+                values=values)).rowcount
+        meta.Session.commit()
+    return count
+
+
+def recomputeAllMorphemeReferences(batchSize=BATCH_SIZE, callback=None):
+    """Recompute the morpheme references of every Form in the database.
+
+    Forms are processed in batches of batchSize ordered by id; after each batch
+    is committed it is expunged from the session and callback (if given) is
+    called with the number of Forms processed so far and the elapsed time in
+    seconds.  Return a (formCount, elapsedSeconds) tuple.
+
+    """
+
+    start = time.time()
+    morphemeIndex = MorphemeIndex(meta, model,
+                                  delimiters=app_globals.morphDelimiters)
+    count = 0
+    lastID = 0
+    while True:
+        forms = meta.Session.query(model.Form).filter(
+            model.Form.id > lastID).order_by(
+            model.Form.id).limit(batchSize).all()
+        if not forms:
+            break
+        for form in forms:
+            form.getMorphemeIDLists(meta, model, morphemeIndex)
+        lastID = forms[-1].id
+        count += len(forms)
+        meta.Session.commit()
+        meta.Session.expunge_all()
+        if callback:
+            callback(count, time.time() - start)
+    resetInvertedMorphemeIndex()
+    elapsed = time.time() - start
+    log.info('Recomputed morpheme references of %d forms in %.1f s '
+             '(%.1f forms/s).' % (count, elapsed, getThroughput(count, elapsed)))
+    return count, elapsed
+
+
+def getThroughput(count, elapsed):
+    if elapsed:
+        return count / elapsed
+    return 0.0
+
+
+class MorphemeReferenceUpdater(threading.Thread):
+    """Background thread that recomputes the morpheme references of the Forms
+    affected by changes to other Forms.  Its queue holds the (id, oldKey,
+    newKey) changes passed to scheduleMorphemeReferenceUpdate.
+
+    Pylons' app_globals is thread-local, so the globals object of the
+    application that started the thread is registered in the thread before
+    any work is done.
+
+    """
+
+    def __init__(self, globalsObject):
+        threading.Thread.__init__(self)
+        self.setDaemon(True)
+        self.globalsObject = globalsObject
+        self.queue = Queue.Queue()
+
+    def run(self):
+        app_globals._push_object(self.globalsObject)
+        while True:
+            changes = [self.queue.get()]
+            # Merge any other pending changes into this one
+            while True:
+                try:
+                    changes.append(self.queue.get_nowait())
+                except Queue.Empty:
+                    break
+            try:
+                try:
+                    start = time.time()
+                    formIDs = set()
+                    for id, oldKey, newKey in changes:
+                        formIDs.update(getAffectedFormIDs(id, oldKey, newKey))
+                    if not formIDs:
+                        continue
+                    count = recomputeMorphemeReferencesFor(formIDs)
+                    log.debug('Recomputed morpheme references of %d forms '
+                              'in %.2f s.' % (count, time.time() - start))
+                except Exception, e:
+                    log.error('Unable to recompute morpheme references: %s' % e)
+                    meta.Session.rollback()
+            finally:
+                meta.Session.remove()
+
+
+_updater = None
+_updaterLock = threading.Lock()
+
+
+def getMorphemeReferenceUpdater():
+    global _updater
+    if _updater is None or not _updater.isAlive():
+        _updaterLock.acquire()
+        try:
+            if _updater is None or not _updater.isAlive():
+                _updater = MorphemeReferenceUpdater(
+                    app_globals._current_obj())
+                _updater.start()
+        finally:
+            _updaterLock.release()
+    return _updater
+
+
+def scheduleMorphemeReferenceUpdate(id, oldKey, newKey):
+    """Queue the recomputation of the morpheme references of the Forms
+    affected by Form id's key changing from oldKey to newKey (see
+    getAffectedFormIDs).  Call this after the change has been committed.
+
+    """
+
+    getMorphemeReferenceUpdater().queue.put((id, oldKey, newKey))
@@ -397,15 +397,22 @@ grubbReplacements = {
 }
 
 
-orthographies = {}
+# The arguments of each Orthography.  The Orthography objects (and their regexes) are
+# only built when getInstance first asks for them, not when this module is imported.
+
+orthographyArguments = {
+	"napa": (napaReplacements, True, True),
+	"sd72": (sd72Replacements, True, True),
+	"umista": (umistaReplacements, False, False),
+	"grubb": (grubbReplacements, False, False),
+	"eng": ({}, True, True)
+}
 
-orthographies["napa"] = Orthography(napaReplacements, True, True)
-orthographies["sd72"] = Orthography(sd72Replacements, True, True)
-orthographies["umista"] = Orthography(umistaReplacements, False, False)
-orthographies["grubb"] = Orthography(grubbReplacements, False, False)
-orthographies["eng"] = Orthography({}, True, True)
+orthographies = {}
 
 def getInstance(lang):
+	if lang not in orthographies:
+		orthographies[lang] = Orthography(*orthographyArguments[lang])
 	return orthographies[lang]
 
 
@@ -27,6 +27,7 @@ except ImportError:
     import simplejson as json
 from pylons import app_globals, url, session
 import helpers as h
+from morphemeIndex import MorphemeIndex, getMorphemesAndGlosses
 
 log = logging.getLogger(__name__)
 
@@ -191,7 +192,7 @@ class Form(object):
             self.morphemeGlossTuples = []
 
 
-    def getMorphemeIDLists(self, meta, model):
+    def getMorphemeIDLists(self, meta, model, morphemeIndex=None):
         """This method takes the morpheme-gloss components of a Form and looks
         for matches in other Forms.
         
@@ -208,6 +209,11 @@ class Form(object):
         
         In short, this method generates values for the morphemeBreakIDs,
         morphemeGlossIDs and syntacticCategoryString attributes.
+
+        The matches are looked up in morphemeIndex (a MorphemeIndex instance).
+        If none is supplied, one is built for this Form's morphemes and glosses
+        with a single batch query.  Callers processing many Forms should build
+        one index for all of them and pass it in.
         
         """
         
@@ -223,6 +229,10 @@ class Form(object):
         len(self.morphemeBreak.split()) == len(self.morphemeGloss.split()) and \
         [len(re.split(patt, x)) for x in self.morphemeBreak.split()] == \
         [len(re.split(patt, x)) for x in self.morphemeGloss.split()]:
+            if morphemeIndex is None:
+                morphemes, glosses = getMorphemesAndGlosses([self],
+                                                            validDelimiters)
+                morphemeIndex = MorphemeIndex(meta, model, morphemes, glosses)
             morphemeBreak = self.morphemeBreak
             morphemeGloss = self.morphemeGloss
             mbWords = morphemeBreak.split()
@@ -243,48 +253,31 @@ class Form(object):
                     gloss = mgWordMorphemesList[ii]
                     matches = []
                     if morpheme and gloss:
-                        matches = meta.Session.query(model.Form).filter(
-                            model.Form.morphemeBreak==morpheme).filter(
-                            model.Form.morphemeGloss==gloss).all()
+                        matches = morphemeIndex.getPerfectMatches(
+                            morpheme, gloss)
                     # If one or more Forms match both gloss and morpheme, append a
                     #  list of the IDs of those Forms in morphemeBreakIDs and
                     #  morphemeGlossIDs
                     if matches:
-                        mbWordIDList.append([f.syntacticCategory and
-                            (f.id, f.morphemeGloss, f.syntacticCategory.name) 
-                            or (f.id, f.morphemeGloss, None) for f in matches])
-                        mgWordIDList.append([f.syntacticCategory and
-                            (f.id, f.morphemeBreak, f.syntacticCategory.name) 
-                            or (f.id, f.morphemeBreak, None) for f in matches])
-                        scWordMorphemesList[ii * 2] = matches[0].syntacticCategory and \
-                        matches[0].syntacticCategory.name or '?'
+                        mbWordIDList.append([(id, mg, sc)
+                                             for id, mb, mg, sc in matches])
+                        mgWordIDList.append([(id, mb, sc)
+                                             for id, mb, mg, sc in matches])
+                        scWordMorphemesList[ii * 2] = matches[0][3] or '?'
                     # Otherwise, look for Forms that match only gloss or only
                     #  morpheme and append respectively
                     else:
                         morphemeMatches = []
                         if morpheme:
-                            morphemeMatches = meta.Session.query(
-                                model.Form).filter(
-                                model.Form.morphemeBreak==morpheme).all()
-                        if morphemeMatches:
-                            mbWordIDList.append([f.syntacticCategory and
-                                (f.id, f.morphemeGloss, f.syntacticCategory.name) 
-                                or (f.id, f.morphemeGloss, None)
-                                for f in morphemeMatches])
-                        else:
-                            mbWordIDList.append([])
+                            morphemeMatches = morphemeIndex.getMorphemeMatches(
+                                morpheme)
+                        mbWordIDList.append([(id, mg, sc)
+                                             for id, mb, mg, sc in morphemeMatches])
                         glossMatches = []
                         if gloss:
-                            glossMatches = meta.Session.query(
-                                model.Form).filter(
-                                model.Form.morphemeGloss==gloss).all()
-                        if glossMatches:
-                            mgWordIDList.append([f.syntacticCategory and
-                                (f.id, f.morphemeBreak, f.syntacticCategory.name)
-                                or (f.id, f.morphemeBreak, None)
-                                for f in glossMatches])
-                        else:
-                            mgWordIDList.append([])
+                            glossMatches = morphemeIndex.getGlossMatches(gloss)
+                        mgWordIDList.append([(id, mb, sc)
+                                             for id, mb, mg, sc in glossMatches])
                         scWordMorphemesList[ii * 2] = '?'
                 morphemeBreakIDs.append(mbWordIDList)
                 morphemeGlossIDs.append(mgWordIDList)
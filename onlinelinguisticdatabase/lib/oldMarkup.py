@@ -61,6 +61,16 @@ Embedding Markup
 
   - see embedFiles below
 
+Embedding markup is expanded in two phases: first the ids of all of the
+entities referenced are collected (getEmbeddedIDs), then the entities are fetched
+with one query per type (getEntitiesByID, which splits very long id lists into
+IN_CLAUSE_MAX chunks) and the references are substituted.  embedForms and
+embedFiles do this for the references in their input.  Embedded Collections
+may embed Collections themselves, so getEmbeddedCollections makes one query per
+level of nesting, after which the contents of a Collection can be expanded
+completely (embedContentsOfCollections) and the Forms and Files referenced
+anywhere in it fetched at once (see collection.getCollectionContentsAsHTML).
+
 """
 
 import os
@@ -79,6 +89,68 @@ from sqlalchemy import desc
 
 import onlinelinguisticdatabase.model as model
 import onlinelinguisticdatabase.model.meta as meta
+from morphemeIndex import chunk, IN_CLAUSE_MAX
+from loadingProfiles import withLoadingProfile
+
+# Embedding markup: group 2 is the id of the entity referenced
+formEmbedPatt = re.compile('([Ff]orm\[([0-9]+)\])')
+fileEmbedPatt = re.compile(
+    '([Ff]ile\[([0-9]+)( *, *(embed|forCollection) *)?\])')
+collectionEmbedPatt = re.compile('([Cc]ollection\[([0-9]+)\])')
+
+
+def getEmbeddedIDs(input, patt):
+    """Return the sorted ids of the entities referenced in input by the
+    embedding markup patt (e.g., formEmbedPatt).
+
+    """
+
+    return sorted(set([int(match[1]) for match in patt.findall(input or u'')]))
+
+
+def getEntitiesByID(entity, ids, profile=None):
+    """Return a dict from the ids to the instances of entity (e.g., model.Form)
+    with those ids.  If profile is given, the relations of that loading profile
+    (see lib/loadingProfiles) are loaded as well.
+
+    """
+
+    result = {}
+    for ids_ in chunk(sorted(set(ids)), IN_CLAUSE_MAX):
+        query = meta.Session.query(entity).filter(entity.id.in_(ids_))
+        if profile:
+            query = withLoadingProfile(query, profile)
+        result.update([(instance.id, instance) for instance in query.all()])
+    return result
+
+
+def getEmbeddedCollections(input):
+    """Return a dict from ids to the Collections embedded in input, including
+    those embedded in embedded Collections.  One query is made per level of
+    nesting.
+
+    """
+
+    collectionsDict = {}
+    seen = set()
+    ids = getEmbeddedIDs(input, collectionEmbedPatt)
+    while ids:
+        seen.update(ids)
+        collections = getEntitiesByID(model.Collection, ids)
+        collectionsDict.update(collections)
+        ids = sorted(set([id for collection in collections.values()
+            for id in getEmbeddedIDs(collection.contents, collectionEmbedPatt)
+        ]) - seen)
+    return collectionsDict
+
+
+def getPageContentAsHTML(content):
+    """Return the content of a Page (reStructuredText with OLD linking and
+    Form and File embedding markup) as HTML.
+
+    """
+
+    return embedForms(embedFiles(linkToOLDEntitites(h.rst2html(content))))
 
 
 def linkToOLDEntitites(input):
@@ -118,45 +190,65 @@ def linkToOLDEntitites(input):
     return patt.sub(lambda x: ref2link(x), input)
 
 
-def embedContentsOfCollections(input):
+def embedContentsOfCollections(input, collectionsDict=None):
     """Take a reference to a Collection of the form 'collection[X]' and return
-    the contents (verbatim) of Collection with id=X.
+    the contents (verbatim) of Collection with id=X.  References in the
+    embedded contents are replaced in turn, except for references to a
+    Collection that contains them.
     
     This is useful for making Collections whose contents is composed of those
     of other Collections.  The possibility of such Collections means that the
     collection.py 'add' and 'update' actions will need to be changed so that
     such composite Collections have all the right Forms in collection.forms...
+
+    collectionsDict maps ids to Collections; by default, it is built by
+    getEmbeddedCollections(input).
     
     """
 
-    def ref2representation(match):
-        
-        # get collection contents
-        id = match.group(2)
-        try:
-            collection = meta.Session.query(model.Collection).filter_by(id=id).first()
-            contents = collection.contents
-        except AttributeError:
-            contents = u'Warning: There is no Collection with id=%s' % str(id)
-        
-        # Remove any reStructuredText TOC directives that shouldn't be in an
-        #  embedded contents
-        #  THIS NEEDS TO BE MORE COMPREHENSIVE.  I.e., remove options, etc...
-        contents = contents.replace('.. contents::', '').replace('.. sectnum::', '')
-        
-        return '\n%s\n' % contents
-    
-    patt = re.compile('([Cc]ollection\[([0-9]+)\])')
-    return patt.sub(lambda x: ref2representation(x), input)
+    if collectionsDict is None:
+        collectionsDict = getEmbeddedCollections(input)
+
+    def expand(input, ancestors):
 
+        def ref2representation(match):
 
-def embedFiles(input):
+            # get collection contents
+            id = int(match.group(2))
+            collection = collectionsDict.get(id)
+            if collection is None:
+                contents = u'Warning: There is no Collection with id=%s' % str(id)
+            elif id in ancestors:
+                contents = u'Warning: Collection %s embeds itself' % str(id)
+            else:
+                contents = expand(collection.contents or u'', ancestors + [id])
+
+            # Remove any reStructuredText TOC directives that shouldn't be in an
+            #  embedded contents
+            #  THIS NEEDS TO BE MORE COMPREHENSIVE.  I.e., remove options, etc...
+            contents = contents.replace('.. contents::', '').replace('.. sectnum::', '')
+
+            return '\n%s\n' % contents
+
+        return collectionEmbedPatt.sub(lambda x: ref2representation(x), input)
+
+    return expand(input, [])
+
+
+def embedFiles(input, filesDict=None):
     """Replace each embedding reference to a File in input with a
     representation of the File referenced.  Do this intelligently so that image
     Files are embedded as <img /> tags, audio files as <audio></audio>, etc.
+
+    filesDict maps ids to Files; by default, the Files referenced in input
+    are fetched with one query.
     
     """
 
+    if filesDict is None:
+        filesDict = getEntitiesByID(model.File,
+                                    getEmbeddedIDs(input, fileEmbedPatt))
+
     def ref2representation(match):
         
         # get File
@@ -166,7 +258,7 @@ def embedFiles(input):
             option = option.strip()
         print option
         try:
-            file = meta.Session.query(model.File).get(id)
+            file = filesDict.get(id)
             fileType = file.getFileType()
             #result = file.getFileMedia(False)
             result = file.getHTMLRepresentation(forCollection=True)
@@ -175,26 +267,32 @@ def embedFiles(input):
 
         return '\n%s\n' % result
     
-    patt = re.compile('([Ff]ile\[([0-9]+)( *, *(embed|forCollection) *)?\])')
-    return patt.sub(lambda x: ref2representation(x), input)
+    return fileEmbedPatt.sub(lambda x: ref2representation(x), input)
 
-def embedForms(input):
+def embedForms(input, formsDict=None):
     """Replace each embedding reference to a Form in input with a
     representation of the Form referenced.
+
+    formsDict maps ids to Forms; by default, the Forms referenced in input
+    (and their glosses) are fetched with one query.
     
     """
 
+    if formsDict is None:
+        formsDict = getEntitiesByID(model.Form,
+                                    getEmbeddedIDs(input, formEmbedPatt),
+                                    'summary')
+
     def ref2representation(match):
         
         # get Form
         id = int(match.group(2))
         try:
-            form = meta.Session.query(model.Form).filter_by(id=id).first()
+            form = formsDict.get(id)
             result = form.getIGTHTMLTable()
         except AttributeError:
             result = u'Warning: There is no Form with id=%s' % str(id)
 
         return '\n%s\n' % result
     
-    patt = re.compile('([Ff]orm\[([0-9]+)\])')
-    return patt.sub(lambda x: ref2representation(x), input)
\ No newline at end of file
+    return formEmbedPatt.sub(lambda x: ref2representation(x), input)
\ No newline at end of file
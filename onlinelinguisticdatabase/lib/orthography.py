@@ -29,9 +29,20 @@ orthography B; takes two Orthography objects at initialization.
 This module is adapted and generalized from one written by Patrick Littell
 for the conversion of Kwak'wala strings between its many orthographies.
 
+Run this module to benchmark OrthographyTranslator and CustomSorter on the
+Kwak'wala orthographies, e.g.,
+
+    $ python orthography.py 20000
+
 """
 
 import re
+import hashlib
+
+from translationCache import translationCache
+
+# The digits of the ranks in dictionary keys (see Orthography.getDictionaryKeys)
+DIGITS36 = u'0123456789abcdefghijklmnopqrstuvwxyz'
 
 def removeAllWhiteSpace(string):
     """Remove all spaces, newlines and tabs."""
@@ -162,11 +173,95 @@ class Orthography:
         else:
             return default
 
+    def getGraphRegex(self):
+        """Return a compiled regex whose first group matches the longest graph
+        at a position; where no graph matches, it matches one character (and
+        the group is empty).
+
+        """
+
+        # Built lazily: Orthography instances pickled before graphRegex
+        #  existed do not have it.
+        if getattr(self, 'graphRegex', None) is None:
+            self.graphRegex = re.compile(
+                u'(%s)|.' % getTrieRegex(self.orthographyAsDict), re.S)
+        return self.graphRegex
+
+    def getGraphRanks(self, word):
+        """Return the list of the ranks of the graphs in word, taking the
+        longest graph at each position and skipping characters that are not
+        part of a graph.
+
+        """
+
+        ranks = self.orthographyAsDict
+        return [ranks[graph] for graph in self.getGraphRegex().findall(word)
+                if graph]
+
+    def getDictionaryKeys(self, word, maxLength=255):
+        """Return the (head, key) pair by which word is browsed and sorted in
+        the dictionary (see lib/dictionaryIndex.py).  head is the rank of the
+        graph that word begins with (None if it does not begin with a graph).
+        key is a string of two base-36 digits per graph rank (at most
+        maxLength characters), so that sorting words by key sorts them in the
+        order of the orthography, as CustomSorter does.
+
+        """
+
+        word = word.replace(u' ', u'').lower()
+        match = self.getGraphRegex().match(word)
+        head = None
+        if match and match.group(1):
+            head = self.orthographyAsDict[match.group(1)]
+        key = u''.join([DIGITS36[min(rank, 1295) // 36] +
+                        DIGITS36[min(rank, 1295) % 36]
+                        for rank in self.getGraphRanks(word)])
+        return head, key[:maxLength - maxLength % 2]
+
+
+def getTrieRegex(keys):
+    """Return a regular expression (without capturing groups) that matches the
+    longest of the (non-empty) keys that occurs at a position.
+
+    The keys are arranged as a trie, e.g., [u't', u'tl', u"t'", u"t'l"] becomes
+    u"t(?:\\'(?:l)?|l)?", so the regex engine follows one branch per character
+    instead of trying every key in turn; greedy optional groups and
+    backtracking make it prefer the longest key.
+
+    """
+
+    trie = {}
+    for key in keys:
+        if key:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[None] = True   # a key ends here
+    return getTrieNodeRegex(trie)
+
+
+def getTrieNodeRegex(node, optional=False):
+    alternatives = [re.escape(char) + getTrieSuffixRegex(child)
+                    for char, child in sorted(node.items()) if char is not None]
+    if len(alternatives) == 1 and not optional:
+        return alternatives[0]
+    return u'(?:%s)%s' % (u'|'.join(alternatives), optional and u'?' or u'')
+
+
+def getTrieSuffixRegex(node):
+    if len([char for char in node if char is not None]) == 0:
+        return u''
+    return getTrieNodeRegex(node, None in node)
+
 
 class OrthographyTranslator:
     """Takes two Orthography instances and generates a translate method
     for converting strings form the first orthography to the second.
     """
+
+    # Matches a string in metalanguage tags
+    metalanguagePatt = re.compile(u'(<ml>.*?</ml>)')
+
     def __init__(self, inputOrthography, outputOrthography):
         self.inputOrthography = inputOrthography
         self.outputOrthography = outputOrthography
@@ -179,6 +274,29 @@ class OrthographyTranslator:
             raise OrthographyCompatibilityError()
 
         self.prepareRegexes()
+        self.signature = self.getSignature()
+
+    def __setstate__(self, state):
+        """Translators are pickled (e.g., in sessions); those pickled before
+        the trie regex was introduced need their regexes prepared again.
+        """
+        self.__dict__.update(state)
+        if 'lookup' not in state:
+            self.prepareRegexes()
+        if 'signature' not in state:
+            self.signature = self.getSignature()
+
+    def getSignature(self):
+        """Return a hash of everything that determines how this translator
+        translates, i.e., of both orthographies and their options.  Equivalent
+        translators (e.g., copies unpickled from different sessions) have the
+        same signature.
+
+        """
+
+        return hashlib.sha1(repr([(o.orthographyAsString, o.lowercase,
+            o.initialGlottalStops) for o in
+            (self.inputOrthography, self.outputOrthography)])).hexdigest()
 
     def print_(self):
         for key in self.replacements:
@@ -252,12 +370,20 @@ class OrthographyTranslator:
         self.replacementKeys.sort(lambda x,y:len(y)-len(x))
         
         # This is the pattern that does most of the work
-        #  It matches a string in metalanguage tags ("<ml>" and "</ml>") or
-        #  a key from self.replacements
+        #  It matches (and captures) a string in metalanguage tags ("<ml>" and
+        #  "</ml>") or the longest key from self.replacements (see
+        #  getTrieRegex).  Splitting a string with it gives the unmatched
+        #  substrings and the matches in alternation.
         
         self.regex = re.compile(
-            "<ml>.*?</ml>|(" + "|".join(self.replacementKeys) + ")"
+            u'(<ml>.*?</ml>|%s)' % getTrieRegex(self.replacementKeys)
         )
+
+        # Neither unmatched substrings nor metalanguage strings are keys (a
+        #  key would have matched), so every piece of the split string can
+        #  simply be looked up.
+
+        self.lookup = dict([(k, v) for k, v in self.replacements.items() if k])
         
         # If the output orthography doesn't represent initial glottal stops,
         #  but the input orthography does, compile a regex to remove them from
@@ -265,8 +391,10 @@ class OrthographyTranslator:
         #  create initial glottal stops in the output (Glottal stops are assumed
         #  to be represented by "7".)
         
-        if self.inputOrthography.initialGlottalStops and \
-            not self.outputOrthography.initialGlottalStops:
+        self.removeInitialGlottalStops = \
+            self.inputOrthography.initialGlottalStops and \
+            not self.outputOrthography.initialGlottalStops
+        if self.removeInitialGlottalStops:
             self.initialGlottalStopRemover = re.compile("""( |^|(^| )'|")7""")
     
     # This and the constructor will be the only functions other modules will
@@ -275,13 +403,27 @@ class OrthographyTranslator:
     #  returns the string in the output orthography.
     
     def translate(self, text):
-        """Takes text as input and returns it in the output orthography."""
+        """Takes text as input and returns it in the output orthography.
+
+        Translations are cached in translationCache (see
+        lib/translationCache.py).
+        """
+        return translationCache.translate(self.signature, text,
+                                          self.translateUncached)
+
+    def translateUncached(self, text):
+        """Translate text without consulting the cache.
+
+        The lowercasing, glottal stop removal and splitting are done by the
+        string and regex methods; the only per-graph work done in Python is a
+        dictionary lookup.
+        """
         if self.inputOrthography.lowercase:
             text = self.makeLowercase(text)
-        if self.inputOrthography.initialGlottalStops and \
-            not self.outputOrthography.initialGlottalStops:
+        if self.removeInitialGlottalStops:
             text = self.initialGlottalStopRemover.sub("\\1", text)
-        return self.regex.sub(lambda x:self.getReplacement(x.group()), text)
+        lookup = self.lookup
+        return u''.join([lookup.get(x, x) for x in self.regex.split(text)])
 
     # We can't just replace each match from self.regex with its value in
     #  self.replacements, because some matches are metalangauge strings that
@@ -307,13 +449,12 @@ class OrthographyTranslator:
     def makeLowercase(self, string):
         """Return the string in lowercase except for the substrings enclosed
         in metalanguage tags."""
-        patt = re.compile("<ml>.*?</ml>|.")
-        def getReplacement(string):
-            if string[:4] == '<ml>' and string[-5:] == '</ml>':
-                return string
-            else:
-                return string.lower()
-        return patt.sub(lambda x:getReplacement(x.group()), string)
+        if u'<ml>' not in string:
+            return string.lower()
+        # Metalanguage strings are at the odd indices of the split string
+        parts = self.metalanguagePatt.split(string)
+        parts[::2] = [x.lower() for x in parts[::2]]
+        return u''.join(parts)
 
     def capitalize(self, str):
         """If str contains an alpha character, return str with first alpha
@@ -339,6 +480,13 @@ class OrthographyCompatibilityError(Exception):
 class CustomSorter():
     """Takes an Orthography instance and generates a method for sorting a list
     of Forms according to the order of graphs in the orthography.
+
+    Each transcription is split into graphs once, by the orthography's
+    longest-match graph regex (see Orthography.getGraphRanks).  The application
+    itself no longer sorts with CustomSorter: the dictionary orders Forms by
+    the dictionaryKey column, computed with the same graph ranks (see
+    Orthography.getDictionaryKeys); CustomSorter is kept for scripts and for
+    the benchmark in benchmarks.py.
     
     """
 
@@ -353,31 +501,24 @@ class CustomSorter():
         each graph in the word.  A list of such tuples can then be quickly
         sorted by a Pythonic list's sort() method.
         
-        Since graphs are not necessarily Python characters, we have to replace
-        each graph with its rank, starting with the longest graphs first.
+        Since graphs are not necessarily Python characters, the word is split
+        into the longest graphs that match at each position; characters that
+        are not part of any graph are skipped.
         """
-        
-        graphs = self.orthography.orthographyAsDict.keys()
-        graphs.sort(key=len)
-        graphs.reverse()
-         
-        for graph in graphs: 
-            word = unicode(word.replace(graph,
-                            '%s,' % self.orthography.orthographyAsDict[graph]))
-
-        # Filter out anything that is not a digit or a comma
-        word = filter(lambda x: x in '01234546789,', word)
-        
-        return tuple([int(x) for x in word[:-1].split(',') if x])
+
+        return tuple(self.orthography.getGraphRanks(word))
+
+    def getSortKey(self, transcription):
+        """Return the integer tuple of transcription."""
+        return self.getIntegerTuple(self.removeWhiteSpace(transcription))
 
     def sort(self, forms):
         """Take a list of OLD Forms and return it sorted according to the order
-        of graphs in CustomSorter().orthography.
+        of graphs in CustomSorter().orthography.  Forms with the same key keep
+        their relative order.
         """
-        temp = [(self.getIntegerTuple(self.removeWhiteSpace(form.transcription)),
-                 form) for form in forms]
-        temp.sort()
-        return [x[1] for x in temp]
+        getSortKey = self.getSortKey
+        return sorted(forms, key=lambda form: getSortKey(form.transcription))
         
         
 if __name__ == '__main__':
@@ -489,3 +630,23 @@ if __name__ == '__main__':
     napa = Orthography(napaOrthographyString)
     tr = OrthographyTranslator(kwold, napa)
     print tr.translate('tl')
+
+    # Benchmark translation from and to the Kwak'wala orthographies (see
+    #  benchmarks.py)
+    import sys
+    from benchmarks import benchmarkOrthographyTranslator, \
+        benchmarkCustomSorter
+    sd72 = Orthography(sd72OrthographyString)
+    umista = Orthography(umistaOrthographyString, lowercase='0',
+                         initialGlottalStops='0')
+    grubb = Orthography(grubbOrthographyString, lowercase='0')
+    benchmarkOrthographyTranslator([
+        ('kwold -> napa', kwold, napa),
+        ('kwold -> umista', kwold, umista),
+        ('grubb -> sd72', grubb, sd72),
+        ('umista -> napa', umista, napa)
+    ], *[int(a) for a in sys.argv[1:]])
+    benchmarkCustomSorter([
+        ('napa', napa),
+        ('grubb', grubb)
+    ])
@@ -0,0 +1,261 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Keyset (a.k.a. cursor) pagination.
+
+webhelpers.paginate.Page fetches page N of an SQLAlchemy query with LIMIT and
+OFFSET (so the database reads and discards all of the rows of the preceding
+pages) and counts the rows with COUNT(*) on every request.
+
+getKeysetPage returns an ordinary Page (so templates and pager() work as
+before) whose items are fetched using the (sort column value, id) keys of the
+first and last items of the pages already viewed: page N+1 is the rows after
+the last key of page N, page N-1 is the rows before the first key of page N, the
+last page is the first rows in reverse order, etc.  (Page 1 is always fetched
+from the start, so that it shows new rows.)  These keys and the row
+count are stored in the user's session under a name (e.g., 'formResults');
+the count is cached for COUNT_TTL seconds.  When the query or sort order
+changes, the cached state is discarded.
+
+iterByKey walks a whole query in the same way, a batch of rows at a time, for
+code (e.g., the exporters) that needs every row but not all of them in memory.
+
+NULL sort values are treated as smaller than any other value, as they are by
+MySQL and SQLite.
+
+"""
+
+import time
+
+import webhelpers.paginate as paginate
+from sqlalchemy.sql import and_, or_, asc, desc
+
+from pylons import session
+
+# Number of seconds a cached row count is used for
+COUNT_TTL = 60
+
+
+def getKeysetCondition(col, idCol, key, direction, inclusive=False):
+    """Return a condition matching the rows that come after key (a (sort
+    value, id) tuple) when ordered by col and idCol in direction ('asc' or
+    'desc').  If inclusive is True, the row with key is matched as well.
+
+    """
+
+    value, id = key
+    if direction == 'asc':
+        if inclusive:
+            idCondition = idCol >= id
+        else:
+            idCondition = idCol > id
+        if col is idCol:
+            return idCondition
+        if value is None:
+            return or_(and_(col == None, idCondition), col != None)
+        return or_(col > value, and_(col == value, idCondition))
+    else:
+        if inclusive:
+            idCondition = idCol <= id
+        else:
+            idCondition = idCol < id
+        if col is idCol:
+            return idCondition
+        if value is None:
+            return and_(col == None, idCondition)
+        return or_(col < value, and_(col == value, idCondition), col == None)
+
+
+def reverse(direction):
+    return direction == 'asc' and 'desc' or 'asc'
+
+
+def getOrderedQuery(query, sortColumn, direction, idColumn):
+    order = direction == 'asc' and asc or desc
+    query = query.order_by(order(sortColumn))
+    if sortColumn is not idColumn:
+        query = query.order_by(order(idColumn))
+    return query
+
+
+def iterByKey(query, sortColumn, direction, idColumn, batchSize):
+    """Yield the items of the (unordered) query ordered by sortColumn in
+    direction and then by idColumn, fetching batchSize items at a time: each
+    batch is the rows after the key of the last item of the previous batch.
+
+    """
+
+    query = getOrderedQuery(query.order_by(None), sortColumn, direction,
+                            idColumn)
+    key = None
+    while True:
+        batch = query
+        if key is not None:
+            batch = batch.filter(getKeysetCondition(
+                sortColumn, idColumn, key, direction))
+        items = batch.limit(batchSize).all()
+        if not items:
+            break
+        for item in items:
+            yield item
+        key = (getattr(items[-1], sortColumn.key),
+               getattr(items[-1], idColumn.key))
+
+
+def iterBySlice(query, batchSize):
+    """Yield the items of the (ordered) query, fetching batchSize items at a
+    time using LIMIT and OFFSET.  Use this when the items have no unique key.
+
+    """
+
+    start = 0
+    while True:
+        items = query[start:start + batchSize]
+        if not items:
+            break
+        for item in items:
+            yield item
+        start += batchSize
+
+
+class KeysetQuery(object):
+    """A webhelpers.paginate collection that fetches slices of query by key.
+
+    query must not be limited; any ordering it has is replaced by sortColumn
+    (in direction) and then idColumn.  maxItems (optional) limits the number of
+    items paginated through; itemCount (optional) is used instead of counting.
+
+    """
+
+    def __init__(self, query, name, signature, sortColumn, direction,
+                 idColumn, itemsPerPage, maxItems=None, itemCount=None):
+        self.query = query.order_by(None)
+        self.itemsPerPage = itemsPerPage
+        self.name = name
+        self.sortColumn = sortColumn
+        self.direction = direction
+        self.idColumn = idColumn
+        self.maxItems = maxItems
+        self.itemCount = itemCount
+        self.state = self.getState(signature)
+
+    def getState(self, signature):
+        state = session.get(self.name)
+        if not state or state['signature'] != signature:
+            state = {'signature': signature, 'count': None, 'countTime': 0,
+                     'firstKeys': {}, 'lastKeys': {}}
+        return state
+
+    def saveState(self):
+        session[self.name] = self.state
+        session.save()
+
+    def getKey(self, item):
+        return (getattr(item, self.sortColumn.key),
+                getattr(item, self.idColumn.key))
+
+    def getOrderedQuery(self, direction):
+        return getOrderedQuery(self.query, self.sortColumn, direction,
+                               self.idColumn)
+
+    def getAfter(self, key, direction, count, inclusive=False, offset=0):
+        query = self.getOrderedQuery(direction)
+        if key is not None:
+            query = query.filter(getKeysetCondition(
+                self.sortColumn, self.idColumn, key, direction, inclusive))
+        if offset:
+            query = query.offset(offset)
+        return query.limit(count).all()
+
+    def __len__(self):
+        if self.itemCount is None:
+            now = time.time()
+            if self.state['count'] is None or \
+                    now - self.state['countTime'] > COUNT_TTL:
+                self.state['count'] = self.query.count()
+                self.state['countTime'] = now
+            self.itemCount = self.state['count']
+        if self.maxItems is not None:
+            return min(self.itemCount, self.maxItems)
+        return self.itemCount
+
+    def __iter__(self):
+        return iter(self.getOrderedQuery(self.direction))
+
+    def __getitem__(self, slice_):
+        """Return the items in slice_.  webhelpers.paginate only
+        requests whole pages, so slice_.start is a multiple of the page size
+        and the slice is a page long (or less for the last page).
+
+        """
+
+        start = slice_.start or 0
+        count = slice_.stop - start
+        if count <= 0:
+            return []
+        page = start // self.itemsPerPage + 1
+        firstKeys = self.state['firstKeys']
+        lastKeys = self.state['lastKeys']
+        direction = self.direction
+        if page == 1:
+            items = self.getAfter(None, direction, count)
+        elif page in firstKeys:
+            items = self.getAfter(firstKeys[page], direction, count, True)
+        elif page - 1 in lastKeys:
+            items = self.getAfter(lastKeys[page - 1], direction, count)
+        elif page + 1 in firstKeys:
+            items = self.getAfter(firstKeys[page + 1], reverse(direction),
+                                  count)
+            items.reverse()
+        elif slice_.stop >= len(self) and self.maxItems is None:
+            # The last page: the first rows in reverse order
+            items = self.getAfter(None, reverse(direction),
+                                  len(self) - start)
+            items.reverse()
+        else:
+            # Skip forward from the nearest page before this one whose first
+            #  key we know or, failing that, from the beginning.
+            known = [p for p in firstKeys if p < page]
+            if known:
+                nearest = max(known)
+                offset = (page - nearest) * self.itemsPerPage
+                items = self.getAfter(firstKeys[nearest], direction, count,
+                                      True, offset)
+            else:
+                items = self.getAfter(None, direction, count, offset=start)
+        if items:
+            firstKeys[page] = self.getKey(items[0])
+            lastKeys[page] = self.getKey(items[-1])
+        self.saveState()
+        return items
+
+
+def getKeysetPage(query, name, signature, sortColumn, direction, idColumn,
+                  page, itemsPerPage, maxItems=None, itemCount=None):
+    """Return a webhelpers.paginate.Page of the (unordered) query ordered by
+    sortColumn in direction and then by idColumn.  name is the session key
+    under which the pagination state is stored and signature is any value
+    that changes when the query does (e.g., the search values).
+
+    """
+
+    collection = KeysetQuery(query, name, signature, sortColumn, direction,
+                             idColumn, itemsPerPage, maxItems, itemCount)
+    return paginate.Page(collection, page=page, items_per_page=itemsPerPage)
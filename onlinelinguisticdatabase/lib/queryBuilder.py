@@ -33,6 +33,7 @@ from sqlalchemy.sql import and_, or_, not_, asc, desc
 
 import onlinelinguisticdatabase.model as model
 from functions import removeWhiteSpace, filesize_to_bytes, escapeUnderscores
+from searchIndex import getSearchIndexCondition
 import helpers as h
 
 import datetime
@@ -54,10 +55,13 @@ def getFilterCondition(term, searchType, location, tableName):
     # Get the SQLA column object relevant to the filter condition
     tbl = getattr(model, tableName)
     col = getattr(tbl, location)
+    indexCondition = None
 
     # Define the filter condition on the col according to the searchType
 
     if searchType == 'as a phrase':
+        indexCondition = getSearchIndexCondition(
+            [term], searchType, location, tableName)
         term = u'%' + term + u'%'
         filterCondition = col.like(u'%s' % term)
 
@@ -70,6 +74,8 @@ def getFilterCondition(term, searchType, location, tableName):
 
     else:
         terms = term.split()
+        indexCondition = getSearchIndexCondition(
+            terms, searchType, location, tableName)
         terms = [u'%' + term + u'%' for term in terms]
 
         if searchType == 'all of these':
@@ -78,6 +84,11 @@ def getFilterCondition(term, searchType, location, tableName):
         else:
             filterCondition = or_([col.like(u'%s' % t) for t in terms])
 
+    # Restrict substring searches to the candidates found in the full-text
+    #  search index (see lib/searchIndex), if possible
+    if indexCondition is not None:
+        filterCondition = and_(indexCondition, filterCondition)
+
     return filterCondition
 
 
@@ -260,10 +271,28 @@ def orthoTranslateSearchTerm(term, location):
         return h.inputToStorageTranslateOLOnly(term)
 
 
-def filterSearchQuery(searchValuesDict, query, table):
+def translateSearchTerms(searchValuesDict):
+    """Return a copy of searchValuesDict whose search terms are translated into
+    the storage orthography (see orthoTranslateSearchTerm).  Code that runs
+    outside of a request (e.g., a background job) cannot get at the user's
+    translators, so the request translates the search terms with this function
+    and the job calls filterSearchQuery with translate=False.
+
+    """
+
+    searchValuesDict = dict(searchValuesDict)
+    for i in ('1', '2'):
+        searchValuesDict['searchTerm' + i] = orthoTranslateSearchTerm(
+            searchValuesDict['searchTerm' + i],
+            searchValuesDict['searchLocation' + i])
+    return searchValuesDict
+
+
+def filterSearchQuery(searchValuesDict, query, table, translate=True):
     """This function takes an SQLAlchemy ORM query object and applies filters to
     it using the keys and values from the searchValuesDict.  The newly filtered
-    query is returned.
+    query is returned.  If translate is False, the search terms are taken to be
+    in the storage orthography already (see translateSearchTerms).
 
     """
 
@@ -277,8 +306,9 @@ def filterSearchQuery(searchValuesDict, query, table):
     searchLocation2 = searchValuesDict['searchLocation2']
 
     # Translate the search terms into the storage orthography, if necessary
-    searchTerm1 = orthoTranslateSearchTerm(searchTerm1, searchLocation1)
-    searchTerm2 = orthoTranslateSearchTerm(searchTerm2, searchLocation2)
+    if translate:
+        searchTerm1 = orthoTranslateSearchTerm(searchTerm1, searchLocation1)
+        searchTerm2 = orthoTranslateSearchTerm(searchTerm2, searchLocation2)
 
     andOrNot = searchValuesDict['andOrNot']
 
@@ -0,0 +1,53 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Per-request SQL query counts.
+
+QueryCounter is given to the database engine (see config/environment.py) and
+counts the statements executed by each thread.  BaseController resets the count
+when a request starts and logs it, with a warning if it exceeds the
+query_count_warning config option; in debug mode, it also reports it in the
+X-Query-Count response header.  A view whose count grows with the number of
+items displayed is lazily loading a relation that its loading profile (see
+lib/loadingProfiles) should include.
+
+"""
+
+import threading
+
+from sqlalchemy.interfaces import ConnectionProxy
+
+_local = threading.local()
+
+
+class QueryCounter(ConnectionProxy):
+
+    def cursor_execute(self, execute, cursor, statement, parameters, context,
+                       executemany):
+        _local.count = getattr(_local, 'count', 0) + 1
+        return execute(cursor, statement, parameters, context)
+
+
+def resetQueryCount():
+    _local.count = 0
+
+
+def getQueryCount():
+    return getattr(_local, 'count', 0)
@@ -0,0 +1,98 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A bounded least-recently-used cache of compiled regular expressions.
+
+SQLite has no REGEXP implementation of its own, so the SQLiteSetup listener in
+config/environment.py registers a Python function that SQLite calls once per
+row.  regexCache (shared by all connections) means that each pattern is
+compiled once per query rather than once per row.
+
+"""
+
+import re
+import threading
+
+# Default maximum number of compiled patterns kept (see the regexp_cache_size
+#  config option)
+DEFAULT_SIZE = 256
+
+
+class RegexCache(object):
+    """Maps pattern strings to compiled patterns, discarding the least recently
+    used pattern when more than size patterns are cached.  hits and misses
+    count the lookups that were and were not answered from the cache.
+
+    Lookups are made once per row, so hits do not take the lock: a dict lookup
+    is atomic and a concurrent hit may at worst go uncounted.  Recency is
+    measured in misses (the clock only advances when a pattern is compiled),
+    which is all that eviction needs.
+
+    """
+
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.patterns = {}      # expr -> [compiled pattern, last use]
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, expr):
+        entry = self.patterns.get(expr)
+        if entry is not None:
+            entry[1] = self.misses
+            self.hits += 1
+            return entry[0]
+
+        # Compile outside of the lock; an invalid pattern raises re.error
+        patt = re.compile(expr)
+
+        self.lock.acquire()
+        try:
+            self.misses += 1
+            if expr not in self.patterns and len(self.patterns) >= self.size:
+                oldest = min(self.patterns.items(), key=lambda x: x[1][1])[0]
+                del self.patterns[oldest]
+            self.patterns[expr] = [patt, self.misses]
+        finally:
+            self.lock.release()
+        return patt
+
+    def getStats(self):
+        return {
+            'size': self.size,
+            'cached': len(self.patterns),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+regexCache = RegexCache()
+
+
+def regexp(expr, item):
+    """The REGEXP function: True if item matches expr (from its beginning).
+
+    """
+
+    return item and regexCache.compile(expr).match(item) is not None
@@ -0,0 +1,194 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Cache of HTML rendered from OLD markup.
+
+Rendering OLD markup (e.g., the contents of a Collection) runs docutils over
+the whole text and renders every embedded Form and File, which takes seconds
+for long Collections.  getCachedHTML keeps the rendered HTML in a Beaker file
+cache (under cache_dir, so it survives restarts and is shared by processes).
+
+An entry is stored under the name of the rendered object (e.g., 'page1')
+plus the viewer's output orthography and access to restricted Forms, since the
+rendered Forms depend on both.  With the HTML, the entry stores a fingerprint
+of everything it was rendered from: the source text and the columns of the
+Forms, Files and Collections it embeds that affect their rendering (including
+the Files associated to the embedded Forms) and the versions of the secondary
+objects that are displayed with them (speakers, users, sources, syntactic
+categories, elicitation methods and keywords; see lib/secondaryObjects), which
+are incremented whenever one of them is added, changed or deleted.  The
+fingerprint is recomputed on each request with a few column-only queries and a
+stale entry is rendered again.  So an entry is invalidated whenever one of the
+objects it depends on changes, without the code that changes them having to
+know about the cache.
+
+"""
+
+import hashlib
+import logging
+
+from pylons import cache, session, app_globals
+from sqlalchemy.sql import select, and_
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+from morphemeIndex import chunk, IN_CLAUSE_MAX
+from translatorRegistry import getUserTranslator
+from secondaryObjects import LISTS, getVersions
+from oldMarkup import getEmbeddedIDs, getPageContentAsHTML, formEmbedPatt, \
+    fileEmbedPatt
+
+log = logging.getLogger(__name__)
+
+
+def getRenderCache(key):
+    # Beaker's file cache stores a namespace in one file, so each entry has
+    #  its own namespace rather than loading every entry on each lookup.
+    return cache.get_cache('renderedHTML.%s' % key, type='file')
+
+
+def getFingerprint(*values):
+    """Return a hash of the repr of values.
+
+    """
+
+    return hashlib.sha1(repr(values)).hexdigest()
+
+
+def selectInChunks(columns, idColumn, ids):
+    """Return the rows of the columns whose idColumn value is in ids, ordered
+    by the columns.
+
+    """
+
+    rows = []
+    for ids_ in chunk(sorted(set(ids)), IN_CLAUSE_MAX):
+        rows.extend([tuple(row) for row in meta.Session.execute(
+            select(columns, idColumn.in_(ids_)))])
+    return sorted(rows)
+
+
+def getDependencyFingerprint(formIDs=(), fileIDs=(), collectionIDs=()):
+    """Return a fingerprint of the Forms, Files and Collections with the
+    given ids (and the Files associated to the Forms) that changes whenever
+    any of them is changed, deleted or (re)associated, or a secondary object
+    (e.g., a speaker) is changed.
+
+    """
+
+    formfile = model.formfile_table
+    formFiles = selectInChunks([formfile.c.form_id, formfile.c.file_id],
+                               formfile.c.form_id, formIDs)
+    form = model.form_table
+    forms = selectInChunks([form.c.id, form.c.datetimeModified,
+                            form.c.morphemeBreakIDs, form.c.morphemeGlossIDs,
+                            form.c.syntacticCategoryString],
+                           form.c.id, formIDs)
+    file = model.file_table
+    files = selectInChunks([file.c.id, file.c.datetimeModified], file.c.id,
+                           list(fileIDs) + [row[1] for row in formFiles])
+    collection = model.collection_table
+    collections = selectInChunks(
+        [collection.c.id, collection.c.datetimeModified], collection.c.id,
+        collectionIDs)
+    versions = getVersions() or {}
+    secondaryObjects = [versions.get(name, 0) for name in LISTS]
+    return getFingerprint(forms, formFiles, files, collections,
+                          secondaryObjects)
+
+
+def getRestrictedFormIDs(formIDs):
+    """Return the set of the ids in formIDs of Forms tagged 'restricted'.
+
+    """
+
+    formkeyword = model.formkeyword_table
+    keyword = model.keyword_table
+    result = set()
+    for ids in chunk(sorted(set(formIDs)), IN_CLAUSE_MAX):
+        result.update([row[0] for row in meta.Session.execute(
+            select([formkeyword.c.form_id], and_(
+                formkeyword.c.keyword_id == keyword.c.id,
+                keyword.c.name == u'restricted',
+                formkeyword.c.form_id.in_(ids))))])
+    return result
+
+
+def getViewerKey(formIDs=()):
+    """Return a string identifying how the current user sees the Forms with
+    the given ids: the output orthography and, if some of the Forms are
+    restricted and the user is not unrestricted, the user.
+
+    """
+
+    # The translator used by h.storageToOutputTranslate
+    translator = getUserTranslator('storageToOutput') or \
+        app_globals.storageToOutputTranslator
+    if translator:
+        orthographyKey = getFingerprint(translator.signature,
+            app_globals.morphemeBreakIsObjectLanguageString)
+    else:
+        orthographyKey = 'storage'
+    user = session.get('user')
+    if user is None:
+        accessKey = 'anonymous'
+    elif getRestrictedFormIDs(formIDs) and \
+            user.role != u'administrator' and \
+            user.id not in [u.id for u in app_globals.unrestrictedUsers]:
+        accessKey = 'user%d' % user.id
+    else:
+        accessKey = 'all'
+    return '%s_%s' % (orthographyKey, accessKey)
+
+
+def getCachedHTML(key, fingerprint, render):
+    """Return the HTML cached under key if it was rendered from the objects
+    with the given fingerprint; otherwise, call render() and cache and return
+    its result.
+
+    """
+
+    renderCache = getRenderCache(key)
+    try:
+        cachedFingerprint, html = renderCache.get_value('html')
+        if cachedFingerprint == fingerprint:
+            return html
+    except KeyError:
+        pass
+    log.debug('Rendering %s (not cached or stale).' % key)
+    html = render()
+    renderCache.put('html', (fingerprint, html))
+    return html
+
+
+def getCachedPageHTML(page, render=getPageContentAsHTML):
+    """Return render(page.content), where page is a Page (e.g., the home page)
+    and render returns HTML (by default, getPageContentAsHTML: the content with
+    its OLD markup linked and embedded).
+
+    """
+
+    content = page.content or u''
+    fingerprint = getFingerprint(content, getDependencyFingerprint(
+        getEmbeddedIDs(content, formEmbedPatt),
+        getEmbeddedIDs(content, fileEmbedPatt)))
+    # embedForms does not restrict access to the Forms it embeds
+    key = 'page%d_%s_%s' % (page.id, render.__name__, getViewerKey())
+    return getCachedHTML(key, fingerprint, lambda: render(content))
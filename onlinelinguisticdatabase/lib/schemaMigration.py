@@ -0,0 +1,271 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Schema migration for existing databases.
+
+metadata.create_all (see websetup.py) creates the tables that do not exist,
+with their indexes, but leaves existing tables alone.  So a column or an index
+declared in the model (see the INDEXES section of model/__init__.py) after a
+database was set up has to be created separately: addMissingColumns adds every
+declared column that the database lacks (as a nullable column) and
+createMissingIndexes creates every declared index that the database lacks.
+Both are idempotent and setup-app runs them each time.
+
+migrate does both (after creating any declared table that the database lacks,
+e.g., tableversion) for an administrator (see the migrateIndexes action of the
+administer controller) and reports which of the slow queries listed in
+SLOW_QUERIES the new indexes speed up, i.e., whose query plan (EXPLAIN QUERY
+PLAN in SQLite, EXPLAIN in MySQL) changes.
+
+"""
+
+import logging
+
+import sqlalchemy as sa
+
+import onlinelinguisticdatabase.model.meta as meta
+
+log = logging.getLogger(__name__)
+
+# Indexes on TEXT columns, which cannot be declared in the model: MySQL only
+#  indexes a prefix of such a column and SQLAlchemy's Index cannot say how
+#  long.  (index name, table name, column name, MySQL prefix length)
+PREFIX_INDEXES = [
+    ('ix_gloss_gloss', 'gloss', 'gloss', 255)
+]
+
+# Representative queries of the lookups that the indexes are for:
+#  (description, SQL)
+SLOW_QUERIES = [
+    ('Duplicate transcriptions (form/findduplicate)',
+     "SELECT id FROM form WHERE transcription = 'x'"),
+    ('Lexical items by morpheme (morpheme references)',
+     "SELECT id FROM form WHERE morphemeBreak IN ('x', 'y')"),
+    ('Lexical items by gloss (morpheme references)',
+     "SELECT id FROM form WHERE morphemeGloss IN ('x', 'y')"),
+    ('Exact gloss matches (dictionary/results, quick search)',
+     "SELECT form.id FROM form LEFT OUTER JOIN gloss ON "
+     "form.id = gloss.form_id WHERE gloss.gloss = 'x'"),
+    ('Words beginning with a letter (dictionary/browse)',
+     "SELECT id FROM form WHERE dictionaryHead = 1 ORDER BY dictionaryKey"),
+    ('Glosses beginning with a letter (dictionary/browse)',
+     "SELECT id FROM gloss WHERE dictionaryHead = 1 ORDER BY dictionaryKey"),
+    ('Glosses of Forms',
+     "SELECT id FROM gloss WHERE form_id IN (1, 2)"),
+    ('Forms modified in a period (date restrictors)',
+     "SELECT id FROM form WHERE datetimeModified > '2011-11-10 00:00:00' "
+     "AND datetimeModified < '2011-11-12 00:00:00'"),
+    ('Forms by elicitor (restrictors)',
+     "SELECT id FROM form WHERE elicitor_id IN (1, 2)"),
+    ('Forms by enterer (restrictors)',
+     "SELECT id FROM form WHERE enterer_id IN (1, 2)"),
+    ('Forms by verifier (restrictors)',
+     "SELECT id FROM form WHERE verifier_id IN (1, 2)"),
+    ('Forms by speaker (restrictors)',
+     "SELECT id FROM form WHERE speaker_id IN (1, 2)"),
+    ('Forms by elicitation method (restrictors)',
+     "SELECT id FROM form WHERE elicitationmethod_id IN (1, 2)"),
+    ('Forms by syntactic category (restrictors)',
+     "SELECT id FROM form WHERE syntacticcategory_id IN (1, 2)"),
+    ('Forms by source (restrictors)',
+     "SELECT id FROM form WHERE source_id IN (1, 2)")
+]
+
+
+def getIndexNames(tableName):
+    """Return the set of the names of the indexes of the table, or None if the
+    RDBMS is neither SQLite nor MySQL.
+
+    """
+
+    dialect = meta.engine.dialect.name
+    if dialect == 'sqlite':
+        return set([row[1] for row in meta.engine.execute(
+            'PRAGMA index_list("%s")' % tableName)])
+    elif dialect == 'mysql':
+        return set([row[2] for row in meta.engine.execute(
+            'SHOW INDEX FROM `%s`' % tableName)])
+    return None
+
+
+def getColumnNames(tableName):
+    """Return the set of the names of the columns of the table, or None if the
+    RDBMS is neither SQLite nor MySQL.
+
+    """
+
+    dialect = meta.engine.dialect.name
+    if dialect == 'sqlite':
+        return set([row[1] for row in meta.engine.execute(
+            'PRAGMA table_info("%s")' % tableName)])
+    elif dialect == 'mysql':
+        return set([row[0] for row in meta.engine.execute(
+            'SHOW COLUMNS FROM `%s`' % tableName)])
+    return None
+
+
+def addMissingColumns():
+    """Add the columns declared in the model that the tables of the database
+    lack and return their names (as 'table.column').
+
+    """
+
+    added = []
+    quote = meta.engine.dialect.identifier_preparer.quote_identifier
+    for tableName in sorted(meta.metadata.tables):
+        if not meta.engine.has_table(tableName):
+            continue
+        existing = getColumnNames(tableName)
+        if existing is None:
+            continue
+        for column in meta.metadata.tables[tableName].columns:
+            if column.name in existing:
+                continue
+            meta.engine.execute('ALTER TABLE %s ADD COLUMN %s %s' % (
+                quote(tableName), quote(column.name),
+                column.type.dialect_impl(meta.engine.dialect).get_col_spec()))
+            name = '%s.%s' % (tableName, column.name)
+            log.info('Added column %s.' % name)
+            added.append(name)
+    return added
+
+
+def getPrefixIndexCreator(name, tableName, columnName, length):
+    """Return a function that creates the index on the (prefix of the) column,
+    like Index.create.
+
+    """
+
+    def create(bind):
+        quote = bind.dialect.identifier_preparer.quote_identifier
+        column = quote(columnName)
+        if bind.dialect.name == 'mysql':
+            column = '%s(%d)' % (column, length)
+        bind.execute('CREATE INDEX %s ON %s (%s)' % (
+            quote(name), quote(tableName), column))
+    return create
+
+
+def getDeclaredIndexes():
+    """Return (table name, index name, create) triples for the indexes declared
+    in the model and in PREFIX_INDEXES, where create(bind) creates the index.
+
+    """
+
+    indexes = []
+    for tableName in sorted(meta.metadata.tables):
+        table = meta.metadata.tables[tableName]
+        for index in sorted(table.indexes, key=lambda x: x.name):
+            indexes.append((tableName, index.name, index.create))
+    for name, tableName, columnName, length in PREFIX_INDEXES:
+        indexes.append((tableName, name, getPrefixIndexCreator(
+            name, tableName, columnName, length)))
+    return indexes
+
+
+def createMissingIndexes():
+    """Create the declared indexes that the database lacks and return their
+    names.
+
+    """
+
+    created = []
+    existing = {}
+    for tableName, name, create in getDeclaredIndexes():
+        if tableName not in existing:
+            if not meta.engine.has_table(tableName):
+                existing[tableName] = False
+                continue
+            existing[tableName] = getIndexNames(tableName)
+        elif existing[tableName] is False:
+            continue
+        indexNames = existing[tableName]
+        if indexNames is not None and name in indexNames:
+            continue
+        try:
+            create(bind=meta.engine)
+        except sa.exc.DBAPIError, e:
+            # Without a list of the existing indexes, assume that the index
+            #  could not be created because it exists.
+            if indexNames is not None:
+                raise
+            log.debug('Index %s not created (%s).' % (name, e))
+            continue
+        log.info('Created index %s.' % name)
+        created.append(name)
+    return created
+
+
+def explainQuery(sql):
+    """Return the query plan of the SQL query as a string, or None if the RDBMS
+    is neither SQLite nor MySQL.
+
+    """
+
+    dialect = meta.engine.dialect.name
+    if dialect == 'sqlite':
+        # The last column is the description of the step
+        return '; '.join([row[-1] for row in meta.engine.execute(
+            'EXPLAIN QUERY PLAN %s' % sql)])
+    elif dialect == 'mysql':
+        return '; '.join(['%s: %s, key %s' % (row['table'], row['type'],
+                                              row['key'])
+                          for row in meta.engine.execute('EXPLAIN %s' % sql)])
+    return None
+
+
+def getQueryPlans():
+    """Return a dict from the descriptions of SLOW_QUERIES to their query
+    plans.  Queries that cannot be explained (e.g., because a table does not
+    exist) are left out.
+
+    """
+
+    plans = {}
+    for description, sql in SLOW_QUERIES:
+        try:
+            plan = explainQuery(sql)
+        except sa.exc.DBAPIError, e:
+            log.debug('Query not explained: %s (%s).' % (description, e))
+            continue
+        if plan is not None:
+            plans[description] = plan
+    return plans
+
+
+def migrate():
+    """Create the declared tables, add the declared columns and create the
+    declared indexes that the database lacks.  Return the names of the columns
+    added and of the indexes created and a list of (description, plan before,
+    plan after) triples for the SLOW_QUERIES whose plans the new indexes
+    changed.
+
+    """
+
+    meta.metadata.create_all(bind=meta.engine)
+    added = addMissingColumns()
+    before = getQueryPlans()
+    created = createMissingIndexes()
+    after = getQueryPlans()
+    changed = [(description, before[description], after[description])
+               for description, sql in SLOW_QUERIES
+               if description in before and description in after and
+               before[description] != after[description]]
+    return added, created, changed
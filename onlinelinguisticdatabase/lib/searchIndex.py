@@ -0,0 +1,521 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Full-text search index for Forms.
+
+Form searches are substring searches (LIKE '%term%'), which cannot use an
+ordinary index and so scan the whole form (and gloss) table.  This module keeps
+a trigram index of the transcription, morphemeBreak, morphemeGloss, comments
+and context values and the glosses of each Form.  If a value contains a search
+term then it contains every trigram of the term, so the Forms that have all of
+the term's trigrams are a (usually very small) superset of the matches.  The
+query builder restricts its LIKE conditions to these candidates; the LIKE
+conditions themselves are kept, so results are unchanged.
+
+Each trigram of a field is stored as a token: a one-letter field code followed
+by the first 10 hex digits of the trigram's md5 hash (hash collisions only add
+candidates).  Values are lowercased and stripped of combining characters before
+they are split into trigrams, so the candidates are also a superset of the
+matches of case- and accent-insensitive collations.
+
+The tokens are stored using the best mechanism available:
+
+    fts       SQLite FTS3 virtual table, one document of tokens per Form
+    fulltext  MySQL table with a FULLTEXT index, one row per Form (InnoDB if
+              the server supports FULLTEXT indexes on InnoDB tables, i.e.,
+              MySQL 5.6 or later, else MyISAM)
+    tokens    plain (token, form_id) table with an index on token
+
+Each rebuild (rebuildSearchIndex; see the administer controller) builds a new
+generation of the index in tables of its own and, once every Form is indexed,
+makes it the complete index.  The formsearchstate table records which
+generation is complete and which one is being built; it is read whenever the
+index is used, so every process sees a new index at once and, until there is a
+complete index, searches fall back to scanning.  updateSearchIndex and
+removeFromSearchIndex, which the form controller calls whenever a Form is
+created, saved or deleted, write to both generations, and the rebuild indexes
+the Forms modified while it ran again at its end.  The previous generation is
+only dropped by the next rebuild, so requests that read the state just before
+the switch can still use it.
+
+Index writes are part of the current transaction unless the index is a MyISAM
+table, which is not transactional: a write to it stays even if the transaction
+is rolled back.  So, in a MyISAM index, updateSearchIndex adds the Form's new
+tokens to its old ones and removeFromSearchIndex leaves the tokens in place.
+The index then only ever has extra tokens, i.e., extra candidates (which the
+LIKE conditions filter out), whatever is rolled back; rebuildSearchIndex
+removes them.
+
+"""
+
+import re
+import time
+import datetime
+import hashlib
+import logging
+import unicodedata as ud
+
+import sqlalchemy as sa
+from sqlalchemy.sql import table, column, select, and_, func
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+
+log = logging.getLogger(__name__)
+
+# Indexed Form attributes (plus 'gloss' for Gloss.gloss) and their codes
+FIELD_CODES = {
+    'transcription': u't',
+    'morphemeBreak': u'm',
+    'morphemeGloss': u'g',
+    'comments': u'c',
+    'context': u'x',
+    'gloss': u'l'
+}
+
+FORM_FIELDS = ['transcription', 'morphemeBreak', 'morphemeGloss', 'comments',
+               'context']
+
+# Number of Forms indexed at a time by rebuildSearchIndex
+BATCH_SIZE = 500
+
+# Forms modified up to this many seconds before a rebuild started are indexed
+#  again at its end, since their saves may have been committed after the
+#  rebuild read them
+CATCH_UP_MARGIN = 60
+
+# Names of the formsearchstate rows
+COMPLETE = u'complete'
+BUILDING = u'building'
+
+# LIKE wildcards and the escape character split a search term into literal
+#  segments; trigrams spanning them cannot be used.
+wildcardPatt = re.compile(u'[%_\\\\]')
+
+# Names of the index tables of a generation (no number: before generations)
+indexTablePatt = re.compile(u'^formsearch(index|token)(\\d*)$')
+
+
+def fold(value):
+    """Lowercase value and remove its combining characters.
+
+    """
+
+    value = ud.normalize('NFD', value.lower())
+    return u''.join([c for c in value if not ud.combining(c)])
+
+
+def getTrigrams(value):
+    value = fold(value)
+    return set([value[i:i + 3] for i in range(len(value) - 2)])
+
+
+def getToken(field, trigram):
+    return FIELD_CODES[field] + \
+        unicode(hashlib.md5(trigram.encode('utf-8')).hexdigest()[:10])
+
+
+def getTokens(field, value):
+    if not value:
+        return set()
+    return set([getToken(field, t) for t in getTrigrams(value)])
+
+
+def getTermTokens(field, term):
+    """Return the tokens that every value matching LIKE '%term%' must have.
+
+    """
+
+    tokens = set()
+    for segment in wildcardPatt.split(term):
+        tokens.update(getTokens(field, segment))
+    return tokens
+
+
+def getFormTokens(values, glosses):
+    """Return the set of tokens of a Form given a dict of its FORM_FIELDS
+    values and a list of its glosses.
+
+    """
+
+    tokens = set()
+    for field in FORM_FIELDS:
+        tokens.update(getTokens(field, values.get(field)))
+    for gloss in glosses:
+        tokens.update(getTokens('gloss', gloss))
+    return tokens
+
+
+################################################################################
+# Index state and DDL
+################################################################################
+
+def getDialectName():
+    return meta.engine.dialect.name
+
+
+def getSearchIndexState():
+    """Return a dict from COMPLETE and BUILDING to the (name, backend,
+    generation, transactional) rows of the complete search index and of the
+    one being built, if there are such indexes.
+
+    """
+
+    stateTable = model.formsearchstate_table
+    try:
+        rows = meta.engine.execute(select([stateTable])).fetchall()
+    except sa.exc.DBAPIError, e:
+        log.debug('The search index state is not available (%s); run '
+                  'setup-app to create the formsearchstate table.' % e)
+        return {}
+    return dict([(row['name'], row) for row in rows])
+
+
+def setSearchIndexState(name, backend=None, generation=None,
+                        transactional=None):
+    """Record the index of backend and generation as the COMPLETE or BUILDING
+    one or, if backend is None, that there is no such index.
+
+    """
+
+    stateTable = model.formsearchstate_table
+    meta.engine.execute(stateTable.delete(stateTable.c.name == name))
+    if backend is not None:
+        meta.engine.execute(stateTable.insert(), name=name, backend=backend,
+                            generation=generation, transactional=transactional)
+
+
+def getSearchIndexBackend():
+    """Return the name of the backend of the complete search index or None if
+    there is no complete search index.
+
+    """
+
+    complete = getSearchIndexState().get(COMPLETE)
+    return complete and complete['backend'] or None
+
+
+def getDocumentTable(generation):
+    return table('formsearchindex%d' % generation, column('docid'),
+                 column('form_id'), column('tokens'))
+
+
+def getTokenTable(generation):
+    return table('formsearchtoken%d' % generation, column('form_id'),
+                 column('token'))
+
+
+def getTable(backend, generation):
+    if backend == 'tokens':
+        return getTokenTable(generation)
+    return getDocumentTable(generation)
+
+
+def getKeyColumn(backend, generation):
+    if backend == 'fts':
+        return getDocumentTable(generation).c.docid
+    return getTable(backend, generation).c.form_id
+
+
+def dropSearchIndexes(keep=()):
+    """Drop the index tables of every generation except those in keep (and the
+    tables of the index from before generations were numbered).
+
+    """
+
+    for tableName in meta.engine.table_names():
+        match = indexTablePatt.match(tableName)
+        if match and not (match.group(2) and int(match.group(2)) in keep):
+            meta.engine.execute('DROP TABLE %s' % tableName)
+
+
+def createSearchIndex(generation):
+    """Create the (empty) search index tables of generation using the best
+    backend available and return the backend's name and whether its writes
+    are transactional.
+
+    """
+
+    dialect = getDialectName()
+    if dialect == 'sqlite':
+        try:
+            meta.engine.execute(
+                'CREATE VIRTUAL TABLE formsearchindex%d USING fts3(tokens)' %
+                generation)
+            return 'fts', True
+        except sa.exc.DBAPIError, e:
+            log.info('SQLite FTS3 is unavailable (%s).' % e)
+    elif dialect == 'mysql':
+        for engine in ('InnoDB', 'MyISAM'):
+            try:
+                meta.engine.execute(
+                    'CREATE TABLE formsearchindex%d ('
+                    'form_id INTEGER NOT NULL PRIMARY KEY, '
+                    'tokens MEDIUMTEXT NOT NULL, '
+                    'FULLTEXT (tokens)) ENGINE=%s DEFAULT CHARSET=utf8' % (
+                        generation, engine))
+            except sa.exc.DBAPIError, e:
+                log.info('MySQL %s FULLTEXT indexes are unavailable (%s).' % (
+                    engine, e))
+                continue
+            return 'fulltext', engine != 'MyISAM'
+    meta.engine.execute(
+        'CREATE TABLE formsearchtoken%d ('
+        'form_id INTEGER NOT NULL, token VARCHAR(11) NOT NULL)' % generation)
+    meta.engine.execute(
+        'CREATE INDEX ix_formsearchtoken%d_token '
+        'ON formsearchtoken%d (token, form_id)' % (generation, generation))
+    meta.engine.execute(
+        'CREATE INDEX ix_formsearchtoken%d_form_id '
+        'ON formsearchtoken%d (form_id)' % (generation, generation))
+    return 'tokens', True
+
+
+################################################################################
+# Maintenance
+################################################################################
+
+def getInsertParams(backend, generation, formID, tokens):
+    if backend == 'tokens':
+        return [{'form_id': formID, 'token': t} for t in tokens]
+    key = getKeyColumn(backend, generation).name
+    return [{key: formID, 'tokens': u' '.join(sorted(tokens))}]
+
+
+def getWritableIndexes():
+    """Return the state rows of the complete index and of the one being built.
+
+    """
+
+    state = getSearchIndexState()
+    return [state[name] for name in (COMPLETE, BUILDING) if name in state]
+
+
+def removeFromSearchIndex(formID):
+    """Remove the Form with id formID from the search indexes (if there are
+    any and they are transactional; see the module docstring).  The change is
+    part of the current transaction.
+
+    """
+
+    for index in getWritableIndexes():
+        if index['transactional']:
+            backend, generation = index['backend'], index['generation']
+            meta.Session.execute(getTable(backend, generation).delete(
+                getKeyColumn(backend, generation) == formID))
+
+
+def indexForm(index, formID, tokens):
+    """Replace the tokens of the Form with id formID in index (a state row)
+    with tokens or, if the index is not transactional, add tokens to them.
+
+    """
+
+    backend, generation = index['backend'], index['generation']
+    key = getKeyColumn(backend, generation)
+    if not index['transactional']:
+        tokens = set(tokens)
+        for row in meta.Session.execute(select(
+                [getDocumentTable(generation).c.tokens], key == formID)):
+            tokens.update(row[0].split())
+    meta.Session.execute(getTable(backend, generation).delete(key == formID))
+    if tokens:
+        meta.Session.execute(getTable(backend, generation).insert(),
+                             getInsertParams(backend, generation, formID,
+                                             tokens))
+
+
+def updateSearchIndex(form):
+    """(Re-)index form in the search indexes (if there are any).  The change
+    is part of the current transaction, unless an index is not transactional,
+    in which case the new tokens are added to the old ones (see the module
+    docstring).
+
+    """
+
+    indexes = getWritableIndexes()
+    if not indexes:
+        return
+    values = dict([(field, getattr(form, field)) for field in FORM_FIELDS])
+    tokens = getFormTokens(values, [g.gloss for g in form.glosses])
+    for index in indexes:
+        indexForm(index, form.id, tokens)
+
+
+def indexForms(index, ids):
+    """(Re-)index the Forms with ids in index (a state row) and commit.
+    Return the number of Forms indexed.
+
+    """
+
+    columns = [model.Form.id] + [getattr(model.Form, f) for f in FORM_FIELDS]
+    rows = meta.Session.query(*columns).filter(model.Form.id.in_(ids)).all()
+    glosses = {}
+    for formID, gloss in meta.Session.query(
+            model.Gloss.form_id, model.Gloss.gloss).filter(
+            model.Gloss.form_id.in_(ids)):
+        glosses.setdefault(formID, []).append(gloss)
+    tokens = [(row[0], getFormTokens(dict(zip(FORM_FIELDS, row[1:])),
+                                     glosses.get(row[0], [])))
+              for row in rows]
+    if index['transactional']:
+        backend, generation = index['backend'], index['generation']
+        meta.Session.execute(getTable(backend, generation).delete(
+            getKeyColumn(backend, generation).in_(ids)))
+        params = []
+        for formID, formTokens in tokens:
+            if formTokens:
+                params.extend(getInsertParams(backend, generation, formID,
+                                              formTokens))
+        if params:
+            meta.Session.execute(getTable(backend, generation).insert(),
+                                 params)
+    else:
+        for formID, formTokens in tokens:
+            indexForm(index, formID, formTokens)
+    meta.Session.commit()
+    return len(rows)
+
+
+def rebuildSearchIndex(batchSize=BATCH_SIZE, callback=None):
+    """Build a new generation of the search index, indexing every Form,
+    batchSize Forms at a time, and make it the complete index (see the module
+    docstring).  After each batch, callback (if given) is called with the
+    number of Forms indexed so far and the elapsed time in seconds.  Return a
+    (backend, formCount, elapsedSeconds) tuple.
+
+    """
+
+    start = time.time()
+    started = model.now()
+    state = getSearchIndexState()
+    complete = state.get(COMPLETE)
+    # Drop the previous generation and any interrupted rebuild
+    dropSearchIndexes(complete and [complete['generation']] or [])
+    generation = max([row['generation'] for row in state.values()] + [0]) + 1
+    backend, transactional = createSearchIndex(generation)
+    setSearchIndexState(BUILDING, backend, generation, transactional)
+    index = getSearchIndexState()[BUILDING]
+    count = 0
+    lastID = 0
+    while True:
+        ids = [row[0] for row in meta.Session.query(model.Form.id).filter(
+            model.Form.id > lastID).order_by(model.Form.id).limit(batchSize)]
+        if not ids:
+            break
+        count += indexForms(index, ids)
+        lastID = ids[-1]
+        if callback:
+            callback(count, time.time() - start)
+    # Index the Forms modified during the rebuild again
+    since = started - datetime.timedelta(seconds=CATCH_UP_MARGIN)
+    ids = [row[0] for row in meta.Session.query(model.Form.id).filter(
+        model.Form.datetimeModified >= since)]
+    for i in range(0, len(ids), batchSize):
+        indexForms(index, ids[i:i + batchSize])
+    building = getSearchIndexState().get(BUILDING)
+    if building is None or building['generation'] != generation:
+        log.warning('Search index %d was replaced by another rebuild.' %
+                    generation)
+    else:
+        setSearchIndexState(COMPLETE, backend, generation, transactional)
+        setSearchIndexState(BUILDING)
+    elapsed = time.time() - start
+    log.info('Indexed %d forms (%s) in %.1f s.' % (count, backend, elapsed))
+    return backend, count, elapsed
+
+
+################################################################################
+# Search
+################################################################################
+
+def getCandidateIDQuery(backend, generation, tokens):
+    """Return a select of the ids of the Forms having all of the tokens.
+
+    """
+
+    tokens = sorted(tokens)
+    documentTable = getDocumentTable(generation)
+    tokenTable = getTokenTable(generation)
+    if backend == 'fts':
+        return select([documentTable.c.docid],
+                      documentTable.c.tokens.match(u' '.join(tokens)))
+    elif backend == 'fulltext':
+        return select([documentTable.c.form_id],
+                      documentTable.c.tokens.match(
+                          u' '.join([u'+' + t for t in tokens])))
+    else:
+        return select([tokenTable.c.form_id],
+                      tokenTable.c.token.in_(tokens),
+                      group_by=[tokenTable.c.form_id],
+                      having=func.count(tokenTable.c.token.distinct()) ==
+                        len(tokens))
+
+
+def getCandidateCondition(col, backend, generation, tokens):
+    """Return a condition restricting col (a Form id column) to the Forms
+    having all of the tokens.
+
+    SQLite evaluates an IN subquery once; MySQL may evaluate it for each row
+    (as a dependent subquery), so there the candidates are selected from a
+    derived table, which MySQL materializes once.
+
+    """
+
+    candidates = getCandidateIDQuery(backend, generation, tokens)
+    if getDialectName() == 'sqlite':
+        return col.in_(candidates)
+    candidates = candidates.alias('candidates')
+    return col.in_(select([list(candidates.c)[0]]))
+
+
+def getSearchIndexCondition(terms, searchType, location, tableName):
+    """Return a condition restricting the query to the Forms that may match
+    the search on location or None if the search index cannot help, i.e.,
+    if there is no complete index, the location is not indexed, or (some of)
+    the terms are shorter than three characters.  terms is a list of search
+    terms (without the LIKE wildcards added by the query builder) and
+    searchType is 'as a phrase', 'all of these' or 'any of these' (the
+    default).
+
+    """
+
+    if tableName not in ('Form', 'Gloss') or location not in FIELD_CODES:
+        return None
+    complete = getSearchIndexState().get(COMPLETE)
+    if complete is None:
+        return None
+    backend, generation = complete['backend'], complete['generation']
+    if tableName == 'Gloss':
+        col = model.Gloss.form_id
+    else:
+        col = model.Form.id
+    termTokens = [getTermTokens(location, term) for term in terms]
+    if searchType not in ('as a phrase', 'all of these'):
+        if not termTokens or not min([len(t) for t in termTokens]):
+            return None
+        return sa.or_(*[
+            getCandidateCondition(col, backend, generation, tokens)
+            for tokens in termTokens])
+    conditions = [getCandidateCondition(col, backend, generation, tokens)
+                  for tokens in termTokens if tokens]
+    if not conditions:
+        return None
+    return and_(*conditions)
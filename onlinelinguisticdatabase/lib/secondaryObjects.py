@@ -0,0 +1,293 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A versioned, per-process cache of the secondary objects.
+
+The add, update and search pages populate their select fields with the
+speakers, users, sources, syntactic categories, keywords and elicitation
+methods of the database, which the templates read from app_globals (e.g.,
+app_globals.speakers).  secondaryObjectCache keeps these lists as tuples of
+Records (read-only copies of the rows, so they cannot go stale the way detached
+ORM instances do) and puts them into app_globals.
+
+Each list has a version: a row of the tableversion table whose count is
+incremented (by secondaryObjectsChanged) whenever the list's table is changed.
+Before each request, refresh polls the versions with one query (at most once
+every pollInterval seconds; see the secondary_objects_poll_interval config
+option) and reloads only the lists whose versions changed.  So a speaker added
+in one process shows up in the others within pollInterval seconds.
+
+The application settings are versioned in the same way: when their version
+changes, refresh applies the latest settings to app_globals (see
+applicationSettingsToAppGlobals in lib/functions.py) and recomputes the
+unrestricted users.
+
+If the versions are not available (i.e., setup-app has not yet created the
+tableversion table), the loaded lists are kept and only reloaded every
+FALLBACK_RELOAD_INTERVAL seconds (or when this process changes them).
+
+"""
+
+import time
+import logging
+import threading
+
+import sqlalchemy as sa
+from sqlalchemy.sql import select, desc
+from pylons import app_globals
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+log = logging.getLogger(__name__)
+
+# Default number of seconds between polls of the versions (see the
+#  secondary_objects_poll_interval config option)
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Number of seconds between reloads of every list (and of the settings) when
+#  the versions are not available, and between warnings about it
+FALLBACK_RELOAD_INTERVAL = 300.0
+
+# The version names of the settings and of each list
+SETTINGS = u'applicationSettings'
+LISTS = [u'speakers', u'users', u'sources', u'syncats', u'keywords',
+         u'elicitationMethods']
+
+
+class Record(object):
+    """A read-only copy of a row: its values are its attributes.
+
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        object.__setattr__(self, '_values', values)
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Record attributes cannot be set')
+
+    def __repr__(self):
+        return '<Record %r>' % self._values
+
+
+def getRecords(table, orderBy, exclude=()):
+    """Return a tuple of Records of the rows of table, ordered by orderBy (a
+    list of column expressions), with the values of all columns but those
+    named in exclude.
+
+    """
+
+    columns = [c for c in table.c if c.name not in exclude]
+    return tuple([Record(dict([(c.name, row[c]) for c in columns]))
+                  for row in meta.engine.execute(
+                      select(columns).order_by(*orderBy))])
+
+
+def loadList(name):
+    """Return the Records of the list called name.
+
+    """
+
+    if name == u'speakers':
+        speaker = model.speaker_table
+        return getRecords(speaker, [speaker.c.lastName])
+    elif name == u'users':
+        user = model.user_table
+        return getRecords(user, [user.c.lastName], exclude=('password',))
+    elif name == u'sources':
+        source = model.source_table
+        return getRecords(source, [source.c.authorLastName,
+                                   source.c.authorFirstName,
+                                   desc(source.c.year)])
+    elif name == u'syncats':
+        syncat = model.syntacticcategory_table
+        return getRecords(syncat, [syncat.c.name])
+    elif name == u'keywords':
+        keyword = model.keyword_table
+        return getRecords(keyword, [keyword.c.name])
+    elif name == u'elicitationMethods':
+        method = model.elicitationmethod_table
+        return getRecords(method, [method.c.name])
+
+
+def getUnrestrictedUserIDs():
+    """Return the set of the ids of the unrestricted users of the latest
+    application settings.
+
+    """
+
+    settings = model.application_settings_table
+    row = meta.engine.execute(select([settings.c.unrestrictedUsers]).order_by(
+        desc(settings.c.id)).limit(1)).fetchone()
+    try:
+        return set([int(id) for id in json.loads(row[0])])
+    except TypeError:   # No settings or no unrestricted users (None)
+        return set()
+
+
+# When getVersions last warned that the versions are not available
+_lastWarning = None
+
+
+def getVersions():
+    """Return a dict from version names to versions, or None if there is no
+    tableversion table.
+
+    """
+
+    global _lastWarning
+    table = model.tableversion_table
+    try:
+        return dict([(row[0], row[1]) for row in meta.engine.execute(
+            select([table.c.name, table.c.version]))])
+    except sa.exc.DBAPIError, e:
+        if _lastWarning is None or \
+                time.time() - _lastWarning >= FALLBACK_RELOAD_INTERVAL:
+            log.warning('Secondary object versions are not available (%s); '
+                        'run setup-app to create the tableversion table.' % e)
+            _lastWarning = time.time()
+        return None
+
+
+def incrementVersion(name):
+    """Increment the version called name in the database.
+
+    """
+
+    table = model.tableversion_table
+    update = table.update(table.c.name == name,
+                          values={table.c.version: table.c.version + 1})
+    try:
+        if meta.engine.execute(update).rowcount == 0:
+            try:
+                meta.engine.execute(table.insert(), name=name, version=1)
+            except sa.exc.IntegrityError:
+                # Another process inserted it first
+                meta.engine.execute(update)
+    except sa.exc.DBAPIError, e:
+        log.warning('Version %s not incremented (%s).' % (name, e))
+
+
+class SecondaryObjectCache(object):
+    """Holds the secondary object lists and the versions they were loaded
+    at.  refresh updates them and app_globals; the lock is only taken by the
+    thread that polls the versions.
+
+    """
+
+    def __init__(self, pollInterval=DEFAULT_POLL_INTERVAL):
+        self.pollInterval = pollInterval
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.lists = dict([(name, ()) for name in LISTS])
+        self.unrestrictedUserIDs = set()
+        self.versions = {}  # name -> version loaded (None if unknown)
+        self.lastPoll = None
+        self.lastFallbackReload = None  # when all were reloaded unversioned
+
+    def refresh(self, force=False):
+        """Reload the lists (and apply the settings) whose versions have
+        changed since they were loaded, if pollInterval seconds have passed
+        since the last poll or force is true.
+
+        """
+
+        if not force and self.lastPoll is not None and \
+                time.time() - self.lastPoll < self.pollInterval:
+            return
+        self.lock.acquire()
+        try:
+            versions = getVersions()
+            if versions is not None:
+                stale = [name for name in [SETTINGS] + LISTS
+                         if name not in self.versions or
+                         self.versions[name] != versions.get(name, 0)]
+            elif force or self.lastFallbackReload is None or \
+                    time.time() - self.lastFallbackReload >= \
+                    FALLBACK_RELOAD_INTERVAL:
+                stale = [SETTINGS] + LISTS
+                self.lastFallbackReload = time.time()
+            else:
+                stale = []
+            for name in stale:
+                if name == SETTINGS:
+                    from functions import applicationSettingsToAppGlobals
+                    applicationSettingsToAppGlobals(app_globals)
+                    self.unrestrictedUserIDs = getUnrestrictedUserIDs()
+                else:
+                    self.lists[name] = loadList(name)
+                self.versions[name] = versions and versions.get(name, 0)
+            if stale:
+                log.debug('Reloaded secondary objects: %s.' % ', '.join(stale))
+            self.lastPoll = time.time()
+            self.publish()
+        finally:
+            self.lock.release()
+
+    def getSecondaryObjects(self):
+        """Return a dict of the lists, as getSecondaryObjects in
+        lib/functions.py did.
+
+        """
+
+        users = self.lists[u'users']
+        result = dict(self.lists)
+        result['nonAdministrators'] = tuple([user for user in users if
+                                             user.role == u'contributor'])
+        result['unrestrictedUsers'] = tuple([user for user in users if
+                                             user.id in self.unrestrictedUserIDs])
+        return result
+
+    def publish(self):
+        """Put the lists into app_globals.
+
+        """
+
+        for name, value in self.getSecondaryObjects().items():
+            setattr(app_globals, name, value)
+
+
+secondaryObjectCache = SecondaryObjectCache()
+
+
+def secondaryObjectsChanged(*names):
+    """Record (after commit) that the tables of the lists called names (or the
+    application settings) have changed, and reload them in this process.
+
+    """
+
+    for name in names:
+        incrementVersion(name)
+    secondaryObjectCache.refresh(force=True)
@@ -0,0 +1,111 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A bounded least-recently-used cache of orthographic translations.
+
+Every display of a Form translates its object language fields from the storage
+orthography into the user's output orthography (see storageToOutputTranslate in
+lib/functions.py), so browsing, searching and exporting translate the same
+stored strings over and over.  OrthographyTranslator.translate looks its input
+up in translationCache (shared by all threads) first.
+
+Entries are keyed on the translator's signature (a hash of its orthographies and
+options; see OrthographyTranslator.signature) and the text itself.  A stored
+value that changes is a different key, so entries never go stale; the ones no
+longer used are simply evicted.
+
+"""
+
+import threading
+
+# Default maximum number of translations kept (see the translation_cache_size
+#  config option)
+DEFAULT_SIZE = 50000
+
+
+class TranslationCache(object):
+    """Maps (translator signature, text) pairs to translations, discarding the
+    least recently used quarter of the entries when more than size are cached.
+    hits and misses count the lookups that were and were not answered from the
+    cache.
+
+    As in RegexCache, hits do not take the lock and recency is measured in
+    misses.  Evicting a quarter at a time (rather than one entry per miss)
+    keeps the cost of eviction constant per miss for large sizes.
+
+    """
+
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.translations = {}  # (signature, text) -> [translation, last use]
+        self.hits = 0
+        self.misses = 0
+
+    def translate(self, signature, text, translate):
+        """Return the translation of text by the translator with signature,
+        calling translate(text) if it is not cached.
+
+        """
+
+        if self.size <= 0:
+            return translate(text)
+        key = (signature, text)
+        entry = self.translations.get(key)
+        if entry is not None:
+            entry[1] = self.misses
+            self.hits += 1
+            return entry[0]
+
+        translation = translate(text)
+
+        self.lock.acquire()
+        try:
+            self.misses += 1
+            if len(self.translations) >= self.size:
+                self.evict()
+            self.translations[key] = [translation, self.misses]
+        finally:
+            self.lock.release()
+        return translation
+
+    def evict(self):
+        """Remove the least recently used quarter of the entries (at least
+        one).  Call with the lock held.
+
+        """
+
+        entries = sorted(self.translations.items(), key=lambda x: x[1][1])
+        for key, entry in entries[:max(1, len(entries) // 4)]:
+            del self.translations[key]
+
+    def getStats(self):
+        return {
+            'size': self.size,
+            'cached': len(self.translations),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+translationCache = TranslationCache()
@@ -0,0 +1,129 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""A process-wide registry of the OrthographyTranslators of users' orthographies.
+
+A user who chooses an input or output orthography other than the defaults needs
+their own translators (see putOrthographyTranslatorsIntoSession in
+lib/functions.py).  Rather than storing OrthographyTranslator instances in the
+session (which pickles and unpickles them, compiled regexes and all, on every
+request), the session stores a key:
+
+    (input orthography identifier, output orthography identifier, version)
+
+where the identifiers are keys of app_globals.OLOrthographies (e.g.,
+u'Orthography 2') or STORAGE and version is app_globals.settingsVersion, the id
+of the application settings the orthographies come from.  translatorRegistry
+builds the translator for a key the first time it is requested and shares it
+between all of the users and threads of the process; translators are not
+modified after they are built.
+
+The session also stores the version of the settings that the user's keys were
+made from (session['user_translatorsVersion']).  When the application settings
+change, the registry is cleared and, on the user's next lookup, getUserTranslator
+makes the user's keys again (with putOrthographyTranslatorsIntoSession), so
+that whether the user needs translators at all (e.g., whether their input
+orthography is the storage orthography) is decided against the new settings.
+The registry returns None for a key made from other settings.
+
+"""
+
+import threading
+
+from pylons import session, app_globals
+
+from orthography import OrthographyTranslator, OrthographyCompatibilityError
+
+# The identifier of the storage orthography in translator keys
+STORAGE = u'storage'
+
+
+def getOrthography(identifier):
+    if identifier == STORAGE:
+        return app_globals.storageOrthography[1]
+    return app_globals.OLOrthographies[identifier][1]
+
+
+class TranslatorRegistry(object):
+    """Maps translator keys (see above) to OrthographyTranslator instances.
+    Lookups do not take the lock; building a translator does.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.translators = {}
+
+    def get(self, key):
+        """Return the translator for key, or None if key is None, was made
+        from other application settings than the current ones or names an
+        orthography that no longer exists (or cannot be translated into the
+        other).
+
+        """
+
+        if not key:
+            return None
+        inputIdentifier, outputIdentifier, version = key
+        if version != app_globals.settingsVersion:
+            return None
+        translator = self.translators.get(key)
+        if translator is not None:
+            return translator
+
+        try:
+            translator = OrthographyTranslator(
+                getOrthography(inputIdentifier),
+                getOrthography(outputIdentifier))
+        except (KeyError, OrthographyCompatibilityError):
+            return None
+
+        self.lock.acquire()
+        try:
+            translator = self.translators.setdefault(key, translator)
+        finally:
+            self.lock.release()
+        return translator
+
+
+translatorRegistry = TranslatorRegistry()
+
+
+def getTranslatorKey(inputIdentifier, outputIdentifier):
+    return (inputIdentifier, outputIdentifier, app_globals.settingsVersion)
+
+
+def getUserTranslator(name):
+    """Return the user's translator called name ('inputToStorage',
+    'storageToInput' or 'storageToOutput') or None if the user has none.
+
+    """
+
+    if 'user_inputOrthography' in session and \
+            session.get('user_translatorsVersion') != \
+            app_globals.settingsVersion:
+        # The application settings have changed since the user's keys were
+        #  made
+        from functions import putOrthographyTranslatorsIntoSession
+        putOrthographyTranslatorsIntoSession()
+    return translatorRegistry.get(session.get('user_%sTranslatorKey' % name))
@@ -0,0 +1,350 @@
+# −*− coding: UTF−8 −*−
+
+# Copyright (C) 2010 Joel Dunham
+#
+# This file is part of OnlineLinguisticDatabase.
+#
+# OnlineLinguisticDatabase is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OnlineLinguisticDatabase is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with OnlineLinguisticDatabase.  If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Validation reports: which Forms have a field (e.g., transcription) that
+cannot be constructed from the graphs of an inventory (see the testvalidation
+action of the settings controller).
+
+validationScanner.start scans the field of every Form in a background thread,
+in batches of batchSize rows ordered by id, checking each value with the
+inventory's trie (Inventory.stringIsValid) and, if it is invalid, checking
+whether canonical decomposition (NFD) makes it valid.  If processes is greater
+than 0, the batches are checked by a pool of that many processes (see the
+validation_processes config option).
+
+The report is written to files (under the cache_dir of the config) as the scan
+proceeds: status.json holds the counts and progress (see getStatus) and each
+page-N.json holds pageSize of the invalid Forms, as [id, NFD value, code
+points] triples in id order (see getPage).  So the report is available to
+every process and the request that starts the scan returns immediately.
+
+Each scan writes to a directory of its own, and the current.json file of the
+validation id names the latest one; a new scan only removes the directories of
+scans that are complete (or have not written anything for STALE_SCAN_AGE
+seconds), so it never deletes a report that another process is still writing.
+
+"""
+
+import os
+import time
+import shutil
+import logging
+import threading
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+from pylons import config
+from sqlalchemy.sql import select, func
+
+import onlinelinguisticdatabase.model as model
+import onlinelinguisticdatabase.model.meta as meta
+from functions import Inventory, NFD, getUnicodeCodePoints
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+PAGE_SIZE = 100
+
+# Number of seconds after which an incomplete scan whose status has not been
+#  updated is taken to have died with its process
+STALE_SCAN_AGE = 3600
+
+
+def checkBatch(inventory, rows):
+    """Return (row count, invalid count, NFD fixes, invalid entries) for the
+    (id, value) rows, where invalid count is the number of values that the
+    inventory does not generate, NFD fixes is the number of those that it
+    generates after NFD normalization and invalid entries is a list of [id, NFD
+    value, code points] lists for the rest.
+
+    """
+
+    invalidCount = NFDFixes = 0
+    invalid = []
+    for id, value in rows:
+        if value is None or inventory.stringIsValid(value):
+            continue
+        invalidCount += 1
+        value = NFD(value)
+        if inventory.stringIsValid(value):
+            NFDFixes += 1
+        else:
+            invalid.append([id, value, getUnicodeCodePoints(value)])
+    return len(rows), invalidCount, NFDFixes, invalid
+
+
+# The inventory of a pool process (see initPoolProcess)
+poolInventory = None
+
+def initPoolProcess(graphs):
+    global poolInventory
+    poolInventory = Inventory(graphs)
+
+def checkBatchInPool(rows):
+    return checkBatch(poolInventory, rows)
+
+
+def getBatches(column, batchSize):
+    """Generate lists of the (id, value) rows of the column of the form table,
+    batchSize rows at a time, in id order.
+
+    """
+
+    table = model.form_table
+    lastID = 0
+    while True:
+        rows = [tuple(row) for row in meta.engine.execute(
+            select([table.c.id, column], table.c.id > lastID).order_by(
+                table.c.id).limit(batchSize))]
+        if not rows:
+            break
+        yield rows
+        lastID = rows[-1][0]
+
+
+def writeJSON(path, value):
+    """Write value as JSON to the file at path, atomically, so that readers
+    never see a partial file.
+
+    """
+
+    temporaryPath = '%s.%d.tmp' % (path, threading.currentThread().ident)
+    f = open(temporaryPath, 'w')
+    try:
+        json.dump(value, f)
+    finally:
+        f.close()
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(temporaryPath, path)
+
+
+def readJSON(path):
+    try:
+        f = open(path)
+    except IOError:
+        return None
+    try:
+        return json.load(f)
+    finally:
+        f.close()
+
+
+def isRunning(status, statusPath):
+    """Return True if the scan whose status was read from statusPath is still
+    running (see STALE_SCAN_AGE).
+
+    """
+
+    if status is None or status['complete']:
+        return False
+    try:
+        return time.time() - os.path.getmtime(statusPath) < STALE_SCAN_AGE
+    except OSError:
+        return False
+
+
+class ValidationScanner(object):
+    """Starts the scans and reads their reports.  Only one scan per validation
+    id runs at a time.
+
+    """
+
+    def __init__(self, batchSize=BATCH_SIZE, pageSize=PAGE_SIZE, processes=0):
+        self.batchSize = batchSize
+        self.pageSize = pageSize
+        self.processes = processes
+        self.lock = threading.Lock()
+        self.running = set()
+
+    def getDirectory(self, validationId):
+        return os.path.join(config['app_conf']['cache_dir'], 'validation',
+                            validationId)
+
+    def getScanDirectory(self, validationId):
+        """Return the directory of the latest scan for validationId, or None.
+
+        """
+
+        scanId = readJSON(os.path.join(self.getDirectory(validationId),
+                                       'current.json'))
+        if scanId is None:
+            return None
+        return os.path.join(self.getDirectory(validationId), scanId)
+
+    def getStatus(self, validationId):
+        """Return the status of the latest scan for validationId (or None): a
+        dict with formCount, scanned, invalidCount, NFDFixes, pageCount,
+        validationInventory, statusMsg and complete keys.
+
+        """
+
+        directory = self.getScanDirectory(validationId)
+        if directory is None:
+            return None
+        return readJSON(os.path.join(directory, 'status.json'))
+
+    def getPage(self, validationId, page):
+        """Return the list of invalid entries on page (counting from 0) of the
+        report for validationId, or None if there is no such page.
+
+        """
+
+        directory = self.getScanDirectory(validationId)
+        if directory is None:
+            return None
+        return readJSON(os.path.join(directory, 'page-%d.json' % page))
+
+    def removeFinishedScans(self, validationId):
+        """Remove the directories of the scans for validationId that are no
+        longer running.
+
+        """
+
+        parent = self.getDirectory(validationId)
+        for scanId in os.listdir(parent):
+            directory = os.path.join(parent, scanId)
+            if not os.path.isdir(directory):
+                continue
+            statusPath = os.path.join(directory, 'status.json')
+            if not isRunning(readJSON(statusPath), statusPath):
+                shutil.rmtree(directory, True)
+
+    def start(self, validationId, fieldName, inventory):
+        """Start a scan of the fieldName field of every Form with (a copy of)
+        the inventory in a background thread, unless one is running (in any
+        process), and return its status.
+
+        """
+
+        self.lock.acquire()
+        try:
+            if validationId in self.running:
+                return self.getStatus(validationId)
+            self.running.add(validationId)
+        finally:
+            self.lock.release()
+        try:
+            directory = self.getScanDirectory(validationId)
+            if directory is not None:
+                statusPath = os.path.join(directory, 'status.json')
+                status = readJSON(statusPath)
+                if isRunning(status, statusPath):
+                    self.release(validationId)
+                    return status
+            parent = self.getDirectory(validationId)
+            if not os.path.exists(parent):
+                os.makedirs(parent)
+            scanId = '%d-%d' % (time.time() * 1000, os.getpid())
+            directory = os.path.join(parent, scanId)
+            os.makedirs(directory)
+            graphs = list(inventory.inputList)
+            table = model.form_table
+            status = {
+                'formCount': meta.engine.execute(
+                    select([func.count(table.c.id)])).scalar(),
+                'scanned': 0,
+                'invalidCount': 0,
+                'NFDFixes': 0,
+                'pageCount': 0,
+                'validationInventory': graphs,
+                'statusMsg': 'Validation has begun.',
+                'complete': False
+            }
+            writeJSON(os.path.join(directory, 'status.json'), status)
+            writeJSON(os.path.join(parent, 'current.json'), scanId)
+            self.removeFinishedScans(validationId)
+            thread = threading.Thread(target=self.scan, args=(
+                validationId, directory, table.c[fieldName], graphs,
+                dict(status)))
+            thread.setDaemon(True)
+            thread.start()
+        except:
+            self.release(validationId)
+            raise
+        return status
+
+    def release(self, validationId):
+        self.lock.acquire()
+        try:
+            self.running.discard(validationId)
+        finally:
+            self.lock.release()
+
+    def scan(self, validationId, directory, column, graphs, status):
+        """Scan the values of column and write the report to directory (see
+        the module docstring).
+
+        """
+
+        statusPath = os.path.join(directory, 'status.json')
+        start = time.time()
+        pool = None
+        try:
+            batches = getBatches(column, self.batchSize)
+            if self.processes > 0:
+                import multiprocessing
+                pool = multiprocessing.Pool(self.processes, initPoolProcess,
+                                            (graphs,))
+                results = pool.imap(checkBatchInPool, batches)
+            else:
+                inventory = Inventory(graphs)
+                results = (checkBatch(inventory, rows) for rows in batches)
+            buffer = []
+            for batch in results:
+                rowCount, invalidCount, NFDFixes, invalid = batch
+                status['scanned'] += rowCount
+                status['invalidCount'] += invalidCount
+                status['NFDFixes'] += NFDFixes
+                buffer.extend(invalid)
+                while len(buffer) >= self.pageSize:
+                    self.writePage(directory, status, buffer[:self.pageSize])
+                    buffer = buffer[self.pageSize:]
+                status['statusMsg'] = '%d of %d forms checked (%.1f s).' % (
+                    status['scanned'], status['formCount'], time.time() - start)
+                writeJSON(statusPath, status)
+            if buffer:
+                self.writePage(directory, status, buffer)
+            status['statusMsg'] = 'Validation is complete: %d forms checked ' \
+                'in %.1f s.' % (status['scanned'], time.time() - start)
+            log.info('Validated the %s of %d forms in %.1f s.' % (
+                column.name, status['scanned'], time.time() - start))
+        except Exception, e:
+            log.exception('Validation %s failed.' % validationId)
+            status['statusMsg'] = 'Validation failed: %s' % e
+        finally:
+            if pool is not None:
+                pool.terminate()
+            status['complete'] = True
+            try:
+                writeJSON(statusPath, status)
+            finally:
+                self.release(validationId)
+
+    def writePage(self, directory, status, entries):
+        writeJSON(os.path.join(directory, 'page-%d.json' % status['pageCount']),
+                  entries)
+        status['pageCount'] += 1
+
+
+validationScanner = ValidationScanner()
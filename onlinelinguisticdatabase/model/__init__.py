@@ -111,7 +111,12 @@ form_table = schema.Table('form', meta.metadata,
     # A Form can have only one Source, but a Source can have more than one Form.
     # Form-Source = Many-to-One
     schema.Column('source_id', types.Integer,
-                  schema.ForeignKey('source.id'))
+                  schema.ForeignKey('source.id')),
+
+    # The rank of the graph of the storage orthography that the transcription
+    #  begins with and the transcription's sort key; see lib/dictionaryIndex.py
+    schema.Column('dictionaryHead', types.Integer),
+    schema.Column('dictionaryKey', types.Unicode(255))
 
     # A Form can have many glosses (with a glossGrammaticality), but a gloss
     #  has only one Form.
@@ -135,7 +140,12 @@ gloss_table = schema.Table('gloss', meta.metadata,
     # Gloss-Form = Many-to-One
     schema.Column('form_id', types.Integer, schema.ForeignKey('form.id')),
     
-    schema.Column('datetimeModified', types.DateTime(), default=now)
+    schema.Column('datetimeModified', types.DateTime(), default=now),
+
+    # As form.dictionaryHead and form.dictionaryKey, in the metalanguage
+    #  orthography
+    schema.Column('dictionaryHead', types.Integer),
+    schema.Column('dictionaryKey', types.Unicode(255))
 )
 
 # file_table holds the info about OLD Files (i.e., images, audio, video, PDFs) 
@@ -326,9 +336,27 @@ application_settings_table = schema.Table('application_settings', meta.metadata,
 
 )
 
+# tableversion_table counts the changes to the tables whose contents each
+#  process caches (speakers, users, sources, etc.; see
+#  lib/secondaryObjects.py), so that processes can tell that their copies are
+#  stale with a single query
+tableversion_table = schema.Table('tableversion', meta.metadata,
+    schema.Column('name', types.Unicode(255), primary_key=True),
+    schema.Column('version', types.Integer, nullable=False, default=0)
+)
+
+# formsearchstate_table records which generation of the full-text search index
+#  (see lib/searchIndex.py) is complete and which one is being built
+formsearchstate_table = schema.Table('formsearchstate', meta.metadata,
+    schema.Column('name', types.Unicode(16), primary_key=True),
+    schema.Column('backend', types.Unicode(16), nullable=False),
+    schema.Column('generation', types.Integer, nullable=False),
+    schema.Column('transactional', types.Boolean, nullable=False)
+)
+
 # language_table holds ISO-639-3 data on the world's languages
 #  - see http://www.sil.org/iso639-3/download.asp
-#  - this table is populated from lib/languages/iso-639-3.tab
+#  - this table is populated from lib/languages/iso_639_3.tab
 #    when "paster setup-app" is run
 language_table = schema.Table('language', meta.metadata,
     schema.Column('Id', types.Unicode(3), primary_key=True),
@@ -370,6 +398,29 @@ phonology_table = schema.Table('phonology', meta.metadata,
     schema.Column('datetimeModified', types.DateTime(), default=now),
 )
 
+# job_table holds the records of the long-running background jobs (e.g.,
+#  compiling the morphophonology FST); see lib/jobQueue.py.  status is one of
+#  queued, running, complete, failed and cancelled; arguments is JSON; worker
+#  identifies the process (host:pid) that claimed the job.
+job_table = schema.Table('job', meta.metadata,
+    schema.Column('id', types.Integer,
+        schema.Sequence('job_seq_id', optional=True),
+        primary_key=True
+    ),
+    schema.Column('name', types.Unicode(255)),
+    schema.Column('arguments', types.UnicodeText()),
+    schema.Column('status', types.Unicode(255)),
+    schema.Column('message', types.UnicodeText()),
+    schema.Column('result', types.UnicodeText()),
+    schema.Column('cancelRequested', types.Boolean(), default=False),
+    schema.Column('worker', types.Unicode(255)),
+    schema.Column('enterer_id', types.Integer, schema.ForeignKey('user.id')),
+    schema.Column('datetimeEntered', types.DateTime(), default=now),
+    schema.Column('datetimeStarted', types.DateTime()),
+    schema.Column('datetimeFinished', types.DateTime()),
+    schema.Column('datetimeModified', types.DateTime(), default=now)
+)
+
 ###################
 # RELATIONAL TABLES
 ###################
@@ -423,6 +474,67 @@ userform_table = schema.Table('userform', meta.metadata,
 )
 
 
+#########
+# INDEXES
+#########
+
+# Each association table has an index for lookups in either direction, e.g., the
+#  Forms with a Keyword (foreign words, restricted Forms) and the Keywords of a
+#  Form.  Indexes added here after a database has been set up are created in it
+#  by lib/schemaMigration.createMissingIndexes (run by setup-app).
+schema.Index('ix_formfile_form_id_file_id',
+             formfile_table.c.form_id, formfile_table.c.file_id)
+schema.Index('ix_formfile_file_id_form_id',
+             formfile_table.c.file_id, formfile_table.c.form_id)
+schema.Index('ix_formkeyword_keyword_id_form_id',
+             formkeyword_table.c.keyword_id, formkeyword_table.c.form_id)
+schema.Index('ix_formkeyword_form_id_keyword_id',
+             formkeyword_table.c.form_id, formkeyword_table.c.keyword_id)
+schema.Index('ix_collectionform_collection_id_form_id',
+             collectionform_table.c.collection_id, collectionform_table.c.form_id)
+schema.Index('ix_collectionform_form_id_collection_id',
+             collectionform_table.c.form_id, collectionform_table.c.collection_id)
+schema.Index('ix_collectionfile_collection_id_file_id',
+             collectionfile_table.c.collection_id, collectionfile_table.c.file_id)
+schema.Index('ix_collectionfile_file_id_collection_id',
+             collectionfile_table.c.file_id, collectionfile_table.c.collection_id)
+schema.Index('ix_userform_user_id_form_id',
+             userform_table.c.user_id, userform_table.c.form_id)
+schema.Index('ix_userform_form_id_user_id',
+             userform_table.c.form_id, userform_table.c.user_id)
+
+# The Glosses of a Form; Keywords by name (so that joins from a Keyword name,
+#  e.g., u'foreign word', start from the keyword table)
+schema.Index('ix_gloss_form_id', gloss_table.c.form_id)
+schema.Index('ix_keyword_name', keyword_table.c.name)
+
+# Equality lookups on Forms: duplicate transcriptions (form/findduplicate),
+#  lexical items by morpheme and gloss (morpheme references), exact dictionary
+#  matches, and the restrictors and date restrictors of the query builder.
+#  gloss.gloss is a TEXT column, which MySQL can only index by prefix, so its
+#  index is created by lib/schemaMigration (see PREFIX_INDEXES there).
+schema.Index('ix_form_transcription', form_table.c.transcription)
+schema.Index('ix_form_morphemeBreak', form_table.c.morphemeBreak)
+schema.Index('ix_form_morphemeGloss', form_table.c.morphemeGloss)
+schema.Index('ix_form_datetimeModified', form_table.c.datetimeModified)
+schema.Index('ix_form_elicitor_id', form_table.c.elicitor_id)
+schema.Index('ix_form_enterer_id', form_table.c.enterer_id)
+schema.Index('ix_form_verifier_id', form_table.c.verifier_id)
+schema.Index('ix_form_speaker_id', form_table.c.speaker_id)
+schema.Index('ix_form_elicitationmethod_id', form_table.c.elicitationmethod_id)
+schema.Index('ix_form_syntacticcategory_id', form_table.c.syntacticcategory_id)
+schema.Index('ix_form_source_id', form_table.c.source_id)
+
+# Dictionary browsing: the words that begin with a graph, in orthographic order
+schema.Index('ix_form_dictionaryHead_dictionaryKey',
+             form_table.c.dictionaryHead, form_table.c.dictionaryKey)
+schema.Index('ix_gloss_dictionaryHead_dictionaryKey',
+             gloss_table.c.dictionaryHead, gloss_table.c.dictionaryKey)
+
+# The job queue: the oldest queued job (see lib/jobQueue.py)
+schema.Index('ix_job_status_id', job_table.c.status, job_table.c.id)
+
+
 
 ###############
 # BACKUP TABLES
@@ -549,6 +661,9 @@ class Page(object):
 class FormKeyword(object):
     pass
 
+class Job(object):
+    pass
+
 ##########
 # MAPPPERS
 ##########
@@ -612,6 +727,10 @@ orm.mapper(Page, page_table)
 
 orm.mapper(FormKeyword, formkeyword_table)
 
+orm.mapper(Job, job_table, properties={
+    'enterer': orm.relation(User)
+})
+
 orm.mapper(Phonology, phonology_table, properties={
     'enterer': orm.relation(
         User, primaryjoin=(phonology_table.c.enterer_id==user_table.c.id)),
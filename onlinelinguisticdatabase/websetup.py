@@ -13,7 +13,8 @@ from onlinelinguisticdatabase.config.environment import load_environment
 from onlinelinguisticdatabase.model import meta
 from onlinelinguisticdatabase import model
 import onlinelinguisticdatabase.lib.helpers as h
-import onlinelinguisticdatabase.lib.languages.iso_639_3 as iso_639_3
+from onlinelinguisticdatabase.lib.languageIndex import readLanguages
+from onlinelinguisticdatabase.lib.schemaMigration import migrate
 
 log = logging.getLogger(__name__)
 
@@ -28,6 +29,15 @@ def setup_app(command, conf, vars):
 
     log.debug('tables created')
 
+    # Add the columns and create the indexes that existing tables lack
+    #  (create_all only creates new tables, with their indexes)
+    added, created, changed = migrate()
+    log.debug('columns added: %s' % added)
+    log.debug('indexes created: %s' % created)
+    for description, before, after in changed:
+        log.debug('query plan changed: %s (%s -> %s)' % (
+            description, before, after))
+
     # Create the files directory and the archived_files and researchers
     #  subdirectories
     try:
@@ -136,10 +146,6 @@ This page should contain content entered by your administrator.
         """
     helppage.markup = u'restructuredtext'
 
-    # Enter ISO-639-3 Language data into the languages table
-    log.info("Retrieving ISO-639-3 languages data.")
-    languages = [getLanguageObject(language) for language in iso_639_3.languages]
-
     # Default Application Settings
     log.info("Generating default settings.")
     orthography = u', '.join(list(string.ascii_lowercase))
@@ -201,24 +207,29 @@ phonetic and phonemic inventories.'''
     data = [admin, contributor, viewer, homepage, helppage, applicationSettings,
             restrictedKW, foreignWordKW]
 
-    if config['addLanguageData'] != '0':
-        data += languages
-
     if config['emptyDatabase'] == '0':
         meta.Session.add_all(data)
         meta.Session.commit()
-        
+
+        # Enter ISO-639-3 Language data into the languages table, read from
+        #  lib/languages/iso_639_3.tab and inserted with one executemany
+        if config['addLanguageData'] != '0':
+            log.info("Adding ISO-639-3 languages data.")
+            meta.Session.execute(model.language_table.insert(),
+                [getLanguageValues(language) for language in readLanguages()])
+            meta.Session.commit()
+
 
     log.info("OLD successfully set up.")
 
-def getLanguageObject(languageList):
-    language = model.Language()
-    language.Id = languageList[0]
-    language.Part2B = languageList[1]
-    language.Part2T = languageList[2]
-    language.Part1 = languageList[3]     
-    language.Scope = languageList[4]
-    language.Type = languageList[5]
-    language.Ref_Name = languageList[6]
-    language.Comment = languageList[7]     
-    return language
\ No newline at end of file
+def getLanguageValues(languageList):
+    return {
+        'Id': languageList[0],
+        'Part2B': languageList[1],
+        'Part2T': languageList[2],
+        'Part1': languageList[3],
+        'Scope': languageList[4],
+        'Type': languageList[5],
+        'Ref_Name': languageList[6],
+        'Comment': languageList[7]
+    }
\ No newline at end of file